@@ -0,0 +1,4 @@
+"""Offline performance benchmarks for the VGC calc engines and tool workflows.
+
+Run with ``python -m benchmarks``. See ``benchmarks/README.md``.
+"""
@@ -0,0 +1,76 @@
+"""CLI entry point: ``python -m benchmarks``."""
+
+import argparse
+import fnmatch
+import logging
+import sys
+from pathlib import Path
+
+from .harness import (
+    BENCHMARKS,
+    DEFAULT_REGRESSION_THRESHOLD,
+    compare_results,
+    format_comparison_table,
+    format_results_table,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run the offline VGC MCP benchmark suite.",
+    )
+    parser.add_argument("--filter", "-k", action="append", default=[],
+                        help="Glob on benchmark names (repeatable), e.g. 'damage.*'")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    parser.add_argument("--repeat", type=int, default=None,
+                        help="Timed iterations per benchmark (default: per-benchmark)")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed warmup iterations")
+    parser.add_argument("--output", "-o", type=Path, help="Write results JSON here")
+    parser.add_argument("--save-baseline", type=Path,
+                        help="Write results JSON as the new baseline")
+    parser.add_argument("--compare", type=Path, help="Compare against a baseline JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="Median slowdown ratio counted as a regression (default 0.25)")
+    args = parser.parse_args(argv)
+
+    # httpx logs every (fixture) request at INFO; keep the table readable
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    from . import suite  # noqa: F401  (registers benchmarks)
+
+    names = list(BENCHMARKS)
+    if args.filter:
+        names = [n for n in names if any(fnmatch.fnmatch(n, pat) for pat in args.filter)]
+
+    if args.list:
+        for name in names:
+            print(f"{name:<40} {BENCHMARKS[name].description}")
+        return 0
+
+    if not names:
+        print("No benchmarks match the given filter.", file=sys.stderr)
+        return 2
+
+    results = run_benchmarks(names, repeat=args.repeat, warmup=args.warmup)
+    print(format_results_table(results))
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            write_results(results, path)
+            print(f"\nWrote {path}")
+
+    if args.compare:
+        rows = compare_results(results, load_results(args.compare), args.threshold)
+        print()
+        print(format_comparison_table(rows))
+        if any(row["status"] == "regression" for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
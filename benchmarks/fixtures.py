@@ -0,0 +1,181 @@
+"""Offline fixture replay for the benchmark suite.
+
+Recorded PokeAPI, Smogon and PokePaste responses live under ``fixtures/`` and
+are served to the real API clients through an ``httpx.MockTransport``, so the
+full fetch -> parse -> cache path runs without touching the network. The
+same store backs the HTTP stand-in server (``benchmarks.standin``).
+
+Fixture layout (mirrors the upstream URL paths):
+    fixtures/pokeapi/<endpoint>.json              e.g. pokemon/flutter-mane.json
+    fixtures/smogon/chaos/<format>-<rating>.json  served for any month
+    fixtures/pokepaste/<paste_id>.txt
+"""
+
+import json
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.api.pokeapi import PokeAPIClient
+from vgc_mcp_core.api.pokepaste import PokePasteClient
+from vgc_mcp_core.api.smogon import SmogonStatsClient
+from vgc_mcp_core.config import settings
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+CLIENTS = ("pokeapi", "smogon", "pokepaste")
+
+# Real upstream services, used when recording through the stand-in
+UPSTREAM_BASE_URLS = {
+    "pokeapi": "https://pokeapi.co/api/v2",
+    "smogon": "https://www.smogon.com/stats",
+    "pokepaste": "https://pokepast.es",
+}
+
+
+class FixtureStore:
+    """Map upstream request paths to fixture files, and read/write them."""
+
+    def __init__(self, fixtures_dir: Optional[Path] = None):
+        self.fixtures_dir = Path(fixtures_dir or FIXTURES_DIR)
+
+    def path_for(self, client: str, upstream_path: str) -> Optional[Path]:
+        """Fixture file for ``upstream_path`` (relative to the client's base URL).
+
+        Returns None for paths the layout has no slot for, or that would
+        escape the fixture directory.
+        """
+        parts = [p for p in upstream_path.strip("/").split("/") if p]
+        if not parts or any(p in (".", "..") for p in parts):
+            return None
+
+        if client == "pokeapi":
+            path = self.fixtures_dir / "pokeapi" / Path(*parts[:-1]) / f"{parts[-1]}.json"
+        elif client == "smogon":
+            # <month>/chaos/<format>-<rating>.json -> month-agnostic fixture
+            if len(parts) != 3 or parts[1] != "chaos":
+                return None
+            path = self.fixtures_dir / "smogon" / "chaos" / parts[2]
+        elif client == "pokepaste":
+            path = self.fixtures_dir / "pokepaste" / f"{parts[0]}.txt"
+        else:
+            return None
+
+        if not path.resolve().is_relative_to(self.fixtures_dir.resolve()):
+            return None
+        return path
+
+    def split_url(self, url: str) -> tuple[str, str]:
+        """Split a request URL into (client name, path below the base URL)."""
+        bases = {
+            "pokeapi": settings.POKEAPI_BASE_URL,
+            "smogon": settings.SMOGON_STATS_BASE_URL,
+            "pokepaste": settings.POKEPASTE_BASE_URL,
+        }
+        for client, base in bases.items():
+            if url.startswith(base):
+                return client, url[len(base):]
+        return "unknown", url
+
+    def load(self, path: Optional[Path]) -> Optional[bytes]:
+        """Raw fixture bytes, or None if there is no recording."""
+        if path is None or not path.is_file():
+            return None
+        return path.read_bytes()
+
+    def save(self, path: Path, body: bytes) -> None:
+        """Record a response body. JSON is re-indented for readable diffs."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".json":
+            body = (json.dumps(json.loads(body), indent=1, sort_keys=True) + "\n").encode("utf-8")
+        path.write_bytes(body)
+
+
+def media_type_for(path: Path) -> str:
+    return "application/json" if path.suffix == ".json" else "text/plain; charset=utf-8"
+
+
+class FixtureTransport:
+    """Serve recorded responses for the three upstream APIs.
+
+    Unknown paths return 404, which every client already treats as a miss,
+    so a benchmark can never silently fall through to the real service.
+    """
+
+    def __init__(self, fixtures_dir: Optional[Path] = None):
+        self.store = FixtureStore(fixtures_dir)
+        self.requests: Counter[str] = Counter()
+        self.misses: list[str] = []
+
+    @property
+    def fixtures_dir(self) -> Path:
+        return self.store.fixtures_dir
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        client_name, upstream_path = self.store.split_url(str(request.url))
+        self.requests[client_name] += 1
+
+        path = self.store.path_for(client_name, upstream_path)
+        body = self.store.load(path)
+        if body is None:
+            self.misses.append(str(request.url))
+            return httpx.Response(404, request=request)
+
+        return httpx.Response(
+            200, content=body, headers={"content-type": media_type_for(path)}, request=request,
+        )
+
+    def install(self, client) -> None:
+        """Point an API client's HTTP session at this transport."""
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(self))
+
+
+@dataclass
+class OfflineEnvironment:
+    """API clients wired to recorded fixtures and a throwaway disk cache."""
+    cache: APICache
+    pokeapi: PokeAPIClient
+    smogon: SmogonStatsClient
+    pokepaste: PokePasteClient
+    transport: FixtureTransport
+    _tmpdir: Optional[tempfile.TemporaryDirectory] = field(default=None, repr=False)
+
+    @classmethod
+    def create(cls, fixtures_dir: Optional[Path] = None) -> "OfflineEnvironment":
+        """Build clients backed by a fresh temporary cache directory."""
+        tmpdir = tempfile.TemporaryDirectory(prefix="vgc-bench-")
+        cache = APICache(tmpdir.name)
+        transport = FixtureTransport(fixtures_dir)
+
+        pokeapi = PokeAPIClient(cache)
+        smogon = SmogonStatsClient(cache)
+        pokepaste = PokePasteClient(cache)
+        for client in (pokeapi, smogon, pokepaste):
+            transport.install(client)
+
+        return cls(
+            cache=cache,
+            pokeapi=pokeapi,
+            smogon=smogon,
+            pokepaste=pokepaste,
+            transport=transport,
+            _tmpdir=tmpdir,
+        )
+
+    def scratch_path(self, name: str) -> Path:
+        """Path for a benchmark's output file, removed with the cache by ``close()``."""
+        return Path(self._tmpdir.name) / name
+
+    async def close(self) -> None:
+        """Close HTTP sessions and remove the temporary cache."""
+        for client in (self.pokeapi, self.smogon, self.pokepaste):
+            await client.close()
+        self.cache.close()
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
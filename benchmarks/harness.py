@@ -0,0 +1,215 @@
+"""Benchmark registry, timing loop and baseline comparison."""
+
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from .fixtures import OfflineEnvironment
+
+RESULTS_SCHEMA_VERSION = 1
+
+# Median slowdown (current / baseline - 1) above which a benchmark is a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+
+
+@dataclass
+class Benchmark:
+    """A named benchmark.
+
+    ``setup`` receives the offline environment and returns the callable to
+    time (sync or async, no arguments). Setup cost is never measured.
+    """
+    name: str
+    group: str
+    description: str
+    setup: Callable[[OfflineEnvironment], Awaitable[Callable[[], Any]]]
+    repeat: int = 20
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, group: str, repeat: int = 20):
+    """Register a benchmark setup coroutine under ``name``."""
+    def decorator(setup):
+        BENCHMARKS[name] = Benchmark(
+            name=name,
+            group=group,
+            description=(inspect.getdoc(setup) or "").split("\n")[0],
+            setup=setup,
+            repeat=repeat,
+        )
+        return setup
+    return decorator
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list."""
+    ordered = sorted(samples)
+    idx = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+async def _time_benchmark(
+    bench: Benchmark,
+    env: OfflineEnvironment,
+    repeat: Optional[int],
+    warmup: int,
+) -> dict:
+    """Run setup, warm up, then time ``repeat`` calls."""
+    fn = await bench.setup(env)
+    runs = repeat or bench.repeat
+
+    for _ in range(warmup):
+        result = fn()
+        if inspect.isawaitable(result):
+            await result
+
+    fetches_before = sum(env.transport.requests.values())
+    samples: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        if inspect.isawaitable(result):
+            await result
+        samples.append((time.perf_counter() - start) * 1000)
+    fetches = sum(env.transport.requests.values()) - fetches_before
+
+    return {
+        "group": bench.group,
+        "description": bench.description,
+        "repeat": runs,
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p95_ms": round(percentile(samples, 95), 4),
+        "stdev_ms": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+        "network_fetches": fetches,
+        "fixture_misses": len(env.transport.misses),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """Current git commit hash, if the suite runs from a checkout."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=Path(__file__).parent,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(
+    names: Optional[list[str]] = None,
+    repeat: Optional[int] = None,
+    warmup: int = 2,
+) -> dict:
+    """Run the selected benchmarks (all by default) and return a results document.
+
+    Each benchmark gets its own offline environment so cache state never
+    leaks between cases.
+    """
+    # Import for registration side effects
+    from . import suite  # noqa: F401
+
+    selected = [BENCHMARKS[n] for n in names] if names else list(BENCHMARKS.values())
+
+    async def _run_all() -> dict:
+        results = {}
+        for bench in selected:
+            env = OfflineEnvironment.create()
+            try:
+                results[bench.name] = await _time_benchmark(bench, env, repeat, warmup)
+            finally:
+                await env.close()
+        return results
+
+    return {
+        "schema": RESULTS_SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "benchmarks": asyncio.run(_run_all()),
+    }
+
+
+def compare_results(
+    current: dict,
+    baseline: dict,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[dict]:
+    """Compare median timings of two results documents.
+
+    Returns one row per benchmark present in both, with ``ratio`` =
+    current / baseline median and a ``status`` of "regression",
+    "improvement" or "ok".
+    """
+    rows = []
+    base_benchmarks = baseline.get("benchmarks", {})
+    for name, cur in current.get("benchmarks", {}).items():
+        base = base_benchmarks.get(name)
+        if base is None or not base.get("median_ms"):
+            continue
+        ratio = cur["median_ms"] / base["median_ms"]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({
+            "name": name,
+            "baseline_ms": base["median_ms"],
+            "current_ms": cur["median_ms"],
+            "ratio": round(ratio, 3),
+            "status": status,
+        })
+    return rows
+
+
+def load_results(path: Path) -> dict:
+    """Load a results document written by ``write_results``."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_results(results: dict, path: Path) -> None:
+    """Write a results document as pretty-printed JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def format_results_table(results: dict) -> str:
+    """Render results as a fixed-width text table."""
+    lines = [f"{'benchmark':<44} {'median ms':>10} {'p95 ms':>10} {'fetches':>8}"]
+    for name, r in results["benchmarks"].items():
+        lines.append(
+            f"{name:<44} {r['median_ms']:>10.3f} {r['p95_ms']:>10.3f} {r['network_fetches']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison_table(rows: list[dict]) -> str:
+    """Render ``compare_results`` rows as a fixed-width text table."""
+    lines = [f"{'benchmark':<44} {'baseline':>10} {'current':>10} {'ratio':>7}  status"]
+    for row in rows:
+        lines.append(
+            f"{row['name']:<44} {row['baseline_ms']:>10.3f} {row['current_ms']:>10.3f} "
+            f"{row['ratio']:>7.2f}  {row['status']}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,233 @@
+"""Concurrent SSE load generator for the HTTP server.
+
+Opens N MCP sessions against ``/sse`` and has each one drive a weighted mix
+of tool calls, then reports latency percentiles per tool. Run it against a
+server whose upstream APIs point at ``benchmarks.standin`` to size a
+deployment without touching the real services:
+
+    python -m benchmarks.standin --port 8100 --latency-ms 40 &
+    VGC_POKEAPI_BASE_URL=http://127.0.0.1:8100/pokeapi \\
+    VGC_SMOGON_STATS_BASE_URL=http://127.0.0.1:8100/smogon \\
+    VGC_POKEPASTE_BASE_URL=http://127.0.0.1:8100/pokepaste \\
+    vgc-mcp-http &
+    python -m benchmarks.loadgen --url http://127.0.0.1:8000/sse --sessions 20 --duration 60
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .harness import percentile
+
+
+@dataclass
+class ToolCall:
+    """One entry in a tool mix."""
+    tool: str
+    arguments: dict
+    weight: float = 1.0
+
+
+# Weighted towards the cheap, high-traffic lookups, with a tail of heavy
+# optimizer calls. Species and moves all exist in the recorded fixtures.
+DEFAULT_MIX = [
+    ToolCall("calculate_damage_output",
+             {"attacker_name": "flutter-mane", "defender_name": "incineroar",
+              "move_name": "moonblast"}, 30),
+    ToolCall("calculate_damage_output",
+             {"attacker_name": "urshifu-rapid-strike", "defender_name": "amoonguss",
+              "move_name": "surging-strikes"}, 15),
+    ToolCall("get_usage_stats", {"pokemon_name": "incineroar"}, 15),
+    ToolCall("get_common_sets", {"pokemon_name": "flutter-mane"}, 10),
+    ToolCall("get_pokemon_stats", {"pokemon_name": "rillaboom"}, 10),
+    ToolCall("compare_speed", {"pokemon1_name": "chien-pao", "pokemon2_name": "flutter-mane"}, 10),
+    ToolCall("find_survival_evs",
+             {"attacker_name": "chien-pao", "defender_name": "amoonguss",
+              "move_name": "icicle-crash"}, 5),
+    ToolCall("calculate_bulk_offensive_calcs",
+             {"attacker_name": "flutter-mane", "move_names": ["moonblast", "shadow-ball"]}, 3),
+    ToolCall("optimize_dual_survival_spread",
+             {"pokemon_name": "incineroar",
+              "survive_hit1_attacker": "flutter-mane", "survive_hit1_move": "moonblast",
+              "survive_hit2_attacker": "urshifu-rapid-strike",
+              "survive_hit2_move": "surging-strikes"}, 2),
+]
+
+
+def load_mix(path: Path) -> list[ToolCall]:
+    """Load a tool mix from JSON: ``[{"tool": ..., "arguments": {...}, "weight": 1}, ...]``."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [ToolCall(**entry) for entry in json.load(f)]
+
+
+@dataclass
+class LoadResults:
+    """Raw samples collected during a load run."""
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    session_failures: int = 0
+    elapsed: float = 0.0
+
+    def record(self, tool: str, seconds: float, ok: bool) -> None:
+        self.latencies[tool].append(seconds * 1000)
+        if not ok:
+            self.errors[tool] += 1
+
+    def summary(self) -> dict:
+        """Per-tool and overall p50/p95/p99 (ms), error counts and throughput."""
+        tools = {}
+        all_samples: list[float] = []
+        for tool, samples in sorted(self.latencies.items()):
+            all_samples.extend(samples)
+            tools[tool] = _stats(samples, self.errors.get(tool, 0))
+        total = _stats(all_samples, sum(self.errors.values())) if all_samples else {}
+        return {
+            "elapsed_seconds": round(self.elapsed, 3),
+            "throughput_per_second": (
+                round(len(all_samples) / self.elapsed, 2) if self.elapsed else 0.0
+            ),
+            "session_failures": self.session_failures,
+            "overall": total,
+            "tools": tools,
+        }
+
+
+def _stats(samples: list[float], errors: int) -> dict:
+    return {
+        "calls": len(samples),
+        "errors": errors,
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "p99_ms": round(percentile(samples, 99), 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+async def _run_session(
+    url: str,
+    mix: list[ToolCall],
+    deadline: float,
+    max_calls: Optional[int],
+    think_ms: float,
+    rng: random.Random,
+    results: LoadResults,
+) -> None:
+    """One SSE session issuing calls until the deadline or call budget."""
+    from mcp import ClientSession
+    from mcp.client.sse import sse_client
+
+    weights = [c.weight for c in mix]
+    try:
+        async with sse_client(url, timeout=30, sse_read_timeout=600) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                calls = 0
+                while time.monotonic() < deadline and (max_calls is None or calls < max_calls):
+                    call = rng.choices(mix, weights)[0]
+                    start = time.perf_counter()
+                    try:
+                        result = await session.call_tool(call.tool, call.arguments)
+                        ok = not result.isError
+                    except Exception:
+                        ok = False
+                    results.record(call.tool, time.perf_counter() - start, ok)
+                    calls += 1
+                    if think_ms:
+                        await asyncio.sleep(rng.uniform(0, 2 * think_ms) / 1000)
+    except Exception as e:
+        results.session_failures += 1
+        print(f"session failed: {e!r}", file=sys.stderr)
+
+
+async def run_load(
+    url: str,
+    sessions: int,
+    duration: float,
+    mix: Optional[list[ToolCall]] = None,
+    calls_per_session: Optional[int] = None,
+    think_ms: float = 0.0,
+    ramp_seconds: float = 0.0,
+    seed: Optional[int] = None,
+) -> LoadResults:
+    """Run ``sessions`` concurrent sessions for ``duration`` seconds."""
+    mix = mix or DEFAULT_MIX
+    rng = random.Random(seed)
+    results = LoadResults()
+    start = time.monotonic()
+    deadline = start + duration
+
+    async def staggered(i: int):
+        if ramp_seconds and sessions > 1:
+            await asyncio.sleep(ramp_seconds * i / (sessions - 1))
+        await _run_session(
+            url, mix, deadline, calls_per_session, think_ms,
+            random.Random(rng.random()), results,
+        )
+
+    await asyncio.gather(*(staggered(i) for i in range(sessions)))
+    results.elapsed = time.monotonic() - start
+    return results
+
+
+def format_summary(summary: dict) -> str:
+    lines = [
+        f"{'tool':<36} {'calls':>6} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    ]
+    rows = list(summary["tools"].items())
+    if summary["overall"]:
+        rows.append(("ALL", summary["overall"]))
+    for tool, s in rows:
+        lines.append(
+            f"{tool:<36} {s['calls']:>6} {s['errors']:>6} "
+            f"{s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} {s['p99_ms']:>9.1f}"
+        )
+    lines.append(
+        f"\n{summary['throughput_per_second']} calls/s over {summary['elapsed_seconds']}s, "
+        f"{summary['session_failures']} failed sessions"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.loadgen",
+        description="Drive concurrent MCP SSE sessions and report per-tool latency.",
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8000/sse")
+    parser.add_argument("--sessions", "-n", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds")
+    parser.add_argument("--calls-per-session", type=int, default=None)
+    parser.add_argument("--think-ms", type=float, default=0.0,
+                        help="Mean pause between a session's calls")
+    parser.add_argument("--ramp", type=float, default=0.0,
+                        help="Seconds over which sessions are started")
+    parser.add_argument("--mix", type=Path, help="JSON tool mix (default: built-in)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", "-o", type=Path, help="Write summary JSON here")
+    args = parser.parse_args(argv)
+
+    mix = load_mix(args.mix) if args.mix else DEFAULT_MIX
+    results = asyncio.run(run_load(
+        args.url, args.sessions, args.duration, mix,
+        calls_per_session=args.calls_per_session,
+        think_ms=args.think_ms,
+        ramp_seconds=args.ramp,
+        seed=args.seed,
+    ))
+    summary = results.summary()
+    print(format_summary(summary))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    return 1 if results.session_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""Local HTTP stand-in for PokeAPI, Smogon stats and PokePaste.
+
+Serves recorded fixtures with optional latency and error injection, so the
+HTTP server can be load-tested without touching the real services. In record
+mode, requests with no fixture are proxied to the real upstream and the
+response is saved, so a run against the stand-in doubles as a recording
+session.
+
+Routes (point the server at them with the ``VGC_*_BASE_URL`` variables):
+    /pokeapi/<endpoint>                    VGC_POKEAPI_BASE_URL=http://HOST:PORT/pokeapi
+    /smogon/<month>/chaos/<file>.json      VGC_SMOGON_STATS_BASE_URL=http://HOST:PORT/smogon
+    /pokepaste/<paste_id>/raw              VGC_POKEPASTE_BASE_URL=http://HOST:PORT/pokepaste
+    /_standin/stats                        request / miss / injected-error counters
+
+Usage:
+    python -m benchmarks.standin --port 8100 --latency-ms 40 --jitter-ms 20 --error-rate 0.01
+    python -m benchmarks.standin --port 8100 --record
+"""
+
+import argparse
+import asyncio
+import contextlib
+import random
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from .fixtures import CLIENTS, UPSTREAM_BASE_URLS, FixtureStore, media_type_for
+
+
+@dataclass
+class FaultConfig:
+    """Latency and error injection applied to every stand-in response."""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: Optional[int] = None
+
+
+class StandInState:
+    """Counters and upstream session shared by all stand-in requests."""
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        faults: FaultConfig,
+        record: bool = False,
+        upstream: Optional[httpx.AsyncClient] = None,
+    ):
+        self.store = store
+        self.faults = faults
+        self.record = record
+        self.upstream = upstream
+        self.rng = random.Random(faults.seed)
+        self.requests: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.recorded: Counter[str] = Counter()
+        self.injected_errors: Counter[str] = Counter()
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": dict(self.requests),
+            "misses": dict(self.misses),
+            "recorded": dict(self.recorded),
+            "injected_errors": dict(self.injected_errors),
+        }
+
+    async def fetch_upstream(self, client: str, upstream_path: str) -> Optional[bytes]:
+        """Fetch from the real service (record mode). None unless 200."""
+        if self.upstream is None:
+            self.upstream = httpx.AsyncClient(
+                timeout=30.0, headers={"User-Agent": "VGC-MCP-Server/0.1.0"},
+            )
+        response = await self.upstream.get(f"{UPSTREAM_BASE_URLS[client]}/{upstream_path}")
+        if response.status_code != 200:
+            return None
+        return response.content
+
+
+def create_standin_app(
+    fixtures_dir: Optional[Path] = None,
+    faults: Optional[FaultConfig] = None,
+    record: bool = False,
+    upstream: Optional[httpx.AsyncClient] = None,
+):
+    """Build the stand-in Starlette app."""
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse, Response
+    from starlette.routing import Route
+
+    state = StandInState(FixtureStore(fixtures_dir), faults or FaultConfig(), record, upstream)
+
+    async def serve(request):
+        client = request.path_params["client"]
+        upstream_path = request.path_params["path"]
+        if client not in CLIENTS:
+            return Response(status_code=404)
+        state.requests[client] += 1
+
+        faults = state.faults
+        delay = faults.latency_ms
+        if faults.jitter_ms:
+            delay += state.rng.uniform(0, faults.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if faults.error_rate and state.rng.random() < faults.error_rate:
+            state.injected_errors[client] += 1
+            return Response(status_code=faults.error_status)
+
+        path = state.store.path_for(client, upstream_path)
+        body = state.store.load(path)
+        if body is None and state.record and path is not None:
+            body = await state.fetch_upstream(client, upstream_path)
+            if body is not None:
+                state.store.save(path, body)
+                state.recorded[client] += 1
+        if body is None:
+            state.misses[client] += 1
+            return Response(status_code=404)
+        return Response(body, media_type=media_type_for(path))
+
+    async def stats(request):
+        return JSONResponse(state.snapshot())
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        yield
+        if state.upstream is not None:
+            await state.upstream.aclose()
+
+    app = Starlette(
+        routes=[
+            Route("/_standin/stats", endpoint=stats, methods=["GET"]),
+            Route("/{client}/{path:path}", endpoint=serve, methods=["GET"]),
+        ],
+        lifespan=lifespan,
+    )
+    app.state.standin = state
+    return app
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.standin",
+        description="Serve recorded PokeAPI / Smogon / PokePaste fixtures over HTTP.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--fixtures", type=Path, default=None,
+                        help="Fixture directory (default: benchmarks/fixtures)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added per response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform extra latency")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of responses replaced by an error status")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=None, help="Seed for jitter/errors")
+    parser.add_argument("--record", action="store_true",
+                        help="Proxy missing fixtures to the real services and save them")
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    faults = FaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    app = create_standin_app(args.fixtures, faults, record=args.record)
+
+    base = f"http://{args.host}:{args.port}"
+    print("Point the server at the stand-in with:")
+    print(f"  VGC_POKEAPI_BASE_URL={base}/pokeapi")
+    print(f"  VGC_SMOGON_STATS_BASE_URL={base}/smogon")
+    print(f"  VGC_POKEPASTE_BASE_URL={base}/pokepaste")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""Benchmark cases.
+
+Every case builds its inputs from recorded fixtures in ``setup`` (untimed)
+and returns the callable that gets timed. Builds mirror common Regulation F
+sets so the numbers reflect realistic calc paths (spread moves, multi-hit,
+crits, Tera, weather).
+"""
+
+from typing import Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from vgc_mcp_core.calc.bulk_calc import DEFAULT_SCENARIOS, run_bulk_calcs
+from vgc_mcp_core.calc.damage import calculate_bulk_threshold, calculate_damage
+from vgc_mcp_core.calc.modifiers import DamageModifiers
+from vgc_mcp_core.calc.team_matchup import (
+    build_matchup_matrix,
+    build_pokemon_profile,
+    generate_full_game_plan,
+)
+from vgc_mcp_core.export.damage_report import generate_excel_report
+from vgc_mcp_core.models.pokemon import EVSpread, Nature, PokemonBuild
+from vgc_mcp_core.utils.damage_verdicts import calculate_ko_probability
+
+from .fixtures import OfflineEnvironment
+from .harness import benchmark
+
+# (species, nature, evs, ability, item, tera, moves)
+SETS = {
+    "flutter-mane": (
+        Nature.TIMID, (4, 0, 0, 252, 0, 252), "protosynthesis", "booster-energy", "fairy",
+        ["moonblast", "shadow-ball", "dazzling-gleam", "icy-wind"],
+    ),
+    "incineroar": (
+        Nature.CAREFUL, (252, 4, 84, 0, 164, 4), "intimidate", "safety-goggles", "ghost",
+        ["fake-out", "flare-blitz", "knock-off", "parting-shot"],
+    ),
+    "urshifu-rapid-strike": (
+        Nature.ADAMANT, (4, 252, 0, 0, 0, 252), "unseen-fist", "focus-sash", "water",
+        ["surging-strikes", "close-combat", "aqua-jet", "protect"],
+    ),
+    "rillaboom": (
+        Nature.ADAMANT, (252, 116, 4, 0, 60, 76), "grassy-surge", "assault-vest", "fire",
+        ["fake-out", "wood-hammer", "grassy-glide", "u-turn"],
+    ),
+    "amoonguss": (
+        Nature.SASSY, (252, 0, 172, 0, 84, 0), "regenerator", "rocky-helmet", "water",
+        ["spore", "rage-powder", "pollen-puff", "protect"],
+    ),
+    "chien-pao": (
+        Nature.JOLLY, (4, 252, 0, 0, 0, 252), "sword-of-ruin", "focus-sash", "ghost",
+        ["icicle-crash", "sacred-sword", "sucker-punch", "protect"],
+    ),
+    "landorus-therian": (
+        Nature.ADAMANT, (4, 252, 0, 0, 0, 252), "intimidate", "choice-scarf", "flying",
+        ["stomping-tantrum", "rock-slide", "u-turn", "protect"],
+    ),
+    "ogerpon-hearthflame-mask": (
+        Nature.ADAMANT, (4, 252, 0, 0, 0, 252), "mold-breaker", "hearthflame-mask", "fire",
+        ["ivy-cudgel", "follow-me", "wood-hammer", "protect"],
+    ),
+    "tornadus-incarnate": (
+        Nature.TIMID, (252, 0, 4, 0, 0, 252), "prankster", "covert-cloak", "ghost",
+        ["bleakwind-storm", "tailwind", "taunt", "protect"],
+    ),
+    "iron-hands": (
+        Nature.ADAMANT, (252, 252, 0, 0, 4, 0), "quark-drive", "assault-vest", "grass",
+        ["fake-out", "drain-punch", "wild-charge", "heat-wave"],
+    ),
+    "raging-bolt": (
+        Nature.MODEST, (252, 0, 4, 252, 0, 0), "protosynthesis", "booster-energy", "fairy",
+        ["thunderclap", "draco-meteor", "protect", "heat-wave"],
+    ),
+    "kingambit": (
+        Nature.ADAMANT, (252, 252, 0, 0, 4, 0), "defiant", "black-glasses", "flying",
+        ["kowtow-cleave", "sucker-punch", "iron-head", "protect"],
+    ),
+}
+
+TEAM_A = ["flutter-mane", "incineroar", "urshifu-rapid-strike",
+          "rillaboom", "amoonguss", "chien-pao"]
+TEAM_B = ["landorus-therian", "ogerpon-hearthflame-mask", "tornadus-incarnate",
+          "iron-hands", "raging-bolt", "kingambit"]
+
+FORMAT = "gen9vgc2026regfbo3"
+
+
+async def _build(env: OfflineEnvironment, species: str) -> PokemonBuild:
+    """Build a PokemonBuild for ``species`` from fixture data."""
+    nature, evs, ability, item, tera, _ = SETS[species]
+    hp, atk, df, spa, spd, spe = evs
+    return PokemonBuild(
+        name=species,
+        base_stats=await env.pokeapi.get_base_stats(species),
+        types=await env.pokeapi.get_pokemon_types(species),
+        nature=nature,
+        evs=EVSpread(hp=hp, attack=atk, defense=df,
+                     special_attack=spa, special_defense=spd, speed=spe),
+        ability=ability,
+        item=item,
+        tera_type=tera,
+    )
+
+
+async def _moves(env: OfflineEnvironment, species: str, limit: Optional[int] = None):
+    """Fetch the fixture Move objects for ``species``'s set."""
+    names = SETS[species][5][:limit]
+    return [await env.pokeapi.get_move(name, user_name=species) for name in names]
+
+
+async def _profiles(env: OfflineEnvironment, team: list[str]):
+    """Build game-plan profiles for a whole team."""
+    profiles = []
+    for species in team:
+        _, _, ability, item, _, _ = SETS[species]
+        profiles.append(build_pokemon_profile(
+            await _build(env, species), await _moves(env, species), ability, item,
+        ))
+    return profiles
+
+
+# =============================================================================
+# Damage engine
+# =============================================================================
+
+@benchmark("damage.single_hit", group="damage", repeat=200)
+async def bench_single_hit(env: OfflineEnvironment):
+    """Flutter Mane Moonblast into Incineroar (Booster, spread-free single target)."""
+    attacker = await _build(env, "flutter-mane")
+    defender = await _build(env, "incineroar")
+    move = await env.pokeapi.get_move("moonblast", user_name="flutter-mane")
+    modifiers = DamageModifiers(attacker_item="booster-energy",
+                                defender_item="safety-goggles")
+    return lambda: calculate_damage(attacker, defender, move, modifiers)
+
+
+@benchmark("damage.multi_hit", group="damage", repeat=200)
+async def bench_multi_hit(env: OfflineEnvironment):
+    """Urshifu-Rapid-Strike Surging Strikes (3 always-crit hits) into Flutter Mane."""
+    attacker = await _build(env, "urshifu-rapid-strike")
+    defender = await _build(env, "flutter-mane")
+    move = await env.pokeapi.get_move("surging-strikes", user_name="urshifu-rapid-strike")
+    modifiers = DamageModifiers(attacker_item="focus-sash")
+    return lambda: calculate_damage(attacker, defender, move, modifiers)
+
+
+@benchmark("damage.spread_tera_weather", group="damage", repeat=200)
+async def bench_spread_tera(env: OfflineEnvironment):
+    """Tornadus Bleakwind Storm into Tera Water Rillaboom in rain."""
+    attacker = await _build(env, "tornadus-incarnate")
+    defender = await _build(env, "rillaboom")
+    move = await env.pokeapi.get_move("bleakwind-storm", user_name="tornadus-incarnate")
+    modifiers = DamageModifiers(
+        multiple_targets=True, weather="rain",
+        defender_tera_type="water", defender_tera_active=True,
+    )
+    return lambda: calculate_damage(attacker, defender, move, modifiers)
+
+
+@benchmark("damage.ko_probability", group="damage", repeat=200)
+async def bench_ko_probability(env: OfflineEnvironment):
+    """Exact 1-4HKO probabilities over a 16-roll distribution."""
+    attacker = await _build(env, "chien-pao")
+    defender = await _build(env, "amoonguss")
+    move = await env.pokeapi.get_move("icicle-crash", user_name="chien-pao")
+    result = calculate_damage(attacker, defender, move)
+    return lambda: calculate_ko_probability(result.rolls, result.defender_hp, max_hits=4)
+
+
+@benchmark("damage.bulk_threshold", group="damage", repeat=5)
+async def bench_bulk_threshold(env: OfflineEnvironment):
+    """Minimum HP/Def EVs for Incineroar to survive Ogerpon-Hearthflame Ivy Cudgel."""
+    attacker = await _build(env, "ogerpon-hearthflame-mask")
+    defender = await _build(env, "incineroar")
+    move = await env.pokeapi.get_move("ivy-cudgel", user_name="ogerpon-hearthflame-mask")
+    modifiers = DamageModifiers(attacker_item="hearthflame-mask")
+    return lambda: calculate_bulk_threshold(attacker, defender, move, modifiers)
+
+
+# =============================================================================
+# Spread optimizer tools
+# =============================================================================
+
+def _spread_tools(env: OfflineEnvironment) -> dict:
+    """Register spread tools on a throwaway server and return them by name."""
+    from vgc_mcp.tools.spread_tools import register_spread_tools
+
+    mcp = FastMCP("bench")
+    register_spread_tools(mcp, env.pokeapi, env.smogon)
+    return {t.name: t.fn for t in mcp._tool_manager._tools.values()}
+
+
+@benchmark("spread.dual_survival", group="spread", repeat=3)
+async def bench_dual_survival(env: OfflineEnvironment):
+    """optimize_dual_survival_spread: Incineroar vs Flutter Mane + Urshifu-RS."""
+    tool = _spread_tools(env)["optimize_dual_survival_spread"]
+
+    async def run():
+        await tool(
+            pokemon_name="incineroar",
+            survive_hit1_attacker="flutter-mane",
+            survive_hit1_move="moonblast",
+            survive_hit2_attacker="urshifu-rapid-strike",
+            survive_hit2_move="surging-strikes",
+            nature="careful",
+        )
+    return run
+
+
+@benchmark("spread.multi_survival", group="spread", repeat=3)
+async def bench_multi_survival(env: OfflineEnvironment):
+    """optimize_multi_survival_spread: Amoonguss vs four attackers."""
+    tool = _spread_tools(env)["optimize_multi_survival_spread"]
+    threats = [
+        {"attacker": "flutter-mane", "move": "moonblast"},
+        {"attacker": "chien-pao", "move": "icicle-crash"},
+        {"attacker": "ogerpon-hearthflame-mask", "move": "ivy-cudgel"},
+        {"attacker": "raging-bolt", "move": "draco-meteor"},
+    ]
+
+    async def run():
+        await tool(pokemon_name="amoonguss", threats=threats, nature="sassy")
+    return run
+
+
+# =============================================================================
+# Team matchup / game plan
+# =============================================================================
+
+@benchmark("matchup.matrix_6v6", group="matchup", repeat=20)
+async def bench_matchup_matrix(env: OfflineEnvironment):
+    """build_matchup_matrix for two six-Pokemon teams."""
+    team_a = [await _build(env, s) for s in TEAM_A]
+    team_b = [await _build(env, s) for s in TEAM_B]
+    return lambda: build_matchup_matrix(team_a, team_b)
+
+
+@benchmark("matchup.full_game_plan", group="matchup", repeat=10)
+async def bench_full_game_plan(env: OfflineEnvironment):
+    """generate_full_game_plan for two six-Pokemon teams with full movesets."""
+    yours = await _profiles(env, TEAM_A)
+    theirs = await _profiles(env, TEAM_B)
+    return lambda: generate_full_game_plan(yours, theirs)
+
+
+# =============================================================================
+# Bulk calcs + export
+# =============================================================================
+
+async def _bulk_inputs(env: OfflineEnvironment):
+    attacker = await _build(env, "flutter-mane")
+    moves = await _moves(env, "flutter-mane", limit=3)
+    defenders = [await _build(env, s) for s in TEAM_B]
+    return attacker, moves, defenders
+
+
+@benchmark("bulk.run_bulk_calcs", group="bulk", repeat=10)
+async def bench_run_bulk_calcs(env: OfflineEnvironment):
+    """run_bulk_calcs: 3 moves x 6 defenders x all default scenarios."""
+    attacker, moves, defenders = await _bulk_inputs(env)
+    scenarios = list(DEFAULT_SCENARIOS.values())
+    return lambda: run_bulk_calcs(attacker, moves, defenders, scenarios)
+
+
+@benchmark("bulk.excel_export", group="bulk", repeat=5)
+async def bench_excel_export(env: OfflineEnvironment):
+    """generate_excel_report for a full bulk-calc summary."""
+    attacker, moves, defenders = await _bulk_inputs(env)
+    summary = run_bulk_calcs(attacker, moves, defenders, list(DEFAULT_SCENARIOS.values()))
+    path = str(env.scratch_path("bench_report.xlsx"))
+
+    def run():
+        generate_excel_report(summary, path)
+    return run
+
+
+# =============================================================================
+# Smogon usage
+# =============================================================================
+
+@benchmark("smogon.usage_stats_cold", group="smogon", repeat=10)
+async def bench_usage_stats_cold(env: OfflineEnvironment):
+    """get_usage_stats with empty caches (fetch + JSON decode + index build + cache write)."""
+    async def run():
+        env.cache.clear_all()
+        env.smogon.clear_snapshots()
+        await env.smogon.get_usage_stats(FORMAT, 0)
+    return run
+
+
+@benchmark("smogon.pokemon_usage", group="smogon", repeat=50)
+async def bench_pokemon_usage(env: OfflineEnvironment):
+    """get_pokemon_usage from a warm cache (per-species aggregation only)."""
+    return lambda: env.smogon.get_pokemon_usage("Flutter Mane", FORMAT, 0)
+
+
+@benchmark("smogon.speed_distribution", group="smogon", repeat=50)
+async def bench_speed_distribution(env: OfflineEnvironment):
+    """get_speed_distribution over every recorded spread for a species."""
+    return lambda: env.smogon.get_speed_distribution("Flutter Mane", 135, FORMAT, 0)
@@ -0,0 +1,123 @@
+"""``vgc-mcp-cache``: build, inspect and restore warm-start cache snapshots.
+
+    vgc-mcp-cache build              # prefetch into a fresh cache, write the snapshot
+    vgc-mcp-cache info               # show a snapshot's manifest
+    vgc-mcp-cache restore [--force]  # unpack a snapshot into the cache directory
+
+Run ``build`` during the image build (see the Dockerfile) so a cold container
+starts with the dex and current usage stats already on disk.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.api.pokeapi import PokeAPIClient
+from vgc_mcp_core.api.smogon import SmogonStatsClient
+from vgc_mcp_core.api.snapshot import (
+    DEFAULT_TOP_POKEMON,
+    read_manifest,
+    restore_snapshot,
+    warm_cache,
+    write_snapshot,
+)
+from vgc_mcp_core.api.transport import get_transport
+from vgc_mcp_core.config import settings
+
+
+async def _build(cache_dir: Path, args) -> dict:
+    cache = APICache(str(cache_dir))
+    pokeapi = PokeAPIClient(cache)
+    smogon = SmogonStatsClient(cache)
+    try:
+        return await warm_cache(
+            pokeapi, smogon,
+            top_pokemon=args.top_pokemon,
+            history_months=args.history_months,
+            ratings=args.ratings,
+        )
+    finally:
+        await pokeapi.close()
+        await smogon.close()
+        await get_transport().close()
+        cache.close()
+
+
+def _cmd_build(args) -> int:
+    with tempfile.TemporaryDirectory(prefix="vgc-cache-") as tmp:
+        cache_dir = Path(tmp) / "cache"
+        summary = asyncio.run(_build(cache_dir, args))
+        manifest = write_snapshot(cache_dir, args.output, summary)
+
+    usage = summary["usage"]
+    print(f"Snapshot written to {args.output} ({manifest['bytes'] / 1024 / 1024:.1f} MB)")
+    print(f"  names:   {summary['names']}")
+    print(f"  usage:   {len(usage['available'])} available, {len(usage['missing'])} missing, "
+          f"{len(usage['errors'])} errors")
+    print(f"  dex:     {summary['pokemon']} Pokemon, {summary['moves']} moves "
+          f"({len(summary['failed'])} failed)")
+    print(f"  history: {summary['history_months']} months")
+    if not usage["available"] and not summary["names"]:
+        print("Nothing could be fetched; is the network available?", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _cmd_info(args) -> int:
+    print(json.dumps(read_manifest(args.snapshot), indent=2))
+    return 0
+
+
+def _cmd_restore(args) -> int:
+    manifest = restore_snapshot(args.snapshot, args.cache_dir, force=args.force)
+    if manifest is None:
+        print(f"Not restored ({args.cache_dir} already populated, or snapshot missing/"
+              f"incompatible; use --force to overwrite)", file=sys.stderr)
+        return 1
+    print(f"Restored snapshot from {manifest['created_at']} into {args.cache_dir} "
+          f"in {manifest['restore_seconds']}s")
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="vgc-mcp-cache",
+        description="Build and restore warm-start cache snapshots.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Prefetch data and write a snapshot")
+    build.add_argument("--output", "-o", type=Path, default=settings.CACHE_SNAPSHOT,
+                       help=f"Snapshot path (default {settings.CACHE_SNAPSHOT})")
+    build.add_argument("--top-pokemon", type=int, default=DEFAULT_TOP_POKEMON,
+                       help="Most-used Pokemon whose dex entries and moves are fetched")
+    build.add_argument("--history-months", type=int, default=6,
+                       help="Months of usage history to include")
+    build.add_argument("--ratings", type=int, nargs="+",
+                       help="Rating cutoffs to prefetch (default: all)")
+    build.set_defaults(func=_cmd_build)
+
+    info = sub.add_parser("info", help="Print a snapshot's manifest")
+    info.add_argument("snapshot", type=Path, nargs="?", default=settings.CACHE_SNAPSHOT)
+    info.set_defaults(func=_cmd_info)
+
+    restore = sub.add_parser("restore", help="Unpack a snapshot into the cache directory")
+    restore.add_argument("snapshot", type=Path, nargs="?", default=settings.CACHE_SNAPSHOT)
+    restore.add_argument("--cache-dir", type=Path, default=settings.CACHE_DIR)
+    restore.add_argument("--force", action="store_true",
+                         help="Replace a populated cache directory")
+    restore.set_defaults(func=_cmd_restore)
+
+    args = parser.parse_args(argv)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
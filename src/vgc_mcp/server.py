@@ -28,13 +28,21 @@ Usage:
     vgc-mcp (after pip install)
 """
 
+from contextlib import asynccontextmanager
+
 from mcp.server.fastmcp import FastMCP
 
-from vgc_mcp_core.config import logger
+from vgc_mcp_core.config import logger, settings
+from vgc_mcp_core.metrics import REGISTRY, PROMETHEUS_CONTENT_TYPE, instrument_tools
 from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.api.snapshot import restore_configured_snapshot
+from vgc_mcp_core.result_cache import get_tool_result_cache
 from vgc_mcp_core.api.pokeapi import PokeAPIClient
 from vgc_mcp_core.api.smogon import SmogonStatsClient
+from vgc_mcp_core.api.prefetch import UsageStatsPrefetcher
 from vgc_mcp_core.api.pokepaste import PokePasteClient
+from vgc_mcp_core.api.transport import get_transport
+from vgc_mcp_core.calc.speed_tiers import get_speed_tier_store
 from vgc_mcp_core.team.manager import TeamManager
 from vgc_mcp_core.team.analysis import TeamAnalyzer
 from vgc_mcp_core.state import BuildStateManager
@@ -84,11 +92,28 @@ from .tools.type_tools import register_type_tools
 from .tools.onboarding_tools import register_onboarding_tools
 from .tools.game_plan_tools import register_game_plan_tools
 from .tools.bulk_calc_tools import register_bulk_calc_tools
+from .tools.results_tools import register_results_tools
 
 # Note: MCP-UI is only enabled in vgc-mcp-lite for smaller footprint
 # Full server focuses on tool completeness over visual components
 
 
+@asynccontextmanager
+async def server_lifespan(server: FastMCP):
+    """Start usage-stats prefetch, the name-index and speed-tier loads with the first session.
+
+    Runs once per session over SSE, so it only ever starts the (idempotent)
+    background work; the HTTP app's own lifespan stops it on shutdown.
+    """
+    if settings.SMOGON_PREFETCH_ENABLED:
+        usage_prefetcher.start()
+    if settings.NAME_INDEX_ENABLED:
+        pokeapi.start_name_index_load()
+    if settings.SPEED_TIERS_ENABLED:
+        get_speed_tier_store().start(smogon, pokeapi)
+    yield {}
+
+
 # Initialize MCP server
 mcp = FastMCP(
     "VGC Team Builder",
@@ -100,7 +125,8 @@ IMPORTANT - For ALL damage calculations, ALWAYS show full spreads for BOTH Pokem
 **Result:** [damage]% ([verdict])
 
 Example: "**Attacker:** Adamant 4/252/0/0/0/252 Urshifu @ Choice Scarf"
-Users need EXACT spreads to verify calculations themselves."""
+Users need EXACT spreads to verify calculations themselves.""",
+    lifespan=server_lifespan,
 )
 
 
@@ -223,15 +249,21 @@ Use calculate_damage_output and show:
 # Initialize shared state
 # ============================================================================
 
-# Initialize shared state
+# Initialize shared state (an empty cache is first filled from the warm-start snapshot)
+restore_configured_snapshot()
 cache = APICache()
 pokeapi = PokeAPIClient(cache)
 smogon = SmogonStatsClient(cache)
 pokepaste = PokePasteClient(cache)
+usage_prefetcher = UsageStatsPrefetcher(smogon)
 team_manager = TeamManager()
 analyzer = TeamAnalyzer()
 build_manager = BuildStateManager()
 
+# Repeat calls of pure tools (@cached_tool) are served from the result cache
+if settings.RESULT_CACHE_ENABLED:
+    get_tool_result_cache().enable(disk=cache, usage_source=smogon)
+
 # Register all tools
 register_stats_tools(mcp, pokeapi)
 register_damage_tools(mcp, pokeapi, smogon)  # Pass smogon for auto-fetching common spreads
@@ -241,7 +273,7 @@ register_usage_tools(mcp, smogon)
 register_spread_tools(mcp, pokeapi, smogon)  # Pass smogon for auto-fetching attacker spreads
 register_import_export_tools(mcp, pokeapi, team_manager)
 register_matchup_tools(mcp, team_manager)
-register_core_tools(mcp, team_manager, smogon)
+register_core_tools(mcp, team_manager, smogon, pokeapi)
 
 # Phase 3 tools
 register_legality_tools(mcp, team_manager)
@@ -311,6 +343,12 @@ register_game_plan_tools(mcp, pokeapi, team_manager, smogon)
 # Bulk offensive damage calcs + Excel/PDF export
 register_bulk_calc_tools(mcp, pokeapi, smogon)
 
+# Paging through large results returned with a next_cursor
+register_results_tools(mcp)
+
+# Per-tool latency / calc-count / cache metrics (served on /metrics over HTTP)
+instrument_tools(mcp)
+
 
 def main():
     """Entry point for the MCP server (local stdio transport)."""
@@ -337,6 +375,18 @@ def main_http(host: str = "0.0.0.0", port: int = None):
     # Use PORT env var (Render sets this), fallback to 8000
     if port is None:
         port = int(os.environ.get("PORT", 8000))
+
+    app = create_http_app()
+
+    logger.info(f"Starting VGC MCP server on http://{host}:{port}")
+    logger.info(f"SSE endpoint: http://{host}:{port}/sse")
+    logger.info(f"Health check: http://{host}:{port}/health")
+    logger.info(f"Metrics: http://{host}:{port}/metrics")
+    uvicorn.run(app, host=host, port=port)
+
+
+def create_http_app():
+    """Build the Starlette app serving SSE, health and metrics endpoints."""
     from mcp.server.sse import SseServerTransport
     from starlette.applications import Starlette
     from starlette.routing import Mount, Route
@@ -365,6 +415,22 @@ def main_http(host: str = "0.0.0.0", port: int = None):
             "tools": tool_count
         })
 
+    async def metrics(request):
+        """Prometheus metrics for tool calls and API clients."""
+        return Response(REGISTRY.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        if settings.SMOGON_PREFETCH_ENABLED:
+            usage_prefetcher.start()
+        if settings.NAME_INDEX_ENABLED:
+            pokeapi.start_name_index_load()
+        if settings.SPEED_TIERS_ENABLED:
+            get_speed_tier_store().start(smogon, pokeapi)
+        yield
+        await usage_prefetcher.stop()
+        await get_transport().close()
+
     async def root(request):
         """Root endpoint with server info."""
         tool_count = len(mcp._tool_manager._tools) if hasattr(mcp, '_tool_manager') else 0
@@ -376,17 +442,20 @@ def main_http(host: str = "0.0.0.0", port: int = None):
             "endpoints": {
                 "sse": "/sse",
                 "health": "/health",
+                "metrics": "/metrics",
                 "messages": "/messages/"
             }
         })
 
-    app = Starlette(
+    return Starlette(
         routes=[
             Route("/", endpoint=root, methods=["GET"]),
             Route("/health", endpoint=health_check, methods=["GET"]),
+            Route("/metrics", endpoint=metrics, methods=["GET"]),
             Route("/sse", endpoint=handle_sse),
             Mount("/messages/", app=sse.handle_post_message),
         ],
+        lifespan=lifespan,
         middleware=[
             Middleware(
                 CORSMiddleware,
@@ -398,11 +467,6 @@ def main_http(host: str = "0.0.0.0", port: int = None):
         ]
     )
 
-    logger.info(f"Starting VGC MCP server on http://{host}:{port}")
-    logger.info(f"SSE endpoint: http://{host}:{port}/sse")
-    logger.info(f"Health check: http://{host}:{port}/health")
-    uvicorn.run(app, host=host, port=port)
-
 
 if __name__ == "__main__":
     main()
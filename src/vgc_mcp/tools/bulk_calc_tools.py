@@ -1,9 +1,10 @@
 """MCP tools for bulk offensive damage calculations and export."""
 
 import logging
+from collections.abc import Sequence
 from typing import Optional
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 logger = logging.getLogger(__name__)
 
@@ -11,11 +12,16 @@ from vgc_mcp_core.api.pokeapi import PokeAPIClient
 from vgc_mcp_core.api.smogon import SmogonStatsClient
 from vgc_mcp_core.calc.bulk_calc import (
     DEFAULT_SCENARIOS,
+    BulkCalcSummary,
+    get_best_move_per_defender,
+    get_result,
     get_results_for_scenario,
+    merge_bulk_summaries,
     run_bulk_calcs,
 )
 from vgc_mcp_core.calc.damage import format_percent
 from vgc_mcp_core.formats.showdown import pokemon_build_to_showdown
+from vgc_mcp_core.progress import DEFAULT_PAGE_SIZE, ProgressReporter, get_result_store
 
 from .multicalc_tools import _build_pokemon_from_smogon
 
@@ -32,6 +38,39 @@ def _parse_ev_string(ev_string: str) -> dict:
     return {name: int(val) for name, val in zip(stat_names, parts)}
 
 
+class _DefenderResults(Sequence):
+    """Per-defender result rows of a bulk run, built when sliced.
+
+    Handed to the result store so detailed rows and calc strings past the
+    first page are only rendered if a client pages to them.
+    """
+
+    def __init__(self, summary: BulkCalcSummary):
+        self.summary = summary
+        self.defenders = summary.results.defender_names
+
+    def __len__(self) -> int:
+        return len(self.defenders)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(name) for name in self.defenders[index]]
+        return self._row(self.defenders[index])
+
+    def _row(self, defender_name: str) -> dict:
+        results: dict = {}
+        calc_strings = []
+        for r in self.summary.results.rows(defender=defender_name):
+            calc_string = r.calc_string
+            results.setdefault(r.move_name, {})[r.scenario_name] = {
+                "damage_pct": f"{format_percent(r.min_pct)}-{format_percent(r.max_pct)}%",
+                "ko_chance": r.ko_chance,
+                "calc_string": calc_string,
+            }
+            calc_strings.append(calc_string)
+        return {"defender": defender_name, "results": results, "calc_strings": calc_strings}
+
+
 async def _get_top_meta_pokemon(
     smogon_client: SmogonStatsClient,
     count: int = 25,
@@ -92,12 +131,16 @@ def register_bulk_calc_tools(
         attacker_evs: Optional[str] = None,
         attacker_tera_type: Optional[str] = None,
         defender_tera_types: Optional[dict[str, str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        ctx: Optional[Context] = None,
     ) -> dict:
         """
         Run bulk offensive damage calculations: 1 attacker × N moves × M defenders × K scenarios.
 
         Replaces running dozens of individual damage calcs. Returns structured results
-        with calc strings, KO counts, and markdown tables per scenario.
+        with calc strings, KO counts, and markdown tables per scenario. Each defender is
+        reported in a progress notification as soon as it's done, and detailed results
+        beyond the first page_size defenders are fetched with get_more_results.
 
         Args:
             attacker_name: Your Pokemon (e.g., "urshifu-rapid-strike")
@@ -115,6 +158,8 @@ def register_bulk_calc_tools(
             attacker_tera_type: Attacker's Tera type (required for "tera" and "*_tera" scenarios)
             defender_tera_types: Map of defender name to their Tera type
                 (e.g., {"incineroar": "water", "rillaboom": "fire"})
+            page_size: Defenders with detailed results and calc strings in this
+                response (default 10); the rest come from get_more_results(next_cursor)
 
         Returns:
             Structured results with per-scenario markdown tables, calc strings, and KO summary
@@ -154,19 +199,6 @@ def register_bulk_calc_tools(
                 move = await pokeapi.get_move(move_name, user_name=attacker_name)
                 moves.append(move)
 
-            # Build defenders
-            defenders = []
-            failed_defenders = []
-            for defender_name in defender_names:
-                try:
-                    defender = await _build_pokemon_from_smogon(defender_name, pokeapi)
-                    defenders.append(defender)
-                except Exception as e:
-                    failed_defenders.append({"name": defender_name, "error": str(e)})
-
-            if not defenders:
-                return {"error": "Could not build any defenders. Check Pokemon names."}
-
             # Resolve scenarios
             scenario_configs = []
             scenario_names_used = scenarios or ["normal"]
@@ -180,11 +212,40 @@ def register_bulk_calc_tools(
                         f"Available: {avail}"
                     }
 
-            # Run bulk calcs
-            summary = run_bulk_calcs(
-                attacker, moves, defenders, scenario_configs,
-                defender_tera_types=defender_tera_types,
-            )
+            # Build and calc each defender in turn, reporting it as it finishes
+            progress = ProgressReporter(ctx, total=len(defender_names))
+            partials = []
+            failed_defenders = []
+            for done, defender_name in enumerate(defender_names, 1):
+                try:
+                    defender = await _build_pokemon_from_smogon(defender_name, pokeapi)
+                except Exception as e:
+                    failed_defenders.append({"name": defender_name, "error": str(e)})
+                    continue
+                partial = run_bulk_calcs(
+                    attacker, moves, [defender], scenario_configs,
+                    defender_tera_types=defender_tera_types,
+                )
+                partials.append(partial)
+                best_moves = get_best_move_per_defender(partial, scenario_configs[0].name)
+                best = best_moves.get(defender.name)
+                await progress.update(
+                    done,
+                    f"{done}/{len(defender_names)} defenders: {defender.name}",
+                    best={
+                        "defender": defender.name,
+                        "move": best.move_name,
+                        "damage_pct": (
+                            f"{format_percent(best.min_pct)}-{format_percent(best.max_pct)}%"
+                        ),
+                        "ko_chance": best.ko_chance,
+                    } if best else None,
+                )
+
+            if not partials:
+                return {"error": "Could not build any defenders. Check Pokemon names."}
+
+            summary = merge_bulk_summaries(partials)
 
             # Generate attacker Showdown paste
             attacker_paste = pokemon_build_to_showdown(attacker)
@@ -205,13 +266,7 @@ def register_bulk_calc_tools(
                 separator = f"|----------|--------|------|{move_seps}|"
                 rows = [header, separator]
 
-                # Get unique defenders in order
-                seen = []
-                for r in s_results:
-                    if r.defender_name not in seen:
-                        seen.append(r.defender_name)
-
-                for def_name in seen:
+                for def_name in summary.results.defender_names:
                     def_display = def_name.replace("-", " ").title()
                     spread = summary.defender_spreads.get(def_name, "")
                     item = summary.defender_items.get(def_name, "None")
@@ -219,12 +274,8 @@ def register_bulk_calc_tools(
 
                     move_cells = []
                     for move_name in summary.move_names:
-                        matching = [
-                            r for r in s_results
-                            if r.defender_name == def_name and r.move_name == move_name
-                        ]
-                        if matching:
-                            r = matching[0]
+                        r = get_result(summary, def_name, move_name, s_name)
+                        if r is not None:
                             min_str = format_percent(r.min_pct)
                             max_str = format_percent(r.max_pct)
                             move_cells.append(f"{min_str}-{max_str}% ({r.ko_chance})")
@@ -243,21 +294,13 @@ def register_bulk_calc_tools(
                     "markdown_table": "\n".join(rows),
                 }
 
-            # Build calc strings list
-            calc_strings = [r.calc_string for r in summary.results]
-
-            # Build results grouped by defender
-            results_by_defender = {}
-            for r in summary.results:
-                if r.defender_name not in results_by_defender:
-                    results_by_defender[r.defender_name] = {}
-                if r.move_name not in results_by_defender[r.defender_name]:
-                    results_by_defender[r.defender_name][r.move_name] = {}
-                results_by_defender[r.defender_name][r.move_name][r.scenario_name] = {
-                    "damage_pct": f"{format_percent(r.min_pct)}-{format_percent(r.max_pct)}%",
-                    "ko_chance": r.ko_chance,
-                    "calc_string": r.calc_string,
-                }
+            # Detailed rows past the first page are held for get_more_results,
+            # and only rendered if they're fetched
+            page = get_result_store().paginate(
+                "calculate_bulk_offensive_calcs", _DefenderResults(summary), page_size,
+            )
+            results_by_defender = {row["defender"]: row["results"] for row in page["items"]}
+            calc_strings = [c for row in page["items"] for c in row["calc_strings"]]
 
             return {
                 "attacker": {
@@ -275,6 +318,8 @@ def register_bulk_calc_tools(
                 "twohko_summary": summary.twohko_counts,
                 "calc_strings": calc_strings,
                 "failed_defenders": failed_defenders if failed_defenders else None,
+                "total_defenders": page["total"],
+                "next_cursor": page["next_cursor"],
             }
 
         except Exception as e:
@@ -1,14 +1,18 @@
 """MCP tools for core building and team suggestions."""
 
+from typing import Optional
+
 from mcp.server.fastmcp import FastMCP
 
 from vgc_mcp_core.team.manager import TeamManager
+from vgc_mcp_core.api.pokeapi import PokeAPIClient
 from vgc_mcp_core.api.smogon import SmogonStatsClient
 from vgc_mcp_core.team.core_builder import (
     suggest_partners,
     find_popular_cores,
     analyze_core_synergy,
     complete_team,
+    suggest_team_fills,
     get_pokemon_role,
     POKEMON_ROLES,
 )
@@ -17,7 +21,8 @@ from vgc_mcp_core.team.core_builder import (
 def register_core_tools(
     mcp: FastMCP,
     team_manager: TeamManager,
-    smogon_client: SmogonStatsClient
+    smogon_client: SmogonStatsClient,
+    pokeapi: Optional[PokeAPIClient] = None
 ):
     """Register core building tools with the MCP server."""
 
@@ -148,18 +153,20 @@ def register_core_tools(
             return {"error": str(e)}
 
     @mcp.tool()
-    async def suggest_team_completion(limit: int = 5) -> dict:
+    async def suggest_team_completion(limit: int = 5, fills: int = 3) -> dict:
         """
         Suggest Pokemon to complete the current team.
 
         Analyzes the current team composition and suggests Pokemon
-        that would fill gaps in coverage, roles, and synergy.
+        that would fill gaps in coverage, roles, and synergy, plus complete
+        sets of Pokemon for every open slot scored as a whole.
 
         Args:
             limit: Number of suggestions to return (default 5)
+            fills: Number of complete team fills to return (default 3, 0 to skip)
 
         Returns:
-            Suggested Pokemon with reasoning
+            Suggested Pokemon with reasoning and ranked complete fills
         """
         try:
             if team_manager.size == 0:
@@ -178,7 +185,8 @@ def register_core_tools(
             suggestions = await complete_team(
                 team_manager.team,
                 smogon_client,
-                limit=limit
+                limit=limit,
+                pokeapi=pokeapi
             )
 
             if not suggestions:
@@ -187,6 +195,15 @@ def register_core_tools(
                     "team": team_manager.team.get_pokemon_names()
                 }
 
+            team_fills = []
+            if fills > 0:
+                team_fills = await suggest_team_fills(
+                    team_manager.team,
+                    smogon_client,
+                    pokeapi=pokeapi,
+                    limit=fills
+                )
+
             # Also get current analysis for context
             current_analysis = analyze_core_synergy(team_manager.team)
 
@@ -202,6 +219,16 @@ def register_core_tools(
                         "reasons": s.reasons
                     }
                     for s in suggestions
+                ],
+                "complete_fills": [
+                    {
+                        "pokemon": f.pokemon,
+                        "score": f.score,
+                        "pair_synergy": f.pair_synergy,
+                        "roles_added": f.roles_added,
+                        "uncovered_weaknesses": f.uncovered_weaknesses
+                    }
+                    for f in team_fills
                 ]
             }
 
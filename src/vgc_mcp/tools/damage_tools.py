@@ -16,6 +16,7 @@ from vgc_mcp_core.calc.stats import calculate_stat, calculate_hp
 from vgc_mcp_core.utils.errors import error_response, ErrorCodes, pokemon_not_found_error, invalid_nature_error, api_error
 from vgc_mcp_core.utils.fuzzy import suggest_pokemon_name, suggest_nature
 from vgc_mcp_core.utils.synergies import get_synergy_ability
+from vgc_mcp_core.result_cache import cached_tool
 
 
 # Module-level Smogon client reference (set during registration)
@@ -125,7 +126,7 @@ def _normalize_smogon_name(name: str) -> str:
     return smogon_to_hyphenated.get(name_lower, name_lower)
 
 
-async def _get_common_spreads(pokemon_name: str, limit: int = 3) -> list[dict]:
+async def _get_common_spreads(pokemon_name: str, limit: int = 3) -> Optional[list[dict]]:
     """Fetch the top common spreads for a Pokemon from Smogon usage stats.
 
     Args:
@@ -134,7 +135,7 @@ async def _get_common_spreads(pokemon_name: str, limit: int = 3) -> list[dict]:
 
     Returns:
         List of dicts with 'nature', 'evs', 'item', 'ability', 'usage' keys.
-        Returns empty list if not found.
+        Returns empty list if not found, None if the usage lookup failed.
     """
     if _smogon_client is None:
         return []
@@ -166,6 +167,7 @@ async def _get_common_spreads(pokemon_name: str, limit: int = 3) -> list[dict]:
             return result
     except Exception as e:
         logger.warning("Failed to fetch Smogon spreads for %s: %s", pokemon_name, e)
+        return None
     return []
 
 
@@ -357,6 +359,12 @@ def register_damage_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
     _smogon_client = smogon
 
     @mcp.tool()
+    @cached_tool(names={
+        "attacker_name": "pokemon", "defender_name": "pokemon", "move_name": "move",
+        "attacker_nature": "nature", "defender_nature": "nature",
+        "attacker_item": "item", "defender_item": "item",
+        "attacker_ability": "ability", "defender_ability": "ability",
+    })
     async def calculate_damage_output(
         attacker_name: str,
         defender_name: str,
@@ -501,6 +509,8 @@ def register_damage_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
             attacker_spread_info = None
             defender_spread_info = None
             defender_spreads_list = []  # For multi-spread calculations
+            # A Smogon lookup failed and neutral defaults stood in for it
+            spreads_unavailable = False
 
             # Auto-fetch Smogon spreads if enabled and values not provided
             if use_smogon_spreads:
@@ -516,7 +526,9 @@ def register_damage_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
                     (attacker_nature is None or attacker_atk_evs is None or attacker_spa_evs is None)
                 )
                 if attacker_needs_spread:
-                    atk_spread = await _get_common_spread(attacker_name)
+                    atk_spreads = await _get_common_spreads(attacker_name, limit=1)
+                    spreads_unavailable |= atk_spreads is None
+                    atk_spread = atk_spreads[0] if atk_spreads else None
                     if atk_spread:
                         attacker_spread_source = "smogon"
                         attacker_spread_info = atk_spread
@@ -551,6 +563,9 @@ def register_damage_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
                 )
                 if defender_needs_spread:
                     defender_spreads_list = await _get_common_spreads(defender_name, limit=num_defender_spreads)
+                    if defender_spreads_list is None:
+                        spreads_unavailable = True
+                        defender_spreads_list = []
                     if defender_spreads_list:
                         defender_spread_source = "smogon"
                         # Use first spread as the primary for backwards compatibility
@@ -1027,6 +1042,10 @@ def register_damage_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
             if ability_notes:
                 response["ability_effects"] = ability_notes
 
+            if spreads_unavailable:
+                # Not cached: the Smogon spreads may load on the next call
+                response["fallback"] = True
+
             # Build condensed summary with all key info at a glance
             def _format_evs(evs_dict: dict) -> str:
                 """Format EVs as HP/Atk/Def/SpA/SpD/Spe string."""
@@ -8,7 +8,7 @@ turn 1 analysis, threat assessment, and bring-4 recommendations.
 import asyncio
 from typing import Optional
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 from vgc_mcp_core.api.pokeapi import PokeAPIClient
 from vgc_mcp_core.api.smogon import SmogonStatsClient
@@ -18,6 +18,11 @@ from vgc_mcp_core.calc.team_matchup import (
     build_pokemon_profile, generate_full_game_plan, PokemonProfile,
 )
 from vgc_mcp_core.calc.priority import normalize_move_name
+from vgc_mcp_core.calc.turn_sim import (
+    DEFAULT_MATRIX_SAMPLES, DEFAULT_SAMPLES, TurnOneOption, TurnOneSimulator,
+    simulate_lead_matrix,
+)
+from vgc_mcp_core.progress import ProgressReporter
 from vgc_mcp_core.team.manager import TeamManager
 from vgc_mcp_core.utils.errors import pokemon_not_found_error, api_error
 from vgc_mcp_core.utils.fuzzy import suggest_pokemon_name
@@ -148,6 +153,10 @@ def register_game_plan_tools(
         format: str = "reg_h",
         known_items: Optional[dict[str, str]] = None,
         known_abilities: Optional[dict[str, str]] = None,
+        simulate_turn_one: bool = False,
+        simulation_samples: int = DEFAULT_MATRIX_SAMPLES,
+        solve_team_preview: bool = False,
+        ctx: Optional[Context] = None,
     ) -> dict:
         """Generate a comprehensive game plan against a specific opponent team.
 
@@ -165,6 +174,15 @@ def register_game_plan_tools(
             format: VGC format (default "reg_h")
             known_items: Optional items you've seen (e.g. {"tornadus": "covert-cloak"})
             known_abilities: Optional abilities you've identified (e.g. {"tornadus": "prankster"})
+            simulate_turn_one: Also sample turn 1 of every lead pairing (speed ties,
+                damage rolls, crits, Fake Out/Protect) and rank your leads by expected KOs
+            simulation_samples: Sampled turns per lead pairing (default 500)
+            solve_team_preview: Also solve bring-4/lead selection as a game against
+                every bring-4/lead the opponent could pick, returning how often to
+                play each choice and the opponent's likely mix
+
+        Progress notifications follow each stage (profiles, plan, turn 1
+        simulation); the plan's message carries the top lead pair.
 
         Returns:
             Complete game plan with markdown_summary for display
@@ -250,8 +268,43 @@ def register_game_plan_tools(
         except Exception as e:
             return api_error("game plan generation", str(e))
 
+        progress = ProgressReporter(ctx, total=3 if simulate_turn_one else 2)
+        await progress.update(
+            1, f"Built {len(your_profiles)} vs {len(their_profiles)} Pokemon profiles"
+        )
+
         # Generate the game plan
-        plan = generate_full_game_plan(your_profiles, their_profiles)
+        plan = generate_full_game_plan(
+            your_profiles, their_profiles, solve_brings=solve_team_preview,
+        )
+        best = None
+        if plan.lead_recommendations:
+            top = plan.lead_recommendations[0]
+            best = {"leads": [top.pokemon_1, top.pokemon_2], "score": top.score}
+        await progress.update(2, f"Game plan ready: {plan.overall_matchup}", best=best)
+
+        simulation = None
+        if simulate_turn_one:
+            matrix = simulate_lead_matrix(
+                your_profiles, their_profiles,
+                samples=max(50, min(simulation_samples, 5000)),
+            )
+            simulation = {
+                "samples_per_matchup": matrix.samples_per_matchup,
+                "lead_pairings": len(matrix.matchups),
+                "damage_calcs": matrix.damage_calcs,
+                "lead_pairs": [
+                    {
+                        "leads": list(s.leads),
+                        "average_expected_ko_diff": s.average_score,
+                        "worst_expected_ko_diff": s.worst_score,
+                        "worst_against": list(s.worst_against),
+                        "vs_predicted_leads": s.predicted_score,
+                    }
+                    for s in matrix.summaries[:5]
+                ],
+            }
+            await progress.update(3, f"Simulated {len(matrix.matchups)} lead pairings")
 
         # Convert to dict for MCP response
         return {
@@ -299,5 +352,92 @@ def register_game_plan_tools(
                 "leave_behind": plan.bring_recommendation.leave_behind,
                 "reasoning": plan.bring_recommendation.reasoning,
             },
+            "turn_1_simulation": simulation,
+            "team_preview_solution": (
+                plan.bring_solution.to_dict() if plan.bring_solution else None
+            ),
             "markdown_summary": plan.markdown_summary,
         }
+
+    @mcp.tool()
+    async def simulate_turn_one(
+        your_leads: list[str],
+        their_leads: list[str],
+        move_choices: Optional[dict[str, dict[str, float]]] = None,
+        samples: int = DEFAULT_SAMPLES,
+        your_tailwind: bool = False,
+        their_tailwind: bool = False,
+        trick_room: bool = False,
+        known_items: Optional[dict[str, str]] = None,
+        known_abilities: Optional[dict[str, str]] = None,
+    ) -> dict:
+        """Simulate turn 1 of a lead matchup thousands of times.
+
+        Samples speed ties, damage rolls, crits and accuracy, applies Intimidate,
+        spread reduction, Fake Out flinches, Protect, Follow Me and mid-turn
+        Tailwind/Trick Room order changes, and reports outcome probabilities with
+        95% confidence bounds. Sets come from your loaded team or Smogon's most
+        common spreads.
+
+        Args:
+            your_leads: Your two leads
+            their_leads: Their two leads
+            move_choices: Optional move weights per Pokemon, overriding the default
+                heuristic (e.g. {"incineroar": {"Fake Out": 0.7, "Protect": 0.3}})
+            samples: Number of sampled turns (default 2000, max 20000)
+            your_tailwind: Tailwind already active on your side
+            their_tailwind: Tailwind already active on their side
+            trick_room: Trick Room already active
+            known_items: Optional items you've seen (e.g. {"tornadus": "covert-cloak"})
+            known_abilities: Optional abilities you've identified
+
+        Returns:
+            KO, flinch and move-first probabilities per Pokemon, trade outcomes
+            and the sampled move choices
+        """
+        if len(your_leads) != 2 or len(their_leads) != 2:
+            return {"error": "Provide exactly two leads for each side."}
+        known_items = known_items or {}
+        known_abilities = known_abilities or {}
+
+        team_builds: list[PokemonBuild] = []
+        current_team = team_manager.get_current_team()
+        if current_team:
+            team_builds = [slot.pokemon for slot in current_team.slots]
+
+        def _existing(name: str) -> Optional[PokemonBuild]:
+            key = name.lower().replace(" ", "-")
+            return next(
+                (b for b in team_builds if b.name.lower().replace(" ", "-") == key), None
+            )
+
+        tasks = [
+            _build_profile(
+                name, pokeapi, smogon,
+                known_item=known_items.get(name.lower()),
+                known_ability=known_abilities.get(name.lower()),
+                existing_build=_existing(name) if i < 2 else None,
+            )
+            for i, name in enumerate([*your_leads, *their_leads])
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        errors = [
+            pokemon_not_found_error(name, suggest_pokemon_name(name))
+            for name, result in zip([*your_leads, *their_leads], results)
+            if isinstance(result, Exception)
+        ]
+        if errors:
+            return {"error": "Could not find some Pokemon", "details": errors}
+
+        choices = {
+            name: [TurnOneOption(move=move, weight=weight) for move, weight in weights.items()]
+            for name, weights in (move_choices or {}).items()
+        }
+        result = TurnOneSimulator().simulate(
+            list(results[:2]), list(results[2:]),
+            samples=max(100, min(samples, 20000)),
+            choices=choices,
+            tailwind=(your_tailwind, their_tailwind),
+            trick_room=trick_room,
+        )
+        return result.to_dict()
@@ -10,9 +10,11 @@ from mcp.server.fastmcp import FastMCP
 from vgc_mcp_core.api.pokeapi import PokeAPIClient
 from vgc_mcp_core.api.smogon import SmogonStatsClient
 from vgc_mcp_core.calc.item_optimization import (
+    ItemBenchmark,
     compare_items_damage,
     analyze_life_orb_sustainability,
-    calculate_ev_tradeoff
+    calculate_ev_tradeoff,
+    optimize_item_spreads,
 )
 from vgc_mcp_core.calc.damage import calculate_damage, format_percent
 from vgc_mcp_core.calc.modifiers import DamageModifiers
@@ -58,6 +60,36 @@ async def _get_common_spread(pokemon_name: str) -> Optional[dict]:
     return None
 
 
+async def _build_pokemon(
+    pokeapi: PokeAPIClient,
+    pokemon_name: str,
+    nature: Optional[str] = None,
+    evs: Optional[dict] = None,
+    item: Optional[str] = None,
+    ability: Optional[str] = None,
+    use_smogon_spread: bool = True,
+) -> PokemonBuild:
+    """Build a Pokemon, filling unspecified nature/EVs/item/ability from Smogon."""
+    base_stats = await pokeapi.get_base_stats(pokemon_name)
+    types = await pokeapi.get_pokemon_types(pokemon_name)
+    spread = await _get_common_spread(pokemon_name) if use_smogon_spread else None
+    if spread:
+        nature = nature or spread.get("nature")
+        evs = evs if evs is not None else spread.get("evs")
+        item = item or spread.get("item")
+        ability = ability or spread.get("ability")
+    evs = evs or {}
+    return PokemonBuild(
+        name=pokemon_name,
+        base_stats=base_stats,
+        types=types,
+        nature=Nature(nature.lower() if nature else "serious"),
+        evs=EVSpread(**{stat: evs.get(stat, 0) for stat in EVSpread.model_fields}),
+        item=item.lower().replace(" ", "-") if item else None,
+        ability=ability,
+    )
+
+
 def register_item_optimization_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional[SmogonStatsClient] = None):
     """Register Life Orb optimization and item comparison tools."""
     global _smogon_client
@@ -454,3 +486,92 @@ def register_item_optimization_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogo
 
         except Exception as e:
             return {"error": str(e)}
+
+    @mcp.tool()
+    async def optimize_item_and_spread(
+        pokemon_name: str,
+        benchmarks: list[dict],
+        items_to_test: Optional[list[str]] = None,
+        nature: Optional[str] = None,
+        speed_evs: Optional[int] = None,
+        ability: Optional[str] = None,
+        use_smogon_spreads: bool = True
+    ) -> dict:
+        """
+        Find the best item and EV spread together against damage benchmarks.
+
+        For each item, finds the fewest EVs that survive every "survive" benchmark
+        and OHKO every "ko" benchmark, then puts the spare EVs into the attacking
+        stat and HP. Shows e.g. that Assault Vest survives a special hit with fewer
+        HP EVs, freeing them for Sp. Atk.
+
+        Args:
+            pokemon_name: Pokemon to optimize (e.g., "gholdengo")
+            benchmarks: List of checks, each like {"pokemon": "flutter-mane",
+                "move": "shadow-ball", "goal": "survive"} or {..., "goal": "ko"}.
+                Optional keys: "nature", "evs", "item", "ability" for that Pokemon
+                (auto-fetched from Smogon if not specified)
+            items_to_test: Items to compare (default: Choice Specs/Band, Life Orb,
+                Expert Belt, Assault Vest, Booster Energy, Sitrus Berry, plus type
+                boosters and resist berries the benchmarks call for)
+            nature: Pokemon's nature (auto-fetched from Smogon if not specified)
+            speed_evs: Speed EVs to keep (auto-fetched from Smogon if not specified)
+            ability: Pokemon's ability (auto-fetched from Smogon if not specified)
+            use_smogon_spreads: Auto-fetch common spreads from Smogon (default: True)
+
+        Returns:
+            Best spread per item, ranked by benchmarks met and spare EVs
+        """
+        try:
+            pokemon = await _build_pokemon(
+                pokeapi, pokemon_name, nature=nature, ability=ability,
+                use_smogon_spread=use_smogon_spreads,
+            )
+            if speed_evs is not None:
+                pokemon = pokemon.model_copy(update={"evs": EVSpread(speed=speed_evs)})
+
+            checks = []
+            for benchmark in benchmarks:
+                goal = benchmark.get("goal", "survive").lower()
+                if goal not in ("survive", "ko"):
+                    return {"error": f"Unknown benchmark goal '{goal}' (use 'survive' or 'ko')"}
+                opponent = await _build_pokemon(
+                    pokeapi, benchmark["pokemon"],
+                    nature=benchmark.get("nature"), evs=benchmark.get("evs"),
+                    item=benchmark.get("item"), ability=benchmark.get("ability"),
+                    use_smogon_spread=use_smogon_spreads,
+                )
+                user = pokemon_name if goal == "ko" else benchmark["pokemon"]
+                move = await pokeapi.get_move(benchmark["move"], user_name=user)
+                checks.append(ItemBenchmark(opponent=opponent, move=move, goal=goal))
+
+            results = optimize_item_spreads(pokemon, checks, items_to_test)
+            if not results:
+                return {"error": "No items to test", "pokemon": pokemon_name}
+
+            best = results[0]
+            return {
+                "pokemon": pokemon_name,
+                "items": [
+                    {
+                        "rank": result.rank,
+                        "item": result.item,
+                        "meets_benchmarks": result.meets_benchmarks,
+                        "failed_benchmarks": result.failed_benchmarks,
+                        "spare_evs": result.spare_evs,
+                        "evs": result.evs,
+                        "final_stats": result.final_stats,
+                        "benchmarks": result.benchmark_results,
+                    }
+                    for result in results
+                ],
+                "recommendation": {
+                    "best_item": best.item,
+                    "meets_benchmarks": best.meets_benchmarks,
+                    "spare_evs": best.spare_evs,
+                    "showdown_paste": best.showdown_paste,
+                },
+            }
+
+        except Exception as e:
+            return {"error": str(e)}
@@ -12,13 +12,23 @@ from vgc_mcp_core.calc.stats import calculate_all_stats
 from vgc_mcp_core.calc.speed_probability import calculate_speed_stat
 from vgc_mcp_core.calc.damage import format_percent
 from vgc_mcp_core.calc.meta_threats import (
-    analyze_single_threat,
+    analyze_threat_sweep,
     generate_spread_suggestions,
     create_empty_threat_report,
     MetaThreatReport,
     ThreatDamageResult
 )
+from vgc_mcp_core.calc.meta_sweep import (
+    MetaSetVariant,
+    MetaSpecies,
+    load_meta_species,
+    load_species_sets,
+    resolve_usage_move,
+    run_meta_sweep,
+)
+from vgc_mcp_core.calc.modifiers import get_type_effectiveness
 from vgc_mcp_core.models.pokemon import PokemonBuild, BaseStats, EVSpread, Nature
+from vgc_mcp_core.utils.normalize import normalize_ability, normalize_item
 from vgc_mcp_core.config import EV_BREAKPOINTS_LV50
 
 
@@ -112,6 +122,38 @@ def _format_results_table(threat_results: list[ThreatDamageResult]) -> dict:
 def register_meta_threat_tools(mcp: FastMCP, smogon, pokeapi, team_manager):
     """Register meta threat analysis tools with the MCP server."""
 
+    async def _sweep_threats(
+        your_pokemon: PokemonBuild, your_stats: dict, top_threats: int
+    ) -> tuple[list[ThreatDamageResult], dict]:
+        """Run a meta sweep against the top threats and summarize each matchup."""
+        # Your most used damaging moves
+        your_usage = await smogon.get_pokemon_usage(your_pokemon.name)
+        your_moves = []
+        for move_name in (your_usage or {}).get("moves", {}):
+            if len(your_moves) >= 4:
+                break
+            move = await resolve_usage_move(pokeapi, move_name)
+            if move is not None and move.is_damaging:
+                your_moves.append(move)
+
+        usage_stats = await smogon.get_usage_stats()
+        meta = await load_meta_species(
+            smogon, pokeapi, top_n=top_threats, exclude=(your_pokemon.name,), max_moves=4
+        )
+        report = run_meta_sweep(your_pokemon, your_moves, meta)
+
+        threat_results = [
+            analyze_threat_sweep(
+                species,
+                [r for r in report.incoming if r.species == species.name],
+                [r for r in report.outgoing if r.species == species.name],
+                your_moves,
+                your_stats["speed"],
+            )
+            for species in meta
+        ]
+        return threat_results, usage_stats.get("_meta", {})
+
     @mcp.tool()
     async def analyze_spread_vs_threats(
         pokemon_name: str,
@@ -128,7 +170,8 @@ def register_meta_threat_tools(mcp: FastMCP, smogon, pokeapi, team_manager):
         Analyze a spread against the top meta threats.
 
         Checks damage calculations in both directions against the most
-        used Pokemon in the current metagame.
+        used Pokemon in the current metagame, weighted over each one's
+        common Smogon spreads, items and abilities.
 
         NOTE: EVs default to 0 if not specified. For accurate results,
         specify your full EV spread. Common spreads are 252/252/4.
@@ -179,124 +222,7 @@ def register_meta_threat_tools(mcp: FastMCP, smogon, pokeapi, team_manager):
         )
 
         your_stats = calculate_all_stats(your_pokemon)
-
-        # Get your common moves (simplified - would need actual moveset data)
-        your_usage = await smogon.get_pokemon_usage(pokemon_name)
-        your_moves = []
-        if your_usage:
-            for move_name, usage in list(your_usage.get("moves", {}).items())[:4]:
-                move_data = await pokeapi.get_move(move_name)
-                if move_data:
-                    your_moves.append({
-                        "name": move_name,
-                        "power": move_data.get("power", 0),
-                        "type": move_data.get("type", "normal"),
-                        "category": move_data.get("category", "physical")
-                    })
-
-        # Get meta usage stats
-        usage_stats = await smogon.get_usage_stats()
-        meta_info = usage_stats.get("_meta", {})
-        usage_data = usage_stats.get("data", {})
-
-        # Get top threats
-        sorted_pokemon = sorted(
-            usage_data.items(),
-            key=lambda x: x[1].get("usage", 0),
-            reverse=True
-        )[:top_threats]
-
-        # Analyze each threat
-        threat_results = []
-        for threat_name, threat_usage_data in sorted_pokemon:
-            # Skip self
-            if threat_name.lower() == pokemon_name.lower():
-                continue
-
-            try:
-                threat_base_stats = await pokeapi.get_base_stats(threat_name)
-                threat_types = await pokeapi.get_pokemon_types(threat_name)
-            except Exception:
-                continue
-
-            threat_usage = await smogon.get_pokemon_usage(threat_name)
-
-            # Get threat's common moves
-            threat_moves = []
-            if threat_usage:
-                for move_name, usage in list(threat_usage.get("moves", {}).items())[:4]:
-                    move_data = await pokeapi.get_move(move_name)
-                    if move_data:
-                        threat_moves.append({
-                            "name": move_name,
-                            "power": move_data.power or 0,
-                            "type": move_data.type.lower(),
-                            "category": move_data.category.value
-                        })
-
-            # Use actual Smogon spread if available, otherwise estimate
-            threat_spread = None
-            if threat_usage and threat_usage.get("spreads"):
-                top_spread = threat_usage["spreads"][0]
-                try:
-                    threat_nature = Nature(top_spread["nature"].lower())
-                    threat_evs = EVSpread(
-                        hp=top_spread["evs"].get("hp", 0),
-                        attack=top_spread["evs"].get("attack", 0),
-                        defense=top_spread["evs"].get("defense", 0),
-                        special_attack=top_spread["evs"].get("special_attack", 0),
-                        special_defense=top_spread["evs"].get("special_defense", 0),
-                        speed=top_spread["evs"].get("speed", 0)
-                    )
-                    threat_pokemon_build = PokemonBuild(
-                        name=threat_name,
-                        base_stats=threat_base_stats,
-                        types=threat_types,
-                        nature=threat_nature,
-                        evs=threat_evs,
-                        level=50
-                    )
-                    threat_stats = calculate_all_stats(threat_pokemon_build)
-                    threat_spread = {
-                        "nature": top_spread["nature"],
-                        "evs": top_spread["evs"],
-                        "usage": top_spread.get("usage", 0)
-                    }
-                except (ValueError, KeyError):
-                    # Fallback to estimates if spread parsing fails
-                    threat_stats = {
-                        "hp": threat_base_stats.hp + 75,
-                        "attack": threat_base_stats.attack + 40,
-                        "defense": threat_base_stats.defense + 40,
-                        "special_attack": threat_base_stats.special_attack + 40,
-                        "special_defense": threat_base_stats.special_defense + 40,
-                        "speed": threat_base_stats.speed + 40
-                    }
-            else:
-                # Fallback to rough estimates if no spread data
-                threat_stats = {
-                    "hp": threat_base_stats.hp + 75,
-                    "attack": threat_base_stats.attack + 40,
-                    "defense": threat_base_stats.defense + 40,
-                    "special_attack": threat_base_stats.special_attack + 40,
-                    "special_defense": threat_base_stats.special_defense + 40,
-                    "speed": threat_base_stats.speed + 40
-                }
-
-            result = analyze_single_threat(
-                your_pokemon=your_pokemon,
-                your_stats=your_stats,
-                threat_name=threat_name,
-                threat_stats=threat_stats,
-                threat_types=threat_types,
-                threat_usage_pct=round(threat_usage_data.get("usage", 0) * 100, 2),
-                threat_common_moves=threat_moves,
-                your_common_moves=your_moves,
-                your_speed=your_stats["speed"],
-                threat_spread=threat_spread
-            )
-
-            threat_results.append(result)
+        threat_results, meta_info = await _sweep_threats(your_pokemon, your_stats, top_threats)
 
         # Categorize results
         favorable = [r for r in threat_results if r.matchup_verdict == "Favorable"]
@@ -373,118 +299,7 @@ def register_meta_threat_tools(mcp: FastMCP, smogon, pokeapi, team_manager):
             }
 
         your_stats = calculate_all_stats(pokemon)
-
-        # Get your common moves
-        your_usage = await smogon.get_pokemon_usage(pokemon.name)
-        your_moves = []
-        if your_usage:
-            for move_name, usage in list(your_usage.get("moves", {}).items())[:4]:
-                move_data = await pokeapi.get_move(move_name)
-                if move_data:
-                    your_moves.append({
-                        "name": move_name,
-                        "power": move_data.get("power", 0),
-                        "type": move_data.get("type", "normal"),
-                        "category": move_data.get("category", "physical")
-                    })
-
-        # Get meta usage stats
-        usage_stats = await smogon.get_usage_stats()
-        meta_info = usage_stats.get("_meta", {})
-        usage_data = usage_stats.get("data", {})
-
-        sorted_pokemon = sorted(
-            usage_data.items(),
-            key=lambda x: x[1].get("usage", 0),
-            reverse=True
-        )[:top_threats]
-
-        threat_results = []
-        for threat_name, threat_usage_data in sorted_pokemon:
-            if threat_name.lower() == pokemon.name.lower():
-                continue
-
-            try:
-                threat_base_stats = await pokeapi.get_base_stats(threat_name)
-                threat_types = await pokeapi.get_pokemon_types(threat_name)
-            except Exception:
-                continue
-
-            threat_usage = await smogon.get_pokemon_usage(threat_name)
-
-            threat_moves = []
-            if threat_usage:
-                for move_name, usage in list(threat_usage.get("moves", {}).items())[:4]:
-                    move_data = await pokeapi.get_move(move_name)
-                    if move_data:
-                        threat_moves.append({
-                            "name": move_name,
-                            "power": move_data.power or 0,
-                            "type": move_data.type.lower(),
-                            "category": move_data.category.value
-                        })
-
-            # Use actual Smogon spread if available, otherwise estimate
-            threat_spread = None
-            if threat_usage and threat_usage.get("spreads"):
-                top_spread = threat_usage["spreads"][0]
-                try:
-                    threat_nature = Nature(top_spread["nature"].lower())
-                    threat_evs = EVSpread(
-                        hp=top_spread["evs"].get("hp", 0),
-                        attack=top_spread["evs"].get("attack", 0),
-                        defense=top_spread["evs"].get("defense", 0),
-                        special_attack=top_spread["evs"].get("special_attack", 0),
-                        special_defense=top_spread["evs"].get("special_defense", 0),
-                        speed=top_spread["evs"].get("speed", 0)
-                    )
-                    threat_pokemon_build = PokemonBuild(
-                        name=threat_name,
-                        base_stats=threat_base_stats,
-                        types=threat_types,
-                        nature=threat_nature,
-                        evs=threat_evs,
-                        level=50
-                    )
-                    threat_stats = calculate_all_stats(threat_pokemon_build)
-                    threat_spread = {
-                        "nature": top_spread["nature"],
-                        "evs": top_spread["evs"],
-                        "usage": top_spread.get("usage", 0)
-                    }
-                except (ValueError, KeyError):
-                    threat_stats = {
-                        "hp": threat_base_stats.hp + 75,
-                        "attack": threat_base_stats.attack + 40,
-                        "defense": threat_base_stats.defense + 40,
-                        "special_attack": threat_base_stats.special_attack + 40,
-                        "special_defense": threat_base_stats.special_defense + 40,
-                        "speed": threat_base_stats.speed + 40
-                    }
-            else:
-                threat_stats = {
-                    "hp": threat_base_stats.hp + 75,
-                    "attack": threat_base_stats.attack + 40,
-                    "defense": threat_base_stats.defense + 40,
-                    "special_attack": threat_base_stats.special_attack + 40,
-                    "special_defense": threat_base_stats.special_defense + 40,
-                    "speed": threat_base_stats.speed + 40
-                }
-
-            result = analyze_single_threat(
-                your_pokemon=pokemon,
-                your_stats=your_stats,
-                threat_name=threat_name,
-                threat_stats=threat_stats,
-                threat_types=threat_types,
-                threat_usage_pct=round(threat_usage_data.get("usage", 0) * 100, 2),
-                threat_common_moves=threat_moves,
-                your_common_moves=your_moves,
-                your_speed=your_stats["speed"],
-                threat_spread=threat_spread
-            )
-
-            threat_results.append(result)
+        threat_results, meta_info = await _sweep_threats(pokemon, your_stats, top_threats)
 
         favorable = [r for r in threat_results if r.matchup_verdict == "Favorable"]
         unfavorable = [r for r in threat_results if r.matchup_verdict == "Unfavorable"]
@@ -555,10 +370,12 @@ def register_meta_threat_tools(mcp: FastMCP, smogon, pokeapi, team_manager):
             spd_evs: Special Defense EVs
             threat_pokemon: Attacking Pokemon
             threat_move: Move name
-            survival_threshold: Required survival percentage (0-100).
-                - 100 = must survive all rolls (default, "always survives")
-                - 75 = survive 75% of rolls ("most of the time")
-                - 50 = survive 50% of rolls ("sometimes")
+            survival_threshold: Required survival percentage (0-100), over
+                the threat's common Smogon sets (weighted by usage) and
+                their damage rolls.
+                - 100 = must survive every set and roll (default, "always survives")
+                - 75 = survive 75% of the time ("most of the time")
+                - 50 = survive 50% of the time ("sometimes")
 
         Returns:
             Survival analysis with damage range and survival percentage
@@ -603,183 +420,137 @@ def register_meta_threat_tools(mcp: FastMCP, smogon, pokeapi, team_manager):
         )
 
         your_stats = calculate_all_stats(your_pokemon)
+        your_hp = your_stats["hp"]
 
-        # Get threat's actual spread from Smogon if available
+        # The threat's common Smogon sets, else one max-invested set
         is_physical = move_data.category.value == "physical"
-        threat_usage = await smogon.get_pokemon_usage(threat_pokemon)
-        threat_spread = None
-
-        if threat_usage and threat_usage.get("spreads"):
-            top_spread = threat_usage["spreads"][0]
-            try:
-                threat_nature = Nature(top_spread["nature"].lower())
-                threat_evs = EVSpread(
-                    hp=top_spread["evs"].get("hp", 0),
-                    attack=top_spread["evs"].get("attack", 0),
-                    defense=top_spread["evs"].get("defense", 0),
-                    special_attack=top_spread["evs"].get("special_attack", 0),
-                    special_defense=top_spread["evs"].get("special_defense", 0),
-                    speed=top_spread["evs"].get("speed", 0)
-                )
-                threat_pokemon_build = PokemonBuild(
-                    name=threat_pokemon,
-                    base_stats=threat_base_stats,
-                    types=threat_types,
-                    nature=threat_nature,
-                    evs=threat_evs,
-                    level=50
-                )
-                threat_stats = calculate_all_stats(threat_pokemon_build)
-                threat_spread = {
-                    "nature": top_spread["nature"],
-                    "evs": top_spread["evs"],
-                    "usage": top_spread.get("usage", 0)
-                }
-            except (ValueError, KeyError):
-                # Fallback to estimates
-                threat_stats = {
-                    "hp": threat_base_stats.hp + 75,
-                    "attack": threat_base_stats.attack + 80 if is_physical else threat_base_stats.attack + 40,
-                    "defense": threat_base_stats.defense + 40,
-                    "special_attack": threat_base_stats.special_attack + 80 if not is_physical else threat_base_stats.special_attack + 40,
-                    "special_defense": threat_base_stats.special_defense + 40,
-                    "speed": threat_base_stats.speed + 40
-                }
+        threat = await load_species_sets(smogon, pokeapi, threat_pokemon, max_moves=0)
+        if threat is not None:
+            source = f"{len(threat.variants)} common {threat_pokemon} sets"
         else:
-            # Fallback to estimated max offensive investment
-            threat_stats = {
-                "hp": threat_base_stats.hp + 75,
-                "attack": threat_base_stats.attack + 80 if is_physical else threat_base_stats.attack + 40,
-                "defense": threat_base_stats.defense + 40,
-                "special_attack": threat_base_stats.special_attack + 80 if not is_physical else threat_base_stats.special_attack + 40,
-                "special_defense": threat_base_stats.special_defense + 40,
-                "speed": threat_base_stats.speed + 40
-            }
-
-        from vgc_mcp_core.calc.meta_threats import calculate_simple_damage
-        from vgc_mcp_core.calc.modifiers import get_type_effectiveness
-
-        # Check if STAB
-        stab = move_data.type.lower() in [t.lower() for t in threat_types]
-
-        # Calculate type effectiveness
-        type_eff = get_type_effectiveness(
-            move_data.type.lower(),
-            your_types
-        )
-
-        damage = calculate_simple_damage(
-            threat_stats, your_stats,
-            move_data.power or 80,
-            is_physical,
-            stab=stab,
-            type_effectiveness=type_eff
-        )
-
-        # Calculate exact survival percentage from damage rolls
-        damage_rolls = damage.get("damage_rolls", [])
-        your_hp = your_stats["hp"]
+            threat = MetaSpecies(
+                name=threat_pokemon,
+                usage_percent=0,
+                variants=[MetaSetVariant(
+                    build=PokemonBuild(
+                        name=threat_pokemon,
+                        base_stats=threat_base_stats,
+                        types=threat_types,
+                        nature=Nature.ADAMANT if is_physical else Nature.MODEST,
+                        evs=EVSpread(attack=252) if is_physical else EVSpread(special_attack=252),
+                    ),
+                    weight=1.0,
+                    spread="max invested",
+                )],
+            )
+            source = f"a max-invested {threat_pokemon} (no Smogon data)"
+        threat.moves = [(move_data, 100.0)]
 
-        if damage_rolls:
-            survival_count = sum(1 for r in damage_rolls if r < your_hp)
-            survival_percent = (survival_count / len(damage_rolls)) * 100
-        else:
-            # Fallback to binary check if no rolls available
-            survival_percent = 100.0 if your_hp > damage["max_damage"] else 0.0
-            survival_count = 16 if survival_percent == 100.0 else 0
+        report = run_meta_sweep(your_pokemon, [], [threat])
+        if not report.incoming:
+            return {"error": f"{threat_move} is not a damaging move"}
+        sweep = report.incoming[0]
 
-        # Determine survival status
+        # Usage-weighted over the threat's sets and each set's 16 rolls
+        survival_percent = sweep.survive_percent
         survives_guaranteed = survival_percent == 100.0
         survives_sometimes = 0 < survival_percent < 100.0
         meets_threshold = survival_percent >= survival_threshold
 
         # Calculate HP remaining after taking damage (for clear communication)
         # Use min/max damage to show HP remaining range
-        hp_remaining_min = max(0, your_hp - damage["max_damage"])
-        hp_remaining_max = max(0, your_hp - damage["min_damage"])
+        min_damage = min(v["min_damage"] for v in sweep.variants)
+        max_damage = max(v["max_damage"] for v in sweep.variants)
+        hp_remaining_min = max(0, your_hp - max_damage)
+        hp_remaining_max = max(0, your_hp - min_damage)
         hp_remaining_min_pct = round((hp_remaining_min / your_hp) * 100, 1)
         hp_remaining_max_pct = round((hp_remaining_max / your_hp) * 100, 1)
 
         # Check if attacker has Unseen Fist (Urshifu forms)
         normalized_threat = threat_pokemon.lower().replace(" ", "-")
-        has_unseen_fist = normalized_threat in ("urshifu", "urshifu-single-strike", "urshifu-rapid-strike")
+        has_unseen_fist = normalized_threat in (
+            "urshifu", "urshifu-single-strike", "urshifu-rapid-strike"
+        )
 
-        # Build threat spread string for analysis
-        if threat_spread:
-            # Extract relevant EVs based on move category
-            threat_evs_dict = threat_spread.get("evs", {})
-            threat_atk_evs = threat_evs_dict.get("attack", 0) if is_physical else threat_evs_dict.get("special_attack", 0)
-            threat_stat_name = "Atk" if is_physical else "SpA"
-            threat_nature_name = threat_spread.get("nature", "")
-            # Determine nature modifier
-            from vgc_mcp_core.calc.stats import get_nature_modifier
-            try:
-                threat_nature_enum = Nature(threat_nature_name.lower())
-                nature_mod = get_nature_modifier(threat_nature_enum, "attack" if is_physical else "special_attack")
-                nature_indicator = "+" if nature_mod > 1.0 else ("-" if nature_mod < 1.0 else "")
-            except (ValueError, KeyError):
-                nature_indicator = ""
-            threat_spread_str = f"{threat_atk_evs}{nature_indicator} {threat_stat_name} {threat_pokemon}"
-        else:
-            # Fallback when no Smogon data
-            threat_spread_str = f"max invested {threat_pokemon}"
+        worst = sweep.worst_case
+        worst_set = " @ ".join(filter(None, [worst.get("spread"), worst.get("item")]))
 
         # Build analysis message with HP remaining for clarity
         if survives_guaranteed:
             analysis_msg = (
-                f"Your {pokemon_name} survives all rolls from {threat_move} ({threat_spread_str}), "
+                f"Your {pokemon_name} survives {threat_move} from {source}, "
                 f"left with {hp_remaining_min_pct}-{hp_remaining_max_pct}% HP"
             )
         elif survival_percent == 0:
-            analysis_msg = f"Your {pokemon_name} does NOT survive any rolls from {threat_move} ({threat_spread_str})"
+            analysis_msg = (
+                f"Your {pokemon_name} does NOT survive {threat_move} from {source}"
+            )
         else:
             threshold_status = "MEETS" if meets_threshold else "does NOT meet"
             analysis_msg = (
-                f"Your {pokemon_name} survives {survival_percent:.1f}% of rolls "
-                f"({survival_count}/16) from {threat_move} ({threat_spread_str}). "
-                f"When surviving, left with {hp_remaining_min_pct}-{hp_remaining_max_pct}% HP. "
+                f"Your {pokemon_name} survives {survival_percent:.1f}% of {threat_move}s "
+                f"from {source}, weighted by usage and damage roll. "
+                f"Worst case: {worst_set} ({worst.get('damage_range')}). "
                 f"{threshold_status} {survival_threshold}% threshold."
             )
 
+        if sweep.ko_percent >= 100:
+            ko_result = "Guaranteed OHKO"
+        elif sweep.ko_percent > 0:
+            ko_result = f"{sweep.ko_percent}% chance to OHKO"
+        else:
+            ko_result = "No OHKO"
+
+        damage_percent = (
+            f"{format_percent(sweep.min_percent)}-{format_percent(sweep.max_percent)}%"
+        )
         result = {
             "your_pokemon": pokemon_name,
             "your_hp": your_hp,
             "threat_pokemon": threat_pokemon,
             "threat_move": threat_move,
-            "threat_spread": threat_spread,
-            "threat_stats": threat_stats,
+            "threat_spread": worst,
+            "threat_sets": sweep.variants,
             "move_type": move_data.type,
             "move_category": move_data.category.value,
-            "damage_range": f"{damage['min_damage']}-{damage['max_damage']}",
-            "damage_percent": f"{format_percent(damage['min_percent'])}-{format_percent(damage['max_percent'])}%",
+            "damage_range": f"{min_damage}-{max_damage}",
+            "damage_percent": damage_percent,
             # HP remaining after taking the hit (clearer than damage percent for survival discussions)
             "hp_remaining_range": f"{hp_remaining_min}-{hp_remaining_max}",
             "hp_remaining_percent": f"{hp_remaining_min_pct}-{hp_remaining_max_pct}%",
-            "survival_percent": round(survival_percent, 1),
-            "survival_rolls": f"{survival_count}/16",
+            "survival_percent": survival_percent,
             "survives_guaranteed": survives_guaranteed,
             "survives_sometimes": survives_sometimes,
             "meets_threshold": meets_threshold,
             "threshold_requested": survival_threshold,
-            "ko_result": damage["ko_chance"],
-            "type_effectiveness": type_eff,
+            "ko_result": ko_result,
+            "type_effectiveness": get_type_effectiveness(move_data.type.lower(), your_types),
             "analysis": analysis_msg
         }
 
         # Build benchmark table for clear display
-        survival_status = "Survives" if survives_guaranteed else ("Survives sometimes" if survives_sometimes else "Does not survive")
+        if survives_guaranteed:
+            survival_status = "Survives"
+        elif survives_sometimes:
+            survival_status = "Survives sometimes"
+        else:
+            survival_status = "Does not survive"
         threshold_status = "Yes" if meets_threshold else "No"
+        hp_remaining = f"{hp_remaining_min_pct}-{hp_remaining_max_pct}%"
+        survival = f"{survival_percent:.1f}% of sets and rolls"
+        threshold = f"{threshold_status} ({survival_threshold}% required)"
         table_lines = [
             "| Metric               | Value                                    |",
             "|----------------------|------------------------------------------|",
             f"| Pokemon              | {pokemon_name:<40} |",
             f"| HP                   | {your_hp:<40} |",
             f"| Threat               | {threat_pokemon}'s {threat_move:<20} |",
-            f"| Damage Taken         | {format_percent(damage['min_percent'])}-{format_percent(damage['max_percent'])}%{' ':<30} |",
-            f"| HP Remaining         | {hp_remaining_min_pct}-{hp_remaining_max_pct}%{' ':<30} |",
-            f"| Survival Probability | {survival_percent:.1f}% ({survival_count}/16 rolls){' ':<20} |",
+            f"| Sets Checked         | {len(sweep.variants):<40} |",
+            f"| Damage Taken         | {damage_percent:<40} |",
+            f"| HP Remaining         | {hp_remaining:<40} |",
+            f"| Survival Probability | {survival:<40} |",
             f"| Survival Status      | {survival_status:<40} |",
-            f"| Threshold Met        | {threshold_status} ({survival_threshold}% required){' ':<20} |",
+            f"| Threshold Met        | {threshold:<40} |",
         ]
         result["benchmark_table"] = "\n".join(table_lines)
 
@@ -1124,3 +895,134 @@ def register_meta_threat_tools(mcp: FastMCP, smogon, pokeapi, team_manager):
             )
 
         return result
+
+    @mcp.tool()
+    async def sweep_meta_damage(
+        pokemon_name: str,
+        nature: str,
+        hp_evs: int = 0,
+        atk_evs: int = 0,
+        def_evs: int = 0,
+        spa_evs: int = 0,
+        spd_evs: int = 0,
+        spe_evs: int = 0,
+        item: Optional[str] = None,
+        ability: Optional[str] = None,
+        tera_type: Optional[str] = None,
+        tera_active: bool = False,
+        moves: Optional[list[str]] = None,
+        top_n: int = 12,
+        threat_moves: int = 3,
+        threats_terastallized: bool = False
+    ) -> dict:
+        """
+        Run your exact set against every common set of the top-N meta Pokemon.
+
+        Each meta Pokemon is expanded into its common Smogon spreads, items,
+        abilities (and Tera types when threats_terastallized), weighted by
+        usage, and the full damage calc runs in both directions. Answers
+        "you survive 87% of the meta's Flutter Mane Moonblasts" and "your
+        Close Combat OHKOs 60% of Incineroar sets" in a single call.
+
+        Args:
+            pokemon_name: Your Pokemon
+            nature: Your nature
+            hp_evs: HP EVs
+            atk_evs: Attack EVs
+            def_evs: Defense EVs
+            spa_evs: Special Attack EVs
+            spd_evs: Special Defense EVs
+            spe_evs: Speed EVs
+            item: Your item (e.g., "assault-vest")
+            ability: Your ability (auto-detected if not specified)
+            tera_type: Your Tera type
+            tera_active: Whether you are Terastallized
+            moves: Your attacking moves (default: your top Smogon moves)
+            top_n: Number of meta Pokemon by usage (default 12)
+            threat_moves: Damaging moves checked per meta Pokemon (default 3)
+            threats_terastallized: Assume meta Pokemon Terastallize into their
+                common Tera types
+
+        Returns:
+            Usage-weighted survival/KO percentages per threat and move, plus
+            meta-wide survival and KO rates
+        """
+        try:
+            nature_enum = Nature(nature.lower())
+        except ValueError:
+            return {"error": f"Invalid nature: {nature}"}
+
+        try:
+            base_stats = await pokeapi.get_base_stats(pokemon_name)
+            your_types = await pokeapi.get_pokemon_types(pokemon_name)
+        except Exception:
+            return {"error": f"Pokemon not found: {pokemon_name}"}
+
+        if not ability:
+            abilities = await pokeapi.get_pokemon_abilities(pokemon_name)
+            ability = abilities[0] if abilities else None
+
+        your_pokemon = PokemonBuild(
+            name=pokemon_name,
+            base_stats=base_stats,
+            types=your_types,
+            nature=nature_enum,
+            evs=EVSpread(
+                hp=hp_evs,
+                attack=atk_evs,
+                defense=def_evs,
+                special_attack=spa_evs,
+                special_defense=spd_evs,
+                speed=spe_evs
+            ),
+            item=normalize_item(item) if item else None,
+            ability=normalize_ability(ability) if ability else None,
+            tera_type=tera_type.capitalize() if tera_type else None,
+        )
+
+        # Your moves: as given, else your most used damaging moves
+        move_names = moves
+        if not move_names:
+            your_usage = await smogon.get_pokemon_usage(pokemon_name)
+            move_names = list((your_usage or {}).get("moves", {}))[:6]
+        your_moves = []
+        for move_name in move_names:
+            move = await resolve_usage_move(pokeapi, move_name)
+            if move is not None and move.is_damaging:
+                your_moves.append(move)
+        if moves and not your_moves:
+            return {"error": f"No damaging moves found in: {', '.join(moves)}"}
+
+        try:
+            meta = await load_meta_species(
+                smogon, pokeapi,
+                top_n=top_n,
+                exclude=(pokemon_name,),
+                max_moves=threat_moves,
+                expand_tera=threats_terastallized,
+            )
+        except Exception as e:
+            return {"error": f"Could not load usage stats: {e}"}
+
+        report = run_meta_sweep(
+            your_pokemon, your_moves, meta,
+            your_tera_active=tera_active,
+            threat_tera_active=threats_terastallized,
+        )
+
+        result = report.to_dict()
+        result["final_stats"] = calculate_all_stats(your_pokemon)
+        result["moves_checked"] = [m.name for m in your_moves]
+
+        # One-line takeaways for the most dangerous attacks and best KO targets
+        highlights = [
+            f"You survive {r.survive_percent}% of the meta's {r.species} {r.move}"
+            for r in report.incoming[:3] if r.ko_percent > 0
+        ]
+        highlights += [
+            f"Your {r.move} OHKOs {r.ko_percent}% of {r.species} sets"
+            for r in sorted(report.best_ko_by_species().values(), key=lambda r: -r.ko_percent)[:3]
+            if r.ko_percent > 0
+        ]
+        result["highlights"] = highlights
+        return result
@@ -8,8 +8,12 @@ from vgc_mcp_core.validation.learnset import (
     validate_moveset,
     validate_team_movesets,
     suggest_legal_moves,
-    categorize_learn_method
+    categorize_learn_method,
+    find_learners,
+    load_learnsets,
+    normalize_move_name,
 )
+from vgc_mcp_core.validation.learnset_index import get_learnset_index
 
 
 def register_move_tools(mcp: FastMCP, pokeapi, smogon, team_manager):
@@ -224,18 +228,28 @@ def register_move_tools(mcp: FastMCP, pokeapi, smogon, team_manager):
     @mcp.tool()
     async def find_move_learners(
         move_name: str,
-        team_only: bool = False
+        team_only: bool = False,
+        also_learns: Optional[list[str]] = None,
+        exclude_restricted: bool = False,
+        limit: int = 60
     ) -> dict:
         """
-        Find which Pokemon can learn a specific move.
+        Find which Pokemon can learn a specific move (or a set of moves).
 
         Args:
             move_name: Name of the move to search for
             team_only: If True, only check current team members
+            also_learns: Other moves the Pokemon must also learn
+                (e.g. ["tailwind"] with move_name="fake-out")
+            exclude_restricted: Leave restricted Pokemon out of dex-wide results
+            limit: Maximum learners to list for dex-wide searches
 
         Returns:
-            List of Pokemon that can learn the move
+            List of Pokemon that can learn the move(s)
         """
+        wanted = [move_name, *(also_learns or [])]
+        label = " + ".join(wanted)
+
         if team_only:
             team = team_manager.get_current_team()
 
@@ -246,32 +260,55 @@ def register_move_tools(mcp: FastMCP, pokeapi, smogon, team_manager):
                     "message": "No Pokemon on team"
                 }
 
+            names = [slot.pokemon.name for slot in team.slots]
+            errors = await load_learnsets(names, pokeapi)
+            index = get_learnset_index()
+
             learners = []
-            for slot in team.slots:
-                pokemon_name = slot.pokemon.name
-                learnable = await get_learnable_moves(pokemon_name, pokeapi)
-
-                if "error" not in learnable:
-                    normalized_move = move_name.lower().replace(" ", "-")
-                    if normalized_move in learnable.get("moves", {}):
-                        methods = learnable["moves"][normalized_move]
-                        learners.append({
-                            "pokemon": pokemon_name,
-                            "methods": [categorize_learn_method(m) for m in methods]
-                        })
+            for pokemon_name in names:
+                if pokemon_name.lower().replace(" ", "-") in errors:
+                    continue
+                if not index.missing_moves(pokemon_name, [normalize_move_name(m) for m in wanted]):
+                    methods = index.methods(pokemon_name, normalize_move_name(move_name))
+                    learners.append({
+                        "pokemon": pokemon_name,
+                        "methods": [categorize_learn_method(m) for m in methods]
+                    })
 
             return {
                 "move": move_name,
                 "learners": learners,
                 "message": (
-                    f"{len(learners)} team member(s) can learn {move_name}"
-                    if learners else f"No team member can learn {move_name}"
+                    f"{len(learners)} team member(s) can learn {label}"
+                    if learners else f"No team member can learn {label}"
                 )
             }
-        else:
-            # This would require searching all Pokemon - return guidance instead
+
+        result = await find_learners(wanted, pokeapi, include_restricted=not exclude_restricted)
+        if "error" in result:
             return {
                 "move": move_name,
-                "message": "Use team_only=True to check your team, or use Smogon data to find common users",
-                "suggestion": "Try searching for Pokemon that commonly use this move in the meta"
+                "error": result["error"],
+                "suggestion": "Check the move spelling, e.g. 'fake-out' or 'Fake Out'"
             }
+
+        learners = result["learners"]
+        response = {
+            "move": move_name,
+            "also_learns": also_learns or [],
+            "total_learners": len(learners),
+            "learners": learners[:limit],
+            "restricted": result["restricted"],
+            "message": (
+                f"{len(learners)} Pokemon not banned in the current regulation can learn {label}"
+            ),
+            "note": (
+                "Mega and Gigantamax forms are excluded, but learners come from every "
+                "generation: check that a species is available in Scarlet/Violet"
+            )
+        }
+        if not learners:
+            response["suggestion"] = (
+                "No eligible Pokemon learns all of these moves; try fewer moves"
+            )
+        return response
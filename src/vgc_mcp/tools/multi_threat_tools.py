@@ -5,7 +5,7 @@ from mcp.server.fastmcp import FastMCP
 
 from vgc_mcp_core.config import logger
 from vgc_mcp_core.api.pokeapi import PokeAPIClient
-from vgc_mcp_core.calc.damage import calculate_damage
+from vgc_mcp_core.calc.damage import screen_survival
 from vgc_mcp_core.calc.modifiers import DamageModifiers
 from vgc_mcp_core.models.pokemon import PokemonBuild, Nature, EVSpread, BaseStats
 from vgc_mcp_core.models.move import Move
@@ -147,21 +147,19 @@ def register_multi_threat_tools(mcp: FastMCP, pokeapi: PokeAPIClient):
                         all_survive = True
                         
                         for threat_data in threat_builds:
-                            result = calculate_damage(
+                            # Survival chance; damage bounds settle most spreads
+                            # without the full 16-roll calc
+                            bounds, survival_pct = screen_survival(
                                 threat_data["build"],
                                 test_defender,
                                 threat_data["move"],
                                 DamageModifiers(is_doubles=True)
                             )
                             
-                            # Calculate survival chance
-                            survives = sum(1 for r in result.rolls if r < result.defender_hp)
-                            survival_pct = (survives / 16) * 100
-                            
                             threat_results.append({
                                 "threat_name": threat_data["name"],
                                 "move_name": threat_data["move_name"],
-                                "damage_range": result.damage_range,
+                                "damage_range": bounds.damage_range,
                                 "survival_chance": survival_pct,
                                 "survives": survival_pct >= target_survival_chance
                             })
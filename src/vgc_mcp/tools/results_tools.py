@@ -0,0 +1,38 @@
+"""MCP tool for paging through results held back by long-running tools."""
+
+from typing import Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from vgc_mcp_core.progress import get_result_store
+from vgc_mcp_core.utils.errors import ErrorCodes, error_response
+
+
+def register_results_tools(mcp: FastMCP):
+    """Register the paginated results tool."""
+
+    @mcp.tool()
+    async def get_more_results(cursor: str, page_size: Optional[int] = None) -> dict:
+        """
+        Get the next page of a large result (bulk calcs, team vs meta reports).
+
+        Tools with many rows return the first page plus a "next_cursor". Pass that
+        cursor here to get the following page; keep going until next_cursor is null.
+
+        Args:
+            cursor: The next_cursor value from a previous response
+            page_size: Rows to return (default: the original tool's page size, max 100)
+
+        Returns:
+            The tool name, this page's items, offset, total rows and the next cursor
+        """
+        try:
+            return get_result_store().page(cursor, page_size)
+        except ValueError as e:
+            return error_response(ErrorCodes.INVALID_PARAMETER, str(e))
+        except KeyError:
+            return error_response(
+                ErrorCodes.INVALID_PARAMETER,
+                "Cursor not found or expired",
+                suggestions=["Re-run the original tool to get a fresh cursor"],
+            )
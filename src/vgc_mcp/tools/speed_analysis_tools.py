@@ -17,8 +17,9 @@ from vgc_mcp_core.calc.speed import (
     SPEED_BENCHMARKS,
     META_SPEED_TIERS,
     calculate_speed_tier,
-    get_competitive_speed_benchmarks,
+    meta_speed_tier_names,
 )
+from vgc_mcp_core.calc.speed_tiers import competitive_speed_benchmarks
 from vgc_mcp_core.calc.speed_control import (
     analyze_trick_room,
     analyze_tailwind,
@@ -31,6 +32,7 @@ from vgc_mcp_core.calc.speed_control import (
 )
 from vgc_mcp_core.models.pokemon import Nature
 from vgc_mcp_core.config import EV_BREAKPOINTS_LV50
+from vgc_mcp_core.result_cache import cached_tool
 
 
 def register_speed_analysis_tools(mcp: FastMCP, pokeapi: PokeAPIClient, team_manager: TeamManager, smogon_client: SmogonStatsClient):
@@ -307,8 +309,9 @@ def register_speed_analysis_tools(mcp: FastMCP, pokeapi: PokeAPIClient, team_man
             competitive_benchmarks = None
             if use_competitive_data:
                 try:
-                    competitive_benchmarks = await get_competitive_speed_benchmarks(
+                    competitive_benchmarks = await competitive_speed_benchmarks(
                         smogon_client,
+                        pokeapi,
                         top_n_pokemon=30,
                         top_n_speeds=3
                     )
@@ -373,7 +376,7 @@ def register_speed_analysis_tools(mcp: FastMCP, pokeapi: PokeAPIClient, team_man
         # Add meta Pokemon for reference
         if compare_to_meta:
             from vgc_mcp_core.calc.speed import get_meta_speed_tier
-            for mon in META_SPEED_TIERS.keys():
+            for mon in meta_speed_tier_names(limit=len(META_SPEED_TIERS)):
                 data = get_meta_speed_tier(mon)
                 if data:
                     common_speeds = data.get("common_speeds", [])
@@ -458,6 +461,7 @@ def register_speed_analysis_tools(mcp: FastMCP, pokeapi: PokeAPIClient, team_man
         return result
 
     @mcp.tool()
+    @cached_tool()
     async def get_meta_speed_tiers(
         format_type: str = "general",
         tier: Optional[str] = None,
@@ -470,21 +474,31 @@ def register_speed_analysis_tools(mcp: FastMCP, pokeapi: PokeAPIClient, team_man
             format_type: "general", "trick_room", or "tailwind"
             tier: Optional filter - "fast", "medium", "slow"
             use_competitive_data: Use Smogon competitive spreads (default True).
-                                 If False, uses theoretical speeds from META_SPEED_TIERS.
+                                 These come from the speed tier table; until it
+                                 has loaded, or if False, the static meta tiers
+                                 are used (the table's spreads once loaded, else
+                                 theoretical speeds).
 
         Returns:
             Speed tier information for meta Pokemon based on real competitive usage
         """
         result = []
+        # Competitive data was asked for but couldn't be served
+        fallback = False
 
         if use_competitive_data:
             # Fetch competitive speed benchmarks from Smogon
             try:
-                competitive_benchmarks = await get_competitive_speed_benchmarks(
+                competitive_benchmarks = await competitive_speed_benchmarks(
                     smogon_client,
+                    pokeapi,
                     top_n_pokemon=30,
                     top_n_speeds=3
                 )
+                if not competitive_benchmarks:
+                    # Speed tier table still loading
+                    use_competitive_data = False
+                    fallback = True
 
                 for mon_name, speeds in competitive_benchmarks.items():
                     if not speeds:
@@ -526,12 +540,13 @@ def register_speed_analysis_tools(mcp: FastMCP, pokeapi: PokeAPIClient, team_man
             except Exception:
                 # Fallback to META_SPEED_TIERS if Smogon fetch fails
                 use_competitive_data = False
+                fallback = True
 
         if not use_competitive_data:
             # Fallback to theoretical speeds from META_SPEED_TIERS
             from vgc_mcp_core.calc.speed import get_meta_speed_tier
 
-            for mon in META_SPEED_TIERS.keys():
+            for mon in meta_speed_tier_names(limit=len(META_SPEED_TIERS)):
                 data = get_meta_speed_tier(mon)
                 if not data:
                     continue
@@ -571,12 +586,18 @@ def register_speed_analysis_tools(mcp: FastMCP, pokeapi: PokeAPIClient, team_man
         elif format_type == "trick_room":
             result.sort(key=lambda x: x["base_speed"])  # Reverse order
 
-        return {
+        response = {
             "format": format_type,
             "tier_filter": tier,
             "pokemon_count": len(result),
-            "speed_tiers": result
+            "speed_tiers": result,
+            "data_source": (
+                "Smogon competitive usage" if use_competitive_data else "Meta speed tiers"
+            ),
         }
+        if fallback:
+            response["fallback"] = True
+        return response
 
     @mcp.tool()
     async def find_speed_benchmark(
@@ -632,7 +653,7 @@ def register_speed_analysis_tools(mcp: FastMCP, pokeapi: PokeAPIClient, team_man
 
         # Check meta Pokemon
         from vgc_mcp_core.calc.speed import get_meta_speed_tier
-        for mon in META_SPEED_TIERS.keys():
+        for mon in meta_speed_tier_names(limit=len(META_SPEED_TIERS)):
             data = get_meta_speed_tier(mon)
             if not data:
                 continue
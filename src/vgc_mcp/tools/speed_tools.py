@@ -10,7 +10,7 @@ from mcp.server.fastmcp import FastMCP
 from vgc_mcp_core.api.pokeapi import PokeAPIClient
 from vgc_mcp_core.api.smogon import SmogonStatsClient
 from vgc_mcp_core.calc.stats import calculate_speed
-from vgc_mcp_core.models.pokemon import Nature
+from vgc_mcp_core.models.pokemon import Nature, parse_nature
 
 
 # Common VGC Pokemon with their base speeds and common speed investments
@@ -153,23 +153,11 @@ def register_speed_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional[
                     common_speeds = target_data.get("common_speeds", [])
                     if not common_speeds and "spreads" in target_data:
                         # Calculate from spreads (use module-level calculate_speed)
-                        NATURE_MAP = {
-                            "adamant": Nature.ADAMANT, "bashful": Nature.BASHFUL, "bold": Nature.BOLD,
-                            "brave": Nature.BRAVE, "calm": Nature.CALM, "careful": Nature.CAREFUL,
-                            "docile": Nature.DOCILE, "gentle": Nature.GENTLE, "hardy": Nature.HARDY,
-                            "hasty": Nature.HASTY, "impish": Nature.IMPISH, "jolly": Nature.JOLLY,
-                            "lax": Nature.LAX, "lonely": Nature.LONELY, "mild": Nature.MILD,
-                            "modest": Nature.MODEST, "naive": Nature.NAIVE, "naughty": Nature.NAUGHTY,
-                            "quiet": Nature.QUIET, "quirky": Nature.QUIRKY, "rash": Nature.RASH,
-                            "relaxed": Nature.RELAXED, "sassy": Nature.SASSY, "serious": Nature.SERIOUS,
-                            "timid": Nature.TIMID,
-                        }
                         base = target_data["base"]
                         speed_set = set()
                         for spread in target_data["spreads"]:
-                            nature_str = spread.get("nature", "Serious").lower()
                             speed_evs = spread.get("evs", 0)
-                            nature = NATURE_MAP.get(nature_str, Nature.SERIOUS)
+                            nature = parse_nature(spread.get("nature", "Serious"))
                             speed = calculate_speed(base, 31, speed_evs, 50, nature)
                             if speed not in speed_set:
                                 speed_set.add(speed)
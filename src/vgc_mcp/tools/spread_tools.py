@@ -1,7 +1,7 @@
 """MCP tools for EV spread optimization."""
 
 from typing import Optional
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from dataclasses import dataclass
 import itertools
 import time
@@ -10,7 +10,14 @@ from vgc_mcp_core.config import logger
 from vgc_mcp_core.api.pokeapi import PokeAPIClient
 from vgc_mcp_core.api.smogon import SmogonStatsClient
 from vgc_mcp_core.calc.stats import calculate_speed, calculate_stat, calculate_hp, find_speed_evs
-from vgc_mcp_core.calc.damage import calculate_damage, DamageResult, format_percent
+from vgc_mcp_core.calc.damage import (
+    DamageBounds,
+    DamageResult,
+    calculate_damage,
+    calculate_damage_bounds,
+    format_percent,
+    screen_survival,
+)
 from vgc_mcp_core.calc.modifiers import DamageModifiers
 from vgc_mcp_core.calc.bulk_optimization import (
     calculate_optimal_bulk_distribution,
@@ -21,6 +28,7 @@ from vgc_mcp_core.formats.showdown import pokemon_build_to_showdown
 from vgc_mcp_core.models.move import Move, MoveCategory
 from vgc_mcp_core.config import EV_BREAKPOINTS_LV50, normalize_evs
 from vgc_mcp_core.utils.synergies import get_synergy_ability
+from vgc_mcp_core.progress import ProgressReporter
 import math
 
 
@@ -214,7 +222,12 @@ class ThreatSpec:
 
 
 class DamageCache:
-    """Cache damage calculations to avoid redundant computations."""
+    """Cache damage calculations to avoid redundant computations.
+
+    Spreads are screened with damage bounds first: a threat that KOs on no
+    roll or on every roll is settled without the full 16-roll calc, which
+    only runs for the rest and for the spread finally reported.
+    """
 
     def __init__(self, threats: list[ThreatSpec], defender_name: str, defender_base: BaseStats, defender_types: list[str]):
         self.threats = threats
@@ -222,6 +235,46 @@ class DamageCache:
         self.defender_base = defender_base
         self.defender_types = defender_types
         self.cache: dict = {}  # Key: (threat_idx, hp_ev, def_ev, spd_ev, nature_name, tera_type)
+        self.bounds_cache: dict = {}  # Same keys, DamageBounds
+
+    def _calc_inputs(
+        self,
+        threat_idx: int,
+        hp_ev: int,
+        def_ev: int,
+        spd_ev: int,
+        nature: Nature,
+        defender_tera_type: Optional[str] = None
+    ) -> tuple[PokemonBuild, DamageModifiers]:
+        """Defender build and modifiers for one threat against one spread."""
+        # Build defender with these EVs
+        defender = PokemonBuild(
+            name=self.defender_name,
+            base_stats=self.defender_base,
+            types=self.defender_types,
+            nature=nature,
+            evs=EVSpread(hp=hp_ev, defense=def_ev, special_defense=spd_ev),
+            tera_type=defender_tera_type
+        )
+
+        threat = self.threats[threat_idx]
+
+        # Update modifiers with defender Tera if specified
+        modifiers = DamageModifiers(
+            is_doubles=threat.modifiers.is_doubles,
+            attacker_item=threat.modifiers.attacker_item,
+            attacker_ability=threat.modifiers.attacker_ability,
+            tera_type=threat.modifiers.tera_type,
+            tera_active=threat.modifiers.tera_active,
+            defender_tera_type=defender_tera_type,
+            defender_tera_active=defender_tera_type is not None,
+            is_critical=threat.modifiers.is_critical,
+            sword_of_ruin=threat.modifiers.sword_of_ruin,
+            beads_of_ruin=threat.modifiers.beads_of_ruin,
+            vessel_of_ruin=threat.modifiers.vessel_of_ruin,
+            tablets_of_ruin=threat.modifiers.tablets_of_ruin
+        )
+        return defender, modifiers
 
     def get_damage(
         self,
@@ -237,39 +290,62 @@ class DamageCache:
         key = (threat_idx, hp_ev, def_ev, spd_ev, nature.value, tera_key)
 
         if key not in self.cache:
-            # Build defender with these EVs
-            defender = PokemonBuild(
-                name=self.defender_name,
-                base_stats=self.defender_base,
-                types=self.defender_types,
-                nature=nature,
-                evs=EVSpread(hp=hp_ev, defense=def_ev, special_defense=spd_ev),
-                tera_type=defender_tera_type
+            defender, modifiers = self._calc_inputs(
+                threat_idx, hp_ev, def_ev, spd_ev, nature, defender_tera_type
             )
-
             threat = self.threats[threat_idx]
+            self.cache[key] = calculate_damage(
+                threat.attacker_build, defender, threat.move, modifiers
+            )
+
+        return self.cache[key]
 
-            # Update modifiers with defender Tera if specified
-            modifiers = DamageModifiers(
-                is_doubles=threat.modifiers.is_doubles,
-                attacker_item=threat.modifiers.attacker_item,
-                attacker_ability=threat.modifiers.attacker_ability,
-                tera_type=threat.modifiers.tera_type,
-                tera_active=threat.modifiers.tera_active,
-                defender_tera_type=defender_tera_type,
-                defender_tera_active=defender_tera_type is not None,
-                is_critical=threat.modifiers.is_critical,
-                sword_of_ruin=threat.modifiers.sword_of_ruin,
-                beads_of_ruin=threat.modifiers.beads_of_ruin,
-                vessel_of_ruin=threat.modifiers.vessel_of_ruin,
-                tablets_of_ruin=threat.modifiers.tablets_of_ruin
+    def get_bounds(
+        self,
+        threat_idx: int,
+        hp_ev: int,
+        def_ev: int,
+        spd_ev: int,
+        nature: Nature,
+        defender_tera_type: Optional[str] = None
+    ) -> DamageBounds:
+        """Get cached min/max damage or calculate and cache it."""
+        tera_key = defender_tera_type or "none"
+        key = (threat_idx, hp_ev, def_ev, spd_ev, nature.value, tera_key)
+
+        if key not in self.bounds_cache:
+            defender, modifiers = self._calc_inputs(
+                threat_idx, hp_ev, def_ev, spd_ev, nature, defender_tera_type
+            )
+            threat = self.threats[threat_idx]
+            self.bounds_cache[key] = calculate_damage_bounds(
+                threat.attacker_build, defender, threat.move, modifiers
             )
 
-            # Calculate damage
-            result = calculate_damage(threat.attacker_build, defender, threat.move, modifiers)
-            self.cache[key] = result
+        return self.bounds_cache[key]
 
-        return self.cache[key]
+    def survival_percent(
+        self,
+        threat_idx: int,
+        hp_ev: int,
+        def_ev: int,
+        spd_ev: int,
+        nature: Nature,
+        defender_tera_type: Optional[str] = None
+    ) -> float:
+        """Share of a threat's 16 rolls the spread survives.
+
+        The bounds decide all-or-nothing cases; only spreads KO'd by some
+        rolls and not others need the full calc to count them.
+        """
+        bounds = self.get_bounds(threat_idx, hp_ev, def_ev, spd_ev, nature, defender_tera_type)
+        if not bounds.is_possible_ohko:
+            return 100.0
+        if bounds.is_guaranteed_ohko:
+            return 0.0
+        result = self.get_damage(threat_idx, hp_ev, def_ev, spd_ev, nature, defender_tera_type)
+        survive_rolls = sum(1 for roll in result.rolls if roll < result.defender_hp)
+        return (survive_rolls / 16) * 100
 
     def test_spread_all_threats(
         self,
@@ -283,27 +359,27 @@ class DamageCache:
         """Test if spread survives ALL threats at the target survival rate.
 
         Returns:
-            (all_survive: bool, results: list[(survives, DamageResult)])
+            (all_survive: bool, results: list[(survives, DamageResult)]);
+            results are only calculated when every threat is survived
         """
-        results = []
-
         for i in range(len(self.threats)):
-            result = self.get_damage(i, hp_ev, def_ev, spd_ev, nature, defender_tera_type)
-
-            # Calculate survival percentage (count rolls that don't KO)
-            survive_rolls = sum(1 for roll in result.rolls if roll < result.defender_hp)
-            survival_pct = (survive_rolls / 16) * 100
-
-            survives = survival_pct >= target_survival
-            results.append((survives, result))
+            survival_pct = self.survival_percent(
+                i, hp_ev, def_ev, spd_ev, nature, defender_tera_type
+            )
+            if survival_pct < target_survival:
+                return False, []
 
-        all_survive = all(r[0] for r in results)
-        return all_survive, results
+        results = [
+            (True, self.get_damage(i, hp_ev, def_ev, spd_ev, nature, defender_tera_type))
+            for i in range(len(self.threats))
+        ]
+        return True, results
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
         return {
-            "total_cached": len(self.cache),
+            "total_cached": len(self.bounds_cache),
+            "exact_calcs": len(self.cache),
             "cache_hits": sum(1 for _ in self.cache.values())  # Placeholder - would need tracking
         }
 
@@ -490,11 +566,9 @@ def _find_min_bulk_for_threat(
         def_ev = test_ev if stat_type == "defense" else 0
         spd_ev = test_ev if stat_type == "special_defense" else 0
 
-        result = cache.get_damage(threat_idx, hp_ev, def_ev, spd_ev, nature, defender_tera_type)
-
-        # Calculate survival percentage
-        survive_rolls = sum(1 for roll in result.rolls if roll < result.defender_hp)
-        survival_pct = (survive_rolls / 16) * 100
+        survival_pct = cache.survival_percent(
+            threat_idx, hp_ev, def_ev, spd_ev, nature, defender_tera_type
+        )
 
         if survival_pct >= target_survival:
             return test_ev
@@ -502,6 +576,14 @@ def _find_min_bulk_for_threat(
     return -1  # Impossible even at 252 EVs
 
 
+def _cheapest_nature_spread(valid_natures: list[dict]) -> Optional[dict]:
+    """Best multi-survival candidate so far, for progress messages."""
+    if not valid_natures:
+        return None
+    best = min(valid_natures, key=lambda x: (x["speed_evs"], x["total_evs"]))
+    return {"nature": best["nature"], "spread": best["spread"], "total_evs": best["total_evs"]}
+
+
 def _quick_feasibility_check(
     cache: DamageCache,
     remaining_evs: int,
@@ -1915,7 +1997,10 @@ def register_spread_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
                                     tablets_of_ruin=tablets_of_ruin,
                                     vessel_of_ruin=vessel_of_ruin
                                 )
-                                result = calculate_damage(attacker, defender, move, modifiers)
+                                # The score only reads max damage, so bounds suffice
+                                result = calculate_damage_bounds(
+                                    attacker, defender, move, modifiers
+                                )
 
                                 # Calculate effective bulk for tiebreaker
                                 final_hp = calculate_hp(my_base.hp, 31, hp_ev, 50)
@@ -2613,7 +2698,8 @@ def register_spread_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
                         sword_of_ruin=sword_of_ruin1,
                         beads_of_ruin=beads_of_ruin1
                     )
-                    result1 = calculate_damage(attacker1, defender, move1, modifiers1)
+                    # Bounds only; the full calc runs when they straddle the HP
+                    result1, survival_pct1 = screen_survival(attacker1, defender, move1, modifiers1)
                     modifiers2 = DamageModifiers(
                         is_doubles=True, attacker_item=survive_hit2_item,
                         attacker_ability=survive_hit2_ability, tera_type=survive_hit2_tera_type,
@@ -2624,11 +2710,7 @@ def register_spread_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
                         sword_of_ruin=sword_of_ruin2,
                         beads_of_ruin=beads_of_ruin2
                     )
-                    result2 = calculate_damage(attacker2, defender, move2, modifiers2)
-                    survive_rolls1 = sum(1 for r in result1.rolls if r < result1.defender_hp)
-                    survive_rolls2 = sum(1 for r in result2.rolls if r < result2.defender_hp)
-                    survival_pct1 = (survive_rolls1 / 16) * 100
-                    survival_pct2 = (survive_rolls2 / 16) * 100
+                    result2, survival_pct2 = screen_survival(attacker2, defender, move2, modifiers2)
                     survives1 = survival_pct1 >= target_survival
                     survives2 = survival_pct2 >= target_survival
                     margin = min(100 - result1.max_percent, 100 - result2.max_percent)
@@ -2744,7 +2826,8 @@ def register_spread_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
                         sword_of_ruin=sword_of_ruin1,
                         beads_of_ruin=beads_of_ruin1
                     )
-                    result1 = calculate_damage(attacker1, defender, move1, modifiers1)
+                    # Bounds only; the full calc runs when they straddle the HP
+                    result1, survival_pct1 = screen_survival(attacker1, defender, move1, modifiers1)
                     modifiers2 = DamageModifiers(
                         is_doubles=True, attacker_item=survive_hit2_item,
                         attacker_ability=survive_hit2_ability, tera_type=survive_hit2_tera_type,
@@ -2755,11 +2838,7 @@ def register_spread_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
                         sword_of_ruin=sword_of_ruin2,
                         beads_of_ruin=beads_of_ruin2
                     )
-                    result2 = calculate_damage(attacker2, defender, move2, modifiers2)
-                    survive_rolls1 = sum(1 for r in result1.rolls if r < result1.defender_hp)
-                    survive_rolls2 = sum(1 for r in result2.rolls if r < result2.defender_hp)
-                    survival_pct1 = (survive_rolls1 / 16) * 100
-                    survival_pct2 = (survive_rolls2 / 16) * 100
+                    result2, survival_pct2 = screen_survival(attacker2, defender, move2, modifiers2)
                     survives1 = survival_pct1 >= target_survival
                     survives2 = survival_pct2 >= target_survival
                     margin = min(100 - result1.max_percent, 100 - result2.max_percent)
@@ -3019,6 +3098,7 @@ def register_spread_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
         defender_tera_type: Optional[str] = None,
         target_survival: float = 93.75,
         item: Optional[str] = None,
+        ctx: Optional[Context] = None,
     ) -> dict:
         """
         Find optimal EV spread to survive 3-6 different attacks while meeting speed benchmark.
@@ -3207,7 +3287,16 @@ def register_spread_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
             # Track ALL valid natures (for alternative suggestions)
             all_valid_natures_multi = []  # List of all natures that meet benchmarks
 
-            for nature_name, nature_mods in natures_to_try:
+            # Each nature searched is reported with the cheapest spread so far,
+            # starting once the first one has been evaluated
+            progress = ProgressReporter(ctx, total=len(natures_to_try))
+            for tried, (nature_name, nature_mods) in enumerate(natures_to_try):
+                if tried:
+                    await progress.update(
+                        tried,
+                        f"{tried}/{len(natures_to_try)} natures searched",
+                        best=_cheapest_nature_spread(all_valid_natures_multi),
+                    )
                 speed_mod = nature_mods["speed"]
                 speed_evs_needed, my_speed_stat = calc_min_speed_evs(my_base.speed, speed_mod)
 
@@ -3338,6 +3427,12 @@ def register_spread_tools(mcp: FastMCP, pokeapi: PokeAPIClient, smogon: Optional
                         "final_spd": final_spd
                     })
 
+            await progress.update(
+                len(natures_to_try),
+                f"{len(natures_to_try)}/{len(natures_to_try)} natures searched",
+                best=_cheapest_nature_spread(all_valid_natures_multi),
+            )
+
             # Calculate computation stats
             end_time = time.time()
             time_ms = int((end_time - start_time) * 1000)
@@ -1,7 +1,7 @@
 """MCP tools for team vs team matchup analysis against tournament teams."""
 
 from typing import Optional
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 from vgc_mcp_core.api.pokepaste import PokePasteClient, PokePasteError
 from vgc_mcp_core.api.pokeapi import PokeAPIClient
@@ -11,6 +11,7 @@ from vgc_mcp_core.calc.stats import calculate_all_stats
 from vgc_mcp_core.calc.damage import calculate_damage
 from vgc_mcp_core.calc.modifiers import DamageModifiers, get_type_effectiveness
 from vgc_mcp_core.data.sample_teams import ALL_SAMPLE_TEAMS, SampleTeam
+from vgc_mcp_core.progress import ProgressReporter, get_result_store
 from vgc_mcp_core.calc.team_matchup import (
     full_team_matchup_analysis,
     TeamMatchupResult,
@@ -337,7 +338,9 @@ def register_tournament_tools(mcp: FastMCP, pokepaste: PokePasteClient, pokeapi:
     @mcp.tool()
     async def analyze_team_vs_meta(
         pokepaste_url: str,
-        top_n: int = 5
+        top_n: int = 5,
+        page_size: Optional[int] = None,
+        ctx: Optional[Context] = None,
     ) -> dict:
         """
         Analyze your team against top tournament meta teams.
@@ -353,6 +356,9 @@ def register_tournament_tools(mcp: FastMCP, pokepaste: PokePasteClient, pokeapi:
         Args:
             pokepaste_url: PokePaste URL of your team (e.g., "https://pokepast.es/abc123")
             top_n: Number of meta teams to analyze against (default 5)
+            page_size: Full reports included in this response (default top_n, i.e.
+                all of them; hardest matchups first); the rest come from
+                get_more_results(next_cursor)
 
         Returns:
             Full matchup report for each meta team
@@ -378,9 +384,11 @@ def register_tournament_tools(mcp: FastMCP, pokepaste: PokePasteClient, pokeapi:
                     "parsed_pokemon": [p.name for p in user_team]
                 }
 
-            # Analyze against each sample team
+            # Analyze against each sample team, reporting each as it finishes
+            sample_teams = ALL_SAMPLE_TEAMS[:top_n]
+            progress = ProgressReporter(ctx, total=len(sample_teams))
             results = []
-            for sample_team in ALL_SAMPLE_TEAMS[:top_n]:
+            for done, sample_team in enumerate(sample_teams, 1):
                 # Parse the sample team's paste
                 sample_parsed = parse_showdown_team(sample_team.paste)
                 opponent_team = []
@@ -390,6 +398,7 @@ def register_tournament_tools(mcp: FastMCP, pokepaste: PokePasteClient, pokeapi:
                         opponent_team.append(build)
 
                 if len(opponent_team) < 4:
+                    await progress.update(done, f"Skipped {sample_team.name}")
                     continue
 
                 # Run matchup analysis
@@ -407,12 +416,25 @@ def register_tournament_tools(mcp: FastMCP, pokepaste: PokePasteClient, pokeapi:
                     "overall_advantage": matchup_result.overall_advantage,
                     "formatted_report": _format_full_result(matchup_result)
                 })
+                worst = min(results, key=lambda r: r["overall_advantage"])
+                await progress.update(
+                    done,
+                    f"{done}/{len(sample_teams)} teams: {sample_team.name} "
+                    f"{matchup_result.overall_advantage:.0f}% advantage",
+                    best={
+                        "worst_matchup": worst["opponent_name"],
+                        "advantage": worst["overall_advantage"],
+                    },
+                )
 
             # Sort by most challenging (lowest advantage first)
             results.sort(key=lambda r: r["overall_advantage"])
 
             # Summary
             avg_advantage = sum(r["overall_advantage"] for r in results) / len(results) if results else 50
+            page = get_result_store().paginate(
+                "analyze_team_vs_meta", results, page_size or top_n
+            )
 
             return {
                 "success": True,
@@ -422,7 +444,8 @@ def register_tournament_tools(mcp: FastMCP, pokepaste: PokePasteClient, pokeapi:
                 "summary": f"Your team has an average {avg_advantage:.0f}% advantage across {len(results)} meta teams.",
                 "worst_matchup": results[0]["opponent_name"] if results else None,
                 "best_matchup": results[-1]["opponent_name"] if results else None,
-                "matchup_reports": results
+                "matchup_reports": page["items"],
+                "next_cursor": page["next_cursor"],
             }
 
         except PokePasteError as e:
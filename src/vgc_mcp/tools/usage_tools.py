@@ -230,3 +230,69 @@ def register_usage_tools(mcp: FastMCP, smogon: SmogonStatsClient):
 
         except Exception as e:
             return {"error": str(e)}
+
+    @mcp.tool()
+    async def get_usage_trends(
+        pokemon_name: Optional[str] = None,
+        months: int = 6,
+        metric: str = "usage",
+        limit: int = 10,
+        format_name: Optional[str] = None,
+        rating: int = 0
+    ) -> dict:
+        """
+        Usage trends across several months of Smogon stats.
+
+        Without a Pokemon, lists the biggest risers and fallers across the whole
+        metagame (e.g. "top risers over 6 months"). With a Pokemon, returns its
+        month-by-month usage, Speed investment and top item/Tera type shares
+        (e.g. "Flutter Mane speed-investment trend").
+
+        Args:
+            pokemon_name: Pokemon to trace (omit for metagame-wide risers/fallers)
+            months: Number of months to cover (default 6)
+            metric: For risers/fallers: "usage", "speed_evs" (mean Speed EVs) or
+                    "max_speed" (% of spreads with 252 Speed EVs)
+            limit: Number of risers and fallers to return
+            format_name: VGC format (auto-detects latest if not specified)
+            rating: Rating cutoff (0, 1500, 1630, or 1760)
+
+        Returns:
+            Months covered plus risers/fallers, or the Pokemon's series
+        """
+        try:
+            history = await smogon.get_usage_history(format_name, rating, months)
+            window = history.window(months)
+            result = {
+                "format": history.format_name,
+                "rating": rating,
+                "months": window,
+            }
+
+            if pokemon_name is None:
+                result["metric"] = metric
+                result["risers"] = history.movers(metric, months, limit, rising=True)
+                result["fallers"] = history.movers(metric, months, limit, rising=False)
+                return result
+
+            row = history.lookup(pokemon_name)
+            if row is None:
+                return {
+                    "error": f"No usage data found for {pokemon_name} in {', '.join(window)}",
+                    "suggestion": "Check spelling or try a different format or rating"
+                }
+
+            latest = window[-1]
+            result["pokemon"] = history.species[row]
+            for numeric in ("usage", "speed_evs", "max_speed"):
+                result[numeric] = dict(history.series(pokemon_name, numeric, months))
+            for shares in ("items", "tera_types"):
+                top = list((history.columns[shares][latest][row] or {}))[:3]
+                result[shares] = {
+                    name: dict(history.share_series(pokemon_name, shares, name, months))
+                    for name in top
+                }
+            return result
+
+        except Exception as e:
+            return {"error": str(e)}
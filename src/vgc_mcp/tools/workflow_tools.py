@@ -1843,9 +1843,7 @@ def register_workflow_tools(mcp: FastMCP, pokeapi, smogon, team_manager, analyze
             - summary: Quick overview of survival/KO across sets
         """
         from vgc_mcp_core.models.pokemon import Nature, PokemonBuild, EVSpread, BaseStats, get_nature_modifier
-        from vgc_mcp_core.models.move import MoveCategory
-        from vgc_mcp_core.calc.damage import calculate_damage
-        from vgc_mcp_core.calc.modifiers import DamageModifiers
+        from vgc_mcp_core.calc.meta_sweep import MetaSpecies, expand_usage_variants, run_meta_sweep
         from vgc_mcp_core.calc.stats import calculate_stat, calculate_hp
 
         try:
@@ -1898,15 +1896,13 @@ def register_workflow_tools(mcp: FastMCP, pokeapi, smogon, team_manager, analyze
                 if abilities:
                     my_ability = abilities[0].lower().replace(" ", "-")
 
-            # Build my Pokemon
+            # Build my Pokemon (the sweep applies Tera typing when my_tera_type is set)
             my_types = await pokeapi.get_pokemon_types(my_pokemon)
-            # If Tera active, defensive typing changes
-            defensive_types = [my_tera_type] if my_tera_type else my_types
 
             my_build = PokemonBuild(
                 name=my_pokemon,
                 base_stats=my_base_stats,
-                types=defensive_types,
+                types=my_types,
                 nature=parsed_nature,
                 evs=EVSpread(
                     hp=my_hp_evs,
@@ -1940,17 +1936,10 @@ def register_workflow_tools(mcp: FastMCP, pokeapi, smogon, team_manager, analyze
                     suggestions=["This Pokemon may not have enough usage in the current format"]
                 )
 
-            opp_spreads = opp_usage.get("spreads", [])[:num_sets]
             opp_items = opp_usage.get("items", {})
             opp_abilities = opp_usage.get("abilities", {})
             opp_tera_types = opp_usage.get("tera_types", {})
 
-            if not opp_spreads:
-                return error_response(
-                    ErrorCodes.API_ERROR,
-                    f"No spread data available for {opponent_pokemon}"
-                )
-
             # Get most common item and ability for opponent
             top_item = list(opp_items.keys())[0] if opp_items else None
             top_ability = list(opp_abilities.keys())[0] if opp_abilities else None
@@ -1962,8 +1951,43 @@ def register_workflow_tools(mcp: FastMCP, pokeapi, smogon, team_manager, analyze
             if top_ability:
                 top_ability = top_ability.lower().replace(" ", "-")
 
+            # One set per top spread, each with the most common item and ability
             opp_types = await pokeapi.get_pokemon_types(opponent_pokemon)
-            is_physical = move_data.category == MoveCategory.PHYSICAL
+            opp_sets = expand_usage_variants(
+                opponent_pokemon, opp_base_stats, opp_types, opp_usage,
+                max_spreads=num_sets, max_items=1, max_abilities=1,
+            )
+            if not opp_sets:
+                return error_response(
+                    ErrorCodes.API_ERROR,
+                    f"No spread data available for {opponent_pokemon}"
+                )
+            if not move_data.is_damaging:
+                return error_response(
+                    ErrorCodes.VALIDATION_ERROR, f"'{move}' is not a damaging move"
+                )
+
+            opponent = MetaSpecies(
+                name=opponent_pokemon,
+                usage_percent=opp_usage.get("usage_percent", 0),
+                variants=opp_sets,
+            )
+            if direction == "from":
+                # Opponent attacks me
+                opponent.moves = [(move_data, 100.0)]
+                report = run_meta_sweep(
+                    my_build, [], [opponent], your_tera_active=my_tera_type is not None
+                )
+                sweep = report.incoming[0]
+            else:
+                # I attack opponent
+                report = run_meta_sweep(
+                    my_build, [move_data], [opponent], your_tera_active=my_tera_type is not None
+                )
+                sweep = report.outgoing[0]
+            spread_usage = {
+                s.get("spread_string"): s.get("usage", 0) for s in opp_usage.get("spreads", [])
+            }
 
             damage_results = []
             survives_count = 0
@@ -1982,77 +2006,28 @@ def register_workflow_tools(mcp: FastMCP, pokeapi, smogon, team_manager, analyze
             if my_item and my_item.lower().replace(" ", "-") == "life-orb":
                 my_life_orb_recoil = my_final_stats["hp"] // 10
 
-            for i, spread in enumerate(opp_spreads):
-                if "evs" not in spread:
-                    continue
-
-                spread_evs = spread["evs"]
-                spread_nature_str = spread.get("nature", "Serious")
-
-                try:
-                    spread_nature = Nature(spread_nature_str.lower())
-                except ValueError:
-                    spread_nature = Nature.serious
-
-                # Build opponent with this spread
-                opp_build = PokemonBuild(
-                    name=opponent_pokemon,
-                    base_stats=opp_base_stats,
-                    types=opp_types,
-                    nature=spread_nature,
-                    evs=EVSpread(
-                        hp=spread_evs.get("hp", 0),
-                        attack=spread_evs.get("attack", 0),
-                        defense=spread_evs.get("defense", 0),
-                        special_attack=spread_evs.get("special_attack", 0),
-                        special_defense=spread_evs.get("special_defense", 0),
-                        speed=spread_evs.get("speed", 0)
-                    ),
-                    item=top_item,
-                    ability=top_ability
-                )
-
-                # Set up modifiers based on direction
-                if direction == "from":
-                    # Opponent attacks me
-                    attacker = opp_build
-                    defender = my_build
-                    modifiers = DamageModifiers(
-                        is_doubles=True,
-                        attacker_item=top_item,
-                        attacker_ability=top_ability,
-                        defender_tera_type=my_tera_type,
-                        defender_tera_active=my_tera_type is not None
-                    )
-                else:
-                    # I attack opponent
-                    attacker = my_build
-                    defender = opp_build
-                    modifiers = DamageModifiers(
-                        is_doubles=True,
-                        attacker_item=my_item,
-                        attacker_ability=my_ability,
-                        tera_type=my_tera_type,
-                        tera_active=my_tera_type is not None
-                    )
-
-                result = calculate_damage(attacker, defender, move_data, modifiers)
-
-                # Determine outcome
+            for i, (opp_set, result) in enumerate(zip(opp_sets, sweep.variants)):
+                evs = opp_set.build.evs
                 result_entry = {
                     "set_rank": i + 1,
-                    "usage": f"{spread.get('usage', 0)}%",
-                    "nature": spread_nature_str,
-                    "evs": f"{spread_evs.get('hp', 0)} HP / {spread_evs.get('attack', 0)} Atk / {spread_evs.get('defense', 0)} Def / {spread_evs.get('special_attack', 0)} SpA / {spread_evs.get('special_defense', 0)} SpD / {spread_evs.get('speed', 0)} Spe",
-                    "damage_range": result.damage_range,
-                    "percent_range": f"{format_percent(result.min_percent)}% - {format_percent(result.max_percent)}%",
+                    "usage": f"{spread_usage.get(opp_set.spread, 0)}%",
+                    "nature": opp_set.build.nature.value.title(),
+                    "evs": (
+                        f"{evs.hp} HP / {evs.attack} Atk / {evs.defense} Def / "
+                        f"{evs.special_attack} SpA / {evs.special_defense} SpD / {evs.speed} Spe"
+                    ),
+                    "damage_range": result["damage_range"],
+                    "percent_range": (
+                        f"{format_percent(result['min_percent'])}% - "
+                        f"{format_percent(result['max_percent'])}%"
+                    ),
                 }
 
                 if direction == "from":
                     # I'm being attacked
-                    survives = result.max_percent < 100
-                    hp_remaining_min = my_final_stats["hp"] - result.max_damage
-                    hp_remaining_max = my_final_stats["hp"] - result.min_damage
+                    survives = result["max_damage"] < my_final_stats["hp"]
+                    hp_remaining_min = my_final_stats["hp"] - result["max_damage"]
+                    hp_remaining_max = my_final_stats["hp"] - result["min_damage"]
 
                     # Calculate survival after my Life Orb recoil (if I attack back with Extreme Speed, etc.)
                     if my_life_orb_recoil > 0 and survives:
@@ -2078,8 +2053,8 @@ def register_workflow_tools(mcp: FastMCP, pokeapi, smogon, team_manager, analyze
                         survives_count += 1
                 else:
                     # I'm attacking
-                    kos = result.min_percent >= 100
-                    possible_ko = result.max_percent >= 100
+                    kos = result["ko_percent"] >= 100
+                    possible_ko = result["ko_percent"] > 0
                     if kos:
                         ko_count += 1
                         outcome = "Guaranteed OHKO"
@@ -2087,7 +2062,7 @@ def register_workflow_tools(mcp: FastMCP, pokeapi, smogon, team_manager, analyze
                         ko_count += 0.5  # Partial credit for roll
                         outcome = "Possible OHKO (roll)"
                     else:
-                        outcome = f"{result.max_percent:.0f}% max"
+                        outcome = f"{result['max_percent']:.0f}% max"
 
                     # Add Life Orb recoil note for offensive calcs
                     if my_life_orb_recoil > 0:
@@ -2145,6 +2120,11 @@ def register_workflow_tools(mcp: FastMCP, pokeapi, smogon, team_manager, analyze
                 "verdict": verdict,
                 "meta_info": opp_usage.get("_meta", {})
             }
+            # Across the checked sets, weighted by spread usage and damage roll
+            if direction == "from":
+                response_data["usage_weighted_survival_percent"] = sweep.survive_percent
+            else:
+                response_data["usage_weighted_ohko_percent"] = sweep.ko_percent
 
             # Add warnings if any
             if warnings:
@@ -1,32 +1,104 @@
-"""Disk-based caching layer for API responses."""
+"""Disk-based caching layer for API responses.
 
+Large values (PokeAPI payloads, Smogon usage snapshots, usage histories) are
+pickled and compressed before they reach the disk, so both the on-disk cache
+and the warm-start snapshot built from it stay small. Small values are
+stored as before, and entries written before compression was added still
+read back unchanged.
+
+``APICache`` is synchronous. Code running on the event loop goes through
+``AsyncAPICache`` (``get_async_cache``), which keeps disk I/O off the loop.
+"""
+
+import asyncio
+import contextvars
 import hashlib
 import logging
+import lzma
+import pickle
+import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import diskcache
+from diskcache.core import UNKNOWN
+
+from ..config import settings
+from ..metrics import record_cache_blocking, record_cache_lookup, record_cache_read
 
 logger = logging.getLogger(__name__)
 
+# Prefix marking a compressed pickle; the byte after it names the codec
+_MAGIC = b"\x00vgcz"
+CODECS = {
+    "zlib": (b"z", lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (b"x", lzma.compress, lzma.decompress),
+}
+_DECOMPRESS = {tag: decompress for tag, _, decompress in CODECS.values()}
+
+
+class CompressedDisk(diskcache.Disk):
+    """diskcache Disk that compresses large pickled values."""
+
+    def __init__(
+        self,
+        directory,
+        codec: str = "zlib",
+        compress_min_bytes: int = 1024,
+        **kwargs,
+    ):
+        if codec != "none" and codec not in CODECS:
+            raise ValueError(f"Unknown cache codec '{codec}' (use {', '.join(CODECS)} or none)")
+        self.codec = codec
+        self.compress_min_bytes = compress_min_bytes
+        super().__init__(directory, **kwargs)
+
+    def store(self, value, read, key=UNKNOWN):
+        if not read and self.codec != "none" and not isinstance(value, (int, float)):
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(data) >= self.compress_min_bytes:
+                tag, compress, _ = CODECS[self.codec]
+                value = _MAGIC + tag + compress(data)
+        return super().store(value, read, key=key)
+
+    def fetch(self, mode, filename, value, read):
+        data = super().fetch(mode, filename, value, read)
+        if not read and isinstance(data, bytes) and data.startswith(_MAGIC):
+            decompress = _DECOMPRESS[data[len(_MAGIC):len(_MAGIC) + 1]]
+            return pickle.loads(decompress(data[len(_MAGIC) + 1:]))
+        return data
+
 
 class APICache:
     """Disk-based cache with 7-day expiration and hit/miss tracking."""
 
     DEFAULT_EXPIRE = 7 * 24 * 60 * 60  # 7 days in seconds
 
-    def __init__(self, cache_dir: Optional[str] = None):
-        """Initialize cache with optional custom directory."""
+    def __init__(self, cache_dir: Optional[str] = None, codec: Optional[str] = None):
+        """Initialize cache with optional custom directory and compression codec."""
         if cache_dir is None:
-            # Default to data/cache in the project root
-            cache_dir = Path(__file__).parent.parent.parent.parent / "data" / "cache"
+            # Default to data/cache in the project root (VGC_CACHE_DIR to move it)
+            cache_dir = settings.CACHE_DIR
         else:
             cache_dir = Path(cache_dir)
 
         cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache = diskcache.Cache(str(cache_dir))
+        self.directory = cache_dir
+        self.cache = diskcache.Cache(
+            str(cache_dir),
+            disk=CompressedDisk,
+            disk_codec=codec or settings.CACHE_COMPRESSION,
+            disk_compress_min_bytes=settings.CACHE_COMPRESS_MIN_BYTES,
+        )
         self._hits = 0
         self._misses = 0
+        self._blocking_seconds = 0.0
+        self._write_listeners: list[Callable[[Optional[tuple]], None]] = []
 
     def _make_key(self, prefix: str, *args: str) -> str:
         """Create a cache key from prefix and arguments."""
@@ -35,12 +107,11 @@ class APICache:
 
     def get(self, prefix: str, *args: str) -> Optional[Any]:
         """Retrieve from cache if not expired. Tracks hit/miss stats."""
+        start = time.perf_counter()
         key = self._make_key(prefix, *args)
         result = self.cache.get(key)
-        if result is not None:
-            self._hits += 1
-        else:
-            self._misses += 1
+        self.count_lookup(prefix, result is not None)
+        self._track_blocking(prefix, "get", start)
         return result
 
     def set(
@@ -51,17 +122,53 @@ class APICache:
         expire: Optional[int] = None
     ) -> None:
         """Store in cache with expiration."""
+        start = time.perf_counter()
         key = self._make_key(prefix, *args)
         self.cache.set(key, value, expire=expire or self.DEFAULT_EXPIRE)
+        self._notify_write((prefix, *map(str, args)))
+        self._track_blocking(prefix, "set", start)
 
     def delete(self, prefix: str, *args: str) -> None:
         """Remove specific cache entry."""
+        start = time.perf_counter()
         key = self._make_key(prefix, *args)
         self.cache.delete(key)
+        self._notify_write((prefix, *map(str, args)))
+        self._track_blocking(prefix, "delete", start)
+
+    def count_lookup(self, prefix: str, hit: bool) -> None:
+        """Count a lookup served for ``prefix`` (hits/misses and metrics)."""
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+        record_cache_lookup(prefix, hit)
+
+    def on_write(self, listener: Callable[[Optional[tuple]], None]) -> None:
+        """Call ``listener`` with ``(prefix, *args)`` after each set or delete.
+
+        ``clear_all`` calls it with None. Listeners may run on any thread.
+        """
+        self._write_listeners.append(listener)
+
+    def _notify_write(self, key: Optional[tuple]) -> None:
+        for listener in self._write_listeners:
+            listener(key)
+
+    def _track_blocking(self, prefix: str, op: str, start: float) -> None:
+        """Record the call's duration if it ran on (and so blocked) an event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        elapsed = time.perf_counter() - start
+        self._blocking_seconds += elapsed
+        record_cache_blocking(prefix, op, elapsed)
 
     def clear_all(self) -> None:
         """Clear entire cache."""
         self.cache.clear()
+        self._notify_write(None)
 
     @property
     def stats(self) -> dict:
@@ -72,12 +179,14 @@ class APICache:
             "misses": self._misses,
             "total": total,
             "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "0.0%",
+            "loop_blocking_ms": round(self._blocking_seconds * 1000, 3),
         }
 
     def reset_stats(self) -> None:
         """Reset hit/miss counters."""
         self._hits = 0
         self._misses = 0
+        self._blocking_seconds = 0.0
 
     def close(self) -> None:
         """Close the cache. Logs final stats if any lookups occurred."""
@@ -87,6 +196,9 @@ class APICache:
                 "Cache closing — hits: %d, misses: %d, hit rate: %s",
                 self._hits, self._misses, self.stats["hit_rate"]
             )
+        facade = _async_caches.pop(self, None)
+        if facade is not None:
+            facade.close()
         self.cache.close()
 
     def __enter__(self) -> "APICache":
@@ -94,3 +206,244 @@ class APICache:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
+
+
+# Values whose structure has more nodes than this aren't sized for the memory tier
+_MEMORY_MAX_NODES = 512
+
+
+def _is_small(value: Any, max_bytes: int) -> bool:
+    """Cheap check that a JSON-like value is at most about ``max_bytes``.
+
+    Walks at most ``_MEMORY_MAX_NODES`` nodes, so large values are rejected
+    without being traversed.
+    """
+    if isinstance(value, (str, bytes)):
+        return len(value) <= max_bytes
+    size = 0
+    stack = [value]
+    for _ in range(_MEMORY_MAX_NODES):
+        if not stack:
+            return True
+        item = stack.pop()
+        if isinstance(item, (str, bytes)):
+            size += len(item)
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        size += 8
+        if size > max_bytes:
+            return False
+    return not stack
+
+
+class AsyncAPICache:
+    """Event-loop-friendly access to an ``APICache``.
+
+    Disk reads and writes run on a dedicated thread pool, so SQLite's write
+    lock, file reads and decompression never stall other sessions.
+    Concurrent reads of one key share a single disk read (and so, for large
+    values, the same object: treat cached API payloads as read-only, as
+    with the shared Smogon snapshots). Small values read or written recently
+    are kept in memory, pickled so every caller gets its own copy, and
+    served without a thread hop. Time spent on the loop is reported as
+    ``vgc_cache_loop_blocking_seconds``.
+
+    Use ``get_async_cache`` to get the facade shared by everything using a cache.
+    """
+
+    def __init__(
+        self,
+        cache: APICache,
+        max_workers: Optional[int] = None,
+        memory_bytes: Optional[int] = None,
+        entry_max_bytes: Optional[int] = None,
+        memory_ttl: Optional[int] = None,
+    ):
+        self._cache_ref = weakref.ref(cache)
+        self.memory_bytes = settings.CACHE_MEMORY_BYTES if memory_bytes is None else memory_bytes
+        self.entry_max_bytes = (
+            settings.CACHE_MEMORY_ENTRY_BYTES if entry_max_bytes is None else entry_max_bytes
+        )
+        self.memory_ttl = settings.CACHE_MEMORY_TTL if memory_ttl is None else memory_ttl
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or settings.CACHE_IO_THREADS,
+            thread_name_prefix="vgc-cache",
+        )
+        self._lock = threading.Lock()
+        # (prefix, *args) -> (pickled value, expires at); least recently used first
+        self._memory: OrderedDict[tuple, tuple[bytes, float]] = OrderedDict()
+        self._nbytes = 0
+        # Bumped by every write, so a read that raced a write isn't remembered
+        self._generation = 0
+        self._inflight: dict[tuple, Future] = {}
+        self._reads = {"memory": 0, "disk": 0, "coalesced": 0}
+        self._writes = 0
+        self._blocking_seconds = 0.0
+        cache.on_write(self._invalidate)
+
+    @property
+    def cache(self) -> APICache:
+        return self._cache_ref()
+
+    async def get(self, prefix: str, *args: str) -> Optional[Any]:
+        """``APICache.get`` without blocking the loop on disk I/O."""
+        start = time.perf_counter()
+        key = (prefix, *map(str, args))
+        blob = self._remembered(key)
+        if blob is not None:
+            value = pickle.loads(blob)
+            self.cache.count_lookup(prefix, True)
+            self._count_read(prefix, "memory")
+            self._blocked(prefix, "async_get", start)
+            return value
+
+        with self._lock:
+            future = self._inflight.get(key)
+            shared = future is not None
+            if not shared:
+                future = self._inflight[key] = self._submit(self._read, key, self._generation)
+        if not shared:
+            future.add_done_callback(lambda f: self._finish_read(key, f))
+        self._blocked(prefix, "async_get", start)
+
+        value, blob = await asyncio.wrap_future(future)
+        if not shared:
+            self._count_read(prefix, "disk")
+            return value
+
+        self.cache.count_lookup(prefix, value is not None)
+        self._count_read(prefix, "coalesced")
+        return pickle.loads(blob) if blob is not None else value
+
+    async def set(
+        self,
+        prefix: str,
+        *args: str,
+        value: Any,
+        expire: Optional[int] = None,
+    ) -> None:
+        """``APICache.set`` on the cache's I/O threads."""
+        start = time.perf_counter()
+        key = (prefix, *map(str, args))
+        self._writes += 1
+        future = self._submit(self._write, key, value, expire)
+        self._blocked(prefix, "async_set", start)
+        await asyncio.wrap_future(future)
+
+    async def delete(self, prefix: str, *args: str) -> None:
+        """``APICache.delete`` on the cache's I/O threads."""
+        self._writes += 1
+        await self.run(self.cache.delete, prefix, *args)
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        """Run ``fn(*args)`` on the cache's I/O threads (e.g. a batch of writes)."""
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def _submit(self, fn: Callable, *args: Any) -> Future:
+        # Carry the caller's context so lookups count against its tool call
+        return self._executor.submit(contextvars.copy_context().run, fn, *args)
+
+    def _read(self, key: tuple, generation: int) -> tuple[Any, Optional[bytes]]:
+        value = self.cache.get(*key)
+        blob = self._pickle_small(value)
+        if blob is not None:
+            self._remember(key, blob, generation, self.memory_ttl)
+        return value, blob
+
+    def _finish_read(self, key: tuple, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _write(self, key: tuple, value: Any, expire: Optional[int]) -> None:
+        self.cache.set(*key, value=value, expire=expire)
+        blob = self._pickle_small(value)
+        if blob is not None:
+            with self._lock:
+                generation = self._generation
+            self._remember(key, blob, generation, min(self.memory_ttl, expire or self.memory_ttl))
+
+    def _pickle_small(self, value: Any) -> Optional[bytes]:
+        """Pickled ``value`` if it's small enough to keep in memory."""
+        if value is None or not _is_small(value, self.entry_max_bytes):
+            return None
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return blob if len(blob) <= self.entry_max_bytes else None
+
+    def _remembered(self, key: tuple) -> Optional[bytes]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            blob, expires_at = entry
+            if expires_at < time.monotonic():
+                self._forget(key)
+                return None
+            self._memory.move_to_end(key)
+            return blob
+
+    def _remember(self, key: tuple, blob: bytes, generation: int, ttl: float) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._forget(key)
+            self._memory[key] = (blob, time.monotonic() + ttl)
+            self._nbytes += len(blob)
+            while self._nbytes > self.memory_bytes:
+                _, (evicted, _) = self._memory.popitem(last=False)
+                self._nbytes -= len(evicted)
+
+    def _forget(self, key: tuple) -> None:
+        """Drop ``key`` from memory (hold the lock)."""
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._nbytes -= len(entry[0])
+
+    def _invalidate(self, key: Optional[tuple]) -> None:
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._memory.clear()
+                self._nbytes = 0
+            else:
+                self._forget(key)
+
+    def _count_read(self, prefix: str, source: str) -> None:
+        self._reads[source] += 1
+        record_cache_read(prefix, source)
+
+    def _blocked(self, prefix: str, op: str, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        self._blocking_seconds += elapsed
+        record_cache_blocking(prefix, op, elapsed)
+
+    @property
+    def stats(self) -> dict:
+        """Reads by source, writes, memory use and time spent on the loop."""
+        return {
+            "reads": dict(self._reads),
+            "writes": self._writes,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._nbytes,
+            "loop_blocking_ms": round(self._blocking_seconds * 1000, 3),
+        }
+
+    def close(self) -> None:
+        """Finish pending I/O and stop the threads."""
+        self._executor.shutdown(wait=True)
+
+
+_async_caches: "weakref.WeakKeyDictionary[APICache, AsyncAPICache]" = weakref.WeakKeyDictionary()
+_async_caches_lock = threading.Lock()
+
+
+def get_async_cache(cache: APICache) -> AsyncAPICache:
+    """The async facade shared by everything using ``cache``."""
+    with _async_caches_lock:
+        facade = _async_caches.get(cache)
+        if facade is None:
+            facade = _async_caches[cache] = AsyncAPICache(cache)
+        return facade
@@ -0,0 +1,210 @@
+"""Streaming parser for Smogon chaos JSON.
+
+Chaos files run to tens of megabytes, most of it sections no tool reads
+("Checks and Counters", "Happiness", ...). ChaosStreamParser is fed the
+response body chunk by chunk, decodes one species object at a time and keeps
+only the fields the tools use, so neither the raw text nor the full decoded
+file is ever held in memory: the buffer is bounded by the largest single
+species entry.
+"""
+
+import codecs
+import json
+from typing import Any, Optional
+
+# Per-species fields kept from chaos data; everything else is dropped on parse
+KEEP_FIELDS = (
+    "usage",
+    "Raw count",
+    "Abilities",
+    "Items",
+    "Moves",
+    "Spreads",
+    "Teammates",
+    "Tera Types",
+)
+
+# Bytes requested per read from the response stream
+CHUNK_SIZE = 64 * 1024
+
+# A single undecodable value larger than this means the file is malformed
+MAX_PENDING_CHARS = 16 * 1024 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _NeedMoreError(Exception):
+    """The buffer ends before the next token does."""
+
+
+def compact_species(entry: dict) -> dict:
+    """Keep only KEEP_FIELDS from one species' chaos entry."""
+    return {key: entry[key] for key in KEEP_FIELDS if key in entry}
+
+
+class ChaosStreamParser:
+    """Incremental chaos JSON parser producing compact per-species records.
+
+    Usage::
+
+        parser = ChaosStreamParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+        data = parser.close()  # {"info": {...}, "data": {species: record}}
+
+    Raises ValueError (like ``json.loads``) for malformed or truncated input.
+    """
+
+    def __init__(self) -> None:
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._final = False
+        # Top level: "open" -> "key" <-> "sep" -> "done"; inside "data" the
+        # same cycle runs as "species_open" -> "species_key" <-> "species_sep"
+        self._state = "open"
+        self.info: dict = {}
+        self.species: dict[str, dict] = {}
+        # Pending text length before decoding is retried after running short,
+        # so small chunks don't re-decode a large species entry every feed
+        self._retry_at = 0
+        # Largest buffer held at once, in characters (for diagnostics/tests)
+        self.peak_buffered = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the response body."""
+        self._buffer += self._utf8.decode(chunk)
+        pending = len(self._buffer) - self._pos
+        self.peak_buffered = max(self.peak_buffered, pending)
+        if pending >= self._retry_at:
+            self._advance()
+
+    def close(self) -> dict:
+        """Finish parsing and return ``{"info": ..., "data": ...}``."""
+        self._buffer += self._utf8.decode(b"", final=True)
+        self._final = True
+        self._advance()
+        if self._state != "done":
+            raise ValueError("Truncated chaos JSON")
+        self._skip_ws()
+        if self._pos < len(self._buffer):
+            raise ValueError("Extra data after chaos JSON")
+        return {"info": self.info, "data": self.species}
+
+    # ------------------------------------------------------------------
+    # Tokenizing
+    # ------------------------------------------------------------------
+
+    def _skip_ws(self) -> None:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+
+    def _peek(self) -> str:
+        self._skip_ws()
+        if self._pos >= len(self._buffer):
+            raise _NeedMoreError
+        return self._buffer[self._pos]
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} at char {self._pos} of chaos JSON")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decode one complete JSON value at the cursor."""
+        self._peek()
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            if len(self._buffer) - self._pos > MAX_PENDING_CHARS:
+                raise ValueError("Chaos JSON value exceeds the streaming buffer limit")
+            raise _NeedMoreError
+        # A number at the very end of the buffer may continue in the next chunk
+        if end >= len(self._buffer) and not self._final:
+            raise _NeedMoreError
+        self._pos = end
+        return value
+
+    def _key(self) -> str:
+        if self._peek() != '"':
+            raise ValueError(f"Expected a key at char {self._pos} of chaos JSON")
+        key = self._value()
+        self._expect(":")
+        return key
+
+    def _advance(self) -> None:
+        """Consume as many tokens as the buffer holds."""
+        while self._state != "done":
+            checkpoint = self._pos
+            try:
+                self._step()
+            except _NeedMoreError:
+                # Rewind to the last token boundary and wait for more input
+                self._pos = checkpoint
+                self._retry_at = 2 * (len(self._buffer) - checkpoint)
+                break
+        # Drop consumed text once it dominates the buffer
+        if self._pos > len(self._buffer) // 2:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+
+    def _step(self) -> None:
+        state = self._state
+        if state == "open":
+            self._expect("{")
+            self._state = "key"
+        elif state == "key":
+            if self._peek() == "}":
+                self._pos += 1
+                self._state = "done"
+                return
+            key = self._key()
+            if key == "data":
+                self._state = "species_open"
+                return
+            value = self._value()
+            if key == "info" and isinstance(value, dict):
+                self.info = value
+            self._state = "sep"
+        elif state == "sep":
+            self._separator("key", "done")
+        elif state == "species_open":
+            self._expect("{")
+            self._state = "species_key"
+        elif state == "species_key":
+            if self._peek() == "}":
+                self._pos += 1
+                self._state = "sep"
+                return
+            name = self._key()
+            entry = self._value()
+            if isinstance(entry, dict):
+                self.species[name] = compact_species(entry)
+            self._state = "species_sep"
+        elif state == "species_sep":
+            self._separator("species_key", "sep")
+
+    def _separator(self, next_item: str, closed: str) -> None:
+        char = self._peek()
+        self._pos += 1
+        if char == ",":
+            self._state = next_item
+        elif char == "}":
+            self._state = closed
+        else:
+            raise ValueError(f"Expected ',' or '}}' at char {self._pos - 1} of chaos JSON")
+
+
+def parse_chaos(text: str | bytes, chunk_size: Optional[int] = None) -> dict:
+    """Parse a complete chaos document into compact records (tests/fixtures)."""
+    raw = text.encode() if isinstance(text, str) else text
+    parser = ChaosStreamParser()
+    step = chunk_size or len(raw) or 1
+    for start in range(0, len(raw), step):
+        parser.feed(raw[start:start + step])
+    return parser.close()
@@ -6,9 +6,13 @@ from typing import Optional
 import httpx
 
 from ..config import settings, logger
+from ..metrics import record_fetch
 from ..models.pokemon import BaseStats
 from ..models.move import Move, MoveCategory, SPREAD_TARGETS, get_multi_hit_info, is_always_crit_move, get_move_type_for_user, MOVE_SECONDARY_EFFECTS
-from .cache import APICache
+from ..utils.fuzzy import format_suggestions
+from ..utils.name_index import NameResolver, get_name_resolver
+from .cache import APICache, get_async_cache
+from .transport import RetriesExhaustedError, get_transport
 
 
 # Map base form names to PokeAPI's explicit form naming
@@ -39,6 +43,50 @@ POKEAPI_FORM_ALIASES = {
     "ogerpon-hearthflame": "ogerpon-hearthflame-mask",
     "ogerpon-cornerstone": "ogerpon-cornerstone-mask",
     "ogerpon-teal": "ogerpon-teal-mask",
+
+    # Species whose default form has an explicit suffix in PokeAPI
+    "giratina": "giratina-altered",
+    "shaymin": "shaymin-land",
+    "deoxys": "deoxys-normal",
+    "keldeo": "keldeo-ordinary",
+    "meloetta": "meloetta-aria",
+    "aegislash": "aegislash-shield",
+    "lycanroc": "lycanroc-midday",
+    "mimikyu": "mimikyu-disguised",
+    "toxtricity": "toxtricity-amped",
+    "eiscue": "eiscue-ice",
+    "morpeko": "morpeko-full-belly",
+    "palafin": "palafin-zero",
+    "tatsugiri": "tatsugiri-curly",
+    "dudunsparce": "dudunsparce-two-segment",
+    "maushold": "maushold-family-of-four",
+    "oinkologne": "oinkologne-male",
+    "squawkabilly": "squawkabilly-green-plumage",
+    "basculin": "basculin-red-striped",
+    "darmanitan": "darmanitan-standard",
+    "darmanitan-galar": "darmanitan-galar-standard",
+    "wishiwashi": "wishiwashi-solo",
+    "minior": "minior-red-meteor",
+    "oricorio": "oricorio-baile",
+    "pumpkaboo": "pumpkaboo-average",
+    "gourgeist": "gourgeist-average",
+    "zygarde": "zygarde-50",
+
+    # Showdown/Smogon form spellings that differ from PokeAPI
+    "basculegion-f": "basculegion-female",
+    "oinkologne-f": "oinkologne-female",
+    "maushold-four": "maushold-family-of-four",
+    "tauros-paldea-combat": "tauros-paldea-combat-breed",
+    "tauros-paldea-blaze": "tauros-paldea-blaze-breed",
+    "tauros-paldea-aqua": "tauros-paldea-aqua-breed",
+}
+
+# PokeAPI list endpoint backing each name-index kind
+NAME_INDEX_ENDPOINTS = {
+    "pokemon": "pokemon",
+    "move": "move",
+    "ability": "ability",
+    "item": "item",
 }
 
 
@@ -50,20 +98,19 @@ class PokeAPIError(Exception):
 class PokeAPIClient:
     """Async client for PokeAPI v2 with connection pooling and retries."""
 
-    def __init__(self, cache: Optional[APICache] = None):
-        """Initialize client with optional cache."""
+    def __init__(self, cache: Optional[APICache] = None, names: Optional[NameResolver] = None):
+        """Initialize client with optional cache and name resolver."""
         self.cache = cache or APICache()
+        self.async_cache = get_async_cache(self.cache)
+        self.names = names or get_name_resolver()
         self._client: Optional[httpx.AsyncClient] = None
+        self._index_task: Optional[asyncio.Task] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with connection pooling."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(settings.API_TIMEOUT_SECONDS),
-                headers={"User-Agent": "VGC-MCP-Server/0.1.0"},
-                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
-            )
-        return self._client
+        """HTTP client: one set on ``_client``, otherwise the shared pool."""
+        if self._client is not None and not self._client.is_closed:
+            return self._client
+        return await get_transport().client()
 
     def _normalize_name(self, name: str, apply_form_aliases: bool = True) -> str:
         """Normalize Pokemon/move names for API.
@@ -84,48 +131,102 @@ class PokeAPIClient:
             normalized = POKEAPI_FORM_ALIASES.get(normalized, normalized)
         return normalized
 
+    def _resolve(self, kind: str, name_or_id: str | int) -> str:
+        """Resolve any Showdown/Smogon/PokeAPI spelling to the PokeAPI name.
+
+        Once the full list for ``kind`` is loaded, unknown names raise
+        PokeAPIError with "did you mean" suggestions instead of costing a
+        request that would 404.
+        """
+        text = str(name_or_id)
+        if text.isdigit():
+            return text
+        name = self._normalize_name(text, apply_form_aliases=kind == "pokemon")
+        resolved = self.names.resolve(kind, name)
+        if resolved is not None:
+            return resolved
+        if self.names.is_complete(kind):
+            hint = format_suggestions(self.names.suggest(kind, text))
+            message = f"Not found: {kind}/{name}"
+            raise PokeAPIError(f"{message}. {hint}" if hint else message)
+        return name
+
+    async def load_name_index(self) -> dict[str, int]:
+        """Load the full PokeAPI name lists into the name resolver.
+
+        One (disk-cached) list request per kind. Kinds that fail stay on the
+        seed lists and keep passing unknown names through to the API.
+
+        Returns:
+            Number of names indexed per kind that loaded
+        """
+        async def load(kind: str, endpoint: str) -> int:
+            data = await self._fetch(f"{endpoint}?limit=100000")
+            return self.names.load(kind, (entry["name"] for entry in data["results"]))
+
+        kinds = list(NAME_INDEX_ENDPOINTS)
+        results = await asyncio.gather(
+            *(load(kind, NAME_INDEX_ENDPOINTS[kind]) for kind in kinds),
+            return_exceptions=True,
+        )
+        loaded = {}
+        for kind, result in zip(kinds, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Name index: failed to load {kind} list: {result!r}")
+            else:
+                loaded[kind] = result
+        logger.info(f"Name index loaded: {loaded}")
+        return loaded
+
+    def start_name_index_load(self) -> asyncio.Task:
+        """Load the name index in the background; retried if a kind failed."""
+        task = self._index_task
+        if task is None or (task.done() and not self.names.is_complete()):
+            self._index_task = asyncio.create_task(self.load_name_index())
+        return self._index_task
+
     async def _fetch(self, endpoint: str) -> dict:
         """Fetch from API with caching and retry logic."""
         # Check cache first
-        cached = self.cache.get("pokeapi", endpoint)
+        cached = await self.async_cache.get("pokeapi", endpoint)
         if cached is not None:
             return cached
 
-        # Fetch from API with retries
-        client = await self._get_client()
-        last_error: Optional[Exception] = None
+        # Concurrent misses for the same endpoint share one download
+        url = f"{settings.POKEAPI_BASE_URL}/{endpoint}"
+        return await get_transport().single_flight(url, lambda: self._download(endpoint, url))
 
-        for attempt in range(settings.API_MAX_RETRIES):
-            try:
-                response = await client.get(f"{settings.POKEAPI_BASE_URL}/{endpoint}")
-                response.raise_for_status()
-                data = response.json()
-                self.cache.set("pokeapi", endpoint, value=data)
-                return data
+    async def _download(self, endpoint: str, url: str) -> dict:
+        """GET an endpoint with budgeted retries and cache the result."""
 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    raise PokeAPIError(f"Not found: {endpoint}") from e
-                last_error = e
-                logger.warning(f"PokeAPI request failed (attempt {attempt + 1}): {e}")
+        async def attempt() -> dict:
+            client = await self._get_client()
+            record_fetch("pokeapi")
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.json()
 
-            except httpx.RequestError as e:
-                last_error = e
-                logger.warning(f"PokeAPI connection error (attempt {attempt + 1}): {e}")
-
-            if attempt < settings.API_MAX_RETRIES - 1:
-                await asyncio.sleep(settings.API_RETRY_DELAY * (attempt + 1))
-
-        raise PokeAPIError(f"Failed after {settings.API_MAX_RETRIES} attempts: {last_error}")
+        try:
+            data = await get_transport().call(url, attempt)
+        except RetriesExhaustedError as e:
+            raise PokeAPIError(str(e)) from e.last_error
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise PokeAPIError(f"Not found: {endpoint}") from e
+            raise PokeAPIError(f"Request failed: {e}") from e
+        await self.async_cache.set("pokeapi", endpoint, value=data)
+        return data
 
     async def get_pokemon(self, name_or_id: str | int) -> dict:
         """Get Pokemon data including base stats, types, abilities."""
-        name = self._normalize_name(str(name_or_id))
+        name = self._resolve("pokemon", name_or_id)
         return await self._fetch(f"pokemon/{name}")
 
     async def get_pokemon_species(self, name_or_id: str | int) -> dict:
         """Get Pokemon species data (for species clause)."""
-        name = self._normalize_name(str(name_or_id))
+        # Species are named after the base species ("giratina", not
+        # "giratina-altered"), so form aliases would only cost a 404
+        name = self._normalize_name(str(name_or_id), apply_form_aliases=False)
         try:
             return await self._fetch(f"pokemon-species/{name}")
         except PokeAPIError:
@@ -177,7 +278,7 @@ class PokeAPIClient:
             user_name: Optional Pokemon name using the move. Used for form-dependent
                        move types like Ivy Cudgel (changes type based on Ogerpon form).
         """
-        name = self._normalize_name(str(name_or_id), apply_form_aliases=False)
+        name = self._resolve("move", name_or_id)
         data = await self._fetch(f"move/{name}")
 
         target = data.get("target", {}).get("name", "selected-pokemon")
@@ -232,6 +333,11 @@ class PokeAPIClient:
             always_crit=always_crit
         )
 
+    async def get_move_data(self, name_or_id: str | int) -> dict:
+        """Get raw move data (including ``learned_by_pokemon``)."""
+        name = self._resolve("move", name_or_id)
+        return await self._fetch(f"move/{name}")
+
     async def get_type(self, name: str) -> dict:
         """Get type data including damage relations."""
         name = self._normalize_name(name, apply_form_aliases=False)
@@ -239,16 +345,18 @@ class PokeAPIClient:
 
     async def get_ability(self, name_or_id: str | int) -> dict:
         """Get ability data."""
-        name = self._normalize_name(str(name_or_id), apply_form_aliases=False)
+        name = self._resolve("ability", name_or_id)
         return await self._fetch(f"ability/{name}")
 
     async def get_item(self, name_or_id: str | int) -> dict:
         """Get item data."""
-        name = self._normalize_name(str(name_or_id), apply_form_aliases=False)
+        name = self._resolve("item", name_or_id)
         return await self._fetch(f"item/{name}")
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Stop background work and close ``_client`` (the shared pool stays open)."""
+        if self._index_task is not None and not self._index_task.done():
+            self._index_task.cancel()
         if self._client:
             await self._client.aclose()
             self._client = None
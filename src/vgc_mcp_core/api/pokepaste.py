@@ -5,8 +5,10 @@ from typing import Optional
 
 import httpx
 
-from .cache import APICache
+from .cache import APICache, get_async_cache
+from .transport import RetriesExhaustedError, get_transport
 from ..config import settings, logger
+from ..metrics import record_fetch
 
 
 class PokePasteError(Exception):
@@ -26,18 +28,14 @@ class PokePasteClient:
     def __init__(self, cache: Optional[APICache] = None):
         """Initialize client with optional cache."""
         self.cache = cache or APICache()
+        self.async_cache = get_async_cache(self.cache)
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with connection pooling."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(settings.API_TIMEOUT_SECONDS),
-                headers={"User-Agent": "VGC-MCP-Server/0.1.0"},
-                follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-            )
-        return self._client
+        """HTTP client: one set on ``_client``, otherwise the shared pool."""
+        if self._client is not None and not self._client.is_closed:
+            return self._client
+        return await get_transport().client()
 
     def extract_paste_id(self, url_or_id: str) -> Optional[str]:
         """Extract paste ID from a URL or return the ID if already bare.
@@ -75,34 +73,41 @@ class PokePasteClient:
         """
         # Check cache first
         cache_key = f"paste/{paste_id}"
-        cached = self.cache.get("pokepaste", cache_key)
+        cached = await self.async_cache.get("pokepaste", cache_key)
         if cached is not None:
             return cached
 
-        client = await self._get_client()
         url = f"{settings.POKEPASTE_BASE_URL}/{paste_id}/raw"
+        return await get_transport().single_flight(
+            url, lambda: self._download(paste_id, cache_key, url)
+        )
 
-        try:
-            response = await client.get(url)
-
-            if response.status_code == 404:
-                raise PokePasteError(f"Paste not found: {paste_id}")
+    async def _download(self, paste_id: str, cache_key: str, url: str) -> str:
+        """GET a raw paste with budgeted retries and cache it."""
 
+        async def attempt() -> str:
+            client = await self._get_client()
+            record_fetch("pokepaste")
+            response = await client.get(url)
             response.raise_for_status()
-            content = response.text
-
-            # Cache the result
-            self.cache.set("pokepaste", cache_key, value=content)
-            logger.debug(f"Fetched PokePaste: {paste_id}")
-
-            return content
+            return response.text
 
+        try:
+            content = await get_transport().call(url, attempt)
         except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise PokePasteError(f"Paste not found: {paste_id}")
             logger.warning(f"PokePaste HTTP error for {paste_id}: {e}")
             raise PokePasteError(f"HTTP error fetching paste: {e}")
-        except httpx.RequestError as e:
-            logger.warning(f"PokePaste network error for {paste_id}: {e}")
-            raise PokePasteError(f"Network error fetching paste: {e}")
+        except RetriesExhaustedError as e:
+            kind = "HTTP" if isinstance(e.last_error, httpx.HTTPStatusError) else "Network"
+            logger.warning(f"PokePaste {kind.lower()} error for {paste_id}: {e.last_error}")
+            raise PokePasteError(f"{kind} error fetching paste: {e.last_error}")
+
+        # Cache the result
+        await self.async_cache.set("pokepaste", cache_key, value=content)
+        logger.debug(f"Fetched PokePaste: {paste_id}")
+        return content
 
     async def get_paste(self, url_or_id: str) -> str:
         """Fetch paste content from a URL or paste ID.
@@ -131,7 +136,7 @@ class PokePasteClient:
         return await self.get_paste_raw(paste_id)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close ``_client`` if one was set (the shared pool stays open)."""
         if self._client:
             await self._client.aclose()
             self._client = None
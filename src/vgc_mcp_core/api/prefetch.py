@@ -0,0 +1,110 @@
+"""Background prefetch of Smogon usage stats.
+
+Keeps the current regulation's format x rating snapshots warm so tool calls
+are served from memory/disk and never wait on a chaos JSON download. Past
+regulations still load on demand but aren't pinned in memory. Refreshes are
+conditional GETs, so an unchanged month costs one 304 per combination.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from ..config import logger, settings
+from .smogon import SmogonStatsClient
+
+
+class UsageStatsPrefetcher:
+    """Periodically refresh usage stats for the current regulation's formats."""
+
+    def __init__(
+        self,
+        client: SmogonStatsClient,
+        interval_seconds: Optional[float] = None,
+        formats: Optional[list[str]] = None,
+        ratings: Optional[list[int]] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.client = client
+        self.interval_seconds = (
+            interval_seconds if interval_seconds is not None
+            else settings.SMOGON_REFRESH_INTERVAL_HOURS * 3600
+        )
+        self._formats = formats
+        self._ratings = ratings
+        self.concurrency = concurrency or settings.SMOGON_PREFETCH_CONCURRENCY
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Optional[dict] = None
+
+    def combos(self) -> list[tuple[str, int]]:
+        """Format/rating pairs to keep warm (formats re-read from the regulation config)."""
+        formats = self._formats or self.client.regulation_config.get_smogon_formats()
+        ratings = self._ratings or self.client.RATING_CUTOFFS
+        return [(fmt, rating) for fmt in formats for rating in ratings]
+
+    async def refresh_all(self) -> dict:
+        """Refresh every combination once.
+
+        Returns:
+            Summary with the combinations that have data, those with none
+            published, and any that raised.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        start = time.monotonic()
+
+        async def refresh(fmt: str, rating: int):
+            async with semaphore:
+                return await self.client.refresh_usage_stats(fmt, rating)
+
+        combos = self.combos()
+        self.client.keep_snapshots(len(combos))
+        results = await asyncio.gather(
+            *(refresh(fmt, rating) for fmt, rating in combos), return_exceptions=True
+        )
+
+        summary = {"available": {}, "missing": [], "errors": []}
+        for (fmt, rating), result in zip(combos, results):
+            label = f"{fmt}/{rating}"
+            if isinstance(result, BaseException):
+                logger.warning(f"Usage prefetch failed for {label}: {result!r}")
+                summary["errors"].append(label)
+            elif result is None:
+                summary["missing"].append(label)
+            else:
+                summary["available"][label] = result.month
+        summary["seconds"] = round(time.monotonic() - start, 3)
+        self.last_run = summary
+        logger.info(
+            f"Usage prefetch: {len(summary['available'])} available, "
+            f"{len(summary['missing'])} missing, {len(summary['errors'])} errors "
+            f"in {summary['seconds']}s"
+        )
+        return summary
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop (no-op if already running)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the refresh loop and wait for it to exit."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh_all()
+            except Exception as e:
+                logger.warning(f"Usage prefetch cycle failed: {e!r}")
+            await asyncio.sleep(self.interval_seconds)
@@ -1,12 +1,20 @@
 """Smogon usage stats client with caching and retry logic."""
 
-from datetime import datetime, timedelta
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional
 
 import httpx
 
-from .cache import APICache
+from .cache import APICache, get_async_cache
+from .chaos_stream import CHUNK_SIZE, ChaosStreamParser
+from .transport import get_transport
+from .usage_history import UsageHistory, month_window, shift_month
 from ..config import settings, logger
+from ..metrics import record_fetch
 from ..rules.regulation_loader import get_regulation_config, RegulationConfig
 
 
@@ -34,11 +42,116 @@ FORM_ALIASES = {
 }
 
 
+def parse_spread(spread_str: str) -> dict:
+    """Parse spread string like 'Modest:252/0/4/252/0/0' into structured data."""
+    try:
+        nature, evs = spread_str.split(":")
+        hp, atk, def_, spa, spd, spe = map(int, evs.split("/"))
+        return {
+            "nature": nature,
+            "evs": {
+                "hp": hp,
+                "attack": atk,
+                "defense": def_,
+                "special_attack": spa,
+                "special_defense": spd,
+                "speed": spe
+            },
+            "spread_string": spread_str
+        }
+    except Exception:
+        return {"raw": spread_str}
+
+
+def usage_spreads(spreads: dict) -> list[dict]:
+    """Parsed chaos spreads with at least 1% share, most used first.
+
+    Each carries its share as ``usage`` (percent, one decimal).
+    """
+    spread_total = sum(spreads.values()) or 1
+    processed = []
+    for spread_str, weight in sorted(spreads.items(), key=lambda x: -x[1]):
+        pct = weight / spread_total
+        if pct < 0.01:
+            continue
+        parsed = parse_spread(spread_str)
+        parsed["usage"] = round(pct * 100, 1)
+        processed.append(parsed)
+    return processed
+
+
 class SmogonStatsError(Exception):
     """Error fetching Smogon stats."""
     pass
 
 
+def _normalize_species_key(name: str) -> str:
+    return name.lower().replace(" ", "").replace("-", "")
+
+
+@dataclass
+class UsageSnapshot:
+    """Latest chaos stats for one format/rating plus derived lookup indexes."""
+    format_name: str
+    rating: int
+    month: str
+    data: dict
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # normalized species name -> key in data["data"]
+    name_index: dict[str, str] = field(default_factory=dict)
+    # species keys sorted by usage, highest first
+    ranking: list[str] = field(default_factory=list)
+
+    @classmethod
+    def build(
+        cls,
+        data: dict,
+        format_name: str,
+        rating: int,
+        month: str,
+        fetched_at: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> "UsageSnapshot":
+        """Wrap raw chaos data and build its indexes (CPU-bound; run off the loop)."""
+        species = data.get("data", {})
+        return cls(
+            format_name=format_name,
+            rating=rating,
+            month=month,
+            data=data,
+            fetched_at=time.time() if fetched_at is None else fetched_at,
+            etag=etag,
+            last_modified=last_modified,
+            name_index={_normalize_species_key(name): name for name in species},
+            ranking=sorted(species, key=lambda n: -species[n].get("usage", 0)),
+        )
+
+    @property
+    def pointer(self) -> dict:
+        """Small record persisted alongside the data to find it again after a restart."""
+        return {
+            "month": self.month,
+            "fetched_at": self.fetched_at,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def lookup(self, pokemon_name: str) -> Optional[str]:
+        """Key in data["data"] for a Pokemon name in any spelling, or None."""
+        return self.name_index.get(_normalize_species_key(pokemon_name))
+
+
+# Sentinels for _download_snapshot outcomes other than a new snapshot
+_NOT_MODIFIED = object()
+_FAILED = object()
+
+
 class SmogonStatsClient:
     """Client for Smogon usage stats (chaos JSON format)."""
 
@@ -49,6 +162,7 @@ class SmogonStatsClient:
     ):
         """Initialize client with optional cache and regulation config."""
         self.cache = cache or APICache()
+        self.async_cache = get_async_cache(self.cache)
         self._regulation_config = regulation_config
         self._client: Optional[httpx.AsyncClient] = None
         self._current_format: Optional[str] = None
@@ -57,6 +171,15 @@ class SmogonStatsClient:
         self._session_first_month: Optional[str] = None
         self._data_upgraded: bool = False
         self._upgrade_notice: Optional[str] = None
+        # Stale-while-revalidate state, keyed by (format, rating)
+        self._snapshots: OrderedDict[tuple[str, int], UsageSnapshot] = OrderedDict()
+        self.snapshot_capacity = settings.SMOGON_SNAPSHOT_CACHE_SIZE
+        self._pointers: dict[tuple[str, int], Optional[dict]] = {}
+        self._absent: dict[tuple[str, int], float] = {}
+        self._refreshing: dict[tuple[str, int], asyncio.Task] = {}
+        # Multi-month time series, keyed by (format, rating)
+        self._histories: dict[tuple[str, int], UsageHistory] = {}
+        self._history_locks: dict[tuple[str, int], asyncio.Lock] = {}
 
     @property
     def regulation_config(self) -> RegulationConfig:
@@ -101,15 +224,10 @@ class SmogonStatsClient:
         return None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with connection pooling."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(settings.API_TIMEOUT_SECONDS),
-                headers={"User-Agent": "VGC-MCP-Server/0.1.0"},
-                follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-            )
-        return self._client
+        """HTTP client: one set on ``_client``, otherwise the shared pool."""
+        if self._client is not None and not self._client.is_closed:
+            return self._client
+        return await get_transport().client()
 
     def _get_recent_months(self, count: int = 4) -> list[str]:
         """Get list of recent months in YYYY-MM format.
@@ -118,14 +236,10 @@ class SmogonStatsClient:
         So on Jan 1, December stats likely aren't available yet.
         We try current month -1, -2, -3, etc. to find latest available.
         """
-        months = []
-        now = datetime.now()
         # Start from previous month (current month stats won't exist yet)
-        # and go back several months to ensure we find available data
-        for i in range(1, count + 1):
-            date = now - timedelta(days=30 * i)
-            months.append(date.strftime("%Y-%m"))
-        return months
+        # and go back several calendar months to ensure we find available data
+        this_month = datetime.now().strftime("%Y-%m")
+        return [shift_month(this_month, -i) for i in range(1, count + 1)]
 
     async def _try_fetch_stats(
         self,
@@ -135,27 +249,347 @@ class SmogonStatsClient:
     ) -> Optional[dict]:
         """Try to fetch stats for a specific month/format/rating combination."""
         cache_key = f"{month}/{format_name}/{rating}"
-        cached = self.cache.get("smogon", cache_key)
+        cached = await self.async_cache.get("smogon", cache_key)
         if cached is not None:
             return cached
 
+        data = await self._fetch_month(month, format_name, rating)
+        if data is None or data is _FAILED:
+            logger.debug(f"Smogon stats not found: {month}/{format_name}/{rating}")
+            return None
+        await self.async_cache.set("smogon", cache_key, value=data)
+        logger.debug(f"Fetched Smogon stats: {month}/{format_name}/{rating}")
+        return data
+
+    async def _fetch_month(self, month: str, format_name: str, rating: int):
+        """GET one chaos file without touching the cache.
+
+        Returns the parsed data, None for 404, or ``_FAILED`` for
+        network/server errors.
+        """
+        url = f"{settings.SMOGON_STATS_BASE_URL}/{month}/chaos/{format_name}-{rating}.json"
+        # Sessions missing the same month share one download
+        return await get_transport().single_flight(url, lambda: self._download_month(url))
+
+    async def _download_month(self, url: str):
+        """Stream one chaos file; results as for ``_fetch_month``."""
+        try:
+            record_fetch("smogon")
+            status, _, data = await self._stream_chaos(url)
+        except httpx.RequestError as e:
+            logger.warning(f"Smogon request error for {url}: {e}")
+            return _FAILED
+        except ValueError as e:
+            logger.warning(f"Invalid Smogon JSON for {url}: {e}")
+            return _FAILED
+        if status == 404:
+            return None
+        if status != 200:
+            logger.warning(f"Smogon returned {status} for {url}")
+            return _FAILED
+        return data
+
+    async def _stream_chaos(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+    ) -> tuple[int, httpx.Headers, Optional[dict]]:
+        """GET a chaos file, parsing the body as it arrives.
+
+        Returns (status, response headers, compact data); data is None for
+        any status but 200. httpx negotiates gzip and decompresses per
+        chunk, and ChaosStreamParser keeps only the fields the tools read, so
+        neither the raw file nor its full decoded form is held in memory.
+        Raises httpx.RequestError for transport errors and ValueError for
+        malformed JSON.
+        """
         client = await self._get_client()
+        await get_transport().throttle(url)
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code != 200:
+                return response.status_code, response.headers, None
+            parser = ChaosStreamParser()
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                await asyncio.to_thread(parser.feed, chunk)
+            data = await asyncio.to_thread(parser.close)
+            return 200, response.headers, data
+
+    # ------------------------------------------------------------------
+    # Stale-while-revalidate snapshots
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_stale(fetched_at: float) -> bool:
+        return time.time() - fetched_at > settings.SMOGON_REFRESH_INTERVAL_HOURS * 3600
+
+    async def _get_pointer(self, format_name: str, rating: int) -> Optional[dict]:
+        """Which month is latest for a format/rating, as last recorded on disk."""
+        key = (format_name, rating)
+        if key not in self._pointers:
+            self._pointers[key] = await self.async_cache.get(
+                "smogon", f"latest/{format_name}/{rating}"
+            )
+        return self._pointers[key]
+
+    def _remember(self, snapshot: UsageSnapshot) -> None:
+        key = (snapshot.format_name, snapshot.rating)
+        self._snapshots[key] = snapshot
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > self.snapshot_capacity:
+            self._snapshots.popitem(last=False)
+        self._pointers[key] = snapshot.pointer
+        self._absent.pop(key, None)
+
+    def keep_snapshots(self, count: int) -> None:
+        """Hold at least ``count`` parsed snapshots in memory.
+
+        The prefetcher calls this with its number of combinations, so the
+        snapshots (and their indexes) it builds aren't evicted by the next.
+        """
+        self.snapshot_capacity = max(self.snapshot_capacity, count)
+
+    def clear_snapshots(self) -> None:
+        """Drop in-memory snapshots and pointers (the disk cache is untouched)."""
+        self._snapshots.clear()
+        self._pointers.clear()
+        self._absent.clear()
+
+    def _persist(self, snapshot: UsageSnapshot) -> None:
+        """Write data and pointer to disk (blocking; run on the cache's I/O threads)."""
+        expire = settings.SMOGON_STALE_EXPIRE_DAYS * 24 * 60 * 60
+        fmt, rating = snapshot.format_name, snapshot.rating
+        self.cache.set(
+            "smogon", f"{snapshot.month}/{fmt}/{rating}", value=snapshot.data, expire=expire
+        )
+        self.cache.set("smogon", f"latest/{fmt}/{rating}", value=snapshot.pointer, expire=expire)
+
+    async def _load_snapshot(self, format_name: str, rating: int) -> Optional[UsageSnapshot]:
+        """Snapshot for the pointed-to month, from memory or the disk cache."""
+        key = (format_name, rating)
+        pointer = await self._get_pointer(format_name, rating)
+        if pointer is None:
+            return None
+
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.month == pointer["month"]:
+            snapshot.fetched_at = pointer["fetched_at"]
+            self._snapshots.move_to_end(key)
+            return snapshot
+
+        data = await self.async_cache.get(
+            "smogon", f"{pointer['month']}/{format_name}/{rating}"
+        )
+        if data is None:
+            # Data evicted under the pointer: forget it so the next refresh
+            # does a full download instead of a conditional one
+            self._pointers[key] = None
+            await self.async_cache.delete("smogon", f"latest/{format_name}/{rating}")
+            return None
+
+        snapshot = await asyncio.to_thread(
+            UsageSnapshot.build, data, format_name, rating, pointer["month"],
+            pointer["fetched_at"], pointer.get("etag"), pointer.get("last_modified"),
+        )
+        self._remember(snapshot)
+        return snapshot
+
+    async def _download_snapshot(
+        self,
+        month: str,
+        format_name: str,
+        rating: int,
+        pointer: Optional[dict] = None,
+    ):
+        """GET one chaos file, conditionally if ``pointer`` has validators.
+
+        Returns a new UsageSnapshot, ``_NOT_MODIFIED``, None for 404, or
+        ``_FAILED`` for network/server errors (which must not be mistaken
+        for "this month does not exist").
+        """
         url = f"{settings.SMOGON_STATS_BASE_URL}/{month}/chaos/{format_name}-{rating}.json"
+        headers = {}
+        if pointer:
+            if pointer.get("etag"):
+                headers["If-None-Match"] = pointer["etag"]
+            if pointer.get("last_modified"):
+                headers["If-Modified-Since"] = pointer["last_modified"]
 
         try:
-            response = await client.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                self.cache.set("smogon", cache_key, value=data)
-                logger.debug(f"Fetched Smogon stats: {month}/{format_name}/{rating}")
-                return data
-            elif response.status_code == 404:
-                logger.debug(f"Smogon stats not found: {month}/{format_name}/{rating}")
+            record_fetch("smogon")
+            status, response_headers, data = await self._stream_chaos(url, headers)
         except httpx.RequestError as e:
             logger.warning(f"Smogon request error for {url}: {e}")
+            return _FAILED
+        except ValueError as e:
+            logger.warning(f"Invalid Smogon JSON for {url}: {e}")
+            return _FAILED
+
+        if status == 304:
+            return _NOT_MODIFIED
+        if status == 404:
+            logger.debug(f"Smogon stats not found: {month}/{format_name}/{rating}")
+            return None
+        if status != 200:
+            logger.warning(f"Smogon returned {status} for {url}")
+            return _FAILED
+
+        snapshot = await asyncio.to_thread(
+            UsageSnapshot.build, data, format_name, rating, month, None,
+            response_headers.get("etag"), response_headers.get("last-modified"),
+        )
+        await self.async_cache.run(self._persist, snapshot)
+        logger.debug(f"Fetched Smogon stats: {month}/{format_name}/{rating}")
+        return snapshot
+
+    async def _revalidate(self, format_name: str, rating: int) -> Optional[UsageSnapshot]:
+        """Look for a newer month, then revalidate the current one."""
+        key = (format_name, rating)
+        pointer = await self._get_pointer(format_name, rating)
+        current = pointer["month"] if pointer else None
+
+        for month in self._get_recent_months(3):
+            if current and month < current:
+                break
+            result = await self._download_snapshot(
+                month, format_name, rating, pointer if month == current else None
+            )
+            if result is _FAILED:
+                return await self._load_snapshot(format_name, rating)
+            if result is _NOT_MODIFIED:
+                pointer = {**pointer, "fetched_at": time.time()}
+                await self.async_cache.set(
+                    "smogon", f"latest/{format_name}/{rating}", value=pointer,
+                    expire=settings.SMOGON_STALE_EXPIRE_DAYS * 24 * 60 * 60,
+                )
+                self._pointers[key] = pointer
+                return await self._load_snapshot(format_name, rating)
+            if result is not None:
+                self._remember(result)
+                return result
+
+        if pointer is None:
+            self._absent[key] = time.time()
+            return None
+        # Nothing newer and the current month has gone: keep serving it
+        self._pointers[key] = {**pointer, "fetched_at": time.time()}
+        return await self._load_snapshot(format_name, rating)
+
+    def _start_refresh(self, format_name: str, rating: int) -> asyncio.Task:
+        """Start (or join) the single in-flight refresh for a format/rating."""
+        key = (format_name, rating)
+        task = self._refreshing.get(key)
+        if task is None:
+            task = asyncio.create_task(self._revalidate(format_name, rating))
+            self._refreshing[key] = task
+
+            def _done(t: asyncio.Task) -> None:
+                if self._refreshing.get(key) is t:
+                    del self._refreshing[key]
+                if not t.cancelled() and t.exception() is not None:
+                    logger.warning(
+                        f"Smogon refresh failed for {format_name}/{rating}: {t.exception()!r}"
+                    )
+
+            task.add_done_callback(_done)
+        return task
+
+    async def refresh_usage_stats(
+        self,
+        format_name: str,
+        rating: int = 0
+    ) -> Optional[UsageSnapshot]:
+        """Fetch the latest stats for one format/rating, coalescing concurrent callers.
+
+        Returns the current snapshot (possibly unchanged), or None if the
+        format has no published stats.
+        """
+        return await asyncio.shield(self._start_refresh(format_name, rating))
+
+    async def get_usage_snapshot(
+        self,
+        format_name: Optional[str] = None,
+        rating: int = 0
+    ) -> Optional[UsageSnapshot]:
+        """Latest known snapshot across formats, without waiting on revalidation.
+
+        Formats never seen before are fetched in the foreground only when no
+        format has anything to serve yet; otherwise they, and any stale or
+        previously-missing ones, are refreshed in the background while the
+        last-known-good data is returned.
+        """
+        formats = [format_name] if format_name else self.VGC_FORMATS
+        pointers = {fmt: await self._get_pointer(fmt, rating) for fmt in formats}
+
+        unseen = [f for f, p in pointers.items() if p is None and (f, rating) not in self._absent]
+        if unseen and not any(pointers.values()):
+            await asyncio.gather(*(self.refresh_usage_stats(f, rating) for f in unseen))
+            pointers.update({f: self._pointers.get((f, rating)) for f in unseen})
 
+        # Unseen formats count as stale, so the loop below backgrounds them
+        for fmt, pointer in pointers.items():
+            if pointer is not None:
+                stale = self._is_stale(pointer["fetched_at"])
+            else:
+                stale = self._is_stale(self._absent.get((fmt, rating), 0))
+            if stale:
+                self._start_refresh(fmt, rating)
+
+        # Newest month wins; ties go to the earlier (preferred) format
+        candidates = [
+            (pointer["month"], -i, fmt)
+            for i, (fmt, pointer) in enumerate(pointers.items())
+            if pointer is not None
+        ]
+        for _, _, fmt in sorted(candidates, reverse=True):
+            snapshot = await self._load_snapshot(fmt, rating)
+            if snapshot is None:
+                snapshot = await self.refresh_usage_stats(fmt, rating)
+            if snapshot is not None:
+                return snapshot
         return None
 
+    async def get_usage_ranking(
+        self,
+        format_name: Optional[str] = None,
+        rating: int = 0,
+        limit: Optional[int] = None
+    ) -> list[str]:
+        """Species names ordered by usage (highest first) for the latest stats."""
+        snapshot = await self.get_usage_snapshot(format_name, rating)
+        if snapshot is None:
+            raise SmogonStatsError(f"Could not find usage stats for {format_name or 'any format'}")
+        self._mark_current(snapshot.format_name, snapshot.month)
+        return snapshot.ranking[:limit] if limit is not None else list(snapshot.ranking)
+
+    def _mark_current(self, format_name: str, month: str) -> None:
+        self._current_format = format_name
+        self._current_month = month
+        self._check_for_data_upgrade(month)  # Track data freshness
+
+    def _with_meta(self, data: dict, format_name: str, month: str, rating: int) -> dict:
+        """Record the source as current and attach ``_meta`` to the returned stats."""
+        self._mark_current(format_name, month)
+
+        # Format month for display (e.g., "2025-12" -> "December 2025")
+        try:
+            month_display = datetime.strptime(month, "%Y-%m").strftime("%B %Y")
+        except ValueError:
+            month_display = month
+
+        data["_meta"] = {
+            "format": format_name,
+            "month": month,
+            "month_display": f"{month_display} Usage Stats",
+            "rating": rating
+        }
+
+        # Add notice if data source upgraded mid-session
+        notice = self.check_data_freshness()
+        if notice:
+            data["_meta"]["notice"] = notice
+
+        return data
+
     async def get_usage_stats(
         self,
         format_name: Optional[str] = None,
@@ -165,6 +599,10 @@ class SmogonStatsClient:
         """
         Fetch chaos.json usage stats with auto-detection.
 
+        Without an explicit month this serves the latest snapshot and never
+        waits on a refresh once a format has been seen (see
+        ``get_usage_snapshot``).
+
         Args:
             format_name: e.g., "gen9vgc2025regg". If None, auto-detect latest.
             rating: Rating cutoff (0, 1500, 1630, 1760)
@@ -173,42 +611,42 @@ class SmogonStatsClient:
         Returns:
             Usage stats data with metadata about source
         """
-        months = [month] if month else self._get_recent_months(3)
         formats = [format_name] if format_name else self.VGC_FORMATS
 
-        # Try combinations until we find one that works
-        for m in months:
-            for fmt in formats:
-                data = await self._try_fetch_stats(m, fmt, rating)
-                if data:
-                    self._current_format = fmt
-                    self._current_month = m
-                    self._check_for_data_upgrade(m)  # Track data freshness
-
-                    # Format month for display (e.g., "2025-12" -> "December 2025")
-                    try:
-                        month_display = datetime.strptime(m, "%Y-%m").strftime("%B %Y")
-                    except ValueError:
-                        month_display = m
-
-                    data["_meta"] = {
-                        "format": fmt,
-                        "month": m,
-                        "month_display": f"{month_display} Usage Stats",
-                        "rating": rating
-                    }
-
-                    # Add notice if data source upgraded mid-session
-                    notice = self.check_data_freshness()
-                    if notice:
-                        data["_meta"]["notice"] = notice
-
-                    return data
+        if month is None:
+            snapshot = await self.get_usage_snapshot(format_name, rating)
+            if snapshot is not None:
+                # Shallow copy so _meta never leaks into the shared snapshot
+                return self._with_meta(
+                    dict(snapshot.data), snapshot.format_name, snapshot.month, rating
+                )
+            raise SmogonStatsError(
+                f"Could not find usage stats. Tried formats: {formats[:3]}, "
+                f"months: {self._get_recent_months(3)}"
+            )
+
+        for fmt in formats:
+            data = await self._try_fetch_stats(month, fmt, rating)
+            if data:
+                return self._with_meta(data, fmt, month, rating)
 
         raise SmogonStatsError(
-            f"Could not find usage stats. Tried formats: {formats[:3]}, months: {months}"
+            f"Could not find usage stats. Tried formats: {formats[:3]}, months: {[month]}"
         )
 
+    def _find_species_key(self, stats: dict, pokemon_name: str) -> Optional[str]:
+        """Key in stats["data"] for a Pokemon, via the snapshot index when available."""
+        meta = stats.get("_meta", {})
+        snapshot = self._snapshots.get((meta.get("format"), meta.get("rating")))
+        if snapshot is not None and snapshot.month == meta.get("month"):
+            return snapshot.lookup(pokemon_name)
+
+        name_normalized = _normalize_species_key(pokemon_name)
+        for mon_name in stats.get("data", {}):
+            if _normalize_species_key(mon_name) == name_normalized:
+                return mon_name
+        return None
+
     async def get_pokemon_usage(
         self,
         pokemon_name: str,
@@ -222,105 +660,76 @@ class SmogonStatsClient:
         name_lower = pokemon_name.lower().replace(" ", "-")
         pokemon_name = FORM_ALIASES.get(name_lower, pokemon_name)
 
-        # Normalize name for matching
-        name_normalized = pokemon_name.lower().replace(" ", "").replace("-", "")
-
-        data = stats.get("data", {})
-        for mon_name, mon_data in data.items():
-            if mon_name.lower().replace(" ", "").replace("-", "") == name_normalized:
-                # Process raw data into percentages
-                usage_raw = mon_data.get("usage", 0)
-
-                # Process items
-                items = mon_data.get("Items", {})
-                item_total = sum(items.values()) or 1
-                items_pct = {
-                    k: round(v / item_total * 100, 1)
-                    for k, v in sorted(items.items(), key=lambda x: -x[1])
-                    if v / item_total > 0.01
-                }
-
-                # Process moves
-                moves = mon_data.get("Moves", {})
-                move_total = sum(moves.values()) or 1
-                moves_pct = {
-                    k: round(v / move_total * 100, 1)
-                    for k, v in sorted(moves.items(), key=lambda x: -x[1])
-                    if v / move_total > 0.01
-                }
+        mon_name = self._find_species_key(stats, pokemon_name)
+        if mon_name is None:
+            return None
+        mon_data = stats["data"][mon_name]
+
+        # Process raw data into percentages
+        usage_raw = mon_data.get("usage", 0)
+
+        # Process items
+        items = mon_data.get("Items", {})
+        item_total = sum(items.values()) or 1
+        items_pct = {
+            k: round(v / item_total * 100, 1)
+            for k, v in sorted(items.items(), key=lambda x: -x[1])
+            if v / item_total > 0.01
+        }
 
-                # Process abilities
-                abilities = mon_data.get("Abilities", {})
-                ability_total = sum(abilities.values()) or 1
-                abilities_pct = {
-                    k: round(v / ability_total * 100, 1)
-                    for k, v in sorted(abilities.items(), key=lambda x: -x[1])
-                    if v / ability_total > 0.01
-                }
+        # Process moves
+        moves = mon_data.get("Moves", {})
+        move_total = sum(moves.values()) or 1
+        moves_pct = {
+            k: round(v / move_total * 100, 1)
+            for k, v in sorted(moves.items(), key=lambda x: -x[1])
+            if v / move_total > 0.01
+        }
 
-                # Process spreads
-                spreads = mon_data.get("Spreads", {})
-                spread_total = sum(spreads.values()) or 1
-                spreads_processed = []
-                for spread_str, weight in sorted(spreads.items(), key=lambda x: -x[1]):
-                    pct = weight / spread_total
-                    if pct < 0.01:
-                        continue
-                    parsed = self._parse_spread(spread_str)
-                    parsed["usage"] = round(pct * 100, 1)
-                    spreads_processed.append(parsed)
+        # Process abilities
+        abilities = mon_data.get("Abilities", {})
+        ability_total = sum(abilities.values()) or 1
+        abilities_pct = {
+            k: round(v / ability_total * 100, 1)
+            for k, v in sorted(abilities.items(), key=lambda x: -x[1])
+            if v / ability_total > 0.01
+        }
 
-                # Process teammates
-                teammates = mon_data.get("Teammates", {})
-                teammate_total = sum(teammates.values()) or 1
-                teammates_pct = {
-                    k: round(v / teammate_total * 100, 1)
-                    for k, v in sorted(teammates.items(), key=lambda x: -x[1])[:15]
-                    if v / teammate_total > 0.01
-                }
+        spreads_processed = usage_spreads(mon_data.get("Spreads", {}))
 
-                # Process Tera types
-                tera_types = mon_data.get("Tera Types", {})
-                tera_total = sum(tera_types.values()) or 1
-                tera_pct = {
-                    k: round(v / tera_total * 100, 1)
-                    for k, v in sorted(tera_types.items(), key=lambda x: -x[1])
-                    if v / tera_total > 0.01
-                }
+        # Process teammates
+        teammates = mon_data.get("Teammates", {})
+        teammate_total = sum(teammates.values()) or 1
+        teammates_pct = {
+            k: round(v / teammate_total * 100, 1)
+            for k, v in sorted(teammates.items(), key=lambda x: -x[1])[:15]
+            if v / teammate_total > 0.01
+        }
 
-                return {
-                    "name": mon_name,
-                    "usage_percent": round(usage_raw * 100, 2),
-                    "abilities": abilities_pct,
-                    "items": items_pct,
-                    "moves": moves_pct,
-                    "spreads": spreads_processed[:10],
-                    "teammates": teammates_pct,
-                    "tera_types": tera_pct,
-                    "_meta": stats.get("_meta", {})
-                }
+        # Process Tera types
+        tera_types = mon_data.get("Tera Types", {})
+        tera_total = sum(tera_types.values()) or 1
+        tera_pct = {
+            k: round(v / tera_total * 100, 1)
+            for k, v in sorted(tera_types.items(), key=lambda x: -x[1])
+            if v / tera_total > 0.01
+        }
 
-        return None
+        return {
+            "name": mon_name,
+            "usage_percent": round(usage_raw * 100, 2),
+            "abilities": abilities_pct,
+            "items": items_pct,
+            "moves": moves_pct,
+            "spreads": spreads_processed[:10],
+            "teammates": teammates_pct,
+            "tera_types": tera_pct,
+            "_meta": stats.get("_meta", {})
+        }
 
     def _parse_spread(self, spread_str: str) -> dict:
         """Parse spread string like 'Modest:252/0/4/252/0/0' into structured data."""
-        try:
-            nature, evs = spread_str.split(":")
-            hp, atk, def_, spa, spd, spe = map(int, evs.split("/"))
-            return {
-                "nature": nature,
-                "evs": {
-                    "hp": hp,
-                    "attack": atk,
-                    "defense": def_,
-                    "special_attack": spa,
-                    "special_defense": spd,
-                    "speed": spe
-                },
-                "spread_string": spread_str
-            }
-        except Exception:
-            return {"raw": spread_str}
+        return parse_spread(spread_str)
 
     async def get_common_sets(
         self,
@@ -429,6 +838,72 @@ class SmogonStatsClient:
                     f"(previously {self._session_first_month})."
                 )
 
+    async def get_usage_history(
+        self,
+        format_name: Optional[str] = None,
+        rating: int = 0,
+        months: int = 6
+    ) -> UsageHistory:
+        """
+        Usage time series for the latest format, covering the last `months` months.
+
+        Months already in the history (in memory or on disk) are never
+        re-downloaded; new months are fetched once (concurrently), reduced to
+        columns and the history is persisted. Months with no published stats are
+        remembered and skipped.
+
+        Args:
+            format_name: Specific format (auto-detects latest if None)
+            rating: Rating cutoff
+            months: Calendar months to cover, ending at the latest stats month
+
+        Returns:
+            The UsageHistory for that format/rating
+        """
+        snapshot = await self.get_usage_snapshot(format_name, rating)
+        if snapshot is None:
+            raise SmogonStatsError(f"Could not find usage stats for {format_name or 'any format'}")
+        fmt = snapshot.format_name
+        key = (fmt, rating)
+        cache_key = f"history/{fmt}/{rating}"
+
+        async with self._history_locks.setdefault(key, asyncio.Lock()):
+            history = self._histories.get(key)
+            if history is None:
+                stored = await self.async_cache.get("smogon", cache_key)
+                history = UsageHistory.from_dict(stored) if stored else UsageHistory(fmt, rating)
+                self._histories[key] = history
+
+            wanted = [
+                month for month in reversed(month_window(snapshot.month, months))
+                if not history.has_month(month) and month not in history.missing
+            ]
+            # Download the missing months concurrently
+            older = [month for month in wanted if month != snapshot.month]
+            fetched = await asyncio.gather(
+                *(self._fetch_month(month, fmt, rating) for month in older)
+            )
+            downloads = dict(zip(older, fetched))
+
+            changed = False
+            for month in wanted:
+                data = snapshot.data if month == snapshot.month else downloads[month]
+                if data is _FAILED:
+                    continue
+                if data is None:
+                    history.missing.add(month)
+                else:
+                    reduced = await asyncio.to_thread(UsageHistory.reduce_month, data)
+                    history.add_reduced(month, reduced)
+                changed = True
+
+            if changed:
+                await self.async_cache.set(
+                    "smogon", cache_key, value=history.to_dict(),
+                    expire=settings.SMOGON_STALE_EXPIRE_DAYS * 24 * 60 * 60,
+                )
+        return history
+
     async def compare_pokemon_usage(
         self,
         pokemon_name: str,
@@ -453,70 +928,46 @@ class SmogonStatsClient:
         Returns:
             Comparison data showing current vs previous month
         """
-        months = self._get_recent_months(2)
-
-        if len(months) < 2:
+        try:
+            history = await self.get_usage_history(format_name, rating, months=2)
+        except SmogonStatsError:
             return None
 
-        current_month = months[0]
-        previous_month = months[1]
+        current_month = history.months[-1]
+        previous_month = shift_month(current_month, -1)
 
-        # Get current month stats
         current_stats = None
         previous_stats = None
 
         try:
             current_stats = await self.get_pokemon_usage(
-                pokemon_name, format_name, rating
+                pokemon_name, history.format_name, rating
             )
         except SmogonStatsError:
             pass
 
-        # Try to get previous month stats
-        try:
-            # Temporarily override to get previous month
-            formats = [format_name] if format_name else self.VGC_FORMATS
-
-            for fmt in formats:
-                data = await self._try_fetch_stats(previous_month, fmt, rating)
-                if data:
-                    # Extract Pokemon data from previous month
-                    name_normalized = pokemon_name.lower().replace(" ", "").replace("-", "")
-
-                    for mon_name, mon_data in data.get("data", {}).items():
-                        if mon_name.lower().replace(" ", "").replace("-", "") == name_normalized:
-                            # Process previous month data
-                            usage_raw = mon_data.get("usage", 0)
-
-                            spreads = mon_data.get("Spreads", {})
-                            spread_total = sum(spreads.values()) or 1
-                            spreads_processed = []
-                            for spread_str, weight in sorted(spreads.items(), key=lambda x: -x[1])[:5]:
-                                pct = weight / spread_total
-                                parsed = self._parse_spread(spread_str)
-                                parsed["usage"] = round(pct * 100, 1)
-                                spreads_processed.append(parsed)
-
-                            items = mon_data.get("Items", {})
-                            item_total = sum(items.values()) or 1
-                            items_pct = {
-                                k: round(v / item_total * 100, 1)
-                                for k, v in sorted(items.items(), key=lambda x: -x[1])[:5]
-                            }
-
-                            previous_stats = {
-                                "name": mon_name,
-                                "usage_percent": round(usage_raw * 100, 2),
-                                "spreads": spreads_processed,
-                                "items": items_pct,
-                                "month": previous_month,
-                                "format": fmt
-                            }
-                            break
-                    if previous_stats:
-                        break
-        except Exception:
-            pass
+        # Previous month comes from the history columns (no refetch/reprocess)
+        name_lower = pokemon_name.lower().replace(" ", "-")
+        row = history.lookup(FORM_ALIASES.get(name_lower, pokemon_name))
+        if row is not None and history.has_month(previous_month):
+            usage_percent = history.columns["usage"][previous_month][row]
+            if usage_percent is not None:
+                spreads_processed = []
+                spreads = history.columns["spreads"][previous_month][row]
+                for spread_str, pct in list(spreads.items())[:5]:
+                    parsed = self._parse_spread(spread_str)
+                    parsed["usage"] = pct
+                    spreads_processed.append(parsed)
+                items = history.columns["items"][previous_month][row]
+
+                previous_stats = {
+                    "name": history.species[row],
+                    "usage_percent": usage_percent,
+                    "spreads": spreads_processed,
+                    "items": dict(list(items.items())[:5]),
+                    "month": previous_month,
+                    "format": history.format_name
+                }
 
         if not current_stats and not previous_stats:
             return None
@@ -597,100 +1048,31 @@ class SmogonStatsClient:
                 }
             }
         """
-        from ..calc.stats import calculate_speed
-        from ..models.pokemon import Nature
-
-        # Nature name -> Nature enum mapping
-        NATURE_MAP = {
-            "adamant": Nature.ADAMANT, "bashful": Nature.BASHFUL, "bold": Nature.BOLD,
-            "brave": Nature.BRAVE, "calm": Nature.CALM, "careful": Nature.CAREFUL,
-            "docile": Nature.DOCILE, "gentle": Nature.GENTLE, "hardy": Nature.HARDY,
-            "hasty": Nature.HASTY, "impish": Nature.IMPISH, "jolly": Nature.JOLLY,
-            "lax": Nature.LAX, "lonely": Nature.LONELY, "mild": Nature.MILD,
-            "modest": Nature.MODEST, "naive": Nature.NAIVE, "naughty": Nature.NAUGHTY,
-            "quiet": Nature.QUIET, "quirky": Nature.QUIRKY, "rash": Nature.RASH,
-            "relaxed": Nature.RELAXED, "sassy": Nature.SASSY, "serious": Nature.SERIOUS,
-            "timid": Nature.TIMID,
-        }
+        from ..calc.speed_tiers import speed_distribution
 
         usage = await self.get_pokemon_usage(pokemon_name, format_name, rating)
         if not usage or not usage.get("spreads"):
             return None
 
-        # Calculate speed for each spread and aggregate by speed value
-        speed_usage: dict[int, float] = {}
-        for spread in usage["spreads"]:
-            nature_str = spread.get("nature", "Serious").lower()
-            evs = spread.get("evs", {})
-            spread_usage = spread.get("usage", 0)
-
-            nature = NATURE_MAP.get(nature_str, Nature.SERIOUS)
-            speed_evs = evs.get("speed", 0)
-
-            # Calculate final speed stat (level 50, 31 IVs)
-            final_speed = calculate_speed(base_speed, 31, speed_evs, 50, nature)
-
-            if final_speed in speed_usage:
-                speed_usage[final_speed] += spread_usage
-            else:
-                speed_usage[final_speed] = spread_usage
-
-        if not speed_usage:
+        summary = speed_distribution(usage["spreads"], base_speed)
+        if summary is None:
             return None
-
-        # Build distribution sorted by speed
-        distribution = [
-            {"speed": speed, "usage": round(usage_pct, 1)}
-            for speed, usage_pct in sorted(speed_usage.items())
-        ]
-
-        # Calculate statistics
-        speeds = list(speed_usage.keys())
-        usages = list(speed_usage.values())
-        total_usage = sum(usages)
-
-        # Weighted mean
-        weighted_sum = sum(s * u for s, u in zip(speeds, usages))
-        mean_speed = weighted_sum / total_usage if total_usage > 0 else speeds[0]
-
-        # Median (by usage weight)
-        cumulative = 0
-        median_speed = speeds[0]
-        for s, u in sorted(zip(speeds, usages)):
-            cumulative += u
-            if cumulative >= total_usage / 2:
-                median_speed = s
-                break
-
-        # IQR (25th and 75th percentile by usage)
-        cumulative = 0
-        iqr_low = speeds[0]
-        iqr_high = speeds[-1]
-        for s, u in sorted(zip(speeds, usages)):
-            cumulative += u
-            if cumulative >= total_usage * 0.25 and iqr_low == speeds[0]:
-                iqr_low = s
-            if cumulative >= total_usage * 0.75:
-                iqr_high = s
-                break
+        distribution, stats = summary
 
         return {
             "pokemon": usage["name"],
             "base_speed": base_speed,
             "distribution": distribution,
-            "stats": {
-                "min": min(speeds),
-                "max": max(speeds),
-                "median": median_speed,
-                "mean": round(mean_speed, 1),
-                "iqr_low": iqr_low,
-                "iqr_high": iqr_high,
-            },
+            "stats": stats,
             "_meta": usage.get("_meta", {})
         }
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Cancel in-flight refreshes and close ``_client`` (the shared pool stays open)."""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
         if self._client:
             await self._client.aclose()
             self._client = None
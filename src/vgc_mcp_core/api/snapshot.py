@@ -0,0 +1,245 @@
+"""Warm-start cache snapshots.
+
+Scale-to-zero deployments (Fly.io with ``min_machines_running = 0``, Render's
+free tier) boot with an empty disk cache, so the first requests after a wake
+pay for PokeAPI and Smogon downloads. ``vgc-mcp-cache build`` fills a cache
+directory ahead of time (full dex name lists, current usage stats for every
+format and rating cutoff, the usage history, and PokeAPI entries for the most
+used Pokemon and their moves) and packs it into one xz-compressed tarball
+with a JSON manifest. At boot the server restores that snapshot into the
+cache directory if the directory is empty, or mounts an existing directory
+as-is (``VGC_CACHE_DIR``).
+
+Snapshots hold a diskcache directory, so they are portable between machines
+running the same diskcache major version; the manifest records it and a
+mismatched snapshot is skipped rather than restored. diskcache stores absolute
+expiry times, so a restore moves every expiry forward by the snapshot's age:
+entries get the lifetime they had at build time, counted from the restore.
+"""
+
+import asyncio
+import io
+import json
+import shutil
+import sqlite3
+import tarfile
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import diskcache
+
+from .. import __version__
+from ..config import logger, settings
+from .prefetch import UsageStatsPrefetcher
+
+SNAPSHOT_VERSION = 1
+MANIFEST_NAME = "snapshot.json"
+CACHE_MEMBER = "cache"
+
+# Most-used Pokemon (and their top moves) whose PokeAPI entries are prefetched
+DEFAULT_TOP_POKEMON = 60
+MOVES_PER_POKEMON = 4
+FETCH_CONCURRENCY = 8
+
+
+def _diskcache_major() -> str:
+    return diskcache.__version__.split(".")[0]
+
+
+async def warm_cache(
+    pokeapi,
+    smogon,
+    top_pokemon: int = DEFAULT_TOP_POKEMON,
+    history_months: int = 6,
+    ratings: Optional[list[int]] = None,
+) -> dict:
+    """Fetch everything a cold server would otherwise download on first use.
+
+    Args:
+        pokeapi: PokeAPIClient writing into the cache being warmed
+        smogon: SmogonStatsClient writing into the same cache
+        top_pokemon: Most-used Pokemon whose dex entries and top moves are fetched
+        history_months: Months of usage history to build
+        ratings: Rating cutoffs to prefetch (default: all configured)
+
+    Returns:
+        Summary of what was fetched and what failed
+    """
+    start = time.monotonic()
+    summary: dict = {"names": await pokeapi.load_name_index()}
+
+    prefetch = await UsageStatsPrefetcher(smogon, ratings=ratings).refresh_all()
+    summary["usage"] = {key: prefetch[key] for key in ("available", "missing", "errors")}
+
+    try:
+        history = await smogon.get_usage_history(
+            rating=settings.DEFAULT_RATING, months=history_months
+        )
+        summary["history_months"] = len(history.months)
+    except Exception as e:
+        logger.warning(f"Snapshot: usage history skipped: {e!r}")
+        summary["history_months"] = 0
+
+    try:
+        ranking = await smogon.get_usage_ranking(rating=settings.DEFAULT_RATING, limit=top_pokemon)
+    except Exception as e:
+        logger.warning(f"Snapshot: usage ranking unavailable: {e!r}")
+        ranking = []
+
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    failed: list[str] = []
+
+    async def fetch(kind: str, name: str, getter) -> None:
+        async with semaphore:
+            try:
+                await getter(name)
+            except Exception:
+                failed.append(f"{kind}/{name}")
+
+    moves: set[str] = set()
+    for name in ranking:
+        usage = await smogon.get_pokemon_usage(name, rating=settings.DEFAULT_RATING)
+        if usage:
+            moves.update(list(usage.get("moves", {}))[:MOVES_PER_POKEMON])
+    await asyncio.gather(
+        *(fetch("pokemon", name, pokeapi.get_pokemon) for name in ranking),
+        *(fetch("move", name, pokeapi.get_move_data) for name in sorted(moves)),
+    )
+    summary["pokemon"] = len(ranking)
+    summary["moves"] = len(moves)
+    summary["failed"] = sorted(failed)
+    summary["seconds"] = round(time.monotonic() - start, 1)
+    return summary
+
+
+def write_snapshot(cache_dir: Path, output: Path, summary: Optional[dict] = None) -> dict:
+    """Pack a (closed) cache directory into a compressed snapshot.
+
+    Returns:
+        The manifest written alongside the cache
+    """
+    manifest = {
+        "snapshot_version": SNAPSHOT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "vgc_mcp_core": __version__,
+        "diskcache": diskcache.__version__,
+        "summary": summary or {},
+    }
+    output.parent.mkdir(parents=True, exist_ok=True)
+    partial = output.with_name(output.name + ".partial")
+    with tarfile.open(partial, "w:xz") as tar:
+        data = json.dumps(manifest, indent=2).encode()
+        info = tarfile.TarInfo(MANIFEST_NAME)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+        tar.add(cache_dir, arcname=CACHE_MEMBER)
+    partial.replace(output)
+    manifest["bytes"] = output.stat().st_size
+    return manifest
+
+
+def read_manifest(snapshot: Path) -> dict:
+    """The manifest of a snapshot file."""
+    with tarfile.open(snapshot, "r:*") as tar:
+        member = tar.extractfile(MANIFEST_NAME)
+        if member is None:
+            raise ValueError(f"{snapshot} has no {MANIFEST_NAME}")
+        return json.loads(member.read())
+
+
+def _cache_is_empty(cache_dir: Path) -> bool:
+    return not (cache_dir / "cache.db").exists()
+
+
+def _shift_expiries(cache_dir: Path, seconds: float) -> int:
+    """Move every expiring entry of a closed cache ``seconds`` later.
+
+    Returns:
+        Number of entries moved
+    """
+    with closing(sqlite3.connect(cache_dir / "cache.db")) as db, db:
+        cursor = db.execute(
+            "UPDATE Cache SET expire_time = expire_time + ? WHERE expire_time IS NOT NULL",
+            (seconds,),
+        )
+        return cursor.rowcount
+
+
+def restore_snapshot(
+    snapshot: Path,
+    cache_dir: Path,
+    force: bool = False,
+) -> Optional[dict]:
+    """Unpack a snapshot into ``cache_dir`` if that cache is empty.
+
+    A populated cache (a mounted volume, or a machine that already warmed
+    up) is left alone unless ``force`` is set. Call before any ``APICache``
+    opens the directory.
+
+    Returns:
+        The snapshot manifest if it was restored, else None
+    """
+    if not snapshot.exists():
+        return None
+    if not force and not _cache_is_empty(cache_dir):
+        return None
+    try:
+        manifest = read_manifest(snapshot)
+    except (OSError, tarfile.TarError, ValueError) as e:
+        logger.warning(f"Cache snapshot {snapshot} unreadable: {e!r}")
+        return None
+    if manifest.get("snapshot_version") != SNAPSHOT_VERSION:
+        logger.warning(f"Cache snapshot {snapshot} has an unsupported version; skipped")
+        return None
+    if str(manifest.get("diskcache", "")).split(".")[0] != _diskcache_major():
+        logger.warning(f"Cache snapshot {snapshot} was built with diskcache "
+                       f"{manifest.get('diskcache')}; skipped")
+        return None
+
+    start = time.monotonic()
+    staging = cache_dir.with_name(cache_dir.name + ".restore")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    try:
+        with tarfile.open(snapshot, "r:*") as tar:
+            members = [
+                m for m in tar.getmembers()
+                if m.name.startswith(CACHE_MEMBER + "/") and (m.isfile() or m.isdir())
+            ]
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(staging, members=members, filter="data")
+            else:
+                # Python < 3.11.4: no extraction filters, so vet paths ourselves
+                for member in members:
+                    if member.name.startswith("/") or ".." in Path(member.name).parts:
+                        raise ValueError(f"Unsafe path in snapshot: {member.name}")
+                tar.extractall(staging, members=members)
+        age = time.time() - datetime.fromisoformat(manifest["created_at"]).timestamp()
+        if age > 0:
+            _shift_expiries(staging / CACHE_MEMBER, age)
+        if cache_dir.exists():
+            shutil.rmtree(cache_dir)
+        (staging / CACHE_MEMBER).replace(cache_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    manifest["restore_seconds"] = round(time.monotonic() - start, 3)
+    logger.info(
+        f"Restored cache snapshot from {manifest['created_at']} "
+        f"in {manifest['restore_seconds']}s"
+    )
+    return manifest
+
+
+def restore_configured_snapshot() -> Optional[dict]:
+    """Restore ``settings.CACHE_SNAPSHOT`` into ``settings.CACHE_DIR`` if empty."""
+    try:
+        return restore_snapshot(settings.CACHE_SNAPSHOT, settings.CACHE_DIR)
+    except Exception as e:
+        # A bad snapshot only costs the warm start
+        logger.warning(f"Cache snapshot restore failed: {e!r}")
+        return None
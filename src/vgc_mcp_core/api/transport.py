@@ -0,0 +1,297 @@
+"""Shared HTTP transport for the API clients.
+
+PokeAPI, Smogon and PokePaste requests all go through one ``Transport``:
+
+* one connection pool, speaking HTTP/2 when the optional ``h2`` package is
+  installed;
+* single-flight: concurrent requests for the same URL share one fetch, so a
+  herd of sessions missing the same cache entry costs one download;
+* a token bucket per host, so bursts (startup warmers, bulk tools) stay at
+  a polite request rate;
+* jittered exponential backoff, with retries drawn from a per-host budget
+  that refills as requests are made, so an outage is not multiplied by
+  every caller retrying on its own schedule.
+
+Clients with their own ``_client`` (tests, offline fixtures) keep it; they
+still get single-flight, throttling and retries.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+from ..config import logger, settings
+from ..metrics import record_transport
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+T = TypeVar("T")
+
+USER_AGENT = "VGC-MCP-Server/0.1.0"
+# Statuses worth another attempt; anything else (404, 400, ...) is final
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryableStatusError(Exception):
+    """A retryable status from an attempt that doesn't use raise_for_status."""
+
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+class RetriesExhaustedError(Exception):
+    """Every allowed attempt failed; ``last_error`` is the final failure."""
+
+    def __init__(self, attempts: int, last_error: Exception):
+        super().__init__(f"Failed after {attempts} attempts: {last_error}")
+        self.attempts = attempts
+        self.last_error = last_error
+
+
+def is_retryable(error: Exception) -> bool:
+    """Transport errors and 429/5xx responses are retried."""
+    if isinstance(error, (httpx.RequestError, RetryableStatusError)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRY_STATUSES
+    return False
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number ``attempt`` (0-based)."""
+    ceiling = min(settings.API_MAX_RETRY_DELAY, settings.API_RETRY_DELAY * 2 ** attempt)
+    return random.uniform(0, ceiling)
+
+
+class TokenBucket:
+    """A request rate with a burst allowance.
+
+    ``acquire`` reserves a token up front and sleeps until it is due, so
+    waiters are served in arrival order without a lock.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token; returns how many seconds to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class RetryBudget:
+    """Retries allowed as a fraction of requests made.
+
+    Each request deposits ``ratio`` tokens and each retry withdraws one,
+    starting from (and capped at) ``reserve``. A brief blip gets its
+    retries; a sustained outage runs the budget dry, after which failures
+    surface at once until fresh requests refill it.
+    """
+
+    def __init__(self, ratio: float, reserve: int):
+        self.ratio = ratio
+        self.reserve = reserve
+        self.tokens = float(reserve)
+
+    def deposit(self) -> None:
+        self.tokens = min(self.reserve, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+@dataclass
+class HostState:
+    """Rate limit, retry budget and counters for one upstream host."""
+    bucket: Optional[TokenBucket]
+    budget: RetryBudget
+    counts: dict[str, int] = field(default_factory=lambda: {
+        "requests": 0, "coalesced": 0, "throttled": 0, "retry": 0, "retry_denied": 0,
+    })
+
+
+class Transport:
+    """Connection pool, single-flight map, rate limits and retry budgets."""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        budget_ratio: Optional[float] = None,
+        budget_reserve: Optional[int] = None,
+        http2: Optional[bool] = None,
+    ):
+        self.rate = settings.API_RATE_PER_HOST if rate is None else rate
+        self.burst = settings.API_RATE_BURST if burst is None else burst
+        self.budget_ratio = (
+            settings.API_RETRY_BUDGET_RATIO if budget_ratio is None else budget_ratio
+        )
+        self.budget_reserve = (
+            settings.API_RETRY_BUDGET_RESERVE if budget_reserve is None else budget_reserve
+        )
+        self.http2 = (settings.API_HTTP2 if http2 is None else http2) and HTTP2_AVAILABLE
+        self._hosts: dict[str, HostState] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._pool: Optional[httpx.AsyncClient] = None
+        self._pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def host(self, url: str) -> HostState:
+        name = httpx.URL(url).host
+        state = self._hosts.get(name)
+        if state is None:
+            bucket = TokenBucket(self.rate, self.burst) if self.rate > 0 else None
+            state = self._hosts[name] = HostState(
+                bucket, RetryBudget(self.budget_ratio, self.budget_reserve)
+            )
+        return state
+
+    def _count(self, url: str, event: str) -> None:
+        self.host(url).counts[event] += 1
+        if event != "requests":
+            record_transport(httpx.URL(url).host, event)
+
+    async def client(self) -> httpx.AsyncClient:
+        """The shared pool for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._pool is None or self._pool.is_closed or self._pool_loop is not loop:
+            # A pool opened on another (finished) loop can't be reused or closed here
+            self._pool = httpx.AsyncClient(
+                timeout=httpx.Timeout(settings.API_TIMEOUT_SECONDS),
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=16, max_connections=32, keepalive_expiry=30.0
+                ),
+            )
+            self._pool_loop = loop
+        return self._pool
+
+    async def single_flight(self, url: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fetch`` once for every concurrent caller asking for ``url``.
+
+        The fetch runs in its own task, so a caller that is cancelled does
+        not cancel it for the others still waiting.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(url)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(fetch())
+            self._inflight[url] = task
+            task.add_done_callback(lambda done: self._forget(url, done))
+        else:
+            self._count(url, "coalesced")
+        return await asyncio.shield(task)
+
+    def _forget(self, url: str, task: asyncio.Task) -> None:
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every waiter was cancelled
+
+    async def throttle(self, url: str) -> None:
+        """Wait for a request slot on ``url``'s host."""
+        bucket = self.host(url).bucket
+        if bucket is not None and await bucket.acquire():
+            self._count(url, "throttled")
+
+    async def call(
+        self,
+        url: str,
+        attempt: Callable[[], Awaitable[T]],
+        attempts: Optional[int] = None,
+    ) -> T:
+        """Make one logical request to ``url``, retrying within the budget.
+
+        ``attempt`` performs a single request. Errors that ``is_retryable``
+        rejects propagate unchanged; retryable ones are retried with
+        jittered backoff while attempts and the host's budget last, then
+        raise ``RetriesExhaustedError``.
+        """
+        attempts = settings.API_MAX_RETRIES if attempts is None else attempts
+        state = self.host(url)
+        state.budget.deposit()
+        self._count(url, "requests")
+        tried = 0
+        while True:
+            await self.throttle(url)
+            tried += 1
+            try:
+                return await attempt()
+            except Exception as e:
+                if not is_retryable(e):
+                    raise
+                last_error = e
+            if tried >= attempts:
+                break
+            if not state.budget.withdraw():
+                self._count(url, "retry_denied")
+                logger.warning(f"Retry budget spent for {httpx.URL(url).host}; not retrying {url}")
+                break
+            self._count(url, "retry")
+            delay = backoff_delay(tried - 1)
+            logger.warning(
+                f"Request to {url} failed (attempt {tried}), retrying in {delay:.2f}s: {last_error}"
+            )
+            await asyncio.sleep(delay)
+        raise RetriesExhaustedError(tried, last_error)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "http2": self.http2,
+            "inflight": len(self._inflight),
+            "hosts": {
+                name: {**state.counts, "retry_budget": round(state.budget.tokens, 2)}
+                for name, state in self._hosts.items()
+            },
+        }
+
+    async def close(self) -> None:
+        """Close the pool if it belongs to the running loop."""
+        pool, self._pool = self._pool, None
+        same_loop = self._pool_loop is asyncio.get_running_loop()
+        if pool is not None and not pool.is_closed and same_loop:
+            await pool.aclose()
+        self._pool_loop = None
+
+
+_transport: Optional[Transport] = None
+
+
+def get_transport() -> Transport:
+    """The process-wide transport shared by every API client."""
+    global _transport
+    if _transport is None:
+        _transport = Transport()
+    return _transport
+
+
+def reset_transport() -> None:
+    """Reset the shared transport (useful for testing)."""
+    global _transport
+    _transport = None
@@ -0,0 +1,251 @@
+"""Multi-month usage time series for one Smogon format/rating.
+
+Each month of chaos stats is reduced once to a column per metric (usage,
+speed investment, item/move/ability/Tera/spread shares), aligned to a shared
+species list. Trend queries then read columns instead of re-fetching and
+re-processing chaos files per Pokemon per month.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+# Metrics holding one number per species per month
+NUMERIC_METRICS = ("usage", "speed_evs", "max_speed")
+# Metrics holding a {name: share %} dict per species per month
+SHARE_METRICS = ("items", "moves", "abilities", "tera_types", "spreads")
+METRICS = NUMERIC_METRICS + SHARE_METRICS
+
+# Chaos key for each share metric
+_CHAOS_KEYS = {
+    "items": "Items",
+    "moves": "Moves",
+    "abilities": "Abilities",
+    "tera_types": "Tera Types",
+    "spreads": "Spreads",
+}
+# Entries kept per share metric (the long tail is < 1% and noisy)
+SHARE_LIMIT = 10
+
+
+def _normalize(name: str) -> str:
+    return name.lower().replace(" ", "").replace("-", "")
+
+
+def shift_month(month: str, offset: int) -> str:
+    """Calendar month `offset` months from a YYYY-MM month (negative = earlier)."""
+    date = datetime.strptime(month, "%Y-%m")
+    index = date.year * 12 + date.month - 1 + offset
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def month_window(end: str, count: int) -> list[str]:
+    """The `count` calendar months ending at `end`, oldest first."""
+    return [shift_month(end, -i) for i in range(count - 1, -1, -1)]
+
+
+def _shares(counts: dict[str, float]) -> dict[str, float]:
+    total = sum(v for v in counts.values() if v > 0) or 1
+    top = sorted(counts.items(), key=lambda kv: -kv[1])[:SHARE_LIMIT]
+    return {k: round(v / total * 100, 1) for k, v in top if v / total > 0.01}
+
+
+def _speed(spreads: dict[str, float]) -> tuple[Optional[float], Optional[float]]:
+    """(usage-weighted mean Speed EVs, % of spreads with 252 Speed EVs)."""
+    total = weighted = maxed = 0.0
+    for spread, weight in spreads.items():
+        try:
+            speed = int(spread.split(":")[1].split("/")[5])
+        except (IndexError, ValueError):
+            continue
+        total += weight
+        weighted += speed * weight
+        if speed >= 252:
+            maxed += weight
+    if not total:
+        return None, None
+    return round(weighted / total, 1), round(maxed / total * 100, 1)
+
+
+def _slope(values: list[float]) -> float:
+    """Least-squares change per month."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2
+    mean_y = sum(values) / n
+    num = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    den = sum((x - mean_x) ** 2 for x in range(n))
+    return num / den
+
+
+@dataclass
+class UsageHistory:
+    """Columnar usage time series: columns[metric][month][row] per species row."""
+    format_name: str
+    rating: int
+    months: list[str] = field(default_factory=list)  # oldest first
+    species: list[str] = field(default_factory=list)  # chaos names, append-only
+    columns: dict[str, dict[str, list[Any]]] = field(
+        default_factory=lambda: {metric: {} for metric in METRICS}
+    )
+    # Months known to have no published stats (never retried)
+    missing: set[str] = field(default_factory=set)
+    _index: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self._index:
+            self._index = {_normalize(name): i for i, name in enumerate(self.species)}
+
+    def lookup(self, pokemon_name: str) -> Optional[int]:
+        """Row for a Pokemon name in any spelling, or None."""
+        return self._index.get(_normalize(pokemon_name))
+
+    def _row(self, name: str) -> int:
+        key = _normalize(name)
+        row = self._index.get(key)
+        if row is None:
+            row = len(self.species)
+            self.species.append(name)
+            self._index[key] = row
+            for by_month in self.columns.values():
+                for column in by_month.values():
+                    column.append(None)
+        return row
+
+    def has_month(self, month: str) -> bool:
+        return month in self.columns["usage"]
+
+    @staticmethod
+    def reduce_month(data: dict) -> dict[str, dict[str, Any]]:
+        """Per-species metric values for one month of chaos data (pure; run off the loop)."""
+        reduced = {}
+        for name, mon in data.get("data", {}).items():
+            values: dict[str, Any] = {"usage": round(mon.get("usage", 0) * 100, 2)}
+            values["speed_evs"], values["max_speed"] = _speed(mon.get("Spreads", {}))
+            for metric, chaos_key in _CHAOS_KEYS.items():
+                values[metric] = _shares(mon.get(chaos_key, {}))
+            reduced[name] = values
+        return reduced
+
+    def add_reduced(self, month: str, reduced: dict[str, dict[str, Any]]) -> None:
+        """Store a reduced month as one new column per metric."""
+        rows = [self._row(name) for name in reduced]
+        new = {metric: [None] * len(self.species) for metric in METRICS}
+        for row, values in zip(rows, reduced.values()):
+            for metric in METRICS:
+                new[metric][row] = values[metric]
+
+        for metric, column in new.items():
+            self.columns[metric][month] = column
+        self.missing.discard(month)
+        self.months = sorted(set(self.months) | {month})
+
+    def add_month(self, month: str, data: dict) -> None:
+        """Reduce one month of chaos data and store it (one pass over species)."""
+        self.add_reduced(month, self.reduce_month(data))
+
+    def window(self, months: Optional[int] = None) -> list[str]:
+        """The latest `months` months with data (all of them if None)."""
+        return self.months[-months:] if months else list(self.months)
+
+    def series(
+        self,
+        pokemon_name: str,
+        metric: str = "usage",
+        months: Optional[int] = None,
+    ) -> list[tuple[str, Any]]:
+        """(month, value) for one Pokemon; value is None in months it wasn't used."""
+        row = self.lookup(pokemon_name)
+        if row is None:
+            return []
+        by_month = self.columns[metric]
+        return [(month, by_month[month][row]) for month in self.window(months)]
+
+    def share_series(
+        self,
+        pokemon_name: str,
+        metric: str,
+        key: str,
+        months: Optional[int] = None,
+    ) -> list[tuple[str, float]]:
+        """(month, share %) of one item/move/ability/Tera type/spread for a Pokemon."""
+        wanted = _normalize(key)
+        points = []
+        for month, shares in self.series(pokemon_name, metric, months):
+            share = 0.0
+            for name, pct in (shares or {}).items():
+                if _normalize(name) == wanted:
+                    share = pct
+                    break
+            points.append((month, share))
+        return points
+
+    def movers(
+        self,
+        metric: str = "usage",
+        months: Optional[int] = None,
+        limit: int = 10,
+        min_usage: float = 1.0,
+        rising: bool = True,
+    ) -> list[dict]:
+        """Species with the largest change in a numeric metric over the window.
+
+        Scans every species once. Months a species wasn't used count as 0
+        for usage and are skipped for other metrics; species below
+        `min_usage` % usage in every month of the window are ignored.
+        """
+        if metric not in NUMERIC_METRICS:
+            raise ValueError(f"Trends need a numeric metric: {', '.join(NUMERIC_METRICS)}")
+        window = self.window(months)
+        if len(window) < 2:
+            return []
+
+        columns = [self.columns[metric][month] for month in window]
+        fill = 0.0 if metric == "usage" else None
+        usage = [self.columns["usage"][month] for month in window]
+
+        results = []
+        for row, name in enumerate(self.species):
+            if max((col[row] or 0.0) for col in usage) < min_usage:
+                continue
+            points = [
+                (month, col[row] if col[row] is not None else fill)
+                for month, col in zip(window, columns)
+            ]
+            values = [v for _, v in points if v is not None]
+            if len(values) < 2:
+                continue
+            results.append({
+                "pokemon": name,
+                "start": values[0],
+                "end": values[-1],
+                "change": round(values[-1] - values[0], 2),
+                "slope": round(_slope(values), 2),
+                "series": dict(points),
+            })
+
+        results.sort(key=lambda r: r["change"], reverse=rising)
+        return results[:limit]
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form for the disk cache."""
+        return {
+            "format": self.format_name,
+            "rating": self.rating,
+            "months": self.months,
+            "species": self.species,
+            "columns": self.columns,
+            "missing": sorted(self.missing),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UsageHistory":
+        return cls(
+            format_name=data["format"],
+            rating=data["rating"],
+            months=list(data["months"]),
+            species=list(data["species"]),
+            columns={metric: dict(data["columns"].get(metric, {})) for metric in METRICS},
+            missing=set(data.get("missing", [])),
+        )
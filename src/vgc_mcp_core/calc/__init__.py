@@ -1,7 +1,7 @@
 """Calculation engines for stats, damage, and speed."""
 
 from .stats import calculate_hp, calculate_stat, calculate_all_stats, calculate_speed
-from .damage import calculate_damage, DamageResult
+from .damage import calculate_damage, calculate_damage_bounds, DamageBounds, DamageResult
 from .modifiers import DamageModifiers, get_type_effectiveness, TYPE_CHART
 from .speed import compare_speeds, find_speed_evs, SpeedComparison
 from .coverage import (
@@ -27,6 +27,8 @@ __all__ = [
     "calculate_all_stats",
     "calculate_speed",
     "calculate_damage",
+    "calculate_damage_bounds",
+    "DamageBounds",
     "DamageResult",
     "DamageModifiers",
     "get_type_effectiveness",
@@ -0,0 +1,359 @@
+"""Game-theoretic bring-4 and lead selection.
+
+The game plan's lead and bring recommendations are greedy: the best scoring
+lead pair, then the two back Pokemon with the highest additive score, against
+one predicted opposing lead. This module instead treats team preview as a
+zero-sum game. Each side's strategies are every (bring 4, lead 2) choice
+(15 x 6 = 90 for a full team), and the payoff of every pairing comes from the
+pairwise 1v1 net score table (damage, speed, bulk and typing via
+score_1v1_matchup).
+
+The payoff matrix is built incrementally. Pair scores come from the shared
+TeamAnalysisCache (via build_matchup_matrix), so a new opponent only costs
+its own column of 1v1 scores.
+"Best answer" aggregates are built by subset (pair -> max over a pair's
+members), and each strategy pairing is the sum of one lead-pair and one
+bring-4 payoff looked up from 15 x 15 tables instead of being recomputed.
+
+Weakly dominated strategies are pruned on both sides, then fictitious play
+finds mixed strategies (which brings and leads to randomise between, and
+how often) together with the game value and an exploitability bound.
+"""
+
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Optional
+
+from .team_matchup import PokemonProfile, build_matchup_matrix
+
+# Share of a strategy pairing's payoff decided by the lead matchup; the rest
+# comes from the full bring-4 matchup
+LEAD_WEIGHT = 0.4
+
+DEFAULT_ITERATIONS = 20000
+DEFAULT_TOLERANCE = 0.05  # stop once exploitability falls below this
+
+# Strategies below this probability are left out of reports
+MIN_REPORTED_PROBABILITY = 0.01
+
+
+@dataclass
+class BringStrategy:
+    """One bring-4 + lead choice and its equilibrium probability."""
+    bring: list[str]
+    lead: list[str]
+    probability: float  # 0-1
+
+    def to_dict(self) -> dict:
+        return {
+            "bring": self.bring,
+            "lead": self.lead,
+            "probability_percent": round(self.probability * 100, 1),
+        }
+
+
+@dataclass
+class BringSolution:
+    """Mixed-strategy solution of the team preview game."""
+    your_strategy: list[BringStrategy]   # most likely first
+    their_strategy: list[BringStrategy]
+    game_value: float        # expected payoff for you at equilibrium
+    exploitability: float    # how far the mixes are from an exact equilibrium
+    your_bring_rates: dict[str, float]   # Pokemon -> % of games brought
+    your_lead_rates: dict[str, float]    # Pokemon -> % of games led
+    their_bring_rates: dict[str, float]
+    their_lead_rates: dict[str, float]
+    strategies: tuple[int, int]          # before pruning (yours, theirs)
+    pruned: tuple[int, int]              # removed as dominated
+    iterations: int
+    notes: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "your_strategy": [s.to_dict() for s in self.your_strategy],
+            "their_strategy": [s.to_dict() for s in self.their_strategy],
+            "game_value": round(self.game_value, 2),
+            "exploitability": round(self.exploitability, 3),
+            "your_bring_rates": self.your_bring_rates,
+            "your_lead_rates": self.your_lead_rates,
+            "their_bring_rates": self.their_bring_rates,
+            "their_lead_rates": self.their_lead_rates,
+            "strategies": list(self.strategies),
+            "pruned": list(self.pruned),
+            "iterations": self.iterations,
+            "notes": self.notes,
+        }
+
+
+def _strategies(n: int) -> list[tuple[int, int]]:
+    """Every (bring mask, lead mask) for an n-Pokemon team."""
+    brings = (
+        [sum(1 << i for i in combo) for combo in combinations(range(n), 4)]
+        if n > 4 else [(1 << n) - 1]
+    )
+    result = []
+    for bring in brings:
+        members = [i for i in range(n) if bring >> i & 1]
+        for a, b in combinations(members, 2):
+            result.append((bring, (1 << a) | (1 << b)))
+    return result
+
+
+def _members(mask: int) -> list[int]:
+    return [i for i in range(mask.bit_length()) if mask >> i & 1]
+
+
+class _SubsetAggregates:
+    """Best-answer vectors per subset, each built from a one-smaller subset.
+
+    For your subsets: the best net score any member has into each of their
+    Pokemon. For theirs: the worst (for you) net score any member forces on
+    each of yours.
+    """
+
+    def __init__(self, matrix: list[list[float]]):
+        self.matrix = matrix
+        self.n_yours = len(matrix)
+        self.n_theirs = len(matrix[0]) if matrix else 0
+        self._best: dict[int, list[float]] = {}
+        self._worst: dict[int, list[float]] = {}
+
+    def best(self, mask: int) -> list[float]:
+        vector = self._best.get(mask)
+        if vector is None:
+            low = mask & -mask
+            row = self.matrix[low.bit_length() - 1]
+            rest = mask ^ low
+            vector = row if not rest else [max(a, b) for a, b in zip(self.best(rest), row)]
+            self._best[mask] = vector
+        return vector
+
+    def worst(self, mask: int) -> list[float]:
+        vector = self._worst.get(mask)
+        if vector is None:
+            low = mask & -mask
+            j = low.bit_length() - 1
+            column = [row[j] for row in self.matrix]
+            rest = mask ^ low
+            vector = column if not rest else [min(a, b) for a, b in zip(self.worst(rest), column)]
+            self._worst[mask] = vector
+        return vector
+
+    def payoff(self, yours: int, theirs: int) -> float:
+        """Mean of your best answer to each of theirs and their best answer to each of yours."""
+        best = self.best(yours)
+        worst = self.worst(theirs)
+        their_members = _members(theirs)
+        your_members = _members(yours)
+        attack = sum(best[j] for j in their_members) / len(their_members)
+        defend = sum(worst[i] for i in your_members) / len(your_members)
+        return (attack + defend) / 2
+
+
+def build_payoff_matrix(
+    matrix: list[list[float]],
+    your_strategies: list[tuple[int, int]],
+    their_strategies: list[tuple[int, int]],
+    lead_weight: float = LEAD_WEIGHT,
+) -> list[list[float]]:
+    """Payoff (for you) of every strategy pairing from a pairwise net matrix."""
+    aggregates = _SubsetAggregates(matrix)
+    lead_payoffs: dict[tuple[int, int], float] = {}
+    bring_payoffs: dict[tuple[int, int], float] = {}
+    payoffs = []
+    for bring, lead in your_strategies:
+        row = []
+        for their_bring, their_lead in their_strategies:
+            lead_key = (lead, their_lead)
+            lead_value = lead_payoffs.get(lead_key)
+            if lead_value is None:
+                lead_value = lead_payoffs[lead_key] = aggregates.payoff(lead, their_lead)
+            bring_key = (bring, their_bring)
+            bring_value = bring_payoffs.get(bring_key)
+            if bring_value is None:
+                bring_value = bring_payoffs[bring_key] = aggregates.payoff(bring, their_bring)
+            row.append(lead_weight * lead_value + (1 - lead_weight) * bring_value)
+        payoffs.append(row)
+    return payoffs
+
+
+def prune_dominated(payoffs: list[list[float]]) -> tuple[list[int], list[int]]:
+    """Iteratively remove weakly dominated rows (maximiser) and columns (minimiser).
+
+    Returns:
+        Indices of the surviving rows and columns
+    """
+    rows = list(range(len(payoffs)))
+    cols = list(range(len(payoffs[0]) if payoffs else 0))
+    changed = True
+    while changed:
+        changed = False
+
+        # Rows: a row can only be dominated by one with at least its total
+        row_values = {r: [payoffs[r][c] for c in cols] for r in rows}
+        ordered = sorted(rows, key=lambda r: sum(row_values[r]), reverse=True)
+        kept: list[int] = []
+        for r in ordered:
+            values = row_values[r]
+            if any(
+                all(a >= b for a, b in zip(row_values[k], values)) for k in kept
+            ):
+                changed = True
+                continue
+            kept.append(r)
+        rows = sorted(kept)
+
+        col_values = {c: [payoffs[r][c] for r in rows] for c in cols}
+        ordered = sorted(cols, key=lambda c: sum(col_values[c]))
+        kept = []
+        for c in ordered:
+            values = col_values[c]
+            if any(
+                all(a <= b for a, b in zip(col_values[k], values)) for k in kept
+            ):
+                changed = True
+                continue
+            kept.append(c)
+        cols = sorted(kept)
+    return rows, cols
+
+
+def fictitious_play(
+    payoffs: list[list[float]],
+    iterations: int = DEFAULT_ITERATIONS,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> tuple[list[float], list[float], float, float, int]:
+    """Approximate equilibrium of a zero-sum matrix game (row player maximises).
+
+    Each step both players best-respond to the other's empirical mix; the
+    running payoff vectors are updated with one row and one column, so an
+    iteration costs O(rows + columns).
+
+    Returns:
+        (row mix, column mix, game value, exploitability, iterations run)
+    """
+    n = len(payoffs)
+    m = len(payoffs[0])
+    columns = [[payoffs[r][c] for r in range(n)] for c in range(m)]
+    row_counts = [0] * n
+    col_counts = [0] * m
+    row_totals = [0.0] * n  # payoff of each row against their history
+    col_totals = [0.0] * m  # payoff of each column against your history
+    r = 0
+    c = 0
+    check_every = max(100, iterations // 20)
+    gap = float("inf")
+    value = 0.0
+    done = 0
+
+    for step in range(1, iterations + 1):
+        row_counts[r] += 1
+        col_counts[c] += 1
+        for i, v in enumerate(payoffs[r]):
+            col_totals[i] += v
+        for i, v in enumerate(columns[c]):
+            row_totals[i] += v
+        r = max(range(n), key=row_totals.__getitem__)
+        c = min(range(m), key=col_totals.__getitem__)
+        done = step
+        if step % check_every == 0 or step == iterations:
+            upper = row_totals[r] / step  # best you can do vs their mix
+            lower = col_totals[c] / step  # worst they can hold you to vs your mix
+            gap = upper - lower
+            value = (upper + lower) / 2
+            if gap <= tolerance:
+                break
+
+    row_mix = [count / done for count in row_counts]
+    col_mix = [count / done for count in col_counts]
+    return row_mix, col_mix, value, max(gap, 0.0), done
+
+
+def _rates(
+    names: list[str], strategies: list[tuple[int, int]], mix: list[float], use_lead: bool,
+) -> dict[str, float]:
+    rates = [0.0] * len(names)
+    for (bring, lead), p in zip(strategies, mix):
+        for i in _members(lead if use_lead else bring):
+            rates[i] += p
+    return {name: round(rate * 100, 1) for name, rate in zip(names, rates)}
+
+
+def _report(
+    names: list[str], strategies: list[tuple[int, int]], mix: list[float],
+) -> list[BringStrategy]:
+    chosen = [
+        BringStrategy(
+            bring=[names[i] for i in _members(bring)],
+            lead=[names[i] for i in _members(lead)],
+            probability=p,
+        )
+        for (bring, lead), p in zip(strategies, mix)
+        if p >= MIN_REPORTED_PROBABILITY
+    ]
+    chosen.sort(key=lambda s: s.probability, reverse=True)
+    return chosen
+
+
+def solve_bring_game(
+    your_profiles: list[PokemonProfile],
+    their_profiles: list[PokemonProfile],
+    matrix: Optional[list[list[float]]] = None,
+    lead_weight: float = LEAD_WEIGHT,
+    iterations: int = DEFAULT_ITERATIONS,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> BringSolution:
+    """Solve team preview as a zero-sum game over bring-4s and leads.
+
+    Args:
+        your_profiles: Your team (2-6 Pokemon)
+        their_profiles: Their team (2-6 Pokemon)
+        matrix: Precomputed pairwise net matrix (e.g. from the game plan);
+            otherwise built with build_matchup_matrix
+        lead_weight: Share of the payoff decided by the lead matchup
+        iterations: Fictitious play iteration cap
+        tolerance: Stop once the exploitability bound drops below this
+
+    Returns:
+        BringSolution with mixed strategies for both sides
+    """
+    if len(your_profiles) < 2 or len(their_profiles) < 2:
+        raise ValueError("Each team needs at least 2 Pokemon")
+    if matrix is None:
+        matrix, _ = build_matchup_matrix(
+            [p.build for p in your_profiles], [p.build for p in their_profiles]
+        )
+
+    your_names = [p.name for p in your_profiles]
+    their_names = [p.name for p in their_profiles]
+    your_all = _strategies(len(your_profiles))
+    their_all = _strategies(len(their_profiles))
+    payoffs = build_payoff_matrix(matrix, your_all, their_all, lead_weight)
+
+    rows, cols = prune_dominated(payoffs)
+    reduced = [[payoffs[r][c] for c in cols] for r in rows]
+    row_mix, col_mix, value, gap, done = fictitious_play(reduced, iterations, tolerance)
+
+    your_strategies = [your_all[r] for r in rows]
+    their_strategies = [their_all[c] for c in cols]
+
+    notes = []
+    if len(rows) == 1:
+        notes.append("One bring/lead choice dominates all others for you")
+    if gap > tolerance:
+        notes.append(f"Stopped at the iteration cap; mixes are within {gap:.2f} of equilibrium")
+
+    return BringSolution(
+        your_strategy=_report(your_names, your_strategies, row_mix),
+        their_strategy=_report(their_names, their_strategies, col_mix),
+        game_value=value,
+        exploitability=gap,
+        your_bring_rates=_rates(your_names, your_strategies, row_mix, use_lead=False),
+        your_lead_rates=_rates(your_names, your_strategies, row_mix, use_lead=True),
+        their_bring_rates=_rates(their_names, their_strategies, col_mix, use_lead=False),
+        their_lead_rates=_rates(their_names, their_strategies, col_mix, use_lead=True),
+        strategies=(len(your_all), len(their_all)),
+        pruned=(len(your_all) - len(rows), len(their_all) - len(cols)),
+        iterations=done,
+        notes=notes,
+    )
@@ -2,12 +2,21 @@
 
 Runs N moves × M defenders × K scenarios in a single call,
 returning structured results grouped by defender → move → scenario.
+
+Results are held column-wise (damage, HP and percentages in typed arrays,
+defender/move/scenario/verdict as interned ids) with indexes by defender,
+move, scenario and cell, so filtering and table building never scan the
+whole run. Showdown-style calc strings are rendered only for the rows that
+are read, so a 30-defender, 8-scenario run that shows one page of calc
+strings formats one page of them.
 """
 
 import logging
 import time
+from array import array
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -145,21 +154,349 @@ class BulkCalcResult:
     calc_string: str
 
 
+class BulkCalcRow:
+    """Read-only view of one row of a BulkCalcTable.
+
+    Has the same attributes as BulkCalcResult; ``calc_string`` is rendered
+    on access.
+    """
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "BulkCalcTable", index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def defender_name(self) -> str:
+        return self._table.defender_names[self._table.defender_ids[self._index]]
+
+    @property
+    def move_name(self) -> str:
+        return self._table.move_names[self._table.move_ids[self._index]]
+
+    @property
+    def scenario_name(self) -> str:
+        return self._table.scenarios[self._table.scenario_ids[self._index]].name
+
+    @property
+    def scenario_display(self) -> str:
+        return self._table.scenarios[self._table.scenario_ids[self._index]].display_name
+
+    @property
+    def min_pct(self) -> float:
+        return self._table.min_pct[self._index]
+
+    @property
+    def max_pct(self) -> float:
+        return self._table.max_pct[self._index]
+
+    @property
+    def min_damage(self) -> int:
+        return self._table.min_damage[self._index]
+
+    @property
+    def max_damage(self) -> int:
+        return self._table.max_damage[self._index]
+
+    @property
+    def defender_hp(self) -> int:
+        return self._table.defender_hp[self._index]
+
+    @property
+    def ko_chance(self) -> str:
+        return self._table.verdicts[self._table.verdict_ids[self._index]]
+
+    @property
+    def calc_string(self) -> str:
+        return self._table.calc_string(self._index)
+
+    def to_result(self) -> BulkCalcResult:
+        """Materialize the row (rendering its calc string)."""
+        return BulkCalcResult(
+            defender_name=self.defender_name,
+            move_name=self.move_name,
+            scenario_name=self.scenario_name,
+            scenario_display=self.scenario_display,
+            min_pct=self.min_pct,
+            max_pct=self.max_pct,
+            min_damage=self.min_damage,
+            max_damage=self.max_damage,
+            defender_hp=self.defender_hp,
+            ko_chance=self.ko_chance,
+            calc_string=self.calc_string,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkCalcRow({self.defender_name!r}, {self.move_name!r}, "
+            f"{self.scenario_name!r}, {self.min_pct}-{self.max_pct}%)"
+        )
+
+
+# build_ids entry for rows without a stored defender build
+NO_BUILD = 0xFFFF
+
+
+def _intern(names: list, ids: dict, key) -> int:
+    index = ids.get(key)
+    if index is None:
+        index = ids[key] = len(names)
+        names.append(key)
+    return index
+
+
+class BulkCalcTable(Sequence):
+    """Columnar results of a bulk run, indexed by defender, move and scenario.
+
+    Numbers live in typed arrays and names as interned ids, so a row costs
+    a few dozen bytes however long its calc string would be. Iterating or
+    indexing yields BulkCalcRow views; ``rows()`` and ``row()`` answer
+    grouped lookups from indexes built as rows are added.
+    """
+
+    def __init__(self, attacker: Optional[PokemonBuild] = None):
+        self.attacker = attacker
+        self.defender_names: list[str] = []
+        self.move_names: list[str] = []
+        self.scenarios: list[ScenarioConfig] = []
+        self.verdicts: list[str] = []
+        self._defender_index: dict[str, int] = {}
+        self._move_index: dict[str, int] = {}
+        self._scenario_index: dict[str, int] = {}
+        self._verdict_index: dict[str, int] = {}
+
+        self.defender_ids = array("H")
+        self.move_ids = array("H")
+        self.scenario_ids = array("H")
+        self.verdict_ids = array("H")
+        self.build_ids = array("H")
+        self.min_damage = array("i")
+        self.max_damage = array("i")
+        self.defender_hp = array("i")
+        self.min_pct = array("d")
+        self.max_pct = array("d")
+
+        self._by_defender: dict[int, list[int]] = {}
+        self._by_move: dict[int, list[int]] = {}
+        self._by_scenario: dict[int, list[int]] = {}
+        self._cells: dict[tuple[int, int, int], int] = {}
+
+        # Inputs calc strings are rendered from, and strings given up front.
+        # Defender builds are kept per build, not per name, so two spreads of
+        # the same species each render their own label.
+        self._defender_builds: list[PokemonBuild] = []
+        self._build_index: dict[int, int] = {}  # id(build) -> build id
+        self._moves: dict[int, Move] = {}
+        self._fixed_strings: dict[int, str] = {}
+        self._label_cache: dict = {}
+
+    @classmethod
+    def from_results(cls, results: list[BulkCalcResult]) -> "BulkCalcTable":
+        """Table holding already-materialized rows (calc strings included)."""
+        table = cls()
+        for r in results:
+            scenario = ScenarioConfig(name=r.scenario_name, display_name=r.scenario_display)
+            index = table._append(
+                r.defender_name, r.move_name, scenario, r.ko_chance,
+                r.min_damage, r.max_damage, r.defender_hp, r.min_pct, r.max_pct,
+            )
+            table._fixed_strings[index] = r.calc_string
+        return table
+
+    def _append(
+        self,
+        defender_name: str,
+        move_name: str,
+        scenario: ScenarioConfig,
+        verdict: str,
+        min_damage: int,
+        max_damage: int,
+        defender_hp: int,
+        min_pct: float,
+        max_pct: float,
+        build: int = NO_BUILD,
+    ) -> int:
+        d = _intern(self.defender_names, self._defender_index, defender_name)
+        m = _intern(self.move_names, self._move_index, move_name)
+        s = self._scenario_index.get(scenario.name)
+        if s is None:
+            s = self._scenario_index[scenario.name] = len(self.scenarios)
+            self.scenarios.append(scenario)
+        v = _intern(self.verdicts, self._verdict_index, verdict)
+
+        index = len(self.min_damage)
+        self.defender_ids.append(d)
+        self.move_ids.append(m)
+        self.scenario_ids.append(s)
+        self.verdict_ids.append(v)
+        self.build_ids.append(build)
+        self.min_damage.append(min_damage)
+        self.max_damage.append(max_damage)
+        self.defender_hp.append(defender_hp)
+        self.min_pct.append(min_pct)
+        self.max_pct.append(max_pct)
+
+        self._by_defender.setdefault(d, []).append(index)
+        self._by_move.setdefault(m, []).append(index)
+        self._by_scenario.setdefault(s, []).append(index)
+        self._cells.setdefault((d, m, s), index)
+        return index
+
+    def add(
+        self,
+        defender: PokemonBuild,
+        move: Move,
+        scenario: ScenarioConfig,
+        result: DamageResult,
+    ) -> int:
+        """Record one calc; its calc string is rendered when first read."""
+        index = self._append(
+            defender.name, move.name, scenario, result.ko_chance,
+            result.min_damage, result.max_damage, result.defender_hp,
+            result.min_percent, result.max_percent, self._intern_build(defender),
+        )
+        self._moves.setdefault(self.move_ids[index], move)
+        return index
+
+    def _intern_build(self, defender: PokemonBuild) -> int:
+        # Keyed by identity: the build is held in _defender_builds, so its
+        # id can't be reused while the table lives
+        index = self._build_index.get(id(defender))
+        if index is None:
+            index = self._build_index[id(defender)] = len(self._defender_builds)
+            self._defender_builds.append(defender)
+        return index
+
+    def extend(self, other: "BulkCalcTable") -> None:
+        """Append every row of another table (ids are remapped)."""
+        if self.attacker is None:
+            self.attacker = other.attacker
+        for i in range(len(other)):
+            d, m, b = other.defender_ids[i], other.move_ids[i], other.build_ids[i]
+            if b != NO_BUILD:
+                b = self._intern_build(other._defender_builds[b])
+            index = self._append(
+                other.defender_names[d],
+                other.move_names[m],
+                other.scenarios[other.scenario_ids[i]],
+                other.verdicts[other.verdict_ids[i]],
+                other.min_damage[i], other.max_damage[i], other.defender_hp[i],
+                other.min_pct[i], other.max_pct[i], b,
+            )
+            if i in other._fixed_strings:
+                self._fixed_strings[index] = other._fixed_strings[i]
+            if m in other._moves:
+                self._moves.setdefault(self.move_ids[index], other._moves[m])
+
+    def __len__(self) -> int:
+        return len(self.min_damage)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[BulkCalcRow, list[BulkCalcRow]]:
+        if isinstance(index, slice):
+            return [BulkCalcRow(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("bulk calc row out of range")
+        return BulkCalcRow(self, index)
+
+    def __iter__(self) -> Iterator[BulkCalcRow]:
+        for i in range(len(self)):
+            yield BulkCalcRow(self, i)
+
+    def rows(
+        self,
+        defender: Optional[str] = None,
+        move: Optional[str] = None,
+        scenario: Optional[str] = None,
+    ) -> list[BulkCalcRow]:
+        """Rows matching every given name, in run order."""
+        return [BulkCalcRow(self, i) for i in self._matching(defender, move, scenario)]
+
+    def _matching(
+        self,
+        defender: Optional[str] = None,
+        move: Optional[str] = None,
+        scenario: Optional[str] = None,
+    ) -> Sequence[int]:
+        groups = []
+        for name, ids, index in (
+            (defender, self._defender_index, self._by_defender),
+            (move, self._move_index, self._by_move),
+            (scenario, self._scenario_index, self._by_scenario),
+        ):
+            if name is None:
+                continue
+            key = ids.get(name)
+            if key is None:
+                return []
+            groups.append(index[key])
+        if not groups:
+            return range(len(self))
+        groups.sort(key=len)
+        matches = groups[0]
+        for other in groups[1:]:
+            allowed = set(other)
+            matches = [i for i in matches if i in allowed]
+        return matches
+
+    def row(self, defender: str, move: str, scenario: str) -> Optional[BulkCalcRow]:
+        """The row for one defender/move/scenario cell, if it was calculated."""
+        key = (
+            self._defender_index.get(defender),
+            self._move_index.get(move),
+            self._scenario_index.get(scenario),
+        )
+        index = self._cells.get(key)
+        return BulkCalcRow(self, index) if index is not None else None
+
+    def calc_string(self, index: int) -> str:
+        """Showdown-style calc string for one row, rendered on demand."""
+        fixed = self._fixed_strings.get(index)
+        if fixed is not None:
+            return fixed
+        b, m = self.build_ids[index], self.move_ids[index]
+        labels = self._label_cache
+        if "attacker" not in labels:
+            labels["attacker"] = _build_attacker_label(self.attacker)
+        if ("defender", b) not in labels:
+            labels["defender", b] = _build_defender_label(self._defender_builds[b])
+        return _format_calc_string(
+            labels["attacker"],
+            self._moves[m].name.replace("-", " ").title(),
+            labels["defender", b],
+            self.min_damage[index],
+            self.max_damage[index],
+            self.min_pct[index],
+            self.max_pct[index],
+            self.verdicts[self.verdict_ids[index]],
+            self.scenarios[self.scenario_ids[index]],
+        )
+
+
 @dataclass
 class BulkCalcSummary:
-    """Aggregated results from a bulk damage calculation run."""
+    """Aggregated results from a bulk damage calculation run.
+
+    ``results`` is a BulkCalcTable; a list of BulkCalcResult is accepted
+    and converted.
+    """
     attacker_name: str
     attacker_spread_str: str
     move_names: list[str]
     scenario_names: list[str]
     total_calcs: int
-    results: list[BulkCalcResult]
+    results: BulkCalcTable
     # Keyed by scenario name
     ohko_counts: dict[str, int] = field(default_factory=dict)
     twohko_counts: dict[str, int] = field(default_factory=dict)
     defender_spreads: dict[str, str] = field(default_factory=dict)
     defender_items: dict[str, str] = field(default_factory=dict)
 
+    def __post_init__(self):
+        if not isinstance(self.results, BulkCalcTable):
+            self.results = BulkCalcTable.from_results(list(self.results))
+
 
 # =============================================================================
 # Calc string builder
@@ -252,16 +589,34 @@ def build_calc_string(
     "252+ Atk Choice Scarf Urshifu-Rapid-Strike Surging Strikes vs.
      0 HP / 4 Def Chien-Pao: 123-147 (79.4-94.8%) -- guaranteed 2HKO"
     """
-    atk_label = _build_attacker_label(attacker)
-    move_display = move.name.replace("-", " ").title()
-    def_label = _build_defender_label(defender)
+    return _format_calc_string(
+        _build_attacker_label(attacker),
+        move.name.replace("-", " ").title(),
+        _build_defender_label(defender),
+        result.min_damage,
+        result.max_damage,
+        result.min_percent,
+        result.max_percent,
+        result.ko_chance,
+        scenario,
+    )
 
-    min_pct = format_percent(result.min_percent)
-    max_pct = format_percent(result.max_percent)
 
-    verdict = result.ko_chance
+def _format_calc_string(
+    atk_label: str,
+    move_display: str,
+    def_label: str,
+    min_damage: int,
+    max_damage: int,
+    min_percent: float,
+    max_percent: float,
+    verdict: str,
+    scenario: ScenarioConfig,
+) -> str:
+    min_pct = format_percent(min_percent)
+    max_pct = format_percent(max_percent)
 
-    dmg = f"{result.min_damage}-{result.max_damage}"
+    dmg = f"{min_damage}-{max_damage}"
     pct = f"{min_pct}-{max_pct}%"
     calc = (
         f"{atk_label} {move_display} vs. {def_label}: "
@@ -298,7 +653,7 @@ def run_bulk_calcs(
         BulkCalcSummary with all results grouped and counted
     """
     start_time = time.monotonic()
-    results: list[BulkCalcResult] = []
+    results = BulkCalcTable(attacker)
     ohko_counts: dict[str, int] = {s.name: 0 for s in scenarios}
     twohko_counts: dict[str, int] = {s.name: 0 for s in scenarios}
     defender_spreads: dict[str, str] = {}
@@ -336,23 +691,7 @@ def run_bulk_calcs(
                     modifiers.defender_tera_active = True
 
                 result = calculate_damage(attacker, defender, move, modifiers)
-
-                calc_string = build_calc_string(attacker, defender, move, result, scenario)
-
-                bulk_result = BulkCalcResult(
-                    defender_name=defender.name,
-                    move_name=move.name,
-                    scenario_name=scenario.name,
-                    scenario_display=scenario.display_name,
-                    min_pct=result.min_percent,
-                    max_pct=result.max_percent,
-                    min_damage=result.min_damage,
-                    max_damage=result.max_damage,
-                    defender_hp=result.defender_hp,
-                    ko_chance=result.ko_chance,
-                    calc_string=calc_string,
-                )
-                results.append(bulk_result)
+                results.add(defender, move, scenario, result)
 
                 # Count KOs per scenario (best move per defender)
                 if result.is_guaranteed_ohko:
@@ -380,31 +719,70 @@ def run_bulk_calcs(
     )
 
 
+def merge_bulk_summaries(summaries: list[BulkCalcSummary]) -> BulkCalcSummary:
+    """Combine runs over disjoint defender lists (same attacker, moves, scenarios).
+
+    Lets callers run defenders one at a time, reporting each as it finishes,
+    and still build the same summary as a single run_bulk_calcs call.
+    """
+    first = summaries[0]
+    merged = BulkCalcSummary(
+        attacker_name=first.attacker_name,
+        attacker_spread_str=first.attacker_spread_str,
+        move_names=first.move_names,
+        scenario_names=first.scenario_names,
+        total_calcs=0,
+        results=BulkCalcTable(first.results.attacker),
+        ohko_counts={name: 0 for name in first.scenario_names},
+        twohko_counts={name: 0 for name in first.scenario_names},
+    )
+    for summary in summaries:
+        merged.total_calcs += summary.total_calcs
+        merged.results.extend(summary.results)
+        for name in summary.scenario_names:
+            merged.ohko_counts[name] += summary.ohko_counts.get(name, 0)
+            merged.twohko_counts[name] += summary.twohko_counts.get(name, 0)
+        merged.defender_spreads.update(summary.defender_spreads)
+        merged.defender_items.update(summary.defender_items)
+    return merged
+
+
 def get_results_for_defender(
     summary: BulkCalcSummary,
     defender_name: str,
-) -> list[BulkCalcResult]:
+) -> list[BulkCalcRow]:
     """Filter results for a specific defender."""
-    return [r for r in summary.results if r.defender_name == defender_name]
+    return summary.results.rows(defender=defender_name)
 
 
 def get_results_for_scenario(
     summary: BulkCalcSummary,
     scenario_name: str,
-) -> list[BulkCalcResult]:
+) -> list[BulkCalcRow]:
     """Filter results for a specific scenario."""
-    return [r for r in summary.results if r.scenario_name == scenario_name]
+    return summary.results.rows(scenario=scenario_name)
+
+
+def get_result(
+    summary: BulkCalcSummary,
+    defender_name: str,
+    move_name: str,
+    scenario_name: str,
+) -> Optional[BulkCalcRow]:
+    """The result for one defender, move and scenario (None if not calculated)."""
+    return summary.results.row(defender_name, move_name, scenario_name)
 
 
 def get_best_move_per_defender(
     summary: BulkCalcSummary,
     scenario_name: str = "normal",
-) -> dict[str, BulkCalcResult]:
+) -> dict[str, BulkCalcRow]:
     """For each defender, find the move with the highest max damage % in a scenario."""
-    best: dict[str, BulkCalcResult] = {}
-    for r in summary.results:
-        if r.scenario_name != scenario_name:
-            continue
-        if r.defender_name not in best or r.max_pct > best[r.defender_name].max_pct:
-            best[r.defender_name] = r
-    return best
+    table = summary.results
+    max_pct = table.max_pct
+    best: dict[int, int] = {}
+    for i in table._matching(scenario=scenario_name):
+        d = table.defender_ids[i]
+        if d not in best or max_pct[i] > max_pct[best[d]]:
+            best[d] = i
+    return {table.defender_names[d]: BulkCalcRow(table, i) for d, i in best.items()}
@@ -17,11 +17,11 @@ This means: HP stat should roughly equal Defense stat for optimal bulk
 
 from dataclasses import dataclass
 from typing import Optional
-import math
 
 from ..models.pokemon import Nature, NATURE_MODIFIERS
 from ..config import EV_BREAKPOINTS_LV50, normalize_evs
-from .stats import calculate_hp
+from .stats import calculate_hp, optimize_ev_efficiency
+from .stat_table import get_stat_table
 
 
 @dataclass
@@ -60,9 +60,8 @@ def calculate_defense_stat(
     iv: int = 31,
     level: int = 50
 ) -> int:
-    """Calculate Def or SpD stat at level 50."""
-    inner = math.floor((2 * base + iv + ev // 4) * level / 100)
-    return math.floor((inner + 5) * nature_mod)
+    """Calculate Def or SpD stat at level 50 (read from the stat table)."""
+    return get_stat_table().stat(base, ev, nature_mod, iv, level)
 
 
 def calculate_effective_bulk(hp: int, defense: int) -> int:
@@ -96,9 +95,10 @@ def find_optimal_hp_def_ratio(
     best_bulk = 0
     best_hp_evs = 0
     best_def_evs = 0
+    table = get_stat_table()
 
     # Try all valid EV distributions (level 50 breakpoints: 0, 4, 12, 20, 28...)
-    for hp_evs in EV_BREAKPOINTS_LV50:
+    for hp_evs, hp in zip(EV_BREAKPOINTS_LV50, table.row(base_hp, hp=True)):
         if hp_evs > min(252, total_evs):
             break
 
@@ -108,14 +108,12 @@ def find_optimal_hp_def_ratio(
 
         # Optimize to remove any wasted EVs (e.g., 152→148 if same stat)
         # Assuming 31 IVs for competitive play (standard assumption)
-        from .stats import optimize_ev_efficiency
         def_evs = optimize_ev_efficiency(base_def, 31, def_evs, 50, nature_mod_def, "normal")
 
         if def_evs < 0 or def_evs > 252:
             continue
 
-        hp = calculate_hp(base_hp, iv=31, ev=hp_evs)
-        defense = calculate_defense_stat(base_def, def_evs, nature_mod_def)
+        defense = table.stat(base_def, def_evs, nature_mod_def)
         bulk = calculate_effective_bulk(hp, defense)
 
         if bulk > best_bulk:
@@ -196,7 +194,7 @@ def calculate_optimal_bulk_distribution(
         actual_total = hp_evs + def_evs + spd_evs
 
         # Calculate stats
-        hp = calculate_hp(base_hp, iv=31, ev=hp_evs + existing_hp_evs)
+        hp = get_stat_table().hp(base_hp, hp_evs + existing_hp_evs)
         defense = calculate_defense_stat(base_def, def_evs + existing_def_evs, nature_mod_def)
         sp_defense = calculate_defense_stat(base_spd, spd_evs + existing_spd_evs, nature_mod_spd)
 
@@ -337,14 +335,14 @@ def optimize_for_survival(
     min_def_evs = 0
     found = False
 
-    for hp_evs in EV_BREAKPOINTS_LV50:
+    table = get_stat_table()
+    for hp_evs, hp in zip(EV_BREAKPOINTS_LV50, table.row(base_hp, hp=True)):
         if hp_evs > min(252, total_evs):
             break
         for def_evs in EV_BREAKPOINTS_LV50:
             if def_evs > min(252, total_evs - hp_evs):
                 break
-            hp = calculate_hp(base_hp, iv=31, ev=hp_evs)
-            defense = calculate_defense_stat(base_defense, def_evs, nature_mod)
+            defense = table.stat(base_defense, def_evs, nature_mod)
 
             # Rough survival check (actual formula is more complex)
             if hp > incoming_damage:
@@ -20,12 +20,14 @@ Reference: https://bulbapedia.bulbagarden.net/wiki/Damage
 """
 
 import math
+from collections import OrderedDict
 from dataclasses import dataclass, replace
 from typing import Optional
 
 from ..models.pokemon import PokemonBuild
 from ..models.move import Move, MoveCategory, get_multi_hit_info, GEN9_SPECIAL_MOVES, get_move_type_for_user
 from ..config import EV_BREAKPOINTS_LV50
+from ..metrics import record_damage_calc
 from .stats import calculate_all_stats
 from .modifiers import (
     DamageModifiers,
@@ -289,6 +291,29 @@ MOD_MUSCLE_BAND = 4506      # ~1.1x (Muscle Band - physical moves)
 MOD_WISE_GLASSES = 4506     # ~1.1x (Wise Glasses - special moves)
 MOD_NORMAL_GEM = 6144       # 1.5x (Normal Gem - first Normal move, one-time use)
 
+# Type-boosting items (1.2x base power for moves of their type)
+TYPE_BOOST_ITEMS = {
+    "charcoal": "Fire",
+    "mystic-water": "Water",
+    "magnet": "Electric",
+    "miracle-seed": "Grass",
+    "never-melt-ice": "Ice",
+    "black-belt": "Fighting",
+    "poison-barb": "Poison",
+    "soft-sand": "Ground",
+    "sharp-beak": "Flying",
+    "twisted-spoon": "Psychic",
+    "silver-powder": "Bug",
+    "hard-stone": "Rock",
+    "spell-tag": "Ghost",
+    "dragon-fang": "Dragon",
+    "black-glasses": "Dark",
+    "metal-coat": "Steel",
+    "silk-scarf": "Normal",
+    "fairy-feather": "Fairy",
+    # Note: Ogerpon masks are NOT here - they boost ALL moves, handled separately
+}
+
 # Resistance berries - reduce super-effective damage by 50%
 RESISTANCE_BERRIES = {
     "occa-berry": "Fire",
@@ -489,6 +514,14 @@ def format_percent(value: float) -> str:
     return formatted
 
 
+def _percent_of(damage: int, defender_hp: int) -> float:
+    """Damage as a share of HP, truncated to one decimal like Showdown.
+
+    e.g., 98.49% becomes 98.4%, not 98.5%
+    """
+    return int((damage / defender_hp) * 1000) / 10
+
+
 @dataclass
 class DamageResult:
     """Result of damage calculation."""
@@ -512,29 +545,136 @@ class DamageResult:
         return f"{self.min_damage}-{self.max_damage} ({min_pct}%-{max_pct}%)"
 
 
-def calculate_damage(
+@dataclass(frozen=True)
+class DamageBounds:
+    """Lowest and highest damage of a calc, without the full roll spread.
+
+    Every step after the random factor only ever rounds or scales, so the
+    85% and 100% rolls bound the fourteen in between. For multi-hit moves
+    the bounds are the per-hit extremes times the hit count, the same ends
+    DamageResult reports. Screening with bounds settles most cases of a
+    search; only ambiguous ones (some rolls KO, some don't) need the exact
+    calc for their probabilities.
+    """
+    min_damage: int
+    max_damage: int
+    defender_hp: int
+
+    @property
+    def min_percent(self) -> float:
+        return _percent_of(self.min_damage, self.defender_hp)
+
+    @property
+    def max_percent(self) -> float:
+        return _percent_of(self.max_damage, self.defender_hp)
+
+    @property
+    def is_guaranteed_ohko(self) -> bool:
+        """Every roll KOs (matches DamageResult.is_guaranteed_ohko)."""
+        return self.min_damage >= self.defender_hp
+
+    @property
+    def is_possible_ohko(self) -> bool:
+        """At least one roll KOs (matches DamageResult.is_possible_ohko)."""
+        return self.max_damage >= self.defender_hp
+
+    @property
+    def is_ambiguous(self) -> bool:
+        """Some rolls KO and some don't: only the exact calc gives the odds."""
+        return self.min_damage < self.defender_hp <= self.max_damage
+
+    @property
+    def damage_range(self) -> str:
+        """Formatted damage range string (matches DamageResult.damage_range)."""
+        min_pct = format_percent(self.min_percent)
+        max_pct = format_percent(self.max_percent)
+        return f"{self.min_damage}-{self.max_damage} ({min_pct}%-{max_pct}%)"
+
+
+# =============================================================================
+# Compiled calc plans
+# =============================================================================
+
+# Plans kept by the shared cache (one per attacker/defender/move/field combo)
+MAX_CALC_PLANS = 4096
+
+# Variable base power kinds that read the calculated Speed stats
+SPEED_BP_KINDS = ("gyro_ball", "electro_ball")
+
+
+@dataclass(frozen=True)
+class CalcPlan:
+    """Everything in a damage calc that doesn't depend on the two stat lines.
+
+    Compiled once per (attacker identity, defender identity, move, modifiers);
+    evaluate_calc_plan then only does integer arithmetic on calculated stats,
+    so EV sweeps skip the ability/item/move lookups after the first call.
+    """
+    # (ko_chance, reason) for status moves and ability/item immunities
+    no_damage: Optional[tuple[str, str]] = None
+    attack_from_defender: bool = False  # Foul Play
+    attack_stat_name: str = "attack"
+    defense_stat_name: str = "defense"
+    # 4096-based stat modifiers, applied one at a time in order
+    attack_mods: tuple[int, ...] = ()
+    defense_mods: tuple[int, ...] = ()
+    power: int = 0
+    # Gyro Ball / Electro Ball: (move name, base power, move data, modifiers);
+    # power is recomputed from both Speed stats and power_steps re-applied
+    speed_bp: Optional[tuple] = None
+    power_steps: tuple[tuple[str, int], ...] = ()
+    base_mods: tuple[int, ...] = ()  # spread, weather, terrain, crit
+    stab_mod: int = MOD_NEUTRAL
+    type_eff: float = 1.0
+    display_type_eff: float = 1.0  # before Tera Shell / Scrappy adjustments
+    collision_boost: bool = False
+    final_mod: int = MOD_NEUTRAL
+    hit_count: int = 1
+    always_crit: bool = False
+    labels: tuple[str, ...] = ()
+
+
+def _no_damage_plan(ko_chance: str, reason: str) -> CalcPlan:
+    return CalcPlan(no_damage=(ko_chance, reason))
+
+
+def _apply_power_steps(power: int, steps: tuple[tuple[str, int], ...]) -> int:
+    """Apply base power steps; Technician and the Tera floor depend on power."""
+    for step, value in steps:
+        if step == "mod":
+            power = apply_mod(power, value)
+        elif step == "technician":
+            if power <= 60:
+                power = apply_mod(power, value)
+        elif power < value:  # tera floor
+            power = value
+    return power
+
+
+def compile_calc_plan(
     attacker: PokemonBuild,
     defender: PokemonBuild,
     move: Move,
-    modifiers: Optional[DamageModifiers] = None
-) -> DamageResult:
+    modifiers: DamageModifiers,
+    tera_blast_physical: bool = False,
+) -> CalcPlan:
     """
-    Calculate damage from one Pokemon to another.
+    Resolve every stat-independent part of a damage calc into a CalcPlan.
+
+    Only the attacker's and defender's names, types, items and abilities are
+    read here; EVs, IVs, nature and level are left to evaluate_calc_plan.
 
     Args:
-        attacker: Attacking Pokemon with full build
-        defender: Defending Pokemon with full build
+        attacker: Attacking Pokemon (identity only)
+        defender: Defending Pokemon (identity only)
         move: Move being used
         modifiers: Battle conditions and modifiers
+        tera_blast_physical: Tera Blast is physical (attacker's Atk > SpA)
 
     Returns:
-        DamageResult with damage range, percentages, and KO probability
+        Frozen CalcPlan
     """
-    if modifiers is None:
-        modifiers = DamageModifiers()
-
     # Auto-fill attacker/defender items from Pokemon builds if not specified
-    from dataclasses import replace
     if modifiers.attacker_item is None and attacker.item:
         modifiers = replace(modifiers, attacker_item=attacker.item)
     if modifiers.defender_item is None and defender.item:
@@ -546,21 +686,22 @@ def calculate_damage(
     if modifiers.defender_ability is None and defender.ability:
         modifiers = replace(modifiers, defender_ability=defender.ability)
 
+    atk_ability = normalize_ability(modifiers.attacker_ability) if modifiers.attacker_ability else None
+    def_ability = normalize_ability(modifiers.defender_ability) if modifiers.defender_ability else None
+    atk_item = normalize_item(modifiers.attacker_item) if modifiers.attacker_item else None
+    def_item = normalize_item(modifiers.defender_item) if modifiers.defender_item else None
+
     # Auto-detect Ruin abilities from attacker/defender ability names.
     # Ruin abilities are field effects (not stat stages), so they always apply
     # even on critical hits. Only auto-detect if the flags aren't already set.
-    if modifiers.attacker_ability:
-        atk_ab = normalize_ability(modifiers.attacker_ability)
-        if atk_ab == "sword-of-ruin" and not modifiers.sword_of_ruin:
-            modifiers = replace(modifiers, sword_of_ruin=True)
-        elif atk_ab == "beads-of-ruin" and not modifiers.beads_of_ruin:
-            modifiers = replace(modifiers, beads_of_ruin=True)
-    if modifiers.defender_ability:
-        def_ab = normalize_ability(modifiers.defender_ability)
-        if def_ab == "tablets-of-ruin" and not modifiers.tablets_of_ruin:
-            modifiers = replace(modifiers, tablets_of_ruin=True)
-        elif def_ab == "vessel-of-ruin" and not modifiers.vessel_of_ruin:
-            modifiers = replace(modifiers, vessel_of_ruin=True)
+    if atk_ability == "sword-of-ruin" and not modifiers.sword_of_ruin:
+        modifiers = replace(modifiers, sword_of_ruin=True)
+    elif atk_ability == "beads-of-ruin" and not modifiers.beads_of_ruin:
+        modifiers = replace(modifiers, beads_of_ruin=True)
+    if def_ability == "tablets-of-ruin" and not modifiers.tablets_of_ruin:
+        modifiers = replace(modifiers, tablets_of_ruin=True)
+    elif def_ability == "vessel-of-ruin" and not modifiers.vessel_of_ruin:
+        modifiers = replace(modifiers, vessel_of_ruin=True)
 
     # Check for multi-hit move mechanics
     multi_hit_info = get_multi_hit_info(move.name)
@@ -583,50 +724,30 @@ def calculate_damage(
 
     # Non-damaging moves
     if not move.is_damaging:
-        return DamageResult(
-            min_damage=0,
-            max_damage=0,
-            min_percent=0,
-            max_percent=0,
-            rolls=[0] * 16,
-            defender_hp=1,
-            ko_chance="N/A (Status move)",
-            is_guaranteed_ohko=False,
-            is_possible_ohko=False,
-            details={"reason": "Status move"}
-        )
+        return _no_damage_plan("N/A (Status move)", "Status move")
 
     # Handle type-changing abilities (Aerilate, Pixilate, Refrigerate, Galvanize)
     # These change Normal-type moves to another type and apply a 1.2x power boost
     effective_move_type = move.type.capitalize()
     ate_ability_boost = False
-    if modifiers.attacker_ability:
-        ability = normalize_ability(modifiers.attacker_ability)
-        if ability in ATE_ABILITIES and move.type.capitalize() == "Normal":
-            effective_move_type = ATE_ABILITIES[ability]
-            ate_ability_boost = True
+    if atk_ability in ATE_ABILITIES and effective_move_type == "Normal":
+        effective_move_type = ATE_ABILITIES[atk_ability]
+        ate_ability_boost = True
 
-    # Get normalized move name for immunity checks
     move_name_normalized = normalize_move(move.name)
 
     # Handle form-dependent move types (Ivy Cudgel changes type based on Ogerpon form)
-    if attacker and move_name_normalized == "ivy-cudgel":
+    if move_name_normalized == "ivy-cudgel":
         effective_move_type = get_move_type_for_user(move.name, attacker.name, effective_move_type)
 
-    # Handle Tera Blast: type and category change when Terastallized
-    # When Terastallized, Tera Blast becomes the attacker's Tera type
-    # Also becomes physical if Attack > Special Attack
-    tera_blast_physical = False
+    # Handle Tera Blast: becomes the attacker's Tera type when Terastallized
+    # (its physical/special switch is decided by the caller from stats)
     if move_name_normalized == "tera-blast" and modifiers.tera_active and modifiers.tera_type:
         effective_move_type = modifiers.tera_type.capitalize()
-        # Check if should be physical (Atk > SpA after all modifiers)
-        if attacker:
-            stats = calculate_all_stats(attacker)
-            if stats["attack"] > stats["special_attack"]:
-                tera_blast_physical = True
+    else:
+        tera_blast_physical = False
 
     # Determine if move is physical (accounting for Tera Blast category change)
-    # This variable should be used instead of move.category == MoveCategory.PHYSICAL
     is_physical = tera_blast_physical or move.category == MoveCategory.PHYSICAL
 
     # Weather Ball changes type and doubles power in weather
@@ -642,172 +763,96 @@ def calculate_damage(
             effective_move_type = weather_type_map[modifiers.weather]
             weather_ball_boosted = True
 
-    # Check if attacker has Mold Breaker or similar (bypasses defender abilities)
-    attacker_ignores_abilities = False
-    if modifiers.attacker_ability:
-        atk_ability = normalize_ability(modifiers.attacker_ability)
-        attacker_ignores_abilities = atk_ability in MOLD_BREAKER_ABILITIES
-
-    # Check for ability-based type immunities (unless attacker ignores abilities)
-    if modifiers.defender_ability and not attacker_ignores_abilities:
-        def_ability = normalize_ability(modifiers.defender_ability)
-
-        # Check type-based immunities
-        if def_ability in IMMUNITY_ABILITIES:
-            immune_types = IMMUNITY_ABILITIES[def_ability]
-            if effective_move_type in immune_types:
-                return DamageResult(
-                    min_damage=0,
-                    max_damage=0,
-                    min_percent=0,
-                    max_percent=0,
-                    rolls=[0] * 16,
-                    defender_hp=1,
-                    ko_chance=f"Immune ({def_ability.replace('-', ' ').title()})",
-                    is_guaranteed_ohko=False,
-                    is_possible_ohko=False,
-                    details={"reason": f"Immune due to {def_ability.replace('-', ' ').title()}"}
-                )
-
-        # Wind Rider immunity to wind moves
-        if def_ability == "wind-rider" and move_name_normalized in WIND_MOVES:
-            return DamageResult(
-                min_damage=0, max_damage=0, min_percent=0, max_percent=0,
-                rolls=[0] * 16, defender_hp=1,
-                ko_chance="Immune (Wind Rider)",
-                is_guaranteed_ohko=False, is_possible_ohko=False,
-                details={"reason": "Immune due to Wind Rider"}
-            )
-
-        # Soundproof immunity to sound moves
-        if def_ability == "soundproof" and move_name_normalized in SOUND_MOVES:
-            return DamageResult(
-                min_damage=0, max_damage=0, min_percent=0, max_percent=0,
-                rolls=[0] * 16, defender_hp=1,
-                ko_chance="Immune (Soundproof)",
-                is_guaranteed_ohko=False, is_possible_ohko=False,
-                details={"reason": "Immune due to Soundproof"}
-            )
-
-        # Bulletproof immunity to ball/bomb moves
-        if def_ability == "bulletproof" and move_name_normalized in BALL_BOMB_MOVES:
-            return DamageResult(
-                min_damage=0, max_damage=0, min_percent=0, max_percent=0,
-                rolls=[0] * 16, defender_hp=1,
-                ko_chance="Immune (Bulletproof)",
-                is_guaranteed_ohko=False, is_possible_ohko=False,
-                details={"reason": "Immune due to Bulletproof"}
-            )
+    # Check for ability-based immunities (unless attacker has Mold Breaker or similar)
+    if def_ability and atk_ability not in MOLD_BREAKER_ABILITIES:
+        ability_name = def_ability.replace('-', ' ').title()
+        if effective_move_type in IMMUNITY_ABILITIES.get(def_ability, ()):
+            return _no_damage_plan(f"Immune ({ability_name})", f"Immune due to {ability_name}")
+        # Wind Rider, Soundproof and Bulletproof block whole move groups
+        if (
+            (def_ability == "wind-rider" and move_name_normalized in WIND_MOVES)
+            or (def_ability == "soundproof" and move_name_normalized in SOUND_MOVES)
+            or (def_ability == "bulletproof" and move_name_normalized in BALL_BOMB_MOVES)
+        ):
+            return _no_damage_plan(f"Immune ({ability_name})", f"Immune due to {ability_name}")
 
     # Check for Air Balloon item immunity to Ground
-    if modifiers.defender_item:
-        def_item = normalize_item(modifiers.defender_item)
-        if def_item == "air-balloon" and effective_move_type == "Ground":
-            return DamageResult(
-                min_damage=0, max_damage=0, min_percent=0, max_percent=0,
-                rolls=[0] * 16, defender_hp=1,
-                ko_chance="Immune (Air Balloon)",
-                is_guaranteed_ohko=False, is_possible_ohko=False,
-                details={"reason": "Immune due to Air Balloon"}
-            )
-
-    # Calculate stats
-    attacker_stats = calculate_all_stats(attacker)
-    defender_stats = calculate_all_stats(defender)
+    if def_item == "air-balloon" and effective_move_type == "Ground":
+        return _no_damage_plan("Immune (Air Balloon)", "Immune due to Air Balloon")
 
     # Check for special move mechanics from GEN9_SPECIAL_MOVES
-    # (move_name_normalized already defined above for immunity checks)
     special_move_data = GEN9_SPECIAL_MOVES.get(move_name_normalized, {})
 
     # Determine attacking and defending stats
     # Handle stat-swapping moves first
+    attack_from_defender = False
     if special_move_data.get("uses_target_attack"):
         # Foul Play: Uses defender's Attack stat for damage
+        attack_from_defender = True
         attack_stat_name = "attack"
-        attack_stat = defender_stats["attack"]
         defense_stat_name = "defense" if is_physical else "special_defense"
-        defense_stat = defender_stats[defense_stat_name]
     elif special_move_data.get("uses_user_defense"):
         # Body Press: Uses user's Defense stat instead of Attack
         attack_stat_name = "defense"
-        attack_stat = attacker_stats["defense"]
         defense_stat_name = "defense"
-        defense_stat = defender_stats["defense"]
     elif special_move_data.get("targets_physical_defense"):
         # Psyshock, Psystrike, Secret Sword: Special moves that target physical Defense
         attack_stat_name = "special_attack"
-        attack_stat = attacker_stats["special_attack"]
         defense_stat_name = "defense"
-        defense_stat = defender_stats["defense"]
     elif is_physical:
         attack_stat_name = "attack"
         defense_stat_name = "defense"
-        attack_stat = attacker_stats[attack_stat_name]
-        defense_stat = defender_stats[defense_stat_name]
     else:
         attack_stat_name = "special_attack"
         defense_stat_name = "special_defense"
-        attack_stat = attacker_stats[attack_stat_name]
-        defense_stat = defender_stats[defense_stat_name]
+
+    attack_mods = []
+    defense_mods = []
 
     # Apply stat stage modifiers
     # Critical hits ignore:
     # - Attacker's negative Attack/SpA stages (e.g., Intimidate drops)
     # - Defender's positive Defense/SpD stages (boosts)
     if is_physical:
-        # Crits ignore negative attack stages (Intimidate)
-        if modifiers.is_critical and modifiers.attack_stage < 0:
-            pass  # Don't apply negative attack stage on crit
-        else:
-            attack_stat = apply_mod(attack_stat, STAT_STAGE_MODS.get(modifiers.attack_stage, 4096))
-        # Crits ignore positive defense stages
-        if not modifiers.is_critical or modifiers.defense_stage < 0:
-            defense_stat = apply_mod(defense_stat, STAT_STAGE_MODS.get(modifiers.defense_stage, 4096))
+        attack_stage, defense_stage = modifiers.attack_stage, modifiers.defense_stage
     else:
-        # Crits ignore negative special attack stages
-        if modifiers.is_critical and modifiers.special_attack_stage < 0:
-            pass  # Don't apply negative SpA stage on crit
-        else:
-            attack_stat = apply_mod(attack_stat, STAT_STAGE_MODS.get(modifiers.special_attack_stage, 4096))
-        # Crits ignore positive special defense stages
-        if not modifiers.is_critical or modifiers.special_defense_stage < 0:
-            defense_stat = apply_mod(defense_stat, STAT_STAGE_MODS.get(modifiers.special_defense_stage, 4096))
+        attack_stage, defense_stage = modifiers.special_attack_stage, modifiers.special_defense_stage
+    if not (modifiers.is_critical and attack_stage < 0):
+        attack_mods.append(STAT_STAGE_MODS.get(attack_stage, 4096))
+    if not modifiers.is_critical or defense_stage < 0:
+        defense_mods.append(STAT_STAGE_MODS.get(defense_stage, 4096))
 
     # Apply Choice Band/Specs (to stat, not damage)
-    if modifiers.attacker_item:
-        item = normalize_item(modifiers.attacker_item)
-        if item == "choice-band" and is_physical:
-            attack_stat = apply_mod(attack_stat, MOD_CHOICE_BOOST)
-        elif item == "choice-specs" and not is_physical:
-            attack_stat = apply_mod(attack_stat, MOD_CHOICE_BOOST)
+    if atk_item == "choice-band" and is_physical:
+        attack_mods.append(MOD_CHOICE_BOOST)
+    elif atk_item == "choice-specs" and not is_physical:
+        attack_mods.append(MOD_CHOICE_BOOST)
 
     # Apply stat-modifying abilities
-    if modifiers.attacker_ability:
-        ability = normalize_ability(modifiers.attacker_ability)
-        # Huge Power / Pure Power double Attack stat
-        if ability in ("huge-power", "pure-power") and is_physical:
-            attack_stat = apply_mod(attack_stat, MOD_STAT_DOUBLE)
-        # Guts (1.5x Attack when statused) - Ursaluna, Conkeldurr, Heracross
-        elif ability == "guts" and modifiers.attacker_statused and is_physical:
-            attack_stat = apply_mod(attack_stat, MOD_GUTS)
-        # Gorilla Tactics (1.5x Attack, locked into move) - Darmanitan-Galar
-        elif ability == "gorilla-tactics" and is_physical:
-            attack_stat = apply_mod(attack_stat, MOD_CHOICE_BOOST)
-        # Flare Boost (1.5x SpA when burned) - Drifloon/Drifblim
-        elif ability == "flare-boost" and modifiers.attacker_burned and not is_physical:
-            attack_stat = apply_mod(attack_stat, MOD_CHOICE_BOOST)
-        # Toxic Boost (1.5x Atk when poisoned) - Zangoose
-        elif ability == "toxic-boost" and modifiers.attacker_statused and is_physical:
-            # Note: Toxic Boost is specifically for poison, but we use attacker_statused for simplicity
-            attack_stat = apply_mod(attack_stat, MOD_CHOICE_BOOST)
-        # Orichalcum Pulse (1.333x Attack in Sun) - Koraidon
-        elif ability == "orichalcum-pulse" and modifiers.weather == "sun":
-            if is_physical:
-                attack_stat = apply_mod(attack_stat, MOD_ORICHALCUM)
-        # Hadron Engine (1.333x SpA in Electric Terrain) - Miraidon
-        elif ability == "hadron-engine" and modifiers.terrain == "electric":
-            if not is_physical:
-                attack_stat = apply_mod(attack_stat, MOD_HADRON)
+    # Huge Power / Pure Power double Attack stat
+    if atk_ability in ("huge-power", "pure-power") and is_physical:
+        attack_mods.append(MOD_STAT_DOUBLE)
+    # Guts (1.5x Attack when statused) - Ursaluna, Conkeldurr, Heracross
+    elif atk_ability == "guts" and modifiers.attacker_statused and is_physical:
+        attack_mods.append(MOD_GUTS)
+    # Gorilla Tactics (1.5x Attack, locked into move) - Darmanitan-Galar
+    elif atk_ability == "gorilla-tactics" and is_physical:
+        attack_mods.append(MOD_CHOICE_BOOST)
+    # Flare Boost (1.5x SpA when burned) - Drifloon/Drifblim
+    elif atk_ability == "flare-boost" and modifiers.attacker_burned and not is_physical:
+        attack_mods.append(MOD_CHOICE_BOOST)
+    # Toxic Boost (1.5x Atk when poisoned) - Zangoose
+    elif atk_ability == "toxic-boost" and modifiers.attacker_statused and is_physical:
+        # Note: Toxic Boost is specifically for poison, but we use attacker_statused for simplicity
+        attack_mods.append(MOD_CHOICE_BOOST)
+    # Orichalcum Pulse (1.333x Attack in Sun) - Koraidon
+    elif atk_ability == "orichalcum-pulse" and modifiers.weather == "sun":
+        if is_physical:
+            attack_mods.append(MOD_ORICHALCUM)
+    # Hadron Engine (1.333x SpA in Electric Terrain) - Miraidon
+    elif atk_ability == "hadron-engine" and modifiers.terrain == "electric":
+        if not is_physical:
+            attack_mods.append(MOD_HADRON)
 
     # Embody Aspect (Ogerpon): +1 to a specific stat based on mask form
     # This is a stat stage boost that activates on entry
@@ -815,56 +860,32 @@ def calculate_damage(
     # - Hearthflame Mask: +1 Attack
     # - Wellspring Mask: +1 Special Defense
     # - Cornerstone Mask: +1 Defense
-    if modifiers.attacker_ability:
-        ability = normalize_ability(modifiers.attacker_ability)
-        if ability == "embody-aspect":
-            item = normalize_item(modifiers.attacker_item or "")
-            if item == "hearthflame-mask" and is_physical:
-                # +1 Attack stage = 1.5x
-                attack_stat = apply_mod(attack_stat, MOD_EMBODY_ASPECT)
-
-    if modifiers.defender_ability:
-        def_ability = normalize_ability(modifiers.defender_ability)
-        if def_ability == "embody-aspect":
-            def_item = normalize_item(modifiers.defender_item or "")
-            if def_item == "wellspring-mask" and not is_physical:
-                # +1 Special Defense stage = 1.5x
-                defense_stat = apply_mod(defense_stat, MOD_EMBODY_ASPECT)
-            elif def_item == "cornerstone-mask" and is_physical:
-                # +1 Defense stage = 1.5x
-                defense_stat = apply_mod(defense_stat, MOD_EMBODY_ASPECT)
+    if atk_ability == "embody-aspect" and atk_item == "hearthflame-mask" and is_physical:
+        attack_mods.append(MOD_EMBODY_ASPECT)
+    if def_ability == "embody-aspect":
+        if def_item == "wellspring-mask" and not is_physical:
+            defense_mods.append(MOD_EMBODY_ASPECT)
+        elif def_item == "cornerstone-mask" and is_physical:
+            defense_mods.append(MOD_EMBODY_ASPECT)
 
     # Commander ability (Dondozo + Tatsugiri combo)
     # When Commander is active, Dondozo's Attack, Defense, SpA, SpD, and Speed are doubled
-    # For offensive calcs: doubles Dondozo's attacking stat (Attack or SpA)
-    # For defensive calcs: doubles Dondozo's defensive stat (Defense or SpD)
-    commander_boost_applied = False
     if modifiers.commander_active:
-        attack_stat = apply_mod(attack_stat, MOD_STAT_DOUBLE)
-        commander_boost_applied = True
-
-    # Defender has Commander active - doubles their defensive stat
+        attack_mods.append(MOD_STAT_DOUBLE)
     if modifiers.defender_commander_active:
-        defense_stat = apply_mod(defense_stat, MOD_STAT_DOUBLE)
+        defense_mods.append(MOD_STAT_DOUBLE)
 
     # Apply Ruin abilities (field effects, NOT stat stages).
     # These always apply even on critical hits because crits only ignore
     # stat stage changes, not ability-based multipliers.
-    # Sword of Ruin (Chien-Pao): Lowers foe Defense to 0.75x
     if modifiers.sword_of_ruin and is_physical:
-        defense_stat = apply_mod(defense_stat, MOD_RUIN)
-
-    # Beads of Ruin (Chi-Yu): Lowers foe Special Defense to 0.75x
+        defense_mods.append(MOD_RUIN)
     if modifiers.beads_of_ruin and not is_physical:
-        defense_stat = apply_mod(defense_stat, MOD_RUIN)
-
-    # Tablets of Ruin (Wo-Chien): Lowers foe Attack to 0.75x
+        defense_mods.append(MOD_RUIN)
     if modifiers.tablets_of_ruin and is_physical:
-        attack_stat = apply_mod(attack_stat, MOD_RUIN)
-
-    # Vessel of Ruin (Ting-Lu): Lowers foe Special Attack to 0.75x
+        attack_mods.append(MOD_RUIN)
     if modifiers.vessel_of_ruin and not is_physical:
-        attack_stat = apply_mod(attack_stat, MOD_RUIN)
+        attack_mods.append(MOD_RUIN)
 
     # Apply Protosynthesis/Quark Drive boosts (1.3x, or 1.5x for Speed)
     # These boost the attacker's relevant stat if it matches the boosted stat
@@ -872,24 +893,22 @@ def calculate_damage(
         if boost_stat:
             boost_mod = MOD_PARADOX_1_5 if boost_stat == "speed" else MOD_PARADOX_1_3
             if boost_stat == "attack" and is_physical:
-                attack_stat = apply_mod(attack_stat, boost_mod)
+                attack_mods.append(boost_mod)
             elif boost_stat == "special_attack" and not is_physical:
-                attack_stat = apply_mod(attack_stat, boost_mod)
+                attack_mods.append(boost_mod)
 
     # Apply defender's Protosynthesis/Quark Drive boosts
     for boost_stat in [modifiers.defender_protosynthesis_boost, modifiers.defender_quark_drive_boost]:
         if boost_stat:
             boost_mod = MOD_PARADOX_1_5 if boost_stat == "speed" else MOD_PARADOX_1_3
             if boost_stat == "defense" and is_physical:
-                defense_stat = apply_mod(defense_stat, boost_mod)
+                defense_mods.append(boost_mod)
             elif boost_stat == "special_defense" and not is_physical:
-                defense_stat = apply_mod(defense_stat, boost_mod)
+                defense_mods.append(boost_mod)
 
     # Apply Assault Vest (1.5x SpD for special moves)
-    if modifiers.defender_item:
-        def_item = normalize_item(modifiers.defender_item)
-        if def_item == "assault-vest" and not is_physical:
-            defense_stat = apply_mod(defense_stat, MOD_ASSAULT_VEST)
+    if def_item == "assault-vest" and not is_physical:
+        defense_mods.append(MOD_ASSAULT_VEST)
 
     # Get base power (may be variable for special moves)
     power = move.power
@@ -899,131 +918,116 @@ def calculate_damage(
         power = power * 2
 
     # Calculate variable base power for special moves (Gyro Ball, Eruption, etc.)
+    # Speed-based moves are deferred to evaluation; the rest only read modifiers
+    speed_bp = None
     if special_move_data:
-        power = _calculate_variable_bp(
-            move_name_normalized,
-            power,
-            special_move_data,
-            attacker_stats.get("speed", 100),  # Use calculated speed stats
-            defender_stats.get("speed", 100),
-            modifiers,
-        )
+        if special_move_data.get("variable_bp") in SPEED_BP_KINDS:
+            speed_bp = (move_name_normalized, power, special_move_data, replace(modifiers))
+        else:
+            power = _calculate_variable_bp(
+                move_name_normalized, power, special_move_data, 0, 0, modifiers
+            )
+
+    power_steps: list[tuple[str, int]] = []
 
     # Apply power modifiers from abilities (Technician, etc.)
-    if modifiers.attacker_ability:
-        ability = normalize_ability(modifiers.attacker_ability)
-        if ability == "technician" and power <= 60:
-            power = apply_mod(power, MOD_CHOICE_BOOST)  # 1.5x
-        elif ability == "sheer-force" and move.effect_chance:
-            power = apply_mod(power, MOD_LIFE_ORB)  # 1.3x (~5324/4096)
-        elif ability == "tough-claws" and move.makes_contact:
-            power = apply_mod(power, MOD_TOUGH_CLAWS)
-        elif ability == "iron-fist" and normalize_move(move.name) in PUNCH_MOVES:
-            power = apply_mod(power, MOD_IRON_FIST)
-        # Rocky Payload (1.5x Rock damage) - Ogerpon-Cornerstone
-        elif ability == "rocky-payload" and effective_move_type == "Rock":
-            power = apply_mod(power, MOD_ROCKY_PAYLOAD)
-        # Sharpness (1.5x slicing moves) - Gallade, Kartana, Samurott-Hisui
-        elif ability == "sharpness" and normalize_move(move.name) in SLICING_MOVES:
-            power = apply_mod(power, MOD_SHARPNESS)
-        # Strong Jaw (1.5x biting moves) - Dracovish, Tyrantrum, Boltund
-        elif ability == "strong-jaw" and normalize_move(move.name) in BITING_MOVES:
-            power = apply_mod(power, MOD_STRONG_JAW)
-        # Supreme Overlord (+10% per fainted ally, up to +50%) - Kingambit
-        elif ability == "supreme-overlord" and modifiers.supreme_overlord_count > 0:
-            # +10% per ally = 410/4096 per ally
-            boost = 4096 + (410 * min(5, modifiers.supreme_overlord_count))
-            power = apply_mod(power, boost)
-        # Tinted Lens (2x damage on resisted hits) - Yanmega, Butterfree
-        elif ability == "tinted-lens":
-            # Mark for later application after type effectiveness is calculated
-            pass  # Handled in final modifiers section
-        # Mega Launcher (1.5x pulse moves) - Blastoise, Clawitzer
-        elif ability == "mega-launcher" and move_name_normalized in PULSE_MOVES:
-            power = apply_mod(power, MOD_MEGA_LAUNCHER)
-        # Reckless (1.2x recoil moves) - Bouffalant, Staraptor
-        elif ability == "reckless" and move_name_normalized in RECOIL_MOVES:
-            power = apply_mod(power, MOD_RECKLESS)
-        # Sand Force (1.3x Ground/Rock/Steel in sand) - Excadrill, Landorus
-        elif ability == "sand-force" and modifiers.weather == "sand":
-            if effective_move_type in ("Ground", "Rock", "Steel"):
-                power = apply_mod(power, MOD_SAND_FORCE)
-        # Steely Spirit (1.5x Steel moves) - Perrserker, Duraludon
-        elif ability == "steely-spirit" and effective_move_type == "Steel":
-            power = apply_mod(power, MOD_STEELY_SPIRIT)
-        # Transistor (1.5x Electric in Gen 9) - Regieleki
-        elif ability == "transistor" and effective_move_type == "Electric":
-            power = apply_mod(power, MOD_TRANSISTOR)
-        # Dragon's Maw (1.5x Dragon) - Regidrago
-        elif ability == "dragons-maw" and effective_move_type == "Dragon":
-            power = apply_mod(power, MOD_DRAGONS_MAW)
-        # Water Bubble (2x Water moves) - Araquanid
-        elif ability == "water-bubble" and effective_move_type == "Water":
-            power = apply_mod(power, MOD_WATER_BUBBLE_ATK)
-        # Punk Rock (1.3x sound moves) - Toxtricity
-        elif ability == "punk-rock" and move_name_normalized in SOUND_MOVES:
-            power = apply_mod(power, MOD_PUNK_ROCK_ATK)
-        # Analytic (1.3x when moving last) - Magnezone, Porygon-Z
-        elif ability == "analytic" and modifiers.moving_last:
-            power = apply_mod(power, MOD_ANALYTIC)
+    if atk_ability == "technician":
+        power_steps.append(("technician", MOD_CHOICE_BOOST))  # 1.5x at <= 60 BP
+    elif atk_ability == "sheer-force" and move.effect_chance:
+        power_steps.append(("mod", MOD_LIFE_ORB))  # 1.3x (~5324/4096)
+    elif atk_ability == "tough-claws" and move.makes_contact:
+        power_steps.append(("mod", MOD_TOUGH_CLAWS))
+    elif atk_ability == "iron-fist" and move_name_normalized in PUNCH_MOVES:
+        power_steps.append(("mod", MOD_IRON_FIST))
+    # Rocky Payload (1.5x Rock damage) - Ogerpon-Cornerstone
+    elif atk_ability == "rocky-payload" and effective_move_type == "Rock":
+        power_steps.append(("mod", MOD_ROCKY_PAYLOAD))
+    # Sharpness (1.5x slicing moves) - Gallade, Kartana, Samurott-Hisui
+    elif atk_ability == "sharpness" and move_name_normalized in SLICING_MOVES:
+        power_steps.append(("mod", MOD_SHARPNESS))
+    # Strong Jaw (1.5x biting moves) - Dracovish, Tyrantrum, Boltund
+    elif atk_ability == "strong-jaw" and move_name_normalized in BITING_MOVES:
+        power_steps.append(("mod", MOD_STRONG_JAW))
+    # Supreme Overlord (+10% per fainted ally, up to +50%) - Kingambit
+    elif atk_ability == "supreme-overlord" and modifiers.supreme_overlord_count > 0:
+        # +10% per ally = 410/4096 per ally
+        power_steps.append(("mod", 4096 + (410 * min(5, modifiers.supreme_overlord_count))))
+    # Tinted Lens (2x damage on resisted hits) - handled in final modifiers
+    elif atk_ability == "tinted-lens":
+        pass
+    # Mega Launcher (1.5x pulse moves) - Blastoise, Clawitzer
+    elif atk_ability == "mega-launcher" and move_name_normalized in PULSE_MOVES:
+        power_steps.append(("mod", MOD_MEGA_LAUNCHER))
+    # Reckless (1.2x recoil moves) - Bouffalant, Staraptor
+    elif atk_ability == "reckless" and move_name_normalized in RECOIL_MOVES:
+        power_steps.append(("mod", MOD_RECKLESS))
+    # Sand Force (1.3x Ground/Rock/Steel in sand) - Excadrill, Landorus
+    elif atk_ability == "sand-force" and modifiers.weather == "sand":
+        if effective_move_type in ("Ground", "Rock", "Steel"):
+            power_steps.append(("mod", MOD_SAND_FORCE))
+    # Steely Spirit (1.5x Steel moves) - Perrserker, Duraludon
+    elif atk_ability == "steely-spirit" and effective_move_type == "Steel":
+        power_steps.append(("mod", MOD_STEELY_SPIRIT))
+    # Transistor (1.5x Electric in Gen 9) - Regieleki
+    elif atk_ability == "transistor" and effective_move_type == "Electric":
+        power_steps.append(("mod", MOD_TRANSISTOR))
+    # Dragon's Maw (1.5x Dragon) - Regidrago
+    elif atk_ability == "dragons-maw" and effective_move_type == "Dragon":
+        power_steps.append(("mod", MOD_DRAGONS_MAW))
+    # Water Bubble (2x Water moves) - Araquanid
+    elif atk_ability == "water-bubble" and effective_move_type == "Water":
+        power_steps.append(("mod", MOD_WATER_BUBBLE_ATK))
+    # Punk Rock (1.3x sound moves) - Toxtricity
+    elif atk_ability == "punk-rock" and move_name_normalized in SOUND_MOVES:
+        power_steps.append(("mod", MOD_PUNK_ROCK_ATK))
+    # Analytic (1.3x when moving last) - Magnezone, Porygon-Z
+    elif atk_ability == "analytic" and modifiers.moving_last:
+        power_steps.append(("mod", MOD_ANALYTIC))
 
     # Ally Steely Spirit boost (1.5x Steel if ally has Steely Spirit)
     if modifiers.ally_steely_spirit and effective_move_type == "Steel":
-        power = apply_mod(power, MOD_STEELY_SPIRIT)
+        power_steps.append(("mod", MOD_STEELY_SPIRIT))
 
     # Apply -ate ability boost (1.2x) if Normal move was converted
     if ate_ability_boost:
-        power = apply_mod(power, MOD_ATE_ABILITY)
+        power_steps.append(("mod", MOD_ATE_ABILITY))
 
     # Tera BP boost: Tera-type moves with base power < 60 are boosted to 60
     # This is checked AFTER Technician but does NOT apply to:
     # - Multi-hit moves (like Bone Rush, Icicle Spear)
     # - Increased priority moves (like Quick Attack, Aqua Jet)
     if modifiers.tera_active and modifiers.tera_type:
-        tera_type = modifiers.tera_type.capitalize()
-        if effective_move_type == tera_type:
-            is_multi_hit = multi_hit_info is not None
-            is_priority = move.priority > 0
-            if power < 60 and not is_multi_hit and not is_priority:
-                power = 60
+        if effective_move_type == modifiers.tera_type.capitalize():
+            if multi_hit_info is None and move.priority <= 0:
+                power_steps.append(("tera_floor", 60))
 
     # Apply type-boosting item to base power (NOT final damage)
     # This matches Showdown's behavior where items like Charcoal go into bpMods
-    # Use effective_move_type to account for type-changing abilities
     bp_item_mod_4096 = _get_type_boost_item_mod_4096(modifiers.attacker_item, effective_move_type)
     if bp_item_mod_4096 != MOD_NEUTRAL:
-        power = apply_mod(power, bp_item_mod_4096)
+        power_steps.append(("mod", bp_item_mod_4096))
 
     # Apply Ogerpon mask boost (1.2x to ALL moves, not just type-matching)
-    # Only Hearthflame/Wellspring/Cornerstone masks provide this boost (not Teal Mask)
-    attacker_name = attacker.name if attacker else None
-    ogerpon_mask_mod_4096 = _get_ogerpon_mask_boost_4096(modifiers.attacker_item, attacker_name)
+    ogerpon_mask_mod_4096 = _get_ogerpon_mask_boost_4096(modifiers.attacker_item, attacker.name)
     if ogerpon_mask_mod_4096 != MOD_NEUTRAL:
-        power = apply_mod(power, ogerpon_mask_mod_4096)
-
-    # Level constant for level 50: floor(2*50/5+2) = 22
-    level_factor = 22
+        power_steps.append(("mod", ogerpon_mask_mod_4096))
 
-    # Base damage formula
-    # floor(floor(floor(level_factor * power * atk / def) / 50) + 2)
-    base_damage = math.floor(
-        math.floor(
-            math.floor(level_factor * power * attack_stat / defense_stat) / 50
-        ) + 2
-    )
+    if speed_bp is None:
+        power = _apply_power_steps(power, tuple(power_steps))
 
-    # Track applied modifiers for details
+    # Base damage modifiers, applied in order after the base formula
+    base_mods = []
     applied_mods = []
 
     # 1. Spread move modifier (3072/4096 = 0.75x in doubles when hitting multiple)
     if move.is_spread and modifiers.is_doubles and modifiers.multiple_targets:
-        base_damage = apply_mod(base_damage, MOD_SPREAD)
+        base_mods.append(MOD_SPREAD)
         applied_mods.append("Spread (0.75x)")
 
     # 2. Weather modifier (6144/4096 = 1.5x boost, 2048/4096 = 0.5x nerf)
     weather_mod_4096 = _get_weather_mod_4096(modifiers.weather, effective_move_type)
     if weather_mod_4096 != MOD_NEUTRAL:
-        base_damage = apply_mod(base_damage, weather_mod_4096)
+        base_mods.append(weather_mod_4096)
         weather_mult = weather_mod_4096 / 4096
         applied_mods.append(f"Weather ({weather_mult:.1f}x)")
 
@@ -1041,54 +1045,43 @@ def calculate_damage(
         terrain_mod_4096 = 6144  # 1.5x
 
     if terrain_mod_4096 != MOD_NEUTRAL:
-        base_damage = apply_mod(base_damage, terrain_mod_4096)
+        base_mods.append(terrain_mod_4096)
         terrain_name = modifiers.terrain.capitalize() if modifiers.terrain else "Terrain"
         terrain_mult = terrain_mod_4096 / 4096
         applied_mods.append(f"{terrain_name} Terrain ({terrain_mult:.2f}x)")
 
     # 3. Critical hit (6144/4096 = 1.5x in Gen 9)
     if modifiers.is_critical:
-        base_damage = apply_mod(base_damage, MOD_CRIT)
+        base_mods.append(MOD_CRIT)
         applied_mods.append("Critical (1.5x)")
 
-    # Pre-calculate STAB modifier (4096-based)
-    # Pass effective_move_type to account for type-changing abilities
+    # STAB modifier (4096-based), using the effective move type
     stab_mod_4096 = _get_stab_mod_4096(attacker, move, modifiers, effective_move_type)
 
-    # Pre-calculate type effectiveness using effective move type
+    # Type effectiveness using effective move type
     defender_types = defender.types
     if modifiers.defender_tera_active and modifiers.defender_tera_type:
         defender_types = [modifiers.defender_tera_type]
-    type_eff = get_type_effectiveness(effective_move_type, defender_types)
+    display_type_eff = get_type_effectiveness(effective_move_type, defender_types)
+    type_eff = display_type_eff
 
     # Tera Shell (all hits not very effective at full HP) - Terapagos
     # This forces type effectiveness to 0.5x (unless already immune)
-    if modifiers.defender_ability:
-        def_ability = normalize_ability(modifiers.defender_ability)
-        if def_ability == "tera-shell" and modifiers.defender_at_full_hp:
-            if type_eff > 0:  # Don't override immunity
-                type_eff = 0.5
+    if def_ability == "tera-shell" and modifiers.defender_at_full_hp:
+        if type_eff > 0:  # Don't override immunity
+            type_eff = 0.5
 
     # Mind's Eye (Ursaluna-Bloodmoon) / Scrappy: Normal and Fighting moves hit Ghost types
-    # This bypasses the Ghost immunity to Normal and Fighting
-    if modifiers.attacker_ability:
-        att_ability = normalize_ability(modifiers.attacker_ability)
-        if att_ability in ("minds-eye", "scrappy") and type_eff == 0:
-            # Check if this is a Ghost-type immunity to Normal or Fighting
-            if effective_move_type in ("Normal", "Fighting") and "Ghost" in defender_types:
-                type_eff = 1.0  # Bypass immunity, deal neutral damage
-
-    # Pre-calculate final modifier chain (screens, items, abilities)
+    if atk_ability in ("minds-eye", "scrappy") and type_eff == 0:
+        if effective_move_type in ("Normal", "Fighting") and "Ghost" in defender_types:
+            type_eff = 1.0  # Bypass immunity, deal neutral damage
+
+    # Final modifier chain (screens, items, abilities)
     final_mods = []
 
     # Burn (2048/4096 = 0.5x on physical unless Guts/Facade)
     if modifiers.attacker_burned and is_physical:
-        # Check for Guts ability which negates burn penalty
-        has_guts_ability = (
-            modifiers.attacker_ability and
-            normalize_ability(modifiers.attacker_ability) == "guts"
-        )
-        if not modifiers.has_guts and not has_guts_ability and move.name.lower() != "facade":
+        if not modifiers.has_guts and atk_ability != "guts" and move.name.lower() != "facade":
             final_mods.append(MOD_BURN)
 
     # Screens
@@ -1102,9 +1095,8 @@ def calculate_damage(
         final_mods.append(item_mod_4096)
 
     # Expert Belt (only if super effective)
-    if modifiers.attacker_item and normalize_item(modifiers.attacker_item) == "expert-belt":
-        if type_eff >= 2.0:
-            final_mods.append(MOD_EXPERT_BELT)
+    if atk_item == "expert-belt" and type_eff >= 2.0:
+        final_mods.append(MOD_EXPERT_BELT)
 
     # Helping Hand (6144/4096 = 1.5x)
     if modifiers.helping_hand:
@@ -1115,9 +1107,7 @@ def calculate_damage(
         final_mods.append(MOD_FRIEND_GUARD)
 
     # Defender ability effects
-    if modifiers.defender_ability:
-        def_ability = normalize_ability(modifiers.defender_ability)
-
+    if def_ability:
         # Multiscale / Shadow Shield (0.5x at full HP)
         if def_ability in ("multiscale", "shadow-shield") and modifiers.defender_at_full_hp:
             final_mods.append(MOD_MULTISCALE)
@@ -1165,121 +1155,177 @@ def calculate_damage(
         if def_ability == "punk-rock" and move_name_normalized in SOUND_MOVES:
             final_mods.append(MOD_PUNK_ROCK_DEF)
 
-        # Neuroforce (1.25x on super-effective) - Necrozma-Ultra
-        # Note: This is an offensive ability for the attacker
-    if modifiers.attacker_ability:
-        att_ability = normalize_ability(modifiers.attacker_ability)
-        if att_ability == "neuroforce" and type_eff >= 2.0:
-            final_mods.append(MOD_NEUROFORCE)
+    # Neuroforce (1.25x on super-effective) - Necrozma-Ultra
+    if atk_ability == "neuroforce" and type_eff >= 2.0:
+        final_mods.append(MOD_NEUROFORCE)
 
     # Attacker item effects (final damage modifiers)
-    if modifiers.attacker_item:
-        att_item = normalize_item(modifiers.attacker_item)
+    # Punching Glove (1.1x punch moves) - Iron Hands, etc.
+    if atk_item == "punching-glove" and move_name_normalized in PUNCH_MOVES:
+        final_mods.append(MOD_PUNCHING_GLOVE)
 
-        # Punching Glove (1.1x punch moves) - Iron Hands, etc.
-        if att_item == "punching-glove" and move_name_normalized in PUNCH_MOVES:
-            final_mods.append(MOD_PUNCHING_GLOVE)
+    # Muscle Band (1.1x physical moves)
+    if atk_item == "muscle-band" and is_physical:
+        final_mods.append(MOD_MUSCLE_BAND)
 
-        # Muscle Band (1.1x physical moves)
-        if att_item == "muscle-band" and is_physical:
-            final_mods.append(MOD_MUSCLE_BAND)
+    # Wise Glasses (1.1x special moves)
+    if atk_item == "wise-glasses" and not is_physical:
+        final_mods.append(MOD_WISE_GLASSES)
 
-        # Wise Glasses (1.1x special moves)
-        if att_item == "wise-glasses" and not is_physical:
-            final_mods.append(MOD_WISE_GLASSES)
+    # Normal Gem (1.5x first Normal move - one-time use)
+    if atk_item == "normal-gem" and effective_move_type == "Normal":
+        final_mods.append(MOD_NORMAL_GEM)
 
-        # Normal Gem (1.5x first Normal move - one-time use)
-        if att_item == "normal-gem" and effective_move_type == "Normal":
-            final_mods.append(MOD_NORMAL_GEM)
+    # Resistance berries (0.5x super-effective damage of matching type)
+    if def_item in RESISTANCE_BERRIES:
+        if effective_move_type == RESISTANCE_BERRIES[def_item] and type_eff >= 2.0:
+            final_mods.append(MOD_RESISTANCE_BERRY)
 
-    # Defender item effects
-    if modifiers.defender_item:
-        def_item = normalize_item(modifiers.defender_item)
-
-        # Resistance berries (0.5x super-effective damage of matching type)
-        if def_item in RESISTANCE_BERRIES:
-            berry_type = RESISTANCE_BERRIES[def_item]
-            if effective_move_type == berry_type and type_eff >= 2.0:
-                final_mods.append(MOD_RESISTANCE_BERRY)
-
-    # Chain all final modifiers together
-    final_mod_4096 = chain_mods(final_mods) if final_mods else MOD_NEUTRAL
-
-    # Calculate 16 damage rolls (random factor 85-100)
-    rolls = []
-    damages_per_hit = []  # For multi-hit KO probability calculation
-
-    if hit_count == 1:
-        # Single-hit move: standard calculation
-        for i in range(16):
-            # 4. Random factor: floor(damage * random / 100)
-            # Uses floor, NOT pokeRound (per Showdown implementation)
-            random_factor = 85 + i
-            damage = math.floor(base_damage * random_factor / 100)
-
-            # 5. STAB (6144/4096 = 1.5x, 8192/4096 = 2.0x)
-            if stab_mod_4096 != MOD_NEUTRAL:
-                damage = apply_mod(damage, stab_mod_4096)
-
-            # 6. Type effectiveness (integer multiplier, applied directly)
-            # Immunities deal 0 damage (no further modifiers apply)
-            if type_eff == 0:
-                rolls.append(0)
-                continue
+    # Details labels: STAB, raw type effectiveness, multi-hit, Commander
+    if stab_mod_4096 != MOD_NEUTRAL:
+        if stab_mod_4096 == MOD_STAB_BOOSTED:
+            applied_mods.append("STAB (2.0x - Tera/Adaptability)")
+        else:
+            applied_mods.append("STAB (1.5x)")
 
-            if type_eff != 1.0:
-                # Type effectiveness uses floor, not pokeRound
-                damage = int(damage * type_eff)
+    if display_type_eff == 0:
+        applied_mods.append("Immune (0x)")
+    elif display_type_eff == 0.25:
+        applied_mods.append("4x Resist (0.25x)")
+    elif display_type_eff == 0.5:
+        applied_mods.append("Resist (0.5x)")
+    elif display_type_eff == 2:
+        applied_mods.append("Super Effective (2x)")
+    elif display_type_eff == 4:
+        applied_mods.append("4x Super Effective (4x)")
 
-            # Collision Course / Electro Drift: 1.33x damage on super effective hits
-            if move_name_normalized in ("collision-course", "electro-drift") and type_eff > 1.0:
-                # 5461/4096 = 1.333x
-                damage = apply_mod(damage, 5461)
+    if hit_count > 1:
+        crit_note = " (always crits)" if always_crit else ""
+        applied_mods.append(f"Multi-hit ({hit_count} hits{crit_note})")
 
-            # 7-10. Apply chained final modifiers (burn, screens, items, etc.)
-            if final_mod_4096 != MOD_NEUTRAL:
-                damage = apply_mod(damage, final_mod_4096)
+    if modifiers.commander_active:
+        applied_mods.append("Commander (2x all stats)")
 
-            # Minimum 1 damage per hit
-            damage = max(1, damage)
+    return CalcPlan(
+        attack_from_defender=attack_from_defender,
+        attack_stat_name=attack_stat_name,
+        defense_stat_name=defense_stat_name,
+        attack_mods=tuple(m for m in attack_mods if m != MOD_NEUTRAL),
+        defense_mods=tuple(m for m in defense_mods if m != MOD_NEUTRAL),
+        power=power,
+        speed_bp=speed_bp,
+        power_steps=tuple(power_steps),
+        base_mods=tuple(base_mods),
+        stab_mod=stab_mod_4096,
+        type_eff=type_eff,
+        display_type_eff=display_type_eff,
+        # Collision Course / Electro Drift: 1.33x damage on super effective hits
+        collision_boost=(
+            move_name_normalized in ("collision-course", "electro-drift") and type_eff > 1.0
+        ),
+        final_mod=chain_mods(final_mods) if final_mods else MOD_NEUTRAL,
+        hit_count=hit_count,
+        always_crit=always_crit,
+        labels=tuple(applied_mods),
+    )
 
-            rolls.append(damage)
-    else:
-        # Multi-hit move: each hit gets independent random roll
-        for i in range(16):
-            # 4. Random factor: floor(damage * random / 100)
-            random_factor = 85 + i
-            damage_this_roll = math.floor(base_damage * random_factor / 100)
-
-            # 5. STAB (6144/4096 = 1.5x, 8192/4096 = 2.0x)
-            if stab_mod_4096 != MOD_NEUTRAL:
-                damage_this_roll = apply_mod(damage_this_roll, stab_mod_4096)
-
-            # 6. Type effectiveness (integer multiplier, applied directly)
-            # Immunities deal 0 damage (no further modifiers apply)
-            if type_eff == 0:
-                damages_per_hit.append(0)
-                continue
 
-            if type_eff != 1.0:
-                # Type effectiveness uses floor, not pokeRound
-                damage_this_roll = int(damage_this_roll * type_eff)
+def _plan_base_damage(
+    plan: CalcPlan,
+    attacker_stats: dict[str, int],
+    defender_stats: dict[str, int],
+) -> tuple[int, int, int, int]:
+    """Modified attack and defense, base power, and damage before the random roll."""
+    attack_stat = (defender_stats if plan.attack_from_defender else attacker_stats)[plan.attack_stat_name]
+    for mod in plan.attack_mods:
+        attack_stat = apply_mod(attack_stat, mod)
+    defense_stat = defender_stats[plan.defense_stat_name]
+    for mod in plan.defense_mods:
+        defense_stat = apply_mod(defense_stat, mod)
+
+    power = plan.power
+    if plan.speed_bp is not None:
+        move_name, base_power, special_move_data, modifiers = plan.speed_bp
+        power = _calculate_variable_bp(
+            move_name,
+            base_power,
+            special_move_data,
+            attacker_stats.get("speed", 100),
+            defender_stats.get("speed", 100),
+            modifiers,
+        )
+        power = _apply_power_steps(power, plan.power_steps)
+
+    # Base damage formula at level 50: floor(2*50/5+2) = 22
+    # floor(floor(floor(22 * power * atk / def) / 50) + 2)
+    base_damage = (22 * power * attack_stat // defense_stat) // 50 + 2
+    for mod in plan.base_mods:
+        base_damage = apply_mod(base_damage, mod)
+    return attack_stat, defense_stat, power, base_damage
+
+
+def _roll_damage(plan: CalcPlan, base_damage: int, random_factor: int) -> int:
+    """Damage of one hit at one random factor (85-100)."""
+    # 4. Random factor uses floor, NOT pokeRound (per Showdown implementation)
+    damage = base_damage * random_factor // 100
+    # 5. STAB (6144/4096 = 1.5x, 8192/4096 = 2.0x)
+    damage = apply_mod(damage, plan.stab_mod)
+    # 6. Type effectiveness; immunities deal 0 damage (no further modifiers apply)
+    type_eff = plan.type_eff
+    if type_eff == 0:
+        return 0
+    if type_eff != 1.0:
+        # Type effectiveness uses floor, not pokeRound
+        damage = int(damage * type_eff)
+    if plan.collision_boost:
+        damage = apply_mod(damage, 5461)  # 1.333x
+    # 7-10. Chained final modifiers (burn, screens, items, etc.)
+    damage = apply_mod(damage, plan.final_mod)
+    # Minimum 1 damage per hit
+    return max(1, damage)
+
+
+def evaluate_calc_plan(
+    plan: CalcPlan,
+    attacker_stats: dict[str, int],
+    defender_stats: dict[str, int],
+) -> DamageResult:
+    """
+    Run a compiled plan against calculated stats (see calculate_all_stats).
 
-            # Collision Course / Electro Drift: 1.33x damage on super effective hits
-            if move_name_normalized in ("collision-course", "electro-drift") and type_eff > 1.0:
-                # 5461/4096 = 1.333x
-                damage_this_roll = apply_mod(damage_this_roll, 5461)
+    Args:
+        plan: Plan from compile_calc_plan
+        attacker_stats: Attacker's calculated stats
+        defender_stats: Defender's calculated stats
 
-            # 7-10. Apply chained final modifiers (burn, screens, items, etc.)
-            if final_mod_4096 != MOD_NEUTRAL:
-                damage_this_roll = apply_mod(damage_this_roll, final_mod_4096)
+    Returns:
+        DamageResult with damage range, percentages, and KO probability
+    """
+    if plan.no_damage is not None:
+        ko_chance, reason = plan.no_damage
+        return DamageResult(
+            min_damage=0, max_damage=0, min_percent=0, max_percent=0,
+            rolls=[0] * 16, defender_hp=1,
+            ko_chance=ko_chance,
+            is_guaranteed_ohko=False, is_possible_ohko=False,
+            details={"reason": reason}
+        )
 
-            # Minimum 1 damage per hit
-            damage_this_roll = max(1, damage_this_roll)
+    attack_stat, defense_stat, power, base_damage = _plan_base_damage(
+        plan, attacker_stats, defender_stats
+    )
 
-            damages_per_hit.append(damage_this_roll)
+    # 16 damage rolls (random factor 85-100), one hit each
+    type_eff = plan.type_eff
+    damages_per_hit = [
+        _roll_damage(plan, base_damage, random_factor) for random_factor in range(85, 101)
+    ]
 
-        # Generate representative rolls for display
+    hit_count = plan.hit_count
+    if hit_count == 1:
+        rolls = damages_per_hit
+    else:
+        # Each hit gets an independent roll; show representative totals
         rolls = _calculate_multi_hit_rolls(damages_per_hit, hit_count)
 
     # Calculate results
@@ -1287,15 +1333,11 @@ def calculate_damage(
     max_damage = max(rolls)
     defender_hp = defender_stats["hp"]
 
-    # Truncate to 1 decimal place (matching Showdown's behavior)
-    # e.g., 98.49% becomes 98.4%, not 98.5%
-    min_percent = int((min_damage / defender_hp) * 1000) / 10
-    max_percent = int((max_damage / defender_hp) * 1000) / 10
+    min_percent = _percent_of(min_damage, defender_hp)
+    max_percent = _percent_of(max_damage, defender_hp)
 
     # KO calculations
     kos = sum(1 for r in rolls if r >= defender_hp)
-    is_guaranteed_ohko = kos == 16
-    is_possible_ohko = kos > 0
 
     # Calculate detailed KO probabilities
     if hit_count > 1 and type_eff != 0:
@@ -1304,48 +1346,11 @@ def calculate_damage(
             damages_per_hit, hit_count, defender_hp
         )
     else:
-        # Use standard probability calculation for single-hit moves
         ko_probs = calculate_ko_probability(rolls, defender_hp)
 
     # Check for immunity (all rolls are 0)
     is_immune = max_damage == 0
 
-    if is_immune:
-        ko_chance = "Immune (0 damage)"
-    else:
-        # Use the detailed verdict from probability calculation
-        ko_chance = ko_probs.verdict
-
-    # Add STAB to applied mods
-    if stab_mod_4096 != MOD_NEUTRAL:
-        stab_mult = stab_mod_4096 / 4096
-        if stab_mod_4096 == MOD_STAB_BOOSTED:
-            applied_mods.append("STAB (2.0x - Tera/Adaptability)")
-        else:
-            applied_mods.append("STAB (1.5x)")
-
-    # Add type effectiveness to mods
-    type_eff = get_type_effectiveness(effective_move_type, defender_types)
-    if type_eff == 0:
-        applied_mods.append("Immune (0x)")
-    elif type_eff == 0.25:
-        applied_mods.append("4x Resist (0.25x)")
-    elif type_eff == 0.5:
-        applied_mods.append("Resist (0.5x)")
-    elif type_eff == 2:
-        applied_mods.append("Super Effective (2x)")
-    elif type_eff == 4:
-        applied_mods.append("4x Super Effective (4x)")
-
-    # Add multi-hit info to mods
-    if hit_count > 1:
-        crit_note = " (always crits)" if always_crit else ""
-        applied_mods.append(f"Multi-hit ({hit_count} hits{crit_note})")
-
-    # Add Commander to mods
-    if commander_boost_applied:
-        applied_mods.append("Commander (2x all stats)")
-
     return DamageResult(
         min_damage=min_damage,
         max_damage=max_damage,
@@ -1353,22 +1358,229 @@ def calculate_damage(
         max_percent=max_percent,
         rolls=rolls,
         defender_hp=defender_hp,
-        ko_chance=ko_chance,
-        is_guaranteed_ohko=is_guaranteed_ohko,
-        is_possible_ohko=is_possible_ohko,
+        ko_chance="Immune (0 damage)" if is_immune else ko_probs.verdict,
+        is_guaranteed_ohko=kos == 16,
+        is_possible_ohko=kos > 0,
         details={
             "attacker_stat": attack_stat,
             "defender_stat": defense_stat,
             "base_power": power,
-            "type_effectiveness": type_eff,
-            "modifiers_applied": applied_mods,
+            "type_effectiveness": plan.display_type_eff,
+            "modifiers_applied": list(plan.labels),
             "hit_count": hit_count,
-            "always_crit": always_crit,
+            "always_crit": plan.always_crit,
         },
         ko_probability=ko_probs if not is_immune else None
     )
 
 
+def evaluate_calc_plan_bounds(
+    plan: CalcPlan,
+    attacker_stats: dict[str, int],
+    defender_stats: dict[str, int],
+) -> DamageBounds:
+    """
+    Min/max damage of a compiled plan from the 85% and 100% rolls only.
+
+    Uses the same rounding chain as evaluate_calc_plan, so the bounds equal
+    that result's min_damage/max_damage, at a fraction of the cost.
+
+    Args:
+        plan: Plan from compile_calc_plan
+        attacker_stats: Attacker's calculated stats
+        defender_stats: Defender's calculated stats
+
+    Returns:
+        DamageBounds for the calc
+    """
+    if plan.no_damage is not None:
+        return DamageBounds(min_damage=0, max_damage=0, defender_hp=1)
+
+    base_damage = _plan_base_damage(plan, attacker_stats, defender_stats)[3]
+    hit_count = plan.hit_count
+    return DamageBounds(
+        min_damage=_roll_damage(plan, base_damage, 85) * hit_count,
+        max_damage=_roll_damage(plan, base_damage, 100) * hit_count,
+        defender_hp=defender_stats["hp"],
+    )
+
+
+def calc_plan_key(
+    attacker: PokemonBuild,
+    defender: PokemonBuild,
+    move: Move,
+    modifiers: DamageModifiers,
+    tera_blast_physical: bool = False,
+) -> tuple:
+    """Everything compile_calc_plan reads: identities, move, modifiers."""
+    return (
+        attacker.name, tuple(attacker.types), attacker.item, attacker.ability,
+        defender.name, tuple(defender.types), defender.item, defender.ability,
+        tuple(move.__dict__.values()),
+        tuple(modifiers.__dict__.values()),
+        tera_blast_physical,
+    )
+
+
+class CalcPlanCache:
+    """LRU cache of compiled plans shared by every calculate_damage caller."""
+
+    def __init__(self, max_entries: int = MAX_CALC_PLANS):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._plans: OrderedDict[tuple, CalcPlan] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(
+        self,
+        attacker: PokemonBuild,
+        defender: PokemonBuild,
+        move: Move,
+        modifiers: DamageModifiers,
+        tera_blast_physical: bool = False,
+    ) -> CalcPlan:
+        """Cached plan for this matchup, compiling it on first use."""
+        key = calc_plan_key(attacker, defender, move, modifiers, tera_blast_physical)
+        plan = self._plans.get(key)
+        if plan is not None:
+            self.hits += 1
+            self._plans.move_to_end(key)
+            return plan
+        self.misses += 1
+        plan = compile_calc_plan(attacker, defender, move, modifiers, tera_blast_physical)
+        self._plans[key] = plan
+        if len(self._plans) > self.max_entries:
+            self._plans.popitem(last=False)
+        return plan
+
+
+_plan_cache: Optional[CalcPlanCache] = None
+
+
+def get_calc_plan_cache() -> CalcPlanCache:
+    """The process-wide calc plan cache."""
+    global _plan_cache
+    if _plan_cache is None:
+        _plan_cache = CalcPlanCache()
+    return _plan_cache
+
+
+def reset_calc_plan_cache() -> None:
+    """Reset the shared cache (useful for testing)."""
+    global _plan_cache
+    _plan_cache = None
+
+
+def _plan_and_stats(
+    attacker: PokemonBuild,
+    defender: PokemonBuild,
+    move: Move,
+    modifiers: DamageModifiers,
+) -> tuple[CalcPlan, dict[str, int], dict[str, int]]:
+    """The shared cache's plan for a calc and the stats it is evaluated on."""
+    # When Terastallized, Tera Blast becomes physical if Attack > Special Attack,
+    # so that comparison is part of the plan's identity
+    attacker_stats = None
+    tera_blast_physical = False
+    if modifiers.tera_active and modifiers.tera_type and normalize_move(move.name) == "tera-blast":
+        attacker_stats = calculate_all_stats(attacker)
+        tera_blast_physical = attacker_stats["attack"] > attacker_stats["special_attack"]
+
+    plan = get_calc_plan_cache().get(attacker, defender, move, modifiers, tera_blast_physical)
+    if plan.no_damage is not None:
+        return plan, {}, {}
+    if attacker_stats is None:
+        attacker_stats = calculate_all_stats(attacker)
+    return plan, attacker_stats, calculate_all_stats(defender)
+
+
+def calculate_damage(
+    attacker: PokemonBuild,
+    defender: PokemonBuild,
+    move: Move,
+    modifiers: Optional[DamageModifiers] = None
+) -> DamageResult:
+    """
+    Calculate damage from one Pokemon to another.
+
+    The stat-independent work is compiled into a CalcPlan and cached, so
+    repeated calls that only change EVs, IVs or nature (spread optimizers,
+    matchup scoring, bulk calcs) reduce to stat arithmetic.
+
+    Args:
+        attacker: Attacking Pokemon with full build
+        defender: Defending Pokemon with full build
+        move: Move being used
+        modifiers: Battle conditions and modifiers
+
+    Returns:
+        DamageResult with damage range, percentages, and KO probability
+    """
+    record_damage_calc()
+    if modifiers is None:
+        modifiers = DamageModifiers()
+    return evaluate_calc_plan(*_plan_and_stats(attacker, defender, move, modifiers))
+
+
+def calculate_damage_bounds(
+    attacker: PokemonBuild,
+    defender: PokemonBuild,
+    move: Move,
+    modifiers: Optional[DamageModifiers] = None
+) -> DamageBounds:
+    """
+    Guaranteed min/max damage from one Pokemon to another.
+
+    A cheap first pass for searches: when the bounds are not ambiguous the
+    result's KO outcome is already known, and calculate_damage is only
+    needed for the damage rolls and KO probabilities.
+
+    Args:
+        attacker: Attacking Pokemon with full build
+        defender: Defending Pokemon with full build
+        move: Move being used
+        modifiers: Battle conditions and modifiers
+
+    Returns:
+        DamageBounds equal to calculate_damage's min/max damage
+    """
+    if modifiers is None:
+        modifiers = DamageModifiers()
+    return evaluate_calc_plan_bounds(*_plan_and_stats(attacker, defender, move, modifiers))
+
+
+def screen_survival(
+    attacker: PokemonBuild,
+    defender: PokemonBuild,
+    move: Move,
+    modifiers: Optional[DamageModifiers] = None
+) -> tuple[DamageBounds, float]:
+    """
+    Bounds of a calc and the share of its 16 rolls the defender survives.
+
+    The bounds settle "survives every roll" and "KO'd by every roll"; the
+    full calc only runs when they straddle the defender's HP.
+
+    Returns:
+        (DamageBounds, survival percent 0-100)
+    """
+    if modifiers is None:
+        modifiers = DamageModifiers()
+    plan, attacker_stats, defender_stats = _plan_and_stats(attacker, defender, move, modifiers)
+    bounds = evaluate_calc_plan_bounds(plan, attacker_stats, defender_stats)
+    if not bounds.is_possible_ohko:
+        return bounds, 100.0
+    if bounds.is_guaranteed_ohko:
+        return bounds, 0.0
+    record_damage_calc()
+    result = evaluate_calc_plan(plan, attacker_stats, defender_stats)
+    survives = sum(1 for r in result.rolls if r < result.defender_hp)
+    return bounds, (survives / 16) * 100
+
+
 # =============================================================================
 # 4096-based modifier helper functions
 # =============================================================================
@@ -1533,29 +1745,7 @@ def _get_type_boost_item_mod_4096(item: str | None, move_type: str) -> int:
     move_type = move_type.capitalize()
 
     # Type-boosting items (4915/4096 = ~1.2x) - applied to BASE POWER
-    type_items = {
-        "charcoal": "Fire",
-        "mystic-water": "Water",
-        "magnet": "Electric",
-        "miracle-seed": "Grass",
-        "never-melt-ice": "Ice",
-        "black-belt": "Fighting",
-        "poison-barb": "Poison",
-        "soft-sand": "Ground",
-        "sharp-beak": "Flying",
-        "twisted-spoon": "Psychic",
-        "silver-powder": "Bug",
-        "hard-stone": "Rock",
-        "spell-tag": "Ghost",
-        "dragon-fang": "Dragon",
-        "black-glasses": "Dark",
-        "metal-coat": "Steel",
-        "silk-scarf": "Normal",
-        "fairy-feather": "Fairy",
-        # Note: Ogerpon masks are NOT here - they boost ALL moves, handled separately
-    }
-
-    if item in type_items and type_items[item] == move_type:
+    if TYPE_BOOST_ITEMS.get(item) == move_type:
         return MOD_TYPE_BOOST  # 4915/4096 = ~1.2x
 
     # Plates (same boost as type items)
@@ -1698,13 +1888,12 @@ def calculate_ko_threshold(
         test_attacker = attacker.model_copy()
         test_attacker.evs = test_evs
 
-        result = calculate_damage(test_attacker, defender, move, modifiers)
-
-        # Calculate actual KO chance from rolls
-        kos = sum(1 for r in result.rolls if r >= result.defender_hp)
-        ko_pct = (kos / 16) * 100
+        # Actual KO chance from rolls, screened by the damage bounds
+        _, survival_pct = screen_survival(test_attacker, defender, move, modifiers)
+        ko_pct = 100 - survival_pct
 
         if ko_pct >= target_ko_chance:
+            result = calculate_damage(test_attacker, defender, move, modifiers)
             return {
                 "evs_needed": ev,
                 "stat_name": stat_name,
@@ -1764,16 +1953,14 @@ def calculate_bulk_threshold(
             test_defender = defender.model_copy()
             test_defender.evs = test_evs
 
-            result = calculate_damage(attacker, test_defender, move, modifiers)
-
-            # Calculate survival chance
-            survives = sum(1 for r in result.rolls if r < result.defender_hp)
-            survival_pct = (survives / 16) * 100
+            # Survival chance, screened by the damage bounds
+            _, survival_pct = screen_survival(attacker, test_defender, move, modifiers)
 
             if survival_pct >= target_survival_chance:
                 # Found a valid solution - check if it's better
                 # Prefer lower total EVs, or higher HP when totals are equal
                 if total < best_total_evs or (total == best_total_evs and hp_ev > best_result["hp_evs"]):
+                    result = calculate_damage(attacker, test_defender, move, modifiers)
                     best_total_evs = total
                     best_result = {
                         "hp_evs": hp_ev,
@@ -14,7 +14,7 @@ differences can change the actual amount recovered/lost per turn:
 """
 
 from ..config import EV_BREAKPOINTS_LV50
-from .stats import calculate_hp
+from .stat_table import get_stat_table
 
 # Items that benefit from 1/16 HP divisibility
 RECOVERY_16_ITEMS = {"leftovers", "black-sludge"}
@@ -118,8 +118,8 @@ def find_optimal_hp_evs(
     category = _get_item_category(item)
     results = []
 
-    for ev in EV_BREAKPOINTS_LV50:
-        hp = calculate_hp(base_hp, iv, ev, level)
+    hp_row = get_stat_table().row(base_hp, iv=iv, level=level, hp=True)
+    for ev, hp in zip(EV_BREAKPOINTS_LV50, hp_row):
         score = score_hp_for_item(hp, item)
 
         # Calculate recovery/recoil amount
@@ -193,7 +193,8 @@ def adjust_hp_evs_for_item(
          "score_after": float}
     """
     category = _get_item_category(item)
-    original_hp = calculate_hp(base_hp, iv, current_hp_evs, level)
+    table = get_stat_table()
+    original_hp = table.hp(base_hp, current_hp_evs, iv, level)
     original_score = score_hp_for_item(original_hp, item)
 
     # If no optimization relevant or already perfect, return unchanged
@@ -222,7 +223,7 @@ def adjust_hp_evs_for_item(
         if abs(ev - current_hp_evs) > max_adjustment:
             continue
 
-        hp = calculate_hp(base_hp, iv, ev, level)
+        hp = table.hp(base_hp, ev, iv, level)
         score = score_hp_for_item(hp, item)
 
         if score > best_score:
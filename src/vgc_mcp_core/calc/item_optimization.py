@@ -1,17 +1,52 @@
 """Item optimization calculations for VGC.
 
-This module provides core logic for comparing items (Life Orb vs Choice items)
-and analyzing EV-item trade-offs for competitive optimization.
+This module provides core logic for comparing items (Life Orb vs Choice items),
+analyzing EV-item trade-offs and searching items jointly with EV spreads
+against damage benchmarks for competitive optimization.
 """
 
 from typing import Optional
 from dataclasses import dataclass, replace
 
 from ..calc.items import calculate_life_orb_effect, get_item_damage_modifier
-from ..calc.damage import calculate_damage, DamageResult
+from ..calc.damage import (
+    RESISTANCE_BERRIES,
+    TYPE_BOOST_ITEMS,
+    calculate_damage,
+    evaluate_calc_plan,
+    evaluate_calc_plan_bounds,
+    get_calc_plan_cache,
+    CalcPlan,
+    DamageBounds,
+    DamageResult,
+)
+from ..calc.stat_table import get_stat_table
+from ..calc.stats import calculate_all_stats
+from ..config import EV_BREAKPOINTS_LV50
 from ..models.pokemon import PokemonBuild, BaseStats, Nature, EVSpread
 from ..models.move import Move, MoveCategory
-from ..calc.modifiers import DamageModifiers
+from ..calc.modifiers import DamageModifiers, get_type_effectiveness
+from ..utils.normalize import normalize_ability
+
+# Items searched by optimize_item_spreads when none are given; type boosters
+# for the benchmark moves and resist berries for the hits taken are added
+DEFAULT_SPREAD_ITEMS = (
+    "choice-specs",
+    "choice-band",
+    "life-orb",
+    "expert-belt",
+    "assault-vest",
+    "booster-energy",
+    "sitrus-berry",
+)
+
+# Stats the spread search invests in (Speed is kept from the build)
+SPREAD_STATS = ("hp", "attack", "defense", "special_attack", "special_defense")
+
+MAX_TOTAL_EVS = 508
+
+# Booster Energy only does anything with these abilities
+PARADOX_ABILITIES = ("protosynthesis", "quark-drive")
 
 
 @dataclass
@@ -37,6 +72,30 @@ class SustainabilityAnalysis:
     recommendation: str
 
 
+@dataclass
+class ItemBenchmark:
+    """A damage check the joint item/spread search has to pass."""
+    opponent: PokemonBuild
+    move: Move
+    goal: str = "survive"  # "survive" the opponent's move, or "ko" (OHKO) it with ours
+    modifiers: Optional[DamageModifiers] = None
+    label: str = ""
+
+
+@dataclass
+class ItemSpreadResult:
+    """Cheapest spread meeting the benchmarks with one item."""
+    item: str
+    evs: dict[str, int]
+    meets_benchmarks: bool
+    failed_benchmarks: list[str]
+    spare_evs: int  # EVs the benchmarks leave free (dumped into evs)
+    final_stats: dict[str, int]
+    benchmark_results: list[dict]
+    rank: int
+    showdown_paste: str
+
+
 @dataclass
 class EVTradeoffResult:
     """Result of EV-item trade-off analysis."""
@@ -76,9 +135,7 @@ def compare_items_damage(
 
     for item in items:
         # Create modified attacker with this item
-        attacker_dict = attacker.model_dump()
-        attacker_dict["item"] = item
-        attacker_with_item = PokemonBuild(**attacker_dict)
+        attacker_with_item = attacker.model_copy(update={"item": item})
 
         # Update modifiers with item (use dataclasses.replace for cleaner code)
         item_modifiers = replace(base_modifiers, attacker_item=item)
@@ -232,6 +289,9 @@ def calculate_ev_tradeoff(
     """
     Find optimal item + EV distribution to maximize stats.
 
+    This compares stat totals only; to check items against actual damage
+    benchmarks (survive X, OHKO Y) use optimize_item_spreads.
+
     Args:
         pokemon: Base Pokemon build
         target_benchmark: Dict with benchmark requirements
@@ -322,3 +382,302 @@ def calculate_ev_tradeoff(
         result.rank = i + 1
 
     return results
+
+
+def _benchmark_label(benchmark: ItemBenchmark) -> str:
+    if benchmark.label:
+        return benchmark.label
+    if benchmark.goal == "ko":
+        return f"OHKO {benchmark.opponent.name} with {benchmark.move.name}"
+    return f"Survive {benchmark.opponent.name}'s {benchmark.move.name}"
+
+
+def _highest_stat(stats: dict[str, int]) -> str:
+    """The stat Protosynthesis/Quark Drive boosts (ties go to the earlier stat)."""
+    return max(("attack", "defense", "special_attack", "special_defense", "speed"), key=stats.get)
+
+
+class _ItemSearch:
+    """Compiled damage plans for one item against every benchmark.
+
+    Each (benchmark, Booster Energy stat) pair is compiled once; candidate
+    spreads then only cost a stat-table lookup and a two-roll bounds check,
+    and the full 16-roll calc runs once per benchmark for the chosen spread.
+    """
+
+    def __init__(self, pokemon: PokemonBuild, item: str, benchmarks: list[ItemBenchmark]):
+        self.item = item
+        self.holder = pokemon.model_copy(update={"item": item})
+        self.benchmarks = benchmarks
+        self.opponent_stats = [calculate_all_stats(b.opponent) for b in benchmarks]
+        ability = normalize_ability(pokemon.ability) if pokemon.ability else None
+        self.paradox = (
+            ability if item == "booster-energy" and ability in PARADOX_ABILITIES else None
+        )
+        self._pokemon = pokemon
+        self._plans: dict[tuple[int, Optional[str]], CalcPlan] = {}
+
+    def stat_line(self, evs: dict[str, int]) -> dict[str, int]:
+        """Calculated stats for a spread (same values as calculate_all_stats)."""
+        table = get_stat_table()
+        pokemon = self._pokemon
+        base, ivs, level = pokemon.base_stats, pokemon.ivs, pokemon.level
+        stats = {"hp": table.hp(base.hp, evs["hp"], ivs.hp, level)}
+        for stat in ("attack", "defense", "special_attack", "special_defense", "speed"):
+            stats[stat] = table.stat(
+                getattr(base, stat), evs[stat], pokemon.get_nature_modifier(stat),
+                getattr(ivs, stat), level,
+            )
+        return stats
+
+    def plan(self, index: int, boosted: Optional[str] = None) -> CalcPlan:
+        """Compiled plan for a benchmark, with the holder's boosted stat."""
+        key = (index, boosted)
+        plan = self._plans.get(key)
+        if plan is None:
+            benchmark = self.benchmarks[index]
+            modifiers = benchmark.modifiers or DamageModifiers(is_doubles=True)
+            boost_field = (
+                "protosynthesis_boost" if self.paradox == "protosynthesis"
+                else "quark_drive_boost"
+            )
+            if benchmark.goal == "ko":
+                modifiers = replace(modifiers, attacker_item=self.item)
+                if boosted:
+                    modifiers = replace(modifiers, **{boost_field: boosted})
+                plan = get_calc_plan_cache().get(
+                    self.holder, benchmark.opponent, benchmark.move, modifiers
+                )
+            else:
+                modifiers = replace(modifiers, defender_item=self.item)
+                if boosted:
+                    modifiers = replace(modifiers, **{"defender_" + boost_field: boosted})
+                plan = get_calc_plan_cache().get(
+                    benchmark.opponent, self.holder, benchmark.move, modifiers
+                )
+            self._plans[key] = plan
+        return plan
+
+    def result(self, index: int, stats: dict[str, int]) -> DamageResult:
+        """Damage for a benchmark with the holder at these stats."""
+        plan = self.plan(index, _highest_stat(stats) if self.paradox else None)
+        if self.benchmarks[index].goal == "ko":
+            return evaluate_calc_plan(plan, stats, self.opponent_stats[index])
+        return evaluate_calc_plan(plan, self.opponent_stats[index], stats)
+
+    def bounds(self, index: int, stats: dict[str, int]) -> DamageBounds:
+        """Min/max damage for a benchmark; enough to tell if it passes."""
+        plan = self.plan(index, _highest_stat(stats) if self.paradox else None)
+        if self.benchmarks[index].goal == "ko":
+            return evaluate_calc_plan_bounds(plan, stats, self.opponent_stats[index])
+        return evaluate_calc_plan_bounds(plan, self.opponent_stats[index], stats)
+
+    def passes(self, index: int, evs: dict[str, int]) -> bool:
+        bounds = self.bounds(index, self.stat_line(evs))
+        if self.benchmarks[index].goal == "ko":
+            return bounds.is_guaranteed_ohko
+        return not bounds.is_possible_ohko
+
+    def invested_stat(self, index: int) -> Optional[str]:
+        """The holder's stat that moves this benchmark (besides HP), if any."""
+        plan = self.plan(index)
+        if plan.no_damage is not None:
+            return None
+        if self.benchmarks[index].goal == "ko":
+            return None if plan.attack_from_defender else plan.attack_stat_name
+        return plan.defense_stat_name
+
+    def min_ev(self, index: int, evs: dict[str, int], stat: str) -> Optional[int]:
+        """Fewest EVs in ``stat`` (at least evs[stat]) passing a benchmark.
+
+        Damage is monotonic in each stat, so this bisects the breakpoints.
+        """
+        trial = dict(evs)
+        lo = EV_BREAKPOINTS_LV50.index(evs[stat]) if evs[stat] in EV_BREAKPOINTS_LV50 else 0
+        hi = len(EV_BREAKPOINTS_LV50)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            trial[stat] = max(evs[stat], EV_BREAKPOINTS_LV50[mid])
+            if self.passes(index, trial):
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo == len(EV_BREAKPOINTS_LV50):
+            return None
+        return max(evs[stat], EV_BREAKPOINTS_LV50[lo])
+
+
+def _split_evs(evs: dict[str, int], stats: list[str], budget: int) -> None:
+    """Spread ``budget`` EVs evenly over ``stats`` in steps of 4, up to 252 each."""
+    stats = [stat for stat in stats if evs[stat] < 252]
+    while budget >= 4 and stats:
+        share = max(4, budget // len(stats) // 4 * 4)
+        for stat in list(stats):
+            added = min(share, 252 - evs[stat], budget)
+            evs[stat] += added
+            budget -= added
+            if evs[stat] >= 252:
+                stats.remove(stat)
+
+
+def _search_item_spread(
+    pokemon: PokemonBuild,
+    item: str,
+    benchmarks: list[ItemBenchmark],
+) -> ItemSpreadResult:
+    """Cheapest spread passing the benchmarks with one item, spare EVs dumped."""
+    search = _ItemSearch(pokemon, item, benchmarks)
+    needs = {stat: 0 for stat in SPREAD_STATS}
+    needs["speed"] = pokemon.evs.speed
+
+    # Offense first: the fewest Attack/Sp. Atk EVs for every OHKO benchmark
+    offense_stats = []
+    for index, benchmark in enumerate(benchmarks):
+        if benchmark.goal != "ko":
+            continue
+        stat = search.invested_stat(index)
+        if stat is None:
+            continue
+        offense_stats.append(stat)
+        ev = search.min_ev(index, needs, stat)
+        needs[stat] = 252 if ev is None else ev
+
+    # Bulk: for each HP breakpoint the fewest Def/SpD EVs surviving every hit,
+    # keeping the cheapest total
+    survive = [
+        (index, search.invested_stat(index))
+        for index, benchmark in enumerate(benchmarks)
+        if benchmark.goal != "ko"
+    ]
+    if survive:
+        best: Optional[dict[str, int]] = None
+        for hp_evs in EV_BREAKPOINTS_LV50:
+            if hp_evs < needs["hp"]:
+                continue
+            trial = dict(needs, hp=hp_evs)
+            for index, stat in survive:
+                if stat is None:
+                    continue
+                ev = search.min_ev(index, trial, stat)
+                if ev is None:
+                    break
+                trial[stat] = ev
+            else:
+                if best is None or sum(trial.values()) < sum(best.values()):
+                    best = trial
+        if best is None:
+            # Nothing survives everything: show the most bulk the EVs allow
+            best = dict(needs, hp=252)
+            stats = list(dict.fromkeys(stat for _, stat in survive if stat is not None))
+            _split_evs(best, stats, MAX_TOTAL_EVS - sum(best.values()))
+        needs = best
+
+    spare = MAX_TOTAL_EVS - sum(needs.values())
+    evs = dict(needs)
+    if spare > 0:
+        # Spare EVs go to the attacking stat, then HP, then the defenses
+        if offense_stats:
+            dump_order = [offense_stats[0]]
+        elif pokemon.base_stats.attack > pokemon.base_stats.special_attack:
+            dump_order = ["attack"]
+        else:
+            dump_order = ["special_attack"]
+        dump_order += [s for s in ("hp", "defense", "special_defense") if s not in dump_order]
+        remaining = spare
+        for stat in dump_order:
+            added = min(remaining, 252 - evs[stat])
+            evs[stat] += added
+            remaining -= added
+        # A bigger stat can move Booster Energy's boost; keep the minimal
+        # spread if the dump undid a benchmark
+        if not all(search.passes(i, evs) for i in range(len(benchmarks))):
+            evs = dict(needs)
+
+    stats = search.stat_line(evs)
+    benchmark_results = []
+    failed = []
+    for index, benchmark in enumerate(benchmarks):
+        result = search.result(index, stats)
+        if benchmark.goal == "ko":
+            passed = result.is_guaranteed_ohko
+        else:
+            passed = not result.is_possible_ohko
+        label = _benchmark_label(benchmark)
+        if not passed:
+            failed.append(label)
+        benchmark_results.append({
+            "benchmark": label,
+            "goal": benchmark.goal,
+            "damage": result.damage_range,
+            "ko_chance": result.ko_chance,
+            "passes": passed,
+        })
+    if spare < 0:
+        failed.append(f"Needs {sum(needs.values())} EVs (over {MAX_TOTAL_EVS})")
+
+    from ..formats.showdown import pokemon_build_to_showdown
+    build = search.holder.model_copy(update={"evs": EVSpread(**evs)})
+    return ItemSpreadResult(
+        item=item,
+        evs=evs,
+        meets_benchmarks=not failed,
+        failed_benchmarks=failed,
+        spare_evs=max(0, spare),
+        final_stats=stats,
+        benchmark_results=benchmark_results,
+        rank=0,
+        showdown_paste=pokemon_build_to_showdown(build),
+    )
+
+
+def default_spread_items(pokemon: PokemonBuild, benchmarks: list[ItemBenchmark]) -> list[str]:
+    """DEFAULT_SPREAD_ITEMS plus type boosters and resist berries the benchmarks call for."""
+    items = list(DEFAULT_SPREAD_ITEMS)
+    boosters = {move_type: item for item, move_type in TYPE_BOOST_ITEMS.items()}
+    berries = {move_type: item for item, move_type in RESISTANCE_BERRIES.items()}
+    for benchmark in benchmarks:
+        move_type = (benchmark.move.type or "").capitalize()
+        if benchmark.goal == "ko":
+            extra = boosters.get(move_type)
+        elif get_type_effectiveness(move_type, pokemon.types) >= 2:
+            extra = berries.get(move_type)
+        else:
+            extra = None
+        if extra and extra not in items:
+            items.append(extra)
+    return items
+
+
+def optimize_item_spreads(
+    pokemon: PokemonBuild,
+    benchmarks: list[ItemBenchmark],
+    items: Optional[list[str]] = None,
+) -> list[ItemSpreadResult]:
+    """
+    Search items jointly with EV spreads against damage benchmarks.
+
+    For each item, finds the fewest HP/Def/SpD/Atk/SpA EVs that OHKO every
+    "ko" benchmark and survive every "survive" benchmark (Speed EVs and
+    nature are kept from the build), then dumps the spare EVs into the
+    attacking stat and HP. For example, Assault Vest may survive a special
+    hit with fewer HP EVs, leaving more for Sp. Atk than Choice Specs does.
+
+    Each item/benchmark pair is compiled into a damage plan once, so the
+    spread search only evaluates stat lines.
+
+    Args:
+        pokemon: Build to optimize (species, nature, ability, Speed EVs)
+        benchmarks: Damage checks to pass
+        items: Items to try (default: default_spread_items)
+
+    Returns:
+        One result per item, ranked: benchmarks met first, then most spare EVs
+    """
+    if items is None:
+        items = default_spread_items(pokemon, benchmarks)
+
+    results = [_search_item_spread(pokemon, item, benchmarks) for item in items]
+    results.sort(key=lambda r: (not r.meets_benchmarks, len(r.failed_benchmarks), -r.spare_evs))
+    for i, result in enumerate(results):
+        result.rank = i + 1
+    return results
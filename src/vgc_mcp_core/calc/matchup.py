@@ -6,7 +6,7 @@ from typing import Optional
 from ..models.pokemon import PokemonBuild, BaseStats, Nature, EVSpread, IVSpread
 from ..models.move import Move, MoveCategory
 from ..models.team import Team
-from .damage import calculate_damage, DamageResult
+from .damage import calculate_damage, calculate_damage_bounds, DamageResult
 from .stats import calculate_all_stats
 from .speed import SPEED_BENCHMARKS
 from .modifiers import DamageModifiers, get_type_effectiveness
@@ -362,8 +362,9 @@ def analyze_single_matchup(
     defender_speed = defender_stats["speed"]
     outspeeds = attacker_speed > defender_speed
 
-    # Find best move and damage
+    # Find best move by its damage bounds; only that move needs the full calc
     best_result = None
+    best_move = None
     best_move_name = None
     best_damage_pct = 0
 
@@ -371,13 +372,16 @@ def analyze_single_matchup(
         if not move.is_damaging:
             continue
 
-        result = calculate_damage(attacker, defender, move, modifiers)
+        bounds = calculate_damage_bounds(attacker, defender, move, modifiers)
 
-        if result.max_percent > best_damage_pct:
-            best_damage_pct = result.max_percent
-            best_result = result
+        if bounds.max_percent > best_damage_pct:
+            best_damage_pct = bounds.max_percent
+            best_move = move
             best_move_name = move.name
 
+    if best_move is not None:
+        best_result = calculate_damage(attacker, defender, best_move, modifiers)
+
     if best_result is None:
         return MatchupResult(
             attacker_name=attacker.name,
@@ -405,8 +409,8 @@ def analyze_single_matchup(
             if not move.is_damaging:
                 continue
 
-            result = calculate_damage(defender, attacker, move, modifiers)
-            if result.is_possible_ohko:
+            bounds = calculate_damage_bounds(defender, attacker, move, modifiers)
+            if bounds.is_possible_ohko:
                 survives_attack = False
                 break
 
@@ -515,8 +519,8 @@ def analyze_threat_matchup(
                 modifiers=threat_modifiers
             )
 
-            result = calculate_damage(threat, pokemon, move, threat_modifiers)
-            if result.is_possible_ohko:
+            bounds = calculate_damage_bounds(threat, pokemon, move, threat_modifiers)
+            if bounds.is_possible_ohko:
                 member_survives = False
                 threatened.append(pokemon.name)
                 break
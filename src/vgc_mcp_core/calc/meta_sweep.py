@@ -0,0 +1,543 @@
+"""Usage-weighted "meta sweep" damage engine.
+
+Expands each top-N Smogon species into its common spreads, items, abilities
+and Tera types, weights every variant by how often it is played, and runs the
+exact damage engine between one build and all of them in both directions.
+Results are usage-weighted probabilities ("you survive 87% of the meta's
+Flutter Mane Moonblasts") rather than a single assumed set.
+
+Variants that present the same relevant stats to a calc (e.g. two Flutter
+Mane spreads differing only in HP when it is the attacker) share one calc,
+and a calc only runs the full 16 rolls when its min/max damage straddle the
+defender's HP.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ..models.move import Move, MoveCategory
+from ..models.pokemon import BaseStats, EVSpread, Nature, PokemonBuild
+from ..utils.name_index import get_name_resolver
+from ..utils.normalize import (
+    normalize_ability,
+    normalize_item,
+    normalize_move,
+    normalize_pokemon_name,
+)
+from .damage import DamageBounds, DamageResult, calculate_damage, calculate_damage_bounds
+from .modifiers import DamageModifiers
+from .stats import calculate_all_stats
+
+logger = logging.getLogger(__name__)
+
+
+# Per-species expansion limits (top entries kept, then renormalized)
+DEFAULT_MAX_SPREADS = 6
+DEFAULT_MAX_ITEMS = 3
+DEFAULT_MAX_ABILITIES = 2
+DEFAULT_MAX_TERA_TYPES = 3
+
+# Moves whose damage reads stats other than the usual attacking/defending pair
+_FULL_STAT_MOVES = {
+    "body-press", "foul-play", "photon-geyser", "tera-blast", "shell-side-arm",
+    "psyshock", "psystrike", "secret-sword", "gyro-ball", "electro-ball",
+}
+
+
+@dataclass
+class MetaSetVariant:
+    """One concrete set of a meta species and its share of that species' sets."""
+    build: PokemonBuild
+    weight: float  # variants of a species sum to 1.0
+    spread: str    # Smogon spread string, e.g. "Timid:4/0/0/252/0/252"
+
+    def describe(self) -> dict:
+        return {
+            "spread": self.spread,
+            "item": self.build.item,
+            "ability": self.build.ability,
+            "tera_type": self.build.tera_type,
+            "weight_percent": round(self.weight * 100, 1),
+        }
+
+
+@dataclass
+class MetaSpecies:
+    """A top-usage species expanded into weighted sets and damaging moves."""
+    name: str
+    usage_percent: float
+    variants: list[MetaSetVariant]
+    moves: list[tuple[Move, float]] = field(default_factory=list)  # (move, usage %)
+
+
+@dataclass
+class SweepResult:
+    """Usage-weighted outcome of one move between your build and one species."""
+    species: str
+    move: str
+    direction: str              # "incoming" (they attack you) or "outgoing"
+    usage_percent: float        # species usage
+    move_usage_percent: float   # how often the attacker runs the move
+    ko_percent: float           # usage-weighted OHKO chance over variants and rolls
+    min_percent: float          # lowest roll across variants
+    max_percent: float          # highest roll across variants
+    worst_case: dict            # variant producing the highest roll
+    variants: list[dict] = field(default_factory=list)  # per-variant outcome, in input order
+
+    @property
+    def survive_percent(self) -> float:
+        return round(100 - self.ko_percent, 1)
+
+    def to_dict(self) -> dict:
+        data = {
+            "species": self.species,
+            "move": self.move,
+            "usage_percent": self.usage_percent,
+            "move_usage_percent": self.move_usage_percent,
+            "ko_percent": self.ko_percent,
+            "damage_percent": f"{self.min_percent}-{self.max_percent}%",
+            "worst_case": self.worst_case,
+        }
+        if self.direction == "incoming":
+            data["survive_percent"] = self.survive_percent
+        return data
+
+
+@dataclass
+class MetaSweepReport:
+    """Meta sweep results for one build."""
+    pokemon: str
+    incoming: list[SweepResult]
+    outgoing: list[SweepResult]
+    species_analyzed: int
+    variant_calcs: int   # variant x move pairs evaluated
+    damage_calcs: int    # distinct calcs actually run (damage bounds)
+    exact_calcs: int = 0  # of those, full 16-roll calcs for KO-or-not cases
+
+    @property
+    def meta_survival_percent(self) -> Optional[float]:
+        """Chance to survive a random meta attack, weighted by species and move usage."""
+        weights = [
+            (r.usage_percent * r.move_usage_percent, r.survive_percent) for r in self.incoming
+        ]
+        total = sum(w for w, _ in weights)
+        if not total:
+            return None
+        return round(sum(w * p for w, p in weights) / total, 1)
+
+    def best_ko_by_species(self) -> dict[str, SweepResult]:
+        """Your highest-KO-chance move against each species."""
+        best: dict[str, SweepResult] = {}
+        for result in self.outgoing:
+            current = best.get(result.species)
+            if current is None or result.ko_percent > current.ko_percent:
+                best[result.species] = result
+        return best
+
+    @property
+    def meta_ko_percent(self) -> Optional[float]:
+        """Usage-weighted chance to OHKO a meta species with your best move for it."""
+        best = self.best_ko_by_species()
+        total = sum(r.usage_percent for r in best.values())
+        if not total:
+            return None
+        return round(sum(r.usage_percent * r.ko_percent for r in best.values()) / total, 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "pokemon": self.pokemon,
+            "species_analyzed": self.species_analyzed,
+            "meta_survival_percent": self.meta_survival_percent,
+            "meta_ko_percent": self.meta_ko_percent,
+            "incoming": [r.to_dict() for r in self.incoming],
+            "outgoing": [r.to_dict() for r in self.outgoing],
+            "variant_calcs": self.variant_calcs,
+            "damage_calcs": self.damage_calcs,
+            "exact_calcs": self.exact_calcs,
+        }
+
+
+def _top_shares(dist: dict, limit: int) -> list[tuple[str, float]]:
+    """Top ``limit`` entries of a usage distribution, renormalized to sum to 1."""
+    top = sorted(dist.items(), key=lambda x: -x[1])[:limit]
+    total = sum(v for _, v in top)
+    if not total:
+        return []
+    return [(name, value / total) for name, value in top]
+
+
+def expand_usage_variants(
+    species: str,
+    base_stats: BaseStats,
+    types: list[str],
+    usage: dict,
+    max_spreads: int = DEFAULT_MAX_SPREADS,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    max_abilities: int = DEFAULT_MAX_ABILITIES,
+    max_tera_types: int = DEFAULT_MAX_TERA_TYPES,
+    expand_tera: bool = False,
+) -> list[MetaSetVariant]:
+    """Expand processed usage (``SmogonStatsClient.get_pokemon_usage``) into weighted sets.
+
+    Spreads, items, abilities and Tera types are treated as independent, so a
+    variant's weight is the product of its marginal shares. Tera types are
+    only expanded when ``expand_tera`` is set; otherwise every variant carries
+    the most common one.
+
+    Returns:
+        Variants whose weights sum to 1, or [] if the species has no spreads
+    """
+    spreads = [s for s in usage.get("spreads", []) if "evs" in s][:max_spreads]
+    spread_total = sum(s.get("usage", 0) for s in spreads)
+    if not spreads:
+        return []
+
+    items = _top_shares(usage.get("items", {}), max_items) or [(None, 1.0)]
+    abilities = _top_shares(usage.get("abilities", {}), max_abilities) or [(None, 1.0)]
+    teras = _top_shares(usage.get("tera_types", {}), max_tera_types if expand_tera else 1)
+    teras = teras if expand_tera else [(name, 1.0) for name, _ in teras]
+    teras = teras or [(None, 1.0)]
+
+    variants = []
+    for spread in spreads:
+        try:
+            nature = Nature(spread["nature"].lower())
+        except (KeyError, ValueError):
+            continue
+        evs = EVSpread(**spread["evs"])
+        spread_weight = (
+            spread.get("usage", 0) / spread_total if spread_total else 1 / len(spreads)
+        )
+        for item, item_weight in items:
+            for ability, ability_weight in abilities:
+                for tera, tera_weight in teras:
+                    variants.append(MetaSetVariant(
+                        build=PokemonBuild(
+                            name=species,
+                            base_stats=base_stats,
+                            types=types,
+                            nature=nature,
+                            evs=evs,
+                            item=normalize_item(item) if item else None,
+                            ability=normalize_ability(ability) if ability else None,
+                            tera_type=tera.capitalize() if tera else None,
+                        ),
+                        weight=spread_weight * item_weight * ability_weight * tera_weight,
+                        spread=spread.get("spread_string", ""),
+                    ))
+
+    total = sum(v.weight for v in variants)
+    for variant in variants:
+        variant.weight /= total
+    return variants
+
+
+def _stat_key(stats: dict, move: Move, role: str) -> tuple:
+    """The stats of one side that can influence this move's damage."""
+    if normalize_move(move.name) in _FULL_STAT_MOVES:
+        return tuple(stats.values())
+    physical = move.category == MoveCategory.PHYSICAL
+    if role == "attacker":
+        used = ("hp", "attack" if physical else "special_attack", "speed")
+    else:
+        used = ("hp", "defense" if physical else "special_defense", "speed")
+    return tuple(stats[s] for s in used)
+
+
+def _ohko_percent(result: DamageResult) -> float:
+    if result.ko_probability is not None:
+        return result.ko_probability.ohko_chance
+    return sum(1 for r in result.rolls if r >= result.defender_hp) / len(result.rolls) * 100
+
+
+class _CalcCache:
+    """Memoizes calcs on the inputs that actually reach the formula.
+
+    Each calc is screened with its damage bounds first; the full 16-roll
+    calc only runs when some rolls KO and some don't.
+    """
+
+    def __init__(self):
+        self._outcomes: dict[tuple, tuple[DamageBounds, float]] = {}
+        self._stats: dict[tuple, dict] = {}
+        self.lookups = 0
+        self.exact_calcs = 0
+
+    def stats(self, build: PokemonBuild) -> dict:
+        # Keyed on content, not id(): tera'd copies are short-lived and their
+        # ids get reused by other builds
+        key = (
+            build.name,
+            tuple(build.base_stats.__dict__.values()),
+            build.nature,
+            tuple(build.evs.__dict__.values()),
+            tuple(build.ivs.__dict__.values()),
+            build.level,
+        )
+        if key not in self._stats:
+            self._stats[key] = calculate_all_stats(build)
+        return self._stats[key]
+
+    def calc(
+        self,
+        attacker: PokemonBuild,
+        defender: PokemonBuild,
+        move: Move,
+        modifiers: DamageModifiers,
+    ) -> tuple[DamageBounds, float]:
+        """Damage bounds and OHKO chance (0-100) of one calc."""
+        self.lookups += 1
+        key = (
+            attacker.name, _stat_key(self.stats(attacker), move, "attacker"),
+            attacker.item, attacker.ability, attacker.tera_type,
+            defender.name, _stat_key(self.stats(defender), move, "defender"),
+            defender.item, defender.ability, defender.tera_type, tuple(defender.types),
+            move.name, modifiers.tera_active, modifiers.defender_tera_active,
+        )
+        outcome = self._outcomes.get(key)
+        if outcome is None:
+            bounds = calculate_damage_bounds(attacker, defender, move, modifiers)
+            if bounds.is_ambiguous:
+                self.exact_calcs += 1
+                ohko = _ohko_percent(calculate_damage(attacker, defender, move, modifiers))
+            else:
+                ohko = 100.0 if bounds.is_guaranteed_ohko else 0.0
+            outcome = self._outcomes[key] = (bounds, ohko)
+        return outcome
+
+    @property
+    def calcs(self) -> int:
+        return len(self._outcomes)
+
+
+def _sweep(
+    cache: _CalcCache,
+    direction: str,
+    species: MetaSpecies,
+    move: Move,
+    move_usage: float,
+    pairs: list[tuple[MetaSetVariant, PokemonBuild, PokemonBuild, DamageModifiers]],
+) -> SweepResult:
+    ko = 0.0
+    min_pct = float("inf")
+    max_pct = 0.0
+    worst = None
+    outcomes = []
+    for variant, attacker, defender, modifiers in pairs:
+        bounds, ohko = cache.calc(attacker, defender, move, modifiers)
+        ko += variant.weight * ohko
+        min_pct = min(min_pct, bounds.min_percent)
+        outcome = {
+            **variant.describe(),
+            "damage_range": bounds.damage_range,
+            "min_damage": bounds.min_damage,
+            "max_damage": bounds.max_damage,
+            "min_percent": round(bounds.min_percent, 1),
+            "max_percent": round(bounds.max_percent, 1),
+            "ko_percent": round(ohko, 1),
+        }
+        outcomes.append(outcome)
+        if worst is None or bounds.max_percent > max_pct:
+            max_pct = bounds.max_percent
+            worst = {**variant.describe(), "damage_range": bounds.damage_range}
+    return SweepResult(
+        species=species.name,
+        move=move.name,
+        direction=direction,
+        usage_percent=species.usage_percent,
+        move_usage_percent=move_usage,
+        ko_percent=round(ko, 1),
+        min_percent=round(min_pct, 1),
+        max_percent=round(max_pct, 1),
+        worst_case=worst or {},
+        variants=outcomes,
+    )
+
+
+def run_meta_sweep(
+    your_build: PokemonBuild,
+    your_moves: list[Move],
+    meta: list[MetaSpecies],
+    your_tera_active: bool = False,
+    threat_tera_active: bool = False,
+) -> MetaSweepReport:
+    """Run your build against every weighted variant of every meta species.
+
+    Args:
+        your_build: Your Pokemon (nature, EVs, item, ability, Tera type)
+        your_moves: Your attacking moves for the outgoing direction
+        meta: Species from ``load_meta_species`` / ``expand_usage_variants``
+        your_tera_active: Whether you are Terastallized (changes defensive
+            typing and STAB)
+        threat_tera_active: Whether meta variants are Terastallized into
+            their Tera type
+
+    Returns:
+        MetaSweepReport with per species x move incoming/outgoing results
+    """
+    cache = _CalcCache()
+    incoming: list[SweepResult] = []
+    outgoing: list[SweepResult] = []
+
+    you_defending = your_build
+    if your_tera_active and your_build.tera_type:
+        you_defending = your_build.model_copy(update={"types": [your_build.tera_type]})
+
+    for species in meta:
+        for move, move_usage in species.moves:
+            if not move.is_damaging:
+                continue
+            pairs = [
+                (variant, variant.build, you_defending, DamageModifiers(
+                    is_doubles=True,
+                    multiple_targets=move.is_spread,
+                    tera_type=variant.build.tera_type if threat_tera_active else None,
+                    tera_active=threat_tera_active and variant.build.tera_type is not None,
+                    defender_tera_type=your_build.tera_type if your_tera_active else None,
+                    defender_tera_active=your_tera_active and your_build.tera_type is not None,
+                ))
+                for variant in species.variants
+            ]
+            incoming.append(_sweep(cache, "incoming", species, move, move_usage, pairs))
+
+        for move in your_moves:
+            if not move.is_damaging:
+                continue
+            pairs = []
+            for variant in species.variants:
+                defender = variant.build
+                if threat_tera_active and defender.tera_type:
+                    defender = defender.model_copy(update={"types": [defender.tera_type]})
+                pairs.append((variant, your_build, defender, DamageModifiers(
+                    is_doubles=True,
+                    multiple_targets=move.is_spread,
+                    tera_type=your_build.tera_type if your_tera_active else None,
+                    tera_active=your_tera_active and your_build.tera_type is not None,
+                    defender_tera_type=defender.tera_type if threat_tera_active else None,
+                    defender_tera_active=threat_tera_active and defender.tera_type is not None,
+                )))
+            outgoing.append(_sweep(cache, "outgoing", species, move, 100.0, pairs))
+
+    incoming.sort(key=lambda r: (-r.ko_percent, -r.usage_percent))
+    outgoing.sort(key=lambda r: (-r.ko_percent, -r.usage_percent))
+    return MetaSweepReport(
+        pokemon=your_build.name,
+        incoming=incoming,
+        outgoing=outgoing,
+        species_analyzed=len(meta),
+        variant_calcs=cache.lookups,
+        damage_calcs=cache.calcs,
+        exact_calcs=cache.exact_calcs,
+    )
+
+
+async def resolve_usage_move(pokeapi, move_id: str) -> Optional[Move]:
+    """Fetch a move named the Smogon way ("shadowball") or the PokeAPI way."""
+    if not move_id:
+        return None
+    name = get_name_resolver().resolve("move", move_id) or move_id
+    try:
+        return await pokeapi.get_move(name)
+    except Exception as e:
+        logger.debug(f"Skipping unresolved usage move {move_id!r}: {e}")
+        return None
+
+
+async def load_species_sets(
+    smogon,
+    pokeapi,
+    name: str,
+    format_name: Optional[str] = None,
+    rating: int = 0,
+    max_moves: int = 3,
+    expand_tera: bool = False,
+    **limits,
+) -> Optional[MetaSpecies]:
+    """Fetch and expand one species' usage into weighted sets and damaging moves.
+
+    Args:
+        smogon: SmogonStatsClient
+        pokeapi: PokeAPIClient
+        name: Species name
+        format_name: Smogon format (auto-detected if None)
+        rating: Rating cutoff
+        max_moves: Damaging moves kept, by usage
+        expand_tera: Expand Tera types into separate variants
+        **limits: max_spreads / max_items / max_abilities / max_tera_types
+
+    Returns:
+        The species, or None if it has no usage, spreads or PokeAPI data
+    """
+    usage = await smogon.get_pokemon_usage(name, format_name, rating)
+    if not usage:
+        return None
+    try:
+        base_stats = await pokeapi.get_base_stats(name)
+        types = await pokeapi.get_pokemon_types(name)
+    except Exception as e:
+        logger.debug(f"Skipping meta species {name!r}: {e}")
+        return None
+
+    variants = expand_usage_variants(
+        name, base_stats, types, usage, expand_tera=expand_tera, **limits
+    )
+    if not variants:
+        return None
+
+    moves: list[tuple[Move, float]] = []
+    for move_id, move_usage in usage.get("moves", {}).items():
+        if len(moves) >= max_moves:
+            break
+        move = await resolve_usage_move(pokeapi, move_id)
+        if move is not None and move.is_damaging:
+            moves.append((move, move_usage))
+
+    return MetaSpecies(
+        name=name,
+        usage_percent=usage.get("usage_percent", 0),
+        variants=variants,
+        moves=moves,
+    )
+
+
+async def load_meta_species(
+    smogon,
+    pokeapi,
+    top_n: int = 12,
+    format_name: Optional[str] = None,
+    rating: int = 0,
+    exclude: tuple[str, ...] = (),
+    max_moves: int = 3,
+    expand_tera: bool = False,
+    **limits,
+) -> list[MetaSpecies]:
+    """Fetch and expand the top-N species of the current usage ranking.
+
+    Args:
+        smogon: SmogonStatsClient
+        pokeapi: PokeAPIClient
+        top_n: Number of species by usage
+        format_name: Smogon format (auto-detected if None)
+        rating: Rating cutoff
+        exclude: Species to skip (e.g. your own Pokemon)
+        max_moves: Damaging moves kept per species, by usage
+        expand_tera: Expand Tera types into separate variants
+        **limits: max_spreads / max_items / max_abilities / max_tera_types
+
+    Returns:
+        Species in usage order; species without data are dropped
+    """
+    skip = {normalize_pokemon_name(name) for name in exclude}
+    ranking = await smogon.get_usage_ranking(format_name, rating)
+    names = [n for n in ranking if normalize_pokemon_name(n) not in skip][:top_n]
+
+    loaded = await asyncio.gather(*(
+        load_species_sets(
+            smogon, pokeapi, name, format_name, rating,
+            max_moves=max_moves, expand_tera=expand_tera, **limits,
+        )
+        for name in names
+    ))
+    return [species for species in loaded if species is not None]
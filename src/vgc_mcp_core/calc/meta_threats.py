@@ -12,6 +12,7 @@ from ..models.pokemon import PokemonBuild, BaseStats, EVSpread, Nature
 from ..models.move import Move, MoveCategory
 from .stats import calculate_all_stats
 from .modifiers import get_type_effectiveness
+from .meta_sweep import MetaSpecies, SweepResult
 from ..utils.damage_verdicts import calculate_ko_verdict, calculate_ko_probability
 
 
@@ -256,39 +257,116 @@ def analyze_single_threat(
                 **damage
             }
 
-    # Speed comparison
+    return ThreatDamageResult(
+        threat_name=threat_name,
+        threat_usage_pct=threat_usage_pct,
+        your_damage_to_threat=best_your_damage if best_your_damage.get("max_percent", 0) > 0 else {"message": "No damaging moves analyzed"},
+        threat_damage_to_you=best_threat_damage if best_threat_damage.get("max_percent", 0) > 0 else {"message": "No damaging moves analyzed"},
+        speed_comparison=_compare_speed(your_speed, threat_speed),
+        matchup_verdict=_matchup_verdict(
+            best_your_damage, best_threat_damage, your_speed > threat_speed
+        ),
+        threat_spread=threat_spread,
+        threat_stats=threat_stats
+    )
+
+
+def _compare_speed(your_speed: int, threat_speed: int) -> str:
     if your_speed > threat_speed:
-        speed_comparison = f"You outspeed ({your_speed} vs {threat_speed})"
+        return f"You outspeed ({your_speed} vs {threat_speed})"
     elif your_speed < threat_speed:
-        speed_comparison = f"They outspeed ({threat_speed} vs {your_speed})"
-    else:
-        speed_comparison = f"Speed tie ({your_speed})"
+        return f"They outspeed ({threat_speed} vs {your_speed})"
+    return f"Speed tie ({your_speed})"
 
-    # Determine verdict
-    you_ohko = best_your_damage.get("is_guaranteed_ohko", False)
-    they_ohko = best_threat_damage.get("is_guaranteed_ohko", False)
-    you_faster = your_speed > threat_speed
+
+def _matchup_verdict(your_damage: dict, threat_damage: dict, you_faster: bool) -> str:
+    """Favorable / Unfavorable / Even from each side's best hit and the speed order."""
+    you_ohko = your_damage.get("is_guaranteed_ohko", False)
+    they_ohko = threat_damage.get("is_guaranteed_ohko", False)
 
     if you_ohko and (you_faster or not they_ohko):
-        verdict = "Favorable"
+        return "Favorable"
     elif they_ohko and (not you_faster or not you_ohko):
-        verdict = "Unfavorable"
-    elif best_your_damage.get("max_percent", 0) > best_threat_damage.get("max_percent", 0) + 20:
-        verdict = "Favorable"
-    elif best_threat_damage.get("max_percent", 0) > best_your_damage.get("max_percent", 0) + 20:
-        verdict = "Unfavorable"
+        return "Unfavorable"
+    elif your_damage.get("max_percent", 0) > threat_damage.get("max_percent", 0) + 20:
+        return "Favorable"
+    elif threat_damage.get("max_percent", 0) > your_damage.get("max_percent", 0) + 20:
+        return "Unfavorable"
+    return "Even"
+
+
+def _sweep_damage(result: Optional[SweepResult], moves: dict[str, Move]) -> dict:
+    """A sweep result in the damage-dict shape analyze_single_threat produces."""
+    if result is None:
+        return {"message": "No damaging moves analyzed"}
+    if result.ko_percent >= 100:
+        verdict = "Guaranteed OHKO"
+    elif result.ko_percent > 0:
+        verdict = f"{result.ko_percent}% chance to OHKO"
     else:
-        verdict = "Even"
+        verdict = calculate_ko_verdict(result.min_percent, result.max_percent).verdict
+    move = moves.get(result.move)
+    return {
+        "move": result.move,
+        "type": move.type if move else None,
+        "category": move.category.value if move else None,
+        "min_percent": result.min_percent,
+        "max_percent": result.max_percent,
+        "is_guaranteed_ohko": result.ko_percent >= 100,
+        "is_possible_ohko": result.ko_percent > 0,
+        "ko_chance": verdict,
+        "ohko_chance": result.ko_percent,
+        "worst_case": result.worst_case,
+    }
+
+
+def analyze_threat_sweep(
+    species: MetaSpecies,
+    incoming: list[SweepResult],
+    outgoing: list[SweepResult],
+    your_moves: list[Move],
+    your_speed: int,
+) -> ThreatDamageResult:
+    """
+    Analyze matchup against a single threat from its meta sweep results.
+
+    Each side's best move is the one with the highest usage-weighted OHKO
+    chance, then the highest roll. Speed is compared against the species'
+    most common set.
+
+    Args:
+        species: The threat, as passed to run_meta_sweep
+        incoming: The threat's sweep results against you
+        outgoing: Your sweep results against the threat
+        your_moves: Your moves, as passed to run_meta_sweep
+        your_speed: Your calculated speed
+
+    Returns:
+        ThreatDamageResult with matchup analysis
+    """
+    def best(results: list[SweepResult]) -> Optional[SweepResult]:
+        return max(results, key=lambda r: (r.ko_percent, r.max_percent), default=None)
+
+    common = max(species.variants, key=lambda v: v.weight)
+    threat_stats = calculate_all_stats(common.build)
+    your_damage = _sweep_damage(best(outgoing), {m.name: m for m in your_moves})
+    threat_damage = _sweep_damage(best(incoming), {m.name: m for m, _ in species.moves})
 
     return ThreatDamageResult(
-        threat_name=threat_name,
-        threat_usage_pct=threat_usage_pct,
-        your_damage_to_threat=best_your_damage if best_your_damage.get("max_percent", 0) > 0 else {"message": "No damaging moves analyzed"},
-        threat_damage_to_you=best_threat_damage if best_threat_damage.get("max_percent", 0) > 0 else {"message": "No damaging moves analyzed"},
-        speed_comparison=speed_comparison,
-        matchup_verdict=verdict,
-        threat_spread=threat_spread,
-        threat_stats=threat_stats
+        threat_name=species.name,
+        threat_usage_pct=species.usage_percent,
+        your_damage_to_threat=your_damage,
+        threat_damage_to_you=threat_damage,
+        speed_comparison=_compare_speed(your_speed, threat_stats["speed"]),
+        matchup_verdict=_matchup_verdict(
+            your_damage, threat_damage, your_speed > threat_stats["speed"]
+        ),
+        threat_spread={
+            "nature": common.build.nature.value.title(),
+            "evs": common.build.evs.model_dump(),
+            "usage": round(common.weight * 100, 1),
+        },
+        threat_stats=threat_stats,
     )
 
 
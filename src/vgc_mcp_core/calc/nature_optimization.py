@@ -14,8 +14,8 @@ from dataclasses import dataclass
 from pydantic import BaseModel
 
 from ..models.pokemon import Nature, BaseStats, get_nature_modifier
-from .stats import calculate_stat, calculate_speed, find_speed_evs
-from ..config import EV_BREAKPOINTS_LV50
+from .stats import calculate_speed, find_speed_evs
+from .stat_table import get_stat_table
 
 
 class NatureOptimizationResult(BaseModel):
@@ -131,15 +131,10 @@ def calculate_evs_for_benchmarks(
         speed_mod = get_nature_modifier(nature, "speed")
         
         # Find minimum Speed EVs needed
-        speed_evs = None
-        for ev in EV_BREAKPOINTS_LV50:
-            calculated_speed = calculate_stat(
-                base_stats.speed, 31, ev, level, speed_mod
-            )
-            if calculated_speed >= target_speed:
-                speed_evs = ev
-                break
-        
+        speed_evs = get_stat_table().min_ev(
+            base_stats.speed, target_speed, speed_mod, 31, level
+        )
+
         if speed_evs is None:
             # Cannot reach speed target even with 252 EVs
             return None
@@ -1,11 +1,12 @@
 """Speed comparison and tier utilities."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, TYPE_CHECKING
 
-from ..models.pokemon import Nature, PokemonBuild
+from ..models.pokemon import Nature, PokemonBuild, get_nature_modifier, parse_nature
 from .stats import calculate_speed, calculate_all_stats, find_speed_evs
-from ..config import EV_BREAKPOINTS_LV50
+from .stat_table import get_stat_table
 
 if TYPE_CHECKING:
     from ..api.smogon import SmogonStatsClient
@@ -148,14 +149,16 @@ def find_speed_evs_to_underspeed(
     Returns:
         Maximum EVs while staying slower, or None if impossible
     """
-    # Start from 252 and work down (level 50 breakpoints: 252, 244, 236...)
-    for ev in reversed(EV_BREAKPOINTS_LV50):
-        speed = calculate_speed(base_speed, iv, ev, level, nature)
-        if speed < target_speed:
-            return ev
+    table = get_stat_table()
+    nature_mod = get_nature_modifier(nature, "speed")
+
+    # Largest level 50 breakpoint (252, 244, 236...) still below the target
+    evs = table.max_ev_below(base_speed, target_speed, nature_mod, iv, level)
+    if evs is not None:
+        return evs
 
     # Even 0 EVs is too fast, try 0 IV
-    speed_0iv = calculate_speed(base_speed, 0, 0, level, nature)
+    speed_0iv = table.stat(base_speed, 0, nature_mod, 0, level)
     if speed_0iv < target_speed:
         return 0  # Need to use 0 IV
 
@@ -213,15 +216,16 @@ def get_speed_benchmark(pokemon_name: str, benchmark_type: str = "max_positive")
     
     base = data["base"]
     
+    table = get_stat_table()
     if benchmark_type == "max_positive":
         # Use Jolly for physical attackers, Timid for special - default to Jolly
-        return calculate_speed(base, 31, 252, 50, Nature.JOLLY)
+        return table.stat(base, 252, 1.1)
     elif benchmark_type == "max_neutral":
-        return calculate_speed(base, 31, 252, 50, Nature.SERIOUS)
+        return table.stat(base, 252, 1.0)
     elif benchmark_type == "neutral_0ev":
-        return calculate_speed(base, 31, 0, 50, Nature.SERIOUS)
+        return table.stat(base, 0, 1.0)
     elif benchmark_type == "min_negative":
-        return calculate_speed(base, 0, 0, 50, Nature.BRAVE)
+        return table.stat(base, 0, 0.9, iv=0)
     
     return None
 
@@ -811,56 +815,71 @@ def get_speed_tier_info(pokemon_name: str) -> Optional[dict]:
 def get_meta_speed_tier(pokemon_name: str) -> Optional[dict]:
     """
     Get VGC meta speed tier info for a Pokemon with dynamically calculated speeds.
-    
-    Calculates common_speeds from spreads data instead of using hardcoded values.
+
+    Served from the usage-derived speed tier table once it has loaded (see
+    ``calc.speed_tiers``); otherwise calculates common_speeds from the spreads
+    in META_SPEED_TIERS.
     """
-    name = pokemon_name.lower().replace(" ", "-")
+    from .speed_tiers import get_speed_tier_store, tier_key
+
+    name = tier_key(pokemon_name)
 
-    # Normalize Ogerpon mask form names (e.g., "ogerpon-wellspring-mask" -> "ogerpon-wellspring")
-    if name.endswith("-mask"):
-        name = name.replace("-mask", "")
+    table = get_speed_tier_store().table
+    entry = table.get(name) if table is not None else None
+    if entry is not None:
+        result = entry.to_tier()
+        paradox_type = META_SPEED_TIERS.get(name, {}).get("paradox_type")
+        if paradox_type:
+            result["paradox_type"] = paradox_type
+        return result
 
+    data = _static_meta_speed_tier(name)
+    return data.copy() if data else None
+
+
+@lru_cache(maxsize=None)
+def _static_meta_speed_tier(name: str) -> Optional[dict]:
     data = META_SPEED_TIERS.get(name)
     if not data:
         return None
-    
+
     # Calculate common_speeds dynamically from spreads if available
     if "spreads" in data and "base" in data:
         base = data["base"]
         calculated_speeds = []
         speed_set = set()
-        
-        # Nature name -> Nature enum mapping
-        NATURE_MAP = {
-            "adamant": Nature.ADAMANT, "bashful": Nature.BASHFUL, "bold": Nature.BOLD,
-            "brave": Nature.BRAVE, "calm": Nature.CALM, "careful": Nature.CAREFUL,
-            "docile": Nature.DOCILE, "gentle": Nature.GENTLE, "hardy": Nature.HARDY,
-            "hasty": Nature.HASTY, "impish": Nature.IMPISH, "jolly": Nature.JOLLY,
-            "lax": Nature.LAX, "lonely": Nature.LONELY, "mild": Nature.MILD,
-            "modest": Nature.MODEST, "naive": Nature.NAIVE, "naughty": Nature.NAUGHTY,
-            "quiet": Nature.QUIET, "quirky": Nature.QUIRKY, "rash": Nature.RASH,
-            "relaxed": Nature.RELAXED, "sassy": Nature.SASSY, "serious": Nature.SERIOUS,
-            "timid": Nature.TIMID,
-        }
-        
+
         for spread in data["spreads"]:
-            nature_str = spread.get("nature", "Serious").lower()
             speed_evs = spread.get("evs", 0)
-            nature = NATURE_MAP.get(nature_str, Nature.SERIOUS)
+            nature = parse_nature(spread.get("nature", "Serious"))
             speed = calculate_speed(base, 31, speed_evs, 50, nature)
             if speed not in speed_set:
                 speed_set.add(speed)
                 calculated_speeds.append(speed)
-        
+
         # Sort descending and return copy with calculated speeds
         calculated_speeds.sort(reverse=True)
         result = data.copy()
         result["common_speeds"] = calculated_speeds
         return result
-    
+
     return data
 
 
+def meta_speed_tier_names(limit: Optional[int] = None) -> list[str]:
+    """
+    Pokemon with meta speed tier info, for iterating the meta.
+
+    From the usage-derived table (highest usage first) once loaded,
+    otherwise the keys of META_SPEED_TIERS.
+    """
+    from .speed_tiers import get_speed_tier_store
+
+    table = get_speed_tier_store().table
+    names = table.names() if table is not None and len(table) else list(META_SPEED_TIERS)
+    return names[:limit] if limit is not None else names
+
+
 async def get_competitive_speed_benchmarks(
     smogon_client: "SmogonStatsClient",
     format_name: Optional[str] = None,
@@ -952,7 +971,7 @@ async def get_competitive_speed_benchmarks(
                             31,
                             s.get("evs", {}).get("speed", 0),
                             50,
-                            Nature[s.get("nature", "SERIOUS").upper()]
+                            parse_nature(s.get("nature"))
                         ) == speed_value
                     ]
 
@@ -6,7 +6,7 @@ from typing import Optional
 
 from ..models.team import Team
 from ..models.pokemon import PokemonBuild
-from .stats import calculate_all_stats
+from ..team.analysis_cache import get_team_analysis_cache
 from .speed import SPEED_BENCHMARKS, get_speed_benchmark
 
 
@@ -94,10 +94,11 @@ def apply_stage_modifier(speed: int, stages: int) -> int:
 def get_team_speeds(team: Team) -> list[SpeedTier]:
     """Get speed tiers for all Pokemon on a team."""
     speeds = []
+    cache = get_team_analysis_cache()
 
     for slot in team.slots:
         pokemon = slot.pokemon
-        stats = calculate_all_stats(pokemon)
+        stats = cache.slot(pokemon).stats
 
         speeds.append(SpeedTier(
             name=pokemon.name,
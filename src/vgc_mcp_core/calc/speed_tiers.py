@@ -0,0 +1,438 @@
+"""Meta speed tiers generated from Smogon usage.
+
+``calc.speed.META_SPEED_TIERS`` is a hand-maintained table of about sixty
+species with estimated spreads. This module derives the same information
+for every species in the current usage month: each species' Smogon spreads
+become level-50 speeds (base speeds come from the PokeAPI disk cache, the
+local dex), grouped into a usage-weighted distribution.
+
+A ``SpeedTierTable`` is built once per format/month/rating and stored in
+the disk cache under a versioned key, so a restart (or a warm-start
+snapshot) loads it instead of rebuilding it. The process-wide store holds
+the current table in memory; speed tools read it without recomputing
+anything, and fall back to the static tables until one has loaded.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from ..api.cache import get_async_cache
+from ..config import logger, settings
+from ..models.pokemon import parse_nature
+from .stats import calculate_speed
+
+# Bump when the table layout or the way it's derived changes
+SPEED_TIER_VERSION = 1
+
+# Disk cache prefix for built tables
+DISK_PREFIX = "speed_tiers"
+
+# Concurrent base-stat lookups while building
+FETCH_CONCURRENCY = 8
+
+
+def tier_key(pokemon_name: str) -> str:
+    """Name a table is keyed by: "Flutter Mane" -> "flutter-mane"."""
+    name = pokemon_name.lower().replace(" ", "-")
+    # Ogerpon mask forms ("ogerpon-wellspring-mask" -> "ogerpon-wellspring")
+    if name.endswith("-mask"):
+        name = name.replace("-mask", "")
+    return name
+
+
+def speed_distribution(spreads: list[dict], base_speed: int) -> Optional[tuple[list[dict], dict]]:
+    """Usage-weighted level-50 speeds of parsed Smogon spreads.
+
+    Args:
+        spreads: Spreads as returned by ``get_pokemon_usage`` (nature, evs, usage)
+        base_speed: The species' base speed
+
+    Returns:
+        (distribution sorted by speed, summary stats), or None without spreads
+    """
+    # Calculate speed for each spread and aggregate by speed value
+    speed_usage: dict[int, float] = {}
+    for spread in spreads:
+        evs = spread.get("evs", {})
+        spread_usage = spread.get("usage", 0)
+
+        nature = parse_nature(spread.get("nature", "Serious"))
+        speed_evs = evs.get("speed", 0)
+
+        # Calculate final speed stat (level 50, 31 IVs)
+        final_speed = calculate_speed(base_speed, 31, speed_evs, 50, nature)
+
+        if final_speed in speed_usage:
+            speed_usage[final_speed] += spread_usage
+        else:
+            speed_usage[final_speed] = spread_usage
+
+    if not speed_usage:
+        return None
+
+    # Build distribution sorted by speed
+    distribution = [
+        {"speed": speed, "usage": round(usage_pct, 1)}
+        for speed, usage_pct in sorted(speed_usage.items())
+    ]
+
+    # Calculate statistics
+    speeds = list(speed_usage.keys())
+    usages = list(speed_usage.values())
+    total_usage = sum(usages)
+
+    # Weighted mean
+    weighted_sum = sum(s * u for s, u in zip(speeds, usages))
+    mean_speed = weighted_sum / total_usage if total_usage > 0 else speeds[0]
+
+    # Median (by usage weight)
+    cumulative = 0
+    median_speed = speeds[0]
+    for s, u in sorted(zip(speeds, usages)):
+        cumulative += u
+        if cumulative >= total_usage / 2:
+            median_speed = s
+            break
+
+    # IQR (25th and 75th percentile by usage)
+    cumulative = 0
+    iqr_low = speeds[0]
+    iqr_high = speeds[-1]
+    for s, u in sorted(zip(speeds, usages)):
+        cumulative += u
+        if cumulative >= total_usage * 0.25 and iqr_low == speeds[0]:
+            iqr_low = s
+        if cumulative >= total_usage * 0.75:
+            iqr_high = s
+            break
+
+    stats = {
+        "min": min(speeds),
+        "max": max(speeds),
+        "median": median_speed,
+        "mean": round(mean_speed, 1),
+        "iqr_low": iqr_low,
+        "iqr_high": iqr_high,
+    }
+    return distribution, stats
+
+
+@dataclass
+class SpeedTierEntry:
+    """Speeds one species runs in the current usage month."""
+    pokemon: str
+    base_speed: int
+    usage_percent: float
+    # {"speed", "usage", "nature", "evs"} by speed, slowest first; nature and
+    # evs are those of the most used spread reaching that speed
+    distribution: list[dict]
+    stats: dict
+
+    @property
+    def common_speeds(self) -> list[int]:
+        """Speeds by share of usage, most common first."""
+        ranked = sorted(self.distribution, key=lambda d: (-d["usage"], -d["speed"]))
+        return [d["speed"] for d in ranked]
+
+    def competitive_speeds(self, limit: int = 3) -> list[dict]:
+        """Entries in the shape of ``get_competitive_speed_benchmarks``."""
+        return [
+            {
+                "speed": d["speed"],
+                "nature": d["nature"],
+                "evs": d["evs"],
+                "usage": d["usage"],
+                "spread_desc": f"{d['nature']} {d['evs']} Spe",
+            }
+            for d in self.distribution[:limit]
+        ]
+
+    def to_tier(self) -> dict:
+        """Entry in the shape of ``META_SPEED_TIERS`` values."""
+        return {
+            "base": self.base_speed,
+            "common_speeds": self.common_speeds,
+            "spreads": [
+                {"nature": d["nature"], "evs": d["evs"], "usage": d["usage"]}
+                for d in sorted(self.distribution, key=lambda d: -d["usage"])
+            ],
+            "usage_percent": self.usage_percent,
+        }
+
+
+@dataclass
+class SpeedTierTable:
+    """Speed tiers of every species in one usage month."""
+    format_name: str
+    month: str
+    rating: int
+    # tier_key -> entry, highest usage first
+    entries: dict[str, SpeedTierEntry]
+    # Every species' tier_key by usage, including those without an entry
+    ranking: list[str] = field(default_factory=list)
+    # Species whose base speed could not be found
+    missing: list[str] = field(default_factory=list)
+    built_at: float = 0.0
+    version: int = SPEED_TIER_VERSION
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return (self.format_name, self.month, self.rating)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, pokemon_name: str) -> Optional[SpeedTierEntry]:
+        """Entry for a Pokemon in any spelling, or None."""
+        return self.entries.get(tier_key(pokemon_name))
+
+    def names(self, limit: Optional[int] = None) -> list[str]:
+        """Species with an entry, highest usage first."""
+        names = list(self.entries)
+        return names[:limit] if limit is not None else names
+
+    def competitive_benchmarks(
+        self,
+        top_n_pokemon: int = 30,
+        top_n_speeds: int = 3,
+    ) -> dict[str, list[dict]]:
+        """Same result as ``get_competitive_speed_benchmarks`` for this month."""
+        benchmarks = {}
+        for name in self.ranking[:top_n_pokemon]:
+            entry = self.entries.get(name)
+            if entry is not None:
+                benchmarks[name] = entry.competitive_speeds(top_n_speeds)
+        return benchmarks
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpeedTierTable":
+        entries = {name: SpeedTierEntry(**entry) for name, entry in data["entries"].items()}
+        return cls(**{**data, "entries": entries})
+
+
+def _is_not_found(error: Exception) -> bool:
+    return str(error).startswith("Not found")
+
+
+def _static_base_speed(name: str) -> Optional[int]:
+    from .speed import META_SPEED_TIERS, SPEED_BENCHMARKS
+
+    data = META_SPEED_TIERS.get(name) or SPEED_BENCHMARKS.get(name)
+    return data["base"] if data else None
+
+
+async def build_speed_tier_table(snapshot, pokeapi) -> tuple[SpeedTierTable, int]:
+    """Build the table for a usage snapshot.
+
+    Args:
+        snapshot: ``UsageSnapshot`` with the month's chaos data
+        pokeapi: PokeAPIClient for base speeds (served from its disk cache)
+
+    Returns:
+        (table, number of base-speed lookups that failed for reasons other
+        than the species not being in PokeAPI)
+    """
+    from ..api.smogon import usage_spreads
+
+    species = snapshot.data.get("data", {})
+    ranking = [(key, tier_key(key)) for key in snapshot.ranking]
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    failures = 0
+
+    async def base_speed(name: str) -> Optional[int]:
+        nonlocal failures
+        async with semaphore:
+            try:
+                return (await pokeapi.get_base_stats(name)).speed
+            except Exception as e:
+                if not _is_not_found(e):
+                    failures += 1
+                return _static_base_speed(name)
+
+    # The ten spreads get_pokemon_usage reports, so entries match get_speed_distribution
+    spreads = {
+        name: usage_spreads(species[key].get("Spreads", {}))[:10] for key, name in ranking
+    }
+    wanted = [name for _, name in ranking if spreads[name]]
+    bases = dict(zip(wanted, await asyncio.gather(*(base_speed(name) for name in wanted))))
+
+    entries: dict[str, SpeedTierEntry] = {}
+    missing = []
+    for key, name in ranking:
+        if name not in bases:
+            continue
+        base = bases[name]
+        if base is None:
+            missing.append(name)
+            continue
+        summary = speed_distribution(spreads[name], base)
+        if summary is None:
+            continue
+        distribution, stats = summary
+
+        # Most used spread reaching each speed
+        spread_for_speed: dict[int, tuple[str, int]] = {}
+        for spread in spreads[name]:
+            nature = spread.get("nature", "Serious")
+            speed_evs = spread.get("evs", {}).get("speed", 0)
+            speed = calculate_speed(base, 31, speed_evs, 50, parse_nature(nature))
+            spread_for_speed.setdefault(speed, (nature, speed_evs))
+        for d in distribution:
+            d["nature"], d["evs"] = spread_for_speed[d["speed"]]
+
+        entries[name] = SpeedTierEntry(
+            pokemon=name,
+            base_speed=base,
+            usage_percent=round(species[key].get("usage", 0) * 100, 2),
+            distribution=distribution,
+            stats=stats,
+        )
+
+    table = SpeedTierTable(
+        format_name=snapshot.format_name,
+        month=snapshot.month,
+        rating=snapshot.rating,
+        entries=entries,
+        ranking=[name for _, name in ranking],
+        missing=missing,
+        built_at=time.time(),
+    )
+    return table, failures
+
+
+def _disk_key(format_name: str, month: str, rating: int) -> str:
+    return f"v{SPEED_TIER_VERSION}/{format_name}/{month}/{rating}"
+
+
+class SpeedTierStore:
+    """The current speed tier table, loaded from disk or built once per month."""
+
+    def __init__(self):
+        self.table: Optional[SpeedTierTable] = None
+        self._tasks: dict[tuple[str, str, int], asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def ensure(self, smogon, pokeapi, rating: int = 0) -> Optional[SpeedTierTable]:
+        """Table for the latest usage month, loading or building it if needed.
+
+        Cheap once the current month's table is in memory. Concurrent
+        callers share one build.
+
+        Returns:
+            The table, or None if no usage data is available
+        """
+        snapshot = await smogon.get_usage_snapshot(rating=rating)
+        if snapshot is None:
+            return None
+        key = (snapshot.format_name, snapshot.month, snapshot.rating)
+        if self.table is not None and self.table.key == key:
+            return self.table
+
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(snapshot, smogon.cache, pokeapi))
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._tasks.pop(key, None))
+        table = await asyncio.shield(task)
+        self.table = table
+        return table
+
+    async def peek(self, smogon, pokeapi, rating: int = 0) -> Optional[SpeedTierTable]:
+        """Table for the latest usage month if it is already in memory.
+
+        Never waits on a load or build: when the table is missing (or is an
+        older month's) one is started in the background and None returned.
+        """
+        snapshot = await smogon.get_usage_snapshot(rating=rating)
+        if snapshot is None:
+            return None
+        key = (snapshot.format_name, snapshot.month, snapshot.rating)
+        if self.table is not None and self.table.key == key:
+            return self.table
+        self.start(smogon, pokeapi)
+        return None
+
+    async def _load(self, snapshot, cache, pokeapi) -> SpeedTierTable:
+        disk_key = _disk_key(snapshot.format_name, snapshot.month, snapshot.rating)
+        stored = await get_async_cache(cache).get(DISK_PREFIX, disk_key)
+        if stored is not None:
+            try:
+                return SpeedTierTable.from_dict(stored)
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Stored speed tiers {disk_key} unreadable: {e!r}")
+
+        start = time.monotonic()
+        table, failures = await build_speed_tier_table(snapshot, pokeapi)
+        if failures:
+            # Base stats were unreachable: serve this table but rebuild next time
+            logger.warning(
+                f"Speed tiers {disk_key}: {failures} base-stat lookups failed; not persisted"
+            )
+        else:
+            await get_async_cache(cache).set(DISK_PREFIX, disk_key, value=table.to_dict())
+        logger.info(
+            f"Speed tiers {disk_key}: {len(table)} species, {len(table.missing)} without "
+            f"base stats, built in {time.monotonic() - start:.1f}s"
+        )
+        return table
+
+    def start(self, smogon, pokeapi) -> asyncio.Task:
+        """Load (or build) the table in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._ensure_logged(smogon, pokeapi))
+        return self._task
+
+    async def _ensure_logged(self, smogon, pokeapi) -> Optional[SpeedTierTable]:
+        try:
+            return await self.ensure(smogon, pokeapi)
+        except Exception as e:
+            logger.warning(f"Speed tier load failed: {e!r}")
+            return None
+
+
+async def competitive_speed_benchmarks(
+    smogon,
+    pokeapi,
+    top_n_pokemon: int = 30,
+    top_n_speeds: int = 3,
+) -> dict[str, list[dict]]:
+    """``get_competitive_speed_benchmarks`` served from the speed tier table.
+
+    Returns {} until the current month's table has loaded (the load starts
+    in the background), so callers fall back to the static tiers instead of
+    waiting on a build. With the table disabled the benchmarks are computed
+    directly.
+    """
+    if settings.SPEED_TIERS_ENABLED:
+        table = await get_speed_tier_store().peek(smogon, pokeapi)
+        if table is None or not len(table):
+            return {}
+        return table.competitive_benchmarks(top_n_pokemon, top_n_speeds)
+
+    from .speed import get_competitive_speed_benchmarks
+
+    return await get_competitive_speed_benchmarks(
+        smogon, top_n_pokemon=top_n_pokemon, top_n_speeds=top_n_speeds
+    )
+
+
+_speed_tier_store: Optional[SpeedTierStore] = None
+
+
+def get_speed_tier_store() -> SpeedTierStore:
+    """The process-wide speed tier store."""
+    global _speed_tier_store
+    if _speed_tier_store is None:
+        _speed_tier_store = SpeedTierStore()
+    return _speed_tier_store
+
+
+def reset_speed_tier_store() -> None:
+    """Reset the shared store (useful for testing)."""
+    global _speed_tier_store
+    _speed_tier_store = None
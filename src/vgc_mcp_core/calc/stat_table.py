@@ -0,0 +1,216 @@
+"""Precomputed level-50 stat table with inverse EV lookups.
+
+The spread optimizers ask the same two questions inside nested loops: "what
+is this stat at N EVs?" and "how few EVs reach stat T?". StatTable answers
+both from one flat ``array('H')`` holding every level-50 stat for base
+1-255, IV 0/31 and the three nature multipliers at each EV step (EV // 4,
+so any EV value is exact, not only breakpoints). Forward lookups are an
+index; inverse lookups bisect a 64-entry row and round up to the next EV
+breakpoint, giving the same answer as scanning EV_BREAKPOINTS_LV50.
+
+Anything outside the table (another level, an IV other than 0 or 31, an
+unusual multiplier) falls back to the stat formulas, so callers never need
+to check coverage themselves.
+"""
+
+import bisect
+from array import array
+from operator import itemgetter
+from typing import Optional
+
+from ..config import EV_BREAKPOINTS_LV50
+
+TABLE_LEVEL = 50
+MAX_BASE = 255
+TABLE_IVS = (0, 31)
+TABLE_NATURE_MODS = (0.9, 1.0, 1.1)
+
+# One column per EV // 4 (0-252 EVs)
+EV_STEPS = 64
+
+_IV_INDEX = {iv: i for i, iv in enumerate(TABLE_IVS)}
+_NATURE_INDEX = {mod: i for i, mod in enumerate(TABLE_NATURE_MODS)}
+
+# Picks the EV_BREAKPOINTS_LV50 columns out of a 64-entry row
+_pick_breakpoints = itemgetter(*[ev // 4 for ev in EV_BREAKPOINTS_LV50])
+
+
+class StatTable:
+    """Level-50 stats for every base/IV/nature/EV step, with inverse lookups.
+
+    Example::
+
+        table = get_stat_table()
+        table.stat(135, 252, 1.1)          # 205 (Timid Flutter Mane Speed)
+        table.min_ev(135, 200, 1.1)        # 212: fewest EVs reaching 200
+        table.row(95, hp=True)             # HP at each EV breakpoint
+    """
+
+    def __init__(self) -> None:
+        # At level 50 the inner term floor((2 * Base + IV + EV/4) / 2) is
+        # Base + floor((IV + EV/4) / 2), so a row for any base is the same
+        # picks from a list shifted by Base: one list of floor(value * nature)
+        # per multiplier (same floats as calculate_stat, so results match)
+        top = MAX_BASE + TABLE_LEVEL + 10 + (max(TABLE_IVS) + EV_STEPS) // 2 + 1
+        natured = [
+            [int(value * mod) for value in range(top)] for mod in TABLE_NATURE_MODS
+        ]
+        plain = list(range(top))
+        span = (max(TABLE_IVS) + EV_STEPS) // 2
+        pickers = [
+            itemgetter(*[(iv + step) // 2 for step in range(EV_STEPS)]) for iv in TABLE_IVS
+        ]
+        stats = [0] * (EV_STEPS * len(TABLE_IVS) * len(TABLE_NATURE_MODS))
+        hp = [0] * (EV_STEPS * len(TABLE_IVS))
+        for base in range(1, MAX_BASE + 1):
+            for pick in pickers:
+                # Shedinja (base 1 HP) always has 1 HP
+                hp += [1] * EV_STEPS if base == 1 else pick(
+                    plain[base + TABLE_LEVEL + 10:base + TABLE_LEVEL + 11 + span]
+                )
+                for nature in natured:
+                    stats += pick(nature[base + 5:base + 6 + span])
+
+        # Non-HP stats: ((base * 2 + iv_index) * 3 + nature_index) * 64 + ev // 4
+        self._stats = array("H", stats)
+        # HP: (base * 2 + iv_index) * 64 + ev // 4
+        self._hp = array("H", hp)
+        self._stats_view = memoryview(self._stats)
+        self._hp_view = memoryview(self._hp)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the table."""
+        return (len(self._stats) + len(self._hp)) * self._stats.itemsize
+
+    def _locate(
+        self, base: int, nature_mod: float, iv: int, level: int, hp: bool
+    ) -> tuple[Optional[array], int]:
+        """The array and row offset for these inputs, or (None, 0) if not tabled."""
+        iv_index = _IV_INDEX.get(iv)
+        if level != TABLE_LEVEL or iv_index is None or not 1 <= base <= MAX_BASE:
+            return None, 0
+        if hp:
+            return self._hp, (base * 2 + iv_index) * EV_STEPS
+        nature_index = _NATURE_INDEX.get(nature_mod)
+        if nature_index is None:
+            return None, 0
+        return self._stats, ((base * 2 + iv_index) * 3 + nature_index) * EV_STEPS
+
+    def _row_values(
+        self, base: int, nature_mod: float, iv: int, level: int, hp: bool
+    ) -> tuple[list[int] | array, int]:
+        """A row (64 EV steps) to bisect, computing it if it isn't tabled."""
+        values, offset = self._locate(base, nature_mod, iv, level, hp)
+        if values is not None:
+            return values, offset
+        from .stats import calculate_hp, calculate_stat
+
+        if hp:
+            return [calculate_hp(base, iv, step * 4, level) for step in range(EV_STEPS)], 0
+        return [
+            calculate_stat(base, iv, step * 4, level, nature_mod) for step in range(EV_STEPS)
+        ], 0
+
+    def steps(
+        self,
+        base: int,
+        nature_mod: float = 1.0,
+        iv: int = 31,
+        level: int = TABLE_LEVEL,
+        hp: bool = False,
+    ) -> Optional[memoryview]:
+        """The row indexed by EV // 4 (a view, no copy), or None if not tabled."""
+        values, offset = self._locate(base, nature_mod, iv, level, hp)
+        if values is None:
+            return None
+        view = self._hp_view if hp else self._stats_view
+        return view[offset:offset + EV_STEPS]
+
+    def stat(
+        self,
+        base: int,
+        ev: int,
+        nature_mod: float = 1.0,
+        iv: int = 31,
+        level: int = TABLE_LEVEL,
+    ) -> int:
+        """Non-HP stat; same result as calculate_stat."""
+        if 0 <= ev < EV_STEPS * 4:
+            values, offset = self._locate(base, nature_mod, iv, level, False)
+            if values is not None:
+                return values[offset + ev // 4]
+        from .stats import calculate_stat
+
+        return calculate_stat(base, iv, ev, level, nature_mod)
+
+    def hp(self, base: int, ev: int, iv: int = 31, level: int = TABLE_LEVEL) -> int:
+        """HP stat; same result as calculate_hp."""
+        if 0 <= ev < EV_STEPS * 4:
+            values, offset = self._locate(base, 1.0, iv, level, True)
+            if values is not None:
+                return values[offset + ev // 4]
+        from .stats import calculate_hp
+
+        return calculate_hp(base, iv, ev, level)
+
+    def row(
+        self,
+        base: int,
+        nature_mod: float = 1.0,
+        iv: int = 31,
+        level: int = TABLE_LEVEL,
+        hp: bool = False,
+    ) -> list[int]:
+        """The stat at each EV_BREAKPOINTS_LV50 entry, in order."""
+        values, offset = self._row_values(base, nature_mod, iv, level, hp)
+        return list(_pick_breakpoints(values[offset:offset + EV_STEPS]))
+
+    def min_ev(
+        self,
+        base: int,
+        target: int,
+        nature_mod: float = 1.0,
+        iv: int = 31,
+        level: int = TABLE_LEVEL,
+        hp: bool = False,
+    ) -> Optional[int]:
+        """Smallest EV breakpoint whose stat is at least ``target``.
+
+        Returns None if even 252 EVs fall short.
+        """
+        values, offset = self._row_values(base, nature_mod, iv, level, hp)
+        step = bisect.bisect_left(values, target, offset, offset + EV_STEPS) - offset
+        if step == EV_STEPS:
+            return None
+        return EV_BREAKPOINTS_LV50[bisect.bisect_left(EV_BREAKPOINTS_LV50, step * 4)]
+
+    def max_ev_below(
+        self,
+        base: int,
+        target: int,
+        nature_mod: float = 1.0,
+        iv: int = 31,
+        level: int = TABLE_LEVEL,
+        hp: bool = False,
+    ) -> Optional[int]:
+        """Largest EV breakpoint whose stat stays below ``target``.
+
+        Returns None if even 0 EVs reach it.
+        """
+        values, offset = self._row_values(base, nature_mod, iv, level, hp)
+        step = bisect.bisect_left(values, target, offset, offset + EV_STEPS) - offset - 1
+        if step < 0:
+            return None
+        return EV_BREAKPOINTS_LV50[bisect.bisect_right(EV_BREAKPOINTS_LV50, step * 4) - 1]
+
+
+_stat_table: Optional[StatTable] = None
+
+
+def get_stat_table() -> StatTable:
+    """The shared stat table, built on first use."""
+    global _stat_table
+    if _stat_table is None:
+        _stat_table = StatTable()
+    return _stat_table
@@ -12,12 +12,11 @@ Formulas (Level 50):
 - Other: floor((floor((2 * Base + IV + EV/4) * 50/100) + 5) * Nature)
 """
 
-import bisect
 import math
 from typing import Optional
 
 from ..models.pokemon import Nature, PokemonBuild, BaseStats, get_nature_modifier
-from ..config import EV_BREAKPOINTS_LV50
+from .stat_table import get_stat_table
 
 
 def calculate_hp(
@@ -177,9 +176,8 @@ def find_speed_evs(
     """
     Find minimum Speed EVs needed to reach a target speed.
 
-    Uses binary search over EV breakpoints for O(log n) performance instead of
-    linear O(n) search. Since stat calculation is monotonically increasing with
-    EVs, binary search is valid.
+    Answered from the precomputed stat table (a bisect over one row), so
+    it costs no stat calculations at level 50.
 
     Args:
         base_speed: Base Speed stat
@@ -191,19 +189,8 @@ def find_speed_evs(
     Returns:
         Minimum EVs needed, or None if target is unreachable
     """
-    # Pre-compute speeds for all breakpoints for binary search
-    # Cache this calculation as it's the same for given parameters
-    speeds = [calculate_speed(base_speed, iv, ev, level, nature)
-              for ev in EV_BREAKPOINTS_LV50]
-
-    # Use bisect to find first speed >= target
-    idx = bisect.bisect_left(speeds, target_speed)
-
-    # Check if we found a valid result
-    if idx < len(speeds) and speeds[idx] >= target_speed:
-        return EV_BREAKPOINTS_LV50[idx]
-
-    return None  # Cannot reach target
+    nature_mod = get_nature_modifier(nature, "speed")
+    return get_stat_table().min_ev(base_speed, target_speed, nature_mod, iv, level)
 
 
 def get_max_speed(
@@ -260,38 +247,32 @@ def optimize_ev_efficiency(
     if evs <= 0:
         return 0
 
-    # Calculate current stat
-    if stat_type == "hp":
-        current_stat = calculate_hp(base_stat, iv, evs, level)
-    else:
-        current_stat = calculate_stat(base_stat, iv, evs, level, nature_mod)
+    is_hp = stat_type == "hp"
+    steps = get_stat_table().steps(base_stat, nature_mod, iv, level, is_hp)
+
+    def stat_at(ev: int) -> int:
+        if steps is not None and 0 <= ev < 256:
+            return steps[ev // 4]
+        if is_hp:
+            return calculate_hp(base_stat, iv, ev, level)
+        return calculate_stat(base_stat, iv, ev, level, nature_mod)
+
+    current_stat = stat_at(evs)
 
     # Check if we can reduce EVs by 4, 8, or 12 and get the same stat
     for reduction in [4, 8, 12]:
         if evs - reduction < 0:
             break
 
-        reduced_evs = evs - reduction
-
-        if stat_type == "hp":
-            reduced_stat = calculate_hp(base_stat, iv, reduced_evs, level)
-        else:
-            reduced_stat = calculate_stat(base_stat, iv, reduced_evs, level, nature_mod)
-
         # If same stat with fewer EVs, continue checking larger reductions
-        if reduced_stat == current_stat:
+        if stat_at(evs - reduction) == current_stat:
             continue
         else:
             # Found the breakpoint - return EVs before this reduction
             return evs - (reduction - 4) if reduction > 4 else evs
 
     # If we reduced by 12 and still have the same stat, return the lowest
-    if stat_type == "hp":
-        final_stat = calculate_hp(base_stat, iv, evs - 12, level)
-    else:
-        final_stat = calculate_stat(base_stat, iv, evs - 12, level, nature_mod)
-
-    if final_stat == current_stat:
+    if stat_at(evs - 12) == current_stat:
         return evs - 12
 
     return evs
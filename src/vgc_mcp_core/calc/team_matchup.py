@@ -1,12 +1,13 @@
 """Team vs team matchup analysis with scoring algorithm and game plan generation."""
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from ..models.pokemon import PokemonBuild, BaseStats, Nature, EVSpread, IVSpread
 from ..models.move import Move, MoveCategory
 from ..models.team import Team
-from .damage import calculate_damage, DamageResult
+from ..team.analysis_cache import get_team_analysis_cache
+from .damage import calculate_damage, calculate_damage_bounds, DamageResult
 from .stats import calculate_all_stats
 from .modifiers import DamageModifiers, get_type_effectiveness
 from .priority import (
@@ -20,6 +21,9 @@ from .abilities import (
     TERRAIN_SETTERS,
 )
 
+if TYPE_CHECKING:
+    from .bring_solver import BringSolution
+
 # ============================================================================
 # VGC BATTLE MECHANIC CONSTANTS
 # ============================================================================
@@ -198,19 +202,23 @@ def score_1v1_matchup(
     # === DAMAGE SCORE (0-40) ===
     best_damage_pct = 0
     best_move_name = None
+    best_move = None
     best_result = None
 
+    # Moves are ranked by their damage bounds; only the best gets the full calc
     for move in pokemon1_moves:
         if move.power == 0:
             continue
         try:
-            result = calculate_damage(pokemon1, pokemon2, move, modifiers)
-            if result.max_percent > best_damage_pct:
-                best_damage_pct = result.max_percent
+            bounds = calculate_damage_bounds(pokemon1, pokemon2, move, modifiers)
+            if bounds.max_percent > best_damage_pct:
+                best_damage_pct = bounds.max_percent
                 best_move_name = move.name
-                best_result = result
+                best_move = move
         except Exception:
             continue
+    if best_move is not None:
+        best_result = calculate_damage(pokemon1, pokemon2, best_move, modifiers)
 
     if best_result is None:
         damage_score = 0
@@ -261,8 +269,8 @@ def score_1v1_matchup(
         if move.power == 0:
             continue
         try:
-            result = calculate_damage(pokemon2, pokemon1, move, modifiers)
-            opponent_best_damage = max(opponent_best_damage, result.max_percent)
+            bounds = calculate_damage_bounds(pokemon2, pokemon1, move, modifiers)
+            opponent_best_damage = max(opponent_best_damage, bounds.max_percent)
         except Exception:
             continue
 
@@ -309,6 +317,12 @@ def score_1v1_matchup(
     )
 
 
+def _score_both_ways(
+    pokemon1: PokemonBuild, pokemon2: PokemonBuild
+) -> tuple[MatchupScore, MatchupScore]:
+    return score_1v1_matchup(pokemon1, pokemon2), score_1v1_matchup(pokemon2, pokemon1)
+
+
 def build_matchup_matrix(
     team1: list[PokemonBuild],
     team2: list[PokemonBuild]
@@ -316,18 +330,21 @@ def build_matchup_matrix(
     """
     Build a 6x6 matchup matrix showing net advantage for each pairing.
 
+    Pair scores are cached per pair of builds (TeamAnalysisCache), so after
+    one slot changes only that Pokemon's row or column is rescored.
+
     Returns:
         Tuple of (matrix of net scores, list of detailed MatchupScore objects)
     """
     matrix = []
     detailed = []
+    cache = get_team_analysis_cache()
 
     for p1 in team1:
         row = []
         for p2 in team2:
             # Score from both sides
-            score_1v2 = score_1v1_matchup(p1, p2)
-            score_2v1 = score_1v1_matchup(p2, p1)
+            score_1v2, score_2v1 = cache.pair(p1, p2, _score_both_ways)
 
             # Net advantage (positive = team1 pokemon favored)
             net = score_1v2.total - score_2v1.total
@@ -340,7 +357,8 @@ def build_matchup_matrix(
 
 def calculate_team_advantage(
     team1: list[PokemonBuild],
-    team2: list[PokemonBuild]
+    team2: list[PokemonBuild],
+    matrix: Optional[list[list[float]]] = None,
 ) -> float:
     """
     Calculate overall team advantage percentage.
@@ -348,8 +366,11 @@ def calculate_team_advantage(
     Uses weighted matchup scoring where:
     - Each Pokemon's best matchup is weighted by role importance
     - Returns 0-100% where 50% = even matchup
+
+    Pass ``matrix`` (from build_matchup_matrix) to avoid rebuilding it.
     """
-    matrix, _ = build_matchup_matrix(team1, team2)
+    if matrix is None:
+        matrix, _ = build_matchup_matrix(team1, team2)
 
     total_weighted_advantage = 0
     total_weight = 0
@@ -592,7 +613,7 @@ def full_team_matchup_analysis(
     matrix, detailed = build_matchup_matrix(team1, team2)
 
     # Calculate overall advantage
-    overall = calculate_team_advantage(team1, team2)
+    overall = calculate_team_advantage(team1, team2, matrix)
 
     # Analyze threats
     threats = analyze_key_threats(team1, team2)
@@ -723,6 +744,7 @@ class FullGamePlan:
     speed_control_notes: list[str]
     bring_recommendation: BringRec
     markdown_summary: str
+    bring_solution: Optional["BringSolution"] = None  # mixed-strategy team preview solve
 
 
 def build_pokemon_profile(
@@ -1913,12 +1935,14 @@ def _analyze_redirect_interactions(
 def generate_full_game_plan(
     your_profiles: list[PokemonProfile],
     their_profiles: list[PokemonProfile],
+    solve_brings: bool = False,
 ) -> FullGamePlan:
     """Generate a complete, priority-aware game plan.
 
     Integrates matchup matrix, Fake Out speed war, Prankster interactions,
     lead recommendations, turn 1 analysis, threat assessment, win conditions,
-    and bring-4 recommendations.
+    and bring-4 recommendations. With ``solve_brings``, also solves team
+    preview as a game over every bring-4/lead choice of both sides.
     """
     # Build matchup matrix using existing builds
     your_builds = [p.build for p in your_profiles]
@@ -1929,7 +1953,7 @@ def generate_full_game_plan(
     their_moves_map = {p.name: p.moves for p in their_profiles}
 
     matrix, detailed = build_matchup_matrix(your_builds, their_builds)
-    overall_score = calculate_team_advantage(your_builds, their_builds)
+    overall_score = calculate_team_advantage(your_builds, their_builds, matrix)
 
     if overall_score >= 60:
         overall_matchup = "Favorable"
@@ -1987,6 +2011,11 @@ def generate_full_game_plan(
         reasoning=["Default selection"],
     )
 
+    bring_solution = None
+    if solve_brings:
+        from .bring_solver import solve_bring_game
+        bring_solution = solve_bring_game(your_profiles, their_profiles, matrix=matrix)
+
     # Build markdown summary
     md = _format_game_plan_markdown(
         your_profiles, their_profiles, overall_matchup, overall_score,
@@ -2006,6 +2035,7 @@ def generate_full_game_plan(
         speed_control_notes=speed_notes,
         bring_recommendation=bring_rec,
         markdown_summary=md,
+        bring_solution=bring_solution,
     )
 
 
@@ -0,0 +1,754 @@
+"""Monte Carlo simulation of turn one for a lead matchup.
+
+The game plan's turn 1 analysis picks one move per Pokemon and sorts a
+single priority order. This engine instead samples thousands of complete
+turn ones per lead matchup and reports how often each outcome happens, with
+Wilson confidence bounds:
+
+- speed ties broken at random each sample
+- all 16 damage rolls, critical hits (1/24) and accuracy
+- Intimidate on entry (and Defiant/Competitive/Clear Body reactions)
+- spread damage reduction when a spread move has more than one target
+- Fake Out flinch (Ghost, Inner Focus, Covert Cloak, Psychic Terrain, Protect)
+- Protect, Follow Me redirection and weighted move choices
+- Tailwind and Trick Room changing the order mid-turn (Gen 8+ recalculates
+  the remaining order after every action)
+
+All damage is resolved up front: every (attacker, move, target, spread,
+crit) combination is run once through calculate_damage and its 16 rolls
+stored, so a sample is only table lookups and a few comparisons. The
+tables are cached on the simulator and shared across matchups, which keeps
+all 15 x 15 lead pairings of a 6 v 6 game plan to a couple of seconds.
+"""
+
+import logging
+import math
+import random
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Optional
+
+from ..models.move import Move
+from .damage import calculate_damage
+from .modifiers import DamageModifiers
+from .priority import get_move_priority, normalize_move_name
+from .stats import calculate_all_stats
+from .team_matchup import REDIRECT_MOVES, PokemonProfile, _predict_opponent_leads
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLES = 2000
+DEFAULT_MATRIX_SAMPLES = 500
+
+CRIT_CHANCE = 1 / 24
+
+# Default chance a Protect user Protects turn 1 instead of its main option
+DEFAULT_PROTECT_RATE = 0.15
+
+PROTECT_MOVES = {
+    "protect", "detect", "silk-trap", "kings-shield", "spiky-shield",
+    "baneful-bunker", "burning-bulwark", "obstruct",
+}
+
+# Spread targets that also hit the user's partner
+_HITS_ALLY = {"all-other-pokemon", "all-adjacent", "all-pokemon"}
+
+# Intimidate reactions: (attack stage, special attack stage, speed multiplier)
+_INTIMIDATE_EFFECTS = {
+    "defiant": (1, 0, 1.0),        # -1 then +2
+    "competitive": (-1, 2, 1.0),
+    "rattled": (-1, 0, 1.5),
+    "contrary": (1, 0, 1.0),
+    "guard-dog": (1, 0, 1.0),
+}
+
+_WEATHER_ABILITIES = {
+    "drought": "sun", "drizzle": "rain", "sand-stream": "sand",
+    "snow-warning": "snow", "orichalcum-pulse": "sun",
+    "desolate-land": "harsh_sun", "primordial-sea": "heavy_rain",
+}
+_TERRAIN_ABILITIES = {
+    "electric-surge": "electric", "grassy-surge": "grassy",
+    "psychic-surge": "psychic", "misty-surge": "misty",
+    "hadron-engine": "electric",
+}
+
+
+def _norm(name: Optional[str]) -> str:
+    return name.lower().replace(" ", "-") if name else ""
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion (0-1 bounds)."""
+    if trials <= 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denom = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+@dataclass
+class OutcomeEstimate:
+    """Sampled probability of an outcome with a 95% confidence interval."""
+    percent: float
+    low: float
+    high: float
+
+    @classmethod
+    def from_counts(cls, successes: int, trials: int) -> "OutcomeEstimate":
+        low, high = wilson_interval(successes, trials)
+        p = successes / trials if trials else 0.0
+        return cls(round(p * 100, 1), round(low * 100, 1), round(high * 100, 1))
+
+    def to_dict(self) -> dict:
+        return {"percent": self.percent, "low": self.low, "high": self.high}
+
+
+@dataclass
+class TurnOneOption:
+    """One turn 1 choice for a Pokemon and how often it is picked."""
+    move: str
+    target: Optional[str] = None  # opponent name; None = best/automatic
+    weight: float = 1.0
+
+
+@dataclass
+class TurnOneSimResult:
+    """Outcome distribution of one lead matchup's turn 1."""
+    your_leads: tuple[str, str]
+    their_leads: tuple[str, str]  # "(opponent)" appended to species also in your_leads
+    samples: int
+    faint: dict[str, OutcomeEstimate]       # per Pokemon: fainted this turn
+    flinch: dict[str, OutcomeEstimate]      # per Pokemon: flinched this turn
+    moves_first: dict[str, OutcomeEstimate]  # per Pokemon: acted first
+    you_ko_any: OutcomeEstimate
+    they_ko_any: OutcomeEstimate
+    you_win_trade: OutcomeEstimate   # you KO more than you lose
+    even_trade: OutcomeEstimate
+    you_lose_trade: OutcomeEstimate
+    expected_kos_yours: float   # opposing Pokemon you KO
+    expected_kos_theirs: float  # of yours they KO
+    actions: dict[str, dict[str, float]] = field(default_factory=dict)  # name -> move -> %
+
+    @property
+    def score(self) -> float:
+        """Expected KO difference (positive favours you)."""
+        return round(self.expected_kos_yours - self.expected_kos_theirs, 3)
+
+    def to_dict(self) -> dict:
+        return {
+            "your_leads": list(self.your_leads),
+            "their_leads": list(self.their_leads),
+            "samples": self.samples,
+            "score": self.score,
+            "expected_kos_yours": self.expected_kos_yours,
+            "expected_kos_theirs": self.expected_kos_theirs,
+            "you_ko_any": self.you_ko_any.to_dict(),
+            "they_ko_any": self.they_ko_any.to_dict(),
+            "you_win_trade": self.you_win_trade.to_dict(),
+            "even_trade": self.even_trade.to_dict(),
+            "you_lose_trade": self.you_lose_trade.to_dict(),
+            "faint": {name: est.to_dict() for name, est in self.faint.items()},
+            "flinch": {name: est.to_dict() for name, est in self.flinch.items()},
+            "moves_first": {name: est.to_dict() for name, est in self.moves_first.items()},
+            "actions": self.actions,
+        }
+
+
+@dataclass
+class LeadPairSummary:
+    """One of your lead pairs across every opposing lead pair."""
+    leads: tuple[str, str]
+    average_score: float    # mean expected KO difference
+    worst_score: float
+    worst_against: tuple[str, str]
+    predicted_score: Optional[float] = None  # vs the heuristically predicted opposing lead
+
+
+@dataclass
+class LeadMatrixResult:
+    """Turn 1 simulations across all lead pairings of two teams."""
+    samples_per_matchup: int
+    matchups: list[TurnOneSimResult]
+    summaries: list[LeadPairSummary]  # best average score first
+    damage_calcs: int
+
+
+@dataclass
+class _Action:
+    move: Optional[Move]
+    name: str           # normalized move name
+    # "attack", "fake_out", "protect", "follow_me", "tailwind", "trick_room", "status"
+    kind: str
+    priority: int
+    target: Optional[int] = None  # slot for single-target moves
+
+
+class TurnOneSimulator:
+    """Samples turn 1 outcomes; damage tables are shared across matchups."""
+
+    def __init__(self, protect_rate: float = DEFAULT_PROTECT_RATE):
+        self.protect_rate = protect_rate
+        self._tables: dict[tuple, tuple[int, ...]] = {}
+        self._hp: dict[int, int] = {}
+        # Tables are keyed by profile identity; keep the profiles alive so
+        # an id is never reused by a different Pokemon
+        self._pinned: dict[int, PokemonProfile] = {}
+        self.damage_calcs = 0
+
+    # ------------------------------------------------------------------
+    # Precomputation
+    # ------------------------------------------------------------------
+
+    def _rolls(
+        self, attacker: PokemonProfile, move: Move, defender: PokemonProfile,
+        spread: bool, crit: bool, field_state: tuple, stages: tuple[int, int],
+    ) -> Optional[tuple[int, ...]]:
+        """16 damage rolls for one calc, computed once per distinct input.
+
+        None if the calc failed (logged once); choices needing it are dropped
+        rather than scored as doing no damage.
+        """
+        weather, terrain = field_state
+        key = (
+            id(attacker), move.name, id(defender), spread, crit, weather, terrain, stages,
+        )
+        rolls = self._tables.get(key)
+        if rolls is None:
+            self.damage_calcs += 1
+            self._pinned[id(attacker)] = attacker
+            self._pinned[id(defender)] = defender
+            try:
+                result = calculate_damage(
+                    attacker.build, defender.build, move,
+                    DamageModifiers(
+                        is_doubles=True,
+                        multiple_targets=spread,
+                        is_critical=crit,
+                        weather=weather,
+                        terrain=terrain,
+                        attacker_grounded=attacker.is_grounded,
+                        defender_grounded=defender.is_grounded,
+                        attacker_ability=attacker.ability or None,
+                        defender_ability=defender.ability or None,
+                        attack_stage=stages[0],
+                        special_attack_stage=stages[1],
+                    ),
+                )
+                rolls = tuple(result.rolls) or (0,)
+            except Exception as e:
+                logger.warning(
+                    f"Turn 1 calc failed for {attacker.name} {move.name} into "
+                    f"{defender.name}: {e!r}"
+                )
+                rolls = None
+            self._tables[key] = rolls
+        return rolls
+
+    @staticmethod
+    def _field(profiles: list[PokemonProfile], speeds: list[float]) -> tuple:
+        """Weather and terrain from lead abilities; the slower setter's wins."""
+        weather = terrain = None
+        for slot in sorted(range(4), key=lambda s: -speeds[s]):
+            ability = _norm(profiles[slot].ability)
+            weather = _WEATHER_ABILITIES.get(ability, weather)
+            terrain = _TERRAIN_ABILITIES.get(ability, terrain)
+        return weather, terrain
+
+    @staticmethod
+    def _intimidate(profiles: list[PokemonProfile]) -> tuple[list[tuple[int, int]], list[float]]:
+        """Attack/Sp. Atk stages and speed multipliers after entry Intimidates."""
+        atk = [0] * 4
+        spa = [0] * 4
+        spe = [1.0] * 4
+        for user in range(4):
+            if not profiles[user].is_intimidate:
+                continue
+            for foe in _foes(user):
+                ability = _norm(profiles[foe].ability)
+                if ability in _INTIMIDATE_EFFECTS:
+                    d_atk, d_spa, mult = _INTIMIDATE_EFFECTS[ability]
+                    atk[foe] += d_atk
+                    spa[foe] += d_spa
+                    spe[foe] *= mult
+                elif profiles[foe].intimidate_reaction != "blocked":
+                    atk[foe] -= 1
+        stages = [(max(-6, min(6, a)), max(-6, min(6, s))) for a, s in zip(atk, spa)]
+        return stages, spe
+
+    def _expected_percent(
+        self, profiles, slot, move, target, field_state, stages,
+    ) -> Optional[float]:
+        rolls = self._rolls(
+            profiles[slot], move, profiles[target], move.is_spread, False,
+            field_state, stages[slot],
+        )
+        if rolls is None:
+            return None
+        return sum(rolls) / len(rolls) / self._max_hp(profiles[target])
+
+    def _action_tables(
+        self, profiles, slot, action: _Action, field_state, stages,
+    ) -> Optional[dict[tuple[int, bool], tuple[tuple[int, ...], tuple[int, ...]]]]:
+        """(normal, crit) rolls per (target, spread) for an attack, None if a calc failed."""
+        tables = {}
+        targets = _targets(slot, action.move)
+        for target in targets:
+            for spread in ((True, False) if len(targets) > 1 else (False,)):
+                normal, crit = (
+                    self._rolls(profiles[slot], action.move, profiles[target],
+                                spread, is_crit, field_state, stages[slot])
+                    for is_crit in (False, True)
+                )
+                if normal is None or crit is None:
+                    return None
+                tables[target, spread] = (normal, crit)
+        return tables
+
+    def _max_hp(self, profile: PokemonProfile) -> int:
+        hp = self._hp.get(id(profile))
+        if hp is None:
+            self._pinned[id(profile)] = profile
+            hp = self._hp[id(profile)] = calculate_all_stats(profile.build)["hp"]
+        return hp
+
+    def _resolve_option(
+        self, profiles, slot, option: TurnOneOption, field_state, stages,
+    ) -> Optional[_Action]:
+        profile = profiles[slot]
+        wanted = normalize_move_name(option.move)
+        move = next((m for m in profile.moves if normalize_move_name(m.name) == wanted), None)
+        target = None
+        if option.target:
+            target = next(
+                (s for s in _foes(slot) if _norm(profiles[s].name) == _norm(option.target)),
+                None,
+            )
+        if move is None:
+            if wanted in PROTECT_MOVES:
+                return _Action(None, wanted, "protect", 4)
+            return None
+        action = self._action(profile, move)
+        if action.kind in ("attack", "fake_out") and not move.is_spread:
+            if target is None:
+                target = self._best_target(profiles, slot, move, field_state, stages)
+                if target is None:
+                    return None
+            action.target = target
+        return action
+
+    @staticmethod
+    def _action(profile: PokemonProfile, move: Move) -> _Action:
+        name = normalize_move_name(move.name)
+        is_status = not move.is_damaging
+        prio = get_move_priority(name, _norm(profile.ability), is_status=is_status)
+        if name == "fake-out":
+            kind = "fake_out"
+        elif name in PROTECT_MOVES:
+            kind = "protect"
+        elif name in REDIRECT_MOVES:
+            kind = "follow_me"
+        elif name == "tailwind":
+            kind = "tailwind"
+        elif name == "trick-room":
+            kind = "trick_room"
+        elif move.is_damaging:
+            kind = "attack"
+        else:
+            kind = "status"
+        return _Action(move, name, kind, prio)
+
+    def _best_target(self, profiles, slot, move, field_state, stages) -> Optional[int]:
+        """Foe taking the most expected damage, None if no calc succeeded."""
+        expected = {
+            t: self._expected_percent(profiles, slot, move, t, field_state, stages)
+            for t in _foes(slot)
+        }
+        scored = [t for t in expected if expected[t] is not None]
+        return max(scored, key=expected.get) if scored else None
+
+    def _default_options(
+        self, profiles, slot, field_state, stages,
+    ) -> list[tuple[_Action, float]]:
+        """Turn 1 choices following the game plan's heuristics, with weights.
+
+        Fake Out goes into a target that can flinch; speed control and
+        redirection setters set up; everyone else uses their highest expected
+        damage move. Protect users Protect some of the time.
+        """
+        profile = profiles[slot]
+        by_name = {normalize_move_name(m.name): m for m in profile.moves}
+        main: Optional[_Action] = None
+
+        if "fake-out" in by_name:
+            targets = [t for t in _foes(slot) if _flinchable(profiles[t])]
+            if targets:
+                options = []
+                for t in targets:
+                    action = self._action(profile, by_name["fake-out"])
+                    action.target = t
+                    options.append((action, 1.0 / len(targets)))
+                return options
+
+        for name in ("tailwind", "trick-room", *REDIRECT_MOVES):
+            if name in by_name:
+                main = self._action(profile, by_name[name])
+                break
+
+        if main is None:
+            best = None
+            best_value = 0.0
+            for move in profile.moves:
+                if not move.is_damaging or normalize_move_name(move.name) == "fake-out":
+                    continue
+                if move.is_spread:
+                    expected = [
+                        self._expected_percent(profiles, slot, move, t, field_state, stages)
+                        for t in _foes(slot)
+                    ]
+                    if None in expected:
+                        continue
+                    value = 0.75 * sum(expected)
+                    target = None
+                else:
+                    target = self._best_target(profiles, slot, move, field_state, stages)
+                    if target is None:
+                        continue
+                    value = self._expected_percent(
+                        profiles, slot, move, target, field_state, stages
+                    )
+                if value > best_value:
+                    best_value = value
+                    best = self._action(profile, move)
+                    best.target = target
+            main = best
+
+        protect = next((by_name[n] for n in PROTECT_MOVES if n in by_name), None)
+        if main is None:
+            if protect is not None:
+                return [(self._action(profile, protect), 1.0)]
+            return [(_Action(None, "struggle", "status", 0), 1.0)]
+        if protect is not None and self.protect_rate > 0:
+            return [
+                (main, 1.0 - self.protect_rate),
+                (self._action(profile, protect), self.protect_rate),
+            ]
+        return [(main, 1.0)]
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def simulate(
+        self,
+        your_leads: list[PokemonProfile],
+        their_leads: list[PokemonProfile],
+        samples: int = DEFAULT_SAMPLES,
+        seed: Optional[int] = 0,
+        choices: Optional[dict[str, list[TurnOneOption]]] = None,
+        tailwind: tuple[bool, bool] = (False, False),
+        trick_room: bool = False,
+    ) -> TurnOneSimResult:
+        """Sample turn 1 of one lead matchup.
+
+        Args:
+            your_leads: Your two leads
+            their_leads: Their two leads
+            samples: Number of sampled turns
+            seed: RNG seed (None for nondeterministic)
+            choices: Optional per-Pokemon move choices overriding the defaults
+            tailwind: Tailwind already up on (your side, their side)
+            trick_room: Whether Trick Room is already up
+
+        Returns:
+            TurnOneSimResult with outcome probabilities and 95% bounds
+        """
+        profiles = [*your_leads[:2], *their_leads[:2]]
+        if len(profiles) != 4:
+            raise ValueError("Each side needs exactly two leads")
+        choices = {_norm(k): v for k, v in (choices or {}).items()}
+        rng = random.Random(seed)
+
+        stages, speed_mults = self._intimidate(profiles)
+        base_speed = [
+            profiles[s].speed_stat * speed_mults[s]
+            * (1.5 if _norm(profiles[s].build.item) == "choice-scarf" else 1.0)
+            for s in range(4)
+        ]
+        field_state = self._field(profiles, base_speed)
+        psychic_terrain = field_state[1] == "psychic"
+        max_hp = [self._max_hp(p) for p in profiles]
+
+        # Weighted options per slot as cumulative tables, and roll tables per
+        # (slot, action index, target, spread): (normal, crit)
+        slot_options: list[list[_Action]] = []
+        slot_cumulative: list[list[float]] = []
+        tables: dict[tuple, tuple[tuple[int, ...], tuple[int, ...]]] = {}
+        for slot, profile in enumerate(profiles):
+            custom = choices.get(_norm(profile.name))
+            options = []
+            if custom:
+                for option in custom:
+                    action = self._resolve_option(profiles, slot, option, field_state, stages)
+                    if action is not None and option.weight > 0:
+                        options.append((action, option.weight))
+            if not options:
+                options = self._default_options(profiles, slot, field_state, stages)
+
+            kept = []
+            for action, weight in options:
+                if action.kind in ("attack", "fake_out"):
+                    action_tables = self._action_tables(
+                        profiles, slot, action, field_state, stages
+                    )
+                    if action_tables is None:
+                        continue  # a calc failed (logged); drop the choice
+                    for (target, spread), rolls in action_tables.items():
+                        tables[slot, len(kept), target, spread] = rolls
+                kept.append((action, weight))
+            options = kept or [(_Action(None, "struggle", "status", 0), 1.0)]
+            total = sum(w for _, w in options)
+            running = 0.0
+            cumulative = []
+            for _, weight in options:
+                running += weight / total
+                cumulative.append(running)
+            cumulative[-1] = 1.0
+            slot_options.append([a for a, _ in options])
+            slot_cumulative.append(cumulative)
+
+        priorities = [[a.priority for a in actions] for actions in slot_options]
+        faint = [0] * 4
+        flinch = [0] * 4
+        first = [0] * 4
+        you_any = they_any = win = even = lose = 0
+        kos_yours = kos_theirs = 0
+        picks = [[0] * len(actions) for actions in slot_options]
+
+        for _ in range(samples):
+            chosen = []
+            for slot in range(4):
+                r = rng.random()
+                cumulative = slot_cumulative[slot]
+                i = 0
+                while cumulative[i] < r:
+                    i += 1
+                chosen.append(i)
+                picks[slot][i] += 1
+
+            hp = list(max_hp)
+            fainted = [False] * 4
+            protected = [False] * 4
+            flinched = [False] * 4
+            acted = [False] * 4
+            redirect = [None, None]  # per side: slot drawing single-target moves
+            tw = list(tailwind)
+            tr = trick_room
+            ties = [rng.random() for _ in range(4)]
+            pending = [0, 1, 2, 3]
+            first_slot = None
+
+            while pending:
+                # Order is recalculated after every action (Gen 8+)
+                slot = None
+                best = None
+                for s in pending:
+                    speed = base_speed[s] * (2 if tw[s // 2] else 1)
+                    key = (priorities[s][chosen[s]], -speed if tr else speed, ties[s])
+                    if best is None or key > best:
+                        best = key
+                        slot = s
+                pending.remove(slot)
+                if fainted[slot]:
+                    continue
+                if flinched[slot]:
+                    acted[slot] = True
+                    continue
+                if first_slot is None:
+                    first_slot = slot
+                acted[slot] = True
+                action = slot_options[slot][chosen[slot]]
+                kind = action.kind
+
+                if kind == "protect":
+                    protected[slot] = True
+                    continue
+                if kind == "follow_me":
+                    redirect[slot // 2] = slot
+                    continue
+                if kind == "tailwind":
+                    tw[slot // 2] = True
+                    continue
+                if kind == "trick_room":
+                    tr = not tr
+                    continue
+                if kind == "status":
+                    continue
+
+                targets = _targets(slot, action.move)
+                if action.target is not None and not action.move.is_spread:
+                    target = action.target
+                    follower = redirect[1 - slot // 2]
+                    if follower is not None and not fainted[follower]:
+                        target = follower
+                    elif fainted[target]:
+                        # Single-target moves retarget the remaining foe
+                        target = next((t for t in _foes(slot) if not fainted[t]), None)
+                    targets = () if target is None else (target,)
+                targets = tuple(t for t in targets if not fainted[t])
+                spread = len(targets) > 1
+                accuracy = action.move.accuracy
+
+                for target in targets:
+                    if protected[target]:
+                        continue
+                    if (
+                        action.priority > 0 and psychic_terrain
+                        and profiles[target].is_grounded and target // 2 != slot // 2
+                    ):
+                        continue
+                    if accuracy and accuracy < 100 and rng.random() * 100 >= accuracy:
+                        continue
+                    key = (slot, chosen[slot], target, spread)
+                    if key not in tables:
+                        key = (slot, chosen[slot], target, False)
+                    normal, crit = tables[key]
+                    rolls = crit if rng.random() < CRIT_CHANCE else normal
+                    damage = rolls[int(rng.random() * len(rolls))]
+                    if damage <= 0:
+                        continue
+                    hp[target] -= damage
+                    if hp[target] <= 0:
+                        fainted[target] = True
+                    elif kind == "fake_out" and not acted[target] and _flinchable(profiles[target]):
+                        flinched[target] = True
+
+            for slot in range(4):
+                faint[slot] += fainted[slot]
+                flinch[slot] += flinched[slot]
+            if first_slot is not None:
+                first[first_slot] += 1
+            ours = fainted[2] + fainted[3]
+            theirs = fainted[0] + fainted[1]
+            kos_yours += ours
+            kos_theirs += theirs
+            you_any += ours > 0
+            they_any += theirs > 0
+            if ours > theirs:
+                win += 1
+            elif ours == theirs:
+                even += 1
+            else:
+                lose += 1
+
+        # Mirror leads (both sides on the same species) stay distinguishable
+        names = [p.name for p in profiles]
+        names[2:] = [
+            f"{name} (opponent)" if name in names[:2] else name for name in names[2:]
+        ]
+        n = max(samples, 1)
+        return TurnOneSimResult(
+            your_leads=(names[0], names[1]),
+            their_leads=(names[2], names[3]),
+            samples=samples,
+            faint={names[s]: OutcomeEstimate.from_counts(faint[s], samples) for s in range(4)},
+            flinch={names[s]: OutcomeEstimate.from_counts(flinch[s], samples) for s in range(4)},
+            moves_first={
+                names[s]: OutcomeEstimate.from_counts(first[s], samples) for s in range(4)
+            },
+            you_ko_any=OutcomeEstimate.from_counts(you_any, samples),
+            they_ko_any=OutcomeEstimate.from_counts(they_any, samples),
+            you_win_trade=OutcomeEstimate.from_counts(win, samples),
+            even_trade=OutcomeEstimate.from_counts(even, samples),
+            you_lose_trade=OutcomeEstimate.from_counts(lose, samples),
+            expected_kos_yours=round(kos_yours / n, 3),
+            expected_kos_theirs=round(kos_theirs / n, 3),
+            actions={
+                names[s]: {
+                    _action_label(action, names): round(picks[s][i] / n * 100, 1)
+                    for i, action in enumerate(slot_options[s])
+                }
+                for s in range(4)
+            },
+        )
+
+
+def _foes(slot: int) -> tuple[int, int]:
+    return (2, 3) if slot < 2 else (0, 1)
+
+
+def _targets(slot: int, move: Move) -> tuple[int, ...]:
+    """Slots a move can hit before retargeting (spread moves: all of them)."""
+    if move.is_spread:
+        if move.target in _HITS_ALLY:
+            return (*_foes(slot), slot ^ 1)
+        return _foes(slot)
+    return _foes(slot)
+
+
+def _flinchable(profile: PokemonProfile) -> bool:
+    """Whether Fake Out can hit and flinch this Pokemon."""
+    return not (profile.is_ghost_type or profile.is_flinch_immune)
+
+
+def _action_label(action: _Action, names: list[str]) -> str:
+    label = action.move.name if action.move is not None else action.name
+    if action.target is not None and action.move is not None and not action.move.is_spread:
+        label += f" -> {names[action.target]}"
+    return label
+
+
+def simulate_lead_matrix(
+    your_profiles: list[PokemonProfile],
+    their_profiles: list[PokemonProfile],
+    samples: int = DEFAULT_MATRIX_SAMPLES,
+    seed: int = 0,
+    simulator: Optional[TurnOneSimulator] = None,
+) -> LeadMatrixResult:
+    """Simulate turn 1 for every pair of your leads against every pair of theirs.
+
+    Each matchup uses its own seed (``seed`` plus its index), so results are
+    reproducible and independent of iteration order.
+
+    Returns:
+        LeadMatrixResult with one summary per lead pair of yours, best first
+    """
+    simulator = simulator or TurnOneSimulator()
+    your_pairs = list(combinations(your_profiles, 2))
+    their_pairs = list(combinations(their_profiles, 2))
+    predicted = {id(p) for p in _predict_opponent_leads(their_profiles)}
+
+    matchups: list[TurnOneSimResult] = []
+    summaries: list[LeadPairSummary] = []
+    for i, ours in enumerate(your_pairs):
+        results = []
+        for j, theirs in enumerate(their_pairs):
+            result = simulator.simulate(
+                list(ours), list(theirs), samples=samples,
+                seed=seed + i * len(their_pairs) + j,
+            )
+            results.append((theirs, result))
+        matchups.extend(result for _, result in results)
+        if not results:
+            continue
+        worst_pair, worst = min(results, key=lambda item: item[1].score)
+        predicted_result = next(
+            (r for theirs, r in results if {id(p) for p in theirs} == predicted), None
+        )
+        summaries.append(LeadPairSummary(
+            leads=(ours[0].name, ours[1].name),
+            average_score=round(sum(r.score for _, r in results) / len(results), 3),
+            worst_score=worst.score,
+            worst_against=(worst_pair[0].name, worst_pair[1].name),
+            predicted_score=predicted_result.score if predicted_result else None,
+        ))
+
+    summaries.sort(key=lambda s: s.average_score, reverse=True)
+    return LeadMatrixResult(
+        samples_per_matchup=samples,
+        matchups=matchups,
+        summaries=summaries,
+        damage_calcs=simulator.damage_calcs,
+    )
@@ -2,8 +2,10 @@
 
 import bisect
 import logging
+import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
@@ -33,24 +35,83 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
 logger = setup_logging()
 
 
+def _env_float(name: str, default: Optional[float] = None) -> Optional[float]:
+    """Read a float from the environment, falling back to ``default``."""
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring non-numeric {name}={value!r}")
+        return default
+
+
 class Settings:
     """Application settings."""
 
     # Cache settings
-    CACHE_DIR: Path = Path(__file__).parent.parent.parent / "data" / "cache"
+    CACHE_DIR: Path = Path(
+        os.environ.get("VGC_CACHE_DIR", Path(__file__).parent.parent.parent / "data" / "cache")
+    )
     CACHE_EXPIRE_DAYS: int = 7
-
-    # API settings
-    POKEAPI_BASE_URL: str = "https://pokeapi.co/api/v2"
-    SMOGON_STATS_BASE_URL: str = "https://www.smogon.com/stats"
-    POKEPASTE_BASE_URL: str = "https://pokepast.es"
+    # Pickled values at least this large are compressed ("zlib", "lzma" or "none")
+    CACHE_COMPRESSION: str = os.environ.get("VGC_CACHE_COMPRESSION", "zlib")
+    CACHE_COMPRESS_MIN_BYTES: int = 1024
+    # Async cache access: threads for disk I/O, and an in-memory tier for small hot entries
+    CACHE_IO_THREADS: int = int(_env_float("VGC_CACHE_IO_THREADS", 4))
+    CACHE_MEMORY_BYTES: int = int(_env_float("VGC_CACHE_MEMORY_MB", 16.0) * 1024 * 1024)
+    CACHE_MEMORY_ENTRY_BYTES: int = 64 * 1024
+    CACHE_MEMORY_TTL: int = 300
+    # Warm-start snapshot restored into an empty cache at boot (vgc-mcp-cache build)
+    CACHE_SNAPSHOT: Path = Path(
+        os.environ.get(
+            "VGC_CACHE_SNAPSHOT",
+            Path(__file__).parent.parent.parent / "data" / "cache-snapshot.tar.xz",
+        )
+    )
+
+    # API settings (override the base URLs to point clients at a local stand-in)
+    POKEAPI_BASE_URL: str = os.environ.get("VGC_POKEAPI_BASE_URL", "https://pokeapi.co/api/v2")
+    SMOGON_STATS_BASE_URL: str = os.environ.get(
+        "VGC_SMOGON_STATS_BASE_URL", "https://www.smogon.com/stats"
+    )
+    POKEPASTE_BASE_URL: str = os.environ.get("VGC_POKEPASTE_BASE_URL", "https://pokepast.es")
     API_TIMEOUT_SECONDS: float = 30.0
     API_MAX_RETRIES: int = 3
     API_RETRY_DELAY: float = 1.0
+    # Shared HTTP transport: per-host token bucket (VGC_API_RATE=0 disables),
+    # backoff ceiling, and retries allowed per request once the reserve is spent
+    API_RATE_PER_HOST: float = _env_float("VGC_API_RATE", 20.0)
+    API_RATE_BURST: int = int(_env_float("VGC_API_BURST", 40))
+    API_MAX_RETRY_DELAY: float = 10.0
+    API_RETRY_BUDGET_RATIO: float = 0.2
+    API_RETRY_BUDGET_RESERVE: int = 10
+    # HTTP/2 is used when the optional h2 package is installed (disable with VGC_HTTP2=0)
+    API_HTTP2: bool = os.environ.get("VGC_HTTP2", "1") != "0"
 
     # Smogon rating cutoffs
     SMOGON_RATING_CUTOFFS: list[int] = [0, 1500, 1630, 1760]
 
+    # Usage-stats prefetch / stale-while-revalidate (disable with VGC_SMOGON_PREFETCH=0)
+    SMOGON_PREFETCH_ENABLED: bool = os.environ.get("VGC_SMOGON_PREFETCH", "1") != "0"
+    SMOGON_REFRESH_INTERVAL_HOURS: float = _env_float("VGC_SMOGON_REFRESH_HOURS", 6.0)
+    SMOGON_STALE_EXPIRE_DAYS: int = 60  # keep last-known-good stats while upstream is down
+    # Parsed chaos files kept in memory; the prefetcher raises this to cover
+    # the current regulation's format x rating combinations it keeps warm
+    SMOGON_SNAPSHOT_CACHE_SIZE: int = 4
+    SMOGON_PREFETCH_CONCURRENCY: int = 4
+
+    # Full-dex name index loaded from PokeAPI at startup (disable with VGC_NAME_INDEX=0)
+    NAME_INDEX_ENABLED: bool = os.environ.get("VGC_NAME_INDEX", "1") != "0"
+
+    # Speed tiers generated from each usage month (disable with VGC_SPEED_TIERS=0)
+    SPEED_TIERS_ENABLED: bool = os.environ.get("VGC_SPEED_TIERS", "1") != "0"
+
+    # Cached results of pure tools (disable with VGC_RESULT_CACHE=0)
+    RESULT_CACHE_ENABLED: bool = os.environ.get("VGC_RESULT_CACHE", "1") != "0"
+    RESULT_CACHE_MAX_BYTES: int = int(_env_float("VGC_RESULT_CACHE_MB", 32.0) * 1024 * 1024)
+
     # VGC defaults
     DEFAULT_LEVEL: int = 50
     DEFAULT_FORMAT: str = "gen9vgc2026regfbo3"
@@ -64,6 +125,13 @@ class Settings:
     # Damage calculation
     DAMAGE_ROLL_COUNT: int = 16
 
+    # Slow tool-call profiling (off unless VGC_PROFILE_SLOW_MS is set)
+    PROFILE_SLOW_TOOL_MS: Optional[float] = _env_float("VGC_PROFILE_SLOW_MS")
+    PROFILE_SAMPLE_RATE: float = _env_float("VGC_PROFILE_SAMPLE_RATE", 1.0)
+    PROFILE_DIR: Path = Path(
+        os.environ.get("VGC_PROFILE_DIR", Path(__file__).parent.parent.parent / "data" / "profiles")
+    )
+
 
 settings = Settings()
 
@@ -4,7 +4,7 @@ import os
 import tempfile
 from typing import Optional
 
-from ..calc.bulk_calc import BulkCalcSummary, get_results_for_scenario  # noqa: I001
+from ..calc.bulk_calc import BulkCalcSummary, get_result, get_results_for_scenario  # noqa: I001
 from ..calc.damage import format_percent
 
 # =============================================================================
@@ -91,11 +91,8 @@ def generate_excel_report(
         bottom=Side(style="thin"),
     )
 
-    # Get unique defender names in order
-    seen_defenders = []
-    for r in summary.results:
-        if r.defender_name not in seen_defenders:
-            seen_defenders.append(r.defender_name)
+    # Defender names in run order
+    seen_defenders = summary.results.defender_names
 
     for scenario_name in summary.scenario_names:
         scenario_results = get_results_for_scenario(summary, scenario_name)
@@ -159,13 +156,8 @@ def generate_excel_report(
             # Move columns
             for move_idx, move_name in enumerate(summary.move_names):
                 col = 4 + move_idx
-                # Find the result for this defender + move + scenario
-                matching = [
-                    r for r in scenario_results
-                    if r.defender_name == defender_name and r.move_name == move_name
-                ]
-                if matching:
-                    r = matching[0]
+                r = get_result(summary, defender_name, move_name, scenario_name)
+                if r is not None:
                     cell = ws.cell(row=data_row, column=col)
                     cell.value = _format_cell_value(r.min_pct, r.max_pct, r.ko_chance)
                     cell.border = thin_border
@@ -228,11 +220,8 @@ def generate_pdf_report(
     pdf = FPDF(orientation="L", format="A4")
     pdf.set_auto_page_break(auto=True, margin=15)
 
-    # Get unique defender names in order
-    seen_defenders = []
-    for r in summary.results:
-        if r.defender_name not in seen_defenders:
-            seen_defenders.append(r.defender_name)
+    # Defender names in run order
+    seen_defenders = summary.results.defender_names
 
     num_moves = len(summary.move_names)
     # Calculate column widths for landscape A4 (297mm usable ~277mm)
@@ -295,12 +284,8 @@ def generate_pdf_report(
             pdf.cell(item_width, 7, item_display[:15], border=1)
 
             for move_name in summary.move_names:
-                matching = [
-                    r for r in scenario_results
-                    if r.defender_name == defender_name and r.move_name == move_name
-                ]
-                if matching:
-                    r = matching[0]
+                r = get_result(summary, defender_name, move_name, scenario_name)
+                if r is not None:
                     cell_text = _format_cell_value(r.min_pct, r.max_pct, r.ko_chance)
                     color = _get_ko_color(r.ko_chance)
                     pdf.set_fill_color(*color)
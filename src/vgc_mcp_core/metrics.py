@@ -0,0 +1,527 @@
+"""Per-tool instrumentation and Prometheus exposition.
+
+Every tool registered on a FastMCP server can be wrapped with
+``instrument_tools(mcp)``. Each call records:
+
+- wall time and CPU time (CPU is counted only while the tool's own coroutine
+  is running, so concurrent sessions don't inflate each other)
+- number of ``calculate_damage`` invocations
+- upstream fetches and cache hits/misses per API client
+- serialized payload size
+
+Results are aggregated into fixed-bucket histograms and rendered as
+Prometheus text by ``REGISTRY.render_prometheus()`` (served on ``/metrics``
+by the HTTP entry points).
+
+Slow-call profiling is opt-in: set ``VGC_PROFILE_SLOW_MS`` and any tool call
+slower than that threshold has its cProfile stats written to
+``settings.PROFILE_DIR``.
+"""
+
+import bisect
+import cProfile
+import functools
+import inspect
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .config import logger, settings
+
+# Histogram bucket upper bounds (+Inf is implicit)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DAMAGE_CALC_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 20000)
+BLOCKING_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+PAYLOAD_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+# =============================================================================
+# Metric primitives
+# =============================================================================
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape_label(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class CounterMetric:
+    """Monotonic counter keyed by label values."""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, labels: tuple[str, ...], amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def get(self, labels: tuple[str, ...]) -> float:
+        return self._values.get(labels, 0)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(
+                f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class HistogramMetric:
+    """Fixed-bucket histogram keyed by label values."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...],
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # labels -> [per-bucket counts..., +Inf count], sum
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def count(self, labels: tuple[str, ...]) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def sum(self, labels: tuple[str, ...]) -> float:
+        return self._sums.get(labels, 0.0)
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self._sums.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}"
+                )
+            cumulative += counts[-1]
+            inf = 'le="+Inf"'
+            lines.append(
+                f"{self.name}_bucket{_format_labels(self.label_names, labels, inf)} {cumulative}"
+            )
+            lines.append(
+                f"{self.name}_sum{_format_labels(self.label_names, labels)} "
+                f"{_format_value(self._sums[labels])}"
+            )
+            lines.append(
+                f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}"
+            )
+        return lines
+
+
+# =============================================================================
+# Per-call accounting
+# =============================================================================
+
+@dataclass
+class ToolCallStats:
+    """Counters accumulated while a single tool call is running."""
+    tool: str
+    cpu_seconds: float = 0.0
+    damage_calcs: int = 0
+    fetches: Counter = field(default_factory=Counter)
+    cache_hits: Counter = field(default_factory=Counter)
+    cache_misses: Counter = field(default_factory=Counter)
+    profiler: Optional[cProfile.Profile] = None
+
+
+_current_call: ContextVar[Optional[ToolCallStats]] = ContextVar("vgc_tool_call", default=None)
+
+
+def current_call() -> Optional[ToolCallStats]:
+    """Stats for the tool call running in this context, if any."""
+    return _current_call.get()
+
+
+def record_damage_calc() -> None:
+    """Count one ``calculate_damage`` invocation against the running tool call."""
+    stats = _current_call.get()
+    if stats is not None:
+        stats.damage_calcs += 1
+
+
+def record_fetch(client: str) -> None:
+    """Count one upstream HTTP request made by ``client``."""
+    REGISTRY.count_fetch(client)
+    stats = _current_call.get()
+    if stats is not None:
+        stats.fetches[client] += 1
+
+
+def record_cache_lookup(client: str, hit: bool) -> None:
+    """Count one ``APICache`` lookup for ``client``."""
+    REGISTRY.count_cache_lookup(client, hit)
+    stats = _current_call.get()
+    if stats is not None:
+        (stats.cache_hits if hit else stats.cache_misses)[client] += 1
+
+
+def record_cache_read(client: str, source: str) -> None:
+    """Count one async cache read by where it was served from."""
+    REGISTRY.count_cache_read(client, source)
+
+
+def record_cache_blocking(client: str, op: str, seconds: float) -> None:
+    """Record time an API cache operation held the event loop."""
+    REGISTRY.observe_cache_blocking(client, op, seconds)
+
+
+def record_transport(host: str, event: str) -> None:
+    """Count a shared-transport event (coalesced, throttled, retry, retry_denied)."""
+    REGISTRY.count_transport(host, event)
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+class MetricsRegistry:
+    """All tool and client metrics for one process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.tool_calls = CounterMetric(
+            "vgc_tool_calls_total", "Tool invocations by outcome.", ("tool", "status"))
+        self.wall_seconds = HistogramMetric(
+            "vgc_tool_wall_seconds", "Tool wall-clock latency in seconds.",
+            ("tool",), LATENCY_BUCKETS)
+        self.cpu_seconds = HistogramMetric(
+            "vgc_tool_cpu_seconds", "CPU time spent in the tool's own coroutine.",
+            ("tool",), LATENCY_BUCKETS)
+        self.damage_calcs = HistogramMetric(
+            "vgc_tool_damage_calcs", "calculate_damage invocations per tool call.",
+            ("tool",), DAMAGE_CALC_BUCKETS)
+        self.payload_bytes = HistogramMetric(
+            "vgc_tool_payload_bytes", "Serialized tool result size in bytes.",
+            ("tool",), PAYLOAD_BUCKETS)
+        self.tool_fetches = CounterMetric(
+            "vgc_tool_upstream_fetches_total", "Upstream HTTP requests made during tool calls.",
+            ("tool", "client"))
+        self.tool_cache_lookups = CounterMetric(
+            "vgc_tool_cache_lookups_total", "API cache lookups made during tool calls.",
+            ("tool", "client", "result"))
+        self.profiles_captured = CounterMetric(
+            "vgc_tool_profiles_captured_total", "Slow-call profiles written to disk.", ("tool",))
+        self.upstream_fetches = CounterMetric(
+            "vgc_upstream_fetches_total", "Upstream HTTP requests by client.", ("client",))
+        self.cache_lookups = CounterMetric(
+            "vgc_cache_lookups_total", "API cache lookups by client and result.",
+            ("client", "result"))
+        self.result_cache_lookups = CounterMetric(
+            "vgc_tool_result_cache_lookups_total", "Cached tool result lookups by outcome.",
+            ("tool", "result"))
+        self.result_cache_bytes_saved = CounterMetric(
+            "vgc_tool_result_cache_bytes_saved_total",
+            "Result bytes served from the tool result cache instead of recomputed.", ("tool",))
+        self.cache_reads = CounterMetric(
+            "vgc_cache_async_reads_total",
+            "Async API cache reads by source (memory, disk, coalesced).", ("client", "source"))
+        self.cache_blocking = HistogramMetric(
+            "vgc_cache_loop_blocking_seconds", "Time API cache operations held the event loop.",
+            ("client", "op"), BLOCKING_BUCKETS)
+        self.transport_events = CounterMetric(
+            "vgc_http_transport_events_total",
+            "Shared HTTP transport events: coalesced, throttled, retry, retry_denied.",
+            ("host", "event"))
+
+    @property
+    def _metrics(self) -> list:
+        return [
+            self.tool_calls, self.wall_seconds, self.cpu_seconds, self.damage_calcs,
+            self.payload_bytes, self.tool_fetches, self.tool_cache_lookups,
+            self.profiles_captured, self.upstream_fetches, self.cache_lookups,
+            self.result_cache_lookups, self.result_cache_bytes_saved,
+            self.cache_reads, self.cache_blocking, self.transport_events,
+        ]
+
+    def count_fetch(self, client: str) -> None:
+        with self._lock:
+            self.upstream_fetches.inc((client,))
+
+    def count_cache_lookup(self, client: str, hit: bool) -> None:
+        with self._lock:
+            self.cache_lookups.inc((client, "hit" if hit else "miss"))
+
+    def count_cache_read(self, client: str, source: str) -> None:
+        with self._lock:
+            self.cache_reads.inc((client, source))
+
+    def observe_cache_blocking(self, client: str, op: str, seconds: float) -> None:
+        with self._lock:
+            self.cache_blocking.observe((client, op), seconds)
+
+    def count_transport(self, host: str, event: str) -> None:
+        with self._lock:
+            self.transport_events.inc((host, event))
+
+    def count_result_cache(self, tool: str, result: str, bytes_saved: int = 0) -> None:
+        with self._lock:
+            self.result_cache_lookups.inc((tool, result))
+            if bytes_saved:
+                self.result_cache_bytes_saved.inc((tool,), bytes_saved)
+
+    def count_profile(self, tool: str) -> None:
+        with self._lock:
+            self.profiles_captured.inc((tool,))
+
+    def observe_call(
+        self,
+        stats: ToolCallStats,
+        wall_seconds: float,
+        payload_bytes: Optional[int],
+        status: str,
+    ) -> None:
+        """Fold a finished tool call into the aggregates."""
+        tool = (stats.tool,)
+        with self._lock:
+            self.tool_calls.inc((stats.tool, status))
+            self.wall_seconds.observe(tool, wall_seconds)
+            self.cpu_seconds.observe(tool, stats.cpu_seconds)
+            self.damage_calcs.observe(tool, stats.damage_calcs)
+            if payload_bytes is not None:
+                self.payload_bytes.observe(tool, payload_bytes)
+            for client, n in stats.fetches.items():
+                self.tool_fetches.inc((stats.tool, client), n)
+            for client, n in stats.cache_hits.items():
+                self.tool_cache_lookups.inc((stats.tool, client, "hit"), n)
+            for client, n in stats.cache_misses.items():
+                self.tool_cache_lookups.inc((stats.tool, client, "miss"), n)
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            lines = []
+            for metric in self._metrics:
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            for metric in self._metrics:
+                metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# =============================================================================
+# Slow-call profiling
+# =============================================================================
+
+class SlowCallProfiler:
+    """Profile tool calls and keep the cProfile output of slow ones.
+
+    Only a ``sample_rate`` fraction of calls is profiled, to bound overhead.
+    """
+
+    def __init__(self, threshold_ms: float, output_dir: Path, sample_rate: float = 1.0):
+        self.threshold_ms = threshold_ms
+        self.output_dir = Path(output_dir)
+        self.sample_rate = sample_rate
+
+    def should_profile(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def finish(self, stats: ToolCallStats, wall_seconds: float) -> Optional[Path]:
+        """Write the profile if the call crossed the threshold."""
+        elapsed_ms = wall_seconds * 1000
+        if stats.profiler is None or elapsed_ms < self.threshold_ms:
+            return None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        safe_tool = re.sub(r"[^A-Za-z0-9_-]", "_", stats.tool)
+        path = self.output_dir / f"{safe_tool}-{stamp}-{elapsed_ms:.0f}ms.prof"
+        stats.profiler.dump_stats(str(path))
+        REGISTRY.count_profile(stats.tool)
+        logger.info(f"Slow tool call {stats.tool} ({elapsed_ms:.0f}ms), profile: {path}")
+        return path
+
+
+def _profiler_from_settings() -> Optional[SlowCallProfiler]:
+    if settings.PROFILE_SLOW_TOOL_MS is None:
+        return None
+    return SlowCallProfiler(
+        settings.PROFILE_SLOW_TOOL_MS, settings.PROFILE_DIR, settings.PROFILE_SAMPLE_RATE,
+    )
+
+
+# =============================================================================
+# Tool wrapping
+# =============================================================================
+
+class _InstrumentedAwait:
+    """Drive a coroutine, charging CPU time (and profiling) to its own steps only.
+
+    Each ``send``/``throw`` into the wrapped coroutine runs synchronously on
+    the event loop thread, so ``time.thread_time()`` around every step gives
+    the CPU this call used, excluding other tasks interleaved at await points.
+    """
+
+    __slots__ = ("_coro", "_stats")
+
+    def __init__(self, coro, stats: ToolCallStats):
+        self._coro = coro
+        self._stats = stats
+
+    def __await__(self):
+        coro, stats = self._coro, self._stats
+        send_value, throw_exc = None, None
+        while True:
+            if stats.profiler is not None:
+                stats.profiler.enable()
+            start = time.thread_time()
+            try:
+                if throw_exc is not None:
+                    yielded = coro.throw(throw_exc)
+                else:
+                    yielded = coro.send(send_value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                stats.cpu_seconds += time.thread_time() - start
+                if stats.profiler is not None:
+                    stats.profiler.disable()
+            try:
+                send_value, throw_exc = (yield yielded), None
+            except BaseException as exc:
+                send_value, throw_exc = None, exc
+
+
+def _payload_size(result: Any) -> int:
+    """Approximate the serialized size of a tool result in bytes."""
+    if isinstance(result, (bytes, bytearray)):
+        return len(result)
+    if isinstance(result, str):
+        return len(result.encode("utf-8"))
+    try:
+        return len(json.dumps(result, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(result).encode("utf-8"))
+
+
+def instrument_tool(
+    fn: Callable,
+    tool_name: str,
+    registry: Optional[MetricsRegistry] = None,
+    profiler: Optional[SlowCallProfiler] = None,
+) -> Callable:
+    """Wrap a tool function so every call is recorded in ``registry``."""
+    registry = registry or REGISTRY
+
+    def _start() -> tuple[ToolCallStats, Any]:
+        stats = ToolCallStats(tool=tool_name)
+        parent = _current_call.get()
+        # Nested tool calls share the outer profiler's thread; only one may run
+        nested_profile = parent is not None and parent.profiler is not None
+        if profiler is not None and not nested_profile and profiler.should_profile():
+            stats.profiler = cProfile.Profile()
+        return stats, _current_call.set(stats)
+
+    def _finish(stats, token, start, result, status) -> None:
+        _current_call.reset(token)
+        wall = time.perf_counter() - start
+        payload = _payload_size(result) if status == "ok" else None
+        registry.observe_call(stats, wall, payload, status)
+        if profiler is not None:
+            profiler.finish(stats, wall)
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            stats, token = _start()
+            start = time.perf_counter()
+            result, status = None, "error"
+            try:
+                result = await _InstrumentedAwait(fn(*args, **kwargs), stats)
+                status = "ok"
+                return result
+            finally:
+                _finish(stats, token, start, result, status)
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def sync_wrapper(*args, **kwargs):
+        stats, token = _start()
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        result, status = None, "error"
+        if stats.profiler is not None:
+            stats.profiler.enable()
+        try:
+            result = fn(*args, **kwargs)
+            status = "ok"
+            return result
+        finally:
+            if stats.profiler is not None:
+                stats.profiler.disable()
+            stats.cpu_seconds = time.thread_time() - cpu_start
+            _finish(stats, token, start, result, status)
+    return sync_wrapper
+
+
+def instrument_tools(
+    mcp,
+    registry: Optional[MetricsRegistry] = None,
+    profiler: Optional[SlowCallProfiler] = None,
+) -> int:
+    """Wrap every tool registered on ``mcp``. Returns the number wrapped.
+
+    Call once after all ``register_*_tools`` calls. Tools already wrapped are
+    skipped, so calling it again after registering more tools is safe.
+    """
+    if profiler is None:
+        profiler = _profiler_from_settings()
+    wrapped = 0
+    for tool in mcp._tool_manager._tools.values():
+        if getattr(tool.fn, "__vgc_instrumented__", False):
+            continue
+        tool.fn = instrument_tool(tool.fn, tool.name, registry, profiler)
+        tool.fn.__vgc_instrumented__ = True
+        wrapped += 1
+    return wrapped
@@ -8,6 +8,7 @@ from .pokemon import (
     IVSpread,
     Nature,
     NATURE_MODIFIERS,
+    parse_nature,
 )
 from .move import Move, MoveCategory
 from .team import Team, TeamSlot
@@ -20,6 +21,7 @@ __all__ = [
     "IVSpread",
     "Nature",
     "NATURE_MODIFIERS",
+    "parse_nature",
     "Move",
     "MoveCategory",
     "Team",
@@ -76,6 +76,14 @@ NATURE_MODIFIERS: dict[Nature, dict[str, float]] = {
 }
 
 
+def parse_nature(name: Optional[str], default: Nature = Nature.SERIOUS) -> Nature:
+    """Nature from a name in any case ("Jolly", "jolly"), or ``default``."""
+    try:
+        return Nature(name.strip().lower())
+    except (AttributeError, ValueError):
+        return default
+
+
 def get_nature_modifier(nature: Nature, stat_name: str) -> float:
     """Get the nature modifier for a specific stat."""
     if nature not in NATURE_MODIFIERS:
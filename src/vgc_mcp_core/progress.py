@@ -0,0 +1,235 @@
+"""Progress notifications and paginated results for long-running tools.
+
+Big jobs (bulk calcs against the top 25, multi-threat spread searches,
+meta-wide team analysis) used to return one large dict only after all the
+work was done. Two pieces let them stream instead:
+
+- ``ProgressReporter`` sends MCP progress notifications as work completes,
+  each carrying the best result so far (the current best spread, the
+  defender just finished) in its message. Updates are throttled, except the
+  first and last, so a client sees useful output as soon as the first unit
+  of work is done without the transport being flooded.
+- ``ResultStore`` keeps the tail of a long result list behind an opaque
+  cursor. A tool returns the first page plus ``next_cursor``, and the
+  ``get_more_results`` tool pages through the rest, so the first response
+  stays small no matter how many rows were computed.
+
+The reporter works with or without a FastMCP ``Context``: with none (direct
+calls, tests) updates are only recorded.
+"""
+
+import json
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from .config import logger
+
+# Minimum seconds between progress notifications (first and last always sent)
+PROGRESS_MIN_INTERVAL = 0.25
+
+# Progress messages longer than this are truncated
+MAX_PROGRESS_MESSAGE = 1000
+
+# Rows returned per page unless a tool asks for another size
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+
+# Result sets kept for get_more_results, and how long they stay valid
+MAX_RESULT_SETS = 64
+RESULT_TTL_SECONDS = 30 * 60  # since last read
+
+
+def progress_message(message: str = "", best: Any = None) -> str:
+    """A progress message with the best-so-far result appended as JSON."""
+    if best is not None:
+        best_json = json.dumps(best, separators=(",", ":"), default=str)
+        message = f"{message} | best so far: {best_json}" if message else best_json
+    if len(message) > MAX_PROGRESS_MESSAGE:
+        message = message[:MAX_PROGRESS_MESSAGE - 3] + "..."
+    return message
+
+
+class ProgressReporter:
+    """Throttled MCP progress notifications for one tool call.
+
+    Example::
+
+        progress = ProgressReporter(ctx, total=len(defenders))
+        for i, defender in enumerate(defenders, 1):
+            ...
+            await progress.update(i, f"Finished {defender.name}", best=row)
+    """
+
+    def __init__(
+        self,
+        ctx: Any = None,
+        total: Optional[float] = None,
+        min_interval: float = PROGRESS_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ctx = ctx
+        self.total = total
+        self.min_interval = min_interval
+        self._clock = clock
+        self._started = clock()
+        self._last_sent: Optional[float] = None
+        # (progress, total, message) of every notification sent
+        self.sent: list[tuple[float, Optional[float], str]] = []
+        # Seconds from creation to the first notification
+        self.first_update_after: Optional[float] = None
+
+    async def update(
+        self,
+        progress: float,
+        message: str = "",
+        best: Any = None,
+        force: bool = False,
+    ) -> bool:
+        """Report progress; returns False if throttled.
+
+        The first update and the final one (``progress >= total``) are always
+        sent; others at most once per ``min_interval``.
+        """
+        now = self._clock()
+        final = self.total is not None and progress >= self.total
+        if (
+            not force
+            and not final
+            and self._last_sent is not None
+            and now - self._last_sent < self.min_interval
+        ):
+            return False
+
+        text = progress_message(message, best)
+        self._last_sent = now
+        if self.first_update_after is None:
+            self.first_update_after = now - self._started
+        self.sent.append((progress, self.total, text))
+        if self.ctx is not None:
+            try:
+                await self.ctx.report_progress(progress, self.total, text)
+            except Exception as e:
+                # A client that went away mustn't fail the tool call
+                logger.debug("Progress notification failed: %s", e)
+        return True
+
+
+@dataclass
+class ResultSet:
+    """Rows held back from a tool response."""
+    tool: str
+    items: Sequence
+    page_size: int
+    touched: float  # last paginate/page call
+
+
+class ResultStore:
+    """Result sets kept behind cursors for get_more_results.
+
+    Cursors are ``"<handle>:<offset>"``; the handle is random, so one
+    session can't guess another's, and a cursor can be fetched again (pages
+    are read, not consumed). Sets expire ``ttl`` seconds after they were
+    last read and the least recently read are evicted beyond ``max_sets``.
+    """
+
+    def __init__(
+        self,
+        max_sets: int = MAX_RESULT_SETS,
+        ttl: float = RESULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_sets = max_sets
+        self.ttl = ttl
+        self._clock = clock
+        self._sets: OrderedDict[str, ResultSet] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+    def paginate(self, tool: str, items: Sequence, page_size: int = DEFAULT_PAGE_SIZE) -> dict:
+        """First page of ``items``; the rest stays behind ``next_cursor``.
+
+        Lists are copied. Other sequences (a lazy view that builds each row
+        when it's sliced) are held as they are, so rows past the first page
+        are only built if a client pages to them.
+
+        Returns:
+            {"items": [...], "total": int, "next_cursor": str or None}
+        """
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        cursor = None
+        if len(items) > page_size:
+            self._expire()
+            handle = secrets.token_urlsafe(9)
+            held = list(items) if isinstance(items, list) else items
+            self._sets[handle] = ResultSet(tool, held, page_size, self._clock())
+            while len(self._sets) > self.max_sets:
+                self._sets.popitem(last=False)
+            cursor = f"{handle}:{page_size}"
+        return {"items": items[:page_size], "total": len(items), "next_cursor": cursor}
+
+    def page(self, cursor: str, page_size: Optional[int] = None) -> dict:
+        """The page a cursor points at.
+
+        Raises:
+            ValueError: Malformed cursor
+            KeyError: Unknown or expired cursor
+
+        Returns:
+            {"tool": str, "items": [...], "offset": int, "total": int,
+             "next_cursor": str or None}
+        """
+        handle, _, offset_text = cursor.partition(":")
+        if not offset_text.isdigit():
+            raise ValueError(f"Malformed cursor '{cursor}'")
+        self._expire()
+        result_set = self._sets.get(handle)
+        if result_set is None:
+            raise KeyError(cursor)
+        self._sets.move_to_end(handle)
+        result_set.touched = self._clock()
+
+        offset = int(offset_text)
+        size = max(1, min(page_size or result_set.page_size, MAX_PAGE_SIZE))
+        end = offset + size
+        total = len(result_set.items)
+        return {
+            "tool": result_set.tool,
+            "items": result_set.items[offset:end],
+            "offset": offset,
+            "total": total,
+            "next_cursor": f"{handle}:{end}" if end < total else None,
+        }
+
+    def clear(self) -> None:
+        """Drop every stored result set."""
+        self._sets.clear()
+
+    def _expire(self) -> None:
+        cutoff = self._clock() - self.ttl
+        while self._sets:
+            handle, result_set = next(iter(self._sets.items()))
+            if result_set.touched >= cutoff:
+                break
+            del self._sets[handle]
+
+
+_result_store: Optional[ResultStore] = None
+
+
+def get_result_store() -> ResultStore:
+    """The process-wide result store."""
+    global _result_store
+    if _result_store is None:
+        _result_store = ResultStore()
+    return _result_store
+
+
+def reset_result_store() -> None:
+    """Reset the shared store (useful for testing)."""
+    global _result_store
+    _result_store = None
@@ -0,0 +1,332 @@
+"""Deterministic result cache for pure tools.
+
+Many tool calls are exact repeats across sessions ("Flutter Mane Moonblast
+vs Incineroar" with Smogon-default spreads, the meta speed tiers). A tool
+decorated with ``@cached_tool`` answers a repeat from a stored JSON payload
+without running the engine. The key is built from:
+
+- the canonical arguments: bound against the tool's signature with defaults
+  filled in, so omitting an argument and passing its default are the same
+  call, and with Pokemon/move/item/ability/nature names resolved through the
+  name index, so "Flutter Mane", "flutter-mane" and "fluttermane" share an
+  entry
+- the data version: package version, current regulation, the Smogon
+  format and month the usage-derived defaults come from, and the size of the
+  Pokemon name index (which grows once the full dex is loaded)
+
+Payloads live in a byte-bounded in-memory LRU backed by the disk cache, so
+popular calcs survive restarts. Error responses, results a tool flags with
+``"fallback": True`` (a stand-in for data that hasn't loaded), and results
+computed before any usage data loaded (possibly a fallback), are never
+stored. Hits, misses and bytes served from the cache are exported with the
+other tool metrics.
+
+The process-wide cache passes calls straight through until the server
+enables it (``get_tool_result_cache().enable(...)``), so tools registered
+in tests or scripts with their own clients never share results.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from . import __version__
+from .api.cache import get_async_cache
+from .config import logger, settings
+from .metrics import REGISTRY
+from .rules.regulation_loader import get_regulation_config
+from .utils.name_index import get_name_resolver, to_id
+
+# Prefix for entries in the disk cache
+DISK_PREFIX = "tool_result"
+
+# Payloads larger than this share of the memory budget go to disk only
+MAX_ENTRY_SHARE = 8
+
+
+@dataclass
+class ToolCacheStats:
+    """Lookups and savings for one tool."""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _canonical_value(value: Any, kind: Optional[str]) -> Any:
+    if isinstance(value, str):
+        value = value.strip()
+        if kind is not None:
+            return get_name_resolver().resolve(kind, value) or to_id(value)
+        return value
+    if isinstance(value, dict):
+        return {str(k): _canonical_value(v, kind) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(v, kind) for v in value]
+    return value
+
+
+def _defaults(signature: inspect.Signature) -> dict[str, Any]:
+    return {
+        param.name: param.default
+        for param in signature.parameters.values()
+        if param.default is not inspect.Parameter.empty
+    }
+
+
+def canonical_arguments(
+    signature: inspect.Signature,
+    args: tuple,
+    kwargs: dict,
+    names: Optional[dict[str, str]] = None,
+    defaults: Optional[dict[str, Any]] = None,
+) -> dict:
+    """The arguments that differ from their defaults, with names resolved.
+
+    Omitting an argument and passing its default give the same result.
+
+    Args:
+        signature: The tool's signature
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        names: Parameter name -> name-index kind ("pokemon", "move", ...)
+        defaults: The signature's defaults, if already collected
+    """
+    if defaults is None:
+        defaults = _defaults(signature)
+    if args or not kwargs.keys() <= signature.parameters.keys():
+        kwargs = signature.bind(*args, **kwargs).arguments
+    names = names or {}
+    return {
+        param: _canonical_value(value, names.get(param))
+        for param, value in kwargs.items()
+        if param not in defaults or value != defaults[param]
+    }
+
+
+class ToolResultCache:
+    """Byte-bounded LRU of tool results, optionally backed by the disk cache."""
+
+    def __init__(self, max_bytes: int = settings.RESULT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.enabled = False
+        self.disk = None
+        self.usage_source = None
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._bytes = 0
+        self.stats: dict[str, ToolCacheStats] = {}
+
+    def enable(self, disk=None, usage_source=None) -> "ToolResultCache":
+        """Start caching.
+
+        Args:
+            disk: An ``APICache`` used as the second tier (None for memory only)
+            usage_source: Object with ``current_format``/``current_month``
+                (the Smogon client) whose data the tools' defaults come from
+        """
+        self.enabled = True
+        self.disk = disk
+        self.usage_source = usage_source
+        return self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of payload held in memory."""
+        return self._bytes
+
+    def data_version(self) -> str:
+        """Fingerprint of the data a tool result depends on."""
+        usage = "none"
+        if self.usage_source is not None:
+            usage = f"{self.usage_source.current_format}:{self.usage_source.current_month}"
+        dex = len(get_name_resolver().index("pokemon"))
+        regulation = get_regulation_config().current_regulation
+        return f"{__version__}|{regulation}|{usage}|dex{dex}"
+
+    def usage_loaded(self) -> bool:
+        """False while the usage source has no month loaded yet."""
+        return self.usage_source is None or self.usage_source.current_month is not None
+
+    def make_key(self, tool: str, arguments: dict, version: Optional[str] = None) -> str:
+        """Digest of the tool, its canonical arguments and the data version."""
+        data = json.dumps(
+            [tool, version or self.data_version(), arguments],
+            sort_keys=True, separators=(",", ":"), default=str,
+        )
+        return hashlib.sha256(data.encode()).hexdigest()[:32]
+
+    async def fetch(self, key: str) -> Optional[str]:
+        """Stored payload for ``key`` from memory, then disk (read off the event loop)."""
+        payload = self._entries.get(key)
+        if payload is not None:
+            self._entries.move_to_end(key)
+            return payload
+        if self.disk is not None:
+            payload = await get_async_cache(self.disk).get(DISK_PREFIX, key)
+            if payload is not None:
+                self._remember(key, payload)
+        return payload
+
+    async def store(self, key: str, payload: str) -> None:
+        """Store a payload in memory (if it fits) and on disk (written off the event loop)."""
+        self._remember(key, payload)
+        if self.disk is not None:
+            try:
+                await get_async_cache(self.disk).set(DISK_PREFIX, key, value=payload)
+            except Exception as e:
+                logger.debug("Could not persist tool result: %s", e)
+
+    def _remember(self, key: str, payload: str) -> None:
+        size = len(payload)
+        if size * MAX_ENTRY_SHARE > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._entries[key] = payload
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def record(self, tool: str, result: str, size: int = 0, disk: bool = False) -> None:
+        """Count a lookup ("hit" or "miss") for ``tool``."""
+        stats = self.stats.setdefault(tool, ToolCacheStats())
+        if result == "hit":
+            stats.hits += 1
+            stats.bytes_saved += size
+            if disk:
+                stats.disk_hits += 1
+        else:
+            stats.misses += 1
+        REGISTRY.count_result_cache(tool, result, size)
+
+    def report(self) -> dict:
+        """Per-tool hit rates and bytes saved, plus memory use."""
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "memory_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "tools": {
+                tool: {
+                    "hits": s.hits,
+                    "disk_hits": s.disk_hits,
+                    "misses": s.misses,
+                    "hit_rate": round(s.hit_rate, 3),
+                    "bytes_saved": s.bytes_saved,
+                }
+                for tool, s in sorted(self.stats.items())
+            },
+        }
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the disk tier expires on its own)."""
+        self._entries.clear()
+        self._bytes = 0
+
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, dict) and (
+        bool(result.get("error")) or result.get("success") is False
+    )
+
+
+def _is_fallback(result: Any) -> bool:
+    return isinstance(result, dict) and result.get("fallback") is True
+
+
+def cached_tool(
+    names: Optional[dict[str, str]] = None,
+    cache: Optional["ToolResultCache"] = None,
+) -> Callable:
+    """Serve repeat calls of a pure async tool from the result cache.
+
+    Apply under ``@mcp.tool()``::
+
+        @mcp.tool()
+        @cached_tool(names={"attacker_name": "pokemon", "move_name": "move"})
+        async def calculate_damage_output(attacker_name: str, ...) -> dict:
+
+    Only decorate tools whose result depends on nothing but their arguments
+    and the data version (no session state, randomness or clock). A tool
+    that answers from a stand-in when its data isn't available must say so
+    with ``"fallback": True`` so the stand-in isn't stored.
+
+    Args:
+        names: Parameter name -> name-index kind, resolved before keying
+        cache: Cache to use (default: the process-wide one)
+    """
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+        defaults = _defaults(signature)
+        tool = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            store = cache if cache is not None else get_tool_result_cache()
+            if not store.enabled:
+                return await fn(*args, **kwargs)
+
+            arguments = canonical_arguments(signature, args, kwargs, names, defaults)
+            version = store.data_version()
+            key = store.make_key(tool, arguments, version)
+            in_memory = key in store
+            payload = await store.fetch(key)
+            if payload is not None:
+                store.record(tool, "hit", len(payload), disk=not in_memory)
+                return json.loads(payload)
+
+            store.record(tool, "miss")
+            result = await fn(*args, **kwargs)
+            if _is_error(result) or _is_fallback(result):
+                return result
+            try:
+                payload = json.dumps(result, separators=(",", ":"))
+            except (TypeError, ValueError):
+                return result
+            if not store.usage_loaded():
+                # Usage data never loaded: this may be a fallback answer
+                return result
+            # The call may have loaded the usage data its defaults came from
+            after = store.data_version()
+            if after != version:
+                key = store.make_key(tool, arguments, after)
+            await store.store(key, payload)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+_tool_result_cache: Optional[ToolResultCache] = None
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """The process-wide tool result cache (disabled until enabled)."""
+    global _tool_result_cache
+    if _tool_result_cache is None:
+        _tool_result_cache = ToolResultCache()
+    return _tool_result_cache
+
+
+def reset_tool_result_cache() -> None:
+    """Reset the shared cache (useful for testing)."""
+    global _tool_result_cache
+    _tool_result_cache = None
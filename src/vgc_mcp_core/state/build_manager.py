@@ -8,7 +8,8 @@ Manages active Pokemon builds so that:
 """
 
 from typing import Any, Optional
-from difflib import SequenceMatcher
+
+from ..utils.name_index import NameIndex
 
 
 class BuildStateManager:
@@ -21,6 +22,7 @@ class BuildStateManager:
     def __init__(self):
         self._builds: dict[str, dict] = {}  # build_id -> full state
         self._name_to_id: dict[str, str] = {}  # lowercase pokemon name -> build_id
+        self._names = NameIndex("build")  # fuzzy lookup over _name_to_id keys
         self._active_build_id: Optional[str] = None
         self._counter = 0
 
@@ -61,6 +63,7 @@ class BuildStateManager:
 
         # Track name -> id mapping (lowercase for fuzzy matching)
         self._name_to_id[pokemon_name.lower()] = build_id
+        self._names.add(pokemon_name.lower())
         self._active_build_id = build_id
 
         return build_id
@@ -91,18 +94,10 @@ class BuildStateManager:
         if name_lower in self._name_to_id:
             return self._builds.get(self._name_to_id[name_lower])
 
-        # Fuzzy match - find best match above 0.6 threshold
-        best_match = None
-        best_ratio = 0.6
-
-        for stored_name, build_id in self._name_to_id.items():
-            ratio = SequenceMatcher(None, name_lower, stored_name).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_match = build_id
-
-        if best_match:
-            return self._builds.get(best_match)
+        # Fuzzy match - best stored name above 0.6 similarity
+        matches = self._names.suggest(name_lower, limit=1, cutoff=0.6)
+        if matches and matches[0] in self._name_to_id:
+            return self._builds.get(self._name_to_id[matches[0]])
 
         return None
 
@@ -256,6 +251,8 @@ class BuildStateManager:
         # Remove from name mapping
         if self._name_to_id.get(pokemon_name) == build_id:
             del self._name_to_id[pokemon_name]
+            if self._names.resolve(pokemon_name) == pokemon_name:
+                self._names.discard(pokemon_name)
 
         # Remove build
         del self._builds[build_id]
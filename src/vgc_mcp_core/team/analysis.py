@@ -5,8 +5,7 @@ from typing import Optional
 
 from ..models.team import Team
 from ..models.pokemon import PokemonBuild
-from ..calc.modifiers import TYPE_CHART, get_type_effectiveness
-from ..calc.stats import calculate_all_stats
+from .analysis_cache import get_team_analysis_cache
 
 
 ALL_TYPES = [
@@ -17,7 +16,12 @@ ALL_TYPES = [
 
 
 class TeamAnalyzer:
-    """Analyze team composition for competitive insights."""
+    """Analyze team composition for competitive insights.
+
+    Per-Pokemon work (stats, type matchups) comes from the shared
+    TeamAnalysisCache, so re-analyzing a team after one slot changes only
+    derives the new Pokemon's artifacts.
+    """
 
     def analyze_defensive_coverage(self, team: Team) -> dict:
         """
@@ -36,13 +40,14 @@ class TeamAnalyzer:
         weak_pokemon = defaultdict(list)
         resist_pokemon = defaultdict(list)
         immune_pokemon = defaultdict(list)
+        cache = get_team_analysis_cache()
 
         for slot in team.slots:
             pokemon = slot.pokemon
-            pokemon_types = [t.capitalize() for t in pokemon.types]
+            effectiveness = cache.slot(pokemon).effectiveness
 
             for attack_type in ALL_TYPES:
-                eff = get_type_effectiveness(attack_type, pokemon_types)
+                eff = effectiveness[attack_type]
 
                 if eff == 0:
                     immunity_count[attack_type] += 1
@@ -101,16 +106,13 @@ class TeamAnalyzer:
         Full analysis would require knowing moves.
         """
         type_coverage = defaultdict(list)
+        cache = get_team_analysis_cache()
 
         for slot in team.slots:
             pokemon = slot.pokemon
 
-            for poke_type in pokemon.types:
-                poke_type = poke_type.capitalize()
-                if poke_type in TYPE_CHART:
-                    for target_type, eff in TYPE_CHART[poke_type].items():
-                        if eff >= 2:
-                            type_coverage[target_type].append(pokemon.name)
+            for target_type in cache.slot(pokemon).super_effective:
+                type_coverage[target_type].append(pokemon.name)
 
         # Find types with no super-effective coverage
         no_coverage = [
@@ -140,10 +142,11 @@ class TeamAnalyzer:
         Returns list of Pokemon sorted by speed (fastest first).
         """
         speed_data = []
+        cache = get_team_analysis_cache()
 
         for slot in team.slots:
             pokemon = slot.pokemon
-            stats = calculate_all_stats(pokemon)
+            stats = cache.slot(pokemon).stats
 
             speed_data.append({
                 "slot": slot.slot_index + 1,
@@ -202,10 +205,11 @@ class TeamAnalyzer:
         }
 
         support_types = ["Grass", "Fairy", "Ghost", "Dark"]  # Common support typings
+        cache = get_team_analysis_cache()
 
         for slot in team.slots:
             pokemon = slot.pokemon
-            stats = calculate_all_stats(pokemon)
+            stats = cache.slot(pokemon).stats
             base = pokemon.base_stats
 
             # Offense classification
@@ -279,8 +283,9 @@ class TeamAnalyzer:
     def _get_speed_range(self, team: Team) -> dict:
         """Get min/max speed on team."""
         speeds = []
+        cache = get_team_analysis_cache()
         for slot in team.slots:
-            stats = calculate_all_stats(slot.pokemon)
+            stats = cache.slot(slot.pokemon).stats
             speeds.append({
                 "name": slot.pokemon.name,
                 "speed": stats["speed"]
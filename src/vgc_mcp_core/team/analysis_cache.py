@@ -0,0 +1,177 @@
+"""Per-slot analysis artifacts shared by the team analysis tools.
+
+Iterative team building (swap a Pokemon, re-check, swap again) re-runs the
+same analyses on teams that differ in one slot. TeamAnalysisCache keeps what
+those analyses derive from each Pokemon -- calculated stats, its defensive
+type vector and the types its STABs hit super effectively -- plus the 1v1
+scores between pairs of builds that make up the matchup matrix.
+
+Entries are keyed by build content (build_key), so after an edit only the
+changed slot misses: the other slots, and every matchup row and column not
+involving the new Pokemon, are reused. Swapping back hits again. Team-level
+aggregates are recombined from the cached per-slot vectors, which is a few
+hundred dictionary lookups. Because keys are recomputed from the build on
+every lookup, in-place edits (TeamManager.update_pokemon) need no explicit
+invalidation.
+
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+from ..calc.modifiers import TYPE_CHART, get_type_effectiveness
+from ..calc.stats import calculate_all_stats
+from ..models.pokemon import PokemonBuild
+
+T = TypeVar("T")
+
+# Distinct builds kept (a few teams' worth plus swap candidates)
+MAX_SLOT_ENTRIES = 512
+
+# Build pairs kept for matchup matrices (36 per team-vs-team matrix)
+MAX_PAIR_ENTRIES = 4096
+
+
+def build_key(pokemon: PokemonBuild) -> tuple:
+    """Everything an analysis can read from a build, as a hashable key."""
+    return (
+        pokemon.name,
+        pokemon.species,
+        tuple(pokemon.types),
+        tuple(pokemon.base_stats.__dict__.values()),
+        pokemon.nature,
+        tuple(pokemon.evs.__dict__.values()),
+        tuple(pokemon.ivs.__dict__.values()),
+        pokemon.level,
+        pokemon.ability,
+        pokemon.item,
+        pokemon.tera_type,
+        tuple(pokemon.moves),
+    )
+
+
+@dataclass(frozen=True)
+class SlotArtifacts:
+    """Analysis inputs derived from one Pokemon build."""
+
+    key: tuple
+    name: str
+    stats: dict[str, int]
+    # Multiplier taken from each attacking type (TYPE_CHART keys)
+    effectiveness: dict[str, float]
+    # Defending types hit super effectively by each of the Pokemon's types,
+    # in type order (a type hit by both of them appears twice)
+    super_effective: tuple[str, ...]
+
+
+def compute_slot_artifacts(pokemon: PokemonBuild, key: Optional[tuple] = None) -> SlotArtifacts:
+    """Derive a build's artifacts from scratch."""
+    super_effective = []
+    for poke_type in pokemon.types:
+        chart = TYPE_CHART.get(poke_type.capitalize())
+        if chart:
+            super_effective.extend(t for t, eff in chart.items() if eff >= 2)
+    return SlotArtifacts(
+        key=key if key is not None else build_key(pokemon),
+        name=pokemon.name,
+        stats=calculate_all_stats(pokemon),
+        effectiveness={
+            attack_type: get_type_effectiveness(attack_type, pokemon.types)
+            for attack_type in TYPE_CHART
+        },
+        super_effective=tuple(super_effective),
+    )
+
+
+class TeamAnalysisCache:
+    """LRU caches of per-build artifacts and pairwise matchup results."""
+
+    def __init__(
+        self,
+        max_slots: int = MAX_SLOT_ENTRIES,
+        max_pairs: int = MAX_PAIR_ENTRIES,
+    ):
+        self.max_slots = max_slots
+        self.max_pairs = max_pairs
+        self.slot_hits = 0
+        self.slot_misses = 0
+        self.pair_hits = 0
+        self.pair_misses = 0
+        self._slots: OrderedDict[tuple, SlotArtifacts] = OrderedDict()
+        self._pairs: OrderedDict[tuple, object] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def slot(self, pokemon: PokemonBuild) -> SlotArtifacts:
+        """Artifacts for one build, derived on first use."""
+        key = build_key(pokemon)
+        artifacts = self._slots.get(key)
+        if artifacts is not None:
+            self.slot_hits += 1
+            self._slots.move_to_end(key)
+            return artifacts
+        self.slot_misses += 1
+        artifacts = compute_slot_artifacts(pokemon, key)
+        self._slots[key] = artifacts
+        if len(self._slots) > self.max_slots:
+            self._slots.popitem(last=False)
+        return artifacts
+
+    def pair(
+        self,
+        first: PokemonBuild,
+        second: PokemonBuild,
+        compute: Callable[[PokemonBuild, PokemonBuild], T],
+    ) -> T:
+        """Result of ``compute(first, second)``, cached per pair of builds.
+
+        ``compute`` must depend only on the two builds; its qualified name is
+        part of the key so different pairwise functions don't collide.
+        """
+        key = (compute.__qualname__, build_key(first), build_key(second))
+        if key in self._pairs:
+            self.pair_hits += 1
+            self._pairs.move_to_end(key)
+            return self._pairs[key]
+        self.pair_misses += 1
+        result = compute(first, second)
+        self._pairs[key] = result
+        if len(self._pairs) > self.max_pairs:
+            self._pairs.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop every cached artifact."""
+        self._slots.clear()
+        self._pairs.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and sizes."""
+        return {
+            "slots": len(self._slots),
+            "slot_hits": self.slot_hits,
+            "slot_misses": self.slot_misses,
+            "pairs": len(self._pairs),
+            "pair_hits": self.pair_hits,
+            "pair_misses": self.pair_misses,
+        }
+
+
+_analysis_cache: Optional[TeamAnalysisCache] = None
+
+
+def get_team_analysis_cache() -> TeamAnalysisCache:
+    """The process-wide team analysis cache."""
+    global _analysis_cache
+    if _analysis_cache is None:
+        _analysis_cache = TeamAnalysisCache()
+    return _analysis_cache
+
+
+def reset_team_analysis_cache() -> None:
+    """Reset the shared cache (useful for testing)."""
+    global _analysis_cache
+    _analysis_cache = None
@@ -1,12 +1,17 @@
 """Core builder for team composition suggestions."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from ..models.team import Team
 from ..models.pokemon import PokemonBuild
 from ..api.smogon import SmogonStatsClient
 from ..calc.modifiers import get_type_effectiveness
+from .analysis_cache import get_team_analysis_cache
+
+if TYPE_CHECKING:
+    from ..api.pokeapi import PokeAPIClient
+    from .teammate_matrix import TeamFill
 
 
 @dataclass
@@ -211,54 +216,13 @@ async def find_popular_cores(
     Returns:
         List of popular cores with usage data
     """
-    # Get overall usage stats to find top Pokemon
-    stats = await smogon_client.get_usage_stats()
+    from .teammate_matrix import get_teammate_matrix
 
-    if not stats or "data" not in stats:
+    matrix = await get_teammate_matrix(smogon_client)
+    if matrix is None:
         return []
 
-    # Get top 20 Pokemon by usage
-    pokemon_usage = []
-    for name, data in stats["data"].items():
-        usage = data.get("usage", 0) * 100
-        if usage >= 5:  # At least 5% usage
-            pokemon_usage.append((name, usage))
-
-    pokemon_usage.sort(key=lambda x: -x[1])
-    top_pokemon = pokemon_usage[:20]
-
-    cores = []
-
-    # For each top Pokemon, find its best partners
-    for pokemon_name, usage in top_pokemon[:10]:
-        teammates_data = await smogon_client.suggest_teammates(pokemon_name, limit=5)
-
-        if not teammates_data:
-            continue
-
-        for teammate in teammates_data["suggested_teammates"][:3]:
-            mate_name = teammate["name"]
-            mate_usage = teammate["usage_with"]
-
-            # Avoid duplicates
-            core_key = tuple(sorted([pokemon_name.lower(), mate_name.lower()]))
-
-            existing_keys = [tuple(sorted([c["pokemon"][0].lower(), c["pokemon"][1].lower()]))
-                            for c in cores]
-            if core_key in existing_keys:
-                continue
-
-            cores.append({
-                "pokemon": [pokemon_name, mate_name],
-                "pairing_rate": mate_usage,
-                "primary_usage": usage,
-                "roles": get_pokemon_role(pokemon_name) + get_pokemon_role(mate_name)
-            })
-
-    # Sort by pairing rate
-    cores.sort(key=lambda x: x["pairing_rate"], reverse=True)
-
-    return cores[:limit]
+    return matrix.top_cores(top=10, partners=3)[:limit]
 
 
 def analyze_core_synergy(team: Team) -> CoreAnalysis:
@@ -286,12 +250,15 @@ def analyze_core_synergy(team: Team) -> CoreAnalysis:
                  "Fighting", "Poison", "Ground", "Flying", "Psychic", "Bug",
                  "Rock", "Ghost", "Dragon", "Dark", "Steel", "Fairy"]
 
+    cache = get_team_analysis_cache()
+    type_vectors = [cache.slot(slot.pokemon).effectiveness for slot in team.slots]
+
     for attack_type in all_types:
         resist_count = 0
         weak_count = 0
 
-        for slot in team.slots:
-            eff = get_type_effectiveness(attack_type, slot.pokemon.types)
+        for effectiveness in type_vectors:
+            eff = effectiveness[attack_type]
             if eff <= 0.5:
                 resist_count += 1
             elif eff >= 2.0:
@@ -358,18 +325,28 @@ def analyze_core_synergy(team: Team) -> CoreAnalysis:
     )
 
 
+def _team_members(team: Team) -> list[tuple[str, list[str]]]:
+    return [(slot.pokemon.name, slot.pokemon.types) for slot in team.slots]
+
+
 async def complete_team(
     team: Team,
     smogon_client: SmogonStatsClient,
-    limit: int = 5
+    limit: int = 5,
+    pokeapi: Optional["PokeAPIClient"] = None
 ) -> list[CoreSuggestion]:
     """
     Suggest Pokemon to complete an incomplete team.
 
+    Every candidate is scored against all current members in one pass over
+    the month's teammate matrix.
+
     Args:
         team: Current partial team
         smogon_client: Smogon stats client
         limit: Number of suggestions per slot
+        pokeapi: Optional PokeAPI client, used once per month to type the
+                 candidate pool so coverage counts towards the score
 
     Returns:
         List of suggestions for remaining slots
@@ -377,40 +354,74 @@ async def complete_team(
     if team.is_full:
         return []
 
-    current_pokemon = team.get_pokemon_names()
-    all_suggestions = []
-
-    # Get suggestions based on each team member
-    for name in current_pokemon:
-        suggestions = await suggest_partners(
-            name,
-            smogon_client,
-            existing_team=team,
-            limit=limit * 2
-        )
-        all_suggestions.extend(suggestions)
-
-    # Deduplicate and rank
-    seen = set()
-    unique_suggestions = []
-
-    for suggestion in all_suggestions:
-        key = suggestion.pokemon_name.lower()
-        if key not in seen and key not in [n.lower() for n in current_pokemon]:
-            seen.add(key)
-            unique_suggestions.append(suggestion)
-
-    # Sort by how many team members suggest this Pokemon (more = better fit)
-    name_counts = {}
-    for suggestion in all_suggestions:
-        name = suggestion.pokemon_name.lower()
-        name_counts[name] = name_counts.get(name, 0) + 1
-
-    # Adjust scores based on how many teammates suggest them
-    for suggestion in unique_suggestions:
-        count = name_counts.get(suggestion.pokemon_name.lower(), 1)
-        suggestion.synergy_score += (count - 1) * 10  # Bonus for multiple teammates suggesting
-
-    unique_suggestions.sort(key=lambda x: x.synergy_score, reverse=True)
-
-    return unique_suggestions[:limit]
+    from .teammate_matrix import get_teammate_matrix
+
+    matrix = await get_teammate_matrix(smogon_client)
+    if matrix is None:
+        return []
+    if pokeapi is not None:
+        await matrix.load_types(pokeapi)
+
+    suggestions = []
+    for candidate in matrix.score_candidates(_team_members(team))[:limit]:
+        reasons = []
+        correlation = candidate.usage_correlation
+        if correlation >= 30:
+            reasons.append(f"Strong meta pairing ({correlation:.1f}% usage together)")
+        elif correlation >= 15:
+            reasons.append(f"Common pairing ({correlation:.1f}% usage together)")
+        if candidate.roles_added:
+            reasons.append(f"Provides: {', '.join(candidate.roles_added)}")
+        for role in candidate.roles_overlapping:
+            reasons.append(f"Note: Overlapping {role}")
+        if candidate.covers_weaknesses:
+            reasons.append(f"Covers: {', '.join(candidate.covers_weaknesses)}")
+
+        suggestions.append(CoreSuggestion(
+            pokemon_name=matrix.species[candidate.index],
+            synergy_score=candidate.score,
+            reasons=reasons,
+            usage_correlation=correlation,
+            covers_weaknesses=candidate.covers_weaknesses
+        ))
+
+    return suggestions
+
+
+async def suggest_team_fills(
+    team: Team,
+    smogon_client: SmogonStatsClient,
+    pokeapi: Optional["PokeAPIClient"] = None,
+    beam_width: int = 8,
+    limit: int = 3
+) -> list["TeamFill"]:
+    """
+    Propose complete sets of Pokemon for every open slot.
+
+    Args:
+        team: Current partial team
+        smogon_client: Smogon stats client
+        pokeapi: Optional PokeAPI client for candidate typings
+        beam_width: Partial teams kept after each slot is filled
+        limit: Number of complete fills to return
+
+    Returns:
+        Complete fills ranked by combined synergy, role and coverage score
+    """
+    if team.is_full:
+        return []
+
+    from .teammate_matrix import get_teammate_matrix
+
+    matrix = await get_teammate_matrix(smogon_client)
+    if matrix is None:
+        return []
+    if pokeapi is not None:
+        await matrix.load_types(pokeapi)
+
+    return matrix.beam_search(
+        _team_members(team),
+        slots=6 - team.size,
+        beam_width=beam_width,
+        limit=limit,
+    )
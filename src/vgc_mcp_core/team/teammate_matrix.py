@@ -0,0 +1,393 @@
+"""Teammate co-occurrence matrix and beam-search team completion.
+
+Built once per usage month from a Smogon chaos snapshot: a dense
+species x species matrix of how often two Pokemon share a team, plus
+per-species role, type-weakness and type-resistance bitmasks. Completing a
+team then scores candidates incrementally against the matrix instead of
+fetching teammate data once per team member.
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from ..api.smogon import FORM_ALIASES, UsageSnapshot, _normalize_species_key
+from ..calc.modifiers import get_type_effectiveness
+from .analysis import ALL_TYPES
+from .core_builder import POKEMON_ROLES, get_pokemon_role
+
+if TYPE_CHECKING:
+    from ..api.pokeapi import PokeAPIClient
+    from ..api.smogon import SmogonStatsClient
+
+
+# Species kept in the matrix (by usage); the tail of a month's ladder is noise
+MATRIX_SIZE = 150
+# Candidates considered for each open slot, by usage
+DEFAULT_POOL = 60
+# Extra candidates pulled in per team member from its strongest partners
+PARTNERS_PER_MEMBER = 30
+DEFAULT_BEAM_WIDTH = 8
+MAX_CACHED_MATRICES = 4
+
+# Scoring weights (same scale as suggest_partners and get_type_synergy)
+USAGE_WEIGHT = 0.5
+ROLE_BONUS = 5.0
+ROLE_OVERLAP_PENALTY = 3.0
+COVER_BONUS = 2.0
+SHARED_WEAKNESS_PENALTY = 1.0
+
+ROLE_BITS = {role: 1 << i for i, role in enumerate(POKEMON_ROLES)}
+TYPE_BITS = {type_name: 1 << i for i, type_name in enumerate(ALL_TYPES)}
+# Multiple Fake Out users is sometimes fine, so it never counts as an overlap
+_OVERLAP_EXEMPT = ROLE_BITS["fake_out"]
+_RESTRICTED = ROLE_BITS["restricted"]
+
+
+def role_mask(pokemon_name: str) -> int:
+    """Bitmask of the POKEMON_ROLES a Pokemon fills."""
+    mask = 0
+    for role in get_pokemon_role(pokemon_name):
+        mask |= ROLE_BITS[role]
+    return mask
+
+
+def type_masks(types: list[str]) -> tuple[int, int]:
+    """(weak, resist) bitmasks over ALL_TYPES for a defensive typing.
+
+    Immunities count as resistances.
+    """
+    weak = resist = 0
+    for attack_type, bit in TYPE_BITS.items():
+        eff = get_type_effectiveness(attack_type, types)
+        if eff >= 2.0:
+            weak |= bit
+        elif eff <= 0.5:
+            resist |= bit
+    return weak, resist
+
+
+def mask_names(mask: int, bits: dict[str, int]) -> list[str]:
+    """Names whose bit is set in mask, in bit order."""
+    return [name for name, bit in bits.items() if mask & bit]
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def _base_species(pokemon_name: str) -> str:
+    # Same split as PokemonBuild.species, for the species clause
+    return pokemon_name.lower().split("-")[0]
+
+
+@dataclass(frozen=True)
+class _Partial:
+    """A partially filled team in the beam."""
+    anchors: tuple[int, ...]  # matrix indices of every member with usage data
+    additions: tuple[int, ...]
+    species: frozenset[str]  # base species already on the team
+    score: float
+    synergy: float  # summed pairwise co-occurrence of the additions
+    roles: int
+    weak: int  # types at least one member is weak to
+    resist: int  # types at least one member resists
+
+
+@dataclass
+class TeamFill:
+    """A complete set of additions proposed for the open team slots."""
+    pokemon: list[str]
+    score: float
+    pair_synergy: float  # Summed co-occurrence % of each addition with the team
+    roles_added: list[str]
+    uncovered_weaknesses: list[str]  # Types the completed team is weak to with no resist
+
+
+@dataclass
+class CandidateScore:
+    """Marginal value of adding one Pokemon to a partial team."""
+    index: int
+    score: float
+    usage_correlation: float  # Mean co-occurrence % with current members
+    roles_added: list[str]
+    roles_overlapping: list[str]
+    covers_weaknesses: list[str]
+
+
+@dataclass
+class TeammateMatrix:
+    """Dense teammate co-occurrence for the top species of one usage month."""
+    format_name: str
+    rating: int
+    month: str
+    species: list[str]  # chaos names, highest usage first
+    usage: list[float]  # usage %
+    # co[i][j]: share of species i's teammate weight that goes to species j (%)
+    co: list[list[float]]
+    # pair[i][j]: symmetric co-occurrence, mean of co[i][j] and co[j][i]
+    pair: list[list[float]]
+    roles: list[int]
+    base: list[str] = field(default_factory=list)
+    weak: list[int] = field(default_factory=list)
+    resist: list[int] = field(default_factory=list)
+    typed: list[bool] = field(default_factory=list)
+    index: dict[str, int] = field(default_factory=dict)
+    # Leading species already sent to PokeAPI for typings
+    types_requested: int = 0
+
+    @classmethod
+    def from_snapshot(cls, snapshot: UsageSnapshot, size: int = MATRIX_SIZE) -> "TeammateMatrix":
+        """Build the matrix from a usage snapshot (CPU-bound; run off the loop)."""
+        data = snapshot.data.get("data", {})
+        species = snapshot.ranking[:size]
+        position = {name: i for i, name in enumerate(species)}
+        n = len(species)
+
+        co = [[0.0] * n for _ in range(n)]
+        for i, name in enumerate(species):
+            teammates = data[name].get("Teammates", {})
+            total = sum(v for v in teammates.values() if v > 0) or 1
+            row = co[i]
+            for mate, weight in teammates.items():
+                j = position.get(mate)
+                if j is not None and j != i and weight > 0:
+                    row[j] = weight / total * 100
+
+        pair = [[(co[i][j] + co[j][i]) / 2 for j in range(n)] for i in range(n)]
+
+        return cls(
+            format_name=snapshot.format_name,
+            rating=snapshot.rating,
+            month=snapshot.month,
+            species=species,
+            usage=[data[name].get("usage", 0) * 100 for name in species],
+            co=co,
+            pair=pair,
+            roles=[role_mask(name) for name in species],
+            base=[_base_species(name) for name in species],
+            weak=[0] * n,
+            resist=[0] * n,
+            typed=[False] * n,
+            index={_normalize_species_key(name): i for i, name in enumerate(species)},
+        )
+
+    def __len__(self) -> int:
+        return len(self.species)
+
+    def lookup(self, pokemon_name: str) -> Optional[int]:
+        """Matrix index for a Pokemon name in any spelling, or None."""
+        name = FORM_ALIASES.get(pokemon_name.lower().replace(" ", "-"), pokemon_name)
+        return self.index.get(_normalize_species_key(name))
+
+    def set_types(self, i: int, types: list[str]) -> None:
+        """Record a species' typing so it can contribute to coverage scoring."""
+        self.weak[i], self.resist[i] = type_masks(types)
+        self.typed[i] = True
+
+    async def load_types(self, pokeapi: "PokeAPIClient", count: int = DEFAULT_POOL) -> None:
+        """Fetch typings for the top `count` species that don't have one yet.
+
+        Done once per matrix; species PokeAPI can't resolve are left untyped
+        and simply don't score coverage.
+        """
+        count = min(count, len(self))
+        missing = [i for i in range(self.types_requested, count) if not self.typed[i]]
+        self.types_requested = max(self.types_requested, count)
+        if not missing:
+            return
+        results = await asyncio.gather(
+            *(pokeapi.get_pokemon_types(self.species[i].lower().replace(" ", "-"))
+              for i in missing),
+            return_exceptions=True,
+        )
+        for i, types in zip(missing, results):
+            if isinstance(types, list) and types:
+                self.set_types(i, types)
+
+    def top_cores(self, top: int = 10, partners: int = 3, min_usage: float = 5.0) -> list[dict]:
+        """Strongest partners of the most used species, one entry per pair."""
+        cores = []
+        seen = set()
+        leaders = [i for i in range(len(self)) if self.usage[i] >= min_usage][:top]
+        for i in leaders:
+            row = self.co[i]
+            best = sorted((j for j in range(len(self)) if row[j] > 0), key=lambda j: -row[j])
+            for j in best[:partners]:
+                key = (min(i, j), max(i, j))
+                if key in seen:
+                    continue
+                seen.add(key)
+                cores.append({
+                    "pokemon": [self.species[i], self.species[j]],
+                    "pairing_rate": round(row[j], 1),
+                    "primary_usage": self.usage[i],
+                    "roles": get_pokemon_role(self.species[i]) + get_pokemon_role(self.species[j]),
+                })
+        cores.sort(key=lambda c: c["pairing_rate"], reverse=True)
+        return cores
+
+    def start(self, team: list[tuple[str, list[str]]]) -> _Partial:
+        """Beam root for the current team, given (name, types) per member."""
+        anchors = []
+        species = set()
+        roles = weak = resist = 0
+        for name, types in team:
+            i = self.lookup(name)
+            if i is not None:
+                anchors.append(i)
+                species.add(self.base[i])
+            species.add(_base_species(name))
+            roles |= role_mask(name)
+            member_weak, member_resist = type_masks(types)
+            weak |= member_weak
+            resist |= member_resist
+        return _Partial(tuple(anchors), (), frozenset(species), 0.0, 0.0, roles, weak, resist)
+
+    def candidates(self, state: _Partial, pool: int = DEFAULT_POOL) -> list[int]:
+        """Top-usage species plus each member's strongest partners, minus the team.
+
+        Other forms of a species already on the team are excluded (species clause).
+        """
+        chosen = set(range(min(pool, len(self))))
+        for i in state.anchors:
+            row = self.co[i]
+            chosen.update(sorted(range(len(self)), key=lambda j: -row[j])[:PARTNERS_PER_MEMBER])
+        chosen = {c for c in chosen if self.base[c] not in state.species}
+        if state.roles & _RESTRICTED:
+            chosen = {c for c in chosen if not self.roles[c] & _RESTRICTED}
+        return sorted(chosen)
+
+    def _gain(self, state: _Partial, c: int) -> tuple[float, float]:
+        """(score gain, synergy gain) of adding candidate c to state."""
+        pair = self.pair[c]
+        synergy = sum(pair[m] for m in state.anchors)
+        gain = synergy * USAGE_WEIGHT
+
+        roles = self.roles[c]
+        gain += ROLE_BONUS * _popcount(roles & ~state.roles)
+        gain -= ROLE_OVERLAP_PENALTY * _popcount(roles & state.roles & ~_OVERLAP_EXEMPT)
+
+        if self.typed[c]:
+            uncovered = state.weak & ~state.resist
+            gain += COVER_BONUS * _popcount(uncovered & self.resist[c])
+            gain -= SHARED_WEAKNESS_PENALTY * _popcount(uncovered & self.weak[c])
+        return gain, synergy
+
+    def _extend(self, state: _Partial, c: int) -> _Partial:
+        gain, synergy = self._gain(state, c)
+        return _Partial(
+            anchors=state.anchors + (c,),
+            additions=state.additions + (c,),
+            species=state.species | {self.base[c]},
+            score=state.score + gain,
+            synergy=state.synergy + synergy,
+            roles=state.roles | self.roles[c],
+            weak=state.weak | self.weak[c],
+            resist=state.resist | self.resist[c],
+        )
+
+    def score_candidates(
+        self,
+        team: list[tuple[str, list[str]]],
+        pool: int = DEFAULT_POOL,
+    ) -> list[CandidateScore]:
+        """Marginal value of every candidate against the current team, best first."""
+        state = self.start(team)
+        uncovered = state.weak & ~state.resist
+        scored = []
+        for c in self.candidates(state, pool):
+            gain, _ = self._gain(state, c)
+            roles = self.roles[c]
+            correlation = (
+                sum(self.co[m][c] for m in state.anchors) / len(state.anchors)
+                if state.anchors else 0.0
+            )
+            scored.append(CandidateScore(
+                index=c,
+                score=gain,
+                usage_correlation=round(correlation, 1),
+                roles_added=mask_names(roles & ~state.roles, ROLE_BITS),
+                roles_overlapping=mask_names(roles & state.roles & ~_OVERLAP_EXEMPT, ROLE_BITS),
+                covers_weaknesses=mask_names(uncovered & self.resist[c], TYPE_BITS),
+            ))
+        scored.sort(key=lambda s: s.score, reverse=True)
+        return scored
+
+    def beam_search(
+        self,
+        team: list[tuple[str, list[str]]],
+        slots: int,
+        beam_width: int = DEFAULT_BEAM_WIDTH,
+        pool: int = DEFAULT_POOL,
+        limit: int = 3,
+    ) -> list[TeamFill]:
+        """Propose complete fills for `slots` open slots, best first.
+
+        Each step extends every partial team in the beam by one candidate,
+        scoring only the marginal gain against the members already chosen,
+        and keeps the `beam_width` best distinct partial teams. Fills respect
+        the species clause and allow at most one restricted Pokemon.
+        """
+        root = self.start(team)
+        pool_indices = self.candidates(root, pool)
+        beam = [root]
+        for _ in range(slots):
+            expanded: dict[frozenset, _Partial] = {}
+            for state in beam:
+                for c in pool_indices:
+                    if self.base[c] in state.species:
+                        continue
+                    if state.roles & self.roles[c] & _RESTRICTED:
+                        continue
+                    key = frozenset(state.additions + (c,))
+                    child = self._extend(state, c)
+                    current = expanded.get(key)
+                    if current is None or child.score > current.score:
+                        expanded[key] = child
+            if not expanded:
+                break
+            beam = sorted(expanded.values(), key=lambda s: s.score, reverse=True)[:beam_width]
+
+        return [
+            TeamFill(
+                pokemon=[self.species[i] for i in state.additions],
+                score=round(state.score, 1),
+                pair_synergy=round(state.synergy, 1),
+                roles_added=mask_names(state.roles & ~root.roles, ROLE_BITS),
+                uncovered_weaknesses=mask_names(state.weak & ~state.resist, TYPE_BITS),
+            )
+            for state in beam[:limit]
+            if state.additions
+        ]
+
+
+_matrices: "OrderedDict[tuple[str, int, str], TeammateMatrix]" = OrderedDict()
+
+
+async def get_teammate_matrix(
+    smogon_client: "SmogonStatsClient",
+    format_name: Optional[str] = None,
+    rating: int = 0,
+) -> Optional[TeammateMatrix]:
+    """Teammate matrix for the current usage month, built once per month."""
+    snapshot = await smogon_client.get_usage_snapshot(format_name, rating)
+    if snapshot is None:
+        return None
+
+    key = (snapshot.format_name, snapshot.rating, snapshot.month)
+    matrix = _matrices.get(key)
+    if matrix is None:
+        matrix = await asyncio.to_thread(TeammateMatrix.from_snapshot, snapshot)
+        _matrices[key] = matrix
+        while len(_matrices) > MAX_CACHED_MATRICES:
+            _matrices.popitem(last=False)
+    else:
+        _matrices.move_to_end(key)
+    return matrix
+
+
+def reset_teammate_matrices() -> None:
+    """Drop every cached matrix (for tests and data refreshes)."""
+    _matrices.clear()
@@ -1,7 +1,14 @@
 """Utility modules for VGC MCP server."""
 
 from .errors import error_response, success_response, ToolError
-from .fuzzy import suggest_pokemon_name, suggest_nature, suggest_move_name
+from .fuzzy import (
+    suggest_pokemon_name,
+    suggest_nature,
+    suggest_move_name,
+    suggest_ability_name,
+    suggest_item_name,
+)
+from .name_index import NameIndex, NameResolver, get_name_resolver, to_id
 from .damage_verdicts import calculate_ko_verdict, format_matchup_verdict, DamageVerdict
 from .synergies import (
     get_synergy_ability,
@@ -26,6 +33,12 @@ __all__ = [
     "suggest_pokemon_name",
     "suggest_nature",
     "suggest_move_name",
+    "suggest_ability_name",
+    "suggest_item_name",
+    "NameIndex",
+    "NameResolver",
+    "get_name_resolver",
+    "to_id",
     "calculate_ko_verdict",
     "format_matchup_verdict",
     "DamageVerdict",
@@ -4,6 +4,7 @@ This module provides mathematically correct KO analysis descriptions,
 avoiding misleading statements like "clean 2HKO" when the math doesn't add up.
 """
 
+from collections import Counter
 from dataclasses import dataclass
 from typing import Optional
 
@@ -32,6 +33,20 @@ class KOProbability:
     total_combinations: int = 16  # 16 for single-hit, 16^n for multi-hit
 
 
+def _convolve_counts(roll_counts: Counter[int], hits: int) -> list[Counter[int]]:
+    """Distribution of summed damage (total -> ways) after 1..hits hits."""
+    totals: Counter[int] = Counter({0: 1})
+    by_hits = []
+    for _ in range(hits):
+        next_totals: Counter[int] = Counter()
+        for total, ways in totals.items():
+            for damage, count in roll_counts.items():
+                next_totals[total + damage] += ways * count
+        totals = next_totals
+        by_hits.append(totals)
+    return by_hits
+
+
 def calculate_ko_probability(
     damage_rolls: list[int],
     defender_hp: int,
@@ -60,37 +75,26 @@ def calculate_ko_probability(
 
     # OHKO: Count rolls that deal >= HP
     ohko_count = sum(1 for r in damage_rolls if r >= defender_hp)
-    ohko_chance = (ohko_count / n_rolls) * 100
-
-    # 2HKO: Check all 256 combinations (16 x 16)
-    twohko_count = 0
-    for r1 in damage_rolls:
-        for r2 in damage_rolls:
-            if r1 + r2 >= defender_hp:
-                twohko_count += 1
-    twohko_chance = (twohko_count / (n_rolls ** 2)) * 100
-
-    # 3HKO: Check all 4096 combinations (16^3)
-    threehko_count = 0
-    for r1 in damage_rolls:
-        for r2 in damage_rolls:
-            for r3 in damage_rolls:
-                if r1 + r2 + r3 >= defender_hp:
-                    threehko_count += 1
-    threehko_chance = (threehko_count / (n_rolls ** 3)) * 100
-
-    # 4HKO: Check all 65536 combinations (16^4)
-    fourhko_count = 0
-    for r1 in damage_rolls:
-        for r2 in damage_rolls:
-            for r3 in damage_rolls:
-                for r4 in damage_rolls:
-                    if r1 + r2 + r3 + r4 >= defender_hp:
-                        fourhko_count += 1
-    fourhko_chance = (fourhko_count / (n_rolls ** 4)) * 100
 
-    # Determine guaranteed KO (using minimum roll)
+    # 2HKO-4HKO: convolve the roll distribution with itself. Equivalent to
+    # checking all 16^n roll combinations, but only over distinct totals.
+    # Hit counts where every or no combination KOs are settled by the min/max
+    # roll, so the convolution stops after the last undecided hit count.
     min_damage = min(damage_rolls)
+    max_damage = max(damage_rolls)
+    chances = [100.0 if min_damage * hits >= defender_hp else 0.0 for hits in range(1, 5)]
+    undecided = [
+        hits for hits in range(1, 5)
+        if min_damage * hits < defender_hp <= max_damage * hits
+    ]
+    if undecided:
+        totals = _convolve_counts(Counter(damage_rolls), undecided[-1])
+        for hits in undecided:
+            ko_ways = sum(ways for total, ways in totals[hits - 1].items() if total >= defender_hp)
+            chances[hits - 1] = (ko_ways / (n_rolls ** hits)) * 100
+    ohko_chance, twohko_chance, threehko_chance, fourhko_chance = chances
+
+    # Determine guaranteed KO (using minimum roll)
     guaranteed_ko = None
     if min_damage >= defender_hp:
         guaranteed_ko = 1
@@ -136,16 +140,17 @@ def calculate_multi_hit_ko_probability(
     Returns:
         KOProbability with exact percentages
     """
-    from itertools import product
-
-    combos_that_ko = 0
     total_combos = len(damages_per_hit) ** hit_count
 
-    # Generate all possible damage combinations
-    for combo in product(damages_per_hit, repeat=hit_count):
-        total_damage = sum(combo)
-        if total_damage >= defender_hp:
-            combos_that_ko += 1
+    # Count KOing combinations by convolving the per-hit distribution rather
+    # than enumerating all 16^hit_count rolls
+    if min(damages_per_hit) * hit_count >= defender_hp:
+        combos_that_ko = total_combos
+    elif max(damages_per_hit) * hit_count < defender_hp:
+        combos_that_ko = 0
+    else:
+        totals = _convolve_counts(Counter(damages_per_hit), hit_count)[-1]
+        combos_that_ko = sum(ways for total, ways in totals.items() if total >= defender_hp)
 
     ohko_chance = (combos_that_ko / total_combos) * 100
 
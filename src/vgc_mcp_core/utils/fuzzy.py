@@ -1,16 +1,14 @@
-"""Fuzzy matching utilities for Pokemon names, moves, and natures.
+"""Fuzzy matching utilities for Pokemon names, moves, abilities, items and natures.
 
-Provides "Did you mean...?" suggestions for typos and misspellings.
+Provides "Did you mean...?" suggestions for typos and misspellings, backed by
+the shared name index (see name_index.py). Before the full PokeAPI name lists
+are loaded, suggestions come from the seed lists below.
 """
 
-from difflib import get_close_matches
-from typing import Optional
+from .name_index import get_name_resolver
 
-from ..models.pokemon import Nature
 
-
-# Common Pokemon names for fuzzy matching
-# This is a subset of popular VGC Pokemon - can be expanded
+# Popular VGC Pokemon, used to seed the name index before the full dex loads
 COMMON_POKEMON = [
     # Restricted Pokemon
     "koraidon", "miraidon", "calyrex-shadow", "calyrex-ice", "zacian",
@@ -48,7 +46,7 @@ COMMON_POKEMON = [
     "rotom-heat", "rotom", "clefable", "ditto", "smeargle",
 ]
 
-# Common move names for fuzzy matching
+# Common move names, used to seed the name index before the full list loads
 COMMON_MOVES = [
     # Physical
     "close-combat", "earthquake", "rock-slide", "iron-head", "play-rough",
@@ -99,38 +97,7 @@ def suggest_pokemon_name(
         >>> suggest_pokemon_name("landorus therian")
         ['landorus-therian']
     """
-    # Normalize input
-    normalized = input_name.lower().strip()
-
-    # Try direct normalization first (spaces -> hyphens)
-    hyphenated = normalized.replace(" ", "-")
-    if hyphenated in COMMON_POKEMON:
-        return [hyphenated]
-
-    # Try without hyphens
-    dehyphenated = normalized.replace("-", "")
-    for pokemon in COMMON_POKEMON:
-        if pokemon.replace("-", "") == dehyphenated:
-            return [pokemon]
-
-    # Use fuzzy matching
-    matches = get_close_matches(
-        normalized,
-        COMMON_POKEMON,
-        n=max_suggestions,
-        cutoff=cutoff
-    )
-
-    # Also try matching against hyphenated version
-    if not matches:
-        matches = get_close_matches(
-            hyphenated,
-            COMMON_POKEMON,
-            n=max_suggestions,
-            cutoff=cutoff
-        )
-
-    return matches
+    return get_name_resolver().suggest("pokemon", input_name, max_suggestions, cutoff)
 
 
 def suggest_nature(
@@ -153,19 +120,7 @@ def suggest_nature(
         >>> suggest_nature("timmid")
         ['timid']
     """
-    valid_natures = [n.value for n in Nature]
-    normalized = input_nature.lower().strip()
-
-    # Direct match check
-    if normalized in valid_natures:
-        return [normalized]
-
-    return get_close_matches(
-        normalized,
-        valid_natures,
-        n=max_suggestions,
-        cutoff=0.6
-    )
+    return get_name_resolver().suggest("nature", input_nature, max_suggestions)
 
 
 def suggest_move_name(
@@ -190,36 +145,37 @@ def suggest_move_name(
         >>> suggest_move_name("close combat")
         ['close-combat']
     """
-    normalized = input_move.lower().strip()
-
-    # Try hyphenated version first
-    hyphenated = normalized.replace(" ", "-")
-    if hyphenated in COMMON_MOVES:
-        return [hyphenated]
-
-    # Try without hyphens
-    dehyphenated = normalized.replace("-", "").replace(" ", "")
-    for move in COMMON_MOVES:
-        if move.replace("-", "") == dehyphenated:
-            return [move]
-
-    # Fuzzy match
-    matches = get_close_matches(
-        normalized,
-        COMMON_MOVES,
-        n=max_suggestions,
-        cutoff=cutoff
-    )
-
-    if not matches:
-        matches = get_close_matches(
-            hyphenated,
-            COMMON_MOVES,
-            n=max_suggestions,
-            cutoff=cutoff
-        )
-
-    return matches
+    return get_name_resolver().suggest("move", input_move, max_suggestions, cutoff)
+
+
+def suggest_ability_name(
+    input_ability: str,
+    max_suggestions: int = 3,
+    cutoff: float = 0.6
+) -> list[str]:
+    """
+    Find similar ability names for typo correction.
+
+    Example:
+        >>> suggest_ability_name("intimidat")
+        ['intimidate']
+    """
+    return get_name_resolver().suggest("ability", input_ability, max_suggestions, cutoff)
+
+
+def suggest_item_name(
+    input_item: str,
+    max_suggestions: int = 3,
+    cutoff: float = 0.6
+) -> list[str]:
+    """
+    Find similar item names for typo correction.
+
+    Example:
+        >>> suggest_item_name("boosterenergy")
+        ['booster-energy']
+    """
+    return get_name_resolver().suggest("item", input_item, max_suggestions, cutoff)
 
 
 def format_suggestions(suggestions: list[str], prefix: str = "Did you mean") -> str:
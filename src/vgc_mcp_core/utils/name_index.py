@@ -0,0 +1,265 @@
+"""Name resolution index for Pokemon, moves, abilities, items and natures.
+
+Every name is keyed by its Showdown-style id (lowercase ASCII letters and
+digits only), so "Flutter Mane", "flutter-mane" and Smogon's "fluttermane"
+all hit the same entry, and aliases ("Indeedee-F", "Landorus") map onto the
+PokeAPI spelling. Exact lookups are one dict access.
+
+"Did you mean" suggestions come from a trigram index: names sharing the most
+trigrams with the query are shortlisted, then ranked by difflib similarity,
+so a typo only ever compares against a couple of dozen names rather than the
+whole dex.
+
+The process-wide resolver starts seeded from the local tables and is
+completed with the full PokeAPI name lists by
+``PokeAPIClient.load_name_index``. Once a kind is complete, unknown names of
+that kind can be rejected (with suggestions) before any network fetch.
+"""
+
+import heapq
+import unicodedata
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Iterable, Optional
+
+KINDS = ("pokemon", "move", "ability", "item", "nature")
+
+# Candidates re-ranked with difflib per suggestion
+SHORTLIST_SIZE = 24
+
+
+@lru_cache(maxsize=4096)
+def to_id(name: str) -> str:
+    """Showdown-style id: "Farfetch'd" -> "farfetchd", "Flabébé" -> "flabebe"."""
+    if not name:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", name.lower())
+    return "".join(c for c in decomposed if c.isascii() and c.isalnum())
+
+
+def _trigrams(name_id: str) -> set[str]:
+    padded = f"  {name_id} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Exact and fuzzy lookup over the names of one kind of entity."""
+
+    def __init__(self, kind: str, names: Iterable[str] = ()):
+        self.kind = kind
+        self.complete = False  # True once loaded from a full upstream list
+        self._names: dict[str, str] = {}    # id -> canonical name
+        self._aliases: dict[str, str] = {}  # id -> canonical name
+        self._grams: dict[str, set[str]] = {}  # trigram -> ids
+        self._gram_counts: dict[str, int] = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return self.resolve(name) is not None
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._names.values())
+
+    def add(self, name: str, aliases: Iterable[str] = ()) -> None:
+        """Add a canonical name (and optional alternate spellings of it)."""
+        key = to_id(name)
+        if key:
+            if key not in self._names:
+                self._index_grams(key)
+            self._names[key] = name
+            self._aliases.pop(key, None)
+        for alias in aliases:
+            self.add_alias(alias, name)
+
+    def add_alias(self, alias: str, name: str, suggestible: bool = False) -> None:
+        """Map an alternate spelling onto a canonical name.
+
+        Aliases never shadow a canonical name with the same id. A suggestible
+        alias is also matched by typos, which suggest its canonical name.
+        """
+        key = to_id(alias)
+        if key and key not in self._names:
+            self._aliases[key] = name
+            if suggestible and key not in self._gram_counts:
+                self._index_grams(key)
+
+    def _index_grams(self, key: str) -> None:
+        grams = _trigrams(key)
+        for gram in grams:
+            self._grams.setdefault(gram, set()).add(key)
+        self._gram_counts[key] = len(grams)
+
+    def discard(self, name: str) -> None:
+        """Remove a canonical name if present."""
+        key = to_id(name)
+        if self._names.pop(key, None) is None:
+            return
+        for gram in _trigrams(key):
+            ids = self._grams.get(gram)
+            if ids is not None:
+                ids.discard(key)
+                if not ids:
+                    del self._grams[gram]
+        del self._gram_counts[key]
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Canonical name for any known spelling, or None."""
+        key = to_id(name)
+        return self._names.get(key) or self._aliases.get(key)
+
+    def suggest(self, name: str, limit: int = 3, cutoff: float = 0.6) -> list[str]:
+        """Closest canonical names to a (possibly misspelled) name.
+
+        An exact or alias match is returned on its own.
+
+        Args:
+            name: Name to look up
+            limit: Maximum number of suggestions
+            cutoff: Minimum difflib similarity (0-1) between ids
+
+        Returns:
+            Canonical names, most similar first
+        """
+        key = to_id(name)
+        if not key:
+            return []
+        exact = self.resolve(name)
+        if exact is not None:
+            return [exact]
+
+        grams = _trigrams(key)
+        shared: Counter = Counter()
+        for gram in grams:
+            ids = self._grams.get(gram)
+            if ids:
+                shared.update(ids)
+        if not shared:
+            return []
+
+        # Dice coefficient on trigram sets picks the shortlist
+        size = len(grams)
+        shortlist = heapq.nlargest(
+            SHORTLIST_SIZE,
+            shared.items(),
+            key=lambda item: 2 * item[1] / (size + self._gram_counts[item[0]]),
+        )
+
+        scored = []
+        for candidate, _ in shortlist:
+            ratio = SequenceMatcher(None, key, candidate).ratio()
+            if ratio >= cutoff:
+                scored.append((-ratio, candidate))
+        scored.sort()
+        suggestions: list[str] = []
+        for _, candidate in scored:
+            # Suggestible aliases suggest the name they point at
+            name = self._names.get(candidate) or self._aliases[candidate]
+            if name not in suggestions:
+                suggestions.append(name)
+                if len(suggestions) == limit:
+                    break
+        return suggestions
+
+
+class NameResolver:
+    """One NameIndex per entity kind."""
+
+    def __init__(self):
+        self.indexes: dict[str, NameIndex] = {kind: NameIndex(kind) for kind in KINDS}
+
+    def index(self, kind: str) -> NameIndex:
+        try:
+            return self.indexes[kind]
+        except KeyError:
+            raise ValueError(f"Unknown name kind: {kind}") from None
+
+    def resolve(self, kind: str, name: str) -> Optional[str]:
+        return self.index(kind).resolve(name)
+
+    def suggest(
+        self, kind: str, name: str, limit: int = 3, cutoff: float = 0.6
+    ) -> list[str]:
+        return self.index(kind).suggest(name, limit=limit, cutoff=cutoff)
+
+    def load(self, kind: str, names: Iterable[str], complete: bool = True) -> int:
+        """Add a full upstream name list for a kind.
+
+        Returns:
+            Number of canonical names now indexed for the kind
+        """
+        index = self.index(kind)
+        for name in names:
+            index.add(name)
+        index.complete = index.complete or complete
+        return len(index)
+
+    def is_complete(self, kind: Optional[str] = None) -> bool:
+        """Whether a kind (or every kind) has been loaded from a full list."""
+        if kind is not None:
+            return self.index(kind).complete
+        return all(index.complete for index in self.indexes.values())
+
+
+def _seed(resolver: NameResolver) -> None:
+    """Populate from the local tables (imported here to avoid import cycles)."""
+    from ..api.pokeapi import POKEAPI_FORM_ALIASES
+    from ..api.smogon import FORM_ALIASES
+    from ..models.move import (
+        ALWAYS_CRIT_MOVES,
+        COMMON_SPREAD_MOVES,
+        MOVE_SECONDARY_EFFECTS,
+        MULTI_HIT_MOVES,
+        PRIORITY_MOVES,
+    )
+    from ..models.pokemon import Nature
+    from .fuzzy import COMMON_MOVES, COMMON_POKEMON
+    from .normalize import ABILITY_ALIASES, ITEM_ALIASES
+
+    pokemon = resolver.index("pokemon")
+    for name in POKEAPI_FORM_ALIASES.values():
+        pokemon.add(name)
+    for name in COMMON_POKEMON:
+        if name not in POKEAPI_FORM_ALIASES:
+            pokemon.add(name)
+    for alias, name in POKEAPI_FORM_ALIASES.items():
+        # Base names ("urshifu") are what users type, so typos of them suggest the form
+        pokemon.add_alias(alias, name, suggestible=True)
+    for name, smogon_name in FORM_ALIASES.items():
+        # Smogon's base-form spellings, pointed at the PokeAPI form
+        if pokemon.resolve(name) is None:
+            target = POKEAPI_FORM_ALIASES.get(smogon_name, smogon_name)
+            pokemon.add(target)
+            pokemon.add_alias(name, target)
+
+    moves = resolver.index("move")
+    for name in (
+        *COMMON_MOVES, *COMMON_SPREAD_MOVES, *MOVE_SECONDARY_EFFECTS, *MULTI_HIT_MOVES,
+        *ALWAYS_CRIT_MOVES, *PRIORITY_MOVES,
+    ):
+        moves.add(name)
+
+    for name in ABILITY_ALIASES.values():
+        resolver.index("ability").add(name)
+    for name in ITEM_ALIASES.values():
+        resolver.index("item").add(name)
+
+    resolver.load("nature", (nature.value for nature in Nature))
+
+
+_resolver: Optional[NameResolver] = None
+
+
+def get_name_resolver() -> NameResolver:
+    """The process-wide resolver, seeded from local tables on first use."""
+    global _resolver
+    if _resolver is None:
+        resolver = NameResolver()
+        _seed(resolver)
+        _resolver = resolver
+    return _resolver
@@ -1,8 +1,20 @@
 """Validation utilities for Pokemon data."""
 
-from .learnset import validate_moveset, get_learnable_moves
+from .learnset import (
+    validate_moveset,
+    validate_movesets,
+    get_learnable_moves,
+    load_learnsets,
+    find_learners,
+)
+from .learnset_index import LearnsetIndex, get_learnset_index
 
 __all__ = [
     "validate_moveset",
+    "validate_movesets",
     "get_learnable_moves",
+    "load_learnsets",
+    "find_learners",
+    "LearnsetIndex",
+    "get_learnset_index",
 ]
@@ -1,7 +1,10 @@
 """Move legality and learnset validation."""
 
-from typing import Optional
+import asyncio
 from dataclasses import dataclass
+from typing import Optional
+
+from .learnset_index import LearnsetIndex, get_learnset_index
 
 
 @dataclass
@@ -27,10 +30,73 @@ def normalize_move_name(move: str) -> str:
     return move.lower().replace(" ", "-").replace("'", "").strip()
 
 
+def _parse_learnset(data: dict) -> dict[str, list[str]]:
+    """Move -> learn methods from a PokeAPI pokemon payload (all versions)."""
+    moves = {}
+    for move_entry in data.get("moves", []):
+        methods = []
+        for version_detail in move_entry.get("version_group_details", []):
+            learn_method = version_detail.get("move_learn_method", {}).get("name", "")
+            if learn_method and learn_method not in methods:
+                methods.append(learn_method)
+        moves[move_entry["move"]["name"]] = methods
+    return moves
+
+
+async def _load_learnset(pokemon_name: str, pokeapi, index: LearnsetIndex) -> Optional[str]:
+    """Fetch a species' learnset into the index if needed; returns an error or None."""
+    if index.has_learnset(pokemon_name):
+        return None
+    try:
+        data = await pokeapi.get_pokemon(pokemon_name)
+    except Exception as e:
+        return str(e)
+    if not data:
+        return f"Pokemon not found: {pokemon_name}"
+    species = data.get("name", pokemon_name)
+    index.add_learnset(species, _parse_learnset(data))
+    index.add_alias(pokemon_name, species)
+    return None
+
+
+async def load_learnsets(
+    pokemon_names: list[str],
+    pokeapi,
+    index: Optional[LearnsetIndex] = None,
+    concurrency: int = 8,
+) -> dict[str, str]:
+    """
+    Fetch learnsets for many species concurrently (each unique species once).
+
+    Args:
+        pokemon_names: Species to load
+        pokeapi: PokeAPI client instance
+        index: Learnset index to fill (defaults to the shared one)
+        concurrency: Maximum simultaneous fetches
+
+    Returns:
+        Dict of species name -> error for species that failed to load
+    """
+    index = index or get_learnset_index()
+    semaphore = asyncio.Semaphore(concurrency)
+    pending = list(dict.fromkeys(
+        name.lower().replace(" ", "-") for name in pokemon_names
+        if name and not index.has_learnset(name)
+    ))
+
+    async def load(name: str) -> Optional[str]:
+        async with semaphore:
+            return await _load_learnset(name, pokeapi, index)
+
+    errors = await asyncio.gather(*(load(name) for name in pending))
+    return {name: error for name, error in zip(pending, errors) if error}
+
+
 async def get_learnable_moves(
     pokemon_name: str,
     pokeapi,
-    method: Optional[str] = None
+    method: Optional[str] = None,
+    index: Optional[LearnsetIndex] = None,
 ) -> dict:
     """
     Get all moves a Pokemon can learn.
@@ -39,35 +105,19 @@ async def get_learnable_moves(
         pokemon_name: Name of the Pokemon
         pokeapi: PokeAPI client instance
         method: Optional filter by learn method (level-up, machine, egg, tutor)
+        index: Learnset index to use (defaults to the shared one)
 
     Returns:
         Dict mapping move names to their learn methods
     """
+    index = index or get_learnset_index()
     try:
-        # Fetch Pokemon data which includes moves
         pokemon_name = pokemon_name.lower().replace(" ", "-")
-        data = await pokeapi._fetch(f"pokemon/{pokemon_name}")
-
-        if not data:
-            return {"error": f"Pokemon not found: {pokemon_name}"}
-
-        moves = {}
-        for move_entry in data.get("moves", []):
-            move_name = move_entry["move"]["name"]
-            methods = []
-
-            for version_detail in move_entry.get("version_group_details", []):
-                learn_method = version_detail.get("move_learn_method", {}).get("name", "")
-                if learn_method and learn_method not in methods:
-                    methods.append(learn_method)
-
-            # Filter by method if specified
-            if method:
-                if method.lower() in [m.lower() for m in methods]:
-                    moves[move_name] = methods
-            else:
-                moves[move_name] = methods
+        error = await _load_learnset(pokemon_name, pokeapi, index)
+        if error:
+            return {"error": error}
 
+        moves = index.learnset(pokemon_name, method)
         return {
             "pokemon": pokemon_name,
             "move_count": len(moves),
@@ -78,44 +128,24 @@ async def get_learnable_moves(
         return {"error": str(e)}
 
 
-async def validate_moveset(
+def _check_moveset(
     pokemon_name: str,
     moves: list[str],
-    pokeapi
+    index: LearnsetIndex
 ) -> MovesetValidationResult:
-    """
-    Validate that all moves are legal for a Pokemon.
-
-    Args:
-        pokemon_name: Name of the Pokemon
-        moves: List of move names to validate
-        pokeapi: PokeAPI client instance
-
-    Returns:
-        MovesetValidationResult with details for each move
-    """
-    learnable = await get_learnable_moves(pokemon_name, pokeapi)
-
-    if "error" in learnable:
-        return MovesetValidationResult(
-            pokemon=pokemon_name,
-            all_legal=False,
-            moves=[],
-            illegal_moves=moves
-        )
-
-    learnable_moves = learnable.get("moves", {})
+    """Validate a moveset against a loaded learnset with bit tests."""
+    wanted = [move for move in moves if move]
+    missing = set(index.missing_moves(
+        pokemon_name, [normalize_move_name(move) for move in wanted]
+    ))
     results = []
     illegal = []
 
-    for move in moves:
-        if not move:
-            continue
-
+    for move in wanted:
         normalized = normalize_move_name(move)
 
-        if normalized in learnable_moves:
-            methods = learnable_moves[normalized]
+        if normalized not in missing:
+            methods = index.methods(pokemon_name, normalized)
             results.append(MoveValidationResult(
                 move=move,
                 legal=True,
@@ -139,43 +169,149 @@ async def validate_moveset(
     )
 
 
-async def validate_team_movesets(team, pokeapi) -> list[dict]:
+async def validate_moveset(
+    pokemon_name: str,
+    moves: list[str],
+    pokeapi,
+    index: Optional[LearnsetIndex] = None,
+) -> MovesetValidationResult:
+    """
+    Validate that all moves are legal for a Pokemon.
+
+    Args:
+        pokemon_name: Name of the Pokemon
+        moves: List of move names to validate
+        pokeapi: PokeAPI client instance
+        index: Learnset index to use (defaults to the shared one)
+
+    Returns:
+        MovesetValidationResult with details for each move
+    """
+    (result,) = await validate_movesets([(pokemon_name, moves)], pokeapi, index)
+    return result
+
+
+async def validate_movesets(
+    entries: list[tuple[str, list[str]]],
+    pokeapi,
+    index: Optional[LearnsetIndex] = None,
+) -> list[MovesetValidationResult]:
+    """
+    Validate many (Pokemon, moves) pairs, e.g. every slot of many pastes.
+
+    Each distinct species is fetched once (concurrently); every moveset is
+    then checked with bit tests against the learnset index.
+
+    Args:
+        entries: (pokemon name, move list) pairs
+        pokeapi: PokeAPI client instance
+        index: Learnset index to use (defaults to the shared one)
+
+    Returns:
+        One MovesetValidationResult per entry, in order
+    """
+    index = index or get_learnset_index()
+    errors = await load_learnsets([name for name, _ in entries], pokeapi, index)
+
+    results = []
+    for pokemon_name, moves in entries:
+        if pokemon_name.lower().replace(" ", "-") in errors:
+            results.append(MovesetValidationResult(
+                pokemon=pokemon_name,
+                all_legal=False,
+                moves=[],
+                illegal_moves=moves
+            ))
+        else:
+            results.append(_check_moveset(pokemon_name, moves, index))
+    return results
+
+
+async def validate_team_movesets(
+    team, pokeapi, index: Optional[LearnsetIndex] = None
+) -> list[dict]:
     """
     Validate movesets for all Pokemon on a team.
 
     Args:
         team: Team object with Pokemon
         pokeapi: PokeAPI client instance
+        index: Learnset index to use (defaults to the shared one)
 
     Returns:
         List of validation results for each Pokemon
     """
-    results = []
+    entries = [
+        (slot.pokemon.name, slot.pokemon.moves)
+        for slot in team.slots
+        if slot.pokemon.moves
+    ]
+    validations = await validate_movesets(entries, pokeapi, index)
+
+    return [
+        {
+            "pokemon": validation.pokemon,
+            "all_legal": validation.all_legal,
+            "illegal_moves": validation.illegal_moves,
+            "details": [
+                {
+                    "move": m.move,
+                    "legal": m.legal,
+                    "methods": m.methods,
+                    "reason": m.reason
+                }
+                for m in validation.moves
+            ]
+        }
+        for validation in validations
+    ]
 
-    for slot in team.slots:
-        pokemon = slot.pokemon
-        if pokemon.moves:
-            validation = await validate_moveset(
-                pokemon.name,
-                pokemon.moves,
-                pokeapi
-            )
-            results.append({
-                "pokemon": pokemon.name,
-                "all_legal": validation.all_legal,
-                "illegal_moves": validation.illegal_moves,
-                "details": [
-                    {
-                        "move": m.move,
-                        "legal": m.legal,
-                        "methods": m.methods,
-                        "reason": m.reason
-                    }
-                    for m in validation.moves
-                ]
-            })
 
-    return results
+async def find_learners(
+    moves: list[str],
+    pokeapi,
+    regulation: Optional[str] = None,
+    include_restricted: bool = True,
+    index: Optional[LearnsetIndex] = None,
+) -> dict:
+    """
+    Find every Pokemon that learns all of the given moves.
+
+    One move payload per move supplies its full learner list; the answer is
+    the AND of those columns masked by the regulation's species allowlist.
+
+    Args:
+        moves: Move names (all must be learnable)
+        pokeapi: PokeAPI client instance
+        regulation: Regulation code for the allowlist. Uses current if None.
+        include_restricted: Keep restricted Pokemon in the results
+        index: Learnset index to use (defaults to the shared one)
+
+    Returns:
+        Dict with the learners and which of them are restricted
+    """
+    index = index or get_learnset_index()
+    normalized = [normalize_move_name(move) for move in moves if move]
+
+    async def load(move: str) -> None:
+        data = await pokeapi.get_move_data(move)
+        index.add_learners(
+            data.get("name", move),
+            (entry["name"] for entry in data.get("learned_by_pokemon", [])),
+        )
+
+    try:
+        await asyncio.gather(*(load(m) for m in normalized if not index.has_learners(m)))
+    except Exception as e:
+        return {"error": str(e)}
+
+    allowed = index.regulation_mask(regulation, include_restricted)
+    learners = index.learners(normalized, allowed)
+    return {
+        "moves": normalized,
+        "learners": learners,
+        "restricted": sorted(index.restricted_flags(learners, regulation)),
+    }
 
 
 def categorize_learn_method(method: str) -> str:
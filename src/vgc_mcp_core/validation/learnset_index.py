@@ -0,0 +1,243 @@
+"""Species x move learnset matrix stored as integer bitsets.
+
+Rows (species -> moves) are filled from PokeAPI ``pokemon/`` payloads, which
+carry full learnsets with learn methods. Columns (move -> species) are filled
+from ``move/`` payloads' ``learned_by_pokemon``, one request per move for the
+whole dex. Adding either side sets the matching bits on the other.
+
+Each row and column is a Python int used as a bitset, so validating a moveset
+is one AND against a row, and "which Pokemon learn Fake Out and Tailwind" is
+one AND across two columns followed by a regulation allowlist mask.
+
+Names are keyed by Showdown-style id, so "Flutter Mane", "flutter-mane" and
+"fluttermane" share a bit.
+"""
+
+from typing import Iterable, Optional
+
+from ..api.pokeapi import POKEAPI_FORM_ALIASES
+from ..rules.regulation_loader import RegulationConfig, get_regulation_config
+from ..utils.name_index import to_id
+
+# Form name parts PokeAPI uses for forms no Scarlet/Violet regulation allows
+# ("charizard-mega-x", "venusaur-gmax", "groudon-primal", "raticate-totem-alola")
+UNAVAILABLE_FORM_PARTS = frozenset({"mega", "gmax", "primal", "totem", "eternamax", "starter"})
+
+
+def is_unavailable_form(name: str) -> bool:
+    """Mega, Gigantamax, Primal, Totem and other forms that can't be used in SV."""
+    return not UNAVAILABLE_FORM_PARTS.isdisjoint(name.lower().split("-"))
+
+
+def _bits(mask: int) -> Iterable[int]:
+    """Positions of the set bits in a mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class LearnsetIndex:
+    """Bit matrix of which species learn which moves."""
+
+    def __init__(self):
+        self._species: dict[str, int] = {}  # id -> bit
+        self._species_names: list[str] = []
+        self._moves: dict[str, int] = {}
+        self._move_names: list[str] = []
+        self._rows: list[int] = []     # species bit -> move mask
+        self._columns: list[int] = []  # move bit -> species mask
+        self._methods: dict[int, dict[int, tuple[str, ...]]] = {}
+        self._full_rows = 0     # species whose whole learnset is loaded
+        self._full_columns = 0  # moves whose whole learner list is loaded
+
+    @property
+    def species_count(self) -> int:
+        return len(self._species_names)
+
+    @property
+    def move_count(self) -> int:
+        return len(self._move_names)
+
+    def _species_bit(self, name: str) -> int:
+        key = to_id(name)
+        bit = self._species.get(key)
+        if bit is None:
+            bit = self._species[key] = len(self._species_names)
+            self._species_names.append(name)
+            self._rows.append(0)
+        return bit
+
+    def _move_bit(self, name: str) -> int:
+        key = to_id(name)
+        bit = self._moves.get(key)
+        if bit is None:
+            bit = self._moves[key] = len(self._move_names)
+            self._move_names.append(name)
+            self._columns.append(0)
+        return bit
+
+    def add_alias(self, alias: str, species: str) -> None:
+        """Point another spelling (e.g. "landorus") at an indexed species."""
+        self._species.setdefault(to_id(alias), self._species_bit(species))
+
+    def add_learnset(self, species: str, moves: dict[str, list[str]]) -> None:
+        """Record a species' complete learnset (move -> learn methods)."""
+        row_bit = self._species_bit(species)
+        row = 0
+        methods = {}
+        for move, move_methods in moves.items():
+            col_bit = self._move_bit(move)
+            row |= 1 << col_bit
+            self._columns[col_bit] |= 1 << row_bit
+            methods[col_bit] = tuple(move_methods)
+        self._rows[row_bit] |= row
+        self._methods[row_bit] = methods
+        self._full_rows |= 1 << row_bit
+
+    def add_learners(self, move: str, species: Iterable[str]) -> None:
+        """Record every species that can learn a move."""
+        col_bit = self._move_bit(move)
+        column = 0
+        for name in species:
+            row_bit = self._species_bit(name)
+            column |= 1 << row_bit
+            self._rows[row_bit] |= 1 << col_bit
+        self._columns[col_bit] |= column
+        self._full_columns |= 1 << col_bit
+
+    def has_learnset(self, species: str) -> bool:
+        bit = self._species.get(to_id(species))
+        return bit is not None and bool(self._full_rows >> bit & 1)
+
+    def has_learners(self, move: str) -> bool:
+        bit = self._moves.get(to_id(move))
+        return bit is not None and bool(self._full_columns >> bit & 1)
+
+    def species_name(self, species: str) -> Optional[str]:
+        """Indexed (PokeAPI) name for any spelling, or None."""
+        bit = self._species.get(to_id(species))
+        return None if bit is None else self._species_names[bit]
+
+    def learnset(self, species: str, method: Optional[str] = None) -> dict[str, list[str]]:
+        """Moves (with learn methods) of a species whose learnset is loaded."""
+        bit = self._species.get(to_id(species))
+        if bit is None:
+            return {}
+        methods = self._methods.get(bit, {})
+        wanted = method.lower() if method else None
+        result = {}
+        for col_bit in _bits(self._rows[bit]):
+            move_methods = list(methods.get(col_bit, ()))
+            if wanted is None or wanted in move_methods:
+                result[self._move_names[col_bit]] = move_methods
+        return result
+
+    def learns(self, species: str, move: str) -> bool:
+        """Single bit test; False for unknown species or moves."""
+        row_bit = self._species.get(to_id(species))
+        col_bit = self._moves.get(to_id(move))
+        if row_bit is None or col_bit is None:
+            return False
+        return bool(self._rows[row_bit] >> col_bit & 1)
+
+    def methods(self, species: str, move: str) -> list[str]:
+        row_bit = self._species.get(to_id(species))
+        col_bit = self._moves.get(to_id(move))
+        if row_bit is None or col_bit is None:
+            return []
+        return list(self._methods.get(row_bit, {}).get(col_bit, ()))
+
+    def missing_moves(self, species: str, moves: list[str]) -> list[str]:
+        """Requested moves the species cannot learn (one AND against its row)."""
+        row_bit = self._species.get(to_id(species))
+        row = self._rows[row_bit] if row_bit is not None else 0
+        wanted = 0
+        unknown = []
+        for move in moves:
+            col_bit = self._moves.get(to_id(move))
+            if col_bit is None:
+                unknown.append(move)
+            else:
+                wanted |= 1 << col_bit
+        if not wanted & ~row:
+            return unknown
+        return [
+            move for move in moves
+            if move in unknown or not row >> self._moves[to_id(move)] & 1
+        ]
+
+    def species_mask(self, names: Iterable[str]) -> int:
+        """Mask of the indexed species among ``names``."""
+        mask = 0
+        for name in names:
+            bit = self._species.get(to_id(name))
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def regulation_mask(
+        self,
+        regulation: Optional[str] = None,
+        include_restricted: bool = True,
+        config: Optional[RegulationConfig] = None,
+    ) -> int:
+        """Allowlist of indexed species for a regulation.
+
+        Banned (mythical) species are removed, and restricted ones too unless
+        ``include_restricted``. Base-form names in the regulation file
+        ("giratina") also cover the PokeAPI default form ("giratina-altered").
+        Forms that don't exist in Scarlet/Violet (Megas, Gigantamax, ...) are
+        removed too. Learner lists span every generation, so species that
+        were never brought to SV are not filtered here.
+        """
+        config = config or get_regulation_config()
+        excluded = set(config.get_banned_pokemon(regulation))
+        if not include_restricted:
+            excluded |= config.get_restricted_pokemon(regulation)
+        excluded |= {
+            POKEAPI_FORM_ALIASES[name] for name in excluded if name in POKEAPI_FORM_ALIASES
+        }
+        excluded |= {name for name in self._species_names if is_unavailable_form(name)}
+        everyone = (1 << len(self._species_names)) - 1
+        return everyone & ~self.species_mask(excluded)
+
+    def learners(self, moves: list[str], allowed: Optional[int] = None) -> list[str]:
+        """Species that learn every move in ``moves`` (one AND per move)."""
+        mask = (1 << len(self._species_names)) - 1 if allowed is None else allowed
+        for move in moves:
+            col_bit = self._moves.get(to_id(move))
+            if col_bit is None:
+                return []
+            mask &= self._columns[col_bit]
+        return [self._species_names[bit] for bit in _bits(mask)]
+
+    def restricted_flags(
+        self,
+        species: list[str],
+        regulation: Optional[str] = None,
+        config: Optional[RegulationConfig] = None,
+    ) -> set[str]:
+        """The subset of ``species`` that is restricted in a regulation."""
+        config = config or get_regulation_config()
+        restricted = config.get_restricted_pokemon(regulation)
+        restricted |= {POKEAPI_FORM_ALIASES[n] for n in restricted if n in POKEAPI_FORM_ALIASES}
+        mask = self.species_mask(restricted)
+        return {name for name in species if mask >> self._species[to_id(name)] & 1}
+
+
+_index: Optional[LearnsetIndex] = None
+
+
+def get_learnset_index() -> LearnsetIndex:
+    """The process-wide learnset index (filled lazily as payloads are fetched)."""
+    global _index
+    if _index is None:
+        _index = LearnsetIndex()
+    return _index
+
+
+def reset_learnset_index() -> None:
+    """Reset the shared index (useful for testing)."""
+    global _index
+    _index = None
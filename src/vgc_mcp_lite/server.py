@@ -25,6 +25,7 @@ from mcp.server.fastmcp import FastMCP
 
 from vgc_mcp_core.config import logger
 from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.api.snapshot import restore_configured_snapshot
 from vgc_mcp_core.api.pokeapi import PokeAPIClient
 from vgc_mcp_core.api.smogon import SmogonStatsClient
 from vgc_mcp_core.team.manager import TeamManager
@@ -59,7 +60,8 @@ mcp = FastMCP(
     instructions="Lite MCP server for VGC Pokemon team building (~49 essential tools)"
 )
 
-# Initialize shared state
+# Initialize shared state (an empty cache is first filled from the warm-start snapshot)
+restore_configured_snapshot()
 cache = APICache()
 pokeapi = PokeAPIClient(cache)
 smogon = SmogonStatsClient(cache)
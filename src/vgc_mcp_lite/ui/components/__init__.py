@@ -7,6 +7,7 @@ that can be embedded in MCP UI resources.
 Components are organized by category:
 - styles: Shared CSS styles
 - sprites: Pokemon sprite URLs and type colors
+- template: Precompiled HTML templates and payload budgets
 - (main module): All UI component builders
 
 Usage:
@@ -27,6 +28,13 @@ from .sprites import (
     SPRITE_PLACEHOLDER,
     TYPE_COLORS,
 )
+from .template import (
+    HtmlTemplate,
+    document,
+    json_island,
+    get_payload_report,
+    reset_payload_report,
+)
 
 # Import all component builders from the main module
 # These will be migrated to submodules in future refactors
@@ -56,6 +64,12 @@ __all__ = [
     "get_type_color",
     "SPRITE_PLACEHOLDER",
     "TYPE_COLORS",
+    # Templates
+    "HtmlTemplate",
+    "document",
+    "json_island",
+    "get_payload_report",
+    "reset_payload_report",
     # Damage components
     "create_damage_calc_ui",
     "create_damage_calc_table_ui",
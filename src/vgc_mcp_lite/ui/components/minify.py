@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Conservative minifiers for the static CSS, JS and markup in UI components.
+
+These run once per static block at import, never per render. They only
+remove text that cannot change rendering: comments, indentation and
+whitespace around punctuation. Quoted CSS strings and JS string and
+template literals are kept verbatim, and JS keeps its line breaks, so
+automatic semicolon insertion is unaffected.
+"""
+
+import re
+
+_CSS_COMMENT_OR_STRING = re.compile(
+    r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/""", re.S
+)
+_CSS_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r" ?([{};,>]) ?")
+_CSS_COLON = re.compile(r": ")
+
+_HTML_BLOCK = re.compile(
+    r"(<(style|script)\b[^>]*>)(.*?)(</\2>)", re.S | re.I
+)
+_HTML_NEWLINE_SPACE = re.compile(r"\s*\n\s*")
+
+_JS_QUOTES = ("'", '"', "`")
+
+
+def _squeeze_css(code: str) -> str:
+    code = _CSS_SPACE.sub(" ", code)
+    code = _CSS_PUNCTUATION.sub(r"\1", code)
+    code = _CSS_COLON.sub(":", code)
+    return code.replace(";}", "}")
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace from a stylesheet.
+
+    Quoted strings are kept verbatim; only whitespace next to ``{ } ; , >``
+    and after ``:`` is removed, so selectors like ``.a :hover`` keep their
+    meaning.
+    """
+    css = _CSS_COMMENT_OR_STRING.sub(lambda m: m.group(1) or " ", css)
+    parts = _CSS_STRING.split(css)
+    # Odd indices are the quoted strings captured by the split
+    return "".join(
+        part if i % 2 else _squeeze_css(part) for i, part in enumerate(parts)
+    ).strip()
+
+
+def _scan_js_line(line: str, stack: list[str]) -> None:
+    """Advance the open-literal ``stack`` over one line of JS.
+
+    The stack holds a quote character for each open string or template
+    literal, ``{`` for a ``${`` substitution (or a brace inside one) and
+    ``*`` for a block comment. Regex literals aren't recognised.
+    """
+    i = 0
+    while i < len(line):
+        c = line[i]
+        top = stack[-1] if stack else None
+        if top == "*":
+            if line.startswith("*/", i):
+                stack.pop()
+                i += 1
+        elif top in _JS_QUOTES:
+            if c == "\\":
+                i += 1
+            elif c == top:
+                stack.pop()
+            elif top == "`" and line.startswith("${", i):
+                stack.append("{")
+                i += 1
+        elif line.startswith("//", i):
+            break
+        elif line.startswith("/*", i):
+            stack.append("*")
+            i += 1
+        elif c in _JS_QUOTES:
+            stack.append(c)
+        elif c == "{" and top == "{":
+            stack.append(c)
+        elif c == "}" and top == "{":
+            stack.pop()
+        i += 1
+    # Quoted strings end at the line break unless it's escaped
+    if stack and stack[-1] in "'\"" and not line.endswith("\\"):
+        stack.pop()
+
+
+def minify_js(js: str) -> str:
+    """Strip indentation, blank lines and whole-line ``//`` comments.
+
+    Line breaks are kept, so automatic semicolon insertion still sees the
+    same statements. Lines that start inside a multi-line template literal
+    (or an escaped-newline string) are content and kept as they are.
+    """
+    out = []
+    stack: list[str] = []
+    for line in js.splitlines():
+        starts_inside = bool(stack) and stack[-1] in _JS_QUOTES
+        _scan_js_line(line, stack)
+        ends_inside = bool(stack) and stack[-1] in _JS_QUOTES
+        if starts_inside:
+            out.append(line if ends_inside else line.rstrip())
+            continue
+        line = line.lstrip() if ends_inside else line.strip()
+        if line and not line.startswith("//"):
+            out.append(line)
+    return "\n".join(out)
+
+
+def _minify_block(match: re.Match) -> str:
+    open_tag, tag, body, close_tag = match.groups()
+    if tag.lower() == "style":
+        body = minify_css(body)
+    elif "type=" not in open_tag or "javascript" in open_tag:
+        body = minify_js(body)
+    return open_tag + body + close_tag
+
+
+def minify_html(html: str) -> str:
+    """Minify a document: markup indentation, inline CSS and inline JS.
+
+    Whitespace runs that contain a newline collapse to a single newline, which
+    renders identically; other whitespace in the markup is untouched.
+    """
+    out = []
+    pos = 0
+    for match in _HTML_BLOCK.finditer(html):
+        out.append(_HTML_NEWLINE_SPACE.sub("\n", html[pos:match.start()]))
+        out.append(_minify_block(match))
+        pos = match.end()
+    out.append(_HTML_NEWLINE_SPACE.sub("\n", html[pos:]))
+    return "".join(out).strip()
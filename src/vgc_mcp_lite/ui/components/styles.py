@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
 """Shared CSS styles for UI components."""
 
+from functools import lru_cache
 from pathlib import Path
 
+from .minify import minify_css
+
 # Load shared styles from template
 STYLES_PATH = Path(__file__).parent.parent / "templates" / "shared" / "styles.css"
 
 
+@lru_cache(maxsize=1)
 def get_shared_styles() -> str:
-    """Load shared CSS styles."""
+    """Load shared CSS styles (read and minified once per process)."""
     try:
-        return STYLES_PATH.read_text()
+        return minify_css(STYLES_PATH.read_text())
     except FileNotFoundError:
         return ""
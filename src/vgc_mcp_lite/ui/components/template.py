@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Precompiled HTML templates and payload budgets for UI components.
+
+UI payloads are mostly static CSS and JavaScript that is identical on every
+call. This module lets components prepare that text once at import:
+
+- HtmlTemplate splits a document into static segments and ``{{ slot }}``
+  holes, so rendering is a single join.
+- json_island embeds per-call data as JSON that page scripts read, keeping
+  the scripts themselves static.
+- SHARED_ASSETS holds snippets several components use (fonts, the shared
+  stylesheet); document() includes each requested asset once.
+- ui_component records the payload size of every render against a
+  per-component budget (see get_payload_report).
+"""
+
+import functools
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from .minify import minify_html
+from .styles import get_shared_styles
+
+logger = logging.getLogger(__name__)
+
+# Budget for one rendered component, in UTF-8 bytes
+DEFAULT_PAYLOAD_BUDGET = 64 * 1024
+
+# Components whose interactive editors legitimately need more room
+PAYLOAD_BUDGETS: dict[str, int] = {
+    "damage_calc": 96 * 1024,
+    "pokemon_build_card": 96 * 1024,
+    "defensive_benchmark": 96 * 1024,
+}
+
+_SLOT = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}")
+
+
+# =============================================================================
+# TEMPLATES
+# =============================================================================
+
+def json_island(element_id: str, data: Any) -> str:
+    """Embed ``data`` as a JSON script element for page scripts to read.
+
+    Scripts load it with ``JSON.parse(document.getElementById(id).textContent)``.
+    ``<``, ``>`` and ``&`` are escaped so the payload cannot close the element.
+    """
+    payload = (
+        json.dumps(data, separators=(",", ":"), default=str)
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+    )
+    return f'<script type="application/json" id="{element_id}">{payload}</script>'
+
+
+class HtmlTemplate:
+    """An HTML document compiled into static segments and named slots.
+
+    The source is minified once when the template is built (normally at
+    import); ``render`` only joins the precomputed segments with the slot
+    values, which callers are responsible for escaping.
+
+    Example::
+
+        CARD = HtmlTemplate("<div class='name'>{{ name }}</div>", name="card")
+        CARD.render(name=html.escape(pokemon_name))
+    """
+
+    def __init__(self, source: str, name: str = "") -> None:
+        parts = _SLOT.split(minify_html(source))
+        self.name = name
+        self.segments = tuple(parts[0::2])
+        self.slots = tuple(parts[1::2])
+
+    @property
+    def static_size(self) -> int:
+        """Bytes of static text emitted on every render."""
+        return sum(len(segment.encode("utf-8")) for segment in self.segments)
+
+    def render(self, **values: Any) -> str:
+        """Fill the slots and return the document."""
+        try:
+            filled = [str(values[slot]) for slot in self.slots]
+        except KeyError as e:
+            raise KeyError(f"Template {self.name!r} missing slot {e.args[0]!r}") from None
+        out: list[str] = [""] * (2 * len(filled) + 1)
+        out[0::2] = self.segments
+        out[1::2] = filled
+        return "".join(out)
+
+
+# Snippets shared between components, built once at import
+SHARED_ASSETS: dict[str, str] = {
+    "fonts": (
+        '<link rel="preconnect" href="https://fonts.googleapis.com">'
+        '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+        '<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700'
+        '&display=swap" rel="stylesheet">'
+    ),
+    "shared_styles": f"<style>{get_shared_styles()}</style>",
+}
+
+
+def document(
+    body: str,
+    css: str = "",
+    script: str = "",
+    assets: Iterable[str] = (),
+    name: str = "",
+) -> HtmlTemplate:
+    """Assemble and compile a full page.
+
+    Args:
+        body: Markup for ``<body>``; may contain ``{{ slot }}`` holes
+        css: Component stylesheet (minified here)
+        script: Component JavaScript run at the end of the body
+        assets: SHARED_ASSETS names; each is included once, in order
+        name: Component name used in error messages
+
+    Returns:
+        Compiled HtmlTemplate
+    """
+    head = "".join(SHARED_ASSETS[asset] for asset in dict.fromkeys(assets))
+    return HtmlTemplate(
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="UTF-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+        f"{head}{f'<style>{css}</style>' if css else ''}\n</head>\n<body>\n{body}\n"
+        f"{f'<script>{script}</script>' if script else ''}\n</body>\n</html>",
+        name=name,
+    )
+
+
+# =============================================================================
+# PAYLOAD BUDGETS
+# =============================================================================
+
+@dataclass
+class PayloadStats:
+    """Rendered size and time for one component."""
+
+    component: str
+    budget: int
+    calls: int = 0
+    last_bytes: int = 0
+    max_bytes: int = 0
+    total_seconds: float = 0.0
+    over_budget: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "component": self.component,
+            "budget_bytes": self.budget,
+            "calls": self.calls,
+            "last_bytes": self.last_bytes,
+            "max_bytes": self.max_bytes,
+            "avg_render_ms": (
+                round(self.total_seconds / self.calls * 1000, 3) if self.calls else 0.0
+            ),
+            "over_budget": self.over_budget,
+        }
+
+
+class PayloadReport:
+    """Per-component payload sizes checked against PAYLOAD_BUDGETS."""
+
+    def __init__(self) -> None:
+        self.components: dict[str, PayloadStats] = {}
+
+    def record(self, component: str, size: int, seconds: float = 0.0) -> PayloadStats:
+        """Record one render; logs the first time a component exceeds its budget."""
+        stats = self.components.get(component)
+        if stats is None:
+            budget = PAYLOAD_BUDGETS.get(component, DEFAULT_PAYLOAD_BUDGET)
+            stats = self.components[component] = PayloadStats(component, budget)
+        stats.calls += 1
+        stats.last_bytes = size
+        stats.max_bytes = max(stats.max_bytes, size)
+        stats.total_seconds += seconds
+        if size > stats.budget:
+            if not stats.over_budget:
+                logger.warning(
+                    "UI component %s rendered %d bytes (budget %d)",
+                    component, size, stats.budget,
+                )
+            stats.over_budget += 1
+        return stats
+
+    def summary(self) -> list[dict]:
+        """Stats for every rendered component, largest first."""
+        return [
+            stats.to_dict()
+            for stats in sorted(self.components.values(), key=lambda s: -s.max_bytes)
+        ]
+
+
+_payload_report: PayloadReport | None = None
+
+
+def get_payload_report() -> PayloadReport:
+    """Get the shared payload report."""
+    global _payload_report
+    if _payload_report is None:
+        _payload_report = PayloadReport()
+    return _payload_report
+
+
+def reset_payload_report() -> None:
+    """Clear recorded payload sizes."""
+    global _payload_report
+    _payload_report = None
+
+
+def ui_component(name: str) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """Decorate a ``create_*_ui`` builder to record its payload size."""
+
+    def decorator(builder: Callable[..., str]) -> Callable[..., str]:
+        @functools.wraps(builder)
+        def wrapper(*args: Any, **kwargs: Any) -> str:
+            start = time.perf_counter()
+            html = builder(*args, **kwargs)
+            get_payload_report().record(
+                name, len(html.encode("utf-8")), time.perf_counter() - start
+            )
+            return html
+
+        return wrapper
+
+    return decorator
@@ -1,12 +1,26 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
 from vgc_mcp_core.api.cache import APICache
-from vgc_mcp_core.api.pokeapi import PokeAPIClient
-from vgc_mcp_core.team.manager import TeamManager
+from vgc_mcp_core.api.pokeapi import PokeAPIError
+from vgc_mcp_core.api.smogon import SmogonStatsClient
+from vgc_mcp_core.api.transport import reset_transport
 from vgc_mcp_core.models.pokemon import BaseStats
+from vgc_mcp_core.team.manager import TeamManager
+
+
+@pytest.fixture(autouse=True)
+def fresh_transport():
+    """Rate limits and retry budgets don't carry over between tests."""
+    reset_transport()
+    yield
+    reset_transport()
 
 
 @pytest.fixture
@@ -92,3 +106,161 @@ def dragapult_stats():
 @pytest.fixture
 def urshifu_stats():
     return URSHIFU_STATS
+
+
+# Fakes for the API clients
+
+
+def _key(name: str) -> str:
+    return name.lower().replace(" ", "-")
+
+
+def _keyed(table) -> dict:
+    return {_key(name): value for name, value in (table or {}).items()}
+
+
+class FakeRegulation:
+    """Regulation config whose current formats are ``formats``, then any ``past`` ones."""
+
+    def __init__(self, *formats: str, past: tuple[str, ...] = ()):
+        self.formats = list(formats)
+        self.past = list(past)
+
+    def get_smogon_formats(self, regulation=None) -> list[str]:
+        return self.formats
+
+    def get_all_smogon_formats(self) -> list[str]:
+        return self.formats + self.past
+
+
+class FakeSmogonUpstream:
+    """Smogon stats host: chaos files keyed by (month, format, rating), with ETags."""
+
+    def __init__(self):
+        self.files: dict[tuple[str, str, int], dict] = {}
+        self.requests: list[httpx.Request] = []
+        self.fail = False
+        self.delay = 0.0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            raise httpx.ConnectError("down", request=request)
+        month, _, filename = request.url.path.split("/")[-3:]
+        fmt, rating = filename[:-len(".json")].rsplit("-", 1)
+        data = self.files.get((month, fmt, int(rating)))
+        if data is None:
+            return httpx.Response(404, request=request)
+        etag = f'"{month}-{hash(json.dumps(data, sort_keys=True))}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, request=request)
+        return httpx.Response(200, json=data, headers={"etag": etag}, request=request)
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self(request)
+
+
+@pytest.fixture
+def smogon_upstream():
+    return FakeSmogonUpstream()
+
+
+@pytest.fixture
+def make_smogon_client(tmp_path, smogon_upstream):
+    """Factory for SmogonStatsClients sharing a disk cache and ``smogon_upstream``."""
+    clients = []
+
+    def factory() -> SmogonStatsClient:
+        client = SmogonStatsClient(APICache(str(tmp_path / "cache")))
+        client._get_recent_months = lambda count=4: ["2026-09", "2026-08", "2026-07"][:count]
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(smogon_upstream.handler)
+        )
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.cache.close()
+
+
+class FakeSmogon:
+    """SmogonStatsClient stand-in serving one snapshot and a per-species usage table."""
+
+    def __init__(self, snapshot=None, usage=None, ranking=None, cache=None):
+        self.snapshot = snapshot
+        self.usage = _keyed(usage)
+        self.ranking = ranking if ranking is not None else list(usage or {})
+        self.cache = cache
+
+    async def get_usage_snapshot(self, format_name=None, rating=0):
+        return self.snapshot
+
+    async def get_usage_ranking(self, format_name=None, rating=0, limit=None):
+        return self.ranking[:limit]
+
+    async def get_pokemon_usage(self, name, format_name=None, rating=0):
+        return self.usage.get(_key(name))
+
+    async def get_usage_stats(self, format_name=None, rating=0, month=None):
+        return {"_meta": {}, "data": self.snapshot.data if self.snapshot else {}}
+
+
+class FakePokeAPI:
+    """PokeAPIClient stand-in serving fixed tables.
+
+    Tables are looked up case- and space-insensitively. Names missing from a
+    table raise PokeAPIError("Not found: ...") like the real client, and
+    ``down`` makes every lookup fail as if PokeAPI were unreachable. Every
+    requested name is recorded in ``fetched``.
+    """
+
+    def __init__(
+        self,
+        pokemon=None,
+        base_stats=None,
+        types=None,
+        moves=None,
+        move_data=None,
+        names=None,
+        aliases=None,
+        down: bool = False,
+    ):
+        self.pokemon = _keyed(pokemon)
+        self.base_stats = _keyed(base_stats)
+        self.types = _keyed(types)
+        self.moves = _keyed(moves)
+        self.move_data = _keyed(move_data)
+        self.names = names or {}
+        self.aliases = aliases or {}
+        self.down = down
+        self.fetched: list[str] = []
+
+    def _lookup(self, kind: str, table: dict, name: str):
+        name = self.aliases.get(name, name)
+        self.fetched.append(name)
+        if self.down:
+            raise PokeAPIError(f"Failed to fetch {kind}/{name} after 3 attempts")
+        if _key(name) not in table:
+            raise PokeAPIError(f"Not found: {kind}/{name}")
+        return table[_key(name)]
+
+    async def load_name_index(self):
+        return self.names
+
+    async def get_pokemon(self, name):
+        return self._lookup("pokemon", self.pokemon, name)
+
+    async def get_base_stats(self, name):
+        return self._lookup("pokemon", self.base_stats, name)
+
+    async def get_pokemon_types(self, name):
+        return self._lookup("pokemon", self.types, name)
+
+    async def get_move(self, name):
+        return self._lookup("move", self.moves, name)
+
+    async def get_move_data(self, name):
+        return self._lookup("move", self.move_data, name)
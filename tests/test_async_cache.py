@@ -0,0 +1,105 @@
+"""Tests for the async API cache facade."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from vgc_mcp_core.api.cache import APICache, AsyncAPICache, get_async_cache
+from vgc_mcp_core.metrics import REGISTRY
+
+POINTER = {"month": "2026-09", "fetched_at": 1.0}
+BIG_VALUE = {"moves": [{"name": f"move-{i}", "level": i} for i in range(5000)]}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with APICache(str(tmp_path)) as cache:
+        yield cache
+
+
+class TestAsyncAPICache:
+    """Reads and writes go through the facade without blocking the loop."""
+
+    async def test_round_trip(self, cache):
+        facade = get_async_cache(cache)
+        assert facade is get_async_cache(cache)
+
+        await facade.set("smogon", "latest/fmt/0", value=POINTER)
+        assert cache.get("smogon", "latest/fmt/0") == POINTER
+        assert await facade.get("smogon", "latest/fmt/0") == POINTER
+        assert await facade.get("smogon", "missing") is None
+
+        await facade.delete("smogon", "latest/fmt/0")
+        assert await facade.get("smogon", "latest/fmt/0") is None
+
+    async def test_small_values_served_from_memory_as_copies(self, cache):
+        facade = get_async_cache(cache)
+        await facade.set("smogon", "latest/fmt/0", value=POINTER)
+
+        first = await facade.get("smogon", "latest/fmt/0")
+        first["month"] = "changed"
+        assert await facade.get("smogon", "latest/fmt/0") == POINTER
+        assert facade.stats["reads"] == {"memory": 2, "disk": 0, "coalesced": 0}
+        assert cache.stats["hits"] == 2
+
+    async def test_large_values_stay_on_disk(self, cache):
+        facade = get_async_cache(cache)
+        await facade.set("pokeapi", "pokemon/big", value=BIG_VALUE)
+
+        assert await facade.get("pokeapi", "pokemon/big") == BIG_VALUE
+        assert facade.stats["reads"]["disk"] == 1
+        assert facade.stats["memory_entries"] == 0
+
+    async def test_sync_writes_invalidate_memory(self, cache):
+        facade = get_async_cache(cache)
+        await facade.get("smogon", "latest/fmt/0")
+        await facade.set("smogon", "latest/fmt/0", value=POINTER)
+
+        cache.set("smogon", "latest/fmt/0", value={"month": "2026-10"})
+        assert await facade.get("smogon", "latest/fmt/0") == {"month": "2026-10"}
+        cache.clear_all()
+        assert await facade.get("smogon", "latest/fmt/0") is None
+
+    async def test_memory_entries_expire(self, cache):
+        facade = AsyncAPICache(cache, memory_ttl=0)
+        await facade.set("smogon", "latest/fmt/0", value=POINTER)
+        assert await facade.get("smogon", "latest/fmt/0") == POINTER
+        assert facade.stats["reads"]["memory"] == 0
+        facade.close()
+
+    async def test_concurrent_reads_coalesce(self):
+        disk = MagicMock(spec=APICache)
+        reads = []
+
+        def slow_get(prefix, *args):
+            reads.append(args)
+            time.sleep(0.05)
+            return BIG_VALUE
+
+        disk.get.side_effect = slow_get
+        facade = AsyncAPICache(disk)
+        values = await asyncio.gather(*(facade.get("pokeapi", "pokemon/big") for _ in range(5)))
+
+        assert all(v == BIG_VALUE for v in values)
+        assert len(reads) == 1
+        assert facade.stats["reads"] == {"memory": 0, "disk": 1, "coalesced": 4}
+        facade.close()
+
+
+class TestLoopBlocking:
+    """Synchronous cache calls made on the event loop are measured."""
+
+    async def test_sync_calls_on_loop_are_counted(self, cache):
+        REGISTRY.reset()
+        cache.set("pokeapi", "pokemon/big", value=BIG_VALUE)
+        cache.get("pokeapi", "pokemon/big")
+
+        assert cache.stats["loop_blocking_ms"] > 0
+        rendered = REGISTRY.render_prometheus()
+        assert 'vgc_cache_loop_blocking_seconds_count{client="pokeapi",op="get"} 1' in rendered
+
+    def test_calls_off_loop_are_not(self, cache):
+        cache.get("pokeapi", "pokemon/big")
+        assert cache.stats["loop_blocking_ms"] == 0
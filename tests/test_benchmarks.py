@@ -0,0 +1,183 @@
+"""Tests for the offline benchmark harness."""
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from benchmarks.fixtures import FixtureStore, FixtureTransport, OfflineEnvironment
+from benchmarks.harness import compare_results, run_benchmarks
+from benchmarks.loadgen import LoadResults, load_mix
+from benchmarks.standin import FaultConfig, create_standin_app
+
+
+def _doc(**medians):
+    return {"benchmarks": {name: {"median_ms": ms} for name, ms in medians.items()}}
+
+
+class TestFixtureTransport:
+    """Recorded responses are served through the real clients."""
+
+    async def test_serves_pokeapi_fixture(self):
+        env = OfflineEnvironment.create()
+        try:
+            stats = await env.pokeapi.get_base_stats("flutter-mane")
+            assert stats.speed == 135
+            assert env.transport.requests["pokeapi"] == 1
+            assert env.transport.misses == []
+        finally:
+            await env.close()
+
+    async def test_serves_smogon_fixture_for_any_month(self):
+        env = OfflineEnvironment.create()
+        try:
+            usage = await env.smogon.get_pokemon_usage("Incineroar", "gen9vgc2026regfbo3", 0)
+            assert usage is not None
+            assert usage["usage_percent"] > 0
+        finally:
+            await env.close()
+
+    def test_unknown_path_is_404(self):
+        transport = FixtureTransport()
+        response = transport(httpx.Request("GET", "https://pokeapi.co/api/v2/pokemon/missingno"))
+        assert response.status_code == 404
+        assert transport.misses == ["https://pokeapi.co/api/v2/pokemon/missingno"]
+
+    def test_foreign_host_is_404(self):
+        transport = FixtureTransport()
+        response = transport(httpx.Request("GET", "https://example.com/"))
+        assert response.status_code == 404
+        assert transport.requests["unknown"] == 1
+
+
+class TestRunBenchmarks:
+    """Harness runs cases offline and reports timing stats."""
+
+    def test_runs_selected_cases(self):
+        results = run_benchmarks(
+            ["damage.single_hit", "smogon.pokemon_usage"], repeat=2, warmup=0,
+        )
+        assert set(results["benchmarks"]) == {"damage.single_hit", "smogon.pokemon_usage"}
+        single = results["benchmarks"]["damage.single_hit"]
+        assert single["repeat"] == 2
+        assert 0 < single["min_ms"] <= single["median_ms"] <= single["p95_ms"]
+        assert single["network_fetches"] == 0
+        assert single["fixture_misses"] == 0
+
+    def test_unknown_benchmark_raises(self):
+        with pytest.raises(KeyError):
+            run_benchmarks(["no.such.benchmark"], repeat=1)
+
+
+class TestCompareResults:
+    """Median comparison against a stored baseline."""
+
+    def test_flags_regression(self):
+        rows = compare_results(_doc(a=13.0), _doc(a=10.0), threshold=0.25)
+        assert rows[0]["status"] == "regression"
+        assert rows[0]["ratio"] == 1.3
+
+    def test_flags_improvement(self):
+        rows = compare_results(_doc(a=5.0), _doc(a=10.0), threshold=0.25)
+        assert rows[0]["status"] == "improvement"
+
+    def test_within_threshold_ok(self):
+        rows = compare_results(_doc(a=11.0), _doc(a=10.0), threshold=0.25)
+        assert rows[0]["status"] == "ok"
+
+    def test_skips_benchmarks_missing_from_baseline(self):
+        rows = compare_results(_doc(a=1.0, b=2.0), _doc(a=1.0))
+        assert [r["name"] for r in rows] == ["a"]
+
+
+class TestFixtureStore:
+    """Upstream path -> fixture file mapping."""
+
+    def test_pokeapi_path(self, tmp_path):
+        store = FixtureStore(tmp_path)
+        assert store.path_for("pokeapi", "/pokemon/incineroar") == (
+            tmp_path / "pokeapi" / "pokemon" / "incineroar.json"
+        )
+
+    def test_smogon_path_ignores_month(self, tmp_path):
+        store = FixtureStore(tmp_path)
+        a = store.path_for("smogon", "2026-08/chaos/gen9vgc2026regfbo3-0.json")
+        b = store.path_for("smogon", "2026-09/chaos/gen9vgc2026regfbo3-0.json")
+        assert a == b == tmp_path / "smogon" / "chaos" / "gen9vgc2026regfbo3-0.json"
+
+    def test_pokepaste_path(self, tmp_path):
+        store = FixtureStore(tmp_path)
+        assert store.path_for("pokepaste", "abc123/raw") == tmp_path / "pokepaste" / "abc123.txt"
+
+    def test_rejects_traversal(self, tmp_path):
+        store = FixtureStore(tmp_path)
+        assert store.path_for("pokeapi", "../../etc/passwd") is None
+        assert store.path_for("smogon", "stats/not-chaos") is None
+
+
+class TestStandIn:
+    """HTTP stand-in serving fixtures with fault injection."""
+
+    def test_serves_fixture(self):
+        with TestClient(create_standin_app()) as client:
+            response = client.get("/pokeapi/pokemon/incineroar")
+            assert response.status_code == 200
+            assert response.json()["name"] == "incineroar"
+            stats = client.get("/_standin/stats").json()
+            assert stats["requests"] == {"pokeapi": 1}
+
+    def test_missing_fixture_is_404(self):
+        with TestClient(create_standin_app()) as client:
+            assert client.get("/pokeapi/pokemon/missingno").status_code == 404
+            assert client.get("/_standin/stats").json()["misses"] == {"pokeapi": 1}
+
+    def test_error_injection(self):
+        app = create_standin_app(faults=FaultConfig(error_rate=1.0, error_status=502))
+        with TestClient(app) as client:
+            assert client.get("/pokeapi/pokemon/incineroar").status_code == 502
+            assert client.get("/_standin/stats").json()["injected_errors"] == {"pokeapi": 1}
+
+    def test_record_mode_saves_upstream_response(self, tmp_path):
+        def upstream(request: httpx.Request) -> httpx.Response:
+            assert str(request.url) == "https://pokeapi.co/api/v2/pokemon/pikachu"
+            return httpx.Response(200, json={"name": "pikachu", "id": 25})
+
+        app = create_standin_app(
+            fixtures_dir=tmp_path,
+            record=True,
+            upstream=httpx.AsyncClient(transport=httpx.MockTransport(upstream)),
+        )
+        with TestClient(app) as client:
+            assert client.get("/pokeapi/pokemon/pikachu").json()["id"] == 25
+        saved = tmp_path / "pokeapi" / "pokemon" / "pikachu.json"
+        assert saved.is_file()
+
+        # Replays without the upstream once recorded
+        with TestClient(create_standin_app(fixtures_dir=tmp_path)) as client:
+            assert client.get("/pokeapi/pokemon/pikachu").json()["name"] == "pikachu"
+
+
+class TestLoadResults:
+    """Load generator aggregation."""
+
+    def test_summary_percentiles(self):
+        results = LoadResults(elapsed=10.0)
+        for ms in range(1, 101):
+            results.record("calculate_damage_output", ms / 1000, ok=ms != 100)
+        summary = results.summary()
+        tool = summary["tools"]["calculate_damage_output"]
+        assert tool["calls"] == 100
+        assert tool["errors"] == 1
+        assert tool["p50_ms"] == 50
+        assert tool["p95_ms"] == 95
+        assert tool["p99_ms"] == 99
+        assert summary["throughput_per_second"] == 10.0
+
+    def test_load_mix(self, tmp_path):
+        path = tmp_path / "mix.json"
+        path.write_text(
+            '[{"tool": "get_usage_stats", '
+            '"arguments": {"pokemon_name": "incineroar"}, "weight": 3}]'
+        )
+        mix = load_mix(path)
+        assert mix[0].tool == "get_usage_stats"
+        assert mix[0].weight == 3
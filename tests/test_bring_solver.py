@@ -0,0 +1,146 @@
+"""Tests for the team preview (bring-4 / lead) game solver."""
+
+import pytest
+
+from vgc_mcp_core.calc.bring_solver import (
+    _strategies,
+    build_payoff_matrix,
+    fictitious_play,
+    prune_dominated,
+    solve_bring_game,
+)
+from vgc_mcp_core.calc.team_matchup import build_matchup_matrix, build_pokemon_profile
+from vgc_mcp_core.models.pokemon import BaseStats, EVSpread, Nature, PokemonBuild
+from vgc_mcp_core.team.analysis_cache import get_team_analysis_cache, reset_team_analysis_cache
+
+INCINEROAR_STATS = BaseStats(
+    hp=95, attack=115, defense=90, special_attack=80, special_defense=90, speed=60
+)
+FLUTTER_MANE_STATS = BaseStats(
+    hp=55, attack=55, defense=55, special_attack=135, special_defense=135, speed=135
+)
+RILLABOOM_STATS = BaseStats(
+    hp=100, attack=125, defense=90, special_attack=60, special_defense=70, speed=85
+)
+
+
+def _build(name, stats, types, nature=Nature.SERIOUS, evs=None):
+    return PokemonBuild(name=name, base_stats=stats, types=types, nature=nature,
+                        evs=evs or EVSpread())
+
+
+def _profiles(names):
+    return [
+        build_pokemon_profile(_build(name, INCINEROAR_STATS, ["Fire", "Dark"]), [], "")
+        for name in names
+    ]
+
+
+class TestStrategies:
+    """Bring-4 x lead enumeration."""
+
+    @pytest.mark.parametrize("size,expected", [(6, 90), (5, 30), (4, 6), (3, 3), (2, 1)])
+    def test_counts(self, size, expected):
+        assert len(_strategies(size)) == expected
+
+    def test_leads_are_inside_bring(self):
+        for bring, lead in _strategies(6):
+            assert bin(bring).count("1") == 4
+            assert lead & bring == lead and bin(lead).count("1") == 2
+
+
+class TestSolvers:
+    """Pruning and fictitious play on small games."""
+
+    def test_rock_paper_scissors(self):
+        payoffs = [[0, -1, 1], [1, 0, -1], [-1, 1, 0]]
+        rows, cols, value, gap, _ = fictitious_play(payoffs, iterations=20000, tolerance=0.01)
+        assert all(p == pytest.approx(1 / 3, abs=0.05) for p in rows + cols)
+        assert value == pytest.approx(0, abs=0.02)
+        assert gap <= 0.05
+
+    def test_saddle_point_found(self):
+        payoffs = [[3, 5], [1, 4]]
+        rows, cols, value, _, _ = fictitious_play(payoffs)
+        assert rows[0] == pytest.approx(1, abs=0.01)
+        assert cols[0] == pytest.approx(1, abs=0.01)
+        assert value == pytest.approx(3, abs=0.05)
+
+    def test_prune_dominated(self):
+        payoffs = [
+            [1, 2, 3],
+            [0, 1, 2],  # dominated by row 0
+            [2, 0, 1],
+        ]
+        rows, cols = prune_dominated(payoffs)
+        assert 1 not in rows
+        # Column 2 is worse for the minimiser than column 1 everywhere
+        assert 2 not in cols
+
+
+class TestPayoffMatrix:
+    """Incremental payoff construction."""
+
+    def test_matches_direct_computation(self):
+        matrix = [[(i * 7 + j * 3) % 11 - 5 for j in range(6)] for i in range(6)]
+        strategies = _strategies(6)
+        payoffs = build_payoff_matrix(matrix, strategies, strategies, lead_weight=0.4)
+
+        def direct(ours, theirs):
+            yours = [i for i in range(6) if ours >> i & 1]
+            their = [j for j in range(6) if theirs >> j & 1]
+            attack = sum(max(matrix[i][j] for i in yours) for j in their) / len(their)
+            defend = sum(min(matrix[i][j] for j in their) for i in yours) / len(yours)
+            return (attack + defend) / 2
+
+        for r in (0, 17, 89):
+            for c in (3, 45, 88):
+                (bring, lead), (their_bring, their_lead) = strategies[r], strategies[c]
+                expected = 0.4 * direct(lead, their_lead) + 0.6 * direct(bring, their_bring)
+                assert payoffs[r][c] == pytest.approx(expected)
+
+
+class TestSolveBringGame:
+    """End-to-end team preview solve."""
+
+    def test_dominant_pokemon_always_brought(self):
+        names = ["a", "b", "c", "d", "e", "f"]
+        matrix = [[40.0] * 6] + [[0.0] * 6 for _ in range(5)]
+        solution = solve_bring_game(_profiles(names), _profiles(names), matrix=matrix)
+        assert solution.your_bring_rates["a"] == 100.0
+        assert solution.strategies == (90, 90)
+        assert solution.pruned[0] > 0
+        assert sum(s.probability for s in solution.your_strategy) == pytest.approx(1, abs=0.05)
+
+    def test_full_solve_from_profiles(self):
+        ours = [
+            build_pokemon_profile(_build("incineroar", INCINEROAR_STATS, ["Fire", "Dark"],
+                                         Nature.ADAMANT, EVSpread(hp=252, attack=252)), [], ""),
+            build_pokemon_profile(_build("flutter-mane", FLUTTER_MANE_STATS, ["Ghost", "Fairy"],
+                                         Nature.TIMID, EVSpread(special_attack=252, speed=252)),
+                                  [], ""),
+            build_pokemon_profile(_build("rillaboom", RILLABOOM_STATS, ["Grass"]), [], ""),
+        ]
+        solution = solve_bring_game(ours, ours[::-1])
+        assert solution.strategies == (3, 3)
+        assert solution.exploitability <= 0.05 or solution.notes
+        assert set(solution.your_lead_rates) == {"incineroar", "flutter-mane", "rillaboom"}
+
+    def test_scores_shared_with_matchup_matrix(self):
+        ours = [build_pokemon_profile(_build("incineroar", INCINEROAR_STATS, ["Fire", "Dark"]),
+                                      [], ""),
+                build_pokemon_profile(_build("flutter-mane", FLUTTER_MANE_STATS,
+                                             ["Ghost", "Fairy"]), [], "")]
+        theirs = [build_pokemon_profile(_build("rillaboom", RILLABOOM_STATS, ["Grass"]), [], ""),
+                  build_pokemon_profile(_build("amoonguss", RILLABOOM_STATS, ["Grass"]), [], "")]
+        reset_team_analysis_cache()
+        build_matchup_matrix([p.build for p in ours], [p.build for p in theirs])
+        misses = get_team_analysis_cache().pair_misses
+
+        solve_bring_game(ours, theirs)
+        assert get_team_analysis_cache().pair_misses == misses
+        reset_team_analysis_cache()
+
+    def test_needs_two_pokemon(self):
+        with pytest.raises(ValueError):
+            solve_bring_game(_profiles(["a"]), _profiles(["b", "c"]))
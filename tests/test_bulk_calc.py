@@ -10,12 +10,15 @@ from vgc_mcp_core.calc.bulk_calc import (
     DEFAULT_SCENARIOS,
     BulkCalcResult,
     BulkCalcSummary,
+    BulkCalcTable,
     ScenarioConfig,
     build_calc_string,
     build_scenario_modifiers,
     get_best_move_per_defender,
+    get_result,
     get_results_for_defender,
     get_results_for_scenario,
+    merge_bulk_summaries,
     run_bulk_calcs,
 )
 from vgc_mcp_core.calc.damage import calculate_damage
@@ -487,6 +490,76 @@ class TestResultFiltering:
         assert best["incineroar"].max_pct == max_pct
 
 
+class TestBulkCalcTable:
+    """Columnar results with indexed lookups and calc strings rendered on read."""
+
+    @pytest.fixture
+    def summary(self, urshifu, incineroar, flutter_mane, surging_strikes, close_combat):
+        scenarios = [DEFAULT_SCENARIOS["normal"], DEFAULT_SCENARIOS["rain"]]
+        return run_bulk_calcs(
+            urshifu, [surging_strikes, close_combat], [incineroar, flutter_mane], scenarios,
+        )
+
+    def test_indexes_match_linear_filtering(self, summary):
+        rows = list(summary.results)
+        indexed = summary.results.rows(defender="flutter-mane", scenario="rain")
+        assert [r.calc_string for r in indexed] == [
+            r.calc_string for r in rows
+            if r.defender_name == "flutter-mane" and r.scenario_name == "rain"
+        ]
+        assert len(summary.results.rows(move="close-combat")) == 4
+        assert summary.results.rows(defender="amoonguss") == []
+
+    def test_cell_lookup(self, summary):
+        r = get_result(summary, "incineroar", "close-combat", "rain")
+        assert (r.defender_name, r.move_name, r.scenario_name) == (
+            "incineroar", "close-combat", "rain"
+        )
+        assert get_result(summary, "incineroar", "close-combat", "sun") is None
+
+    def test_calc_strings_match_eager_build(
+        self, summary, urshifu, flutter_mane, close_combat
+    ):
+        scenario = DEFAULT_SCENARIOS["rain"]
+        mods = build_scenario_modifiers(scenario, urshifu, close_combat)
+        mods.defender_item = flutter_mane.item
+        mods.defender_ability = flutter_mane.ability
+        result = calculate_damage(urshifu, flutter_mane, close_combat, mods)
+
+        row = get_result(summary, "flutter-mane", "close-combat", "rain")
+        assert row.calc_string == build_calc_string(
+            urshifu, flutter_mane, close_combat, result, scenario
+        )
+        assert row.to_result().ko_chance == result.ko_chance
+
+    def test_same_species_builds_render_their_own_strings(
+        self, urshifu, incineroar, surging_strikes
+    ):
+        bulky = incineroar.model_copy(update={"evs": EVSpread(hp=252, defense=252)})
+        scenarios = [DEFAULT_SCENARIOS["normal"]]
+        summary = run_bulk_calcs(urshifu, [surging_strikes], [incineroar, bulky], scenarios)
+        other = run_bulk_calcs(urshifu, [surging_strikes], [bulky], scenarios)
+        summary.results.extend(other.results)
+
+        expected = []
+        for build in (incineroar, bulky, bulky):
+            mods = build_scenario_modifiers(scenarios[0], urshifu, surging_strikes)
+            mods.defender_item = build.item
+            mods.defender_ability = build.ability
+            result = calculate_damage(urshifu, build, surging_strikes, mods)
+            expected.append(
+                build_calc_string(urshifu, build, surging_strikes, result, scenarios[0])
+            )
+        assert [r.calc_string for r in summary.results] == expected
+        assert expected[0] != expected[1]
+
+    def test_result_lists_are_converted(self):
+        summary = _make_bulk_summary()
+        assert isinstance(summary.results, BulkCalcTable)
+        assert summary.results[-1].calc_string.startswith("[Rain]")
+        assert get_result(summary, "flutter-mane", "close-combat", "normal").max_pct == 53.0
+
+
 # =============================================================================
 # Tests: Scenario edge cases
 # =============================================================================
@@ -660,6 +733,28 @@ class TestDefenderTera:
         assert summary_none.results[0].max_pct == summary_empty.results[0].max_pct
 
 
+# =============================================================================
+# Tests: Merging per-defender runs
+# =============================================================================
+
+class TestMergeBulkSummaries:
+
+    def test_merge_matches_single_run(self, urshifu, incineroar, flutter_mane, surging_strikes):
+        """Running defenders one at a time and merging gives the same summary."""
+        scenarios = [DEFAULT_SCENARIOS["normal"], DEFAULT_SCENARIOS["rain"]]
+        whole = run_bulk_calcs(urshifu, [surging_strikes], [incineroar, flutter_mane], scenarios)
+        merged = merge_bulk_summaries([
+            run_bulk_calcs(urshifu, [surging_strikes], [defender], scenarios)
+            for defender in (incineroar, flutter_mane)
+        ])
+
+        assert merged.total_calcs == whole.total_calcs
+        assert merged.ohko_counts == whole.ohko_counts
+        assert merged.twohko_counts == whole.twohko_counts
+        assert merged.defender_spreads == whole.defender_spreads
+        assert [r.calc_string for r in merged.results] == [r.calc_string for r in whole.results]
+
+
 # =============================================================================
 # Tests: Sword of Ruin auto-detection in bulk calcs
 # =============================================================================
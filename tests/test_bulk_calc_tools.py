@@ -6,7 +6,9 @@ from unittest.mock import AsyncMock, MagicMock
 from mcp.server.fastmcp import FastMCP
 
 from vgc_mcp.tools.bulk_calc_tools import register_bulk_calc_tools, _parse_ev_string
+from vgc_mcp_core.models.move import Move, MoveCategory
 from vgc_mcp_core.models.pokemon import BaseStats
+from vgc_mcp_core.progress import get_result_store, reset_result_store
 
 
 @pytest.fixture
@@ -94,6 +96,41 @@ class TestCalculateBulkOffensiveCalcs:
         )
         assert "error" in result or isinstance(result, dict)
 
+    async def test_progress_and_pagination(self, tools, mock_pokeapi, monkeypatch):
+        """Each defender is reported as it finishes; rows past page_size sit behind a cursor."""
+        monkeypatch.setattr(
+            "vgc_mcp.tools.multicalc_tools._get_common_spread", AsyncMock(return_value=None)
+        )
+        mock_pokeapi.get_move = AsyncMock(return_value=Move(
+            name="close-combat", type="fighting", category=MoveCategory.PHYSICAL,
+            power=120, accuracy=100,
+        ))
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock()
+        reset_result_store()
+
+        fn = tools["calculate_bulk_offensive_calcs"].fn
+        result = await fn(
+            attacker_name="urshifu",
+            move_names=["close-combat"],
+            defender_names=["incineroar", "rillaboom", "amoonguss"],
+            attacker_evs="4/252/0/0/0/252",
+            page_size=2,
+            ctx=ctx,
+        )
+
+        assert ctx.report_progress.await_count >= 2
+        assert ctx.report_progress.await_args.args[:2] == (3, 3)
+        assert "best so far" in ctx.report_progress.await_args.args[2]
+        assert list(result["results_by_defender"]) == ["incineroar", "rillaboom"]
+        assert len(result["calc_strings"]) == 2
+        assert result["total_defenders"] == 3
+
+        rest = get_result_store().page(result["next_cursor"])
+        assert [row["defender"] for row in rest["items"]] == ["amoonguss"]
+        assert rest["next_cursor"] is None
+        reset_result_store()
+
 
 class TestExportDamageReport:
     """Tests for export_damage_report."""
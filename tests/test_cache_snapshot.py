@@ -0,0 +1,170 @@
+"""Tests for compressed cache values and warm-start snapshots."""
+
+import pickle
+import sqlite3
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from vgc_mcp.cache_cli import main as cache_cli
+from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.api.snapshot import (
+    read_manifest,
+    restore_snapshot,
+    warm_cache,
+    write_snapshot,
+)
+
+from .conftest import FakePokeAPI, FakeRegulation, FakeSmogon
+
+BIG_VALUE = {"stats": [{"base_stat": i, "stat": {"name": "speed"}} for i in range(2000)]}
+
+
+def _stored_bytes(cache_dir) -> int:
+    """Bytes the cache holds for values (inline in SQLite plus value files)."""
+    with sqlite3.connect(cache_dir / "cache.db") as db:
+        inline = sum(len(v) for (v,) in db.execute(
+            "SELECT value FROM Cache WHERE typeof(value) = 'blob'"))
+    files = sum(f.stat().st_size for f in cache_dir.rglob("*.val"))
+    return inline + files
+
+
+class TestCompressedValues:
+    """APICache compresses large values transparently."""
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_round_trip_and_smaller(self, tmp_path, codec):
+        with APICache(str(tmp_path), codec=codec) as cache:
+            cache.set("pokeapi", "pokemon/incineroar", value=BIG_VALUE)
+            cache.set("pokeapi", "small", value={"a": 1})
+            assert cache.get("pokeapi", "pokemon/incineroar") == BIG_VALUE
+            assert cache.get("pokeapi", "small") == {"a": 1}
+        assert _stored_bytes(tmp_path) < len(pickle.dumps(BIG_VALUE)) / 5
+
+    def test_uncompressed_entries_still_read(self, tmp_path):
+        with APICache(str(tmp_path), codec="none") as cache:
+            cache.set("pokeapi", "pokemon/incineroar", value=BIG_VALUE)
+        with APICache(str(tmp_path)) as cache:
+            assert cache.get("pokeapi", "pokemon/incineroar") == BIG_VALUE
+
+    def test_unknown_codec(self, tmp_path):
+        with pytest.raises(ValueError):
+            APICache(str(tmp_path), codec="brotli")
+
+
+def _populated_cache(cache_dir) -> None:
+    with APICache(str(cache_dir)) as cache:
+        cache.set("pokeapi", "pokemon/incineroar", value=BIG_VALUE)
+        cache.set("smogon", "latest/gen9vgc2026regf/0", value={"month": "2026-09"})
+
+
+class TestSnapshots:
+    """Snapshots restore into empty caches only."""
+
+    def test_round_trip(self, tmp_path):
+        _populated_cache(tmp_path / "build")
+        snapshot = tmp_path / "snap.tar.xz"
+        manifest = write_snapshot(tmp_path / "build", snapshot, {"pokemon": 1})
+        assert manifest["bytes"] == snapshot.stat().st_size
+        assert read_manifest(snapshot)["summary"] == {"pokemon": 1}
+
+        target = tmp_path / "serve" / "cache"
+        restored = restore_snapshot(snapshot, target)
+        assert restored is not None and restored["restore_seconds"] >= 0
+        with APICache(str(target)) as cache:
+            assert cache.get("pokeapi", "pokemon/incineroar") == BIG_VALUE
+            assert cache.get("smogon", "latest/gen9vgc2026regf/0") == {"month": "2026-09"}
+
+    def test_old_snapshot_restores_unexpired(self, tmp_path):
+        _populated_cache(tmp_path / "build")
+        snapshot = tmp_path / "snap.tar.xz"
+        write_snapshot(tmp_path / "build", snapshot)
+
+        # Past APICache.DEFAULT_EXPIRE (7 days) after the build
+        later = time.time() + 8 * 24 * 60 * 60
+        target = tmp_path / "cache"
+        with patch("time.time", return_value=later):
+            assert restore_snapshot(snapshot, target) is not None
+            with APICache(str(target)) as cache:
+                assert cache.get("pokeapi", "pokemon/incineroar") == BIG_VALUE
+        with patch("time.time", return_value=later + APICache.DEFAULT_EXPIRE + 60):
+            with APICache(str(target)) as cache:
+                assert cache.get("pokeapi", "pokemon/incineroar") is None
+
+    def test_populated_cache_left_alone(self, tmp_path):
+        _populated_cache(tmp_path / "build")
+        snapshot = tmp_path / "snap.tar.xz"
+        write_snapshot(tmp_path / "build", snapshot)
+
+        target = tmp_path / "cache"
+        with APICache(str(target)) as cache:
+            cache.set("pokeapi", "mine", value=1)
+        assert restore_snapshot(snapshot, target) is None
+        assert restore_snapshot(snapshot, target, force=True) is not None
+        with APICache(str(target)) as cache:
+            assert cache.get("pokeapi", "mine") is None
+            assert cache.get("pokeapi", "pokemon/incineroar") == BIG_VALUE
+
+    def test_missing_or_incompatible_snapshot(self, tmp_path, monkeypatch):
+        assert restore_snapshot(tmp_path / "none.tar.xz", tmp_path / "cache") is None
+
+        _populated_cache(tmp_path / "build")
+        snapshot = tmp_path / "snap.tar.xz"
+        write_snapshot(tmp_path / "build", snapshot)
+        monkeypatch.setattr("vgc_mcp_core.api.snapshot.SNAPSHOT_VERSION", 99)
+        assert restore_snapshot(snapshot, tmp_path / "cache") is None
+        assert not (tmp_path / "cache" / "cache.db").exists()
+
+    def test_cli_info_and_restore(self, tmp_path, capsys):
+        _populated_cache(tmp_path / "build")
+        snapshot = tmp_path / "snap.tar.xz"
+        write_snapshot(tmp_path / "build", snapshot)
+
+        assert cache_cli(["info", str(snapshot)]) == 0
+        assert '"snapshot_version": 1' in capsys.readouterr().out
+        target = tmp_path / "cache"
+        assert cache_cli(["restore", str(snapshot), "--cache-dir", str(target)]) == 0
+        assert cache_cli(["restore", str(snapshot), "--cache-dir", str(target)]) == 1
+
+
+class WarmSmogon(FakeSmogon):
+    """Adds the prefetch and history calls warm_cache makes."""
+
+    regulation_config = FakeRegulation("gen9vgc2026regf")
+    RATING_CUTOFFS = [0, 1760]
+
+    def keep_snapshots(self, count):
+        pass
+
+    async def refresh_usage_stats(self, fmt, rating):
+        return SimpleNamespace(month="2026-09") if rating == 0 else None
+
+    async def get_usage_history(self, rating=0, months=6):
+        return SimpleNamespace(months=["2026-08", "2026-09"])
+
+
+class TestWarmCache:
+    """warm_cache fetches the dex, usage and top Pokemon."""
+
+    async def test_summary(self):
+        pokeapi = FakePokeAPI(
+            pokemon={"Incineroar": {}, "Flutter Mane": {}},
+            move_data={"fake-out": {}, "knock-off": {}, "moonblast": {}},
+            names={"pokemon": 1300},
+        )
+        smogon = WarmSmogon(usage={
+            "Incineroar": {"moves": {"fake-out": 50, "knock-off": 50}},
+            "Flutter Mane": {"moves": {"moonblast": 50, "bad-move": 50}},
+        })
+        summary = await warm_cache(pokeapi, smogon, top_pokemon=2)
+
+        assert summary["names"] == {"pokemon": 1300}
+        assert summary["usage"]["available"] == {"gen9vgc2026regf/0": "2026-09"}
+        assert summary["usage"]["missing"] == ["gen9vgc2026regf/1760"]
+        assert summary["history_months"] == 2
+        assert summary["pokemon"] == 2 and summary["moves"] == 4
+        assert summary["failed"] == ["move/bad-move"]
+        assert "Flutter Mane" in pokeapi.fetched
+        assert "fake-out" in pokeapi.fetched
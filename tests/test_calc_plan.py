@@ -0,0 +1,203 @@
+"""Tests for compiled damage calc plans."""
+
+import pytest
+
+from vgc_mcp_core.calc.damage import (
+    CalcPlanCache,
+    DamageBounds,
+    calculate_damage,
+    calculate_damage_bounds,
+    compile_calc_plan,
+    evaluate_calc_plan,
+    get_calc_plan_cache,
+    reset_calc_plan_cache,
+    screen_survival,
+)
+from vgc_mcp_core.calc.modifiers import DamageModifiers
+from vgc_mcp_core.calc.stats import calculate_all_stats
+from vgc_mcp_core.models.move import Move, MoveCategory
+from vgc_mcp_core.models.pokemon import BaseStats, EVSpread, Nature, PokemonBuild
+
+FLUTTER_MANE = PokemonBuild(
+    name="flutter-mane",
+    base_stats=BaseStats(hp=55, attack=55, defense=55, special_attack=135,
+                         special_defense=135, speed=135),
+    types=["Ghost", "Fairy"],
+    nature=Nature.MODEST,
+    evs=EVSpread(special_attack=252),
+    item="choice-specs",
+)
+INCINEROAR = PokemonBuild(
+    name="incineroar",
+    base_stats=BaseStats(hp=95, attack=115, defense=90, special_attack=80,
+                         special_defense=90, speed=60),
+    types=["Fire", "Dark"],
+    nature=Nature.CAREFUL,
+    item="assault-vest",
+    ability="intimidate",
+)
+GHOLDENGO = PokemonBuild(
+    name="gholdengo",
+    base_stats=BaseStats(hp=87, attack=60, defense=95, special_attack=133,
+                         special_defense=91, speed=84),
+    types=["Steel", "Ghost"],
+    ability="good-as-gold",
+)
+
+MOONBLAST = Move(name="moonblast", type="fairy", category=MoveCategory.SPECIAL, power=95)
+GYRO_BALL = Move(name="gyro-ball", type="steel", category=MoveCategory.PHYSICAL, power=1,
+                 makes_contact=True)
+TERA_BLAST = Move(name="tera-blast", type="normal", category=MoveCategory.SPECIAL, power=80)
+SURGING_STRIKES = Move(name="surging-strikes", type="water", category=MoveCategory.PHYSICAL,
+                       power=25, makes_contact=True)
+URSHIFU = PokemonBuild(
+    name="urshifu-rapid-strike",
+    base_stats=BaseStats(hp=100, attack=130, defense=100, special_attack=63,
+                         special_defense=60, speed=97),
+    types=["Fighting", "Water"],
+    nature=Nature.ADAMANT,
+    evs=EVSpread(attack=252),
+    item="mystic-water",
+    ability="unseen-fist",
+)
+
+
+def _with_evs(build: PokemonBuild, **evs) -> PokemonBuild:
+    return build.model_copy(update={"evs": EVSpread(**evs)})
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    reset_calc_plan_cache()
+    yield
+    reset_calc_plan_cache()
+
+
+class TestCompileCalcPlan:
+    """Stat-independent work resolved up front."""
+
+    def test_chains_resolved(self):
+        plan = compile_calc_plan(FLUTTER_MANE, INCINEROAR, MOONBLAST,
+                                 DamageModifiers(helping_hand=True))
+        assert plan.attack_stat_name == "special_attack"
+        assert plan.defense_stat_name == "special_defense"
+        assert plan.attack_mods == (6144,)  # Choice Specs
+        assert plan.defense_mods == (6144,)  # Assault Vest
+        assert plan.power == 95
+        assert plan.stab_mod == 6144
+        assert plan.final_mod == 6144  # Helping Hand
+        assert "STAB (1.5x)" in plan.labels
+
+    def test_immunity_needs_no_stats(self):
+        levitating = INCINEROAR.model_copy(update={"ability": "levitate"})
+        earthquake = Move(name="earthquake", type="ground", category=MoveCategory.PHYSICAL,
+                          power=100)
+        plan = compile_calc_plan(FLUTTER_MANE, levitating, earthquake, DamageModifiers())
+        result = evaluate_calc_plan(plan, {}, {})
+        assert result.ko_chance == "Immune (Levitate)"
+        assert result.rolls == [0] * 16
+
+    def test_evaluation_matches_calculate_damage(self):
+        plan = compile_calc_plan(FLUTTER_MANE, INCINEROAR, MOONBLAST, DamageModifiers())
+        for spd in (0, 100, 252):
+            defender = _with_evs(INCINEROAR, hp=252, special_defense=spd)
+            direct = evaluate_calc_plan(
+                plan, calculate_all_stats(FLUTTER_MANE), calculate_all_stats(defender)
+            )
+            assert direct == calculate_damage(FLUTTER_MANE, defender, MOONBLAST)
+
+
+class TestCalcPlanCache:
+    """Plans shared across calls that only change stats."""
+
+    def test_ev_changes_reuse_plan(self):
+        for spd in (0, 4, 12, 252):
+            calculate_damage(FLUTTER_MANE, _with_evs(INCINEROAR, special_defense=spd), MOONBLAST)
+        cache = get_calc_plan_cache()
+        assert (cache.misses, cache.hits) == (1, 3)
+
+        calculate_damage(FLUTTER_MANE, INCINEROAR.model_copy(update={"item": "sitrus-berry"}),
+                         MOONBLAST)
+        calculate_damage(FLUTTER_MANE, INCINEROAR, MOONBLAST, DamageModifiers(weather="sun"))
+        assert cache.misses == 3
+
+    def test_speed_based_power_evaluated_per_call(self):
+        slow = _with_evs(GHOLDENGO)
+        fast = _with_evs(GHOLDENGO, speed=252)
+        target = _with_evs(FLUTTER_MANE, speed=252)
+        slow_result = calculate_damage(slow, target, GYRO_BALL)
+        fast_result = calculate_damage(fast, target, GYRO_BALL)
+        assert get_calc_plan_cache().hits == 1
+        assert slow_result.details["base_power"] > fast_result.details["base_power"]
+
+    def test_tera_blast_category_follows_stats(self):
+        mods = DamageModifiers(tera_active=True, tera_type="fire")
+        special = calculate_damage(GHOLDENGO, INCINEROAR, TERA_BLAST, mods)
+        physical_build = GHOLDENGO.model_copy(update={
+            "nature": Nature.ADAMANT, "evs": EVSpread(attack=252),
+            "base_stats": GHOLDENGO.base_stats.model_copy(update={"attack": 140}),
+        })
+        physical = calculate_damage(physical_build, INCINEROAR, TERA_BLAST, mods)
+        assert special.details["defender_stat"] != physical.details["defender_stat"]
+        assert get_calc_plan_cache().misses == 2
+
+    def test_lru_eviction(self):
+        cache = CalcPlanCache(max_entries=2)
+        moves = [MOONBLAST.model_copy(update={"power": power}) for power in (80, 90, 95)]
+        for move in moves:
+            cache.get(FLUTTER_MANE, INCINEROAR, move, DamageModifiers())
+        assert len(cache) == 2
+
+        cache.get(FLUTTER_MANE, INCINEROAR, moves[2], DamageModifiers())
+        assert cache.hits == 1
+        cache.get(FLUTTER_MANE, INCINEROAR, moves[0], DamageModifiers())
+        assert cache.misses == 4
+
+
+class TestDamageBounds:
+    """Two-roll bounds agree with the full 16-roll calc."""
+
+    @pytest.mark.parametrize("attacker,move", [
+        (FLUTTER_MANE, MOONBLAST),
+        (URSHIFU, SURGING_STRIKES),
+        (GHOLDENGO, GYRO_BALL),
+    ])
+    def test_bounds_match_calculate_damage(self, attacker, move):
+        for hp in (0, 124, 252):
+            for bulk in (0, 100, 252):
+                defender = _with_evs(INCINEROAR, hp=hp, defense=bulk, special_defense=bulk)
+                bounds = calculate_damage_bounds(attacker, defender, move)
+                result = calculate_damage(attacker, defender, move)
+                assert bounds.min_damage == result.min_damage
+                assert bounds.max_damage == result.max_damage
+                assert bounds.defender_hp == result.defender_hp
+                assert bounds.damage_range == result.damage_range
+                assert bounds.is_guaranteed_ohko == result.is_guaranteed_ohko
+                assert bounds.is_possible_ohko == result.is_possible_ohko
+
+    def test_immunity(self):
+        earthquake = Move(name="earthquake", type="ground", category=MoveCategory.PHYSICAL,
+                          power=100)
+        bounds = calculate_damage_bounds(FLUTTER_MANE, INCINEROAR.model_copy(
+            update={"ability": "levitate"}), earthquake)
+        assert bounds == DamageBounds(min_damage=0, max_damage=0, defender_hp=1)
+        assert not bounds.is_possible_ohko
+
+    def test_classification(self):
+        assert DamageBounds(50, 60, 100).is_possible_ohko is False
+        assert DamageBounds(100, 118, 100).is_guaranteed_ohko
+        ambiguous = DamageBounds(90, 106, 100)
+        assert ambiguous.is_ambiguous
+        assert ambiguous.is_possible_ohko and not ambiguous.is_guaranteed_ohko
+
+    def test_screen_survival_counts_rolls(self):
+        calls = 0
+        for hp in range(0, 253, 4):
+            defender = _with_evs(INCINEROAR, hp=hp)
+            bounds, survival = screen_survival(FLUTTER_MANE, defender, MOONBLAST)
+            result = calculate_damage(FLUTTER_MANE, defender, MOONBLAST)
+            expected = sum(1 for r in result.rolls if r < result.defender_hp) / 16 * 100
+            assert survival == expected
+            calls += bounds.is_ambiguous
+        # Most HP investments are settled by the bounds alone
+        assert calls < 10
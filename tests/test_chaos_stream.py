@@ -0,0 +1,128 @@
+"""Tests for streaming chaos JSON ingest."""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.api.chaos_stream import ChaosStreamParser, compact_species, parse_chaos
+from vgc_mcp_core.api.smogon import SmogonStatsClient
+
+FORMAT = "gen9vgc2026regf"
+
+
+def _species(i: int) -> dict:
+    return {
+        "Raw count": 1000 + i,
+        "usage": 0.5 / (i + 1),
+        "Abilities": {"Intimidate": 90.5, "Blaze": 9.5},
+        "Items": {f"Item {j}": float(j) for j in range(20)},
+        "Moves": {"Fake Out": 80.0, "": 1.0},
+        "Spreads": {f"Careful:252/{j}/0/0/252/0": float(j) for j in range(50)},
+        "Teammates": {"Flutter Mane": 30.0},
+        "Tera Types": {"Ghost": 60.0, "Grass": 40.0},
+        "Checks and Counters": {f"Mon {j}": [100.0, 0.6, 0.1] for j in range(60)},
+        "Happiness": {"255": 100.0},
+        "Viability Ceiling": [100, 90, 80, 70],
+    }
+
+
+def _chaos(count: int = 30) -> dict:
+    return {
+        "info": {"metagame": FORMAT, "cutoff": 0, "number of battles": 5000},
+        "data": {f"Pokémon {i}": _species(i) for i in range(count)},
+    }
+
+
+def _compact(data: dict) -> dict:
+    return {
+        "info": data["info"],
+        "data": {name: compact_species(entry) for name, entry in data["data"].items()},
+    }
+
+
+class TestChaosStreamParser:
+    """Incremental parsing into compact records."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 13, 4096, None])
+    def test_matches_full_parse(self, chunk_size):
+        data = _chaos(8)
+        raw = json.dumps(data, indent=2, ensure_ascii=False).encode()
+        assert parse_chaos(raw, chunk_size) == _compact(data)
+
+    def test_only_used_fields_kept(self):
+        record = parse_chaos(json.dumps(_chaos(1)))["data"]["Pokémon 0"]
+        assert "Checks and Counters" not in record and "Happiness" not in record
+        assert record["Raw count"] == 1000
+        assert record["Tera Types"] == {"Ghost": 60.0, "Grass": 40.0}
+
+    def test_buffer_bounded_by_largest_species(self):
+        peaks = []
+        for count in (20, 200):
+            raw = json.dumps(_chaos(count)).encode()
+            parser = ChaosStreamParser()
+            for start in range(0, len(raw), 4096):
+                parser.feed(raw[start:start + 4096])
+            assert len(parser.close()["data"]) == count
+            peaks.append(parser.peak_buffered)
+        # Ten times the species, same buffer: a couple of entries plus a chunk
+        species_size = len(json.dumps(_species(0)))
+        assert all(peak < 3 * species_size + 4096 for peak in peaks)
+
+    @pytest.mark.parametrize("raw", [
+        b'{"info": {}, "data": {"A": {"usage": 0.1}}',  # truncated
+        b'{"data": {"A": {"usage": 0.1}}} trailing',
+        b'{"data": ["A"]}',
+        b'{"data": {"A" {"usage": 0.1}}}',
+    ])
+    def test_malformed_raises_value_error(self, raw):
+        with pytest.raises(ValueError):
+            parse_chaos(raw, 7)
+
+    def test_unused_top_level_keys_skipped(self):
+        raw = b'{"extra": [1, 2, {"x": "}"}], "data": {}, "info": {"cutoff": 1760}}'
+        assert parse_chaos(raw, 3) == {"info": {"cutoff": 1760}, "data": {}}
+
+
+class TestClientStreaming:
+    """SmogonStatsClient downloads through the streaming parser."""
+
+    async def test_gzip_download_is_compacted_and_cached(self, tmp_path):
+        data = _chaos(5)
+        accept_encodings = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            accept_encodings.append(request.headers.get("accept-encoding", ""))
+            return httpx.Response(
+                200,
+                content=gzip.compress(json.dumps(data).encode()),
+                headers={"content-encoding": "gzip", "etag": '"v1"'},
+                request=request,
+            )
+
+        client = SmogonStatsClient(APICache(str(tmp_path / "cache")))
+        client._get_recent_months = lambda count=4: ["2026-09"][:count]
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            snapshot = await client.refresh_usage_stats(FORMAT, 0)
+            assert "gzip" in accept_encodings[0]
+            assert snapshot.data == _compact(data)
+            assert snapshot.pointer["etag"] == '"v1"'
+            assert client.cache.get("smogon", f"2026-09/{FORMAT}/0") == _compact(data)
+        finally:
+            await client.close()
+            client.cache.close()
+
+    async def test_invalid_json_is_a_failed_fetch(self, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'{"data": {"A": ', request=request)
+
+        client = SmogonStatsClient(APICache(str(tmp_path / "cache")))
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            assert await client._try_fetch_stats("2026-09", FORMAT, 0) is None
+        finally:
+            await client.close()
+            client.cache.close()
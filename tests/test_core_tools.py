@@ -98,6 +98,48 @@ class TestSuggestTeamCompletion:
         assert "message" in result
         assert "full" in result["message"].lower()
 
+    async def test_complete_fills(self, tools, mock_team_manager, mock_smogon):
+        """Test suggestions and full fills come from the teammate matrix."""
+        from vgc_mcp_core.api.smogon import UsageSnapshot
+        from vgc_mcp_core.models.pokemon import BaseStats, PokemonBuild
+        from vgc_mcp_core.models.team import Team
+        from vgc_mcp_core.team.teammate_matrix import reset_teammate_matrices
+
+        teammates = {
+            "Incineroar": {"Rillaboom": 50, "Amoonguss": 30, "Tornadus": 20},
+            "Rillaboom": {"Incineroar": 60, "Tornadus": 40},
+            "Amoonguss": {"Incineroar": 70, "Rillaboom": 30},
+            "Tornadus": {"Rillaboom": 50, "Incineroar": 50},
+        }
+        data = {"data": {
+            name: {"usage": 0.5 - i * 0.1, "Teammates": mates}
+            for i, (name, mates) in enumerate(teammates.items())
+        }}
+        mock_smogon.get_usage_snapshot.return_value = UsageSnapshot.build(
+            data, "gen9vgc2026regi", 0, "2026-09"
+        )
+        team = Team()
+        team.add_pokemon(PokemonBuild(
+            name="incineroar", types=["Fire", "Dark"],
+            base_stats=BaseStats(hp=95, attack=115, defense=90, special_attack=80,
+                                 special_defense=90, speed=60),
+        ))
+        mock_team_manager.size = 1
+        mock_team_manager.team = team
+
+        reset_teammate_matrices()
+        try:
+            fn = tools["suggest_team_completion"].fn
+            result = await fn(limit=2, fills=1)
+        finally:
+            reset_teammate_matrices()
+
+        assert [s["name"] for s in result["suggestions"]][0] == "Rillaboom"
+        assert len(result["complete_fills"]) == 1
+        assert sorted(result["complete_fills"][0]["pokemon"]) == [
+            "Amoonguss", "Rillaboom", "Tornadus",
+        ]
+
 
 class TestSuggestPartnersWithSynergy:
     """Tests for suggest_partners_with_synergy."""
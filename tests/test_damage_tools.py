@@ -107,6 +107,28 @@ class TestCalculateDamageOutput:
         assert isinstance(result, dict)
         assert "error" not in result or "damage" in str(result).lower()
 
+    async def test_smogon_failure_flagged_as_fallback(self, mock_pokeapi):
+        """Neutral spreads standing in for failed Smogon lookups are flagged."""
+        smogon = MagicMock()
+        smogon.get_pokemon_usage = AsyncMock(side_effect=Exception("Smogon down"))
+        mcp = FastMCP("test")
+        register_damage_tools(mcp, mock_pokeapi, smogon)
+        fn = mcp._tool_manager._tools["calculate_damage_output"].fn
+        result = await fn(
+            attacker_name="flutter-mane",
+            defender_name="incineroar",
+            move_name="moonblast"
+        )
+        assert result["fallback"] is True
+
+        smogon.get_pokemon_usage = AsyncMock(return_value=None)
+        result = await fn(
+            attacker_name="flutter-mane",
+            defender_name="incineroar",
+            move_name="moonblast"
+        )
+        assert "fallback" not in result
+
 
 class TestFindKoEvs:
     """Tests for find_ko_evs."""
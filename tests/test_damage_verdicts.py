@@ -0,0 +1,63 @@
+"""Tests for KO probability analysis."""
+
+import itertools
+import random
+
+import pytest
+
+from vgc_mcp_core.utils.damage_verdicts import (
+    calculate_ko_probability,
+    calculate_multi_hit_ko_probability,
+)
+
+
+def _brute_force_chance(rolls: list[int], hp: int, hits: int) -> float:
+    combos = itertools.product(rolls, repeat=hits)
+    ko = sum(1 for combo in combos if sum(combo) >= hp)
+    return round(ko / len(rolls) ** hits * 100, 2)
+
+
+class TestCalculateKOProbability:
+    """Exact roll-combination probabilities."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_exhaustive_enumeration(self, seed):
+        rng = random.Random(seed)
+        base = rng.randint(20, 200)
+        rolls = [base * (85 + i) // 100 for i in range(16)]
+        hp = rng.randint(base, base * 4)
+
+        result = calculate_ko_probability(rolls, hp)
+        assert result.ohko_chance == _brute_force_chance(rolls, hp, 1)
+        assert result.twohko_chance == _brute_force_chance(rolls, hp, 2)
+        assert result.threehko_chance == _brute_force_chance(rolls, hp, 3)
+        assert result.fourhko_chance == _brute_force_chance(rolls, hp, 4)
+
+    def test_guaranteed_ohko(self):
+        result = calculate_ko_probability([200] * 16, 150)
+        assert result.ohko_chance == 100
+        assert result.guaranteed_ko == 1
+        assert result.rolls_that_ohko == 16
+
+    def test_partial_ohko(self):
+        rolls = [90 + i for i in range(16)]  # 90..105
+        result = calculate_ko_probability(rolls, 100)
+        assert result.rolls_that_ohko == 6
+        assert result.ohko_chance == 37.5
+        assert result.twohko_chance == 100
+
+    def test_no_rolls(self):
+        result = calculate_ko_probability([], 100)
+        assert result.ohko_chance == 0
+        assert result.verdict == "No damage"
+
+
+class TestMultiHitKOProbability:
+    """Multi-hit KO chances from the per-hit roll distribution."""
+
+    @pytest.mark.parametrize("hits,hp", [(2, 60), (3, 75), (5, 120), (5, 90), (5, 200)])
+    def test_matches_exhaustive_enumeration(self, hits, hp):
+        per_hit = [20 * (85 + i) // 100 for i in range(16)]
+        result = calculate_multi_hit_ko_probability(per_hit, hits, hp)
+        assert result.ohko_chance == _brute_force_chance(per_hit, hp, hits)
+        assert result.total_combinations == 16 ** hits
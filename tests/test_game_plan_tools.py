@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 from mcp.server.fastmcp import FastMCP
 
 from vgc_mcp.tools.game_plan_tools import register_game_plan_tools
+from vgc_mcp_core.models.move import Move, MoveCategory
 from vgc_mcp_core.models.pokemon import BaseStats
 from vgc_mcp_core.team.manager import TeamManager
 
@@ -74,3 +75,68 @@ class TestGenerateGamePlan:
         )
         # Should return a game plan or error if your team is empty
         assert "error" in result or "game_plan" in result or "leads" in str(result).lower()
+
+    async def test_turn_one_simulation_attached(self, tools, mock_pokeapi):
+        """Opt-in lead simulation ranks your lead pairs."""
+        mock_pokeapi.get_move = AsyncMock(side_effect=lambda name, user_name=None: Move(
+            name=name, type="fire", category=MoveCategory.PHYSICAL, power=90,
+        ))
+        fn = tools["generate_game_plan"].fn
+        result = await fn(
+            opponent_team=["incineroar", "arcanine", "ninetales"],
+            your_team=["incineroar", "arcanine", "ninetales"],
+            simulate_turn_one=True, simulation_samples=50,
+        )
+        simulation = result["turn_1_simulation"]
+        assert simulation["lead_pairings"] == 9
+        assert len(simulation["lead_pairs"]) == 3
+
+    async def test_reports_progress_per_stage(self, tools):
+        """Profiles, plan and simulation each send a progress notification."""
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock()
+        fn = tools["generate_game_plan"].fn
+        await fn(
+            opponent_team=["incineroar", "arcanine", "ninetales"],
+            your_team=["incineroar", "arcanine", "ninetales"],
+            ctx=ctx,
+        )
+        stages = [call.args[:2] for call in ctx.report_progress.await_args_list]
+        assert stages == [(1, 2), (2, 2)]
+        assert "best so far" in ctx.report_progress.await_args_list[1].args[2]
+
+    async def test_team_preview_solution_attached(self, tools):
+        """Opt-in bring/lead game solve is returned as mixed strategies."""
+        fn = tools["generate_game_plan"].fn
+        result = await fn(
+            opponent_team=["incineroar", "arcanine", "ninetales", "typhlosion", "houndoom"],
+            your_team=["incineroar", "arcanine", "ninetales", "typhlosion", "houndoom"],
+            solve_team_preview=True,
+        )
+        solution = result["team_preview_solution"]
+        assert solution["strategies"] == [30, 30]
+        total = sum(s["probability_percent"] for s in solution["your_strategy"])
+        assert total == pytest.approx(100, abs=5)
+
+
+class TestSimulateTurnOne:
+    """Tests for simulate_turn_one."""
+
+    async def test_requires_two_leads_each(self, tools):
+        fn = tools["simulate_turn_one"].fn
+        result = await fn(your_leads=["incineroar"], their_leads=["a", "b"])
+        assert "error" in result
+
+    async def test_reports_bounded_probabilities(self, tools, mock_pokeapi):
+        mock_pokeapi.get_move = AsyncMock(side_effect=lambda name, user_name=None: Move(
+            name=name, type="fire", category=MoveCategory.PHYSICAL, power=90,
+        ))
+        fn = tools["simulate_turn_one"].fn
+        result = await fn(
+            your_leads=["incineroar", "arcanine"],
+            their_leads=["ninetales", "typhlosion"],
+            samples=200,
+        )
+        assert result["samples"] == 200
+        for estimate in result["faint"].values():
+            assert estimate["low"] <= estimate["percent"] <= estimate["high"]
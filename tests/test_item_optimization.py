@@ -1,10 +1,14 @@
 """Tests for Life Orb optimization tools."""
 
 import pytest
+from vgc_mcp_core.calc.damage import calculate_damage
 from vgc_mcp_core.calc.item_optimization import (
+    ItemBenchmark,
     compare_items_damage,
     analyze_life_orb_sustainability,
-    calculate_ev_tradeoff
+    calculate_ev_tradeoff,
+    default_spread_items,
+    optimize_item_spreads,
 )
 from vgc_mcp_core.models.pokemon import PokemonBuild, Nature, EVSpread, IVSpread, BaseStats
 from vgc_mcp_core.models.move import Move, MoveCategory
@@ -221,5 +225,104 @@ class TestEVTradeoff:
         assert "BEST" in life_orb_result.recommendation or "best" in life_orb_result.recommendation.lower()
 
 
+GHOLDENGO = PokemonBuild(
+    name="gholdengo",
+    base_stats=BaseStats(
+        hp=87, attack=60, defense=95, special_attack=133, special_defense=91, speed=84
+    ),
+    types=["Steel", "Ghost"],
+    nature=Nature.MODEST,
+    evs=EVSpread(speed=36),
+    ability="good-as-gold",
+)
+FLUTTER_MANE = PokemonBuild(
+    name="flutter-mane",
+    base_stats=BaseStats(
+        hp=55, attack=55, defense=55, special_attack=135, special_defense=135, speed=135
+    ),
+    types=["Ghost", "Fairy"],
+    nature=Nature.TIMID,
+    evs=EVSpread(hp=4, special_attack=252, speed=252),
+    ability="protosynthesis",
+)
+SHADOW_BALL = Move(name="shadow-ball", power=80, type="ghost", category=MoveCategory.SPECIAL)
+MAKE_IT_RAIN = Move(name="make-it-rain", power=120, type="steel", category=MoveCategory.SPECIAL)
+
+
+class TestOptimizeItemSpreads:
+    """Test the joint item x EV spread search."""
+
+    def test_assault_vest_frees_evs(self):
+        """AV survives Shadow Ball with fewer bulk EVs than Choice Specs."""
+        benchmarks = [ItemBenchmark(FLUTTER_MANE, SHADOW_BALL, "survive")]
+        results = optimize_item_spreads(GHOLDENGO, benchmarks, ["choice-specs", "assault-vest"])
+
+        assert [r.item for r in results] == ["assault-vest", "choice-specs"]
+        assert all(r.meets_benchmarks for r in results)
+        assert results[0].spare_evs > results[1].spare_evs
+        assert results[0].rank == 1
+        assert results[1].evs["special_attack"] == 252
+
+    def test_results_match_damage_calc(self):
+        """Reported spreads pass their benchmarks in a plain damage calc."""
+        benchmarks = [
+            ItemBenchmark(FLUTTER_MANE, SHADOW_BALL, "survive"),
+            ItemBenchmark(FLUTTER_MANE, MAKE_IT_RAIN, "ko"),
+        ]
+        for result in optimize_item_spreads(GHOLDENGO, benchmarks, ["life-orb", "sitrus-berry"]):
+            evs = EVSpread(**result.evs)
+            build = GHOLDENGO.model_copy(update={"item": result.item, "evs": evs})
+            assert sum(result.evs.values()) <= 508
+            assert result.evs["speed"] == 36
+            assert not calculate_damage(FLUTTER_MANE, build, SHADOW_BALL).is_possible_ohko
+            assert calculate_damage(build, FLUTTER_MANE, MAKE_IT_RAIN).is_guaranteed_ohko
+
+    def test_bulk_is_minimal(self):
+        """One breakpoint less HP (or SpD) no longer survives."""
+        benchmarks = [ItemBenchmark(FLUTTER_MANE, SHADOW_BALL, "survive")]
+        result = optimize_item_spreads(GHOLDENGO, benchmarks, ["choice-specs"])[0]
+        hp, spd = result.evs["hp"], result.evs["special_defense"]
+        evs = EVSpread(hp=hp, special_defense=spd)
+        build = GHOLDENGO.model_copy(update={"item": "choice-specs", "evs": evs})
+        assert not calculate_damage(FLUTTER_MANE, build, SHADOW_BALL).is_possible_ohko
+        assert hp + spd < 252 + 252
+
+    def test_unreachable_benchmark_fails(self):
+        """A benchmark no spread meets is reported, not hidden."""
+        huge = Move(name="shadow-ball", power=250, type="ghost", category=MoveCategory.SPECIAL)
+        benchmarks = [ItemBenchmark(FLUTTER_MANE, huge, "survive")]
+        result = optimize_item_spreads(GHOLDENGO, benchmarks, ["life-orb"])[0]
+        assert not result.meets_benchmarks
+        assert result.failed_benchmarks == ["Survive flutter-mane's shadow-ball"]
+        assert not result.benchmark_results[0]["passes"]
+
+    def test_unreachable_bulk_split_across_defenses(self):
+        """Without a surviving spread, both benchmarked defenses share the EVs."""
+        huge = Move(name="shadow-ball", power=250, type="ghost", category=MoveCategory.SPECIAL)
+        punch = Move(name="shadow-claw", power=250, type="ghost", category=MoveCategory.PHYSICAL)
+        benchmarks = [
+            ItemBenchmark(FLUTTER_MANE, huge, "survive"),
+            ItemBenchmark(FLUTTER_MANE, punch, "survive"),
+        ]
+        result = optimize_item_spreads(GHOLDENGO, benchmarks, ["life-orb"])[0]
+        assert not result.meets_benchmarks
+        assert result.evs["hp"] == 252
+        defense, special_defense = result.evs["defense"], result.evs["special_defense"]
+        assert min(defense, special_defense) >= 108
+        assert abs(defense - special_defense) <= 4
+        assert sum(result.evs.values()) == 508
+
+    def test_default_items_follow_benchmarks(self):
+        """Type boosters for our attacks, resist berries for super effective hits."""
+        benchmarks = [
+            ItemBenchmark(FLUTTER_MANE, SHADOW_BALL, "survive"),
+            ItemBenchmark(FLUTTER_MANE, MAKE_IT_RAIN, "ko"),
+        ]
+        items = default_spread_items(GHOLDENGO, benchmarks)
+        assert "metal-coat" in items
+        assert "kasib-berry" in items
+        assert "assault-vest" in items
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -119,3 +119,28 @@ class TestAnalyzeItemEvTradeoff:
             target_benchmark=200
         )
         assert isinstance(result, dict)
+
+
+class TestOptimizeItemAndSpread:
+    """Tests for optimize_item_and_spread."""
+
+    async def test_ranks_items(self, tools):
+        """Each item gets a spread; results are ranked."""
+        fn = tools["optimize_item_and_spread"].fn
+        result = await fn(
+            pokemon_name="flutter-mane",
+            benchmarks=[{"pokemon": "flutter-mane", "move": "moonblast", "goal": "ko"}],
+            items_to_test=["choice-specs", "life-orb"],
+        )
+        assert [entry["rank"] for entry in result["items"]] == [1, 2]
+        assert result["recommendation"]["best_item"] == result["items"][0]["item"]
+        assert "showdown_paste" in result["recommendation"]
+
+    async def test_bad_goal(self, tools):
+        """Unknown goals are rejected."""
+        fn = tools["optimize_item_and_spread"].fn
+        result = await fn(
+            pokemon_name="flutter-mane",
+            benchmarks=[{"pokemon": "incineroar", "move": "moonblast", "goal": "2hko"}],
+        )
+        assert "error" in result
@@ -0,0 +1,144 @@
+"""Tests for the learnset bit matrix and batch moveset validation."""
+
+import pytest
+
+from vgc_mcp_core.validation.learnset import (
+    find_learners,
+    get_learnable_moves,
+    validate_moveset,
+    validate_movesets,
+)
+from vgc_mcp_core.validation.learnset_index import LearnsetIndex
+
+from .conftest import FakePokeAPI
+
+
+def _payload(name: str, moves: dict[str, list[str]]) -> dict:
+    return {
+        "name": name,
+        "moves": [
+            {
+                "move": {"name": move},
+                "version_group_details": [
+                    {"move_learn_method": {"name": method}} for method in methods
+                ],
+            }
+            for move, methods in moves.items()
+        ],
+    }
+
+
+POKEMON = {
+    "incineroar": _payload("incineroar", {
+        "fake-out": ["level-up", "egg"], "flare-blitz": ["level-up"], "u-turn": ["machine"],
+    }),
+    "landorus-incarnate": _payload("landorus-incarnate", {
+        "earth-power": ["level-up"], "sludge-bomb": ["machine"],
+    }),
+}
+
+MOVES = {
+    "fake-out": ["incineroar", "rillaboom", "mew", "kyogre"],
+    "tailwind": ["whimsicott", "kyogre", "tornadus-incarnate"],
+    "u-turn": ["incineroar", "rillaboom", "mew"],
+}
+
+
+@pytest.fixture
+def index():
+    return LearnsetIndex()
+
+
+@pytest.fixture
+def pokeapi():
+    return FakePokeAPI(
+        pokemon=POKEMON,
+        move_data={
+            name: {"name": name, "learned_by_pokemon": [{"name": s} for s in species]}
+            for name, species in MOVES.items()
+        },
+        aliases={"landorus": "landorus-incarnate"},
+    )
+
+
+class TestLearnsetIndex:
+    """Row and column bit operations."""
+
+    def test_rows_and_columns_stay_consistent(self, index):
+        index.add_learnset("incineroar", {"fake-out": ["egg"], "knock-off": ["machine"]})
+        index.add_learners("fake-out", ["incineroar", "rillaboom"])
+
+        assert index.learns("Incineroar", "Fake Out")
+        assert index.learns("rillaboom", "fake-out")
+        assert not index.learns("rillaboom", "knock-off")
+        assert index.has_learnset("incineroar") and not index.has_learnset("rillaboom")
+        assert index.has_learners("fake-out") and not index.has_learners("knock-off")
+
+    def test_missing_moves(self, index):
+        index.add_learnset("incineroar", {"fake-out": ["egg"], "knock-off": ["machine"]})
+        assert index.missing_moves("incineroar", ["fake-out", "knock-off"]) == []
+        assert index.missing_moves("incineroar", ["fake-out", "moonblast", "spore"]) == [
+            "moonblast", "spore",
+        ]
+
+    def test_learners_is_column_intersection(self, index):
+        for move, species in MOVES.items():
+            index.add_learners(move, species)
+        assert index.learners(["fake-out", "u-turn"]) == ["incineroar", "rillaboom", "mew"]
+        assert index.learners(["fake-out", "tailwind"]) == ["kyogre"]
+        assert index.learners(["fake-out", "not-a-move"]) == []
+
+    def test_regulation_mask(self, index):
+        index.add_learners("fake-out", MOVES["fake-out"])
+        everyone = index.learners(["fake-out"], index.regulation_mask("reg_f"))
+        assert "mew" not in everyone and "kyogre" in everyone
+        no_restricted = index.regulation_mask("reg_f", include_restricted=False)
+        assert index.learners(["fake-out"], no_restricted) == ["incineroar", "rillaboom"]
+        assert index.restricted_flags(everyone, "reg_f") == {"kyogre"}
+
+    def test_regulation_base_names_cover_default_forms(self, index):
+        # The regulation file lists "giratina"; PokeAPI calls it "giratina-altered"
+        index.add_learners("shadow-sneak", ["giratina-altered", "gengar"])
+        allowed = index.regulation_mask("reg_f", include_restricted=False)
+        assert index.learners(["shadow-sneak"], allowed) == ["gengar"]
+
+    def test_regulation_excludes_forms_missing_from_sv(self, index):
+        index.add_learners("fire-punch", [
+            "charizard", "charizard-mega-x", "charizard-gmax", "groudon-primal", "meganium",
+        ])
+        allowed = index.regulation_mask("reg_f")
+        assert index.learners(["fire-punch"], allowed) == ["charizard", "meganium"]
+
+
+class TestLearnsetValidation:
+    """Validation through the shared index."""
+
+    async def test_learnable_moves_filtered_by_method(self, index, pokeapi):
+        result = await get_learnable_moves("Incineroar", pokeapi, method="egg", index=index)
+        assert result["moves"] == {"fake-out": ["level-up", "egg"]}
+
+    async def test_validate_moveset(self, index, pokeapi):
+        result = await validate_moveset(
+            "incineroar", ["Fake Out", "Flare Blitz", "Spore"], pokeapi, index=index
+        )
+        assert not result.all_legal
+        assert result.illegal_moves == ["Spore"]
+        assert result.moves[0].methods == ["level-up", "egg"]
+
+    async def test_batch_fetches_each_species_once(self, index, pokeapi):
+        entries = [("incineroar", ["fake-out"])] * 50 + [("landorus", ["earth-power"])]
+        results = await validate_movesets(entries, pokeapi, index=index)
+        assert all(r.all_legal for r in results)
+        assert sorted(pokeapi.fetched) == ["incineroar", "landorus-incarnate"]
+
+    async def test_unknown_species_marked_illegal(self, index, pokeapi):
+        (result,) = await validate_movesets([("missingno", ["fake-out"])], pokeapi, index=index)
+        assert not result.all_legal and result.illegal_moves == ["fake-out"]
+
+    async def test_find_learners(self, index, pokeapi):
+        result = await find_learners(["Fake Out", "Tailwind"], pokeapi, "reg_f", index=index)
+        assert result["learners"] == ["kyogre"]
+        assert result["restricted"] == ["kyogre"]
+
+        await find_learners(["fake-out"], pokeapi, "reg_f", index=index)
+        assert pokeapi.fetched.count("fake-out") == 1
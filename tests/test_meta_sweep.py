@@ -0,0 +1,244 @@
+"""Tests for the usage-weighted meta sweep engine."""
+
+import pytest
+
+from vgc_mcp_core.calc.damage import calculate_damage, calculate_damage_bounds
+from vgc_mcp_core.calc.meta_sweep import (
+    MetaSpecies,
+    _CalcCache,
+    expand_usage_variants,
+    load_meta_species,
+    run_meta_sweep,
+)
+from vgc_mcp_core.calc.modifiers import DamageModifiers
+from vgc_mcp_core.calc.stats import calculate_all_stats
+from vgc_mcp_core.models.move import Move, MoveCategory
+from vgc_mcp_core.models.pokemon import BaseStats, EVSpread, Nature, PokemonBuild
+
+from .conftest import FakePokeAPI, FakeSmogon
+
+FLUTTER_MANE_STATS = BaseStats(
+    hp=55, attack=55, defense=55, special_attack=135, special_defense=135, speed=135
+)
+INCINEROAR_STATS = BaseStats(
+    hp=95, attack=115, defense=90, special_attack=80, special_defense=90, speed=60
+)
+
+MOONBLAST = Move(name="moonblast", type="fairy", category=MoveCategory.SPECIAL, power=95)
+FLARE_BLITZ = Move(
+    name="flare-blitz", type="fire", category=MoveCategory.PHYSICAL, power=120, makes_contact=True
+)
+
+FLUTTER_USAGE = {
+    "usage_percent": 40.0,
+    "spreads": [
+        {"nature": "Timid", "evs": {"hp": 4, "special_attack": 252, "speed": 252},
+         "spread_string": "Timid:4/0/0/252/0/252", "usage": 30.0},
+        {"nature": "Modest", "evs": {"hp": 252, "special_attack": 252, "speed": 4},
+         "spread_string": "Modest:252/0/0/252/0/4", "usage": 10.0},
+    ],
+    "items": {"Booster Energy": 60.0, "Choice Specs": 40.0},
+    "abilities": {"Protosynthesis": 100.0},
+    "tera_types": {"Fairy": 70.0, "Normal": 30.0},
+}
+
+
+def _flutter_species(**kwargs) -> MetaSpecies:
+    return MetaSpecies(
+        name="flutter-mane",
+        usage_percent=40.0,
+        variants=expand_usage_variants(
+            "flutter-mane", FLUTTER_MANE_STATS, ["Ghost", "Fairy"], FLUTTER_USAGE, **kwargs
+        ),
+        moves=[(MOONBLAST, 80.0)],
+    )
+
+
+@pytest.fixture
+def incineroar():
+    return PokemonBuild(
+        name="incineroar", base_stats=INCINEROAR_STATS, types=["Fire", "Dark"],
+        nature=Nature.ADAMANT, evs=EVSpread(hp=252, attack=252, special_defense=4),
+        ability="intimidate",
+    )
+
+
+class TestExpandUsageVariants:
+    """Weighted expansion of Smogon usage."""
+
+    def test_weights_are_product_of_shares(self):
+        variants = expand_usage_variants(
+            "flutter-mane", FLUTTER_MANE_STATS, ["Ghost", "Fairy"], FLUTTER_USAGE
+        )
+        assert len(variants) == 4  # 2 spreads x 2 items x 1 ability
+        assert sum(v.weight for v in variants) == pytest.approx(1.0)
+        timid_specs = next(
+            v for v in variants
+            if v.build.nature == Nature.TIMID and v.build.item == "choice-specs"
+        )
+        assert timid_specs.weight == pytest.approx(0.75 * 0.4)
+        assert timid_specs.build.ability == "protosynthesis"
+        assert timid_specs.build.tera_type == "Fairy"
+
+    def test_tera_expansion(self):
+        variants = expand_usage_variants(
+            "flutter-mane", FLUTTER_MANE_STATS, ["Ghost", "Fairy"], FLUTTER_USAGE,
+            expand_tera=True,
+        )
+        assert len(variants) == 8
+        normal = sum(v.weight for v in variants if v.build.tera_type == "Normal")
+        assert normal == pytest.approx(0.3)
+
+    def test_limits_and_missing_spreads(self):
+        variants = expand_usage_variants(
+            "flutter-mane", FLUTTER_MANE_STATS, ["Ghost", "Fairy"], FLUTTER_USAGE,
+            max_spreads=1, max_items=1,
+        )
+        assert len(variants) == 1 and variants[0].weight == pytest.approx(1.0)
+        assert expand_usage_variants("x", FLUTTER_MANE_STATS, ["Ghost"], {"spreads": []}) == []
+
+
+class TestRunMetaSweep:
+    """Exact-engine sweep in both directions."""
+
+    def test_incoming_matches_weighted_exact_calcs(self, incineroar):
+        species = _flutter_species()
+        report = run_meta_sweep(incineroar, [], [species])
+        (result,) = report.incoming
+
+        expected = sum(
+            v.weight * calculate_damage(
+                v.build, incineroar, MOONBLAST, DamageModifiers(is_doubles=True)
+            ).ko_probability.ohko_chance
+            for v in species.variants
+        )
+        assert result.ko_percent == pytest.approx(expected, abs=0.05)
+        assert result.survive_percent == pytest.approx(100 - result.ko_percent)
+        assert result.max_percent >= result.min_percent
+        assert result.worst_case["item"] in ("booster-energy", "choice-specs")
+
+    def test_per_variant_outcomes_add_up(self, incineroar):
+        species = _flutter_species()
+        (result,) = run_meta_sweep(incineroar, [], [species]).incoming
+        assert [o["spread"] for o in result.variants] == [v.spread for v in species.variants]
+        weighted = sum(
+            v.weight * o["ko_percent"] for v, o in zip(species.variants, result.variants)
+        )
+        assert result.ko_percent == pytest.approx(weighted, abs=0.1)
+        assert max(o["max_percent"] for o in result.variants) == result.max_percent
+
+    def test_outgoing_and_meta_rates(self, incineroar):
+        report = run_meta_sweep(incineroar, [FLARE_BLITZ], [_flutter_species()])
+        (result,) = report.outgoing
+        assert result.direction == "outgoing"
+        assert report.meta_ko_percent == result.ko_percent
+        assert report.meta_survival_percent == report.incoming[0].survive_percent
+
+    def test_irrelevant_stat_differences_share_a_calc(self, incineroar):
+        # Moonblast never reads the attacker's Attack or Defense, so Timid
+        # and Hasty with the same EVs collapse into one calc
+        usage = {
+            **FLUTTER_USAGE,
+            "items": {"Choice Specs": 1.0},
+            "spreads": [
+                {"nature": "Timid", "evs": {"hp": 4, "special_attack": 252, "speed": 252},
+                 "usage": 1.0},
+                {"nature": "Hasty", "evs": {"hp": 4, "special_attack": 252, "speed": 252},
+                 "usage": 1.0},
+            ],
+        }
+        species = MetaSpecies(
+            name="flutter-mane", usage_percent=40.0,
+            variants=expand_usage_variants(
+                "flutter-mane", FLUTTER_MANE_STATS, ["Ghost", "Fairy"], usage
+            ),
+            moves=[(MOONBLAST, 80.0)],
+        )
+        report = run_meta_sweep(incineroar, [], [species])
+        assert report.variant_calcs == 2
+        assert report.damage_calcs == 1
+
+    def test_your_tera_changes_defensive_typing(self, incineroar):
+        incineroar = incineroar.model_copy(update={"tera_type": "Fire"})
+        species = _flutter_species()
+        neutral = run_meta_sweep(incineroar, [], [species]).incoming[0]
+        tera = run_meta_sweep(incineroar, [], [species], your_tera_active=True).incoming[0]
+        # Fire/Dark takes neutral damage from Moonblast; mono-Fire resists it
+        assert tera.max_percent < neutral.max_percent
+
+    def test_stats_cache_survives_id_reuse(self, incineroar):
+        spreads = [EVSpread(hp=4), EVSpread(hp=252)]
+        expected = [
+            calculate_all_stats(incineroar.model_copy(update={"evs": evs}))["hp"]
+            for evs in spreads
+        ]
+        cache = _CalcCache()
+        seen = []
+        for i in range(10):
+            build = incineroar.model_copy(update={"evs": spreads[i % 2]})
+            seen.append((cache.stats(build)["hp"], expected[i % 2]))
+            del build  # frees the id for the next copy
+        assert all(got == want for got, want in seen)
+
+    def test_threat_tera_matches_uncached_calcs(self, incineroar):
+        # Terastallized threats are short-lived copies; stats must not be
+        # served from a different build that reused one's id
+        bulky = BaseStats(
+            hp=100, attack=80, defense=120, special_attack=80, special_defense=120, speed=40
+        )
+        meta = [
+            _flutter_species(expand_tera=True),
+            MetaSpecies(
+                name="bulky",
+                usage_percent=20.0,
+                variants=expand_usage_variants(
+                    "bulky", bulky, ["Water"], FLUTTER_USAGE, expand_tera=True
+                ),
+            ),
+        ]
+        moves = [
+            FLARE_BLITZ,
+            Move(name="crunch", type="dark", category=MoveCategory.PHYSICAL, power=80),
+            Move(name="psychic", type="psychic", category=MoveCategory.SPECIAL, power=90),
+            Move(name="hydro-pump", type="water", category=MoveCategory.SPECIAL, power=110),
+        ]
+        report = run_meta_sweep(incineroar, moves, meta, threat_tera_active=True)
+
+        assert len(report.outgoing) == 8
+        for result in report.outgoing:
+            species = next(s for s in meta if s.name == result.species)
+            move = next(m for m in moves if m.name == result.move)
+            bounds = []
+            for variant in species.variants:
+                defender = variant.build.model_copy(update={"types": [variant.build.tera_type]})
+                bounds.append(calculate_damage_bounds(
+                    incineroar, defender, move, DamageModifiers(
+                        is_doubles=True,
+                        defender_tera_type=defender.tera_type,
+                        defender_tera_active=True,
+                    ),
+                ))
+            assert result.min_percent == round(min(b.min_percent for b in bounds), 1)
+            assert result.max_percent == round(max(b.max_percent for b in bounds), 1)
+
+
+class TestLoadMetaSpecies:
+    """Loading the top-N from the usage ranking."""
+
+    async def test_loads_excludes_and_skips_missing(self):
+        smogon = FakeSmogon(
+            usage={"Flutter Mane": FLUTTER_USAGE | {"moves": {"moonblast": 90.0, "protect": 80.0}}},
+            ranking=["Incineroar", "Flutter Mane", "Missingno"],
+        )
+        pokeapi = FakePokeAPI(
+            base_stats={"flutter-mane": FLUTTER_MANE_STATS},
+            types={"flutter-mane": ["Ghost", "Fairy"]},
+            moves={
+                "moonblast": MOONBLAST,
+                "protect": Move(name="protect", type="normal", category=MoveCategory.STATUS),
+            },
+        )
+        meta = await load_meta_species(smogon, pokeapi, exclude=("incineroar",))
+        assert [s.name for s in meta] == ["Flutter Mane"]
+        assert [m.name for m, _ in meta[0].moves] == ["moonblast"]
+        assert meta[0].usage_percent == 40.0
@@ -1,12 +1,16 @@
 """Tests for meta threat analysis tools."""
 
-import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from mcp.server.fastmcp import FastMCP
 
 from vgc_mcp.tools.meta_threat_tools import register_meta_threat_tools
-from vgc_mcp_core.models.pokemon import BaseStats
+from vgc_mcp_core.calc.meta_sweep import MetaSpecies, expand_usage_variants, run_meta_sweep
+from vgc_mcp_core.models.move import Move, MoveCategory
+from vgc_mcp_core.models.pokemon import BaseStats, EVSpread, Nature, PokemonBuild
+
+from .conftest import FakePokeAPI, FakeSmogon
 
 
 @pytest.fixture
@@ -116,3 +120,98 @@ class TestCheckSurvivalBenchmark:
             threat_move="surging-strikes"
         )
         assert "error" in result
+
+
+FLUTTER_MANE_STATS = BaseStats(
+    hp=55, attack=55, defense=55, special_attack=135, special_defense=135, speed=135
+)
+INCINEROAR_STATS = BaseStats(
+    hp=95, attack=115, defense=90, special_attack=80, special_defense=90, speed=60
+)
+MOONBLAST = Move(name="moonblast", type="fairy", category=MoveCategory.SPECIAL, power=95)
+FLARE_BLITZ = Move(
+    name="flare-blitz", type="fire", category=MoveCategory.PHYSICAL, power=120, makes_contact=True
+)
+FLUTTER_USAGE = {
+    "usage_percent": 40.0,
+    "moves": {"moonblast": 90.0},
+    "spreads": [
+        {"nature": "Timid", "evs": {"hp": 4, "special_attack": 252, "speed": 252},
+         "spread_string": "Timid:4/0/0/252/0/252", "usage": 30.0},
+        {"nature": "Modest", "evs": {"hp": 252, "special_attack": 252, "speed": 4},
+         "spread_string": "Modest:252/0/0/252/0/4", "usage": 10.0},
+    ],
+    "items": {"Booster Energy": 60.0, "Choice Specs": 40.0},
+    "abilities": {"Protosynthesis": 100.0},
+}
+
+
+@pytest.fixture
+def sweep_pokeapi():
+    return FakePokeAPI(
+        base_stats={"incineroar": INCINEROAR_STATS, "flutter-mane": FLUTTER_MANE_STATS},
+        types={"incineroar": ["Fire", "Dark"], "flutter-mane": ["Ghost", "Fairy"]},
+        moves={"moonblast": MOONBLAST, "flare-blitz": FLARE_BLITZ},
+    )
+
+
+def _sweep_tools(smogon, pokeapi):
+    mcp = FastMCP("test")
+    register_meta_threat_tools(mcp, smogon, pokeapi, MagicMock())
+    return {t.name: t.fn for t in mcp._tool_manager._tools.values()}
+
+
+class TestMetaSweepBackedTools:
+    """Threat tools run on the usage-weighted meta sweep."""
+
+    async def test_survival_benchmark_weights_common_sets(self, sweep_pokeapi):
+        smogon = FakeSmogon(usage={"flutter-mane": FLUTTER_USAGE})
+        fn = _sweep_tools(smogon, sweep_pokeapi)["check_survival_benchmark"]
+        result = await fn(
+            pokemon_name="incineroar", nature="careful", hp_evs=0, def_evs=0, spd_evs=0,
+            threat_pokemon="flutter-mane", threat_move="moonblast",
+        )
+
+        incineroar = PokemonBuild(
+            name="incineroar", base_stats=INCINEROAR_STATS, types=["Fire", "Dark"],
+            nature=Nature.CAREFUL, evs=EVSpread(),
+        )
+        species = MetaSpecies(
+            name="flutter-mane", usage_percent=40.0,
+            variants=expand_usage_variants(
+                "flutter-mane", FLUTTER_MANE_STATS, ["Ghost", "Fairy"], FLUTTER_USAGE
+            ),
+            moves=[(MOONBLAST, 100.0)],
+        )
+        (expected,) = run_meta_sweep(incineroar, [], [species]).incoming
+        assert result["survival_percent"] == expected.survive_percent
+        assert len(result["threat_sets"]) == 4
+        assert "4 common flutter-mane sets" in result["analysis"]
+
+    async def test_survival_benchmark_without_usage_assumes_max_investment(self, sweep_pokeapi):
+        fn = _sweep_tools(FakeSmogon(), sweep_pokeapi)["check_survival_benchmark"]
+        result = await fn(
+            pokemon_name="incineroar", nature="careful", hp_evs=252, def_evs=0, spd_evs=0,
+            threat_pokemon="flutter-mane", threat_move="moonblast",
+        )
+        assert result["threat_spread"]["spread"] == "max invested"
+        assert "max-invested flutter-mane" in result["analysis"]
+
+    async def test_spread_vs_threats_uses_both_directions(self, sweep_pokeapi):
+        smogon = FakeSmogon(
+            usage={
+                "flutter-mane": FLUTTER_USAGE,
+                "incineroar": {"usage_percent": 50.0, "moves": {"flare-blitz": 90.0}},
+            },
+            ranking=["Incineroar", "Flutter Mane"],
+        )
+        fn = _sweep_tools(smogon, sweep_pokeapi)["analyze_spread_vs_threats"]
+        result = await fn(pokemon_name="incineroar", nature="adamant", hp_evs=252, atk_evs=252)
+
+        assert result["threats_analyzed"] == 1
+        (row,) = result["matchups"]
+        assert row["threat"] == "Flutter Mane"
+        assert row["usage"] == "40.0%"
+        assert row["your_damage_detail"]["move"] == "flare-blitz"
+        assert row["their_damage_detail"]["move"] == "moonblast"
+        assert row["speed"] == "slower"
@@ -0,0 +1,226 @@
+"""Tests for per-tool instrumentation and Prometheus rendering."""
+
+import asyncio
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.calc.damage import calculate_damage
+from vgc_mcp_core.metrics import (
+    REGISTRY,
+    CounterMetric,
+    HistogramMetric,
+    MetricsRegistry,
+    SlowCallProfiler,
+    current_call,
+    instrument_tool,
+    instrument_tools,
+    record_cache_lookup,
+    record_damage_calc,
+    record_fetch,
+)
+from vgc_mcp_core.models.move import Move, MoveCategory
+from vgc_mcp_core.models.pokemon import BaseStats, EVSpread, Nature, PokemonBuild
+
+FLUTTER_MANE_STATS = BaseStats(
+    hp=55, attack=55, defense=55, special_attack=135, special_defense=135, speed=135
+)
+INCINEROAR_STATS = BaseStats(
+    hp=95, attack=115, defense=90, special_attack=80, special_defense=90, speed=60
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def _tools(mcp) -> dict:
+    return {t.name: t for t in mcp._tool_manager._tools.values()}
+
+
+class TestPrimitives:
+    """Counter / histogram bookkeeping and exposition format."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        hist = HistogramMetric("h", "help", ("tool",), (1, 5, 10))
+        for value in (0.5, 3, 3, 7, 100):
+            hist.observe(("t",), value)
+        lines = hist.render()
+        assert 'h_bucket{tool="t",le="1"} 1' in lines
+        assert 'h_bucket{tool="t",le="5"} 3' in lines
+        assert 'h_bucket{tool="t",le="10"} 4' in lines
+        assert 'h_bucket{tool="t",le="+Inf"} 5' in lines
+        assert 'h_count{tool="t"} 5' in lines
+        assert hist.sum(("t",)) == pytest.approx(113.5)
+
+    def test_boundary_value_falls_in_its_bucket(self):
+        hist = HistogramMetric("h", "help", (), (1, 5))
+        hist.observe((), 5)
+        assert 'h_bucket{le="1"} 0' in hist.render()
+        assert 'h_bucket{le="5"} 1' in hist.render()
+
+    def test_counter_escapes_labels(self):
+        counter = CounterMetric("c", "help", ("tool",))
+        counter.inc(('we"ird\\name',), 2)
+        assert 'c{tool="we\\"ird\\\\name"} 2' in counter.render()
+
+    def test_render_includes_help_and_type(self, registry):
+        text = registry.render_prometheus()
+        assert "# TYPE vgc_tool_wall_seconds histogram" in text
+        assert "# TYPE vgc_tool_calls_total counter" in text
+        assert text.endswith("\n")
+
+
+class TestInstrumentTools:
+    """Wrapped tools record per-call stats."""
+
+    async def test_records_call_stats(self, registry):
+        mcp = FastMCP("test")
+
+        @mcp.tool()
+        async def busy_tool(n: int) -> dict:
+            for _ in range(n):
+                record_damage_calc()
+            record_fetch("pokeapi")
+            record_cache_lookup("smogon", True)
+            record_cache_lookup("smogon", False)
+            return {"n": n}
+
+        assert instrument_tools(mcp, registry=registry) == 1
+        await mcp.call_tool("busy_tool", {"n": 7})
+
+        tool = ("busy_tool",)
+        assert registry.tool_calls.get(("busy_tool", "ok")) == 1
+        assert registry.wall_seconds.count(tool) == 1
+        assert registry.damage_calcs.sum(tool) == 7
+        assert registry.payload_bytes.sum(tool) == len('{"n": 7}')
+        assert registry.tool_fetches.get(("busy_tool", "pokeapi")) == 1
+        assert registry.tool_cache_lookups.get(("busy_tool", "smogon", "hit")) == 1
+        assert registry.tool_cache_lookups.get(("busy_tool", "smogon", "miss")) == 1
+
+    async def test_instrumenting_twice_is_a_noop(self, registry):
+        mcp = FastMCP("test")
+
+        @mcp.tool()
+        async def once() -> str:
+            return "ok"
+
+        assert instrument_tools(mcp, registry=registry) == 1
+        assert instrument_tools(mcp, registry=registry) == 0
+
+    async def test_wrapped_tool_keeps_signature(self, registry):
+        mcp = FastMCP("test")
+
+        @mcp.tool()
+        async def typed_tool(pokemon_name: str, evs: int = 252) -> str:
+            return f"{pokemon_name}:{evs}"
+
+        instrument_tools(mcp, registry=registry)
+        assert await _tools(mcp)["typed_tool"].fn(pokemon_name="incineroar") == "incineroar:252"
+
+    async def test_errors_counted_and_reraised(self, registry):
+        async def broken() -> dict:
+            raise ValueError("boom")
+
+        wrapped = instrument_tool(broken, "broken", registry)
+        with pytest.raises(ValueError):
+            await wrapped()
+        assert registry.tool_calls.get(("broken", "error")) == 1
+        assert registry.payload_bytes.count(("broken",)) == 0
+
+    async def test_cpu_time_excludes_awaited_sleep(self, registry):
+        async def sleepy() -> str:
+            await asyncio.sleep(0.05)
+            return "done"
+
+        wrapped = instrument_tool(sleepy, "sleepy", registry)
+        await asyncio.gather(wrapped(), wrapped())
+        assert registry.wall_seconds.sum(("sleepy",)) >= 0.1
+        assert registry.cpu_seconds.sum(("sleepy",)) < 0.05
+
+    async def test_sync_tool(self, registry):
+        def plain(x: int) -> int:
+            record_damage_calc()
+            return x * 2
+
+        wrapped = instrument_tool(plain, "plain", registry)
+        assert wrapped(3) == 6
+        assert registry.damage_calcs.sum(("plain",)) == 1
+
+    async def test_context_cleared_after_call(self, registry):
+        async def noop() -> None:
+            assert current_call() is not None
+
+        await instrument_tool(noop, "noop", registry)()
+        assert current_call() is None
+
+
+class TestHooks:
+    """Calc engine and API cache report into the running call."""
+
+    async def test_calculate_damage_is_counted(self, registry):
+        attacker = PokemonBuild(
+            name="flutter-mane", base_stats=FLUTTER_MANE_STATS, types=["Ghost", "Fairy"],
+            nature=Nature.TIMID, evs=EVSpread(special_attack=252, speed=252),
+        )
+        defender = PokemonBuild(
+            name="incineroar", base_stats=INCINEROAR_STATS, types=["Fire", "Dark"],
+            nature=Nature.CAREFUL, evs=EVSpread(hp=252, special_defense=252),
+        )
+        move = Move(name="moonblast", type="fairy", category=MoveCategory.SPECIAL, power=95)
+
+        async def calc_tool() -> None:
+            for _ in range(3):
+                calculate_damage(attacker, defender, move)
+
+        await instrument_tool(calc_tool, "calc_tool", registry)()
+        assert registry.damage_calcs.sum(("calc_tool",)) == 3
+
+    async def test_api_cache_lookups_are_counted(self, registry, tmp_path):
+        cache = APICache(str(tmp_path))
+        cache.set("pokeapi", "pokemon/incineroar", value={"id": 727})
+        before_hits = REGISTRY.cache_lookups.get(("pokeapi", "hit"))
+
+        async def lookup_tool() -> None:
+            cache.get("pokeapi", "pokemon/incineroar")
+            cache.get("pokeapi", "pokemon/missing")
+
+        await instrument_tool(lookup_tool, "lookup_tool", registry)()
+        cache.close()
+        assert registry.tool_cache_lookups.get(("lookup_tool", "pokeapi", "hit")) == 1
+        assert registry.tool_cache_lookups.get(("lookup_tool", "pokeapi", "miss")) == 1
+        assert REGISTRY.cache_lookups.get(("pokeapi", "hit")) == before_hits + 1
+
+
+class TestSlowCallProfiler:
+    """Opt-in cProfile capture."""
+
+    async def test_writes_profile_over_threshold(self, registry, tmp_path):
+        profiler = SlowCallProfiler(threshold_ms=0, output_dir=tmp_path)
+
+        async def work() -> int:
+            return sum(range(10000))
+
+        await instrument_tool(work, "work", registry, profiler)()
+        files = list(tmp_path.glob("work-*.prof"))
+        assert len(files) == 1
+
+    async def test_skips_fast_calls(self, registry, tmp_path):
+        profiler = SlowCallProfiler(threshold_ms=60_000, output_dir=tmp_path)
+
+        async def work() -> int:
+            return 1
+
+        await instrument_tool(work, "work", registry, profiler)()
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_zero_sample_rate_never_profiles(self, registry, tmp_path):
+        profiler = SlowCallProfiler(threshold_ms=0, output_dir=tmp_path, sample_rate=0.0)
+
+        async def work() -> int:
+            return 1
+
+        await instrument_tool(work, "work", registry, profiler)()
+        assert list(tmp_path.iterdir()) == []
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 from mcp.server.fastmcp import FastMCP
 
 from vgc_mcp.tools.move_tools import register_move_tools
+from vgc_mcp_core.validation.learnset_index import reset_learnset_index
 
 
 @pytest.fixture
@@ -169,10 +170,28 @@ class TestCheckTmMoves:
 class TestFindMoveLearners:
     """Tests for find_move_learners."""
 
-    async def test_no_team_only(self, tools):
-        """Test without team_only returns guidance."""
+    @pytest.fixture(autouse=True)
+    def fresh_index(self):
+        reset_learnset_index()
+        yield
+        reset_learnset_index()
+
+    async def test_no_team_only(self, tools, mock_pokeapi):
+        """Test dex-wide search drops banned Pokemon and flags restricted ones."""
+        mock_pokeapi.get_move_data = AsyncMock(return_value={
+            "name": "fake-out",
+            "learned_by_pokemon": [{"name": "incineroar"}, {"name": "mew"}, {"name": "kyogre"}],
+        })
         fn = tools["find_move_learners"].fn
         result = await fn(move_name="fake-out", team_only=False)
+        assert result["learners"] == ["incineroar", "kyogre"]
+        assert result["restricted"] == ["kyogre"]
+
+    async def test_no_team_only_unknown_move(self, tools, mock_pokeapi):
+        """Test an unresolvable move returns guidance."""
+        mock_pokeapi.get_move_data = AsyncMock(side_effect=Exception("Not found: move/fak-out"))
+        fn = tools["find_move_learners"].fn
+        result = await fn(move_name="fak-out", team_only=False)
         assert "suggestion" in result
 
     async def test_team_only_empty(self, tools):
@@ -0,0 +1,186 @@
+"""Tests for the shared name resolution index."""
+
+import httpx
+import pytest
+
+from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.api.pokeapi import PokeAPIClient, PokeAPIError
+from vgc_mcp_core.state.build_manager import BuildStateManager
+from vgc_mcp_core.utils.fuzzy import (
+    suggest_item_name,
+    suggest_move_name,
+    suggest_nature,
+    suggest_pokemon_name,
+)
+from vgc_mcp_core.utils.name_index import NameIndex, NameResolver, get_name_resolver, to_id
+
+
+class TestToId:
+    """Showdown-style ids."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Flutter Mane", "fluttermane"),
+        ("urshifu-rapid-strike", "urshifurapidstrike"),
+        ("Farfetch'd", "farfetchd"),
+        ("Flabébé", "flabebe"),
+        ("Mr. Mime", "mrmime"),
+        ("", ""),
+    ])
+    def test_to_id(self, name, expected):
+        assert to_id(name) == expected
+
+
+class TestNameIndex:
+    """Exact, alias and trigram lookups."""
+
+    @pytest.fixture
+    def index(self):
+        index = NameIndex("pokemon", ["flutter-mane", "iron-hands", "incineroar", "charizard"])
+        index.add("indeedee-female", aliases=["indeedee-f"])
+        return index
+
+    def test_resolves_any_spelling(self, index):
+        assert index.resolve("Flutter Mane") == "flutter-mane"
+        assert index.resolve("fluttermane") == "flutter-mane"
+        assert index.resolve("Indeedee-F") == "indeedee-female"
+        assert index.resolve("amoonguss") is None
+
+    def test_suggests_for_typos(self, index):
+        assert index.suggest("Charzard") == ["charizard"]
+        assert index.suggest("incinaroar") == ["incineroar"]
+        assert index.suggest("zzzz") == []
+
+    def test_alias_never_shadows_canonical(self, index):
+        index.add_alias("iron hands", "flutter-mane")
+        assert index.resolve("iron-hands") == "iron-hands"
+
+    def test_suggestible_alias_suggests_its_target(self, index):
+        index.add_alias("urshifu", "urshifu-single-strike", suggestible=True)
+        assert index.suggest("urshifuu") == ["urshifu-single-strike"]
+        assert index.suggest("indeedef") == ["indeedee-female"]
+        assert "urshifu-single-strike" not in index.names
+
+    def test_discard(self, index):
+        index.discard("charizard")
+        assert "charizard" not in index
+        assert index.suggest("charzard") == []
+        assert len(index) == 4
+
+
+class TestSeededResolver:
+    """Process-wide resolver seeded from the local tables."""
+
+    def test_smogon_ids_resolve_to_pokeapi_names(self):
+        resolver = get_name_resolver()
+        assert resolver.resolve("move", "shadowball") == "shadow-ball"
+        assert resolver.resolve("item", "boosterenergy") == "booster-energy"
+        assert resolver.resolve("pokemon", "Ogerpon-Wellspring") == "ogerpon-wellspring-mask"
+        assert resolver.resolve("pokemon", "Landorus") == "landorus-incarnate"
+        assert resolver.is_complete("nature")
+
+    def test_suggestion_helpers(self):
+        assert suggest_pokemon_name("landorus therian") == ["landorus-therian"]
+        assert suggest_move_name("earthquack") == ["earthquake"]
+        assert suggest_item_name("Choice Spces")[0] == "choice-specs"
+        assert suggest_nature("Adament") == ["adamant"]
+
+    def test_base_form_typos_suggest_the_form(self):
+        assert suggest_pokemon_name("Urshfu") == ["urshifu-single-strike"]
+        assert suggest_pokemon_name("Indeede")[0] == "indeedee-male"
+
+
+LISTS = {
+    "pokemon": ["flutter-mane", "landorus-incarnate", "incineroar"],
+    "move": ["shadow-ball", "moonblast"],
+    "ability": ["intimidate"],
+    "item": ["booster-energy"],
+}
+
+
+@pytest.fixture
+def pokeapi(tmp_path):
+    requests: list[str] = []
+    missing: set[str] = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.rsplit("/", 1)[-1]
+        requests.append(request.url.path)
+        if path in missing:
+            return httpx.Response(404)
+        if path in LISTS:
+            return httpx.Response(
+                200, json={"results": [{"name": name} for name in LISTS[path]]}
+            )
+        return httpx.Response(200, json={"name": path})
+
+    cache = APICache(str(tmp_path / "cache"))
+    client = PokeAPIClient(cache, names=NameResolver())
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client.requests = requests
+    client.missing = missing
+    yield client
+    cache.close()
+
+
+class TestPokeAPIResolution:
+    """Name resolution in front of PokeAPI requests."""
+
+    async def test_unknown_names_pass_through_before_load(self, pokeapi):
+        await pokeapi.get_pokemon("Some New Mon")
+        assert pokeapi.requests[-1].endswith("/pokemon/some-new-mon")
+
+    async def test_load_then_resolve_spellings(self, pokeapi):
+        loaded = await pokeapi.load_name_index()
+        assert loaded == {"pokemon": 3, "move": 2, "ability": 1, "item": 1}
+
+        await pokeapi.get_pokemon("fluttermane")
+        assert pokeapi.requests[-1].endswith("/pokemon/flutter-mane")
+        await pokeapi.get_pokemon("Landorus")
+        assert pokeapi.requests[-1].endswith("/pokemon/landorus-incarnate")
+        await pokeapi.get_item("boosterenergy")
+        assert pokeapi.requests[-1].endswith("/item/booster-energy")
+
+    async def test_misspelling_rejected_without_request(self, pokeapi):
+        await pokeapi.load_name_index()
+        sent = len(pokeapi.requests)
+        with pytest.raises(PokeAPIError, match="Not found.*Did you mean: flutter-mane"):
+            await pokeapi.get_pokemon("Fluter Mane")
+        assert len(pokeapi.requests) == sent
+
+    async def test_species_lookup_skips_form_aliases(self, pokeapi):
+        await pokeapi.get_pokemon_species("Giratina")
+        assert pokeapi.requests == ["/api/v2/pokemon-species/giratina"]
+
+    async def test_numeric_ids_pass_through(self, pokeapi):
+        await pokeapi.load_name_index()
+        await pokeapi.get_pokemon(987)
+        assert pokeapi.requests[-1].endswith("/pokemon/987")
+
+    async def test_failed_list_leaves_kind_open(self, pokeapi):
+        pokeapi.missing.add("item")
+        loaded = await pokeapi.load_name_index()
+        assert "item" not in loaded and not pokeapi.names.is_complete("item")
+
+        pokeapi.missing.clear()
+        await pokeapi.get_item("Mystery Berry")
+        assert pokeapi.requests[-1].endswith("/item/mystery-berry")
+
+
+class TestBuildManagerLookup:
+    """Fuzzy build lookup by Pokemon name."""
+
+    def test_exact_spelling_variants_and_typos(self):
+        manager = BuildStateManager()
+        build_id = manager.create_build({"name": "Flutter Mane"})
+        manager.create_build({"name": "Incineroar"})
+
+        assert manager.get_build_by_name("flutter mane")["build_id"] == build_id
+        assert manager.get_build_by_name("fluttermane")["build_id"] == build_id
+        assert manager.get_build_by_name("Fluter Mane")["build_id"] == build_id
+        assert manager.get_build_by_name("Amoonguss") is None
+
+    def test_deleted_build_not_matched(self):
+        manager = BuildStateManager()
+        build_id = manager.create_build({"name": "Incineroar"})
+        manager.delete_build(build_id)
+        assert manager.get_build_by_name("incineroar") is None
@@ -0,0 +1,172 @@
+"""Tests for progress notifications and paginated results."""
+
+from collections.abc import Sequence
+
+import pytest
+
+from vgc_mcp_core.progress import (
+    MAX_PAGE_SIZE,
+    MAX_PROGRESS_MESSAGE,
+    ProgressReporter,
+    ResultStore,
+    get_result_store,
+    progress_message,
+    reset_result_store,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingContext:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = []
+
+    async def report_progress(self, progress, total=None, message=None):
+        if self.fail:
+            raise RuntimeError("client went away")
+        self.calls.append((progress, total, message))
+
+
+class TestProgressMessage:
+    """Best-so-far results are appended as JSON."""
+
+    def test_best_appended(self):
+        assert progress_message("1/3 done", {"hp": 4}) == '1/3 done | best so far: {"hp":4}'
+
+    def test_best_only(self):
+        assert progress_message("", [1, 2]) == "[1,2]"
+
+    def test_truncated(self):
+        message = progress_message("x" * 5000)
+        assert len(message) == MAX_PROGRESS_MESSAGE
+        assert message.endswith("...")
+
+
+class TestProgressReporter:
+    """Throttling and delivery of progress notifications."""
+
+    async def test_throttles_between_first_and_final(self):
+        clock = FakeClock()
+        ctx = RecordingContext()
+        progress = ProgressReporter(ctx, total=4, min_interval=1.0, clock=clock)
+
+        assert await progress.update(1, "first")
+        clock.now = 0.5
+        assert not await progress.update(2, "throttled")
+        clock.now = 1.5
+        assert await progress.update(3, "later")
+        # The final update is sent even inside the interval
+        clock.now = 1.6
+        assert await progress.update(4, "done")
+
+        assert [call[0] for call in ctx.calls] == [1, 3, 4]
+        assert ctx.calls == progress.sent
+        assert progress.first_update_after == 0.0
+
+    async def test_force(self):
+        progress = ProgressReporter(total=10, min_interval=60)
+        await progress.update(1)
+        assert await progress.update(2, force=True)
+
+    async def test_without_context_records_only(self):
+        progress = ProgressReporter(total=2)
+        await progress.update(1, "half", best={"nature": "bold"})
+        assert progress.sent == [(1, 2, 'half | best so far: {"nature":"bold"}')]
+
+    async def test_send_errors_are_swallowed(self):
+        progress = ProgressReporter(RecordingContext(fail=True), total=1)
+        assert await progress.update(1, "done")
+        assert len(progress.sent) == 1
+
+
+class TestResultStore:
+    """Cursor pagination over held-back rows."""
+
+    def test_small_result_has_no_cursor(self):
+        store = ResultStore()
+        page = store.paginate("tool", [1, 2, 3], page_size=5)
+        assert page == {"items": [1, 2, 3], "total": 3, "next_cursor": None}
+        assert len(store) == 0
+
+    def test_pages_through_all_items(self):
+        store = ResultStore()
+        items = list(range(25))
+        page = store.paginate("bulk", items, page_size=10)
+        seen = list(page["items"])
+        cursor = page["next_cursor"]
+        while cursor:
+            page = store.page(cursor)
+            assert page["tool"] == "bulk"
+            assert page["total"] == 25
+            seen.extend(page["items"])
+            cursor = page["next_cursor"]
+        assert seen == items
+
+    def test_page_size_override_and_refetch(self):
+        store = ResultStore()
+        cursor = store.paginate("bulk", list(range(10)), page_size=2)["next_cursor"]
+        assert store.page(cursor, page_size=5)["items"] == [2, 3, 4, 5, 6]
+        # Pages are read, not consumed
+        assert store.page(cursor)["items"] == [2, 3]
+        assert len(store.page(cursor, page_size=1000)["items"]) == 8
+        page = store.paginate("bulk", list(range(500)), page_size=1000)
+        assert page["items"] == list(range(MAX_PAGE_SIZE))
+
+    def test_lazy_sequence_built_only_when_paged(self):
+        built = []
+
+        class Rows(Sequence):
+            def __len__(self):
+                return 6
+
+            def __getitem__(self, index):
+                rows = list(range(6))[index]
+                built.extend(rows if isinstance(rows, list) else [rows])
+                return rows
+
+        store = ResultStore()
+        cursor = store.paginate("bulk", Rows(), page_size=2)["next_cursor"]
+        assert built == [0, 1]
+        assert store.page(cursor)["items"] == [2, 3]
+        assert built == [0, 1, 2, 3]
+
+    def test_expires_after_last_read(self):
+        clock = FakeClock()
+        store = ResultStore(ttl=10, clock=clock)
+        cursor = store.paginate("bulk", list(range(5)), page_size=1)["next_cursor"]
+        clock.now = 8
+        store.page(cursor)
+        clock.now = 16
+        store.page(cursor)
+        clock.now = 27
+        with pytest.raises(KeyError):
+            store.page(cursor)
+
+    def test_evicts_least_recently_read(self):
+        store = ResultStore(max_sets=2)
+        first, second, third = (
+            store.paginate("bulk", [1, 2], page_size=1)["next_cursor"] for _ in range(3)
+        )
+        assert len(store) == 2
+        with pytest.raises(KeyError):
+            store.page(first)
+        assert store.page(second)["items"] == [2]
+        assert store.page(third)["items"] == [2]
+
+    @pytest.mark.parametrize("cursor", ["", "abc", "abc:", "abc:-1", "abc:x"])
+    def test_malformed_cursor(self, cursor):
+        with pytest.raises(ValueError):
+            ResultStore().page(cursor)
+
+    def test_shared_store_reset(self):
+        store = get_result_store()
+        assert get_result_store() is store
+        reset_result_store()
+        assert get_result_store() is not store
@@ -0,0 +1,160 @@
+"""Tests for the deterministic tool result cache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.metrics import REGISTRY
+from vgc_mcp_core.result_cache import (
+    ToolResultCache,
+    cached_tool,
+    get_tool_result_cache,
+    reset_tool_result_cache,
+)
+
+
+@pytest.fixture
+def usage():
+    return SimpleNamespace(current_format="gen9vgc2026regfbo3", current_month="2026-09")
+
+
+@pytest.fixture
+def cache(usage):
+    return ToolResultCache(max_bytes=64 * 1024).enable(usage_source=usage)
+
+
+def _counting_tool(cache, result=None):
+    calls = []
+
+    @cached_tool(names={"attacker_name": "pokemon", "move_name": "move"}, cache=cache)
+    async def calc(attacker_name: str, move_name: str, helping_hand: bool = False) -> dict:
+        calls.append((attacker_name, move_name, helping_hand))
+        return result if result is not None else {"damage": [len(calls)], "hh": helping_hand}
+
+    return calc, calls
+
+
+class TestCachedTool:
+    """Repeat calls are answered from the cache."""
+
+    async def test_repeat_call_hits(self, cache):
+        calc, calls = _counting_tool(cache)
+        first = await calc("flutter-mane", "moonblast")
+        assert await calc("flutter-mane", "moonblast") == first
+        assert len(calls) == 1
+        assert cache.stats["calc"].hits == 1
+        assert cache.stats["calc"].bytes_saved > 0
+
+    async def test_names_and_defaults_are_canonical(self, cache):
+        calc, calls = _counting_tool(cache)
+        await calc("Flutter Mane", "Moonblast")
+        await calc("flutter-mane", "moonblast", helping_hand=False)
+        await calc(attacker_name=" fluttermane ", move_name="moonblast")
+        assert len(calls) == 1
+
+        await calc("flutter-mane", "moonblast", helping_hand=True)
+        assert len(calls) == 2
+
+    async def test_disabled_passes_through(self):
+        calc, calls = _counting_tool(ToolResultCache())
+        await calc("incineroar", "fake-out")
+        await calc("incineroar", "fake-out")
+        assert len(calls) == 2
+
+    async def test_errors_not_cached(self, cache):
+        calc, calls = _counting_tool(cache, result={"success": False, "error": "api_error"})
+        await calc("incineroar", "fake-out")
+        await calc("incineroar", "fake-out")
+        assert len(calls) == 2
+
+    async def test_fallbacks_not_cached(self, cache):
+        calc, calls = _counting_tool(cache, result={"tiers": [], "fallback": True})
+        await calc("incineroar", "fake-out")
+        await calc("incineroar", "fake-out")
+        assert len(calls) == 2
+
+    async def test_data_version_change_misses(self, cache, usage):
+        calc, calls = _counting_tool(cache)
+        await calc("incineroar", "fake-out")
+        usage.current_month = "2026-10"
+        await calc("incineroar", "fake-out")
+        assert len(calls) == 2
+
+    async def test_not_stored_without_usage_data(self, cache, usage):
+        usage.current_month = None
+        calc, calls = _counting_tool(cache)
+        await calc("incineroar", "fake-out")
+        await calc("incineroar", "fake-out")
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+    async def test_stored_under_version_loaded_during_call(self, usage):
+        usage.current_month = None
+        cache = ToolResultCache().enable(usage_source=usage)
+        calls = []
+
+        @cached_tool(cache=cache)
+        async def tiers() -> dict:
+            calls.append(1)
+            usage.current_month = "2026-09"  # the first fetch sets the month
+            return {"tiers": []}
+
+        await tiers()
+        await tiers()
+        assert len(calls) == 1
+
+    async def test_disk_tier_survives_restart(self, tmp_path, usage):
+        disk = APICache(str(tmp_path))
+        try:
+            calc, calls = _counting_tool(ToolResultCache().enable(disk=disk, usage_source=usage))
+            expected = await calc("rillaboom", "grassy-glide")
+
+            restarted = ToolResultCache().enable(disk=disk, usage_source=usage)
+            calc, calls = _counting_tool(restarted)
+            assert await calc("rillaboom", "grassy-glide") == expected
+            assert calls == []
+            assert restarted.stats["calc"].disk_hits == 1
+        finally:
+            disk.close()
+
+    async def test_metrics_exported(self, cache):
+        REGISTRY.reset()
+        calc, _ = _counting_tool(cache)
+        await calc("incineroar", "fake-out")
+        await calc("incineroar", "fake-out")
+        assert REGISTRY.result_cache_lookups.get(("calc", "hit")) == 1
+        assert REGISTRY.result_cache_lookups.get(("calc", "miss")) == 1
+        assert "vgc_tool_result_cache_bytes_saved_total" in REGISTRY.render_prometheus()
+        REGISTRY.reset()
+
+
+class TestToolResultCache:
+    """Memory tier bookkeeping."""
+
+    async def test_byte_bound_eviction(self):
+        cache = ToolResultCache(max_bytes=800)
+        for i in range(10):
+            await cache.store(f"k{i}", "x" * 100)
+        assert cache.nbytes <= 800
+        assert "k0" not in cache and "k9" in cache
+
+    async def test_oversized_entry_skips_memory(self, tmp_path):
+        with APICache(str(tmp_path)) as disk:
+            cache = ToolResultCache(max_bytes=800).enable(disk=disk)
+            await cache.store("big", "x" * 200)
+            assert len(cache) == 0
+            assert await cache.fetch("big") == "x" * 200
+
+    def test_report(self, cache):
+        cache.record("calc", "hit", 120)
+        cache.record("calc", "miss")
+        report = cache.report()
+        assert report["tools"]["calc"] == {
+            "hits": 1, "disk_hits": 0, "misses": 1, "hit_rate": 0.5, "bytes_saved": 120,
+        }
+
+    def test_shared_cache_starts_disabled(self):
+        reset_tool_result_cache()
+        assert not get_tool_result_cache().enabled
+        reset_tool_result_cache()
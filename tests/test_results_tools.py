@@ -0,0 +1,41 @@
+"""Tests for the paginated results tool."""
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from vgc_mcp.tools.results_tools import register_results_tools
+from vgc_mcp_core.progress import get_result_store, reset_result_store
+
+
+@pytest.fixture
+def get_more_results():
+    reset_result_store()
+    mcp = FastMCP("test")
+    register_results_tools(mcp)
+    yield mcp._tool_manager._tools["get_more_results"].fn
+    reset_result_store()
+
+
+class TestGetMoreResults:
+    """Tests for get_more_results."""
+
+    async def test_next_page(self, get_more_results):
+        cursor = get_result_store().paginate("bulk", list(range(5)), page_size=2)["next_cursor"]
+        result = await get_more_results(cursor)
+        assert result["items"] == [2, 3]
+        assert result["tool"] == "bulk"
+
+        result = await get_more_results(result["next_cursor"], page_size=10)
+        assert result["items"] == [4]
+        assert result["next_cursor"] is None
+
+    async def test_unknown_cursor(self, get_more_results):
+        result = await get_more_results("missing:10")
+        assert result["success"] is False
+        assert result["error"] == "invalid_parameter"
+        assert "expired" in result["message"]
+
+    async def test_malformed_cursor(self, get_more_results):
+        result = await get_more_results("not-a-cursor")
+        assert result["success"] is False
+        assert result["error"] == "invalid_parameter"
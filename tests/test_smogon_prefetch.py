@@ -0,0 +1,243 @@
+"""Tests for Smogon usage snapshots, stale-while-revalidate and prefetch."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from vgc_mcp_core.api.prefetch import UsageStatsPrefetcher
+from vgc_mcp_core.api.smogon import SmogonStatsClient, SmogonStatsError, UsageSnapshot
+from vgc_mcp_core.config import settings
+
+from .conftest import FakeRegulation
+
+FORMATS = ["gen9vgc2026regf", "gen9vgc2025regh"]
+
+
+def _chaos(incineroar_usage: float = 0.45) -> dict:
+    return {
+        "info": {"metagame": "gen9vgc2026regf", "number of battles": 1000},
+        "data": {
+            "Incineroar": {"usage": incineroar_usage, "Items": {"Safety Goggles": 10}},
+            "Flutter Mane": {"usage": 0.40, "Items": {"Booster Energy": 10}},
+            "Urshifu-Rapid-Strike": {"usage": 0.30, "Items": {"Choice Scarf": 5}},
+        },
+    }
+
+
+def _expire_all(client: SmogonStatsClient) -> None:
+    for key, pointer in client._pointers.items():
+        if pointer is not None:
+            pointer["fetched_at"] = 0
+    for snapshot in client._snapshots.values():
+        snapshot.fetched_at = 0
+
+
+class TestUsageSnapshot:
+    """Derived indexes."""
+
+    def test_ranking_sorted_by_usage(self):
+        snapshot = UsageSnapshot.build(_chaos(0.2), "gen9vgc2026regf", 0, "2026-09")
+        assert snapshot.ranking == ["Flutter Mane", "Urshifu-Rapid-Strike", "Incineroar"]
+
+    def test_lookup_ignores_case_spaces_and_hyphens(self):
+        snapshot = UsageSnapshot.build(_chaos(), "gen9vgc2026regf", 0, "2026-09")
+        assert snapshot.lookup("flutter-mane") == "Flutter Mane"
+        assert snapshot.lookup("urshifu rapid strike") == "Urshifu-Rapid-Strike"
+        assert snapshot.lookup("amoonguss") is None
+
+
+class TestStaleWhileRevalidate:
+    """get_usage_stats serves the last-known-good snapshot."""
+
+    async def test_picks_newest_month_across_formats(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-08", FORMATS[0], 0)] = _chaos(0.1)
+        smogon_upstream.files[("2026-09", FORMATS[1], 0)] = _chaos(0.2)
+        client = make_smogon_client()
+        client._regulation_config = FakeRegulation(*FORMATS)
+
+        stats = await client.get_usage_stats(rating=0)
+        assert stats["_meta"]["format"] == FORMATS[1]
+        assert stats["_meta"]["month"] == "2026-09"
+        assert client.current_format == FORMATS[1]
+
+    async def test_meta_not_written_into_snapshot(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-09", FORMATS[0], 0)] = _chaos()
+        client = make_smogon_client()
+        stats = await client.get_usage_stats(FORMATS[0], 0)
+        assert "_meta" in stats
+        assert "_meta" not in client._snapshots[(FORMATS[0], 0)].data
+
+    async def test_fresh_snapshot_served_without_requests(
+        self, make_smogon_client, smogon_upstream
+    ):
+        smogon_upstream.files[("2026-09", FORMATS[0], 0)] = _chaos()
+        client = make_smogon_client()
+        await client.get_usage_stats(FORMATS[0], 0)
+        sent = len(smogon_upstream.requests)
+
+        for _ in range(5):
+            await client.get_usage_stats(FORMATS[0], 0)
+        assert len(smogon_upstream.requests) == sent
+
+    async def test_stale_served_while_refreshing(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-08", FORMATS[0], 0)] = _chaos(0.1)
+        client = make_smogon_client()
+        first = await client.get_usage_stats(FORMATS[0], 0)
+        assert first["_meta"]["month"] == "2026-08"
+
+        smogon_upstream.files[("2026-09", FORMATS[0], 0)] = _chaos(0.9)
+        smogon_upstream.delay = 0.05
+        _expire_all(client)
+
+        stale = await client.get_usage_stats(FORMATS[0], 0)
+        assert stale["_meta"]["month"] == "2026-08"
+        assert (FORMATS[0], 0) in client._refreshing
+
+        await asyncio.gather(*client._refreshing.values())
+        fresh = await client.get_usage_stats(FORMATS[0], 0)
+        assert fresh["_meta"]["month"] == "2026-09"
+        assert fresh["data"]["Incineroar"]["usage"] == 0.9
+
+    async def test_unchanged_month_revalidates_with_304(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-09", FORMATS[0], 0)] = _chaos()
+        client = make_smogon_client()
+        await client.get_usage_stats(FORMATS[0], 0)
+        _expire_all(client)
+
+        snapshot = await client.refresh_usage_stats(FORMATS[0], 0)
+        last = smogon_upstream.requests[-1]
+        assert last.headers.get("if-none-match")
+        assert snapshot.month == "2026-09"
+        assert not client._is_stale(snapshot.fetched_at)
+
+    async def test_network_error_keeps_last_known_good(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-09", FORMATS[0], 0)] = _chaos()
+        client = make_smogon_client()
+        await client.get_usage_stats(FORMATS[0], 0)
+        smogon_upstream.fail = True
+        _expire_all(client)
+
+        snapshot = await client.refresh_usage_stats(FORMATS[0], 0)
+        assert snapshot is not None and snapshot.month == "2026-09"
+        assert (FORMATS[0], 0) not in client._absent
+
+    async def test_concurrent_refreshes_coalesce(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-09", FORMATS[0], 0)] = _chaos()
+        smogon_upstream.delay = 0.02
+        client = make_smogon_client()
+
+        await asyncio.gather(*(client.get_usage_stats(FORMATS[0], 0) for _ in range(10)))
+        assert len(smogon_upstream.requests) == 1
+
+    async def test_restart_reads_pointer_from_disk(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-08", FORMATS[0], 0)] = _chaos()
+        await make_smogon_client().get_usage_stats(FORMATS[0], 0)
+        sent = len(smogon_upstream.requests)
+
+        restarted = make_smogon_client()
+        stats = await restarted.get_usage_stats(FORMATS[0], 0)
+        assert stats["_meta"]["month"] == "2026-08"
+        assert len(smogon_upstream.requests) == sent
+
+    async def test_missing_format_raises(self, make_smogon_client):
+        client = make_smogon_client()
+        with pytest.raises(SmogonStatsError):
+            await client.get_usage_stats(FORMATS[0], 0)
+        assert (FORMATS[0], 0) in client._absent
+
+    async def test_explicit_month_uses_that_month(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-07", FORMATS[0], 0)] = _chaos(0.3)
+        smogon_upstream.files[("2026-09", FORMATS[0], 0)] = _chaos(0.9)
+        client = make_smogon_client()
+        stats = await client.get_usage_stats(FORMATS[0], 0, month="2026-07")
+        assert stats["_meta"]["month"] == "2026-07"
+        assert stats["data"]["Incineroar"]["usage"] == 0.3
+
+    async def test_pokemon_usage_and_ranking(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-09", FORMATS[0], 0)] = _chaos()
+        client = make_smogon_client()
+        usage = await client.get_pokemon_usage("urshifu-rapid-strike", FORMATS[0], 0)
+        assert usage["name"] == "Urshifu-Rapid-Strike"
+        assert await client.get_usage_ranking(FORMATS[0], 0, limit=2) == [
+            "Incineroar", "Flutter Mane",
+        ]
+
+
+class TestUsageStatsPrefetcher:
+    """Background refresh of every format x rating."""
+
+    async def test_refresh_all_summarises(self, make_smogon_client, smogon_upstream):
+        smogon_upstream.files[("2026-09", FORMATS[0], 0)] = _chaos()
+        smogon_upstream.files[("2026-08", FORMATS[0], 1760)] = _chaos()
+        client = make_smogon_client()
+        prefetcher = UsageStatsPrefetcher(client, formats=FORMATS, ratings=[0, 1760])
+
+        summary = await prefetcher.refresh_all()
+        assert summary["available"] == {
+            f"{FORMATS[0]}/0": "2026-09",
+            f"{FORMATS[0]}/1760": "2026-08",
+        }
+        assert sorted(summary["missing"]) == [f"{FORMATS[1]}/0", f"{FORMATS[1]}/1760"]
+
+        sent = len(smogon_upstream.requests)
+        await client.get_usage_stats(FORMATS[0], 1760)
+        assert len(smogon_upstream.requests) == sent
+
+    async def test_prefetched_snapshots_are_not_rebuilt(self, make_smogon_client, smogon_upstream):
+        ratings = [0, 1500, 1630, 1760]
+        for fmt in FORMATS:
+            for rating in ratings:
+                smogon_upstream.files[("2026-09", fmt, rating)] = _chaos()
+        client = make_smogon_client()
+        prefetcher = UsageStatsPrefetcher(client, formats=FORMATS, ratings=ratings)
+        await prefetcher.refresh_all()
+        assert len(client._snapshots) == len(FORMATS) * len(ratings)
+
+        with patch.object(UsageSnapshot, "build", side_effect=AssertionError("rebuilt")):
+            for fmt in FORMATS:
+                for rating in ratings:
+                    stats = await client.get_usage_stats(fmt, rating)
+                    assert stats["_meta"]["month"] == "2026-09"
+
+    async def test_start_is_idempotent_and_stop_cancels(self, make_smogon_client, smogon_upstream):
+        client = make_smogon_client()
+        prefetcher = UsageStatsPrefetcher(
+            client, interval_seconds=3600, formats=FORMATS, ratings=[0]
+        )
+        prefetcher.start()
+        task = prefetcher._task
+        prefetcher.start()
+        assert prefetcher._task is task
+        await asyncio.sleep(0.01)
+        await prefetcher.stop()
+        assert not prefetcher.running
+
+    async def test_default_lookup_does_not_wait_on_unprefetched_formats(
+        self, make_smogon_client, smogon_upstream
+    ):
+        for fmt in FORMATS:
+            smogon_upstream.files[("2026-09", fmt, 0)] = _chaos()
+        client = make_smogon_client()
+        client._regulation_config = FakeRegulation(FORMATS[0], past=(FORMATS[1],))
+        await UsageStatsPrefetcher(client, ratings=[0]).refresh_all()
+        sent = len(smogon_upstream.requests)
+
+        smogon_upstream.delay = 0.05
+        stats = await client.get_usage_stats(rating=0)
+        assert stats["_meta"]["format"] == FORMATS[0]
+        assert len(smogon_upstream.requests) == sent
+        assert (FORMATS[1], 0) in client._refreshing
+
+        await asyncio.gather(*client._refreshing.values())
+        assert client._pointers[(FORMATS[1], 0)]["month"] == "2026-09"
+
+    def test_default_combos_cover_current_regulation(self, make_smogon_client):
+        client = make_smogon_client()
+        prefetcher = UsageStatsPrefetcher(client)
+        combos = prefetcher.combos()
+        current = client.regulation_config.get_smogon_formats()
+        assert {fmt for fmt, _ in combos} == set(current)
+        assert len(combos) == len(current) * len(settings.SMOGON_RATING_CUTOFFS)
+        assert len(combos) < len(client.VGC_FORMATS) * len(settings.SMOGON_RATING_CUTOFFS)
+        assert prefetcher.interval_seconds == settings.SMOGON_REFRESH_INTERVAL_HOURS * 3600
@@ -9,6 +9,8 @@ from vgc_mcp.tools.speed_analysis_tools import register_speed_analysis_tools
 from vgc_mcp_core.models.pokemon import BaseStats
 from vgc_mcp_core.team.manager import TeamManager
 
+from .conftest import FakeSmogon
+
 
 @pytest.fixture
 def mock_pokeapi():
@@ -108,3 +110,30 @@ class TestAnalyzeSpeedSpread:
             speed_evs=252
         )
         assert "error" not in result or "speed" in str(result).lower()
+
+
+class TestGetMetaSpeedTiers:
+    """Tests for get_meta_speed_tiers."""
+
+    async def test_static_tiers_until_table_loads(self, mock_pokeapi, mock_team_manager):
+        """Without a loaded speed tier table the static tiers are flagged as a fallback."""
+        mcp = FastMCP("test")
+        register_speed_analysis_tools(mcp, mock_pokeapi, mock_team_manager, FakeSmogon())
+        fn = mcp._tool_manager._tools["get_meta_speed_tiers"].fn
+        result = await fn()
+        assert result["pokemon_count"] > 0
+        assert result["fallback"] is True
+
+        result = await fn(use_competitive_data=False)
+        assert result["pokemon_count"] > 0
+        assert "fallback" not in result
+
+    async def test_smogon_failure_flagged_as_fallback(self, mock_pokeapi, mock_team_manager):
+        """A failed usage lookup falls back to the static tiers and says so."""
+        smogon = FakeSmogon()
+        smogon.get_usage_snapshot = AsyncMock(side_effect=Exception("Smogon down"))
+        mcp = FastMCP("test")
+        register_speed_analysis_tools(mcp, mock_pokeapi, mock_team_manager, smogon)
+        result = await mcp._tool_manager._tools["get_meta_speed_tiers"].fn()
+        assert result["pokemon_count"] > 0
+        assert result["fallback"] is True
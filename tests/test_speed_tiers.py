@@ -0,0 +1,187 @@
+"""Tests for speed tiers generated from usage data."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.api.smogon import UsageSnapshot
+from vgc_mcp_core.calc.speed import META_SPEED_TIERS, get_meta_speed_tier, meta_speed_tier_names
+from vgc_mcp_core.calc.speed_tiers import (
+    SpeedTierTable,
+    build_speed_tier_table,
+    competitive_speed_benchmarks,
+    get_speed_tier_store,
+    reset_speed_tier_store,
+    speed_distribution,
+)
+from vgc_mcp_core.models.pokemon import Nature, parse_nature
+
+from .conftest import FakePokeAPI, FakeSmogon
+
+CHAOS = {
+    "info": {"metagame": "gen9vgc2026regf"},
+    "data": {
+        "Flutter Mane": {
+            "usage": 0.5,
+            "Spreads": {
+                "Timid:4/0/0/252/0/252": 60.0,
+                "Modest:4/0/0/252/0/252": 30.0,
+                "Timid:252/0/0/4/0/252": 10.0,
+            },
+        },
+        "Incineroar": {
+            "usage": 0.4,
+            "Spreads": {"Careful:252/4/76/0/172/4": 70.0, "Sassy:252/4/76/0/172/0": 30.0},
+        },
+        "Missingno": {"usage": 0.1, "Spreads": {"Jolly:0/0/0/0/0/252": 1.0}},
+    },
+}
+
+
+def _snapshot(month: str = "2026-09") -> UsageSnapshot:
+    return UsageSnapshot.build(CHAOS, "gen9vgc2026regf", 0, month, fetched_at=0.0)
+
+
+def _pokeapi(down: bool = False) -> FakePokeAPI:
+    return FakePokeAPI(
+        base_stats={
+            "flutter-mane": SimpleNamespace(speed=135),
+            "incineroar": SimpleNamespace(speed=60),
+        },
+        down=down,
+    )
+
+
+def _smogon(cache, month: str = "2026-09") -> FakeSmogon:
+    return FakeSmogon(_snapshot(month), cache=cache)
+
+
+@pytest.fixture(autouse=True)
+def fresh_store():
+    reset_speed_tier_store()
+    yield
+    reset_speed_tier_store()
+
+
+class TestSpeedDistribution:
+    """Spreads become usage-weighted speeds."""
+
+    def test_aggregates_by_speed(self):
+        spreads = [
+            {"nature": "Timid", "evs": {"speed": 252}, "usage": 60.0},
+            {"nature": "Timid", "evs": {"speed": 252}, "usage": 10.0},
+            {"nature": "Modest", "evs": {"speed": 252}, "usage": 30.0},
+        ]
+        distribution, stats = speed_distribution(spreads, 135)
+        assert distribution == [{"speed": 187, "usage": 30.0}, {"speed": 205, "usage": 70.0}]
+        assert stats["median"] == 205 and stats["min"] == 187 and stats["max"] == 205
+
+    def test_no_spreads(self):
+        assert speed_distribution([], 135) is None
+
+    def test_parse_nature(self):
+        assert parse_nature("Jolly") == Nature.JOLLY
+        assert parse_nature("bogus") == Nature.SERIOUS
+        assert parse_nature(None, Nature.HARDY) == Nature.HARDY
+
+
+class TestBuildTable:
+    """Tables are built from a usage snapshot."""
+
+    async def test_entries_and_benchmarks(self):
+        table, failures = await build_speed_tier_table(_snapshot(), _pokeapi())
+
+        assert failures == 0
+        assert table.names() == ["flutter-mane", "incineroar"]
+        assert table.missing == ["missingno"]
+        flutter = table.get("Flutter Mane")
+        assert flutter.common_speeds == [205, 187]
+        assert table.competitive_benchmarks(top_n_speeds=1) == {
+            "flutter-mane": [{"speed": 187, "nature": "Modest", "evs": 252,
+                              "usage": 30.0, "spread_desc": "Modest 252 Spe"}],
+            "incineroar": [{"speed": 72, "nature": "Sassy", "evs": 0,
+                            "usage": 30.0, "spread_desc": "Sassy 0 Spe"}],
+        }
+
+    async def test_network_failures_fall_back_to_static_bases(self):
+        table, failures = await build_speed_tier_table(_snapshot(), _pokeapi(down=True))
+
+        assert failures == 3
+        assert table.get("incineroar").base_speed == META_SPEED_TIERS["incineroar"]["base"]
+
+    async def test_round_trip(self):
+        table, _ = await build_speed_tier_table(_snapshot(), _pokeapi())
+        assert SpeedTierTable.from_dict(table.to_dict()) == table
+
+
+class TestSpeedTierStore:
+    """The store builds once per month and persists complete tables."""
+
+    async def test_persisted_and_reloaded(self, tmp_path):
+        with APICache(str(tmp_path)) as cache:
+            pokeapi = _pokeapi()
+            store = get_speed_tier_store()
+            tables = await asyncio.gather(
+                *(store.ensure(_smogon(cache), pokeapi) for _ in range(3))
+            )
+            assert tables[0] is tables[1] is tables[2]
+            assert len(pokeapi.fetched) == 3
+
+            reset_speed_tier_store()
+            table = await get_speed_tier_store().ensure(_smogon(cache), pokeapi)
+            assert table == tables[0]
+            assert len(pokeapi.fetched) == 3
+
+    async def test_incomplete_table_not_persisted(self, tmp_path):
+        with APICache(str(tmp_path)) as cache:
+            store = get_speed_tier_store()
+            await store.ensure(_smogon(cache), _pokeapi(down=True))
+            reset_speed_tier_store()
+            pokeapi = _pokeapi()
+            await get_speed_tier_store().ensure(_smogon(cache), pokeapi)
+            assert len(pokeapi.fetched) == 3
+
+    async def test_new_month_rebuilds(self, tmp_path):
+        with APICache(str(tmp_path)) as cache:
+            store = get_speed_tier_store()
+            first = await store.ensure(_smogon(cache), _pokeapi())
+            second = await store.ensure(_smogon(cache, month="2026-10"), _pokeapi())
+            assert first.month == "2026-09" and second.month == "2026-10"
+            assert store.table is second
+
+
+class TestCompetitiveBenchmarks:
+    """Benchmarks come from the loaded table and never wait on a build."""
+
+    async def test_cold_table_loads_in_background(self, tmp_path):
+        with APICache(str(tmp_path)) as cache:
+            smogon, pokeapi = _smogon(cache), _pokeapi()
+            assert await competitive_speed_benchmarks(smogon, pokeapi) == {}
+            assert pokeapi.fetched == []
+
+            await get_speed_tier_store().start(smogon, pokeapi)
+            benchmarks = await competitive_speed_benchmarks(smogon, pokeapi)
+            assert sorted(s["speed"] for s in benchmarks["flutter-mane"]) == [187, 205]
+
+
+class TestMetaSpeedTier:
+    """get_meta_speed_tier serves the loaded table, else the static tiers."""
+
+    def test_static_fallback(self):
+        data = get_meta_speed_tier("Flutter Mane")
+        assert data["base"] == 135
+        assert data["common_speeds"] == sorted(data["common_speeds"], reverse=True)
+        assert meta_speed_tier_names() == list(META_SPEED_TIERS)
+
+    async def test_loaded_table(self, tmp_path):
+        with APICache(str(tmp_path)) as cache:
+            await get_speed_tier_store().ensure(_smogon(cache), _pokeapi())
+
+        data = get_meta_speed_tier("Flutter Mane")
+        assert data["common_speeds"] == [205, 187]
+        assert data["paradox_type"] == META_SPEED_TIERS["flutter-mane"]["paradox_type"]
+        assert meta_speed_tier_names(limit=1) == ["flutter-mane"]
+        static = META_SPEED_TIERS["dragonite"]
+        assert get_meta_speed_tier("dragonite")["spreads"] == static["spreads"]
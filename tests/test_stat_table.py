@@ -0,0 +1,77 @@
+"""Tests for the precomputed level-50 stat table."""
+
+import pytest
+
+from vgc_mcp_core.calc.stat_table import StatTable, get_stat_table
+from vgc_mcp_core.calc.stats import calculate_hp, calculate_stat
+from vgc_mcp_core.config import EV_BREAKPOINTS_LV50
+
+
+@pytest.fixture(scope="module")
+def table() -> StatTable:
+    return get_stat_table()
+
+
+def _scan_min_ev(values, target):
+    for ev, value in zip(EV_BREAKPOINTS_LV50, values):
+        if value >= target:
+            return ev
+    return None
+
+
+class TestForwardLookups:
+    """Table entries match the stat formulas."""
+
+    @pytest.mark.parametrize("iv", [0, 31])
+    @pytest.mark.parametrize("nature_mod", [0.9, 1.0, 1.1])
+    def test_stats_match_formula(self, table, iv, nature_mod):
+        for base in range(1, 256, 7):
+            for ev in range(0, 253, 2):
+                expected = calculate_stat(base, iv, ev, 50, nature_mod)
+                assert table.stat(base, ev, nature_mod, iv) == expected
+
+    @pytest.mark.parametrize("iv", [0, 31])
+    def test_hp_matches_formula(self, table, iv):
+        for base in range(1, 256, 5):
+            for ev in range(0, 253, 3):
+                assert table.hp(base, ev, iv) == calculate_hp(base, iv, ev, 50)
+
+    def test_known_values(self, table):
+        assert table.stat(135, 252, 1.1) == 205
+        assert table.hp(1, 252) == 1
+
+    def test_untabled_inputs_fall_back(self, table):
+        assert table.stat(100, 252, 1.1, iv=20) == calculate_stat(100, 20, 252, 50, 1.1)
+        assert table.stat(100, 252, 1.0, level=100) == calculate_stat(100, 31, 252, 100, 1.0)
+        assert table.hp(100, 300) == calculate_hp(100, 31, 300, 50)
+        assert table.steps(100, iv=20) is None
+
+    def test_row_is_breakpoint_values(self, table):
+        expected = [calculate_hp(95, 31, ev, 50) for ev in EV_BREAKPOINTS_LV50]
+        assert table.row(95, hp=True) == expected
+
+
+class TestInverseLookups:
+    """min_ev / max_ev_below agree with scanning the breakpoints."""
+
+    @pytest.mark.parametrize("iv,level", [(31, 50), (0, 50), (15, 50), (31, 100)])
+    def test_min_ev_matches_scan(self, table, iv, level):
+        for base in (20, 80, 135, 200):
+            values = [calculate_stat(base, iv, ev, level, 1.1) for ev in EV_BREAKPOINTS_LV50]
+            for target in range(values[0] - 1, values[-1] + 2):
+                assert table.min_ev(base, target, 1.1, iv, level) == _scan_min_ev(values, target)
+
+    @pytest.mark.parametrize("iv", [0, 31])
+    def test_max_ev_below_matches_scan(self, table, iv):
+        for base in (30, 100, 150):
+            values = [calculate_stat(base, iv, ev, 50, 0.9) for ev in EV_BREAKPOINTS_LV50]
+            for target in range(values[0], values[-1] + 2):
+                below = [ev for ev, value in zip(EV_BREAKPOINTS_LV50, values) if value < target]
+                expected = below[-1] if below else None
+                assert table.max_ev_below(base, target, 0.9, iv) == expected
+
+    def test_examples(self, table):
+        assert table.min_ev(135, 200, 1.1) == 212
+        assert table.min_ev(135, 206, 1.1) is None
+        assert table.max_ev_below(135, 155, 1.1) is None
+        assert table.min_ev(1, 1, hp=True) == 0
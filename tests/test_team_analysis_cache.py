@@ -0,0 +1,146 @@
+"""Tests for incremental team re-analysis."""
+
+import pytest
+
+from vgc_mcp_core.calc.modifiers import TYPE_CHART, get_type_effectiveness
+from vgc_mcp_core.calc.speed_control import get_speed_control_summary
+from vgc_mcp_core.calc.stats import calculate_all_stats
+from vgc_mcp_core.calc.team_matchup import build_matchup_matrix, score_1v1_matchup
+from vgc_mcp_core.models.pokemon import BaseStats, EVSpread, Nature, PokemonBuild
+from vgc_mcp_core.team.analysis import TeamAnalyzer
+from vgc_mcp_core.team.analysis_cache import (
+    TeamAnalysisCache,
+    compute_slot_artifacts,
+    get_team_analysis_cache,
+    reset_team_analysis_cache,
+)
+from vgc_mcp_core.team.core_builder import analyze_core_synergy
+from vgc_mcp_core.team.manager import TeamManager
+
+
+def _build(name: str, types: list[str], speed: int = 80, **evs) -> PokemonBuild:
+    return PokemonBuild(
+        name=name,
+        base_stats=BaseStats(hp=80, attack=100, defense=80, special_attack=70,
+                             special_defense=80, speed=speed),
+        types=types,
+        nature=Nature.ADAMANT,
+        evs=EVSpread(**evs),
+    )
+
+
+TEAM = [
+    _build("incineroar", ["Fire", "Dark"], 60),
+    _build("rillaboom", ["Grass"], 85),
+    _build("urshifu", ["Fighting", "Water"], 97),
+    _build("amoonguss", ["Grass", "Poison"], 30),
+    _build("tornadus", ["Flying"], 111),
+    _build("gholdengo", ["Steel", "Ghost"], 84),
+]
+OPPONENTS = [
+    _build("flutter-mane", ["Ghost", "Fairy"], 135),
+    _build("chien-pao", ["Dark", "Ice"], 135),
+    _build("landorus", ["Ground", "Flying"], 91),
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    reset_team_analysis_cache()
+    yield
+    reset_team_analysis_cache()
+
+
+@pytest.fixture
+def manager() -> TeamManager:
+    manager = TeamManager()
+    for pokemon in TEAM:
+        manager.add_pokemon(pokemon.model_copy(deep=True))
+    return manager
+
+
+class TestSlotArtifacts:
+    """Per-build artifacts match the direct calculations."""
+
+    def test_artifacts(self):
+        artifacts = compute_slot_artifacts(TEAM[0])
+        assert artifacts.stats == calculate_all_stats(TEAM[0])
+        assert artifacts.effectiveness == {
+            t: get_type_effectiveness(t, ["Fire", "Dark"]) for t in TYPE_CHART
+        }
+        assert artifacts.super_effective == ("Grass", "Ice", "Bug", "Steel", "Psychic", "Ghost")
+
+    def test_lru_eviction(self):
+        cache = TeamAnalysisCache(max_slots=2)
+        for pokemon in TEAM[:3]:
+            cache.slot(pokemon)
+        assert len(cache) == 2
+        cache.slot(TEAM[0])
+        assert cache.slot_misses == 4
+
+
+class TestIncrementalAnalysis:
+    """Edits recompute only the changed slot."""
+
+    def test_swap_recomputes_one_slot(self, manager):
+        analyzer = TeamAnalyzer()
+        analyzer.get_summary(manager.team)
+        cache = get_team_analysis_cache()
+        assert cache.slot_misses == 6
+
+        manager.swap_pokemon(2, _build("ogerpon", ["Grass", "Water"], 110))
+        analyzer.get_summary(manager.team)
+        analyze_core_synergy(manager.team)
+        get_speed_control_summary(manager.team)
+        assert cache.slot_misses == 7
+
+        # Swapping back reuses the original slot
+        manager.swap_pokemon(2, TEAM[2].model_copy(deep=True))
+        analyzer.get_quick_summary(manager.team)
+        assert cache.slot_misses == 7
+
+    def test_in_place_update_is_picked_up(self, manager):
+        analyzer = TeamAnalyzer()
+        before = analyzer.analyze_speed_tiers(manager.team)
+        manager.update_pokemon(4, evs=EVSpread(speed=252), nature=Nature.JOLLY)
+        after = analyzer.analyze_speed_tiers(manager.team)
+
+        assert after[0]["name"] == "tornadus"
+        assert after[0]["speed"] > before[0]["speed"]
+        assert after[0]["speed"] == calculate_all_stats(manager.team.slots[4].pokemon)["speed"]
+
+    def test_results_match_cold_cache(self, manager):
+        analyzer = TeamAnalyzer()
+        analyzer.get_summary(manager.team)
+        manager.remove_pokemon(1)
+        manager.reorder(0, 3)
+        warm = analyzer.get_summary(manager.team)
+        warm_synergy = analyze_core_synergy(manager.team)
+
+        reset_team_analysis_cache()
+        assert analyzer.get_summary(manager.team) == warm
+        assert analyze_core_synergy(manager.team) == warm_synergy
+
+
+class TestMatchupMatrix:
+    """Matrix rows for unchanged slots are reused."""
+
+    def test_swap_rescores_one_row(self):
+        team = list(TEAM)
+        matrix, detailed = build_matchup_matrix(team, OPPONENTS)
+        cache = get_team_analysis_cache()
+        assert cache.pair_misses == 18
+
+        team[1] = _build("ogerpon", ["Grass", "Water"], 110)
+        new_matrix, _ = build_matchup_matrix(team, OPPONENTS)
+        assert cache.pair_misses == 21
+        assert new_matrix[0] == matrix[0] and new_matrix[2:] == matrix[2:]
+
+    def test_scores_unchanged(self):
+        matrix, detailed = build_matchup_matrix(TEAM[:2], OPPONENTS[:2])
+        for i, ours in enumerate(TEAM[:2]):
+            for j, theirs in enumerate(OPPONENTS[:2]):
+                forward = score_1v1_matchup(ours, theirs)
+                assert detailed[i * 2 + j] == forward
+                backward = score_1v1_matchup(theirs, ours)
+                assert matrix[i][j] == round(forward.total - backward.total, 1)
@@ -0,0 +1,204 @@
+"""Tests for the teammate co-occurrence matrix and beam-search team completion."""
+
+import pytest
+
+from vgc_mcp_core.api.smogon import UsageSnapshot
+from vgc_mcp_core.models.pokemon import BaseStats, PokemonBuild
+from vgc_mcp_core.models.team import Team
+from vgc_mcp_core.team.core_builder import complete_team, find_popular_cores, suggest_team_fills
+from vgc_mcp_core.team.teammate_matrix import (
+    ROLE_BITS,
+    TYPE_BITS,
+    TeammateMatrix,
+    get_teammate_matrix,
+    reset_teammate_matrices,
+    type_masks,
+)
+
+from .conftest import FakePokeAPI, FakeSmogon
+
+STATS = BaseStats(hp=80, attack=80, defense=80, special_attack=80, special_defense=80, speed=80)
+
+TYPES = {
+    "Incineroar": ["Fire", "Dark"],
+    "Rillaboom": ["Grass"],
+    "Flutter Mane": ["Ghost", "Fairy"],
+    "Amoonguss": ["Grass", "Poison"],
+    "Tornadus": ["Flying"],
+    "Urshifu-Rapid-Strike": ["Fighting", "Water"],
+    "Urshifu": ["Fighting", "Dark"],
+    "Kyogre": ["Water"],
+    "Groudon": ["Ground"],
+}
+
+# species -> (usage, teammate weights)
+USAGE = {
+    "Incineroar": (0.50, {"Rillaboom": 40, "Flutter Mane": 30, "Amoonguss": 20, "Kyogre": 10}),
+    "Rillaboom": (0.40, {"Incineroar": 50, "Urshifu-Rapid-Strike": 30, "Tornadus": 20}),
+    "Flutter Mane": (0.35, {"Incineroar": 40, "Tornadus": 40, "Urshifu": 20}),
+    "Amoonguss": (0.30, {"Incineroar": 60, "Urshifu-Rapid-Strike": 40}),
+    "Tornadus": (0.25, {"Flutter Mane": 50, "Urshifu": 30, "Rillaboom": 20}),
+    "Urshifu-Rapid-Strike": (0.20, {"Rillaboom": 50, "Amoonguss": 30, "Urshifu": 20}),
+    "Urshifu": (0.10, {"Tornadus": 50, "Flutter Mane": 50}),
+    "Kyogre": (0.08, {"Groudon": 70, "Incineroar": 30}),
+    "Groudon": (0.04, {"Kyogre": 100}),
+}
+
+
+def _snapshot(month="2026-09"):
+    data = {
+        "data": {
+            name: {"usage": usage, "Teammates": mates}
+            for name, (usage, mates) in USAGE.items()
+        }
+    }
+    return UsageSnapshot.build(data, "gen9vgc2026regi", 0, month, fetched_at=0.0)
+
+
+def _team(*names):
+    team = Team()
+    for name in names:
+        key = next(k for k in TYPES if k.lower().replace(" ", "-") == name)
+        team.add_pokemon(PokemonBuild(name=name, base_stats=STATS, types=TYPES[key]))
+    return team
+
+
+@pytest.fixture(autouse=True)
+def fresh_matrices():
+    reset_teammate_matrices()
+    yield
+    reset_teammate_matrices()
+
+
+@pytest.fixture
+def matrix():
+    return TeammateMatrix.from_snapshot(_snapshot())
+
+
+class TestMasks:
+    """Role and type bitmasks."""
+
+    def test_type_masks(self):
+        weak, resist = type_masks(["Fire", "Dark"])
+        assert weak & TYPE_BITS["Water"] and weak & TYPE_BITS["Fighting"]
+        assert resist & TYPE_BITS["Fire"] and resist & TYPE_BITS["Psychic"]
+        assert not (weak & resist)
+
+    def test_roles_from_names(self, matrix):
+        i = matrix.lookup("incineroar")
+        assert matrix.roles[i] == ROLE_BITS["intimidate"] | ROLE_BITS["fake_out"]
+
+
+class TestTeammateMatrix:
+    """Co-occurrence shares and lookups."""
+
+    def test_rows_are_teammate_shares(self, matrix):
+        i, j = matrix.lookup("Incineroar"), matrix.lookup("rillaboom")
+        assert matrix.co[i][j] == pytest.approx(40.0)
+        assert matrix.co[j][i] == pytest.approx(50.0)
+        assert matrix.pair[i][j] == matrix.pair[j][i] == pytest.approx(45.0)
+
+    def test_species_ordered_by_usage(self, matrix):
+        assert matrix.species[0] == "Incineroar"
+        assert matrix.usage[0] == pytest.approx(50.0)
+
+    def test_lookup_any_spelling(self, matrix):
+        assert matrix.lookup("flutter-mane") == matrix.lookup("Flutter Mane")
+        assert matrix.lookup("missingno") is None
+
+    def test_size_limit(self):
+        small = TeammateMatrix.from_snapshot(_snapshot(), size=3)
+        assert len(small) == 3
+        assert all(len(row) == 3 for row in small.co)
+
+    def test_top_cores(self, matrix):
+        cores = matrix.top_cores(top=3)
+        pairs = [tuple(sorted(c["pokemon"])) for c in cores]
+        assert len(pairs) == len(set(pairs))
+        assert cores[0]["pokemon"] == ["Incineroar", "Rillaboom"]
+        assert cores[0]["pairing_rate"] == 40.0
+
+
+class TestBeamSearch:
+    """Complete fills from the matrix."""
+
+    def test_fills_every_open_slot(self, matrix):
+        fills = matrix.beam_search([("incineroar", ["Fire", "Dark"])], slots=3, limit=2)
+        assert len(fills) == 2
+        for fill in fills:
+            assert len(fill.pokemon) == 3
+            assert "Incineroar" not in fill.pokemon
+        assert fills[0].score >= fills[1].score
+
+    def test_species_clause_and_one_restricted(self, matrix):
+        fills = matrix.beam_search([("kyogre", ["Water"])], slots=5, beam_width=20, limit=5)
+        for fill in fills:
+            assert "Groudon" not in fill.pokemon
+            assert not {"Urshifu", "Urshifu-Rapid-Strike"} <= set(fill.pokemon)
+
+    def test_beam_finds_best_small_fill(self, matrix):
+        from itertools import combinations
+
+        team = [("amoonguss", ["Grass", "Poison"])]
+        root = matrix.start(team)
+        best = max(
+            (
+                combo for combo in combinations(matrix.candidates(root), 2)
+                if matrix.base[combo[0]] != matrix.base[combo[1]]
+            ),
+            key=lambda combo: matrix._extend(matrix._extend(root, combo[0]), combo[1]).score,
+        )
+        fills = matrix.beam_search(team, slots=2, beam_width=50, limit=1)
+        assert set(fills[0].pokemon) == {matrix.species[i] for i in best}
+
+    def test_coverage_counts_once_types_known(self, matrix):
+        team = [("incineroar", ["Fire", "Dark"])]
+        untyped = {c.index: c for c in matrix.score_candidates(team)}
+        matrix.set_types(matrix.lookup("Urshifu-Rapid-Strike"), ["Fighting", "Water"])
+        typed = {c.index: c for c in matrix.score_candidates(team)}
+
+        i = matrix.lookup("Urshifu-Rapid-Strike")
+        # Incineroar is weak to Water, Ground, Rock and Fighting
+        assert untyped[i].covers_weaknesses == []
+        assert typed[i].covers_weaknesses == ["Water", "Rock"]
+        assert typed[i].score > untyped[i].score
+
+
+class TestTeamCompletion:
+    """core_builder entry points backed by the matrix."""
+
+    async def test_matrix_built_once_per_month(self):
+        smogon = FakeSmogon(_snapshot())
+        first = await get_teammate_matrix(smogon)
+        assert await get_teammate_matrix(smogon) is first
+
+        smogon.snapshot = _snapshot("2026-10")
+        assert await get_teammate_matrix(smogon) is not first
+
+    async def test_no_snapshot(self):
+        smogon = FakeSmogon(None)
+        assert await complete_team(_team("incineroar"), smogon) == []
+        assert await find_popular_cores(smogon) == []
+
+    async def test_complete_team(self):
+        smogon = FakeSmogon(_snapshot())
+        pokeapi = FakePokeAPI(types=TYPES)
+        suggestions = await complete_team(_team("incineroar", "rillaboom"), smogon, pokeapi=pokeapi)
+
+        names = [s.pokemon_name for s in suggestions]
+        assert "Incineroar" not in names and "Rillaboom" not in names
+        assert suggestions == sorted(suggestions, key=lambda s: -s.synergy_score)
+        assert len(pokeapi.fetched) == len(USAGE)
+
+        await complete_team(_team("incineroar"), smogon, pokeapi=pokeapi)
+        assert len(pokeapi.fetched) == len(USAGE)
+
+    async def test_suggest_team_fills(self):
+        smogon = FakeSmogon(_snapshot())
+        fills = await suggest_team_fills(_team("incineroar", "rillaboom"), smogon, limit=1)
+        assert len(fills) == 1 and len(fills[0].pokemon) == 4
+
+    async def test_find_popular_cores(self):
+        cores = await find_popular_cores(FakeSmogon(_snapshot()), limit=2)
+        assert len(cores) == 2
+        assert cores[0]["pairing_rate"] >= cores[1]["pairing_rate"]
@@ -0,0 +1,241 @@
+"""Tests for the shared HTTP transport used by the API clients."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from vgc_mcp_core.api.cache import APICache
+from vgc_mcp_core.api.pokeapi import PokeAPIClient, PokeAPIError
+from vgc_mcp_core.api.pokepaste import PokePasteClient, PokePasteError
+from vgc_mcp_core.api.transport import (
+    RetriesExhaustedError,
+    RetryBudget,
+    TokenBucket,
+    Transport,
+    backoff_delay,
+    get_transport,
+)
+from vgc_mcp_core.metrics import REGISTRY
+
+URL = "https://pokeapi.co/api/v2/pokemon/incineroar"
+INCINEROAR = {"name": "incineroar", "stats": []}
+
+
+class Upstream:
+    """MockTransport handler that fails the first ``failures`` requests."""
+
+    def __init__(self, status: int = 200, failures: int = 0, delay: float = 0.0):
+        self.status = status
+        self.failures = failures
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if len(self.requests) <= self.failures:
+            return httpx.Response(503, request=request)
+        if request.url.path.endswith("/raw"):
+            return httpx.Response(self.status, text="Incineroar @ Safety Goggles", request=request)
+        return httpx.Response(self.status, json=INCINEROAR, request=request)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with APICache(str(tmp_path)) as cache:
+        yield cache
+
+
+@pytest.fixture
+def no_sleep():
+    """Skip backoff sleeps but record what they would have been."""
+    delays = []
+
+    async def fake_sleep(seconds):
+        delays.append(seconds)
+
+    with patch("vgc_mcp_core.api.transport.asyncio.sleep", fake_sleep):
+        yield delays
+
+
+def _pokeapi(cache, upstream: Upstream) -> PokeAPIClient:
+    client = PokeAPIClient(cache)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    return client
+
+
+class TestSingleFlight:
+    """Concurrent misses for one resource share a single request."""
+
+    async def test_pokeapi_herd_collapses_to_one_request(self, cache):
+        upstream = Upstream(delay=0.05)
+        client = _pokeapi(cache, upstream)
+
+        results = await asyncio.gather(*(client._fetch("pokemon/incineroar") for _ in range(10)))
+
+        assert all(r == INCINEROAR for r in results)
+        assert len(upstream.requests) == 1
+        assert get_transport().stats["hosts"]["pokeapi.co"]["coalesced"] == 9
+        assert get_transport().stats["inflight"] == 0
+        await client.close()
+
+    async def test_pokepaste_herd_collapses_to_one_request(self, cache):
+        upstream = Upstream(delay=0.05)
+        client = PokePasteClient(cache)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+
+        results = await asyncio.gather(*(client.get_paste("abc123") for _ in range(5)))
+
+        assert set(results) == {"Incineroar @ Safety Goggles"}
+        assert len(upstream.requests) == 1
+        await client.close()
+
+    async def test_errors_reach_every_waiter(self, cache):
+        upstream = Upstream(status=404, delay=0.05)
+        client = _pokeapi(cache, upstream)
+
+        results = await asyncio.gather(
+            *(client._fetch("pokemon/missingno") for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, PokeAPIError) and "Not found" in str(r) for r in results)
+        assert len(upstream.requests) == 1
+        await client.close()
+
+    async def test_cancelled_caller_does_not_cancel_the_fetch(self):
+        transport = Transport()
+        started = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(transport.single_flight(URL, fetch))
+        await started.wait()
+        second = asyncio.create_task(transport.single_flight(URL, fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+
+class TestRetries:
+    """Retries back off with jitter and stop when the host's budget is spent."""
+
+    async def test_server_errors_are_retried(self, cache, no_sleep):
+        upstream = Upstream(failures=2)
+        client = _pokeapi(cache, upstream)
+
+        assert await client._fetch("pokemon/incineroar") == INCINEROAR
+        assert len(upstream.requests) == 3
+        assert len(no_sleep) == 2
+        await client.close()
+
+    async def test_not_found_is_not_retried(self, cache, no_sleep):
+        upstream = Upstream(status=404)
+        client = _pokeapi(cache, upstream)
+
+        with pytest.raises(PokeAPIError, match="Not found: pokemon/missingno"):
+            await client._fetch("pokemon/missingno")
+        assert len(upstream.requests) == 1
+        assert no_sleep == []
+        await client.close()
+
+    async def test_exhausted_attempts_raise(self, cache, no_sleep):
+        upstream = Upstream(failures=100)
+        client = _pokeapi(cache, upstream)
+
+        with pytest.raises(PokeAPIError, match="Failed after 3 attempts"):
+            await client._fetch("pokemon/incineroar")
+        assert len(upstream.requests) == 3
+        await client.close()
+
+    async def test_budget_stops_retry_storms(self, no_sleep):
+        REGISTRY.reset()
+        transport = Transport(budget_reserve=2, budget_ratio=0.0)
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            raise httpx.ConnectError("down")
+
+        for _ in range(3):
+            with pytest.raises(RetriesExhaustedError):
+                await transport.call(URL, attempt)
+
+        # Two retries from the reserve, then each request gets one attempt
+        assert len(calls) == 3 + 2
+        assert transport.stats["hosts"]["pokeapi.co"]["retry_denied"] == 2
+        rendered = REGISTRY.render_prometheus()
+        assert 'vgc_http_transport_events_total{host="pokeapi.co",event="retry"} 2' in rendered
+
+    async def test_pokepaste_network_errors_keep_their_message(self, cache, no_sleep):
+        def down(request):
+            raise httpx.ConnectError("down", request=request)
+
+        client = PokePasteClient(cache)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(down))
+
+        with pytest.raises(PokePasteError, match="Network error fetching paste"):
+            await client.get_paste_raw("abc123")
+        await client.close()
+
+    def test_backoff_is_jittered_and_capped(self):
+        for attempt in range(8):
+            delays = [backoff_delay(attempt) for _ in range(50)]
+            assert all(0 <= d <= min(10.0, 2 ** attempt) for d in delays)
+        assert len({backoff_delay(3) for _ in range(20)}) > 1
+
+    def test_budget_refills_with_requests(self):
+        budget = RetryBudget(ratio=0.5, reserve=1)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+
+
+class TestRateLimit:
+    """Each host gets a token bucket."""
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10.0, burst=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    async def test_throttle_waits_past_the_burst(self, no_sleep):
+        transport = Transport(rate=5.0, burst=1)
+        for _ in range(3):
+            await transport.throttle(URL)
+        await transport.throttle("https://pokepast.es/abc123/raw")
+
+        assert len(no_sleep) == 2
+        assert transport.stats["hosts"]["pokeapi.co"]["throttled"] == 2
+        assert transport.stats["hosts"]["pokepast.es"]["throttled"] == 0
+
+    async def test_rate_zero_disables(self, no_sleep):
+        transport = Transport(rate=0)
+        for _ in range(100):
+            await transport.throttle(URL)
+        assert no_sleep == []
+
+
+class TestPool:
+    """Clients without their own ``_client`` share one pool."""
+
+    async def test_clients_share_the_pool(self, cache):
+        pokeapi, paste = PokeAPIClient(cache), PokePasteClient(cache)
+
+        shared = await pokeapi._get_client()
+        assert await paste._get_client() is shared
+
+        await pokeapi.close()
+        assert not shared.is_closed
+        await get_transport().close()
+        assert shared.is_closed
@@ -0,0 +1,245 @@
+"""Tests for the turn 1 Monte Carlo simulator."""
+
+import pytest
+
+from vgc_mcp_core.calc.damage import calculate_damage
+from vgc_mcp_core.calc.team_matchup import build_pokemon_profile
+from vgc_mcp_core.calc.turn_sim import (
+    OutcomeEstimate,
+    TurnOneOption,
+    TurnOneSimulator,
+    simulate_lead_matrix,
+    wilson_interval,
+)
+from vgc_mcp_core.models.move import Move, MoveCategory
+from vgc_mcp_core.models.pokemon import BaseStats, EVSpread, Nature, PokemonBuild
+
+INCINEROAR_STATS = BaseStats(
+    hp=95, attack=115, defense=90, special_attack=80, special_defense=90, speed=60
+)
+RILLABOOM_STATS = BaseStats(
+    hp=100, attack=125, defense=90, special_attack=60, special_defense=70, speed=85
+)
+FLUTTER_MANE_STATS = BaseStats(
+    hp=55, attack=55, defense=55, special_attack=135, special_defense=135, speed=135
+)
+AMOONGUSS_STATS = BaseStats(
+    hp=114, attack=85, defense=70, special_attack=85, special_defense=80, speed=30
+)
+
+FAKE_OUT = Move(name="fake-out", type="normal", category=MoveCategory.PHYSICAL,
+                power=40, priority=3, makes_contact=True)
+PROTECT = Move(name="protect", type="normal", category=MoveCategory.STATUS, target="user")
+FLARE_BLITZ = Move(name="flare-blitz", type="fire", category=MoveCategory.PHYSICAL, power=120)
+WOOD_HAMMER = Move(name="wood-hammer", type="grass", category=MoveCategory.PHYSICAL, power=120)
+MOONBLAST = Move(name="moonblast", type="fairy", category=MoveCategory.SPECIAL, power=95)
+DAZZLING_GLEAM = Move(name="dazzling-gleam", type="fairy", category=MoveCategory.SPECIAL,
+                      power=80, target="all-opponents")
+RAGE_POWDER = Move(name="rage-powder", type="bug", category=MoveCategory.STATUS, target="user")
+TAILWIND = Move(name="tailwind", type="flying", category=MoveCategory.STATUS, target="users-field")
+
+
+def _profile(name, stats, types, moves, ability, nature=Nature.SERIOUS, evs=None, item=None):
+    build = PokemonBuild(
+        name=name, base_stats=stats, types=types, nature=nature,
+        evs=evs or EVSpread(), ability=ability, item=item,
+    )
+    return build_pokemon_profile(build, moves, ability, item_name=item or "")
+
+
+@pytest.fixture
+def incineroar():
+    return _profile("incineroar", INCINEROAR_STATS, ["Fire", "Dark"],
+                    [FAKE_OUT, FLARE_BLITZ], "intimidate",
+                    Nature.ADAMANT, EVSpread(hp=252, attack=252))
+
+
+@pytest.fixture
+def rillaboom():
+    return _profile("rillaboom", RILLABOOM_STATS, ["Grass"],
+                    [FAKE_OUT, WOOD_HAMMER], "overgrow",
+                    Nature.ADAMANT, EVSpread(hp=252, attack=252))
+
+
+@pytest.fixture
+def flutter_mane():
+    return _profile("flutter-mane", FLUTTER_MANE_STATS, ["Ghost", "Fairy"],
+                    [MOONBLAST, DAZZLING_GLEAM], "protosynthesis",
+                    Nature.TIMID, EVSpread(special_attack=252, speed=252))
+
+
+@pytest.fixture
+def amoonguss():
+    return _profile("amoonguss", AMOONGUSS_STATS, ["Grass", "Poison"],
+                    [RAGE_POWDER, PROTECT], "regenerator",
+                    Nature.RELAXED, EVSpread(hp=252, defense=252))
+
+
+class TestWilsonInterval:
+    """Confidence bounds."""
+
+    def test_bounds_contain_estimate(self):
+        low, high = wilson_interval(30, 100)
+        assert low < 0.3 < high
+        assert high - low == pytest.approx(0.18, abs=0.01)
+
+    def test_extremes_stay_in_range(self):
+        assert wilson_interval(0, 500)[0] == 0.0
+        assert wilson_interval(500, 500)[1] == pytest.approx(1.0)
+        assert OutcomeEstimate.from_counts(0, 0).percent == 0.0
+
+
+class TestTurnOneSimulator:
+    """Sampled turn 1 mechanics."""
+
+    def test_faster_fake_out_flinches_slower_one(self, incineroar, rillaboom, flutter_mane):
+        result = TurnOneSimulator().simulate(
+            [incineroar, flutter_mane], [rillaboom, flutter_mane], samples=400,
+            choices={"rillaboom": [TurnOneOption("fake-out", target="incineroar")]},
+        )
+        assert result.flinch["incineroar"].percent == 100.0
+        assert result.actions["rillaboom"] == {"fake-out -> incineroar": 100.0}
+
+    def test_ghosts_are_not_fake_out_targets(self, incineroar, flutter_mane, amoonguss):
+        result = TurnOneSimulator().simulate(
+            [incineroar, flutter_mane], [flutter_mane, amoonguss], samples=200,
+        )
+        assert list(result.actions["incineroar"]) == ["fake-out -> amoonguss"]
+        assert result.flinch["flutter-mane (opponent)"].percent == 0.0
+
+    def test_speed_ties_are_random(self):
+        leads = [
+            _profile(f"rillaboom-{i}", RILLABOOM_STATS, ["Grass"], [WOOD_HAMMER], "overgrow")
+            for i in range(4)
+        ]
+        result = TurnOneSimulator().simulate(leads[:2], leads[2:], samples=2000, seed=7)
+        for estimate in result.moves_first.values():
+            assert estimate.low < 25 < estimate.high
+
+    def test_mirror_leads_reported_per_side(self, incineroar, flutter_mane):
+        result = TurnOneSimulator().simulate(
+            [incineroar, flutter_mane], [flutter_mane, incineroar], samples=100,
+        )
+        assert set(result.faint) == {
+            "incineroar", "flutter-mane", "flutter-mane (opponent)", "incineroar (opponent)",
+        }
+
+    def test_trick_room_reverses_order(self, incineroar, rillaboom, flutter_mane, amoonguss):
+        choices = {
+            "flutter-mane": [TurnOneOption("moonblast")],
+            "incineroar": [TurnOneOption("flare-blitz")],
+            "rillaboom": [TurnOneOption("wood-hammer")],
+        }
+        slow = _profile("amoonguss", AMOONGUSS_STATS, ["Grass", "Poison"],
+                        [Move(name="pollen-puff", type="bug", category=MoveCategory.SPECIAL,
+                              power=90)], "regenerator")
+        normal = TurnOneSimulator().simulate(
+            [flutter_mane, incineroar], [rillaboom, slow], samples=200, choices=choices,
+        )
+        reversed_ = TurnOneSimulator().simulate(
+            [flutter_mane, incineroar], [rillaboom, slow], samples=200,
+            choices=choices, trick_room=True,
+        )
+        assert normal.moves_first["flutter-mane"].percent == 100.0
+        assert reversed_.moves_first["amoonguss"].percent == 100.0
+
+    def test_tailwind_changes_order_mid_turn(self, incineroar, amoonguss):
+        # Adamant 252 Atk Incineroar and this glass cannon OHKO each other;
+        # the glass cannon (110 speed) only moves first without Tailwind (160)
+        glass = _profile(
+            "glass-cannon",
+            BaseStats(hp=50, attack=150, defense=50, special_attack=50,
+                      special_defense=50, speed=90),
+            ["Fighting"],
+            [Move(name="close-combat", type="fighting", category=MoveCategory.PHYSICAL,
+                  power=120)],
+            "inner-focus", Nature.ADAMANT, EVSpread(attack=252, speed=252),
+        )
+        tornadus = _profile(
+            "tornadus",
+            BaseStats(hp=79, attack=115, defense=70, special_attack=125,
+                      special_defense=80, speed=111),
+            ["Flying"], [TAILWIND], "prankster",
+        )
+        choices = {
+            "incineroar": [TurnOneOption("flare-blitz", target="glass-cannon")],
+            "glass-cannon": [TurnOneOption("close-combat", target="incineroar")],
+            "amoonguss": [TurnOneOption("protect")],
+        }
+        without = TurnOneSimulator().simulate(
+            [incineroar, amoonguss], [glass, amoonguss], samples=300, choices=choices,
+        )
+        with_tailwind = TurnOneSimulator().simulate(
+            [incineroar, tornadus], [glass, amoonguss], samples=300, choices=choices,
+        )
+        assert without.faint["incineroar"].percent > 90
+        assert with_tailwind.faint["glass-cannon"].percent > 90
+        assert with_tailwind.faint["incineroar"].percent == 0.0
+
+    def test_spread_move_reduction(self, flutter_mane, amoonguss, incineroar):
+        sim = TurnOneSimulator()
+        single = sim._rolls(
+            flutter_mane, DAZZLING_GLEAM, incineroar, False, False, (None, None), (0, 0)
+        )
+        spread = sim._rolls(
+            flutter_mane, DAZZLING_GLEAM, incineroar, True, False, (None, None), (0, 0)
+        )
+        assert max(spread) < max(single)
+
+    def test_intimidate_lowers_foe_attack(self, incineroar, rillaboom):
+        stages, _ = TurnOneSimulator._intimidate([incineroar, rillaboom, rillaboom, incineroar])
+        assert stages[2] == (-1, 0) and stages[3] == (-1, 0)
+        assert stages[0] == (-1, 0) and stages[1] == (-1, 0)
+
+    def test_redirection_draws_single_target_moves(self, flutter_mane, amoonguss, incineroar):
+        result = TurnOneSimulator().simulate(
+            [flutter_mane, incineroar], [amoonguss, incineroar], samples=300,
+            choices={
+                "amoonguss": [TurnOneOption("rage-powder")],
+                "flutter-mane": [TurnOneOption("moonblast", target="incineroar")],
+                "incineroar": [TurnOneOption("flare-blitz")],
+            },
+        )
+        # Flutter Mane outspeeds Amoonguss but Rage Powder is +2
+        assert result.faint["amoonguss"].percent > 0
+
+    def test_same_seed_same_result(self, incineroar, flutter_mane, rillaboom, amoonguss):
+        leads = ([incineroar, flutter_mane], [rillaboom, amoonguss])
+        a = TurnOneSimulator().simulate(*leads, samples=300)
+        b = TurnOneSimulator().simulate(*leads, samples=300)
+        assert a.to_dict() == b.to_dict()
+
+    def test_failed_calcs_drop_the_choice(self, incineroar, flutter_mane, monkeypatch, caplog):
+        def flaky(attacker, defender, move, modifiers=None):
+            if move.name == "moonblast":
+                raise KeyError("moonblast")
+            return calculate_damage(attacker, defender, move, modifiers)
+
+        monkeypatch.setattr("vgc_mcp_core.calc.turn_sim.calculate_damage", flaky)
+        choices = [TurnOneOption("moonblast"), TurnOneOption("dazzling-gleam")]
+        result = TurnOneSimulator().simulate(
+            [incineroar, flutter_mane], [incineroar, flutter_mane], samples=100,
+            choices={"flutter-mane": choices},
+        )
+        assert list(result.actions["flutter-mane"]) == ["dazzling-gleam"]
+        assert "Turn 1 calc failed" in caplog.text
+
+    def test_requires_two_leads(self, incineroar):
+        with pytest.raises(ValueError):
+            TurnOneSimulator().simulate([incineroar], [incineroar])
+
+
+class TestLeadMatrix:
+    """All lead pairings of two teams."""
+
+    def test_every_pairing_simulated_and_tables_shared(
+        self, incineroar, rillaboom, flutter_mane, amoonguss,
+    ):
+        team = [incineroar, rillaboom, flutter_mane, amoonguss]
+        result = simulate_lead_matrix(team, team, samples=100)
+        assert len(result.matchups) == 36
+        assert len(result.summaries) == 6
+        scores = [s.average_score for s in result.summaries]
+        assert scores == sorted(scores, reverse=True)
+        # 4 attackers x at most 2 moves x 3 foes x (spread, crit) variants
+        assert result.damage_calcs < 100
@@ -0,0 +1,165 @@
+"""Tests for precompiled UI templates and payload budgets."""
+
+import json
+import logging
+import re
+
+import pytest
+
+from vgc_mcp_lite.ui.components import (
+    HtmlTemplate,
+    create_damage_calc_ui,
+    create_stats_card_ui,
+    document,
+    get_payload_report,
+    json_island,
+    reset_payload_report,
+)
+from vgc_mcp_lite.ui.components.minify import minify_css, minify_html, minify_js
+from vgc_mcp_lite.ui.components.template import DEFAULT_PAYLOAD_BUDGET, ui_component
+
+BASE_STATS = {"hp": 55, "attack": 55, "defense": 55, "special_attack": 135,
+              "special_defense": 135, "speed": 135}
+EVS = {"hp": 4, "attack": 0, "defense": 0, "special_attack": 252,
+       "special_defense": 0, "speed": 252}
+
+
+@pytest.fixture(autouse=True)
+def fresh_report():
+    reset_payload_report()
+    yield
+    reset_payload_report()
+
+
+def _island(html: str, element_id: str):
+    match = re.search(rf'<script type="application/json" id="{element_id}">(.*?)</script>', html)
+    return json.loads(match.group(1))
+
+
+class TestMinify:
+    """Static text shrinks without changing meaning."""
+
+    def test_css(self):
+        css = """
+        /* header */
+        .a :hover , .b > .c {
+            content: "  x ;  }  ";
+            margin: 0 auto;
+        }
+        """
+        assert minify_css(css) == '.a :hover,.b>.c{content:"  x ;  }  ";margin:0 auto}'
+
+    def test_js_keeps_line_breaks(self):
+        js = """
+            // setup
+            const a = 1
+            const b = `x  y`
+
+            function f() { return a }
+        """
+        assert minify_js(js) == "const a = 1\nconst b = `x  y`\nfunction f() { return a }"
+
+    def test_js_template_literals_kept_verbatim(self):
+        js = """
+            // it's a comment
+            const html = `
+              <div>
+                // not a comment
+              </div>
+            `;
+            const s = 'a \\
+              b'
+        """
+        assert minify_js(js) == (
+            "const html = `\n"
+            "              <div>\n"
+            "                // not a comment\n"
+            "              </div>\n"
+            "            `;\n"
+            "const s = 'a \\\n"
+            "              b'"
+        )
+
+    def test_html_collapses_layout_whitespace(self):
+        html = (
+            "<div>\n    <span>a</span> <span>b</span>\n</div>\n"
+            "<style>\n  .x { color: red; }\n</style>"
+        )
+        assert minify_html(html) == (
+            "<div>\n<span>a</span> <span>b</span>\n</div>\n<style>.x{color:red}</style>"
+        )
+
+
+class TestHtmlTemplate:
+    """Compiled templates and JSON islands."""
+
+    def test_render_fills_slots(self):
+        template = HtmlTemplate("<div>\n  <b>{{ name }}</b> {{count}}\n</div>", name="t")
+        assert template.slots == ("name", "count")
+        assert template.render(name="Incineroar", count=3) == "<div>\n<b>Incineroar</b> 3\n</div>"
+        assert template.static_size == len("<div>\n<b></b> \n</div>")
+
+    def test_missing_slot(self):
+        with pytest.raises(KeyError, match="name"):
+            HtmlTemplate("<b>{{ name }}</b>", name="t").render()
+
+    def test_json_island_cannot_close_script(self):
+        island = json_island("data", {"note": "</script><b>&"})
+        assert "</script><b>" not in island[:-len("</script>")]
+        payload = island.split(">", 1)[1].rsplit("<", 1)[0]
+        assert json.loads(payload) == {"note": "</script><b>&"}
+
+    def test_document_includes_assets_once(self):
+        page = document("<p>{{ x }}</p>", css=".p { color: red; }",
+                        assets=("fonts", "fonts"), name="page")
+        html = page.render(x=1)
+        assert html.count("fonts.googleapis.com/css2") == 1
+        assert "<style>.p{color:red}</style>" in html
+        assert html.startswith("<!DOCTYPE html>")
+
+
+class TestPayloadReport:
+    """Rendered sizes are checked against budgets."""
+
+    def test_records_and_warns_once(self, caplog):
+        @ui_component("oversized")
+        def build(size: int) -> str:
+            return "x" * size
+
+        with caplog.at_level(logging.WARNING):
+            build(10)
+            build(DEFAULT_PAYLOAD_BUDGET + 1)
+            build(DEFAULT_PAYLOAD_BUDGET + 2)
+
+        stats = get_payload_report().components["oversized"]
+        assert stats.calls == 3 and stats.over_budget == 2
+        assert stats.last_bytes == DEFAULT_PAYLOAD_BUDGET + 2
+        assert sum("oversized" in record.message for record in caplog.records) == 1
+        assert get_payload_report().summary()[0]["max_bytes"] == DEFAULT_PAYLOAD_BUDGET + 2
+
+
+class TestComponents:
+    """Builders emit static assets once and data as JSON."""
+
+    def test_damage_calc_data_island(self):
+        html = create_damage_calc_ui(
+            'Flutter "Mane"', "Incineroar", "Moonblast", 40.0, 48.0, "3HKO",
+            move_type="fairy", interactive=True, attacker_base_stats=BASE_STATS, attacker_evs=EVS,
+        )
+        data = _island(html, "calc-data")
+        assert data["attacker"] == 'Flutter "Mane"'
+        assert data["attackerBaseStats"] == BASE_STATS
+        assert data["moveType"] == "fairy"
+        assert "function calcStat" in html
+
+        stats = get_payload_report().components["damage_calc"]
+        assert stats.last_bytes == len(html.encode("utf-8"))
+        assert not stats.over_budget
+
+    def test_stats_card(self):
+        html = create_stats_card_ui("Flutter Mane", BASE_STATS, EVS, {}, "Timid",
+                                    types=["Ghost", "Fairy"], ability="Protosynthesis")
+        assert '<span class="nature-boost">+Speed</span>' in html
+        assert '<span class="stat-final">205</span>' in html
+        assert "<span>Protosynthesis</span> · " in html
+        assert "\n    " not in html
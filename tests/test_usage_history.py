@@ -0,0 +1,172 @@
+"""Tests for the multi-month usage time series."""
+
+import pytest
+
+from vgc_mcp_core.api.usage_history import UsageHistory, month_window, shift_month
+
+from .conftest import FakeRegulation
+
+FORMAT = "gen9vgc2026regf"
+
+
+def _chaos(
+    flutter: float, incineroar: float, flutter_speed: int = 252, extra: bool = False
+) -> dict:
+    data = {
+        "Flutter Mane": {
+            "usage": flutter,
+            "Items": {"Booster Energy": 60, "Choice Specs": 40},
+            "Tera Types": {"Fairy": 70, "Grass": 30},
+            "Spreads": {
+                f"Timid:4/0/0/252/0/{flutter_speed}": 75,
+                "Modest:252/0/0/252/4/0": 25,
+            },
+        },
+        "Incineroar": {
+            "usage": incineroar,
+            "Items": {"Safety Goggles": 50, "Sitrus Berry": 50},
+            "Spreads": {"Careful:252/4/0/0/252/0": 100},
+        },
+    }
+    if extra:
+        data["Amoonguss"] = {"usage": 0.05, "Items": {"Rocky Helmet": 1}}
+    return {"data": data}
+
+
+MONTHS = {
+    "2026-05": _chaos(0.20, 0.50, flutter_speed=124),
+    "2026-06": _chaos(0.30, 0.45, flutter_speed=196),
+    "2026-07": _chaos(0.35, 0.40, extra=True),
+    "2026-09": _chaos(0.40, 0.30, extra=True),
+}
+
+
+@pytest.fixture
+def upstream(smogon_upstream):
+    for month, data in MONTHS.items():
+        smogon_upstream.files[(month, FORMAT, 0)] = data
+    return smogon_upstream
+
+
+def _history() -> UsageHistory:
+    history = UsageHistory(FORMAT, 0)
+    for month, data in MONTHS.items():
+        history.add_month(month, data)
+    return history
+
+
+class TestMonths:
+    """Calendar month arithmetic."""
+
+    def test_shift_across_years(self):
+        assert shift_month("2026-01", -1) == "2025-12"
+        assert shift_month("2025-12", 1) == "2026-01"
+        assert shift_month("2026-03", -14) == "2025-01"
+
+    def test_window_is_exact_calendar_months(self):
+        assert month_window("2026-03", 3) == ["2026-01", "2026-02", "2026-03"]
+
+
+class TestUsageHistory:
+    """Columns and trend queries."""
+
+    def test_columns_align_as_species_arrive(self):
+        history = _history()
+        row = history.lookup("amoonguss")
+        assert history.species[row] == "Amoonguss"
+        assert history.series("amoonguss") == [
+            ("2026-05", None), ("2026-06", None), ("2026-07", 5.0), ("2026-09", 5.0),
+        ]
+        assert all(
+            len(column) == len(history.species)
+            for by_month in history.columns.values() for column in by_month.values()
+        )
+
+    def test_speed_investment_trend(self):
+        series = dict(_history().series("Flutter Mane", "speed_evs"))
+        assert series == {"2026-05": 93.0, "2026-06": 147.0, "2026-07": 189.0, "2026-09": 189.0}
+        assert dict(_history().series("flutter-mane", "max_speed"))["2026-09"] == 75.0
+
+    def test_share_series(self):
+        points = _history().share_series("flutter-mane", "items", "booster-energy")
+        assert [share for _, share in points] == [60.0] * 4
+
+    def test_movers(self):
+        history = _history()
+        risers = history.movers(limit=2)
+        assert risers[0]["pokemon"] == "Flutter Mane"
+        assert risers[0]["change"] == pytest.approx(20.0)
+        assert risers[0]["slope"] > 0
+        fallers = history.movers(rising=False, limit=1)
+        assert fallers[0]["pokemon"] == "Incineroar"
+
+        window = history.movers(months=2, limit=5)
+        assert {r["pokemon"] for r in window} == {"Flutter Mane", "Incineroar", "Amoonguss"}
+        with pytest.raises(ValueError):
+            history.movers("items")
+
+    def test_round_trip(self):
+        history = _history()
+        history.missing.add("2026-08")
+        restored = UsageHistory.from_dict(history.to_dict())
+        assert restored.months == history.months
+        assert restored.missing == {"2026-08"}
+        assert restored.series("incineroar") == history.series("incineroar")
+
+
+class TestClientHistory:
+    """SmogonStatsClient builds the history incrementally."""
+
+    async def test_builds_once_and_remembers_missing_months(self, make_smogon_client, upstream):
+        client = make_smogon_client()
+        client._regulation_config = FakeRegulation(FORMAT)
+
+        history = await client.get_usage_history(FORMAT, 0, months=5)
+        assert history.months == ["2026-05", "2026-06", "2026-07", "2026-09"]
+        assert history.missing == {"2026-08"}
+
+        requests = len(upstream.requests)
+        await client.get_usage_history(FORMAT, 0, months=5)
+        assert len(upstream.requests) == requests
+
+        # A fresh client reads the persisted history instead of refetching months
+        other = make_smogon_client()
+        other._regulation_config = FakeRegulation(FORMAT)
+        reloaded = await other.get_usage_history(FORMAT, 0, months=5)
+        assert reloaded.months == history.months
+        fetched = [r.url.path for r in upstream.requests[requests:] if "2026-0" in r.url.path]
+        assert all("2026-09" in path for path in fetched)
+
+    async def test_missing_months_fetched_concurrently(self, make_smogon_client, upstream):
+        client = make_smogon_client()
+        client._regulation_config = FakeRegulation(FORMAT)
+        await client.get_usage_snapshot(FORMAT, 0)
+        upstream.delay = 0.05
+        fetch_month = client._fetch_month
+        active, peak = 0, 0
+
+        async def tracked(*args):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                return await fetch_month(*args)
+            finally:
+                active -= 1
+
+        client._fetch_month = tracked
+        history = await client.get_usage_history(FORMAT, 0, months=5)
+        assert history.months == ["2026-05", "2026-06", "2026-07", "2026-09"]
+        assert peak == 4
+
+    async def test_compare_uses_history(self, make_smogon_client, upstream):
+        client = make_smogon_client()
+        client._regulation_config = FakeRegulation(FORMAT)
+        upstream.files[("2026-08", FORMAT, 0)] = _chaos(0.38, 0.35)
+        comparison = await client.compare_pokemon_usage("flutter-mane", FORMAT, 0)
+
+        assert comparison["current_month"] == "2026-09"
+        assert comparison["previous_month"] == "2026-08"
+        assert comparison["previous"]["usage_percent"] == 38.0
+        assert comparison["previous"]["spreads"][0]["evs"]["speed"] == 252
+        assert any("Usage increased" in change for change in comparison["changes"])
@@ -171,3 +171,43 @@ class TestComparePokemonMonthOverMonth:
         fn = tools["compare_pokemon_month_over_month"].fn
         result = await fn(pokemon_name="unknown")
         assert "error" in result
+
+
+class TestGetUsageTrends:
+    """Tests for get_usage_trends."""
+
+    @pytest.fixture
+    def history(self, mock_smogon):
+        from vgc_mcp_core.api.usage_history import UsageHistory
+
+        history = UsageHistory("gen9vgc2024regh", 0)
+        for month, flutter in (("2024-10", 0.20), ("2024-11", 0.25), ("2024-12", 0.30)):
+            history.add_month(month, {"data": {
+                "Flutter Mane": {
+                    "usage": flutter,
+                    "Items": {"Booster Energy": 10},
+                    "Spreads": {"Timid:4/0/0/252/0/252": 10},
+                },
+                "Incineroar": {"usage": 0.5 - flutter},
+            }})
+        mock_smogon.get_usage_history = AsyncMock(return_value=history)
+        return history
+
+    async def test_risers_and_fallers(self, tools, history):
+        fn = tools["get_usage_trends"].fn
+        result = await fn(months=3)
+        assert result["months"] == ["2024-10", "2024-11", "2024-12"]
+        assert result["risers"][0]["pokemon"] == "Flutter Mane"
+        assert result["fallers"][0]["pokemon"] == "Incineroar"
+
+    async def test_single_pokemon(self, tools, history):
+        fn = tools["get_usage_trends"].fn
+        result = await fn(pokemon_name="flutter-mane")
+        assert result["usage"] == {"2024-10": 20.0, "2024-11": 25.0, "2024-12": 30.0}
+        assert result["speed_evs"]["2024-12"] == 252.0
+        assert result["items"]["Booster Energy"]["2024-11"] == 100.0
+
+    async def test_unknown_pokemon(self, tools, history):
+        fn = tools["get_usage_trends"].fn
+        result = await fn(pokemon_name="missingno")
+        assert "error" in result
@@ -1,11 +1,16 @@
 """Tests for high-level workflow coordinator tools."""
 
-import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from mcp.server.fastmcp import FastMCP
 
 from vgc_mcp.tools.workflow_tools import register_workflow_tools
+from vgc_mcp_core.calc.meta_sweep import MetaSpecies, expand_usage_variants, run_meta_sweep
+from vgc_mcp_core.models.move import Move, MoveCategory
+from vgc_mcp_core.models.pokemon import BaseStats, EVSpread, Nature, PokemonBuild
+
+from .conftest import FakePokeAPI, FakeSmogon
 
 
 @pytest.fixture
@@ -57,3 +62,66 @@ class TestFullTeamCheck:
         fn = tools["full_team_check"].fn
         result = await fn(paste="")
         assert "error" in result or result.get("success") is False
+
+
+class TestCalcDamageVsSmogonSets:
+    """Tests for calc_damage_vs_smogon_sets."""
+
+    async def test_sets_run_through_meta_sweep(self, mock_team_manager, mock_analyzer):
+        flutter = BaseStats(
+            hp=55, attack=55, defense=55, special_attack=135, special_defense=135, speed=135
+        )
+        incineroar = BaseStats(
+            hp=95, attack=115, defense=90, special_attack=80, special_defense=90, speed=60
+        )
+        moonblast = Move(name="moonblast", type="fairy", category=MoveCategory.SPECIAL, power=95)
+        usage = {
+            "usage_percent": 40.0,
+            "spreads": [
+                {"nature": "Timid", "evs": {"hp": 4, "special_attack": 252, "speed": 252},
+                 "spread_string": "Timid:4/0/0/252/0/252", "usage": 30.0},
+                {"nature": "Modest", "evs": {"hp": 252, "special_attack": 252, "speed": 4},
+                 "spread_string": "Modest:252/0/0/252/0/4", "usage": 10.0},
+            ],
+            "items": {"Choice Specs": 60.0, "Booster Energy": 40.0},
+            "abilities": {"Protosynthesis": 100.0},
+        }
+        pokeapi = FakePokeAPI(
+            pokemon={"incineroar": {}, "flutter-mane": {}},
+            base_stats={"incineroar": incineroar, "flutter-mane": flutter},
+            types={"incineroar": ["Fire", "Dark"], "flutter-mane": ["Ghost", "Fairy"]},
+            moves={"moonblast": moonblast},
+        )
+        mcp = FastMCP("test")
+        register_workflow_tools(
+            mcp, pokeapi, FakeSmogon(usage={"flutter-mane": usage}),
+            mock_team_manager, mock_analyzer,
+        )
+        fn = mcp._tool_manager._tools["calc_damage_vs_smogon_sets"].fn
+        result = await fn(
+            my_pokemon="incineroar", my_nature="careful", my_hp_evs=252, my_spd_evs=252,
+            my_ability="intimidate", opponent_pokemon="flutter-mane", move="moonblast",
+        )
+
+        assert result["success"] is True
+        assert [r["usage"] for r in result["damage_vs_sets"]] == ["30.0%", "10.0%"]
+        assert result["opponent_common_item"] == "choice-specs"
+
+        my_build = PokemonBuild(
+            name="incineroar", base_stats=incineroar, types=["Fire", "Dark"],
+            nature=Nature.CAREFUL, evs=EVSpread(hp=252, special_defense=252),
+            ability="intimidate",
+        )
+        species = MetaSpecies(
+            name="flutter-mane", usage_percent=40.0,
+            variants=expand_usage_variants(
+                "flutter-mane", flutter, ["Ghost", "Fairy"], usage,
+                max_spreads=3, max_items=1, max_abilities=1,
+            ),
+            moves=[(moonblast, 100.0)],
+        )
+        (expected,) = run_meta_sweep(my_build, [], [species]).incoming
+        assert result["usage_weighted_survival_percent"] == expected.survive_percent
+        assert [r["damage_range"] for r in result["damage_vs_sets"]] == [
+            v["damage_range"] for v in expected.variants
+        ]